@@ -27,7 +27,15 @@ from mindtrace.core.testing import (
 from mindtrace.core.types.task_schema import TaskSchema
 from mindtrace.core.utils.checks import check_libs, first_not_none, ifnone, ifnone_url
 from mindtrace.core.utils.dynamic import get_class, instantiate_target
-from mindtrace.core.utils.hashing import compute_dir_hash
+from mindtrace.core.utils.hashing import (
+    HASH_ALGORITHMS,
+    FileDigestCache,
+    compute_dir_hash,
+    compute_file_hash,
+    compute_file_manifest,
+    hash_algorithm_of,
+    merkle_root,
+)
 from mindtrace.core.utils.lambdas import named_lambda
 from mindtrace.core.utils.network import (
     LocalIPError,
@@ -67,6 +75,12 @@ __all__ = [
     "check_libs",
     "check_port_available",
     "compute_dir_hash",
+    "compute_file_hash",
+    "compute_file_manifest",
+    "FileDigestCache",
+    "HASH_ALGORITHMS",
+    "hash_algorithm_of",
+    "merkle_root",
     "ContextListener",
     "Config",
     "CoreConfig",
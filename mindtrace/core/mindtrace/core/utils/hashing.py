@@ -1,5 +1,53 @@
 import hashlib
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Dict, Iterable
+
+try:
+    import xxhash
+
+    _HAS_XXHASH = True
+except ImportError:  # pragma: no cover
+    _HAS_XXHASH = False
+
+HASH_ALGORITHMS = ("sha256", "blake2b", "xxh3_128")
+
+
+def _new_hasher(algorithm: str):
+    """Return a fresh hash object for one of ``HASH_ALGORITHMS``."""
+    if algorithm == "sha256":
+        return hashlib.sha256()
+    if algorithm == "blake2b":
+        return hashlib.blake2b(digest_size=32)
+    if algorithm == "xxh3_128":
+        if not _HAS_XXHASH:
+            raise ImportError("The 'xxh3_128' hash algorithm requires the xxhash package: pip install xxhash")
+        return xxhash.xxh3_128()
+    raise ValueError(f"Unknown hash algorithm '{algorithm}'. Expected one of {HASH_ALGORITHMS}.")
+
+
+def compute_file_hash(file_path: str | Path, chunk_size: int = 2**20, algorithm: str = "sha256") -> str:
+    """Compute the hash of a single file's contents.
+
+    Args:
+        file_path: Path to the file to hash
+        chunk_size: Size of the chunks (in bytes) to read from the file
+        algorithm: One of ``HASH_ALGORITHMS``. ``"xxh3_128"`` is a fast non-cryptographic checksum and requires the
+            optional ``xxhash`` package.
+    Returns:
+        Hexadecimal hash string
+    """
+    hasher = _new_hasher(algorithm)
+    with open(file_path, "rb") as fp:
+        while True:
+            chunk = fp.read(chunk_size)
+            if not chunk:
+                break
+            hasher.update(chunk)
+    return hasher.hexdigest()
 
 
 def compute_dir_hash(directory_path: str | Path, chunk_size: int = 2**20) -> str:
@@ -35,3 +83,146 @@ def compute_dir_hash(directory_path: str | Path, chunk_size: int = 2**20) -> str
                 sha.update(chunk)
 
     return sha.hexdigest()
+
+
+class FileDigestCache:
+    """Thread-safe, bounded cache of file digests keyed by file path and identity.
+
+    Entries are keyed by ``(algorithm, resolved path, device, inode, size, mtime_ns, ctime_ns)``. Any write to a file
+    changes its mtime, so a hit means the file has not changed since it was hashed and need not be read again. The
+    path and ctime are part of the key because inode numbers are recycled: a new file in a fresh directory (e.g. a
+    temporary pull directory) can get the inode, size and coarse mtime of a deleted one, and must not inherit its
+    digest.
+
+    Args:
+        max_entries: Maximum number of digests kept; the least recently used are evicted first.
+    """
+
+    def __init__(self, max_entries: int = 65536):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(path: str | Path, stat: os.stat_result, algorithm: str) -> tuple:
+        return (
+            algorithm,
+            os.path.realpath(path),
+            stat.st_dev,
+            stat.st_ino,
+            stat.st_size,
+            stat.st_mtime_ns,
+            stat.st_ctime_ns,
+        )
+
+    def get(self, path: str | Path, stat: os.stat_result, algorithm: str) -> str | None:
+        """Return the cached digest for the file at ``path`` with the given ``os.stat`` result, if any."""
+        key = self._key(path, stat, algorithm)
+        with self._lock:
+            digest = self._entries.get(key)
+            if digest is not None:
+                self._entries.move_to_end(key)
+            return digest
+
+    def put(self, path: str | Path, stat: os.stat_result, algorithm: str, digest: str) -> None:
+        """Cache ``digest`` for the file at ``path`` with the given ``os.stat`` result."""
+        key = self._key(path, stat, algorithm)
+        with self._lock:
+            self._entries[key] = digest
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached digests."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+def _hash_file_cached(file_path: Path, algorithm: str, chunk_size: int, cache: FileDigestCache | None) -> str:
+    """Hash one file, consulting and updating ``cache`` when given."""
+    if cache is None:
+        return compute_file_hash(file_path, chunk_size, algorithm)
+    before = os.stat(file_path)
+    digest = cache.get(file_path, before, algorithm)
+    if digest is None:
+        digest = compute_file_hash(file_path, chunk_size, algorithm)
+        # Only remember digests of files that did not change while being read.
+        if FileDigestCache._key(file_path, os.stat(file_path), algorithm) == FileDigestCache._key(
+            file_path, before, algorithm
+        ):
+            cache.put(file_path, before, algorithm, digest)
+    return digest
+
+
+def compute_file_manifest(
+    directory_path: str | Path,
+    algorithm: str = "sha256",
+    *,
+    files: Iterable[str] | None = None,
+    max_workers: int | None = None,
+    cache: FileDigestCache | None = None,
+    chunk_size: int = 2**20,
+) -> Dict[str, str]:
+    """Hash every file under a directory in parallel.
+
+    Files are hashed on a thread pool; ``hashlib`` (and ``xxhash``) release the GIL while hashing, so large artifacts
+    are hashed on several cores at once.
+
+    Args:
+        directory_path: Directory to hash.
+        algorithm: One of ``HASH_ALGORITHMS``.
+        files: Relative file paths to hash. Defaults to every regular file under the directory.
+        max_workers: Hashing threads. Defaults to ``min(8, os.cpu_count())``.
+        cache: Optional digest cache, so files unchanged since they were last hashed are not read again.
+        chunk_size: Size of the chunks (in bytes) to read from each file.
+
+    Returns:
+        Mapping of relative POSIX file paths to hexadecimal digests, sorted by path.
+    """
+    directory_path = Path(directory_path)
+    _new_hasher(algorithm)  # Fail fast on an unknown or unavailable algorithm
+    if files is None:
+        rel_paths = sorted(p.relative_to(directory_path).as_posix() for p in directory_path.rglob("*") if p.is_file())
+    else:
+        rel_paths = sorted(Path(f).as_posix() for f in files)
+
+    def hash_one(rel_path: str) -> str:
+        return _hash_file_cached(directory_path / rel_path, algorithm, chunk_size, cache)
+
+    workers = max_workers or min(8, os.cpu_count() or 1)
+    if workers <= 1 or len(rel_paths) <= 1:
+        digests = [hash_one(rel_path) for rel_path in rel_paths]
+    else:
+        with ThreadPoolExecutor(max_workers=min(workers, len(rel_paths))) as executor:
+            digests = list(executor.map(hash_one, rel_paths))
+    return dict(zip(rel_paths, digests))
+
+
+def merkle_root(manifest: Dict[str, str], algorithm: str = "sha256") -> str:
+    """Combine a file manifest into a single directory hash.
+
+    The root hashes the sorted ``path\\0digest\\n`` lines of the manifest and is prefixed with the algorithm
+    (e.g. ``"sha256:…"``), which distinguishes it from the unprefixed hashes of ``compute_dir_hash``.
+
+    Args:
+        manifest: Mapping of relative file paths to digests, as returned by ``compute_file_manifest``.
+        algorithm: Algorithm the manifest digests were computed with.
+
+    Returns:
+        Prefixed hexadecimal hash string.
+    """
+    hasher = _new_hasher(algorithm)
+    for rel_path in sorted(manifest):
+        hasher.update(f"{rel_path}\0{manifest[rel_path]}\n".encode("utf-8"))
+    return f"{algorithm}:{hasher.hexdigest()}"
+
+
+def hash_algorithm_of(dir_hash: str) -> str | None:
+    """Return the algorithm of a ``merkle_root`` hash, or None for an unprefixed ``compute_dir_hash`` hash."""
+    algorithm, sep, _ = dir_hash.partition(":")
+    return algorithm if sep and algorithm in HASH_ALGORITHMS else None
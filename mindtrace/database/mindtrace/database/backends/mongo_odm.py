@@ -8,7 +8,7 @@ from bson import ObjectId
 from bson.errors import InvalidId
 from motor.motor_asyncio import AsyncIOMotorClient
 from pydantic import BaseModel
-from pymongo import MongoClient
+from pymongo import MongoClient, ReturnDocument
 from pymongo.errors import BulkWriteError, DocumentTooLarge, DuplicateKeyError
 
 from mindtrace.database.backends.mindtrace_odm import InitMode, MindtraceODM
@@ -881,6 +881,31 @@ class MongoMindtraceODM[T: MindtraceDocument](MindtraceODM):
 
         return await self._motor_collection().count_documents(query or {})
 
+    async def find_one_and_update(self, query: dict[str, Any], update: dict[str, Any]) -> T | None:
+        """Atomically apply ``update`` to one document matching ``query`` and return it as updated.
+
+        Unlike ``update``, which replaces the whole document, only the fields named in ``update`` (a MongoDB update
+        document such as ``{"$set": {...}}``) are written, and only if the document still matches ``query`` at the
+        time of the write. Use it for compare-and-set transitions that must not race with other writers.
+
+        Args:
+            query: Filter selecting the document to update.
+            update: MongoDB update operators to apply.
+
+        Returns:
+            The updated document, or None if no document matched ``query``.
+        """
+        if self._models is not None:
+            raise ValueError(
+                "Cannot use find_one_and_update() in multi-model mode. Use db.model_name.find_one_and_update() instead."
+            )
+
+        if not self._is_initialized:
+            await self.initialize()
+
+        raw = await self._motor_collection().find_one_and_update(query, update, return_document=ReturnDocument.AFTER)
+        return self._mongo_doc_to_model(raw)
+
     async def aggregate(self, pipeline: list) -> List[T]:
         """
         Execute a MongoDB aggregation pipeline.
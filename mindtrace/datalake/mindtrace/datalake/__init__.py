@@ -32,7 +32,14 @@ from .data_vault_backends import (
     LocalDataVaultBackend,
 )
 from .datalake import Datalake
-from .exporters import ExportableDataset, ExportableItem, ExportResult, export_dataset_to_format, get_dataset_exporter
+from .exporters import (
+    ExportableDataset,
+    ExportableItem,
+    ExportProgress,
+    ExportResult,
+    export_dataset_to_format,
+    get_dataset_exporter,
+)
 from .pagination_types import (
     CursorEnvelope,
     CursorPage,
@@ -57,6 +64,7 @@ from .replication_types import (
     ReplicationReconcileResult,
     ReplicationStatusResult,
 )
+from .replication_worker import ReplicationWorker, ReplicationWorkerMetrics
 from .service import DatalakeService
 from .sync import DatasetSyncManager
 from .sync_types import (
@@ -80,6 +88,7 @@ from .types import (
     Collection,
     CollectionItem,
     DatasetVersion,
+    DatasetVersionMember,
     Datum,
     DirectUploadSession,
     DuplicateAliasError,
@@ -122,6 +131,7 @@ __all__ = [
     "ExportResult",
     "ExportableDataset",
     "ExportableItem",
+    "ExportProgress",
     "export_dataset_to_format",
     "get_dataset_exporter",
     "SlowOperationDisabledError",
@@ -149,6 +159,8 @@ __all__ = [
     "DatasetSyncProgress",
     "ReplicationManager",
     "ReplicationQueueManager",
+    "ReplicationWorker",
+    "ReplicationWorkerMetrics",
     "ReplicatedAssetState",
     "ReplicationBatchRequest",
     "ReplicationBatchResult",
@@ -158,6 +170,7 @@ __all__ = [
     "ReplicationReconcileResult",
     "ReplicationStatusResult",
     "DatasetVersion",
+    "DatasetVersionMember",
     "DatalakeDirectUploadClient",
     "Datalake",
     "DatalakeService",
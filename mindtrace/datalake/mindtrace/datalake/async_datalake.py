@@ -5,20 +5,23 @@ import base64
 import hashlib
 import json
 import os
+import re
 import warnings
-from collections.abc import AsyncIterator, Iterable
+from collections.abc import AsyncIterator, Callable, Iterable
 from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta, timezone
 from enum import StrEnum
 from functools import partial
 from pathlib import Path
-from typing import Any, TypeVar
+from typing import Any, Literal, TypeVar
 
 from motor.motor_asyncio import AsyncIOMotorClient
 
 from mindtrace.core import Mindtrace
 from mindtrace.database import MongoMindtraceODM
 from mindtrace.database.core.exceptions import DocumentNotFoundError, DuplicateInsertError
+from mindtrace.datalake.exporters.types import ExportProgress, ExportResult
 from mindtrace.datalake.pagination_types import (
     CursorEnvelope,
     CursorPage,
@@ -42,6 +45,7 @@ from mindtrace.datalake.types import (
     CollectionItem,
     DatasetImportSession,
     DatasetVersion,
+    DatasetVersionMember,
     Datum,
     DirectUploadSession,
     DuplicateAliasError,
@@ -59,6 +63,15 @@ from mindtrace.registry.core.exceptions import RegistryObjectNotFound, StoreLoca
 
 DocumentT = TypeVar("DocumentT")
 
+# File a bytes payload occupies inside its registry artifact (BytesMaterializer layout).
+_BYTES_PAYLOAD_FILE = "data.txt"
+
+# Datum ids validated per query and member rows written per insert when creating a dataset version.
+_DATASET_VERSION_WRITE_BATCH = 10_000
+
+# Field carrying a datum's manifest position through the dataset view aggregation.
+_DATASET_VIEW_ORDINAL = "_view_ordinal"
+
 
 class AnnotationSchemaValidationError(ValueError):
     """Raised when an annotation record violates a schema-bound set contract."""
@@ -172,6 +185,7 @@ class AsyncDatalake(Mindtrace):
         self.annotation_set_database = MongoMindtraceODM(model_cls=AnnotationSet, **odm_kwargs)
         self.datum_database = MongoMindtraceODM(model_cls=Datum, **odm_kwargs)
         self.dataset_version_database = MongoMindtraceODM(model_cls=DatasetVersion, **odm_kwargs)
+        self.dataset_version_member_database = MongoMindtraceODM(model_cls=DatasetVersionMember, **odm_kwargs)
         self.direct_upload_session_database = MongoMindtraceODM(model_cls=DirectUploadSession, **odm_kwargs)
         self.dataset_import_session_database = MongoMindtraceODM(
             model_cls=DatasetImportSession,
@@ -192,6 +206,7 @@ class AsyncDatalake(Mindtrace):
             self.annotation_set_database,
             self.datum_database,
             self.dataset_version_database,
+            self.dataset_version_member_database,
             self.direct_upload_session_database,
             self.dataset_import_session_database,
             self.replication_rule_database,
@@ -241,6 +256,7 @@ class AsyncDatalake(Mindtrace):
             self.annotation_set_database,
             self.datum_database,
             self.dataset_version_database,
+            self.dataset_version_member_database,
             self.direct_upload_session_database,
             self.dataset_import_session_database,
             self.replication_rule_database,
@@ -707,52 +723,162 @@ class AsyncDatalake(Mindtrace):
         rows = await database.find({id_field: {"$in": unique_ids}})
         return {getattr(row, id_field): row for row in rows}
 
-    async def _scan_dataset_view_manifest(
+    @staticmethod
+    def _compile_whole_value_match(field: str, op: str, expected: Any) -> dict[str, Any]:
+        """Mongo clause applying ``$op`` to the whole value of ``field``, as ``_matches_structured_filters`` does.
+
+        Mongo applies comparison operators to each element of an array field as well as to the array itself, so
+        scalar comparisons are restricted to non-array values. An array ``expected`` is compared with the whole array.
+        """
+        if isinstance(expected, (list, tuple, set)):
+            return {field: {f"${op}": list(expected)}}
+        return {"$and": [{field: {f"${op}": expected}}, {field: {"$not": {"$type": "array"}}}]}
+
+    @classmethod
+    def _compile_structured_filters(cls, filters: list[StructuredFilter]) -> dict[str, Any]:
+        """Translate structured filters into a Mongo query with the same semantics as ``_matches_structured_filters``.
+
+        Fields are always compared as whole values: ``eq``, ``ne``, ``in``, ``exists`` and range filters never match a
+        single element of an array field, which only ``contains`` looks into.
+        """
+        clauses: list[dict[str, Any]] = []
+        for filter_item in filters:
+            field = filter_item.field
+            expected = filter_item.value
+            op = filter_item.op
+            if op in ("eq", "gt", "gte", "lt", "lte"):
+                clauses.append(cls._compile_whole_value_match(field, op, expected))
+            elif op == "ne":
+                clauses.append({"$nor": [cls._compile_whole_value_match(field, "eq", expected)]})
+            elif op == "in":
+                if expected is None:
+                    values: list[Any] = []
+                elif isinstance(expected, (list, tuple, set)):
+                    values = list(expected)
+                else:
+                    raise ValueError(f"Structured filter 'in' on {field!r} requires a list value")
+                scalars = [value for value in values if not isinstance(value, (list, tuple, set))]
+                arrays = [list(value) for value in values if isinstance(value, (list, tuple, set))]
+                alternatives = []
+                if scalars or not arrays:
+                    alternatives.append({"$and": [{field: {"$in": scalars}}, {field: {"$not": {"$type": "array"}}}]})
+                if arrays:
+                    alternatives.append({field: {"$in": arrays}})
+                clauses.append(alternatives[0] if len(alternatives) == 1 else {"$or": alternatives})
+            elif op == "contains":
+                element_match = {field: {"$elemMatch": {"$eq": expected}}}
+                if isinstance(expected, str):
+                    substring_match = {
+                        "$and": [
+                            {field: {"$type": "string"}},
+                            {field: {"$not": {"$type": "array"}}},
+                            {field: {"$regex": re.escape(expected)}},
+                        ]
+                    }
+                    clauses.append({"$or": [substring_match, element_match]})
+                else:
+                    clauses.append(element_match)
+            elif op == "exists":
+                missing = cls._compile_whole_value_match(field, "eq", None)
+                clauses.append({"$nor": [missing]} if expected else missing)
+        if not clauses:
+            return {}
+        if len(clauses) == 1:
+            return clauses[0]
+        return {"$and": clauses}
+
+    def _dataset_version_members_pipeline(
         self,
+        dataset_version: DatasetVersion,
         *,
-        manifest: list[str],
+        start_index: int = 0,
+    ) -> tuple[MongoMindtraceODM[Any], list[dict[str, Any]]]:
+        """Database and aggregation yielding ``{"ordinal", "datum_id"}`` rows in manifest order from ``start_index``."""
+        if dataset_version.manifest_storage == "collection":
+            return self.dataset_version_member_database, [
+                {
+                    "$match": {
+                        "dataset_version_id": dataset_version.dataset_version_id,
+                        "ordinal": {"$gte": start_index},
+                    }
+                },
+                {"$sort": {"ordinal": 1}},
+                {"$project": {"_id": 0, "ordinal": 1, "datum_id": 1}},
+            ]
+        remaining = max(len(dataset_version.manifest) - start_index, 1)
+        return self.dataset_version_database, [
+            {"$match": {"dataset_version_id": dataset_version.dataset_version_id}},
+            {"$project": {"_id": 0, "manifest": {"$slice": ["$manifest", start_index, remaining]}}},
+            {"$unwind": {"path": "$manifest", "includeArrayIndex": "offset"}},
+            {"$project": {"ordinal": {"$add": ["$offset", start_index]}, "datum_id": "$manifest"}},
+        ]
+
+    def _dataset_view_pipeline(
+        self,
+        *,
+        dataset_version: DatasetVersion,
+        start_index: int,
+        filters: list[StructuredFilter],
+    ) -> tuple[MongoMindtraceODM[Any], list[dict[str, Any]]]:
+        """Aggregation over a dataset version's members yielding matching datums tagged with their ordinal."""
+        database, pipeline = self._dataset_version_members_pipeline(dataset_version, start_index=start_index)
+        pipeline.extend(
+            [
+                {
+                    "$lookup": {
+                        "from": Datum.Settings.name,
+                        "localField": "datum_id",
+                        "foreignField": "datum_id",
+                        "as": "datum",
+                    }
+                },
+                {"$unwind": "$datum"},
+                {"$addFields": {f"datum.{_DATASET_VIEW_ORDINAL}": "$ordinal"}},
+                {"$replaceRoot": {"newRoot": "$datum"}},
+            ]
+        )
+        query = self._compile_structured_filters(filters)
+        if query:
+            pipeline.append({"$match": query})
+        return database, pipeline
+
+    async def _find_dataset_view_matches(
+        self,
+        *,
+        dataset_version: DatasetVersion,
         start_index: int,
         filters: list[StructuredFilter],
         target_count: int,
-        scan_chunk_size: int,
     ) -> list[tuple[int, Datum]]:
+        database, pipeline = self._dataset_view_pipeline(
+            dataset_version=dataset_version,
+            start_index=start_index,
+            filters=filters,
+        )
+        pipeline.append({"$limit": target_count})
         matches: list[tuple[int, Datum]] = []
-        for chunk_start in range(start_index, len(manifest), scan_chunk_size):
-            chunk_ids = manifest[chunk_start : chunk_start + scan_chunk_size]
-            datums_by_id = await self._find_rows_by_ids(
-                database=self.datum_database,
-                id_field="datum_id",
-                ids=chunk_ids,
-            )
-            for offset, datum_id in enumerate(chunk_ids):
-                datum = datums_by_id.get(datum_id)
-                if datum is None or not self._matches_structured_filters(datum, filters):
-                    continue
-                matches.append((chunk_start + offset, datum))
-                if len(matches) >= target_count:
-                    return matches
+        for doc in await database.aggregate(pipeline):
+            payload = dict(doc)
+            ordinal = int(payload.pop(_DATASET_VIEW_ORDINAL))
+            if "_id" in payload and "id" not in payload:
+                payload["id"] = payload.pop("_id")
+            matches.append((ordinal, Datum.model_validate(payload)))
         return matches
 
     async def _count_dataset_view_matches(
         self,
         *,
-        manifest: list[str],
+        dataset_version: DatasetVersion,
         filters: list[StructuredFilter],
-        scan_chunk_size: int,
     ) -> int:
-        count = 0
-        for chunk_start in range(0, len(manifest), scan_chunk_size):
-            chunk_ids = manifest[chunk_start : chunk_start + scan_chunk_size]
-            datums_by_id = await self._find_rows_by_ids(
-                database=self.datum_database,
-                id_field="datum_id",
-                ids=chunk_ids,
-            )
-            for datum_id in chunk_ids:
-                datum = datums_by_id.get(datum_id)
-                if datum is not None and self._matches_structured_filters(datum, filters):
-                    count += 1
-        return count
+        database, pipeline = self._dataset_view_pipeline(
+            dataset_version=dataset_version,
+            start_index=0,
+            filters=filters,
+        )
+        pipeline.append({"$count": "total"})
+        result = await database.aggregate(pipeline)
+        return int(result[0]["total"]) if result else 0
 
     async def _build_dataset_view_rows(
         self,
@@ -885,13 +1011,37 @@ class AsyncDatalake(Mindtrace):
     async def get_object(self, storage_ref: StorageRef, **kwargs) -> Any:
         storage_ref = self._normalize_storage_ref(storage_ref)
         key = self.store.build_key(storage_ref.mount, storage_ref.name, storage_ref.version)
-        return self.store.load(key, version=storage_ref.version, **kwargs)
+        return await asyncio.to_thread(self.store.load, key, version=storage_ref.version, **kwargs)
 
     async def head_object(self, storage_ref: StorageRef) -> dict[str, Any]:
         storage_ref = self._normalize_storage_ref(storage_ref)
         key = self.store.build_key(storage_ref.mount, storage_ref.name, storage_ref.version)
         return self.store.info(key, version=storage_ref.version)
 
+    @asynccontextmanager
+    async def open_object_file(self, storage_ref: StorageRef) -> AsyncIterator[Path]:
+        """Yield a local file holding a stored bytes payload, so it can be streamed instead of read into memory.
+
+        The file is the stored copy itself on immutable local mounts, otherwise a temporary pull that is removed on
+        exit; either way it must not be modified.
+
+        Raises:
+            ValueError: If the object was not stored as raw bytes.
+        """
+        storage_ref = self._normalize_storage_ref(storage_ref)
+        key = self.store.build_key(storage_ref.mount, storage_ref.name, storage_ref.version)
+        artifact = self.store.open_artifact(key, version=storage_ref.version)
+        artifact_dir, metadata = await asyncio.to_thread(artifact.__enter__)
+        try:
+            if metadata.get("class") != "builtins.bytes":
+                raise ValueError(
+                    f"Object {storage_ref.name!r} is stored as {metadata.get('class')!r}, not raw bytes; "
+                    "use get_object to load it"
+                )
+            yield artifact_dir / _BYTES_PAYLOAD_FILE
+        finally:
+            await asyncio.to_thread(artifact.__exit__, None, None, None)
+
     async def get_asset_payload(self, asset_id: str, **kwargs: Any) -> Any:
         asset = await self.get_asset(asset_id)
         if asset.payload_status != "present":
@@ -935,15 +1085,15 @@ class AsyncDatalake(Mindtrace):
         except (RegistryObjectNotFound, FileNotFoundError, KeyError, OSError):
             return False
 
-    def dataset_sync(self, target: "AsyncDatalake" | None = None):
+    def dataset_sync(self, target: "AsyncDatalake" | None = None, **options: Any):
         from mindtrace.datalake.sync import DatasetSyncManager
 
-        return DatasetSyncManager(self, target=target)
+        return DatasetSyncManager(self, target=target, **options)
 
-    def replication(self, target: "AsyncDatalake" | None = None):
+    def replication(self, target: "AsyncDatalake" | None = None, **options: Any):
         from mindtrace.datalake.replication import ReplicationManager
 
-        return ReplicationManager(self, target=target)
+        return ReplicationManager(self, target=target, **options)
 
     async def copy_object(
         self,
@@ -1117,10 +1267,42 @@ class AsyncDatalake(Mindtrace):
         payload_status: PayloadStatus = "present",
         payload_status_reason: str | None = None,
         payload_verified_at: datetime | None = None,
+    ) -> Asset:
+        asset = self._new_asset_document(
+            kind=kind,
+            media_type=media_type,
+            storage_ref=storage_ref,
+            checksum=checksum,
+            size_bytes=size_bytes,
+            subject=subject,
+            metadata=metadata,
+            created_by=created_by,
+            payload_status=payload_status,
+            payload_status_reason=payload_status_reason,
+            payload_verified_at=payload_verified_at,
+        )
+        inserted = await self.asset_database.insert(asset)
+        await self.ensure_primary_asset_alias(inserted)
+        return inserted
+
+    def _new_asset_document(
+        self,
+        *,
+        kind: str,
+        media_type: str,
+        storage_ref: StorageRef,
+        checksum: str | None = None,
+        size_bytes: int | None = None,
+        subject: SubjectRef | None = None,
+        metadata: dict[str, Any] | None = None,
+        created_by: str | None = None,
+        payload_status: PayloadStatus = "present",
+        payload_status_reason: str | None = None,
+        payload_verified_at: datetime | None = None,
     ) -> Asset:
         normalized_storage_ref = self._normalize_storage_ref(storage_ref)
         now = self._utc_now()
-        asset = self._build_document(
+        return self._build_document(
             Asset,
             kind=kind,
             media_type=media_type,
@@ -1141,9 +1323,6 @@ class AsyncDatalake(Mindtrace):
             created_by=created_by,
             updated_at=now,
         )
-        inserted = await self.asset_database.insert(asset)
-        await self.ensure_primary_asset_alias(inserted)
-        return inserted
 
     async def ensure_primary_asset_alias(self, asset: Asset) -> AssetAlias:
         """Ensure a primary alias row exists with ``alias == asset.asset_id`` (idempotent)."""
@@ -1755,6 +1934,57 @@ class AsyncDatalake(Mindtrace):
                     raise
         return inserted
 
+    async def create_annotation_sets(self, annotation_sets: Iterable[dict[str, Any]]) -> list[AnnotationSet]:
+        """Create many annotation sets, each with its records, using one insert per collection.
+
+        Each item holds the keyword arguments of :meth:`create_annotation_set` except ``datum_id``, plus an
+        optional ``annotations`` list in any form accepted by :meth:`add_annotation_records`. Records are
+        validated against their set's schema and are stored as given, so give them a ``subject`` when they
+        describe an asset. Link the sets to datums through ``annotation_set_ids`` in :meth:`create_datums`.
+        Returns the sets in input order.
+        """
+        specs = list(annotation_sets)
+        if not specs:
+            return []
+        schemas: dict[str, AnnotationSchema] = {}
+        for spec in specs:
+            schema_id = spec.get("annotation_schema_id")
+            if schema_id is not None and schema_id not in schemas:
+                schemas[schema_id] = await self.get_annotation_schema(schema_id)
+
+        now = self._utc_now()
+        records_per_set: list[list[AnnotationRecord]] = []
+        for spec in specs:
+            records = [self._coerce_annotation_record(annotation) for annotation in spec.get("annotations") or []]
+            schema = schemas.get(spec.get("annotation_schema_id"))
+            if schema is not None:
+                for record in records:
+                    self._validate_annotation_record_against_schema(record, schema)
+            records_per_set.append(records)
+
+        documents = [
+            self._build_document(
+                AnnotationSet,
+                name=spec["name"],
+                purpose=spec["purpose"],
+                source_type=spec["source_type"],
+                status=spec.get("status", "draft"),
+                annotation_schema_id=spec.get("annotation_schema_id"),
+                annotation_record_ids=[record.annotation_id for record in records],
+                metadata=spec.get("metadata") or {},
+                created_by=spec.get("created_by"),
+                updated_at=now,
+            )
+            for spec, records in zip(specs, records_per_set)
+        ]
+        all_records = [record for records in records_per_set for record in records]
+        inserted_records = await self.annotation_record_database.insert_many(all_records, ordered=True)
+        try:
+            return await self.annotation_set_database.insert_many(documents, ordered=True)
+        except Exception:
+            await self._rollback_inserted_annotation_records(inserted_records)
+            raise
+
     async def get_annotation_set(self, annotation_set_id: str) -> AnnotationSet:
         results = await self.annotation_set_database.find({"annotation_set_id": annotation_set_id})
         if not results:
@@ -2079,6 +2309,44 @@ class AsyncDatalake(Mindtrace):
         )
         return await self.datum_database.insert(datum)
 
+    async def create_datums(self, datums: Iterable[dict[str, Any]]) -> list[Datum]:
+        """Create many datums with a single insert.
+
+        Each item holds the keyword arguments of :meth:`create_datum`. Referenced assets and annotation
+        sets are checked with one query per collection instead of one per reference. Returns the datums
+        in input order.
+        """
+        specs = list(datums)
+        if not specs:
+            return []
+        asset_ids = [asset_id for spec in specs for asset_id in spec["asset_refs"].values()]
+        if any(not str(asset_id).strip() for asset_id in asset_ids):
+            raise ValueError("Datum asset_refs must contain non-empty asset ids")
+        found_assets = await self._find_rows_by_ids(database=self.asset_database, id_field="asset_id", ids=asset_ids)
+        for asset_id in asset_ids:
+            if asset_id not in found_assets:
+                raise DocumentNotFoundError(f"Asset with asset_id {asset_id} not found")
+        annotation_set_ids = [set_id for spec in specs for set_id in spec.get("annotation_set_ids") or []]
+        found_sets = await self._find_rows_by_ids(
+            database=self.annotation_set_database, id_field="annotation_set_id", ids=annotation_set_ids
+        )
+        for annotation_set_id in annotation_set_ids:
+            if annotation_set_id not in found_sets:
+                raise DocumentNotFoundError(f"AnnotationSet with annotation_set_id {annotation_set_id} not found")
+        now = self._utc_now()
+        documents = [
+            self._build_document(
+                Datum,
+                split=spec.get("split"),
+                asset_refs=spec["asset_refs"],
+                metadata=spec.get("metadata") or {},
+                annotation_set_ids=spec.get("annotation_set_ids") or [],
+                updated_at=now,
+            )
+            for spec in specs
+        ]
+        return await self.datum_database.insert_many(documents, ordered=True)
+
     async def get_datum(self, datum_id: str) -> Datum:
         results = await self.datum_database.find({"datum_id": datum_id})
         if not results:
@@ -2155,31 +2423,215 @@ class AsyncDatalake(Mindtrace):
         source_dataset_version_id: str | None = None,
         metadata: dict[str, Any] | None = None,
         created_by: str | None = None,
+        manifest_storage: Literal["inline", "collection"] = "inline",
     ) -> DatasetVersion:
+        """Create an immutable dataset version over existing datums.
+
+        ``manifest_storage="collection"`` stores the manifest as indexed :class:`DatasetVersionMember`
+        rows instead of a list inside the version document, which removes the document size ceiling
+        and lets paging, ordinal lookups, split counts and version differences run as index queries.
+        """
         existing = await self.dataset_version_database.find({"dataset_name": dataset_name, "version": version})
         if existing:
             raise ValueError(f"Dataset version already exists: {dataset_name}@{version}")
         if len(manifest) != len(set(manifest)):
             raise ValueError("Dataset version manifest must not contain duplicate datum ids")
-        for datum_id in manifest:
-            await self.get_datum(datum_id)
+        await self._require_datums_exist(manifest)
         dataset_version = self._build_document(
             DatasetVersion,
             dataset_name=dataset_name,
             version=version,
             description=description,
             manifest=manifest,
+            manifest_storage=manifest_storage,
+            datum_count=len(manifest),
             source_dataset_version_id=source_dataset_version_id,
             metadata=metadata or {},
             created_by=created_by,
         )
-        return await self.dataset_version_database.insert(dataset_version)
+        return await self._insert_dataset_version(dataset_version)
+
+    async def _require_datums_exist(self, datum_ids: list[str]) -> None:
+        for chunk_start in range(0, len(datum_ids), _DATASET_VERSION_WRITE_BATCH):
+            chunk = datum_ids[chunk_start : chunk_start + _DATASET_VERSION_WRITE_BATCH]
+            found = await self._find_rows_by_ids(database=self.datum_database, id_field="datum_id", ids=chunk)
+            for datum_id in chunk:
+                if datum_id not in found:
+                    raise DocumentNotFoundError(f"Datum with datum_id {datum_id} not found")
 
-    async def get_dataset_version(self, dataset_name: str, version: str) -> DatasetVersion:
+    async def _insert_dataset_version(self, dataset_version: DatasetVersion) -> DatasetVersion:
+        """Persist ``dataset_version``, writing member rows first when it uses collection storage.
+
+        The returned document always carries the full manifest it was given.
+        """
+        if dataset_version.manifest_storage != "collection":
+            return await self.dataset_version_database.insert(dataset_version)
+        manifest = list(dataset_version.manifest)
+        for chunk_start in range(0, len(manifest), _DATASET_VERSION_WRITE_BATCH):
+            await self.dataset_version_member_database.insert_many(
+                [
+                    DatasetVersionMember(
+                        dataset_version_id=dataset_version.dataset_version_id,
+                        dataset_name=dataset_version.dataset_name,
+                        version=dataset_version.version,
+                        ordinal=ordinal,
+                        datum_id=datum_id,
+                    )
+                    for ordinal, datum_id in enumerate(
+                        manifest[chunk_start : chunk_start + _DATASET_VERSION_WRITE_BATCH],
+                        start=chunk_start,
+                    )
+                ],
+                ordered=False,
+            )
+        inserted = await self.dataset_version_database.insert(
+            dataset_version.model_copy(update={"manifest": [], "datum_count": len(manifest)})
+        )
+        return inserted.model_copy(update={"manifest": manifest})
+
+    async def get_dataset_version(
+        self,
+        dataset_name: str,
+        version: str,
+        *,
+        include_manifest: bool = True,
+    ) -> DatasetVersion:
+        """Return a dataset version.
+
+        For collection-stored versions the manifest is read from the member collection unless
+        ``include_manifest`` is False, in which case ``manifest`` is left empty and ``size`` still
+        reports the number of datums.
+        """
         results = await self.dataset_version_database.find({"dataset_name": dataset_name, "version": version})
         if not results:
             raise DocumentNotFoundError(f"DatasetVersion {dataset_name}@{version} not found")
-        return results[0]
+        dataset_version = results[0]
+        if include_manifest and dataset_version.manifest_storage == "collection":
+            dataset_version.manifest = [
+                member.datum_id
+                async for member in self.dataset_version_member_database.find_iter(
+                    {"dataset_version_id": dataset_version.dataset_version_id},
+                    sort=[("ordinal", 1)],
+                    batch_size=_DATASET_VERSION_WRITE_BATCH,
+                )
+            ]
+        return dataset_version
+
+    async def get_dataset_version_datum_ids(
+        self,
+        dataset_name: str,
+        version: str,
+        *,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> list[str]:
+        """Return the datum ids at manifest ordinals ``offset`` to ``offset + limit``."""
+        if offset < 0:
+            raise ValueError("offset must be non-negative")
+        if limit is not None and limit < 0:
+            raise ValueError("limit must be non-negative")
+        dataset_version = await self.get_dataset_version(dataset_name, version, include_manifest=False)
+        if dataset_version.manifest_storage != "collection":
+            stop = None if limit is None else offset + limit
+            return dataset_version.manifest[offset:stop]
+        if limit == 0:
+            return []
+        members = await self.dataset_version_member_database.find_window(
+            {"dataset_version_id": dataset_version.dataset_version_id, "ordinal": {"$gte": offset}},
+            sort=[("ordinal", 1)],
+            limit=limit,
+        )
+        return [member.datum_id for member in members]
+
+    async def iter_dataset_version_datum_ids(
+        self,
+        dataset_name: str,
+        version: str,
+        *,
+        batch_size: int = _DATASET_VERSION_WRITE_BATCH,
+    ) -> AsyncIterator[str]:
+        """Yield a dataset version's datum ids in manifest order, reading collection manifests in batches."""
+        dataset_version = await self.get_dataset_version(dataset_name, version, include_manifest=False)
+        if dataset_version.manifest_storage != "collection":
+            for datum_id in dataset_version.manifest:
+                yield datum_id
+            return
+        async for member in self.dataset_version_member_database.find_iter(
+            {"dataset_version_id": dataset_version.dataset_version_id},
+            sort=[("ordinal", 1)],
+            batch_size=batch_size,
+        ):
+            yield member.datum_id
+
+    async def count_dataset_version_splits(self, dataset_name: str, version: str) -> dict[str | None, int]:
+        """Count a dataset version's datums per split; datums without a split are counted under ``None``."""
+        dataset_version = await self.get_dataset_version(dataset_name, version, include_manifest=False)
+        database, pipeline = self._dataset_version_members_pipeline(dataset_version)
+        pipeline.extend(
+            [
+                {
+                    "$lookup": {
+                        "from": Datum.Settings.name,
+                        "localField": "datum_id",
+                        "foreignField": "datum_id",
+                        "as": "datum",
+                    }
+                },
+                {"$unwind": "$datum"},
+                {"$group": {"_id": "$datum.split", "count": {"$sum": 1}}},
+            ]
+        )
+        return {row["_id"]: int(row["count"]) for row in await database.aggregate(pipeline)}
+
+    async def dataset_version_difference(
+        self,
+        dataset_name: str,
+        version: str,
+        other_version: str,
+        *,
+        other_dataset_name: str | None = None,
+    ) -> list[str]:
+        """Return datum ids of ``dataset_name@version`` missing from the other version, in manifest order.
+
+        The other version defaults to the same dataset; pass ``other_dataset_name`` to compare across datasets.
+        """
+        dataset_version = await self.get_dataset_version(dataset_name, version, include_manifest=False)
+        other = await self.get_dataset_version(
+            other_dataset_name or dataset_name,
+            other_version,
+            include_manifest=False,
+        )
+        database, pipeline = self._dataset_version_members_pipeline(dataset_version)
+        if other.manifest_storage == "collection":
+            pipeline.extend(
+                [
+                    {
+                        "$lookup": {
+                            "from": DatasetVersionMember.Settings.name,
+                            "let": {"datum_id": "$datum_id"},
+                            "pipeline": [
+                                {
+                                    "$match": {
+                                        "$expr": {
+                                            "$and": [
+                                                {"$eq": ["$dataset_version_id", other.dataset_version_id]},
+                                                {"$eq": ["$datum_id", "$$datum_id"]},
+                                            ]
+                                        }
+                                    }
+                                },
+                                {"$limit": 1},
+                            ],
+                            "as": "other",
+                        }
+                    },
+                    {"$match": {"other": {"$size": 0}}},
+                ]
+            )
+        else:
+            pipeline.append({"$match": {"datum_id": {"$nin": other.manifest}}})
+        pipeline.append({"$project": {"_id": 0, "datum_id": 1}})
+        return [row["datum_id"] for row in await database.aggregate(pipeline)]
 
     async def list_dataset_versions(
         self,
@@ -2229,14 +2681,15 @@ class AsyncDatalake(Mindtrace):
     ) -> DatasetViewPage:
         """Page through a dataset version manifest.
 
-        This can still be a heavy operation for large manifests, especially when filters force
-        per-row inspection or when expansions require loading linked assets or annotations.
+        Filters are compiled into the aggregation that joins the manifest to its datums, so matching
+        rows and ``include_total`` counts are computed by MongoDB rather than by scanning in Python.
+        Expansions still load linked assets or annotations for the returned rows.
         """
         if sort != "manifest_order":
             raise ValueError("dataset version views currently support only sort='manifest_order'")
 
         limit = self._resolve_page_limit(limit)
-        dataset_version = await self.get_dataset_version(dataset_name, version)
+        dataset_version = await self.get_dataset_version(dataset_name, version, include_manifest=False)
         expand = expand or DatasetViewExpand()
         filter_list = filters or []
         filter_payload = self._dataset_view_filter_payload(filter_list)
@@ -2251,13 +2704,11 @@ class AsyncDatalake(Mindtrace):
             )
             start_index = int(envelope.last_key.get("ordinal", -1)) + 1
 
-        scan_chunk_size = max(limit * 2, self._default_page_limit())
-        matches = await self._scan_dataset_view_manifest(
-            manifest=dataset_version.manifest,
+        matches = await self._find_dataset_view_matches(
+            dataset_version=dataset_version,
             start_index=start_index,
             filters=filter_list,
             target_count=limit + 1,
-            scan_chunk_size=scan_chunk_size,
         )
         visible_matches = matches[:limit]
         rows = await self._build_dataset_view_rows(
@@ -2278,9 +2729,8 @@ class AsyncDatalake(Mindtrace):
 
         if include_total:
             total_count_value = await self._count_dataset_view_matches(
-                manifest=dataset_version.manifest,
+                dataset_version=dataset_version,
                 filters=filter_list,
-                scan_chunk_size=scan_chunk_size,
             )
         else:
             total_count_value = None
@@ -2367,24 +2817,29 @@ class AsyncDatalake(Mindtrace):
         overwrite: bool = False,
         split_map: dict[str, str] | None = None,
         exporter_options: dict[str, Any] | None = None,
-    ):
-        """Export an immutable dataset version to a named external format."""
-        from mindtrace.datalake.exporters import export_dataset_to_format
-        from mindtrace.datalake.exporters.base import build_exportable_dataset_from_resolved_version_async
+        concurrency: int = 8,
+        progress_callback: Callable[[ExportProgress], None] | None = None,
+    ) -> ExportResult:
+        """Export an immutable dataset version to a named external format.
+
+        Datums are resolved and their payloads fetched ``concurrency`` at a time and written out as they
+        arrive, so memory use does not grow with the size of the version. ``progress_callback`` receives an
+        :class:`~mindtrace.datalake.exporters.ExportProgress` after each datum.
+        """
+        from mindtrace.datalake.exporters import stream_dataset_version_export
 
-        resolved_dataset_version = await self.resolve_dataset_version(dataset_name, version)
-        exportable_dataset = await build_exportable_dataset_from_resolved_version_async(
+        return await stream_dataset_version_export(
             self,
-            resolved_dataset_version,
-            split_map=split_map,
-        )
-        return export_dataset_to_format(
-            exportable_dataset,
+            dataset_name,
+            version,
             format=format,
             destination=destination,
             include_media=include_media,
             overwrite=overwrite,
+            split_map=split_map,
             exporter_options=exporter_options,
+            concurrency=concurrency,
+            progress_callback=progress_callback,
         )
 
     async def create_asset_from_object(
@@ -2422,3 +2877,43 @@ class AsyncDatalake(Mindtrace):
             metadata=asset_metadata,
             created_by=created_by,
         )
+
+    async def create_assets_from_objects(self, objects: Iterable[dict[str, Any]]) -> list[Asset]:
+        """Store many payloads and create their assets with a single insert.
+
+        Each item holds the keyword arguments of :meth:`create_asset_from_object`. Payloads are saved
+        concurrently on the store save executor; assets and their primary aliases are then inserted in
+        bulk. Returns the assets in input order.
+        """
+        specs = list(objects)
+        if not specs:
+            return []
+        storage_refs = await asyncio.gather(
+            *(
+                self.put_object(
+                    name=spec["name"],
+                    obj=spec["obj"],
+                    mount=spec.get("mount"),
+                    version=spec.get("version"),
+                    metadata=spec.get("object_metadata"),
+                    on_conflict=spec.get("on_conflict"),
+                )
+                for spec in specs
+            )
+        )
+        assets = [
+            self._new_asset_document(
+                kind=spec["kind"],
+                media_type=spec["media_type"],
+                storage_ref=storage_ref,
+                checksum=spec.get("checksum"),
+                size_bytes=spec.get("size_bytes"),
+                subject=spec.get("subject"),
+                metadata=spec.get("asset_metadata"),
+                created_by=spec.get("created_by"),
+            )
+            for spec, storage_ref in zip(specs, storage_refs)
+        ]
+        inserted = await self.asset_database.insert_many(assets, ordered=True)
+        await self.ensure_primary_asset_aliases(inserted)
+        return inserted
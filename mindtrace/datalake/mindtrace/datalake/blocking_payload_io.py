@@ -2,10 +2,141 @@
 
 from __future__ import annotations
 
+import hashlib
+import threading
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
 
+DEFAULT_PAYLOAD_CHUNK_SIZE = 8 * 2**20
+
 
 def mkdir_and_write_bytes(upload_path: Path, data: bytes) -> None:
     """Ensure parent dirs exist and write payload bytes (blocking disk I/O)."""
     upload_path.parent.mkdir(parents=True, exist_ok=True)
     upload_path.write_bytes(data)
+
+
+class PayloadByteBudget:
+    """Thread-safe cap on payload bytes buffered in memory by concurrent streaming transfers.
+
+    Every transfer reserves one chunk at a time, so at most ``max_bytes`` of payload data is in flight no matter how
+    many transfers share the budget. A chunk larger than the whole budget is admitted on its own.
+
+    Args:
+        max_bytes: Budget in bytes, or None for no cap.
+    """
+
+    def __init__(self, max_bytes: int | None = None) -> None:
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError("max_bytes must be positive or None")
+        self.max_bytes = max_bytes
+        self._in_flight = 0
+        self._condition = threading.Condition()
+
+    @property
+    def in_flight(self) -> int:
+        with self._condition:
+            return self._in_flight
+
+    @contextmanager
+    def reserve(self, nbytes: int) -> Iterator[None]:
+        """Block until ``nbytes`` fit in the budget and hold them for the duration of the ``with`` block."""
+        if self.max_bytes is None:
+            yield
+            return
+        nbytes = min(nbytes, self.max_bytes)
+        with self._condition:
+            self._condition.wait_for(lambda: self._in_flight + nbytes <= self.max_bytes)
+            self._in_flight += nbytes
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._in_flight -= nbytes
+                self._condition.notify_all()
+
+
+@dataclass
+class StreamedPayload:
+    """Size and checksums of a payload, tallied while it was streamed."""
+
+    size_bytes: int = 0
+    digests: dict[str, str] = field(default_factory=dict)
+
+
+class PayloadStream:
+    """Single-pass chunked reader over a payload held in memory or on disk.
+
+    Iterating yields the payload in ``chunk_size`` pieces (reserved against ``budget`` while each is in use) and
+    hashes every piece with ``algorithms`` on the way, so size and checksums are known once the stream has been
+    consumed without reading the source again.
+
+    Args:
+        source: Payload bytes, or the path of a file holding them.
+        algorithms: ``hashlib`` algorithm names to compute, e.g. ``("sha256",)``.
+        chunk_size: Bytes read per chunk.
+        budget: Optional budget shared with other concurrent transfers.
+    """
+
+    def __init__(
+        self,
+        source: bytes | bytearray | memoryview | Path,
+        *,
+        algorithms: Iterable[str] = (),
+        chunk_size: int = DEFAULT_PAYLOAD_CHUNK_SIZE,
+        budget: PayloadByteBudget | None = None,
+    ) -> None:
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        self.source = source
+        self.chunk_size = chunk_size
+        self.budget = budget or PayloadByteBudget()
+        self._hashers = {algorithm: hashlib.new(algorithm) for algorithm in dict.fromkeys(algorithms)}
+        self._consumed = 0
+
+    @property
+    def total_size(self) -> int:
+        """Size of the whole payload, known before it is read."""
+        if isinstance(self.source, Path):
+            return self.source.stat().st_size
+        return len(self.source)
+
+    def __iter__(self) -> Iterator[bytes]:
+        if isinstance(self.source, Path):
+            with open(self.source, "rb") as fp:
+                while True:
+                    with self.budget.reserve(self.chunk_size):
+                        chunk = fp.read(self.chunk_size)
+                        if not chunk:
+                            return
+                        yield self._tally(chunk)
+        else:
+            view = memoryview(self.source)
+            for offset in range(0, len(view), self.chunk_size):
+                chunk = view[offset : offset + self.chunk_size]
+                with self.budget.reserve(len(chunk)):
+                    yield self._tally(chunk)
+
+    def _tally(self, chunk: bytes | memoryview) -> bytes | memoryview:
+        self._consumed += len(chunk)
+        for hasher in self._hashers.values():
+            hasher.update(chunk)
+        return chunk
+
+    def result(self) -> StreamedPayload:
+        """Size and checksums of everything yielded so far."""
+        return StreamedPayload(
+            size_bytes=self._consumed,
+            digests={algorithm: hasher.hexdigest() for algorithm, hasher in self._hashers.items()},
+        )
+
+
+def stream_payload_to_path(upload_path: Path, stream: PayloadStream) -> StreamedPayload:
+    """Write a payload stream to ``upload_path`` chunk by chunk, creating parent dirs (blocking disk I/O)."""
+    upload_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(upload_path, "wb") as fp:
+        for chunk in stream:
+            fp.write(chunk)
+    return stream.result()
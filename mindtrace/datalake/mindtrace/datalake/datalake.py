@@ -2,13 +2,14 @@ from __future__ import annotations
 
 import asyncio
 import threading
-from collections.abc import Iterator
+from collections.abc import Callable, Iterable, Iterator
 from concurrent.futures import Future
 from pathlib import Path
 from typing import Any, Optional
 
 from mindtrace.core import Mindtrace
 from mindtrace.datalake.async_datalake import AsyncDatalake, SlowOpsPolicy
+from mindtrace.datalake.exporters.types import ExportProgress
 from mindtrace.registry import Mount, Store
 
 
@@ -636,6 +637,9 @@ class Datalake(Mindtrace):
     def create_annotation_set(self, **kwargs: Any):
         return self._submit_coro(self._backend.create_annotation_set(**kwargs))
 
+    def create_annotation_sets(self, annotation_sets: Iterable[dict[str, Any]]):
+        return self._submit_coro(self._backend.create_annotation_sets(annotation_sets))
+
     def get_annotation_set(self, annotation_set_id: str):
         return self._submit_coro(self._backend.get_annotation_set(annotation_set_id))
 
@@ -765,6 +769,9 @@ class Datalake(Mindtrace):
     def create_datum(self, **kwargs: Any):
         return self._submit_coro(self._backend.create_datum(**kwargs))
 
+    def create_datums(self, datums: Iterable[dict[str, Any]]):
+        return self._submit_coro(self._backend.create_datums(datums))
+
     def get_datum(self, datum_id: str):
         return self._submit_coro(self._backend.get_datum(datum_id))
 
@@ -811,8 +818,42 @@ class Datalake(Mindtrace):
     def create_dataset_version(self, **kwargs: Any):
         return self._submit_coro(self._backend.create_dataset_version(**kwargs))
 
-    def get_dataset_version(self, dataset_name: str, version: str):
-        return self._submit_coro(self._backend.get_dataset_version(dataset_name, version))
+    def get_dataset_version(self, dataset_name: str, version: str, *, include_manifest: bool = True):
+        return self._submit_coro(
+            self._backend.get_dataset_version(dataset_name, version, include_manifest=include_manifest)
+        )
+
+    def get_dataset_version_datum_ids(
+        self,
+        dataset_name: str,
+        version: str,
+        *,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> list[str]:
+        return self._submit_coro(
+            self._backend.get_dataset_version_datum_ids(dataset_name, version, offset=offset, limit=limit)
+        )
+
+    def count_dataset_version_splits(self, dataset_name: str, version: str) -> dict[str | None, int]:
+        return self._submit_coro(self._backend.count_dataset_version_splits(dataset_name, version))
+
+    def dataset_version_difference(
+        self,
+        dataset_name: str,
+        version: str,
+        other_version: str,
+        *,
+        other_dataset_name: str | None = None,
+    ) -> list[str]:
+        return self._submit_coro(
+            self._backend.dataset_version_difference(
+                dataset_name,
+                version,
+                other_version,
+                other_dataset_name=other_dataset_name,
+            )
+        )
 
     def list_dataset_versions(self, dataset_name: str | None = None, filters: dict[str, Any] | None = None):
         return self._submit_coro(self._backend.list_dataset_versions(dataset_name=dataset_name, filters=filters))
@@ -899,6 +940,8 @@ class Datalake(Mindtrace):
         overwrite: bool = False,
         split_map: dict[str, str] | None = None,
         exporter_options: dict[str, Any] | None = None,
+        concurrency: int = 8,
+        progress_callback: Callable[[ExportProgress], None] | None = None,
     ):
         return self._submit_coro(
             self._backend.export_dataset_version_to_format(
@@ -910,12 +953,17 @@ class Datalake(Mindtrace):
                 overwrite=overwrite,
                 split_map=split_map,
                 exporter_options=exporter_options,
+                concurrency=concurrency,
+                progress_callback=progress_callback,
             )
         )
 
     def create_asset_from_object(self, **kwargs: Any):
         return self._submit_coro(self._backend.create_asset_from_object(**kwargs))
 
+    def create_assets_from_objects(self, objects: Iterable[dict[str, Any]]):
+        return self._submit_coro(self._backend.create_assets_from_objects(objects))
+
     def create_asset_from_uploaded_object(self, **kwargs: Any):
         return self._submit_coro(self._backend.create_asset(**kwargs))
 
@@ -3,7 +3,8 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any, Callable
 
-from .types import ExportableDataset, ExportableItem, ExportResult
+from .streaming import stream_dataset_version_export
+from .types import ExportableDataset, ExportableItem, ExportProgress, ExportResult
 
 ExporterFunc = Callable[..., ExportResult]
 
@@ -46,6 +47,8 @@ __all__ = [
     "ExportResult",
     "ExportableDataset",
     "ExportableItem",
+    "ExportProgress",
     "export_dataset_to_format",
     "get_dataset_exporter",
+    "stream_dataset_version_export",
 ]
@@ -131,6 +131,14 @@ def _build_exportable_item(
     )
 
 
+async def load_asset_payload_async(object_loader: Any, asset: Asset) -> Any:
+    """Fetch an asset payload through ``get_asset_payload`` when available, else by storage ref."""
+    payload_loader = getattr(object_loader, "get_asset_payload", None)
+    if callable(payload_loader):
+        return await payload_loader(asset.asset_id)
+    return await object_loader.get_object(asset.payload_storage_ref or asset.storage_ref)
+
+
 def build_exportable_dataset_from_resolved_version_sync(
     object_loader: Any,
     resolved_dataset_version: ResolvedDatasetVersion,
@@ -184,13 +192,7 @@ async def build_exportable_dataset_from_resolved_version_async(
             warnings.append(f"Skipped datum {resolved_datum.datum.datum_id} because it does not reference any assets.")
             continue
         _, asset = primary_entry
-        payload_loader = getattr(object_loader, "get_asset_payload", None)
-        payload_ref = asset.payload_storage_ref or asset.storage_ref
-        payload_bytes = (
-            await payload_loader(asset.asset_id)
-            if callable(payload_loader)
-            else await object_loader.get_object(payload_ref)
-        )
+        payload_bytes = await load_asset_payload_async(object_loader, asset)
         export_item, item_warnings = _build_exportable_item(
             resolved_datum,
             payload_bytes=payload_bytes,
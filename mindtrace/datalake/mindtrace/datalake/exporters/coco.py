@@ -2,13 +2,17 @@ from __future__ import annotations
 
 import json
 from collections import defaultdict
+from collections.abc import Iterator
 from io import BytesIO
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
 from PIL import Image
 
+from mindtrace.datalake.types import AnnotationRecord
+
 from .base import prepare_export_destination, write_export_file
+from .streaming import StagedExportItem, StreamingExportWriter, iter_jsonl_rows, write_json_object, write_jsonl_row
 from .types import ExportableDataset, ExportableItem, ExportResult
 
 
@@ -38,15 +42,20 @@ def _supported_category_records(dataset: ExportableDataset) -> list[tuple[str, s
     return sorted(pairs, key=lambda pair: (pair[0], pair[1]))
 
 
-def _image_info(item: ExportableItem, image_id: int, file_name: str) -> dict[str, Any]:
+def _image_size(item: ExportableItem) -> tuple[int, int]:
     if item.payload_bytes is None:
         raise ValueError(f"COCO export requires payload bytes for asset {item.asset.asset_id}")
     if not item.asset.media_type.startswith("image/"):
         raise ValueError(
             f"COCO export supports image assets only; asset {item.asset.asset_id} has media type {item.asset.media_type!r}."
         )
+    # Image.open only parses the header; pixel data is never decoded here.
     with Image.open(BytesIO(item.payload_bytes)) as image:
-        width, height = image.size
+        return image.size
+
+
+def _image_info(item: ExportableItem, image_id: int, file_name: str) -> dict[str, Any]:
+    width, height = _image_size(item)
     return {
         "id": image_id,
         "file_name": file_name,
@@ -55,6 +64,64 @@ def _image_info(item: ExportableItem, image_id: int, file_name: str) -> dict[str
     }
 
 
+def _image_relative_path(item: ExportableItem) -> Path:
+    image_filename = item.source_filename or f"{item.asset.asset_id}.bin"
+    if item.split is None:
+        return Path("images") / image_filename
+    return Path("images") / item.split / image_filename
+
+
+def _coco_annotation(
+    annotation: AnnotationRecord,
+    *,
+    annotation_id: int,
+    image_id: int,
+    category_id: Any,
+    asset_id: str,
+) -> tuple[dict[str, Any] | None, str | None]:
+    """Convert one annotation record, returning ``(row, None)`` or ``(None, warning)`` when it is skipped."""
+    if annotation.kind == "bbox":
+        geometry = annotation.geometry or {}
+        bbox = [
+            float(geometry["x"]),
+            float(geometry["y"]),
+            float(geometry["width"]),
+            float(geometry["height"]),
+        ]
+        return {
+            "id": annotation_id,
+            "image_id": image_id,
+            "category_id": category_id,
+            "bbox": bbox,
+            "area": float(bbox[2] * bbox[3]),
+            "iscrowd": 0,
+            "segmentation": [],
+        }, None
+    if annotation.kind == "polygon":
+        vertices = list(annotation.geometry.get("vertices") or annotation.geometry.get("points") or [])
+        if len(vertices) < 3:
+            return None, (
+                f"Skipped polygon annotation {annotation.annotation_id} on asset {asset_id} because it has fewer than 3 vertices."
+            )
+        flattened = [float(coord) for vertex in vertices for coord in vertex]
+        return {
+            "id": annotation_id,
+            "image_id": image_id,
+            "category_id": category_id,
+            "bbox": _polygon_bbox(vertices),
+            "area": _polygon_area(vertices),
+            "iscrowd": 0,
+            "segmentation": [flattened],
+        }, None
+    return None, (
+        f"Skipped unsupported COCO annotation kind {annotation.kind!r} for annotation {annotation.annotation_id}."
+    )
+
+
+def _annotations_file_path(split_name: str, *, named_splits: bool) -> Path:
+    return Path("annotations") / f"{split_name}.json" if named_splits else Path("annotations.json")
+
+
 def export_dataset_as_coco(
     dataset: ExportableDataset,
     *,
@@ -76,55 +143,22 @@ def export_dataset_as_coco(
     next_annotation_id = 1
     for image_id, item in enumerate(dataset.items, start=1):
         split_name = item.split or "default"
-        image_filename = item.source_filename or f"{item.asset.asset_id}.bin"
-        image_relative_path = (
-            Path("images") / split_name / image_filename if item.split is not None else Path("images") / image_filename
-        )
+        image_relative_path = _image_relative_path(item)
         if include_media and item.payload_bytes is not None:
             files_written.append(write_export_file(destination_path, image_relative_path, item.payload_bytes))
         image_row = _image_info(item, image_id, image_relative_path.as_posix())
         split_bundles[split_name]["images"].append(image_row)
 
         for annotation in item.annotations:
-            category_key = (annotation.kind, annotation.label)
-            if annotation.kind == "bbox":
-                geometry = annotation.geometry or {}
-                bbox = [
-                    float(geometry["x"]),
-                    float(geometry["y"]),
-                    float(geometry["width"]),
-                    float(geometry["height"]),
-                ]
-                coco_annotation = {
-                    "id": next_annotation_id,
-                    "image_id": image_id,
-                    "category_id": category_ids[category_key],
-                    "bbox": bbox,
-                    "area": float(bbox[2] * bbox[3]),
-                    "iscrowd": 0,
-                    "segmentation": [],
-                }
-            elif annotation.kind == "polygon":
-                vertices = list(annotation.geometry.get("vertices") or annotation.geometry.get("points") or [])
-                if len(vertices) < 3:
-                    warnings.append(
-                        f"Skipped polygon annotation {annotation.annotation_id} on asset {item.asset.asset_id} because it has fewer than 3 vertices."
-                    )
-                    continue
-                flattened = [float(coord) for vertex in vertices for coord in vertex]
-                coco_annotation = {
-                    "id": next_annotation_id,
-                    "image_id": image_id,
-                    "category_id": category_ids[category_key],
-                    "bbox": _polygon_bbox(vertices),
-                    "area": _polygon_area(vertices),
-                    "iscrowd": 0,
-                    "segmentation": [flattened],
-                }
-            else:
-                warnings.append(
-                    f"Skipped unsupported COCO annotation kind {annotation.kind!r} for annotation {annotation.annotation_id}."
-                )
+            coco_annotation, warning = _coco_annotation(
+                annotation,
+                annotation_id=next_annotation_id,
+                image_id=image_id,
+                category_id=category_ids.get((annotation.kind, annotation.label)),
+                asset_id=item.asset.asset_id,
+            )
+            if coco_annotation is None:
+                warnings.append(warning)
                 continue
             split_bundles[split_name]["annotations"].append(coco_annotation)
             next_annotation_id += 1
@@ -138,10 +172,7 @@ def export_dataset_as_coco(
             "images": payload["images"],
             "annotations": payload["annotations"],
         }
-        if multiple_splits:
-            relative_path = Path("annotations") / f"{split_name}.json"
-        else:
-            relative_path = Path("annotations.json")
+        relative_path = _annotations_file_path(split_name, named_splits=bool(multiple_splits))
         files_written.append(
             write_export_file(
                 destination_path,
@@ -171,3 +202,121 @@ def export_dataset_as_coco(
         files_written=files_written,
         warnings=warnings,
     )
+
+
+class CocoStreamWriter(StreamingExportWriter):
+    """Streaming counterpart of :func:`export_dataset_as_coco` producing the same files.
+
+    Image and annotation rows are spooled per split as they arrive. Category ids depend on every label in the
+    export, so annotations carry their ``(kind, label)`` key until :meth:`finish` assigns the ids.
+    """
+
+    format_name = "coco"
+
+    def __init__(self, destination: Path, *, include_media: bool = True, options: dict[str, Any] | None = None):
+        super().__init__(destination, include_media=include_media, options=options)
+        self._next_image_id = 1
+        self._next_annotation_id = 1
+        self._categories: set[tuple[str, str]] = set()
+        self._splits: list[str] = []
+        self._named_splits = False
+
+    def stage(self, item: ExportableItem) -> StagedExportItem:
+        image_relative_path = _image_relative_path(item)
+        width, height = _image_size(item)
+        media_path = None
+        if self.include_media:
+            media_path = write_export_file(self.destination, image_relative_path, item.payload_bytes)
+        return StagedExportItem(
+            item=item.model_copy(update={"payload_bytes": None}),
+            media_path=media_path,
+            details={"file_name": image_relative_path.as_posix(), "width": width, "height": height},
+        )
+
+    def _split_files(self, split_name: str) -> tuple[TextIO, TextIO]:
+        if split_name not in self._splits:
+            self._splits.append(split_name)
+        return self.spool_file(f"{split_name}.images.jsonl"), self.spool_file(f"{split_name}.annotations.jsonl")
+
+    def append(self, staged: StagedExportItem) -> None:
+        item = staged.item
+        images, annotations = self._split_files(item.split or "default")
+        image_id = self._next_image_id
+        self._next_image_id += 1
+        if staged.media_path is not None:
+            self.files_written.append(staged.media_path)
+        write_jsonl_row(images, {"id": image_id, **staged.details})
+        for annotation in item.annotations:
+            category_key = (annotation.kind, annotation.label)
+            if annotation.kind in {"bbox", "polygon"}:
+                # Registered even when the annotation is skipped below, as _supported_category_records does.
+                self._categories.add(category_key)
+            coco_annotation, warning = _coco_annotation(
+                annotation,
+                annotation_id=self._next_annotation_id,
+                image_id=image_id,
+                category_id=list(category_key),
+                asset_id=item.asset.asset_id,
+            )
+            if coco_annotation is None:
+                self.warnings.append(warning)
+                continue
+            write_jsonl_row(annotations, coco_annotation)
+            self._next_annotation_id += 1
+        self._named_splits = self._named_splits or item.split is not None
+        self.asset_count += 1
+        self.annotation_count += len(item.annotations)
+
+    def finish(self, *, dataset_name: str, description: str | None, warnings: list[str]) -> ExportResult:
+        warnings = [*warnings, *self.warnings]
+        categories = sorted(self._categories)
+        category_ids = {pair: idx + 1 for idx, pair in enumerate(categories)}
+        category_rows = [{"id": category_ids[pair], "name": pair[1], "supercategory": pair[0]} for pair in categories]
+
+        def remapped_annotations(path: Path) -> Iterator[dict[str, Any]]:
+            for row in iter_jsonl_rows(path):
+                row["category_id"] = category_ids[tuple(row["category_id"])]
+                yield row
+
+        for split_name in self._splits:
+            images_path = self.close_spool_file(f"{split_name}.images.jsonl")
+            annotations_path = self.close_spool_file(f"{split_name}.annotations.jsonl")
+            relative_path = _annotations_file_path(split_name, named_splits=self._named_splits)
+            target = self.destination / relative_path
+            target.parent.mkdir(parents=True, exist_ok=True)
+            with target.open("w", encoding="utf-8") as handle:
+                write_json_object(
+                    handle,
+                    {
+                        "info": {"description": description or dataset_name},
+                        "licenses": [],
+                        "categories": category_rows,
+                        "images": iter_jsonl_rows(images_path),
+                        "annotations": remapped_annotations(annotations_path),
+                    },
+                )
+            self.files_written.append(relative_path.as_posix())
+
+        summary = {
+            "format": "coco",
+            "dataset_name": dataset_name,
+            "asset_count": self.asset_count,
+            "annotation_count": self.annotation_count,
+            "warnings": warnings,
+        }
+        self.files_written.append(
+            write_export_file(
+                self.destination,
+                "export_summary.json",
+                json.dumps(summary, indent=2, sort_keys=True).encode("utf-8"),
+            )
+        )
+        return ExportResult(
+            format="coco",
+            destination=self.destination,
+            dataset_name=dataset_name,
+            asset_count=self.asset_count,
+            annotation_count=self.annotation_count,
+            files_written=self.files_written,
+            warnings=warnings,
+        )
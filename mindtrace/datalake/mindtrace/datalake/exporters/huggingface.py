@@ -5,7 +5,43 @@ from pathlib import Path
 from typing import Any
 
 from .base import prepare_export_destination, write_export_file
-from .types import ExportableDataset, ExportResult
+from .streaming import StagedExportItem, StreamingExportWriter, iter_jsonl_rows, write_jsonl_row
+from .types import ExportableDataset, ExportableItem, ExportResult
+
+
+def _import_datasets_module() -> Any:
+    try:
+        return importlib.import_module("datasets")
+    except ImportError as exc:
+        raise ImportError(
+            "Hugging Face export requires the optional 'datasets' dependency. "
+            "Install mindtrace-datalake[export-huggingface]."
+        ) from exc
+
+
+def _media_relative_path(item: ExportableItem) -> Path:
+    return Path("media") / (item.split or "default") / (item.source_filename or f"{item.asset.asset_id}.bin")
+
+
+def _huggingface_row(item: ExportableItem, media_relative_path: str | None) -> dict[str, Any]:
+    return {
+        "asset_id": item.asset.asset_id,
+        "split": item.split,
+        "media_type": item.asset.media_type,
+        "image_path": media_relative_path,
+        "storage_ref": item.asset.storage_ref.model_dump(mode="json"),
+        "metadata": dict(item.metadata or {}),
+        "asset_metadata": dict(item.asset.metadata or {}),
+        "annotations": [annotation.model_dump(mode="json") for annotation in item.annotations],
+    }
+
+
+def _save_dataset_payload(datasets_module: Any, dataset_payload: dict[str, Any], destination_path: Path) -> None:
+    if len(dataset_payload) == 1 and "default" in dataset_payload:
+        hf_dataset = dataset_payload["default"]
+    else:
+        hf_dataset = datasets_module.DatasetDict(dataset_payload)
+    hf_dataset.save_to_disk(str(destination_path))
 
 
 def export_dataset_as_huggingface(
@@ -18,14 +54,7 @@ def export_dataset_as_huggingface(
 ) -> ExportResult:
     """Export a canonical dataset view to a Hugging Face datasets directory."""
     del options
-    try:
-        datasets_module = importlib.import_module("datasets")
-    except ImportError as exc:
-        raise ImportError(
-            "Hugging Face export requires the optional 'datasets' dependency. "
-            "Install mindtrace-datalake[export-huggingface]."
-        ) from exc
-
+    datasets_module = _import_datasets_module()
     destination_path = prepare_export_destination(destination, overwrite=overwrite)
     warnings = list(dataset.warnings)
     files_written: list[str] = []
@@ -35,28 +64,12 @@ def export_dataset_as_huggingface(
         split_name = item.split or "default"
         media_relative_path: str | None = None
         if include_media and item.payload_bytes is not None:
-            media_path = Path("media") / split_name / (item.source_filename or f"{item.asset.asset_id}.bin")
-            media_relative_path = write_export_file(destination_path, media_path, item.payload_bytes)
+            media_relative_path = write_export_file(destination_path, _media_relative_path(item), item.payload_bytes)
             files_written.append(media_relative_path)
-        rows_by_split.setdefault(split_name, []).append(
-            {
-                "asset_id": item.asset.asset_id,
-                "split": item.split,
-                "media_type": item.asset.media_type,
-                "image_path": media_relative_path,
-                "storage_ref": item.asset.storage_ref.model_dump(mode="json"),
-                "metadata": dict(item.metadata or {}),
-                "asset_metadata": dict(item.asset.metadata or {}),
-                "annotations": [annotation.model_dump(mode="json") for annotation in item.annotations],
-            }
-        )
+        rows_by_split.setdefault(split_name, []).append(_huggingface_row(item, media_relative_path))
 
     dataset_payload = {split: datasets_module.Dataset.from_list(rows) for split, rows in rows_by_split.items()}
-    if len(dataset_payload) == 1 and "default" in dataset_payload:
-        hf_dataset = dataset_payload["default"]
-    else:
-        hf_dataset = datasets_module.DatasetDict(dataset_payload)
-    hf_dataset.save_to_disk(str(destination_path))
+    _save_dataset_payload(datasets_module, dataset_payload, destination_path)
 
     files_written.append(".")
     return ExportResult(
@@ -68,3 +81,55 @@ def export_dataset_as_huggingface(
         files_written=files_written,
         warnings=warnings,
     )
+
+
+class HuggingFaceStreamWriter(StreamingExportWriter):
+    """Streaming counterpart of :func:`export_dataset_as_huggingface`.
+
+    Rows are spooled per split as JSON lines and loaded with ``Dataset.from_generator``, which writes Arrow
+    shards to disk as it reads, so neither payloads nor rows are held in memory.
+    """
+
+    format_name = "huggingface"
+
+    def __init__(self, destination: Path, *, include_media: bool = True, options: dict[str, Any] | None = None):
+        self._datasets_module = _import_datasets_module()
+        super().__init__(destination, include_media=include_media, options=options)
+        self._splits: list[str] = []
+
+    def stage(self, item: ExportableItem) -> StagedExportItem:
+        media_path = None
+        if self.include_media and item.payload_bytes is not None:
+            media_path = write_export_file(self.destination, _media_relative_path(item), item.payload_bytes)
+        return StagedExportItem(item=item.model_copy(update={"payload_bytes": None}), media_path=media_path)
+
+    def append(self, staged: StagedExportItem) -> None:
+        item = staged.item
+        split_name = item.split or "default"
+        if split_name not in self._splits:
+            self._splits.append(split_name)
+        if staged.media_path is not None:
+            self.files_written.append(staged.media_path)
+        write_jsonl_row(self.spool_file(f"{split_name}.rows.jsonl"), _huggingface_row(item, staged.media_path))
+        self.asset_count += 1
+        self.annotation_count += len(item.annotations)
+
+    def finish(self, *, dataset_name: str, description: str | None, warnings: list[str]) -> ExportResult:
+        del description
+        dataset_payload = {
+            split_name: self._datasets_module.Dataset.from_generator(
+                iter_jsonl_rows, gen_kwargs={"path": str(self.close_spool_file(f"{split_name}.rows.jsonl"))}
+            )
+            for split_name in self._splits
+        }
+        _save_dataset_payload(self._datasets_module, dataset_payload, self.destination)
+        self.files_written.append(".")
+        return ExportResult(
+            format="huggingface",
+            destination=self.destination,
+            dataset_name=dataset_name,
+            asset_count=self.asset_count,
+            annotation_count=self.annotation_count,
+            files_written=self.files_written,
+            warnings=[*warnings, *self.warnings],
+        )
@@ -0,0 +1,223 @@
+"""Streaming dataset version export.
+
+:func:`stream_dataset_version_export` walks a dataset version's manifest, resolves each datum and fetches its
+payload with bounded concurrency, and hands the items to a format writer in manifest order. Writers put media on
+disk from the task that fetched it and spool annotation rows to temporary files, so memory use is bounded by
+``concurrency`` instead of the size of the dataset version. Image and annotation ids match the in-memory
+exporters because items reach the writer in the same order.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import tempfile
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, TextIO
+
+from .base import _build_exportable_item, _primary_asset_entry, load_asset_payload_async, prepare_export_destination
+from .types import ExportableItem, ExportProgress, ExportResult
+
+ProgressCallback = Callable[[ExportProgress], None]
+
+
+@dataclass
+class StagedExportItem:
+    """An export item whose media has been written; ``item.payload_bytes`` is always ``None``."""
+
+    item: ExportableItem
+    media_path: str | None = None
+    details: dict[str, Any] = field(default_factory=dict)
+
+
+class StreamingExportWriter(ABC):
+    """Base class for format writers driven by :func:`stream_dataset_version_export`.
+
+    ``stage`` runs on worker threads, concurrently and in any order, and must only touch its own item's files.
+    ``append`` and ``finish`` run on the event loop in manifest order.
+    """
+
+    format_name = ""
+
+    def __init__(self, destination: Path, *, include_media: bool = True, options: dict[str, Any] | None = None):
+        self.destination = destination
+        self.include_media = include_media
+        self.options = dict(options or {})
+        self.files_written: list[str] = []
+        self.warnings: list[str] = []
+        self.asset_count = 0
+        self.annotation_count = 0
+        self._spool = tempfile.TemporaryDirectory(prefix=f"mindtrace-{self.format_name}-export-")
+        self._spool_files: dict[str, TextIO] = {}
+
+    @abstractmethod
+    def stage(self, item: ExportableItem) -> StagedExportItem:
+        """Write the media of *item* and return what :meth:`append` needs to record it."""
+
+    @abstractmethod
+    def append(self, staged: StagedExportItem) -> None:
+        """Record a staged item, in manifest order."""
+
+    @abstractmethod
+    def finish(self, *, dataset_name: str, description: str | None, warnings: list[str]) -> ExportResult:
+        """Write the remaining export files from the spooled rows and return the export result."""
+
+    def spool_file(self, name: str) -> TextIO:
+        """Return an append handle on a named spool file, creating it on first use."""
+        handle = self._spool_files.get(name)
+        if handle is None:
+            handle = (Path(self._spool.name) / name).open("w", encoding="utf-8")
+            self._spool_files[name] = handle
+        return handle
+
+    def close_spool_file(self, name: str) -> Path:
+        """Flush and close a spool file and return its path for reading."""
+        self._spool_files.pop(name).close()
+        return Path(self._spool.name) / name
+
+    def close(self) -> None:
+        for handle in self._spool_files.values():
+            handle.close()
+        self._spool_files.clear()
+        self._spool.cleanup()
+
+
+def write_jsonl_row(handle: TextIO, row: dict[str, Any]) -> None:
+    handle.write(json.dumps(row, sort_keys=True))
+    handle.write("\n")
+
+
+def iter_jsonl_rows(path: str | Path) -> Iterator[dict[str, Any]]:
+    with Path(path).open(encoding="utf-8") as handle:
+        for line in handle:
+            yield json.loads(line)
+
+
+def write_json_object(handle: TextIO, fields: dict[str, Any]) -> None:
+    """Write ``fields`` exactly as ``json.dumps(fields, indent=2, sort_keys=True)`` would.
+
+    Iterator values are written as arrays one element at a time, so large arrays never sit in memory.
+    """
+    handle.write("{")
+    keys = sorted(fields)
+    for index, key in enumerate(keys):
+        handle.write(f"\n  {json.dumps(key)}: ")
+        value = fields[key]
+        if isinstance(value, Iterator):
+            empty = True
+            handle.write("[")
+            for element in value:
+                handle.write("\n    " if empty else ",\n    ")
+                handle.write(json.dumps(element, indent=2, sort_keys=True).replace("\n", "\n    "))
+                empty = False
+            handle.write("]" if empty else "\n  ]")
+        else:
+            handle.write(json.dumps(value, indent=2, sort_keys=True).replace("\n", "\n  "))
+        if index < len(keys) - 1:
+            handle.write(",")
+    handle.write("\n}" if keys else "}")
+
+
+def get_streaming_export_writer(format_name: str) -> type[StreamingExportWriter]:
+    """Return the streaming writer class for a named format."""
+    normalized = format_name.strip().lower()
+    if normalized == "coco":
+        from .coco import CocoStreamWriter
+
+        return CocoStreamWriter
+    if normalized == "huggingface":
+        from .huggingface import HuggingFaceStreamWriter
+
+        return HuggingFaceStreamWriter
+    raise ValueError(f"Unsupported dataset export format {format_name!r}. Supported formats: 'coco', 'huggingface'.")
+
+
+def _payload_size(payload: Any) -> int:
+    return len(payload) if isinstance(payload, (bytes, bytearray, memoryview)) else 0
+
+
+async def stream_dataset_version_export(
+    source: Any,
+    dataset_name: str,
+    version: str,
+    *,
+    format: str,
+    destination: str | Path,
+    include_media: bool = True,
+    overwrite: bool = False,
+    split_map: dict[str, str] | None = None,
+    exporter_options: dict[str, Any] | None = None,
+    concurrency: int = 8,
+    progress_callback: ProgressCallback | None = None,
+) -> ExportResult:
+    """Export a dataset version without holding its payloads in memory.
+
+    ``source`` is an :class:`~mindtrace.datalake.AsyncDatalake` or anything with the same
+    ``get_dataset_version``, ``iter_dataset_version_datum_ids``, ``resolve_datum`` and payload methods. At most
+    ``concurrency`` datums are resolved and fetched at once. ``progress_callback`` is called after each datum.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    writer_cls = get_streaming_export_writer(format)
+    dataset_version = await source.get_dataset_version(dataset_name, version, include_manifest=False)
+    writer = writer_cls(Path(destination), include_media=include_media, options=exporter_options)
+    pending: deque[asyncio.Task] = deque()
+    try:
+        prepare_export_destination(destination, overwrite=overwrite)
+        warnings: list[str] = []
+        processed = 0
+        fetched_bytes = 0
+        started = time.perf_counter()
+
+        async def load(datum_id: str) -> tuple[StagedExportItem | None, list[str], int]:
+            resolved_datum = await source.resolve_datum(datum_id)
+            primary_entry = _primary_asset_entry(resolved_datum)
+            if primary_entry is None:
+                return None, [f"Skipped datum {datum_id} because it does not reference any assets."], 0
+            payload = await load_asset_payload_async(source, primary_entry[1])
+            item, item_warnings = _build_exportable_item(resolved_datum, payload_bytes=payload, split_map=split_map)
+            staged = await asyncio.to_thread(writer.stage, item) if item is not None else None
+            return staged, item_warnings, _payload_size(payload)
+
+        async def drain_one() -> None:
+            nonlocal processed, fetched_bytes
+            staged, item_warnings, size = await pending.popleft()
+            warnings.extend(item_warnings)
+            if staged is not None:
+                writer.append(staged)
+            processed += 1
+            fetched_bytes += size
+            if progress_callback is not None:
+                progress_callback(
+                    ExportProgress(
+                        dataset_name=dataset_name,
+                        version=version,
+                        total_datums=dataset_version.size,
+                        processed_datums=processed,
+                        exported_assets=writer.asset_count,
+                        payload_bytes=fetched_bytes,
+                        elapsed_seconds=time.perf_counter() - started,
+                    )
+                )
+
+        async for datum_id in source.iter_dataset_version_datum_ids(dataset_name, version):
+            pending.append(asyncio.create_task(load(datum_id)))
+            if len(pending) >= concurrency:
+                await drain_one()
+        while pending:
+            await drain_one()
+        return writer.finish(
+            dataset_name=dataset_version.dataset_name,
+            description=dataset_version.description,
+            warnings=warnings,
+        )
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        writer.close()
@@ -48,3 +48,19 @@ class ExportResult(BaseModel):
     annotation_count: int
     files_written: list[str] = Field(default_factory=list)
     warnings: list[str] = Field(default_factory=list)
+
+
+class ExportProgress(BaseModel):
+    """Snapshot passed to streaming export progress callbacks after each datum."""
+
+    dataset_name: str
+    version: str
+    total_datums: int
+    processed_datums: int
+    exported_assets: int
+    payload_bytes: int
+    elapsed_seconds: float
+
+    @property
+    def datums_per_second(self) -> float:
+        return self.processed_datums / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
 import argparse
+import multiprocessing
+import os
 import tarfile
 import xml.etree.ElementTree as ET
-from dataclasses import dataclass
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
 from io import BytesIO
 from pathlib import Path
-from typing import Iterable
+from typing import Any
 
+import numpy as np
 from PIL import Image
 from tqdm import tqdm
 
@@ -63,6 +69,8 @@ class PascalVocImportConfig:
     object_name_prefix: str | None = None
     source_url: str = PASCAL_VOC_2012_URL
     show_progress: bool = True
+    batch_size: int = 256
+    workers: int | None = None
 
 
 @dataclass(slots=True)
@@ -233,19 +241,14 @@ def _parse_detection_annotations(annotation_path: Path) -> list[dict]:
 
 def _extract_present_segmentation_classes(mask_path: Path) -> list[tuple[str, Image.Image]]:
     with Image.open(mask_path) as mask_image:
-        palette_image = mask_image.convert("P")
-        pixels = list(palette_image.get_flattened_data())
-        width, height = palette_image.size
-        class_ids = sorted(
-            {value for value in pixels if value not in (0, 255) and value in VOC_SEGMENTATION_ID_TO_CLASS}
-        )
-        masks: list[tuple[str, Image.Image]] = []
-        for class_id in class_ids:
-            class_name = VOC_SEGMENTATION_ID_TO_CLASS[class_id]
-            binary = Image.new("L", (width, height))
-            binary.putdata([255 if value == class_id else 0 for value in pixels])
-            masks.append((class_name, binary))
-        return masks
+        pixels = np.asarray(mask_image.convert("P"))
+    masks: list[tuple[str, Image.Image]] = []
+    for class_id in np.unique(pixels).tolist():
+        class_name = VOC_SEGMENTATION_ID_TO_CLASS.get(class_id)
+        if class_name is None or class_id == 0:
+            continue
+        masks.append((class_name, Image.fromarray(np.where(pixels == class_id, 255, 0).astype(np.uint8))))
+    return masks
 
 
 def _asset_object_name(prefix: str, split: str, kind: str, filename: str) -> str:
@@ -345,16 +348,16 @@ def _ensure_voc_schemas(datalake: Datalake) -> dict[str, AnnotationSchema]:
     }
 
 
-def _create_annotation_set_if_needed(datalake: Datalake, *, datum_id: str, name: str, annotation_schema_id: str):
-    return datalake.create_annotation_set(
-        name=name,
-        purpose="ground_truth",
-        source_type="human",
-        status="active",
-        datum_id=datum_id,
-        annotation_schema_id=annotation_schema_id,
-        metadata={"source_dataset": "pascal_voc", "year": "2012"},
-    )
+def _annotation_set_spec(*, name: str, annotation_schema_id: str, annotations: list[dict]) -> dict[str, Any]:
+    return {
+        "name": name,
+        "purpose": "ground_truth",
+        "source_type": "human",
+        "status": "active",
+        "annotation_schema_id": annotation_schema_id,
+        "metadata": {"source_dataset": "pascal_voc", "year": "2012"},
+        "annotations": annotations,
+    }
 
 
 def _iter_segmentation_masks(mask_dir: Path, image_id: str) -> Iterable[tuple[str, Image.Image]]:
@@ -364,6 +367,224 @@ def _iter_segmentation_masks(mask_dir: Path, image_id: str) -> Iterable[tuple[st
     return _extract_present_segmentation_classes(mask_path)
 
 
+@dataclass(slots=True)
+class _PreparedVocImage:
+    """Everything the importer needs for one image, read and encoded off the main process."""
+
+    image_id: str
+    image_path: Path
+    image_bytes: bytes
+    detections: list[dict]
+    masks: list[tuple[str, bytes]] = field(default_factory=list)
+
+
+def _prepare_voc_image(image_dir: Path, annotation_dir: Path, mask_dir: Path, image_id: str) -> _PreparedVocImage:
+    image_path = image_dir / f"{image_id}.jpg"
+    annotation_path = annotation_dir / f"{image_id}.xml"
+    if not image_path.exists():
+        raise FileNotFoundError(f"Pascal VOC image not found: {image_path}")
+    if not annotation_path.exists():
+        raise FileNotFoundError(f"Pascal VOC annotation XML not found: {annotation_path}")
+    masks: list[tuple[str, bytes]] = []
+    for class_name, binary_mask in _iter_segmentation_masks(mask_dir, image_id):
+        mask_bytes = BytesIO()
+        binary_mask.save(mask_bytes, format="PNG")
+        masks.append((class_name, mask_bytes.getvalue()))
+    return _PreparedVocImage(
+        image_id=image_id,
+        image_path=image_path,
+        image_bytes=image_path.read_bytes(),
+        detections=_parse_detection_annotations(annotation_path),
+        masks=masks,
+    )
+
+
+def _iter_prepared_chunks(
+    image_ids: list[str],
+    prepare: Callable[[str], _PreparedVocImage],
+    *,
+    batch_size: int,
+    workers: int,
+) -> Iterator[list[_PreparedVocImage]]:
+    """Yield prepared images in chunks of ``batch_size``, in ``image_ids`` order.
+
+    With more than one worker the next chunk is decoded in a process pool while the caller writes the
+    current one, so at most two chunks of payloads are held in memory.
+    """
+    chunks = [image_ids[start : start + batch_size] for start in range(0, len(image_ids), batch_size)]
+    if workers <= 1:
+        for chunk in chunks:
+            yield [prepare(image_id) for image_id in chunk]
+        return
+    # spawn: the datalake client runs an event loop thread, which makes fork unsafe.
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+        pending = [executor.submit(prepare, image_id) for image_id in chunks[0]]
+        for next_chunk in [*chunks[1:], None]:
+            prepared = [future.result() for future in pending]
+            pending = [executor.submit(prepare, image_id) for image_id in next_chunk or []]
+            yield prepared
+
+
+_VOC_SOURCE = {"type": "human", "name": "pascal-voc", "version": "2012"}
+
+
+def _import_prepared_chunk(
+    datalake: Datalake,
+    prepared: list[_PreparedVocImage],
+    *,
+    config: PascalVocImportConfig,
+    schemas: dict[str, AnnotationSchema],
+    classification_labels: dict[str, list[str]],
+    object_prefix: str,
+) -> tuple[list[str], dict[str, int]]:
+    """Write one chunk of prepared images with one bulk call per document type.
+
+    Returns the new datum ids in input order and the per-type counts for the import summary.
+    """
+    image_specs = []
+    mask_specs = []
+    for item in prepared:
+        source_metadata = {
+            "source_dataset": "pascal_voc",
+            "year": "2012",
+            "split": config.split,
+            "source_path": str(item.image_path),
+            "source_image_id": item.image_id,
+        }
+        image_specs.append(
+            {
+                "name": _asset_object_name(object_prefix, config.split, "images", item.image_path.name),
+                "obj": item.image_bytes,
+                "kind": "image",
+                "media_type": "image/jpeg",
+                "mount": config.mount,
+                "object_metadata": source_metadata,
+                "asset_metadata": dict(source_metadata),
+                "size_bytes": len(item.image_bytes),
+                "created_by": config.created_by,
+                "on_conflict": "overwrite",
+            }
+        )
+        for class_name, mask_bytes in item.masks:
+            mask_metadata = {
+                "source_dataset": "pascal_voc",
+                "year": "2012",
+                "split": config.split,
+                "source_image_id": item.image_id,
+                "source_mask_type": "SegmentationClass",
+                "source_class_name": class_name,
+            }
+            mask_specs.append(
+                {
+                    "name": _asset_object_name(
+                        object_prefix, config.split, "masks", f"{item.image_id}__{class_name}.png"
+                    ),
+                    "obj": mask_bytes,
+                    "kind": "mask",
+                    "media_type": "image/png",
+                    "mount": config.mount,
+                    "object_metadata": mask_metadata,
+                    "asset_metadata": dict(mask_metadata),
+                    "created_by": config.created_by,
+                    "on_conflict": "overwrite",
+                }
+            )
+    assets = datalake.create_assets_from_objects([*image_specs, *mask_specs])
+    image_assets = assets[: len(image_specs)]
+    mask_assets = iter(assets[len(image_specs) :])
+
+    counts = {"classification": 0, "detection": 0, "segmentation": 0, "masks": len(mask_specs)}
+    set_specs: list[dict[str, Any]] = []
+    set_owners: list[int] = []
+    for index, (item, image_asset) in enumerate(zip(prepared, image_assets)):
+        subject = {"kind": "asset", "id": image_asset.asset_id}
+        class_labels = sorted(set(classification_labels.get(item.image_id, [])))
+        if class_labels:
+            records = [
+                {
+                    "kind": "classification",
+                    "label": class_name,
+                    "label_id": VOC_CLASS_TO_ID[class_name],
+                    "subject": subject,
+                    "source": _VOC_SOURCE,
+                    "geometry": {},
+                    "attributes": {"layer": "classification"},
+                }
+                for class_name in class_labels
+            ]
+            set_specs.append(
+                _annotation_set_spec(
+                    name="pascal-voc-classification",
+                    annotation_schema_id=schemas["classification"].annotation_schema_id,
+                    annotations=records,
+                )
+            )
+            set_owners.append(index)
+            counts["classification"] += len(records)
+        if item.detections:
+            records = [
+                {
+                    "kind": "bbox",
+                    "label": detection["label"],
+                    "label_id": detection["label_id"],
+                    "subject": subject,
+                    "source": _VOC_SOURCE,
+                    "geometry": detection["geometry"],
+                    "attributes": detection["attributes"],
+                }
+                for detection in item.detections
+            ]
+            set_specs.append(
+                _annotation_set_spec(
+                    name="pascal-voc-detection",
+                    annotation_schema_id=schemas["detection"].annotation_schema_id,
+                    annotations=records,
+                )
+            )
+            set_owners.append(index)
+            counts["detection"] += len(records)
+        if item.masks:
+            records = [
+                {
+                    "kind": "mask",
+                    "label": class_name,
+                    "label_id": VOC_CLASS_TO_ID[class_name],
+                    "subject": subject,
+                    "source": _VOC_SOURCE,
+                    "geometry": {"type": "mask", "mask_asset_id": next(mask_assets).asset_id},
+                    "attributes": {"layer": "segmentation", "source_mask": "SegmentationClass"},
+                }
+                for class_name, _ in item.masks
+            ]
+            set_specs.append(
+                _annotation_set_spec(
+                    name="pascal-voc-segmentation",
+                    annotation_schema_id=schemas["segmentation"].annotation_schema_id,
+                    annotations=records,
+                )
+            )
+            set_owners.append(index)
+            counts["segmentation"] += len(records)
+
+    annotation_set_ids: list[list[str]] = [[] for _ in prepared]
+    if set_specs:
+        for owner, annotation_set in zip(set_owners, datalake.create_annotation_sets(set_specs)):
+            annotation_set_ids[owner].append(annotation_set.annotation_set_id)
+
+    datums = datalake.create_datums(
+        [
+            {
+                "asset_refs": {"image": image_asset.asset_id},
+                "split": config.split,
+                "metadata": {"source_dataset": "pascal_voc", "year": "2012", "source_image_id": item.image_id},
+                "annotation_set_ids": set_ids,
+            }
+            for item, image_asset, set_ids in zip(prepared, image_assets, annotation_set_ids)
+        ]
+    )
+    return [datum.datum_id for datum in datums], counts
+
+
 def import_pascal_voc(datalake: Datalake, config: PascalVocImportConfig) -> PascalVocImportSummary:
     """Download, parse, and import Pascal VOC 2012 into the Mindtrace Datalake.
 
@@ -371,10 +592,16 @@ def import_pascal_voc(datalake: Datalake, config: PascalVocImportConfig) -> Pasc
     ground-truth annotation sets for classification, detection, and segmentation when data
     exists for that image. Segmentation is imported as one mask Asset and one mask annotation
     record per class present in the VOC segmentation class mask.
+
+    Images are processed in chunks of ``config.batch_size``: files are read, parsed and mask PNGs
+    encoded in a pool of ``config.workers`` processes (default: one per CPU, up to 8), and each
+    chunk is written with one bulk call each for assets, annotation sets and datums.
     """
 
     if config.split not in {"train", "val", "trainval"}:
         raise ValueError("Pascal VOC 2012 importer currently supports split in {'train', 'val', 'trainval'}")
+    if config.batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
 
     dataset_name = config.dataset_name or _default_dataset_name(config.split)
     root_dir = _normalize_root(config.root_dir)
@@ -396,163 +623,37 @@ def import_pascal_voc(datalake: Datalake, config: PascalVocImportConfig) -> Pasc
     schemas = _ensure_voc_schemas(datalake)
     image_ids = _read_split_ids(voc_root, config.split)
     classification_labels = _read_classification_labels(voc_root, config.split)
-    image_dir = voc_root / "JPEGImages"
-    annotation_dir = voc_root / "Annotations"
-    segmentation_mask_dir = voc_root / "SegmentationClass"
+    prepare = partial(
+        _prepare_voc_image, voc_root / "JPEGImages", voc_root / "Annotations", voc_root / "SegmentationClass"
+    )
     object_prefix = config.object_name_prefix or f"imports/pascal-voc-2012/{dataset_name}/{config.dataset_version}"
+    workers = config.workers if config.workers is not None else min(8, os.cpu_count() or 1)
 
     manifest: list[str] = []
-    image_asset_count = 0
-    mask_asset_count = 0
-    classification_record_count = 0
-    detection_record_count = 0
-    segmentation_record_count = 0
-
-    image_iterator = (
-        tqdm(image_ids, desc=f"Importing {dataset_name}", unit="image") if config.show_progress else image_ids
+    totals = {"classification": 0, "detection": 0, "segmentation": 0, "masks": 0}
+    progress = (
+        tqdm(total=len(image_ids), desc=f"Importing {dataset_name}", unit="image") if config.show_progress else None
     )
-
-    for image_id in image_iterator:
-        image_path = image_dir / f"{image_id}.jpg"
-        annotation_path = annotation_dir / f"{image_id}.xml"
-        if not image_path.exists():
-            raise FileNotFoundError(f"Pascal VOC image not found: {image_path}")
-        if not annotation_path.exists():
-            raise FileNotFoundError(f"Pascal VOC annotation XML not found: {annotation_path}")
-
-        image_bytes = image_path.read_bytes()
-        image_asset = datalake.create_asset_from_object(
-            name=_asset_object_name(object_prefix, config.split, "images", image_path.name),
-            obj=image_bytes,
-            kind="image",
-            media_type="image/jpeg",
-            mount=config.mount,
-            object_metadata={
-                "source_dataset": "pascal_voc",
-                "year": "2012",
-                "split": config.split,
-                "source_path": str(image_path),
-                "source_image_id": image_id,
-            },
-            asset_metadata={
-                "source_dataset": "pascal_voc",
-                "year": "2012",
-                "split": config.split,
-                "source_path": str(image_path),
-                "source_image_id": image_id,
-            },
-            size_bytes=len(image_bytes),
-            created_by=config.created_by,
-            on_conflict="overwrite",
-        )
-        image_asset_count += 1
-
-        datum = datalake.create_datum(
-            asset_refs={"image": image_asset.asset_id},
-            split=config.split,
-            metadata={
-                "source_dataset": "pascal_voc",
-                "year": "2012",
-                "source_image_id": image_id,
-            },
-        )
-        manifest.append(datum.datum_id)
-
-        image_class_labels = sorted(set(classification_labels.get(image_id, [])))
-        if image_class_labels:
-            annotation_set = _create_annotation_set_if_needed(
-                datalake,
-                datum_id=datum.datum_id,
-                name="pascal-voc-classification",
-                annotation_schema_id=schemas["classification"].annotation_schema_id,
-            )
-            records = [
-                {
-                    "kind": "classification",
-                    "label": class_name,
-                    "label_id": VOC_CLASS_TO_ID[class_name],
-                    "source": {"type": "human", "name": "pascal-voc", "version": "2012"},
-                    "geometry": {},
-                    "attributes": {"layer": "classification"},
-                }
-                for class_name in image_class_labels
-            ]
-            datalake.add_annotation_records(records, annotation_set_id=annotation_set.annotation_set_id)
-            classification_record_count += len(records)
-
-        detections = _parse_detection_annotations(annotation_path)
-        if detections:
-            annotation_set = _create_annotation_set_if_needed(
-                datalake,
-                datum_id=datum.datum_id,
-                name="pascal-voc-detection",
-                annotation_schema_id=schemas["detection"].annotation_schema_id,
-            )
-            records = [
-                {
-                    "kind": "bbox",
-                    "label": detection["label"],
-                    "label_id": detection["label_id"],
-                    "source": {"type": "human", "name": "pascal-voc", "version": "2012"},
-                    "geometry": detection["geometry"],
-                    "attributes": detection["attributes"],
-                }
-                for detection in detections
-            ]
-            datalake.add_annotation_records(records, annotation_set_id=annotation_set.annotation_set_id)
-            detection_record_count += len(records)
-
-        segmentation_masks = list(_iter_segmentation_masks(segmentation_mask_dir, image_id))
-        if segmentation_masks:
-            annotation_set = _create_annotation_set_if_needed(
+    try:
+        for prepared in _iter_prepared_chunks(
+            image_ids, prepare, batch_size=config.batch_size, workers=min(workers, len(image_ids))
+        ):
+            datum_ids, counts = _import_prepared_chunk(
                 datalake,
-                datum_id=datum.datum_id,
-                name="pascal-voc-segmentation",
-                annotation_schema_id=schemas["segmentation"].annotation_schema_id,
+                prepared,
+                config=config,
+                schemas=schemas,
+                classification_labels=classification_labels,
+                object_prefix=object_prefix,
             )
-            records = []
-            for class_name, binary_mask in segmentation_masks:
-                mask_filename = f"{image_id}__{class_name}.png"
-                mask_bytes = BytesIO()
-                binary_mask.save(mask_bytes, format="PNG")
-                mask_asset = datalake.create_asset_from_object(
-                    name=_asset_object_name(object_prefix, config.split, "masks", mask_filename),
-                    obj=mask_bytes.getvalue(),
-                    kind="mask",
-                    media_type="image/png",
-                    mount=config.mount,
-                    object_metadata={
-                        "source_dataset": "pascal_voc",
-                        "year": "2012",
-                        "split": config.split,
-                        "source_image_id": image_id,
-                        "source_mask_type": "SegmentationClass",
-                        "source_class_name": class_name,
-                    },
-                    asset_metadata={
-                        "source_dataset": "pascal_voc",
-                        "year": "2012",
-                        "split": config.split,
-                        "source_image_id": image_id,
-                        "source_mask_type": "SegmentationClass",
-                        "source_class_name": class_name,
-                    },
-                    created_by=config.created_by,
-                    on_conflict="overwrite",
-                )
-                mask_asset_count += 1
-                records.append(
-                    {
-                        "kind": "mask",
-                        "label": class_name,
-                        "label_id": VOC_CLASS_TO_ID[class_name],
-                        "source": {"type": "human", "name": "pascal-voc", "version": "2012"},
-                        "geometry": {"type": "mask", "mask_asset_id": mask_asset.asset_id},
-                        "attributes": {"layer": "segmentation", "source_mask": "SegmentationClass"},
-                    }
-                )
-            datalake.add_annotation_records(records, annotation_set_id=annotation_set.annotation_set_id)
-            segmentation_record_count += len(records)
+            manifest.extend(datum_ids)
+            for key, value in counts.items():
+                totals[key] += value
+            if progress is not None:
+                progress.update(len(prepared))
+    finally:
+        if progress is not None:
+            progress.close()
 
     dataset_version = datalake.create_dataset_version(
         dataset_name=dataset_name,
@@ -571,11 +672,11 @@ def import_pascal_voc(datalake: Datalake, config: PascalVocImportConfig) -> Pasc
         dataset_version=config.dataset_version,
         split=config.split,
         datum_count=len(manifest),
-        image_asset_count=image_asset_count,
-        mask_asset_count=mask_asset_count,
-        classification_record_count=classification_record_count,
-        detection_record_count=detection_record_count,
-        segmentation_record_count=segmentation_record_count,
+        image_asset_count=len(manifest),
+        mask_asset_count=totals["masks"],
+        classification_record_count=totals["classification"],
+        detection_record_count=totals["detection"],
+        segmentation_record_count=totals["segmentation"],
         dataset_version_id=dataset_version.dataset_version_id,
     )
 
@@ -593,6 +694,12 @@ def _build_cli() -> argparse.ArgumentParser:
     parser.add_argument("--object-name-prefix", help="Optional object-name prefix for imported assets")
     parser.add_argument("--download", action="store_true", help="Download Pascal VOC 2012 if it is missing locally")
     parser.add_argument("--source-url", default=PASCAL_VOC_2012_URL)
+    parser.add_argument("--batch-size", type=int, default=256, help="Images written per bulk insert")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Processes used to read and encode images and masks (default: one per CPU, up to 8)",
+    )
     parser.add_argument(
         "--no-progress",
         action="store_true",
@@ -620,6 +727,8 @@ def main(argv: list[str] | None = None) -> int:
                 object_name_prefix=args.object_name_prefix,
                 source_url=args.source_url,
                 show_progress=not args.no_progress,
+                batch_size=args.batch_size,
+                workers=args.workers,
             ),
         )
     finally:
@@ -1,16 +1,24 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import hashlib
 import mimetypes
+from collections.abc import Awaitable, Callable, Iterable, Mapping
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 from urllib import request as urllib_request
 
 from mindtrace.database.core.exceptions import DocumentNotFoundError
 from mindtrace.datalake.async_datalake import AsyncDatalake
-from mindtrace.datalake.blocking_payload_io import mkdir_and_write_bytes
+from mindtrace.datalake.blocking_payload_io import (
+    DEFAULT_PAYLOAD_CHUNK_SIZE,
+    PayloadByteBudget,
+    PayloadStream,
+    StreamedPayload,
+    stream_payload_to_path,
+)
 from mindtrace.datalake.replication_types import (
     PayloadStatus,
     ReplicatedAssetState,
@@ -49,6 +57,83 @@ def _blocking_presigned_put(req: urllib_request.Request) -> None:
             raise RuntimeError(f"Presigned upload failed with status {response.status}")
 
 
+def _parse_payload_checksum(declared: str) -> tuple[str, str]:
+    """Split a declared payload checksum into ``(hashlib algorithm, lowercase hex digest)``.
+
+    Accepts ``"sha256:<hex>"`` / ``"md5:<hex>"`` descriptors and bare 64- (SHA-256) or 32-hex (MD5) digests.
+    """
+    declared_stripped = declared.strip()
+    lowered = declared_stripped.lower()
+    if ":" in lowered:
+        algo, _, digest = lowered.partition(":")
+        algo = algo.strip()
+        if algo not in ("sha256", "md5"):
+            raise ValueError(f"Unsupported checksum algorithm in payload descriptor: {algo!r}")
+        return algo, digest.strip()
+    hex_body = lowered.replace("-", "")
+    if len(hex_body) == 64 and set(hex_body) <= set("0123456789abcdef"):
+        return "sha256", hex_body
+    if len(hex_body) == 32 and set(hex_body) <= set("0123456789abcdef"):
+        return "md5", hex_body
+    raise ValueError(f"Unrecognized payload checksum format: {declared_stripped!r}")
+
+
+def _summarize_payload_bytes(data: bytes, declared_checksum: str | None) -> StreamedPayload:
+    """Size and (declared-algorithm) checksum of payload bytes already held in memory."""
+    digests = {}
+    if declared_checksum:
+        algo = _parse_payload_checksum(declared_checksum)[0]
+        digests[algo] = hashlib.new(algo, data).hexdigest()
+    return StreamedPayload(size_bytes=len(data), digests=digests)
+
+
+async def _stream_to_upload_session(session: Any, stream: PayloadStream) -> StreamedPayload:
+    """Write a payload stream to a direct-upload session target without buffering the whole payload."""
+    if session.upload_method == "local_path":
+        if not session.upload_path:
+            raise ValueError(f"Upload session {session.upload_session_id} is missing upload_path")
+        return await asyncio.to_thread(stream_payload_to_path, Path(session.upload_path), stream)
+    if session.upload_method == "presigned_url":
+        if not session.upload_url:
+            raise ValueError(f"Upload session {session.upload_session_id} is missing upload_url")
+        # An iterable body with an explicit Content-Length is sent as-is (no chunked encoding), one chunk at a time.
+        req = urllib_request.Request(session.upload_url, data=iter(stream), method="PUT")
+        for key, value in session.upload_headers.items():
+            req.add_header(key, value)
+        req.add_header("Content-Length", str(stream.total_size))
+        await asyncio.to_thread(_blocking_presigned_put, req)
+        return stream.result()
+    raise ValueError(f"Unsupported upload method: {session.upload_method}")
+
+
+_T = TypeVar("_T")
+
+
+async def _run_bounded(
+    items: Iterable[_T], worker: Callable[[_T], Awaitable[Any]], concurrency: int
+) -> list[BaseException | None]:
+    """Await ``worker(item)`` for every item with at most ``concurrency`` in flight.
+
+    ``concurrency`` runners pull items from one shared iterator, so only that many coroutines exist at a time and
+    ``items`` may be a lazy iterable of any length. Returns one entry per item, in input order: ``None`` on success or
+    the exception it raised.
+    """
+    pending = enumerate(items)
+    outcomes: dict[int, BaseException | None] = {}
+
+    async def _runner() -> None:
+        for index, item in pending:
+            try:
+                await worker(item)
+            except Exception as exc:
+                outcomes[index] = exc
+            else:
+                outcomes[index] = None
+
+    await asyncio.gather(*(_runner() for _ in range(max(1, concurrency))))
+    return [outcomes[index] for index in range(len(outcomes))]
+
+
 def _head_object_size_bytes(meta: dict[str, Any]) -> int | None:
     for key in ("size_bytes", "size", "content_length", "ContentLength"):
         val = meta.get(key)
@@ -75,7 +160,31 @@ class ReplicationManager:
     MVP-B adds payload-state transitions and hydration using the direct-upload flow.
     """
 
-    def __init__(self, source: AsyncDatalake, target: AsyncDatalake | None = None) -> None:
+    def __init__(
+        self,
+        source: AsyncDatalake,
+        target: AsyncDatalake | None = None,
+        *,
+        chunk_size: int = DEFAULT_PAYLOAD_CHUNK_SIZE,
+        max_inflight_bytes: int | PayloadByteBudget | None = None,
+        mount_concurrency: int | Mapping[str, int] | None = None,
+    ) -> None:
+        """Create a replication manager.
+
+        Payloads are streamed from source to target in ``chunk_size`` pieces, computing size and checksum in the
+        same pass. ``max_inflight_bytes`` caps the payload bytes buffered across all concurrent transfers of this
+        manager; pass a :class:`PayloadByteBudget` instead to share one cap between several managers.
+        ``mount_concurrency`` caps simultaneous transfers per target mount, either one limit for every mount or a
+        ``{mount: limit}`` mapping (mounts missing from the mapping are unlimited).
+        """
+        self.chunk_size = chunk_size
+        self.mount_concurrency = mount_concurrency
+        self._mount_semaphores: dict[str, asyncio.Semaphore] = {}
+        self.payload_budget = (
+            max_inflight_bytes
+            if isinstance(max_inflight_bytes, PayloadByteBudget)
+            else PayloadByteBudget(max_inflight_bytes)
+        )
         self.source = source
         if target is None:
             self.target = source
@@ -297,8 +406,8 @@ class ReplicationManager:
         )
 
         try:
-            completed_ref = await self._transfer_payload(source_payload_view, mount_map or {})
-            await self._verify_transferred_payload(source_payload_view, completed_ref)
+            completed_ref, transferred = await self._transfer_payload(source_payload_view, mount_map or {})
+            await self._verify_transferred_payload(source_payload_view, completed_ref, transferred)
             refreshed_target_asset = await self.target.get_asset(asset_id)
             refreshed_target_asset.storage_ref = completed_ref
             await self._set_asset_replication_state(
@@ -332,7 +441,6 @@ class ReplicationManager:
         skipped_asset_ids: list[str] = []
 
         candidate_ids = set(request.asset_ids)
-        processed = 0
         for asset in assets:
             if candidate_ids and asset.asset_id not in candidate_ids:
                 continue
@@ -344,15 +452,17 @@ class ReplicationManager:
                 skipped_asset_ids.append(asset.asset_id)
                 continue
             attempted_asset_ids.append(asset.asset_id)
-            try:
-                await self.hydrate_asset_payload(asset.asset_id, mount_map=request.mount_map)
-                verified_asset_ids.append(asset.asset_id)
-            except Exception:
-                failed_asset_ids.append(asset.asset_id)
-            processed += 1
-            if request.limit is not None and processed >= request.limit:
+            if request.limit is not None and len(attempted_asset_ids) >= request.limit:
                 break
 
+        outcomes = await _run_bounded(
+            attempted_asset_ids,
+            lambda asset_id: self.hydrate_asset_payload(asset_id, mount_map=request.mount_map),
+            request.concurrency,
+        )
+        for asset_id, error in zip(attempted_asset_ids, outcomes):
+            (verified_asset_ids if error is None else failed_asset_ids).append(asset_id)
+
         return ReplicationReconcileResult(
             attempted_asset_ids=attempted_asset_ids,
             verified_asset_ids=verified_asset_ids,
@@ -408,7 +518,7 @@ class ReplicationManager:
         skipped_asset_ids: list[str] = []
 
         candidate_ids = set(request.asset_ids)
-        processed = 0
+        attempted_assets: list[Asset] = []
         for asset in assets:
             if candidate_ids and asset.asset_id not in candidate_ids:
                 continue
@@ -420,18 +530,20 @@ class ReplicationManager:
             ):
                 skipped_asset_ids.append(asset.asset_id)
                 continue
-            attempted_asset_ids.append(asset.asset_id)
-            try:
-                if not self.is_local_delete_eligible(asset):
-                    await self.mark_local_delete_eligible(asset.asset_id)
-                await self.delete_local_payload(asset.asset_id)
-                reclaimed_asset_ids.append(asset.asset_id)
-            except Exception:
-                failed_asset_ids.append(asset.asset_id)
-            processed += 1
-            if request.limit is not None and processed >= request.limit:
+            attempted_assets.append(asset)
+            if request.limit is not None and len(attempted_assets) >= request.limit:
                 break
 
+        async def _reclaim(asset: Asset) -> None:
+            if not self.is_local_delete_eligible(asset):
+                await self.mark_local_delete_eligible(asset.asset_id)
+            await self.delete_local_payload(asset.asset_id)
+
+        outcomes = await _run_bounded(attempted_assets, _reclaim, request.concurrency)
+        for asset, error in zip(attempted_assets, outcomes):
+            attempted_asset_ids.append(asset.asset_id)
+            (reclaimed_asset_ids if error is None else failed_asset_ids).append(asset.asset_id)
+
         return ReplicationReclaimResult(
             attempted_asset_ids=attempted_asset_ids,
             reclaimed_asset_ids=reclaimed_asset_ids,
@@ -625,79 +737,86 @@ class ReplicationManager:
         current.updated_at = asset.updated_at
         await self.source.asset_database.update(current)
 
-    async def _transfer_payload(self, source_asset: Asset, mount_map: dict[str, str]) -> StorageRef:
+    def _mount_slot(self, mount: str) -> contextlib.AbstractAsyncContextManager[Any]:
+        """Concurrency slot for transfers into ``mount`` (a no-op when the mount is unlimited)."""
+        if isinstance(self.mount_concurrency, Mapping):
+            limit = self.mount_concurrency.get(mount)
+        else:
+            limit = self.mount_concurrency
+        if limit is None:
+            return contextlib.nullcontext()
+        semaphore = self._mount_semaphores.get(mount)
+        if semaphore is None:
+            semaphore = self._mount_semaphores[mount] = asyncio.Semaphore(max(1, limit))
+        return semaphore
+
+    async def _transfer_payload(
+        self, source_asset: Asset, mount_map: dict[str, str]
+    ) -> tuple[StorageRef, StreamedPayload]:
+        """Stream the source payload into a target upload session, hashing it on the way.
+
+        Returns the committed target ref plus the size and checksum of the bytes that were sent.
+        """
         payload_ref = _asset_payload_storage_ref(source_asset)
-        data = await self.source.get_object(payload_ref)
-        expected_size = source_asset.payload_size_bytes or source_asset.size_bytes
-        if expected_size is not None and len(data) != expected_size:
-            raise ValueError(
-                f"Source read size mismatch for asset {source_asset.asset_id}: "
-                f"expected {expected_size} bytes, read {len(data)}"
-            )
+        declared = source_asset.payload_checksum or source_asset.checksum
+        algorithms = (_parse_payload_checksum(declared)[0],) if declared else ()
         target_write_ref = _apply_mount_map_to_storage_ref(payload_ref, mount_map)
-        session = await self.target.create_object_upload_session(
-            name=target_write_ref.name,
-            mount=target_write_ref.mount,
-            version=target_write_ref.version,
-            metadata=source_asset.metadata,
-            on_conflict="skip",
-            content_type=source_asset.media_type or self._guess_content_type(payload_ref.name),
-        )
-        if session.upload_method == "local_path":
-            if not session.upload_path:
-                raise ValueError(f"Upload session {session.upload_session_id} is missing upload_path")
-            upload_path = Path(session.upload_path)
-            await asyncio.to_thread(mkdir_and_write_bytes, upload_path, data)
-        elif session.upload_method == "presigned_url":
-            if not session.upload_url:
-                raise ValueError(f"Upload session {session.upload_session_id} is missing upload_url")
-            req = urllib_request.Request(session.upload_url, data=data, method="PUT")
-            for key, value in session.upload_headers.items():
-                req.add_header(key, value)
-            await asyncio.to_thread(_blocking_presigned_put, req)
-        else:
-            raise ValueError(f"Unsupported upload method: {session.upload_method}")
+        async with self._mount_slot(target_write_ref.mount), self.source.open_object_file(payload_ref) as source_path:
+            stream = PayloadStream(
+                source_path, algorithms=algorithms, chunk_size=self.chunk_size, budget=self.payload_budget
+            )
+            expected_size = source_asset.payload_size_bytes or source_asset.size_bytes
+            source_size = stream.total_size
+            if expected_size is not None and source_size != expected_size:
+                raise ValueError(
+                    f"Source read size mismatch for asset {source_asset.asset_id}: "
+                    f"expected {expected_size} bytes, read {source_size}"
+                )
+            session = await self.target.create_object_upload_session(
+                name=target_write_ref.name,
+                mount=target_write_ref.mount,
+                version=target_write_ref.version,
+                metadata=source_asset.metadata,
+                on_conflict="skip",
+                content_type=source_asset.media_type or self._guess_content_type(payload_ref.name),
+            )
+            transferred = await _stream_to_upload_session(session, stream)
         completed = await self.target.complete_object_upload_session(
             session.upload_session_id,
             finalize_token=session.finalize_token,
         )
         if completed.storage_ref is None:
             raise RuntimeError(f"Upload session {session.upload_session_id} did not produce a storage_ref")
-        return completed.storage_ref
+        return completed.storage_ref, transferred
 
-    async def _verify_transferred_payload(self, source_asset: Asset, target_ref: StorageRef) -> None:
-        # Avoid downloading the full target object: verify HEAD size + checksum the source read only.
+    async def _verify_transferred_payload(
+        self,
+        source_asset: Asset,
+        target_ref: StorageRef,
+        transferred: StreamedPayload | None = None,
+    ) -> None:
+        # Avoid downloading the full target object: verify HEAD size + the checksum of the bytes that were sent.
         # Wrong bytes at the destination with identical size/checksum-vs-source ambiguity remains a known gap.
-        source_bytes = await self.source.get_object(_asset_payload_storage_ref(source_asset))
+        digest = source_asset.payload_checksum or source_asset.checksum
+        if transferred is None:
+            transferred = _summarize_payload_bytes(
+                await self.source.get_object(_asset_payload_storage_ref(source_asset)), digest
+            )
         head = await self.target.head_object(target_ref)
         remote_size = _head_object_size_bytes(head)
-        if remote_size is not None and remote_size != len(source_bytes):
+        if remote_size is not None and remote_size != transferred.size_bytes:
             raise RuntimeError(
                 f"Post-upload size mismatch for asset {source_asset.asset_id}: "
-                f"target head reports {remote_size} bytes, transferred {len(source_bytes)}"
+                f"target head reports {remote_size} bytes, transferred {transferred.size_bytes}"
             )
-        digest = source_asset.payload_checksum or source_asset.checksum
-        if digest and not self._payload_checksum_matches(source_bytes, digest):
-            raise RuntimeError(f"Post-upload checksum mismatch for asset {source_asset.asset_id}")
+        if digest:
+            algo, expected = _parse_payload_checksum(digest)
+            if transferred.digests.get(algo) != expected:
+                raise RuntimeError(f"Post-upload checksum mismatch for asset {source_asset.asset_id}")
 
     def _payload_checksum_matches(self, data: bytes, declared: str) -> bool:
-        declared_stripped = declared.strip()
-        lowered = declared_stripped.lower()
-        if ":" in lowered:
-            algo, _, digest = lowered.partition(":")
-            digest = digest.strip()
-            algo = algo.strip()
-            if algo == "sha256":
-                return hashlib.sha256(data).hexdigest() == digest
-            if algo == "md5":
-                return hashlib.md5(data).hexdigest() == digest
-            raise ValueError(f"Unsupported checksum algorithm in payload descriptor: {algo!r}")
-        hex_body = lowered.replace("-", "")
-        if len(hex_body) == 64 and set(hex_body) <= set("0123456789abcdef"):
-            return hashlib.sha256(data).hexdigest() == hex_body
-        if len(hex_body) == 32 and set(hex_body) <= set("0123456789abcdef"):
-            return hashlib.md5(data).hexdigest() == hex_body
-        raise ValueError(f"Unrecognized payload checksum format: {declared_stripped!r}")
+        algo, digest = _parse_payload_checksum(declared)
+        return hashlib.new(algo, data).hexdigest() == digest
 
     def _guess_content_type(self, name: str) -> str:
         guessed, _ = mimetypes.guess_type(name)
@@ -217,6 +217,41 @@ class ReplicationQueueManager:
             claimed.append(await self.database.update(fresh))
         return claimed
 
+    async def renew_lease(
+        self,
+        task_id: str,
+        *,
+        worker_id: str,
+        lease_seconds: int = 300,
+        now: datetime | None = None,
+    ) -> ReplicationTask:
+        """Extend the lease on a task this worker is still processing.
+
+        Long payload transfers call this periodically so their lease does not expire and the task is not reclaimed
+        by another worker mid-transfer. Raises ``RuntimeError`` when the task is terminal or claimed by someone else.
+
+        The lease is extended with a single conditional update that only writes ``lease_expires_at`` and
+        ``updated_at``, so a renewal racing with ``mark_status`` / ``fail_task`` can neither overwrite the new status
+        nor revive a task that has just completed.
+        """
+        current = _as_utc(now or utc_now())
+        renewed = await self.database.find_one_and_update(
+            {
+                "task_id": task_id,
+                "claimed_by": worker_id,
+                "status": {"$nin": sorted(_TERMINAL_TASK_STATUSES)},
+            },
+            {"$set": {"lease_expires_at": current + timedelta(seconds=lease_seconds), "updated_at": current}},
+        )
+        if renewed is not None:
+            return renewed
+        task = await self.get_task(task_id)
+        if task.claimed_by != worker_id:
+            raise RuntimeError(f"replication task {task_id} is claimed by {task.claimed_by!r}")
+        if task.status in _TERMINAL_TASK_STATUSES:
+            raise RuntimeError(f"replication task {task_id} is already {task.status}")
+        raise RuntimeError(f"replication task {task_id} changed while its lease was being renewed")
+
     async def mark_status(
         self,
         task_id: str,
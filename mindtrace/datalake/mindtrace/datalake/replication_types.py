@@ -67,6 +67,7 @@ class ReplicationReconcileRequest(BaseModel):
     asset_ids: list[str] = Field(default_factory=list)
     limit: int | None = None
     include_failed: bool = True
+    concurrency: int = Field(default=1, ge=1)
     mount_map: dict[str, str] = Field(default_factory=dict)
 
     @field_validator("mount_map")
@@ -90,6 +91,7 @@ class ReplicationReclaimRequest(BaseModel):
     asset_ids: list[str] = Field(default_factory=list)
     limit: int | None = None
     require_verified_payload: bool = True
+    concurrency: int = Field(default=1, ge=1)
 
 
 class ReplicationReclaimResult(BaseModel):
@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import uuid
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from mindtrace.datalake.replication import ReplicationManager
+from mindtrace.datalake.replication_queue import ReplicationQueueManager, _as_utc
+from mindtrace.datalake.types import ReplicationTask, utc_now
+
+_logger = logging.getLogger(__name__)
+
+ReplicationTaskHandler = Callable[[ReplicationTask], Awaitable[Any]]
+
+
+@dataclass
+class ReplicationWorkerMetrics:
+    """Running counters for a :class:`ReplicationWorker`.
+
+    ``queue_lag`` is how long a task waited between becoming due (``next_attempt_at``) and being claimed; a growing
+    lag means the worker is not keeping up with the backlog.
+    """
+
+    started_at: datetime = field(default_factory=utc_now)
+    claimed: int = 0
+    completed: int = 0
+    failed: int = 0
+    in_flight: int = 0
+    bytes_transferred: int = 0
+    lease_renewals: int = 0
+    last_queue_lag_seconds: float | None = None
+    max_queue_lag_seconds: float = 0.0
+
+    def record_claim(self, task: ReplicationTask, now: datetime) -> None:
+        lag = max(0.0, (now - _as_utc(task.next_attempt_at)).total_seconds())
+        self.claimed += 1
+        self.last_queue_lag_seconds = lag
+        self.max_queue_lag_seconds = max(self.max_queue_lag_seconds, lag)
+
+    def snapshot(self, now: datetime | None = None) -> dict[str, Any]:
+        """Counters plus task and byte throughput since ``started_at``."""
+        elapsed = max((_as_utc(now or utc_now()) - _as_utc(self.started_at)).total_seconds(), 1e-9)
+        return {
+            "claimed": self.claimed,
+            "completed": self.completed,
+            "failed": self.failed,
+            "in_flight": self.in_flight,
+            "bytes_transferred": self.bytes_transferred,
+            "lease_renewals": self.lease_renewals,
+            "elapsed_seconds": elapsed,
+            "tasks_per_second": self.completed / elapsed,
+            "bytes_per_second": self.bytes_transferred / elapsed,
+            "last_queue_lag_seconds": self.last_queue_lag_seconds,
+            "max_queue_lag_seconds": self.max_queue_lag_seconds,
+        }
+
+
+class ReplicationWorker:
+    """Drain the durable replication task queue with bounded parallelism.
+
+    The worker claims due tasks from :class:`ReplicationQueueManager` only when it has free slots, so leases are
+    never held on tasks that are merely waiting in memory (back-pressure lives in the queue, not in the worker).
+    Up to ``concurrency`` tasks run at once; a single background loop renews the leases of every in-flight task so
+    long transfers are not reclaimed by other workers. Each task is marked ``hydrating_payloads`` while it runs,
+    then ``complete``, or handed to :meth:`ReplicationQueueManager.fail_task` for retry on error.
+
+    By default ``asset`` tasks hydrate the asset payload through ``manager``; pass ``handler`` to process other
+    root kinds. Per-mount transfer limits and the in-flight byte budget are configured on the
+    :class:`ReplicationManager`.
+
+    Args:
+        queue: Task queue to claim from.
+        manager: Replication manager used by the default handler.
+        handler: Coroutine run for each claimed task; its result's ``size_bytes`` (if any) is counted as transferred.
+        worker_id: Lease owner id. Defaults to a random ``replication-worker-...`` id.
+        concurrency: Maximum number of tasks processed at once.
+        batch_size: Maximum tasks claimed per queue poll. Defaults to ``concurrency``.
+        lease_seconds: Lease length requested on claim and on every renewal.
+        lease_renew_interval: Seconds between lease renewals. Defaults to a third of ``lease_seconds``.
+        poll_interval: Seconds to wait before polling an empty queue again.
+        retry_delay_seconds: Back-off passed to ``fail_task`` for failed tasks.
+    """
+
+    def __init__(
+        self,
+        queue: ReplicationQueueManager,
+        manager: ReplicationManager | None = None,
+        *,
+        handler: ReplicationTaskHandler | None = None,
+        worker_id: str | None = None,
+        concurrency: int = 8,
+        batch_size: int | None = None,
+        lease_seconds: int = 300,
+        lease_renew_interval: float | None = None,
+        poll_interval: float = 5.0,
+        retry_delay_seconds: int = 60,
+    ) -> None:
+        if handler is None and manager is None:
+            raise ValueError("ReplicationWorker requires a ReplicationManager or a task handler")
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self.queue = queue
+        self.manager = manager
+        self.handler: ReplicationTaskHandler = handler or self._hydrate_asset_task
+        self.worker_id = worker_id or f"replication-worker-{uuid.uuid4().hex[:12]}"
+        self.concurrency = concurrency
+        self.batch_size = batch_size or concurrency
+        self.lease_seconds = lease_seconds
+        self.lease_renew_interval = lease_renew_interval or lease_seconds / 3
+        self.poll_interval = poll_interval
+        self.retry_delay_seconds = retry_delay_seconds
+        self.metrics = ReplicationWorkerMetrics()
+        self._running: dict[str, asyncio.Task[None]] = {}
+
+    @property
+    def free_slots(self) -> int:
+        return self.concurrency - len(self._running)
+
+    async def run_once(self) -> int:
+        """Claim as many due tasks as there are free slots and start processing them.
+
+        Returns the number of tasks claimed; they keep running in the background after this returns.
+        """
+        limit = min(self.free_slots, self.batch_size)
+        if limit <= 0:
+            return 0
+        tasks = await self.queue.claim_due_tasks(
+            worker_id=self.worker_id, limit=limit, lease_seconds=self.lease_seconds
+        )
+        now = utc_now()
+        for task in tasks:
+            self.metrics.record_claim(task, now)
+            running = asyncio.create_task(self._execute(task))
+            self._running[task.task_id] = running
+            running.add_done_callback(lambda _, task_id=task.task_id: self._running.pop(task_id, None))
+        return len(tasks)
+
+    async def drain(self) -> ReplicationWorkerMetrics:
+        """Process due tasks until none are left and nothing is in flight.
+
+        Tasks that fail are rescheduled ``retry_delay_seconds`` into the future and are not retried by this call.
+        """
+        async with self._lease_renewal():
+            while True:
+                claimed = await self.run_once()
+                if not claimed and not self._running:
+                    break
+                if not claimed or not self.free_slots:
+                    await asyncio.wait(set(self._running.values()), return_when=asyncio.FIRST_COMPLETED)
+        return self.metrics
+
+    async def run(self, stop_event: asyncio.Event | None = None) -> ReplicationWorkerMetrics:
+        """Poll and process tasks until ``stop_event`` is set, then finish the tasks already in flight."""
+        stop_event = stop_event or asyncio.Event()
+        async with self._lease_renewal():
+            try:
+                while not stop_event.is_set():
+                    claimed = await self.run_once()
+                    if claimed and self.free_slots:
+                        continue
+                    # Saturated: wait for a slot. Idle: wait for the next poll. Either way, wake up on stop.
+                    await self._wait_for_progress(stop_event, None if not self.free_slots else self.poll_interval)
+            finally:
+                if self._running:
+                    await asyncio.gather(*self._running.values(), return_exceptions=True)
+        return self.metrics
+
+    async def _wait_for_progress(self, stop_event: asyncio.Event, timeout: float | None) -> None:
+        stop_waiter = asyncio.ensure_future(stop_event.wait())
+        try:
+            await asyncio.wait(
+                {stop_waiter, *self._running.values()}, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            stop_waiter.cancel()
+
+    @contextlib.asynccontextmanager
+    async def _lease_renewal(self) -> AsyncIterator[None]:
+        renewer = asyncio.create_task(self._renew_leases_forever())
+        try:
+            yield
+        finally:
+            renewer.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await renewer
+
+    async def _renew_leases_forever(self) -> None:
+        while True:
+            await asyncio.sleep(self.lease_renew_interval)
+            await self.renew_leases()
+
+    async def renew_leases(self) -> None:
+        """Extend the lease of every task currently in flight."""
+        for task_id in list(self._running):
+            try:
+                await self.queue.renew_lease(task_id, worker_id=self.worker_id, lease_seconds=self.lease_seconds)
+                self.metrics.lease_renewals += 1
+            except Exception as exc:
+                _logger.warning("Could not renew lease on replication task %s: %s", task_id, exc)
+
+    async def _execute(self, task: ReplicationTask) -> None:
+        self.metrics.in_flight += 1
+        try:
+            await self.queue.mark_status(
+                task.task_id,
+                status="hydrating_payloads",
+                worker_id=self.worker_id,
+                progress_phase="hydrating_payloads",
+            )
+            result = await self.handler(task)
+            size_bytes = getattr(result, "size_bytes", None) or 0
+            await self.queue.mark_status(
+                task.task_id,
+                status="complete",
+                worker_id=self.worker_id,
+                progress_phase="complete",
+                bytes_completed=size_bytes,
+                bytes_total=size_bytes,
+            )
+            self.metrics.completed += 1
+            self.metrics.bytes_transferred += size_bytes
+        except Exception as exc:
+            self.metrics.failed += 1
+            try:
+                await self.queue.fail_task(
+                    task.task_id,
+                    worker_id=self.worker_id,
+                    error=str(exc),
+                    retry_delay_seconds=self.retry_delay_seconds,
+                )
+            except Exception as fail_exc:
+                _logger.error("Could not record failure of replication task %s: %s", task.task_id, fail_exc)
+        finally:
+            self.metrics.in_flight -= 1
+
+    async def _hydrate_asset_task(self, task: ReplicationTask) -> Any:
+        if task.root_kind != "asset":
+            raise ValueError(f"No replication handler for root_kind {task.root_kind!r}; pass handler= to process it")
+        return await self.manager.hydrate_asset_payload(task.root_id, mount_map=task.mount_map)
@@ -673,6 +673,7 @@ class CreateDatasetVersionInput(BaseModel):
     source_dataset_version_id: str | None = None
     metadata: dict[str, Any] | None = None
     created_by: str | None = None
+    manifest_storage: Literal["inline", "collection"] = "inline"
 
 
 class GetDatasetVersionInput(BaseModel):
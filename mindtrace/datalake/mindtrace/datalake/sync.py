@@ -9,12 +9,21 @@ import time
 from collections.abc import Awaitable, Callable, Sequence
 from pathlib import Path
 from typing import Any
-from urllib import request as urllib_request
 
 from mindtrace.database.core.exceptions import DocumentNotFoundError, DuplicateInsertError
 from mindtrace.datalake.async_datalake import AsyncDatalake
-from mindtrace.datalake.blocking_payload_io import mkdir_and_write_bytes
-from mindtrace.datalake.replication import ReplicationManager
+from mindtrace.datalake.blocking_payload_io import (
+    DEFAULT_PAYLOAD_CHUNK_SIZE,
+    PayloadByteBudget,
+    PayloadStream,
+    StreamedPayload,
+)
+from mindtrace.datalake.replication import (
+    ReplicationManager,
+    _parse_payload_checksum,
+    _stream_to_upload_session,
+    _summarize_payload_bytes,
+)
 from mindtrace.datalake.sync_types import (
     DatasetSyncBundle,
     DatasetSyncCommitResult,
@@ -35,14 +44,6 @@ from mindtrace.datalake.types import (
     utc_now,
 )
 
-
-def _blocking_presigned_put(req: urllib_request.Request) -> None:
-    """Synchronous presigned PUT using :mod:`urllib.request` (run via :func:`asyncio.to_thread`)."""
-    with urllib_request.urlopen(req) as response:
-        if response.status >= 400:
-            raise RuntimeError(f"Presigned upload failed with status {response.status}")
-
-
 _METADATA_ONLY_CROSS_LAKE = (
     "transfer_policy='metadata_only' is only supported when source and target are the same AsyncDatalake instance. "
     "For cross-lake imports, materialize payloads first (for example copy_if_missing) so asset StorageRefs "
@@ -198,17 +199,40 @@ class DatasetSyncManager:
     :class:`~mindtrace.datalake.sync_types.DatasetSyncImportRequest` (source mount → target mount). Object
     existence checks, upload sessions, skipped-transfer refs, and assets without payload descriptors all
     use the mapped target coordinates; bytes are still read from the **source** using the original ref.
+
+    Payloads are streamed from source to target in ``chunk_size`` pieces; ``max_inflight_bytes`` (an int or a shared
+    :class:`~mindtrace.datalake.blocking_payload_io.PayloadByteBudget`) caps the bytes buffered across concurrent
+    transfers.
     """
 
-    def __init__(self, source: AsyncDatalake, target: AsyncDatalake | None = None) -> None:
+    def __init__(
+        self,
+        source: AsyncDatalake,
+        target: AsyncDatalake | None = None,
+        *,
+        chunk_size: int = DEFAULT_PAYLOAD_CHUNK_SIZE,
+        max_inflight_bytes: int | PayloadByteBudget | None = None,
+    ) -> None:
         self.source = source
         self.target = target or source
+        self.chunk_size = chunk_size
+        self.payload_budget = (
+            max_inflight_bytes
+            if isinstance(max_inflight_bytes, PayloadByteBudget)
+            else PayloadByteBudget(max_inflight_bytes)
+        )
 
     @staticmethod
     def map_storage_ref_for_target(storage_ref: StorageRef, mount_map: dict[str, str]) -> StorageRef:
         """Return ``storage_ref`` with ``mount`` rewritten via ``mount_map`` when the source mount is listed."""
         return _apply_mount_map_to_storage_ref(storage_ref, mount_map)
 
+    async def _insert_target_dataset_version(self, dataset_version: DatasetVersion) -> DatasetVersion:
+        # Collection-stored versions arrive with their manifest loaded; the target writes it back as member rows.
+        if dataset_version.manifest_storage == "collection":
+            return await self.target._insert_dataset_version(dataset_version)
+        return await self.target.dataset_version_database.insert(dataset_version)
+
     async def export_dataset_version(self, dataset_name: str, version: str) -> DatasetSyncBundle:
         dataset_version = await self.source.get_dataset_version(dataset_name, version)
 
@@ -966,7 +990,7 @@ class DatasetSyncManager:
                     ),
                 }
             )
-            dataset_version = await self.target.dataset_version_database.insert(dataset_version)
+            dataset_version = await self._insert_target_dataset_version(dataset_version)
         else:
             dataset_version = existing_dataset_version
         commit_done += 1
@@ -1380,7 +1404,7 @@ class DatasetSyncManager:
                 total_batches=1,
             ),
         )
-        await self.target.dataset_version_database.insert(bundle.dataset_version)
+        await self._insert_target_dataset_version(bundle.dataset_version)
         completed_rows += 1
         await self._emit_progress(
             progress_callback,
@@ -1457,20 +1481,22 @@ class DatasetSyncManager:
         return await self._finalize_payload_write(payload, mount_map, data)
 
     async def _transfer_payload(self, payload: ObjectPayloadDescriptor, mount_map: dict[str, str]) -> StorageRef:
-        data = await self.source.get_object(payload.storage_ref)
-        if payload.size_bytes is not None and len(data) != payload.size_bytes:
-            raise ValueError(
-                f"Source read size mismatch for asset {payload.asset_id}: "
-                f"descriptor declares {payload.size_bytes} bytes, read {len(data)}"
-            )
-        return await self._finalize_payload_write(payload, mount_map, data)
+        async with self.source.open_object_file(payload.storage_ref) as source_path:
+            source_size = source_path.stat().st_size
+            if payload.size_bytes is not None and source_size != payload.size_bytes:
+                raise ValueError(
+                    f"Source read size mismatch for asset {payload.asset_id}: "
+                    f"descriptor declares {payload.size_bytes} bytes, read {source_size}"
+                )
+            return await self._finalize_payload_write(payload, mount_map, source_path)
 
     async def _finalize_payload_write(
         self,
         payload: ObjectPayloadDescriptor,
         mount_map: dict[str, str],
-        data: bytes,
+        data: bytes | Path,
     ) -> StorageRef:
+        """Stream ``data`` (bytes or a local file) into a target upload session and verify what landed."""
         target_write_ref = _apply_mount_map_to_storage_ref(payload.storage_ref, mount_map)
         session = await self.target.create_object_upload_session(
             name=target_write_ref.name,
@@ -1482,27 +1508,20 @@ class DatasetSyncManager:
             or payload.media_type
             or self._guess_content_type(payload.storage_ref.name),
         )
-        if session.upload_method == "local_path":
-            if not session.upload_path:
-                raise ValueError(f"Upload session {session.upload_session_id} is missing upload_path")
-            upload_path = Path(session.upload_path)
-            await asyncio.to_thread(mkdir_and_write_bytes, upload_path, data)
-        elif session.upload_method == "presigned_url":
-            if not session.upload_url:
-                raise ValueError(f"Upload session {session.upload_session_id} is missing upload_url")
-            req = urllib_request.Request(session.upload_url, data=data, method="PUT")
-            for key, value in session.upload_headers.items():
-                req.add_header(key, value)
-            await asyncio.to_thread(_blocking_presigned_put, req)
-        else:
-            raise ValueError(f"Unsupported upload method: {session.upload_method}")
+        stream = PayloadStream(
+            data,
+            algorithms=(_parse_payload_checksum(payload.checksum)[0],) if payload.checksum else (),
+            chunk_size=self.chunk_size,
+            budget=self.payload_budget,
+        )
+        transferred = await _stream_to_upload_session(session, stream)
         completed = await self.target.complete_object_upload_session(
             session.upload_session_id,
             finalize_token=session.finalize_token,
         )
         if completed.storage_ref is None:
             raise RuntimeError(f"Upload session {session.upload_session_id} did not produce a storage_ref")
-        await self._verify_transferred_payload(payload, data, completed.storage_ref)
+        await self._verify_transferred_payload(payload, transferred, completed.storage_ref)
         return completed.storage_ref
 
     async def _refresh_target_asset_for_cross_lake_import(self, new_asset: Asset) -> None:
@@ -1616,43 +1635,33 @@ class DatasetSyncManager:
     async def _verify_transferred_payload(
         self,
         payload: ObjectPayloadDescriptor,
-        source_bytes: bytes,
+        transferred: bytes | StreamedPayload,
         target_ref: StorageRef,
     ) -> None:
-        # Cheap target signal only (no full object GET); checksum applies to staged/source bytes callers already hold.
+        # Cheap target signal only (no full object GET); size and checksum come from the bytes that were sent,
+        # either tallied while streaming or computed from staged bytes callers already hold.
+        if not isinstance(transferred, StreamedPayload):
+            transferred = _summarize_payload_bytes(transferred, payload.checksum)
         head = await self.target.head_object(target_ref)
         remote_size = _head_object_size_bytes(head)
-        if remote_size is not None and remote_size != len(source_bytes):
+        if remote_size is not None and remote_size != transferred.size_bytes:
             raise RuntimeError(
                 f"Post-upload size mismatch for asset {payload.asset_id}: "
-                f"target head reports {remote_size} bytes, transferred {len(source_bytes)}"
+                f"target head reports {remote_size} bytes, transferred {transferred.size_bytes}"
             )
-        if payload.size_bytes is not None and len(source_bytes) != payload.size_bytes:
+        if payload.size_bytes is not None and transferred.size_bytes != payload.size_bytes:
             raise RuntimeError(
                 f"Post-upload size mismatch for asset {payload.asset_id}: "
-                f"staged payload is {len(source_bytes)} bytes, expected {payload.size_bytes}"
+                f"staged payload is {transferred.size_bytes} bytes, expected {payload.size_bytes}"
             )
-        if payload.checksum and not self._payload_checksum_matches(source_bytes, payload.checksum):
-            raise RuntimeError(f"Post-upload checksum mismatch for asset {payload.asset_id}")
+        if payload.checksum:
+            algo, expected = _parse_payload_checksum(payload.checksum)
+            if transferred.digests.get(algo) != expected:
+                raise RuntimeError(f"Post-upload checksum mismatch for asset {payload.asset_id}")
 
     def _payload_checksum_matches(self, data: bytes, declared: str) -> bool:
-        declared_stripped = declared.strip()
-        lowered = declared_stripped.lower()
-        if ":" in lowered:
-            algo, _, digest = lowered.partition(":")
-            digest = digest.strip()
-            algo = algo.strip()
-            if algo == "sha256":
-                return hashlib.sha256(data).hexdigest() == digest
-            if algo == "md5":
-                return hashlib.md5(data).hexdigest() == digest
-            raise ValueError(f"Unsupported checksum algorithm in payload descriptor: {algo!r}")
-        hex_body = lowered.replace("-", "")
-        if len(hex_body) == 64 and set(hex_body) <= set("0123456789abcdef"):
-            return hashlib.sha256(data).hexdigest() == hex_body
-        if len(hex_body) == 32 and set(hex_body) <= set("0123456789abcdef"):
-            return hashlib.md5(data).hexdigest() == hex_body
-        raise ValueError(f"Unrecognized payload checksum format: {declared_stripped!r}")
+        algo, digest = _parse_payload_checksum(declared)
+        return hashlib.new(algo, data).hexdigest() == digest
 
     def _guess_content_type(self, name: str) -> str:
         guessed, _ = mimetypes.guess_type(name)
@@ -18,6 +18,8 @@ def register_benchmark_suites(*, runner: TestRunner | None = None, replace: bool
 
     from mindtrace.datalake.testing.suites.collection_item import DatalakeCollectionItemSuite
     from mindtrace.datalake.testing.suites.create_asset import DatalakeCreateAssetFromObjectSuite
+    from mindtrace.datalake.testing.suites.dataset_view import DatalakeDatasetViewSuite
+    from mindtrace.datalake.testing.suites.export import DatalakeExportSuite
     from mindtrace.datalake.testing.suites.mixed_rw import DatalakeMixedRwSuite
     from mindtrace.datalake.testing.suites.mongo_insert import DatalakeMongoInsertCeilingSuite
     from mindtrace.datalake.testing.suites.payload_read import DatalakePayloadReadCeilingSuite
@@ -34,6 +36,8 @@ def register_benchmark_suites(*, runner: TestRunner | None = None, replace: bool
         DatalakeCreateAssetFromObjectSuite,
         DatalakeCollectionItemSuite,
         DatalakeRetentionSuite,
+        DatalakeDatasetViewSuite,
+        DatalakeExportSuite,
     ):
         if replace or cls.suite_id not in target.registered_suites():
             target.register_test_suite(cls, replace=replace)
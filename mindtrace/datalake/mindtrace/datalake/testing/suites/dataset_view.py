@@ -0,0 +1,247 @@
+"""Datalake dataset version view page and count latency vs. dataset size and filter selectivity."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from types import MappingProxyType
+from typing import Literal
+from uuid import uuid4
+
+from pydantic import BaseModel, Field
+
+from mindtrace.core import (
+    BenchReporter,
+    BenchResult,
+    BenchResultSchema,
+    BenchSuiteConfig,
+    BenchTestSuite,
+    TaskSchema,
+    utc_now_iso,
+)
+from mindtrace.database import MongoMindtraceODM
+from mindtrace.datalake import Datalake
+from mindtrace.datalake.pagination_types import DatasetViewExpand, StructuredFilter
+from mindtrace.datalake.testing.mongo_resolve import resolve_mongo_triple
+from mindtrace.datalake.testing.mounts import build_payload_mount
+from mindtrace.datalake.types import DatasetVersion, Datum
+
+# Datums are spread evenly over this many buckets; the filter keeps the lowest ``selectivity`` share of them.
+_BUCKETS = 1_000
+
+
+class DatalakeDatasetViewInput(BaseModel):
+    mongo_backend: Literal["local", "atlas"] = Field("local", description="Mongo backend label to resolve.")
+    dataset_size: int = Field(10_000, ge=1, description="Number of datums in the seeded dataset version.")
+    selectivity: float = Field(
+        0.01, gt=0.0, le=1.0, description="Fraction of datums matched by the view filter (1.0 disables filtering)."
+    )
+    page_size: int = Field(100, ge=1, description="Rows requested per view page.")
+    include_total: bool = Field(False, description="Also ask for total_count on every page.")
+    seed_batch_size: int = Field(1_000, ge=1, description="Datums inserted per seeding operation.")
+
+
+class DatalakeDatasetViewResources(BaseModel):
+    mongo_uri: str = Field("mongodb://127.0.0.1:27017", description="MongoDB URI for local backend.")
+    mongo_db_name: str | None = Field(None, description="Optional Mongo database name for this run.")
+    REMOTE_MONGO_DB_URI: str | None = Field(
+        None, description="Atlas Mongo URI for atlas backend.", json_schema_extra={"secret": True}
+    )
+    REMOTE_MONGO_DB_NAME: str | None = Field(None, description="Atlas Mongo database name for atlas backend.")
+    mongo_atlas_uri: str | None = Field(
+        None, description="Alias for REMOTE_MONGO_DB_URI.", json_schema_extra={"secret": True}
+    )
+    mongo_atlas_db_name: str | None = Field(None, description="Alias for REMOTE_MONGO_DB_NAME.")
+
+
+class DatalakeDatasetViewSuite(BenchTestSuite):
+    suite_id = "datalake.stress.dataset_view"
+    title = "Datalake stress — dataset version view paging"
+    description = (
+        "Seeds a dataset version of ``dataset_size`` datums, then repeatedly walks it with "
+        "view_dataset_version_page using a filter that matches ``selectivity`` of the rows. "
+        "Reports page latency, plus the latency of a separate total-count request."
+    )
+    tags = frozenset({"stress", "datalake"})
+    requires = ("local_disk", "mongo")
+    safety = "Writes seeded datums and a dataset version under generated names; no payload objects are stored."
+    task_schema = TaskSchema(name=suite_id, input_schema=DatalakeDatasetViewInput, output_schema=BenchResultSchema)
+    resource_schema = DatalakeDatasetViewResources
+    profiles = MappingProxyType(
+        {
+            "stress": {
+                "duration_seconds": 30.0,
+                "mongo_backend": "local",
+                "dataset_size": 10_000,
+                "selectivity": 0.01,
+                "page_size": 100,
+                "resources": {"mongo_uri": "mongodb://127.0.0.1:27017"},
+            },
+            "large_selective": {
+                "duration_seconds": 120.0,
+                "mongo_backend": "local",
+                "dataset_size": 200_000,
+                "selectivity": 0.001,
+                "page_size": 100,
+                "include_total": True,
+                "resources": {"mongo_uri": "mongodb://127.0.0.1:27017"},
+            },
+            "large_unfiltered": {
+                "duration_seconds": 120.0,
+                "mongo_backend": "local",
+                "dataset_size": 200_000,
+                "selectivity": 1.0,
+                "page_size": 100,
+                "resources": {"mongo_uri": "mongodb://127.0.0.1:27017"},
+            },
+        },
+    )
+
+    def execute_bench(self, config: BenchSuiteConfig, reporter: BenchReporter) -> BenchResult:
+        started = utc_now_iso()
+        monotonic_start = time.perf_counter()
+        mongo_backend, mongo_uri, mongo_db_name = resolve_mongo_triple(config)
+        dataset_size = int(config.parameters.get("dataset_size", 10_000))
+        selectivity = float(config.parameters.get("selectivity", 0.01))
+        page_size = int(config.parameters.get("page_size", 100))
+        include_total = bool(config.parameters.get("include_total", False))
+        seed_batch_size = int(config.parameters.get("seed_batch_size", 1_000))
+        dataset_name = f"bench-{config.run_id}-{uuid4().hex}"
+        version = "1.0.0"
+        prefix = f"bench/{config.run_id}/{config.suite_id}/{uuid4().hex}"
+
+        bucket_cutoff = max(1, round(selectivity * _BUCKETS))
+        filters = (
+            [StructuredFilter(field="metadata.bucket", op="lt", value=bucket_cutoff)]
+            if bucket_cutoff < _BUCKETS
+            else []
+        )
+        expected_matches = sum(1 for index in range(dataset_size) if index % _BUCKETS < bucket_cutoff)
+
+        seed_start = time.perf_counter()
+        asyncio.run(
+            _seed_dataset_version(
+                config,
+                mongo_uri,
+                mongo_db_name,
+                dataset_name=dataset_name,
+                version=version,
+                dataset_size=dataset_size,
+                seed_batch_size=seed_batch_size,
+            )
+        )
+        seed_seconds = time.perf_counter() - seed_start
+
+        mount, cleanup, _ = build_payload_mount(config, "local", prefix)
+        lake: Datalake | None = None
+        count_latency: float | None = None
+        pages_walked = 0
+        try:
+            lake = Datalake(mongo_db_uri=mongo_uri, mongo_db_name=mongo_db_name, mounts=[mount], default_mount="stress")
+            lake.initialize()
+            expand = DatasetViewExpand(assets=False)
+
+            count_start = time.perf_counter()
+            total = lake.view_dataset_version_page(
+                dataset_name, version, limit=1, filters=filters, expand=expand, include_total=True
+            ).page.total_count
+            count_latency = time.perf_counter() - count_start
+            if total != expected_matches:
+                reporter.record_operation(
+                    success=False,
+                    latency_seconds=count_latency,
+                    error=AssertionError(f"total_count {total} != expected {expected_matches}"),
+                )
+
+            deadline = reporter.deadline(config.duration_seconds)
+            cursor: str | None = None
+            while time.perf_counter() < deadline and not reporter.is_cancelled():
+                op_start = time.perf_counter()
+                try:
+                    page = lake.view_dataset_version_page(
+                        dataset_name,
+                        version,
+                        limit=page_size,
+                        cursor=cursor,
+                        filters=filters,
+                        expand=expand,
+                        include_total=include_total,
+                    )
+                except Exception as exc:  # noqa: BLE001
+                    reporter.record_operation(success=False, latency_seconds=time.perf_counter() - op_start, error=exc)
+                    cursor = None
+                    continue
+                reporter.record_operation(success=True, latency_seconds=time.perf_counter() - op_start)
+                pages_walked += 1
+                cursor = page.page.next_cursor
+        finally:
+            if lake is not None:
+                lake.close()
+            cleanup()
+
+        elapsed = time.perf_counter() - monotonic_start
+        return BenchResult(
+            suite_id=config.suite_id,
+            status="passed" if reporter.failures == 0 else "failed",
+            started_at=started,
+            ended_at=utc_now_iso(),
+            duration_seconds=elapsed,
+            operations=reporter.operations,
+            successes=reporter.successes,
+            failures=reporter.failures,
+            latency_seconds=reporter.latency_seconds,
+            error_counts=reporter.error_counts,
+            metrics={
+                **reporter.metrics,
+                "dataset_size": dataset_size,
+                "selectivity": selectivity,
+                "matching_rows": expected_matches,
+                "page_size": page_size,
+                "include_total": include_total,
+                "pages_walked": pages_walked,
+                "count_latency_seconds": count_latency,
+                "seed_seconds": seed_seconds,
+                "dataset_name": dataset_name,
+                "mongo_backend": mongo_backend,
+                "mongo_db_name": mongo_db_name,
+            },
+        )
+
+
+async def _seed_dataset_version(
+    config: BenchSuiteConfig,
+    mongo_uri: str,
+    mongo_db_name: str,
+    *,
+    dataset_name: str,
+    version: str,
+    dataset_size: int,
+    seed_batch_size: int,
+) -> None:
+    datum_db = MongoMindtraceODM(model_cls=Datum, db_uri=mongo_uri, db_name=mongo_db_name)
+    version_db = MongoMindtraceODM(model_cls=DatasetVersion, db_uri=mongo_uri, db_name=mongo_db_name)
+    try:
+        await datum_db.initialize()
+        await version_db.initialize()
+        manifest: list[str] = []
+        for batch_start in range(0, dataset_size, seed_batch_size):
+            datums = [
+                Datum(
+                    split="train",
+                    metadata={"bench_run_id": config.run_id, "bucket": index % _BUCKETS, "sequence": index},
+                )
+                for index in range(batch_start, min(batch_start + seed_batch_size, dataset_size))
+            ]
+            await datum_db.insert_many(datums, ordered=False)
+            manifest.extend(datum.datum_id for datum in datums)
+        await version_db.insert(
+            DatasetVersion(
+                dataset_name=dataset_name,
+                version=version,
+                manifest=manifest,
+                metadata={"bench_run_id": config.run_id},
+            )
+        )
+    finally:
+        datum_db.close()
+        version_db.close()
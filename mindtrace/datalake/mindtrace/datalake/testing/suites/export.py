@@ -0,0 +1,240 @@
+"""Datalake dataset version export throughput vs. payload fetch concurrency."""
+
+from __future__ import annotations
+
+import random
+import shutil
+import tempfile
+import time
+from io import BytesIO
+from pathlib import Path
+from types import MappingProxyType
+from typing import Literal
+from uuid import uuid4
+
+from PIL import Image
+from pydantic import BaseModel, Field
+
+from mindtrace.core import (
+    BenchReporter,
+    BenchResult,
+    BenchResultSchema,
+    BenchSuiteConfig,
+    BenchTestSuite,
+    TaskSchema,
+    utc_now_iso,
+)
+from mindtrace.datalake import Datalake
+from mindtrace.datalake.testing.mongo_resolve import resolve_mongo_triple
+from mindtrace.datalake.testing.mounts import build_payload_mount
+
+
+class DatalakeExportInput(BaseModel):
+    backend: Literal["local", "minio", "gcs"] = Field("local", description="Object storage backend for payloads.")
+    mongo_backend: Literal["local", "atlas"] = Field("local", description="Mongo backend label to resolve.")
+    export_format: Literal["coco", "huggingface"] = Field("coco", description="Export format to write.")
+    dataset_size: int = Field(200, ge=1, description="Number of image datums in the exported dataset version.")
+    image_side: int = Field(256, ge=1, description="Width and height in pixels of each seeded PNG image.")
+    concurrency: int = Field(8, ge=1, description="Datums resolved and fetched concurrently by the exporter.")
+    include_media: bool = Field(True, description="Write image files alongside the annotation files.")
+
+
+class DatalakeExportResources(BaseModel):
+    mongo_uri: str = Field("mongodb://127.0.0.1:27017", description="MongoDB URI for local backend.")
+    mongo_db_name: str | None = Field(None, description="Optional Mongo database name for this run.")
+    REMOTE_MONGO_DB_URI: str | None = Field(
+        None, description="Atlas Mongo URI for atlas backend.", json_schema_extra={"secret": True}
+    )
+    REMOTE_MONGO_DB_NAME: str | None = Field(None, description="Atlas Mongo database name for atlas backend.")
+    mongo_atlas_uri: str | None = Field(
+        None, description="Alias for REMOTE_MONGO_DB_URI.", json_schema_extra={"secret": True}
+    )
+    mongo_atlas_db_name: str | None = Field(None, description="Alias for REMOTE_MONGO_DB_NAME.")
+    minio_endpoint: str = Field("localhost:9100", description="S3-compatible endpoint for minio backend.")
+    minio_access_key: str = Field(
+        "minioadmin", description="Access key for minio backend.", json_schema_extra={"secret": True}
+    )
+    minio_secret_key: str = Field(
+        "minioadmin", description="Secret key for minio backend.", json_schema_extra={"secret": True}
+    )
+    minio_bucket: str = Field("stress-registry", description="Bucket for minio backend writes.")
+    minio_prefix: str | None = Field(None, description="Optional object prefix for minio backend writes.")
+    minio_secure: bool = Field(False, description="Whether the minio endpoint uses TLS.")
+    gcs_project_id: str | None = Field(None, description="GCP project ID for gcs backend.")
+    gcs_bucket_name: str | None = Field(None, description="GCS bucket name for gcs backend.")
+    gcs_prefix: str | None = Field(None, description="Optional object prefix for gcs backend writes.")
+    gcs_credentials_path: str | None = Field(
+        None,
+        description="Optional service account credentials path for gcs backend.",
+        json_schema_extra={"secret": True},
+    )
+
+
+class DatalakeExportSuite(BenchTestSuite):
+    suite_id = "datalake.stress.export"
+    title = "Datalake stress — dataset version export throughput"
+    description = (
+        "Seeds a dataset version of ``dataset_size`` PNG image datums, then repeatedly exports it with "
+        "export_dataset_version_to_format at the configured payload fetch ``concurrency``. Each operation is one "
+        "full export; reports datums and payload bytes per second."
+    )
+    tags = frozenset({"stress", "datalake"})
+    requires = ("local_disk", "mongo")
+    safety = "Writes seeded assets and a dataset version under generated names; exports go to a temporary directory."
+    task_schema = TaskSchema(name=suite_id, input_schema=DatalakeExportInput, output_schema=BenchResultSchema)
+    resource_schema = DatalakeExportResources
+    profiles = MappingProxyType(
+        {
+            "stress": {
+                "duration_seconds": 30.0,
+                "backend": "local",
+                "mongo_backend": "local",
+                "export_format": "coco",
+                "dataset_size": 200,
+                "image_side": 256,
+                "concurrency": 8,
+                "resources": {"mongo_uri": "mongodb://127.0.0.1:27017"},
+            },
+            "sequential_baseline": {
+                "duration_seconds": 30.0,
+                "backend": "local",
+                "mongo_backend": "local",
+                "export_format": "coco",
+                "dataset_size": 200,
+                "image_side": 256,
+                "concurrency": 1,
+                "resources": {"mongo_uri": "mongodb://127.0.0.1:27017"},
+            },
+            "remote_objects": {
+                "duration_seconds": 60.0,
+                "backend": "minio",
+                "mongo_backend": "local",
+                "export_format": "coco",
+                "dataset_size": 1_000,
+                "image_side": 512,
+                "concurrency": 32,
+                "resources": {"mongo_uri": "mongodb://127.0.0.1:27017"},
+            },
+        },
+    )
+
+    def execute_bench(self, config: BenchSuiteConfig, reporter: BenchReporter) -> BenchResult:
+        started = utc_now_iso()
+        monotonic_start = time.perf_counter()
+        backend = str(config.parameters.get("backend", "local")).lower()
+        mongo_backend, mongo_uri, mongo_db_name = resolve_mongo_triple(config)
+        export_format = str(config.parameters.get("export_format", "coco"))
+        dataset_size = int(config.parameters.get("dataset_size", 200))
+        image_side = int(config.parameters.get("image_side", 256))
+        concurrency = int(config.parameters.get("concurrency", 8))
+        include_media = bool(config.parameters.get("include_media", True))
+        dataset_name = f"bench-{config.run_id}-{uuid4().hex}"
+        version = "1.0.0"
+        prefix = f"bench/{config.run_id}/{config.suite_id}/{uuid4().hex}"
+        export_root = Path(tempfile.mkdtemp(prefix="mindtrace-export-bench-"))
+
+        mount, cleanup, backend_metrics = build_payload_mount(config, backend, prefix)
+        lake: Datalake | None = None
+        seed_seconds: float | None = None
+        dataset_bytes = 0
+        export_seconds: list[float] = []
+        try:
+            lake = Datalake(mongo_db_uri=mongo_uri, mongo_db_name=mongo_db_name, mounts=[mount], default_mount="stress")
+            lake.initialize()
+
+            seed_start = time.perf_counter()
+            rng = random.Random(0)
+            manifest: list[str] = []
+            for index in range(dataset_size):
+                payload = _png_payload(rng, image_side)
+                dataset_bytes += len(payload)
+                asset = lake.create_asset_from_object(
+                    name=f"{prefix}/{index:08d}.png",
+                    obj=payload,
+                    kind="image",
+                    media_type="image/png",
+                    mount="stress",
+                    asset_metadata={"bench_run_id": config.run_id},
+                )
+                datum = lake.create_datum(
+                    asset_refs={"image": asset.asset_id},
+                    split="train" if index % 5 else "val",
+                    metadata={"bench_run_id": config.run_id, "sequence": index},
+                )
+                manifest.append(datum.datum_id)
+            lake.create_dataset_version(
+                dataset_name=dataset_name,
+                version=version,
+                manifest=manifest,
+                metadata={"bench_run_id": config.run_id},
+            )
+            seed_seconds = time.perf_counter() - seed_start
+
+            deadline = reporter.deadline(config.duration_seconds)
+            while time.perf_counter() < deadline and not reporter.is_cancelled():
+                op_start = time.perf_counter()
+                try:
+                    result = lake.export_dataset_version_to_format(
+                        dataset_name,
+                        version,
+                        format=export_format,
+                        destination=export_root / "export",
+                        include_media=include_media,
+                        overwrite=True,
+                        concurrency=concurrency,
+                    )
+                    if result.asset_count != dataset_size:
+                        raise AssertionError(f"exported {result.asset_count} assets, expected {dataset_size}")
+                except Exception as exc:  # noqa: BLE001
+                    reporter.record_operation(success=False, latency_seconds=time.perf_counter() - op_start, error=exc)
+                    continue
+                export_seconds.append(time.perf_counter() - op_start)
+                reporter.record_operation(
+                    success=True, latency_seconds=export_seconds[-1], bytes_processed=dataset_bytes
+                )
+        finally:
+            if lake is not None:
+                lake.close()
+            cleanup()
+            shutil.rmtree(export_root, ignore_errors=True)
+
+        elapsed = time.perf_counter() - monotonic_start
+        mean_export_seconds = sum(export_seconds) / len(export_seconds) if export_seconds else None
+        return BenchResult(
+            suite_id=config.suite_id,
+            status="passed" if reporter.failures == 0 else "failed",
+            started_at=started,
+            ended_at=utc_now_iso(),
+            duration_seconds=elapsed,
+            operations=reporter.operations,
+            successes=reporter.successes,
+            failures=reporter.failures,
+            bytes_processed=reporter.bytes_processed,
+            latency_seconds=reporter.latency_seconds,
+            error_counts=reporter.error_counts,
+            metrics={
+                **reporter.metrics,
+                **backend_metrics,
+                "export_format": export_format,
+                "dataset_size": dataset_size,
+                "dataset_bytes": dataset_bytes,
+                "image_side": image_side,
+                "concurrency": concurrency,
+                "include_media": include_media,
+                "exports": len(export_seconds),
+                "mean_export_seconds": mean_export_seconds,
+                "datums_per_second": dataset_size / mean_export_seconds if mean_export_seconds else None,
+                "payload_bytes_per_second": dataset_bytes / mean_export_seconds if mean_export_seconds else None,
+                "seed_seconds": seed_seconds,
+                "dataset_name": dataset_name,
+                "mongo_backend": mongo_backend,
+                "mongo_db_name": mongo_db_name,
+            },
+        )
+
+
+def _png_payload(rng: random.Random, side: int) -> bytes:
+    """Encode a noisy grayscale PNG, so payload size stays close to ``side * side`` bytes."""
+    buffer = BytesIO()
+    Image.frombytes("L", (side, side), rng.randbytes(side * side)).save(buffer, format="PNG")
+    return buffer.getvalue()
@@ -594,26 +594,62 @@ class Datum(DatalakeDocument):
 
 
 class DatasetVersion(DatalakeDocument):
-    """Immutable dataset manifest over datum ids."""
+    """Immutable dataset manifest over datum ids.
+
+    With ``manifest_storage="inline"`` the ordered datum ids live in ``manifest``. With
+    ``manifest_storage="collection"`` they are stored as :class:`DatasetVersionMember` rows,
+    ``manifest`` is only populated when explicitly loaded, and ``datum_count`` holds the size.
+    """
 
     def __str__(self) -> str:
-        return f"DatasetVersion(dataset={self.dataset_name}, version={self.version}, datums={len(self.manifest)})"
+        return f"DatasetVersion(dataset={self.dataset_name}, version={self.version}, datums={self.size})"
 
     dataset_version_id: Annotated[str, Indexed(unique=True)] = Field(default_factory=lambda: new_id("dataset_version"))
     dataset_name: Annotated[str, Indexed(unique=False)]
     version: str
     description: str | None = None
     manifest: list[str] = Field(default_factory=list)
+    manifest_storage: Literal["inline", "collection"] = "inline"
+    datum_count: int | None = None
     source_dataset_version_id: str | None = None
     metadata: dict[str, Any] = Field(default_factory=dict)
     created_at: datetime = Field(default_factory=utc_now)
     created_by: str | None = None
 
+    @property
+    def size(self) -> int:
+        """Number of datums in the version, without requiring the manifest to be loaded."""
+        return self.datum_count if self.datum_count is not None else len(self.manifest)
+
     class Settings:
         name = "datalake_dataset_versions"
         indexes = [[("dataset_name", 1), ("version", 1)]]
 
 
+class DatasetVersionMember(DatalakeDocument):
+    """One manifest position of a dataset version stored with ``manifest_storage="collection"``."""
+
+    def __str__(self) -> str:
+        return (
+            f"DatasetVersionMember(dataset={self.dataset_name}, version={self.version}, "
+            f"ordinal={self.ordinal}, datum_id={self.datum_id})"
+        )
+
+    dataset_version_id: str
+    dataset_name: str
+    version: str
+    ordinal: int
+    datum_id: str
+
+    class Settings:
+        name = "datalake_dataset_version_members"
+        indexes = [
+            IndexModel([("dataset_version_id", 1), ("ordinal", 1)], unique=True),
+            IndexModel([("dataset_version_id", 1), ("datum_id", 1)], unique=True),
+            "datum_id",
+        ]
+
+
 class ResolvedCollectionItem(BaseModel):
     """Resolved collection item with linked collection and asset."""
 
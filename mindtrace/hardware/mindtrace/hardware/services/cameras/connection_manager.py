@@ -5,10 +5,12 @@ Provides a strongly-typed client interface for programmatic access
 to camera management operations.
 """
 
+from multiprocessing import shared_memory
 from typing import Any, Dict, List, Optional
 from urllib.parse import urljoin
 
 import httpx
+import numpy as np
 
 from mindtrace.hardware.services.cameras.models import (
     # Request models
@@ -25,10 +27,22 @@ from mindtrace.hardware.services.cameras.models import (
     CaptureHDRBatchRequest,
     CaptureHDRRequest,
     CaptureImageRequest,
+    CaptureRawBatchRequest,
+    CaptureRawRequest,
+    CaptureSharedMemoryRequest,
     ConfigFileExportRequest,
     ConfigFileImportRequest,
     ConfigureCaptureGroupsRequest,
 )
+from mindtrace.hardware.services.cameras.transport import (
+    RawFrameError,
+    attach_shared_memory,
+    boundary_from_content_type,
+    decode_frame,
+    detach_shared_memory,
+    parse_multipart_frames,
+    read_shared_frame,
+)
 from mindtrace.services.core.connection_manager import ConnectionManager
 
 
@@ -40,6 +54,11 @@ class CameraManagerConnectionManager(ConnectionManager):
     making it easy to use the service programmatically from other applications.
     """
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Attachments to the service's shared frame segments, one per camera
+        self._shared_frame_buffers: Dict[str, shared_memory.SharedMemory] = {}
+
     async def get(self, endpoint: str, http_timeout: float = 60.0) -> Dict[str, Any]:
         """Make GET request to service endpoint."""
         url = urljoin(str(self.url), endpoint.lstrip("/"))
@@ -56,6 +75,13 @@ class CameraManagerConnectionManager(ConnectionManager):
             response.raise_for_status()
             return response.json()
 
+    async def post_raw(self, endpoint: str, data: Dict[str, Any] = None, http_timeout: float = 60.0) -> httpx.Response:
+        """Make POST request to a binary service endpoint over the pooled keep-alive client."""
+        url = urljoin(str(self.url), endpoint.lstrip("/"))
+        response = await self.async_http_client.post(url, json=data or {}, timeout=http_timeout)
+        response.raise_for_status()
+        return response
+
     # Backend & Discovery Operations
     async def discover_backends(self) -> List[str]:
         """Discover available camera backends.
@@ -311,6 +337,85 @@ class CameraManagerConnectionManager(ConnectionManager):
         response = await self.post("/cameras/capture/batch", request.model_dump(), http_timeout=120.0)
         return response["data"]
 
+    async def capture_image_raw(self, camera: str) -> np.ndarray:
+        """Capture a single image as a numpy array over the binary transport.
+
+        The frame arrives as raw bytes rather than a base64-encoded image, so neither side encodes or decodes it.
+
+        Args:
+            camera: Camera name
+
+        Returns:
+            Read-only BGR array viewing the response body (``.copy()`` it to modify)
+        """
+        request = CaptureRawRequest(camera=camera)
+        response = await self.post_raw("/cameras/capture/raw", request.model_dump(), http_timeout=120.0)
+        return decode_frame(response.headers, response.content)
+
+    async def capture_images_batch_raw(
+        self, cameras: List[str], stage: Optional[str] = None, set_name: Optional[str] = None
+    ) -> Dict[str, Optional[np.ndarray]]:
+        """Capture images from multiple cameras over the binary multipart transport.
+
+        Args:
+            cameras: List of camera names
+            stage: Optional stage name for capture group routing
+            set_name: Optional set name for capture group routing
+
+        Returns:
+            Read-only BGR array per camera, or None for cameras whose capture failed
+        """
+        request = CaptureRawBatchRequest(cameras=cameras, stage=stage, set_name=set_name)
+        response = await self.post_raw("/cameras/capture/batch/raw", request.model_dump(), http_timeout=120.0)
+        frames = parse_multipart_frames(response.content, boundary_from_content_type(response.headers["content-type"]))
+        results: Dict[str, Optional[np.ndarray]] = {}
+        for camera, frame in frames.items():
+            if isinstance(frame, RawFrameError):
+                self.logger.warning(f"Raw capture from '{camera}' failed: {frame}")
+                results[camera] = None
+            else:
+                results[camera] = frame
+        return results
+
+    async def capture_image_shared(self, camera: str, copy: bool = True) -> np.ndarray:
+        """Capture a single image through shared memory; only valid when the service runs on this host.
+
+        The service writes the frame into a shared memory segment it owns (one per camera) and this connection manager
+        attaches to it by name, so the pixels never cross the HTTP connection.
+
+        Args:
+            camera: Camera name
+            copy: Return a copy of the frame. With ``copy=False`` the array views the segment, which the next
+                shared capture of the same camera overwrites, including one made by another client while the
+                view is still being read.
+
+        Returns:
+            BGR array.
+
+        Raises:
+            RuntimeError: If the capture failed
+        """
+        request = CaptureSharedMemoryRequest(camera=camera)
+        response = await self.post("/cameras/capture/shared", request.model_dump(), http_timeout=120.0)
+        result = response["data"]
+        if not result["success"]:
+            raise RuntimeError(f"Shared memory capture from '{camera}' failed: {result.get('error')}")
+
+        segment = self._shared_frame_buffers.get(camera)
+        if segment is None or segment.name != result["shm_name"]:
+            # First capture, or the service replaced the segment with a larger one
+            if segment is not None:
+                detach_shared_memory(self._shared_frame_buffers.pop(camera))
+            segment = self._shared_frame_buffers[camera] = attach_shared_memory(result["shm_name"])
+        frame = read_shared_frame(segment, result["shape"], result["dtype"])
+        return frame.copy() if copy else frame
+
+    def release_shared_memory(self) -> None:
+        """Detach from the service's shared memory segments; the service unlinks them when it shuts down."""
+        while self._shared_frame_buffers:
+            _, segment = self._shared_frame_buffers.popitem()
+            detach_shared_memory(segment)
+
     async def capture_hdr_image(
         self,
         camera: str,
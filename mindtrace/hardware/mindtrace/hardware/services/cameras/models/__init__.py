@@ -22,6 +22,9 @@ from mindtrace.hardware.services.cameras.models.requests import (
     CaptureHDRRequest,
     # Image Capture
     CaptureImageRequest,
+    CaptureRawBatchRequest,
+    CaptureRawRequest,
+    CaptureSharedMemoryRequest,
     ConfigFileExportRequest,
     ConfigFileImportRequest,
     # Capture Groups
@@ -117,9 +120,12 @@ from mindtrace.hardware.services.cameras.models.responses import (
     # Parameter Ranges
     ParameterRange,
     RangeResponse,
+    SharedMemoryCaptureResponse,
+    SharedMemoryCaptureResult,
     # Streaming
     StreamInfo,
     StreamInfoResponse,
+    StreamStats,
     StreamStatus,
     StreamStatusResponse,
     StringResponse,
@@ -145,6 +151,9 @@ __all__ = [
     "CaptureBatchRequest",
     "CaptureHDRRequest",
     "CaptureHDRBatchRequest",
+    "CaptureRawRequest",
+    "CaptureRawBatchRequest",
+    "CaptureSharedMemoryRequest",
     "BandwidthLimitRequest",
     "ExposureRequest",
     "GainRequest",
@@ -194,6 +203,8 @@ __all__ = [
     "CaptureResult",
     "CaptureResponse",
     "BatchCaptureResponse",
+    "SharedMemoryCaptureResult",
+    "SharedMemoryCaptureResponse",
     "HDRCaptureResult",
     "HDRCaptureResponse",
     "BatchHDRCaptureResponse",
@@ -212,6 +223,7 @@ __all__ = [
     "ConfigFileOperationResult",
     "ConfigFileResponse",
     "StreamInfo",
+    "StreamStats",
     "StreamStatus",
     "StreamInfoResponse",
     "StreamStatusResponse",
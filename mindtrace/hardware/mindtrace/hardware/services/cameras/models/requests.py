@@ -159,6 +159,26 @@ class CaptureBatchRequest(BaseModel):
         )
 
 
+class CaptureRawRequest(BaseModel):
+    """Request model for a single capture returned as raw array bytes."""
+
+    camera: str = Field(..., description="Camera name in format 'Backend:device_name'")
+
+
+class CaptureRawBatchRequest(BaseModel):
+    """Request model for a batch capture returned as a multipart body of raw array bytes."""
+
+    cameras: List[str] = Field(..., description="List of camera names to capture from")
+    stage: Optional[str] = Field(None, description="Stage name for capture group routing")
+    set_name: Optional[str] = Field(None, description="Set name for capture group routing")
+
+
+class CaptureSharedMemoryRequest(BaseModel):
+    """Request model for a capture written into a service-owned shared memory segment."""
+
+    camera: str = Field(..., description="Camera name in format 'Backend:device_name'")
+
+
 class CaptureHDRRequest(BaseModel):
     """Request model for HDR image capture."""
 
@@ -214,6 +214,24 @@ class BatchCaptureResponse(BaseResponse):
     failed_count: int
 
 
+class SharedMemoryCaptureResult(BaseModel):
+    """Shared memory capture result model; the frame itself is in the service's segment ``shm_name``."""
+
+    success: bool
+    error: Optional[str] = None
+    shm_name: Optional[str] = None  # Segment to attach to; the service owns it and may replace it on a later capture
+    shape: Optional[List[int]] = None
+    dtype: Optional[str] = None  # numpy dtype string, e.g. "|u1"
+    nbytes: Optional[int] = None
+    capture_time: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+class SharedMemoryCaptureResponse(BaseResponse):
+    """Response model for shared memory capture."""
+
+    data: SharedMemoryCaptureResult
+
+
 class HDRCaptureResult(BaseModel):
     """HDR capture result model."""
 
@@ -397,6 +415,20 @@ class StreamInfo(BaseModel):
     start_time: Optional[datetime] = None
 
 
+class StreamStats(BaseModel):
+    """Live statistics of the shared MJPEG producer serving a camera's stream clients."""
+
+    subscribers: int
+    target_fps: float
+    fps: float  # Measured over the recent frame window
+    quality: int
+    frames_published: int
+    frames_dropped: int  # Oldest frames discarded for clients that fell behind
+    capture_latency_ms: float
+    encode_latency_ms: float
+    frame_latency_ms: float  # Capture start until a client connection picked the frame up
+
+
 class StreamStatus(BaseModel):
     """Stream status model."""
 
@@ -405,6 +437,7 @@ class StreamStatus(BaseModel):
     connected: bool
     stream_url: Optional[str] = None
     uptime_seconds: Optional[float] = None
+    stats: Optional[StreamStats] = None
 
 
 class StreamInfoResponse(BaseResponse):
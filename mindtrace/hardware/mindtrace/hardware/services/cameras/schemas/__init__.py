@@ -14,8 +14,11 @@ from mindtrace.hardware.services.cameras.schemas.capture_group_schemas import (
 from mindtrace.hardware.services.cameras.schemas.capture_schemas import (
     CaptureHDRImagesBatchSchema,
     CaptureHDRImageSchema,
+    CaptureImageRawSchema,
+    CaptureImagesBatchRawSchema,
     CaptureImagesBatchSchema,
     CaptureImageSchema,
+    CaptureImageSharedSchema,
 )
 from mindtrace.hardware.services.cameras.schemas.config_schemas import (
     ConfigureCamerasBatchSchema,
@@ -105,6 +108,9 @@ ALL_SCHEMAS = {
     "capture_images_batch": CaptureImagesBatchSchema,
     "capture_hdr_image": CaptureHDRImageSchema,
     "capture_hdr_images_batch": CaptureHDRImagesBatchSchema,
+    "capture_image_raw": CaptureImageRawSchema,
+    "capture_images_batch_raw": CaptureImagesBatchRawSchema,
+    "capture_image_shared": CaptureImageSharedSchema,
     # Focus / Liquid Lens
     "get_lens_status": GetLensStatusSchema,
     "get_optical_power": GetOpticalPowerSchema,
@@ -165,6 +171,9 @@ __all__ = [
     "CaptureImagesBatchSchema",
     "CaptureHDRImageSchema",
     "CaptureHDRImagesBatchSchema",
+    "CaptureImageRawSchema",
+    "CaptureImagesBatchRawSchema",
+    "CaptureImageSharedSchema",
     # Focus / Liquid Lens
     "GetLensStatusSchema",
     "GetOpticalPowerSchema",
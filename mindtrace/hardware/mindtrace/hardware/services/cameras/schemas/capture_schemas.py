@@ -8,8 +8,12 @@ from mindtrace.hardware.services.cameras.models import (
     CaptureHDRBatchRequest,
     CaptureHDRRequest,
     CaptureImageRequest,
+    CaptureRawBatchRequest,
+    CaptureRawRequest,
     CaptureResponse,
+    CaptureSharedMemoryRequest,
     HDRCaptureResponse,
+    SharedMemoryCaptureResponse,
 )
 
 # Image Capture Schemas
@@ -27,9 +31,23 @@ CaptureHDRImagesBatchSchema = TaskSchema(
     name="capture_hdr_images_batch", input_schema=CaptureHDRBatchRequest, output_schema=BatchHDRCaptureResponse
 )
 
+# Binary transports return raw array bytes (octet-stream / multipart) rather than a JSON model
+CaptureImageRawSchema = TaskSchema(name="capture_image_raw", input_schema=CaptureRawRequest, output_schema=None)
+
+CaptureImagesBatchRawSchema = TaskSchema(
+    name="capture_images_batch_raw", input_schema=CaptureRawBatchRequest, output_schema=None
+)
+
+CaptureImageSharedSchema = TaskSchema(
+    name="capture_image_shared", input_schema=CaptureSharedMemoryRequest, output_schema=SharedMemoryCaptureResponse
+)
+
 __all__ = [
     "CaptureImageSchema",
     "CaptureImagesBatchSchema",
     "CaptureHDRImageSchema",
     "CaptureHDRImagesBatchSchema",
+    "CaptureImageRawSchema",
+    "CaptureImagesBatchRawSchema",
+    "CaptureImageSharedSchema",
 ]
@@ -8,11 +8,13 @@ architecture with comprehensive MCP tool integration and typed client access.
 import asyncio
 import base64
 import io
+import ipaddress
 import os
 import time
 from datetime import datetime, timezone
 from typing import Optional, Tuple
 
+from fastapi import Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
 from PIL import Image as PILImage
 
@@ -64,8 +66,11 @@ from mindtrace.hardware.services.cameras.models import (
     CaptureHDRBatchRequest,
     CaptureHDRRequest,
     CaptureImageRequest,
+    CaptureRawBatchRequest,
+    CaptureRawRequest,
     CaptureResponse,
     CaptureResult,
+    CaptureSharedMemoryRequest,
     ConfigFileExportRequest,
     ConfigFileImportRequest,
     ConfigFileOperationResult,
@@ -96,6 +101,8 @@ from mindtrace.hardware.services.cameras.models import (
     NetworkDiagnostics,
     NetworkDiagnosticsResponse,
     OpticalPowerRequest,
+    SharedMemoryCaptureResponse,
+    SharedMemoryCaptureResult,
     StreamInfo,
     StreamInfoResponse,
     StreamStartRequest,
@@ -108,9 +115,33 @@ from mindtrace.hardware.services.cameras.models import (
     TriggerAutofocusRequest,
 )
 from mindtrace.hardware.services.cameras.schemas import ALL_SCHEMAS, HealthSchema
+from mindtrace.hardware.services.cameras.streaming import MjpegStreamHub
+from mindtrace.hardware.services.cameras.transport import (
+    CAPTURE_TIME_HEADER,
+    MULTIPART_MEDIA_TYPE,
+    RAW_MEDIA_TYPE,
+    SharedFramePool,
+    frame_headers,
+    frame_payload,
+    multipart_chunks,
+    new_boundary,
+)
 from mindtrace.services import Service
 
 
+def _require_local_client(request: Request) -> None:
+    """Reject callers that are not on the service host; shared memory is only reachable from the same machine."""
+    from fastapi import HTTPException
+
+    host = request.client.host if request.client is not None else ""
+    try:
+        local = ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        local = False
+    if not local:
+        raise HTTPException(status_code=403, detail="Shared memory capture is only available to local clients")
+
+
 class CameraManagerService(Service):
     """
     Camera Management Service.
@@ -145,6 +176,10 @@ class CameraManagerService(Service):
         self._camera_manager: Optional[AsyncCameraManager] = None
         self._startup_time = time.time()
         self._active_streams: dict = {}  # Track active camera streams
+        # One capture/encode producer per camera, shared by all MJPEG clients of this worker
+        self._stream_hubs: dict[str, MjpegStreamHub] = {}
+        # Service-owned shared memory segments for capture_image_shared, one per camera
+        self._shared_frames = SharedFramePool()
         # Capabilities are static for the lifetime of an open camera (ranges
         # and supported modes don't change while connected) but the SDK
         # serializes per-camera, so a single get_camera_capabilities call can
@@ -172,6 +207,12 @@ class CameraManagerService(Service):
         # Stop all active streams
         if hasattr(self, "_active_streams"):
             self._active_streams.clear()
+        for hub in getattr(self, "_stream_hubs", {}).values():
+            hub.close()
+        if hasattr(self, "_stream_hubs"):
+            self._stream_hubs.clear()
+        if hasattr(self, "_shared_frames"):
+            self._shared_frames.close()
 
         if self._camera_manager is not None:
             try:
@@ -263,6 +304,17 @@ class CameraManagerService(Service):
             ALL_SCHEMAS["capture_hdr_images_batch"],
             as_tool=True,
         )
+        # Binary capture transports (not MCP tools: they return raw bytes or write to shared memory)
+        self.add_endpoint("cameras/capture/raw", self.capture_image_raw, ALL_SCHEMAS["capture_image_raw"])
+        self.add_endpoint(
+            "cameras/capture/batch/raw", self.capture_images_batch_raw, ALL_SCHEMAS["capture_images_batch_raw"]
+        )
+        self.add_endpoint(
+            "cameras/capture/shared",
+            self.capture_image_shared,
+            ALL_SCHEMAS["capture_image_shared"],
+            api_route_kwargs={"dependencies": [Depends(_require_local_client)]},
+        )
 
         # Capture Groups (stage+set batching)
         self.add_endpoint(
@@ -1165,6 +1217,98 @@ class CameraManagerService(Service):
             self.logger.error(f"Batch image capture failed: {e}")
             raise
 
+    # Binary Capture Operations
+    async def _capture_array(self, camera: str, capture_timeout: float = 15.0):
+        """Capture one numpy frame (BGR) from an active camera, raising on a missing camera or timeout."""
+        manager = await self._get_camera_manager()
+        if camera not in manager.active_cameras:
+            raise CameraNotFoundError(f"Camera '{camera}' is not initialized")
+        camera_proxy = await manager.open(camera)
+        try:
+            return await asyncio.wait_for(camera_proxy.capture(output_format="numpy"), timeout=capture_timeout)
+        except asyncio.TimeoutError:
+            raise CameraTimeoutError(
+                f"Capture timeout after {capture_timeout}s for camera '{camera}'. "
+                f"Camera exposure time may be too high. Configure with lower exposure time (<1000ms recommended)."
+            )
+
+    async def capture_image_raw(self, request: CaptureRawRequest):
+        """Capture a single image and return the raw array bytes.
+
+        The body is the C-ordered BGR array as ``application/octet-stream``, described by the ``X-Image-Shape`` and
+        ``X-Image-Dtype`` headers. Nothing is encoded, so a frame costs one memory copy on the wire instead of an
+        image encode plus base64 inflation. Failures are HTTP errors: 404 for an uninitialized camera, 504 for a
+        capture timeout, 500 otherwise.
+        """
+        from fastapi import HTTPException
+        from fastapi.responses import Response
+
+        try:
+            image = await self._capture_array(request.camera)
+            if image is None:
+                raise HardwareOperationError(f"Camera '{request.camera}' returned no image")
+        except CameraNotFoundError as e:
+            raise HTTPException(status_code=404, detail=str(e))
+        except CameraTimeoutError as e:
+            self.logger.error(str(e))
+            raise HTTPException(status_code=504, detail=str(e))
+        except Exception as e:
+            self.logger.error(f"Failed to capture raw image from '{request.camera}': {e}")
+            raise HTTPException(status_code=500, detail=f"Capture failed: {str(e)}")
+
+        headers = frame_headers(image)
+        headers[CAPTURE_TIME_HEADER] = datetime.now(timezone.utc).isoformat()
+        return Response(content=frame_payload(image), media_type=RAW_MEDIA_TYPE, headers=headers)
+
+    async def capture_images_batch_raw(self, request: CaptureRawBatchRequest):
+        """Capture images from multiple cameras and return them as a ``multipart/mixed`` body.
+
+        Each part holds one camera's raw array bytes with ``X-Camera``, ``X-Image-Shape`` and ``X-Image-Dtype``
+        headers; a camera whose capture failed gets an empty part with an ``X-Capture-Error`` header.
+        """
+        from fastapi import HTTPException
+        from fastapi.responses import StreamingResponse
+
+        try:
+            manager = await self._get_camera_manager()
+            results = await manager.batch_capture(
+                request.cameras, output_format="numpy", stage=request.stage, set_name=request.set_name
+            )
+        except Exception as e:
+            self.logger.error(f"Batch raw image capture failed: {e}")
+            raise HTTPException(status_code=500, detail=f"Batch capture failed: {str(e)}")
+
+        boundary = new_boundary()
+        return StreamingResponse(
+            multipart_chunks(results, boundary), media_type=f"{MULTIPART_MEDIA_TYPE}; boundary={boundary}"
+        )
+
+    async def capture_image_shared(self, request: CaptureSharedMemoryRequest) -> SharedMemoryCaptureResponse:
+        """Capture a single image into a service-owned shared memory segment.
+
+        For clients on the same host (the HTTP route refuses other callers): the frame is copied once into the
+        camera's segment and only the segment name and frame geometry travel over HTTP. The service creates, grows
+        and unlinks the segments; clients attach to the returned ``shm_name`` read-only.
+        """
+        try:
+            image = await self._capture_array(request.camera)
+            if image is None:
+                raise HardwareOperationError(f"Camera '{request.camera}' returned no image")
+            shm_name, shape, dtype, nbytes = await asyncio.to_thread(self._shared_frames.write, request.camera, image)
+            result = SharedMemoryCaptureResult(success=True, shm_name=shm_name, shape=shape, dtype=dtype, nbytes=nbytes)
+            return SharedMemoryCaptureResponse(
+                success=True,
+                message=f"Image captured from camera '{request.camera}' into shared memory '{shm_name}'",
+                data=result,
+            )
+        except Exception as e:
+            if isinstance(e, (CameraNotFoundError, CameraTimeoutError)):
+                self.logger.warning(f"Shared memory capture from '{request.camera}' failed: {e}")
+            else:
+                self.logger.error(f"Shared memory capture from '{request.camera}' failed: {e}")
+            result = SharedMemoryCaptureResult(success=False, error=str(e))
+            return SharedMemoryCaptureResponse(success=False, message=str(e), data=result)
+
     async def capture_hdr_image(self, request: CaptureHDRRequest) -> HDRCaptureResponse:
         """Capture HDR image sequence."""
         try:
@@ -1531,6 +1675,9 @@ class CameraManagerService(Service):
                 "quality": request.quality,
                 "fps": request.fps,
             }
+            hub = self._stream_hubs.get(request.camera)
+            if hub is not None:
+                hub.configure(fps=request.fps, quality=request.quality)
 
             stream_info = StreamInfo(
                 camera=request.camera, streaming=True, stream_url=stream_url, start_time=datetime.now(timezone.utc)
@@ -1558,8 +1705,12 @@ class CameraManagerService(Service):
                 del self._active_streams[request.camera]
                 self.logger.info(f"Removed camera '{request.camera}' from active streams")
 
+            # End the MJPEG clients this worker is serving for the camera
+            hub = self._stream_hubs.pop(request.camera, None)
+            if hub is not None:
+                hub.close()
+
             # Don't require camera to be initialized for stopping streams
-            # The actual video streaming endpoint doesn't depend on _active_streams anyway
             message = f"Stream stopped for camera '{request.camera}'"
             if not was_streaming:
                 message = f"Stream was not active for camera '{request.camera}' (already stopped)"
@@ -1600,12 +1751,14 @@ class CameraManagerService(Service):
                 stream_url = stream_info["stream_url"]
                 uptime_seconds = (datetime.now(timezone.utc) - stream_info["start_time"]).total_seconds()
 
+            hub = self._stream_hubs.get(request.camera)
             stream_status = StreamStatus(
                 camera=request.camera,
                 streaming=is_streaming,
                 connected=is_connected,
                 stream_url=stream_url,
                 uptime_seconds=uptime_seconds,
+                stats=hub.stats() if hub is not None else None,
             )
 
             return StreamStatusResponse(
@@ -1632,6 +1785,9 @@ class CameraManagerService(Service):
         try:
             stopped_count = len(self._active_streams)
             self._active_streams.clear()
+            for hub in self._stream_hubs.values():
+                hub.close()
+            self._stream_hubs.clear()
 
             return BoolResponse(success=True, message=f"Stopped {stopped_count} active streams successfully", data=True)
         except Exception as e:
@@ -1669,88 +1825,31 @@ class CameraManagerService(Service):
             # Create MJPEG streaming response
             from fastapi.responses import StreamingResponse
 
-            async def generate_mjpeg_stream():
-                """Generate MJPEG stream frames."""
-                import cv2
-                import numpy as np
-
-                # Get dynamic streaming parameters
-                stream_info = self._active_streams.get(actual_camera_name, {})
-                quality = stream_info.get("quality", 85)
-                fps = stream_info.get("fps", 30)
-                frame_delay = 1.0 / fps
-
-                self.logger.info(f"Starting stream for '{actual_camera_name}' with quality={quality}, fps={fps}")
-
-                # Track consecutive timeouts for early termination
-                consecutive_timeouts = 0
-                max_consecutive_timeouts = 3
-                capture_timeout = 10.0  # 10 second timeout per frame
-
-                while True:
-                    try:
-                        # Capture frame from camera as numpy array with timeout protection
-                        frame_np = await asyncio.wait_for(
-                            camera_proxy.capture(output_format="numpy"), timeout=capture_timeout
-                        )
+            # Get dynamic streaming parameters
+            stream_info = self._active_streams.get(actual_camera_name, {})
+            quality = stream_info.get("quality", 85)
+            fps = stream_info.get("fps", 30)
 
-                        # Reset timeout counter on successful capture
-                        consecutive_timeouts = 0
-
-                        if frame_np is not None:
-                            # Captures are BGR per the CameraBackend.capture
-                            # contract — the channel order cv2.imencode expects.
-                            if frame_np.dtype != np.uint8:
-                                frame_np = (frame_np * 255).astype(np.uint8)
-
-                            # Encode as JPEG with dynamic quality (run in threadpool)
-                            success, jpeg_data = await asyncio.to_thread(
-                                cv2.imencode, ".jpg", frame_np, [cv2.IMWRITE_JPEG_QUALITY, quality]
-                            )
-
-                            if success:
-                                # Create MJPEG frame (Poseidon format)
-                                frame_data = jpeg_data.tobytes()
-                                yield (b"--frame\r\nContent-Type: image/jpeg\r\n\r\n" + frame_data + b"\r\n")
-
-                        # Control frame rate with dynamic FPS
-                        await asyncio.sleep(frame_delay)
-
-                    except asyncio.TimeoutError:
-                        consecutive_timeouts += 1
-                        self.logger.warning(
-                            f"Frame capture timeout ({consecutive_timeouts}/{max_consecutive_timeouts}) "
-                            f"for {actual_camera_name} - capture took >{capture_timeout}s. "
-                            f"Camera may have high exposure time configured."
-                        )
-
-                        if consecutive_timeouts >= max_consecutive_timeouts:
-                            self.logger.error(
-                                f"Stream terminated for '{actual_camera_name}' after {max_consecutive_timeouts} "
-                                f"consecutive timeouts. Camera exposure time may be too high (>10s). "
-                                f"Configure camera with lower exposure time for streaming."
-                            )
-                            # Send error message as final frame
-                            error_msg = (
-                                f"Stream terminated: Camera '{actual_camera_name}' capture timeout.\n"
-                                f"Exposure time may be too high. Configure camera with exposure <1000ms for streaming."
-                            )
-                            yield (b"--frame\r\nContent-Type: text/plain\r\n\r\n" + error_msg.encode() + b"\r\n")
-                            break
-
-                        # Wait before retry
-                        await asyncio.sleep(1.0)
-                        continue
-
-                    except Exception as e:
-                        self.logger.warning(f"Frame capture error for {actual_camera_name}: {e}")
-                        # Check if camera is still active, if not, stop streaming
-                        if actual_camera_name not in manager.active_cameras:
-                            self.logger.info(f"Camera '{actual_camera_name}' no longer active, stopping stream")
-                            break
-                        # Send error frame or continue
-                        await asyncio.sleep(0.1)
-                        continue
+            async def generate_mjpeg_stream():
+                """Relay the shared hub's MJPEG frames to this client."""
+                # Subscribe only once the body is being sent, so a client that disconnects earlier never leaves a
+                # subscriber behind. Clients of a camera share one producer; an idle or terminated hub is replaced
+                # so a reopened camera is captured through its current proxy.
+                hub = self._stream_hubs.get(actual_camera_name)
+                if hub is None or hub.closed or hub.subscriber_count == 0:
+                    if hub is not None:
+                        hub.close()
+                    hub = MjpegStreamHub(
+                        actual_camera_name,
+                        lambda: camera_proxy.capture(output_format="numpy"),
+                        fps=fps,
+                        quality=quality,
+                        is_active=lambda: actual_camera_name in manager.active_cameras,
+                    )
+                    self._stream_hubs[actual_camera_name] = hub
+                async with hub.subscribe() as subscription:
+                    async for part in subscription:
+                        yield part
 
             return StreamingResponse(
                 generate_mjpeg_stream(),
@@ -0,0 +1,321 @@
+"""
+Shared MJPEG streaming for CameraManagerService.
+
+A ``MjpegStreamHub`` owns a single producer task per camera that captures and JPEG-encodes each frame once and fans
+the encoded multipart part out to every connected HTTP client. Clients that fall behind lose their oldest queued
+frames instead of slowing the producer or each other, and the producer paces itself against frame deadlines so the
+capture time counts toward the frame interval.
+"""
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Optional, Set
+
+from mindtrace.core import Mindtrace
+from mindtrace.hardware.services.cameras.models import StreamStats
+
+MJPEG_BOUNDARY = b"--frame"
+
+
+def mjpeg_part(payload: bytes, content_type: str = "image/jpeg") -> bytes:
+    """Wrap a payload as one part of a ``multipart/x-mixed-replace; boundary=frame`` response."""
+    return MJPEG_BOUNDARY + b"\r\nContent-Type: " + content_type.encode() + b"\r\n\r\n" + payload + b"\r\n"
+
+
+def encode_mjpeg_part(image: Any, quality: int) -> Optional[bytes]:
+    """Convert a captured array to uint8, JPEG-encode it and wrap it as a multipart part.
+
+    Captures are BGR per the ``CameraBackend.capture`` contract — the channel order ``cv2.imencode`` expects.
+    Returns None when encoding fails.
+    """
+    import cv2
+    import numpy as np
+
+    if image.dtype != np.uint8:
+        image = (image * 255).astype(np.uint8)
+    success, jpeg_data = cv2.imencode(".jpg", image, [cv2.IMWRITE_JPEG_QUALITY, quality])
+    if not success:
+        return None
+    return mjpeg_part(jpeg_data.tobytes())
+
+
+@dataclass(frozen=True)
+class _Frame:
+    part: bytes
+    capture_started: float  # Event-loop time
+
+
+class StreamSubscription:
+    """One client's view of a ``MjpegStreamHub``.
+
+    Iterate asynchronously to receive multipart parts; iteration ends when the hub stops. Call ``close`` (or use the
+    subscription as an async context manager) when the client disconnects.
+    """
+
+    def __init__(self, hub: "MjpegStreamHub", maxsize: int):
+        self._hub = hub
+        # Unbounded so the terminal error part and end-of-stream sentinel always fit; ``_offer`` bounds the frames.
+        self._queue: asyncio.Queue[Optional[_Frame]] = asyncio.Queue()
+        self._maxsize = maxsize
+        self.frames_delivered = 0
+        self.frames_dropped = 0
+        self.closed = False
+
+    def _offer(self, item: Optional[_Frame], terminal: bool = False) -> None:
+        """Enqueue without blocking the producer, discarding the oldest queued frame when full.
+
+        Terminal items (the final error part and the end-of-stream sentinel) are always enqueued on top of the
+        ``maxsize`` frames, so a client with a one-frame buffer still receives the reason its stream ended.
+        """
+        while not terminal and self._queue.qsize() >= self._maxsize:
+            try:
+                dropped = self._queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            if dropped is not None:
+                self.frames_dropped += 1
+                self._hub._frames_dropped += 1
+        self._queue.put_nowait(item)
+
+    def __aiter__(self) -> AsyncIterator[bytes]:
+        return self
+
+    async def __anext__(self) -> bytes:
+        if self.closed:
+            raise StopAsyncIteration
+        frame = await self._queue.get()
+        if frame is None:
+            self.closed = True
+            raise StopAsyncIteration
+        self.frames_delivered += 1
+        self._hub._frame_latencies.append(asyncio.get_running_loop().time() - frame.capture_started)
+        return frame.part
+
+    def close(self) -> None:
+        """Unsubscribe from the hub; the producer stops once its last subscriber has left."""
+        self.closed = True
+        self._hub._unsubscribe(self)
+
+    async def __aenter__(self) -> "StreamSubscription":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+class MjpegStreamHub(Mindtrace):
+    """Capture, encode and fan out a camera's MJPEG stream once for all of its clients.
+
+    The producer task starts with the first subscriber and exits after the last one leaves. It terminates every
+    subscription after ``max_consecutive_timeouts`` capture timeouts (sending a final text/plain part explaining why)
+    or when a capture fails and ``is_active`` reports the camera is gone; the hub is then ``closed``.
+    """
+
+    def __init__(
+        self,
+        camera_name: str,
+        capture: Callable[[], Awaitable[Any]],
+        *,
+        fps: float = 30,
+        quality: int = 85,
+        is_active: Optional[Callable[[], bool]] = None,
+        subscriber_queue_size: int = 2,
+        capture_timeout: float = 10.0,
+        max_consecutive_timeouts: int = 3,
+        stats_window: int = 60,
+        **kwargs,
+    ):
+        """Initialize the hub.
+
+        Args:
+            camera_name: Camera name, used in log and error messages.
+            capture: Coroutine function returning the next frame as a numpy array (or None to skip the frame).
+            fps: Target frame rate.
+            quality: JPEG quality (1-100).
+            is_active: Returns whether the camera is still open; consulted after a capture error.
+            subscriber_queue_size: Frames buffered per client before the oldest is dropped.
+            capture_timeout: Seconds to wait for a single capture.
+            max_consecutive_timeouts: Capture timeouts in a row that end the stream.
+            stats_window: Number of recent frames the fps and latency statistics are computed over.
+            **kwargs: Additional Mindtrace initialization parameters.
+        """
+        super().__init__(**kwargs)
+        if subscriber_queue_size < 1:
+            raise ValueError("subscriber_queue_size must be at least 1")
+        self.camera_name = camera_name
+        self._capture = capture
+        self._is_active = is_active
+        self.fps = fps
+        self.quality = quality
+        self.subscriber_queue_size = subscriber_queue_size
+        self.capture_timeout = capture_timeout
+        self.max_consecutive_timeouts = max_consecutive_timeouts
+        self.closed = False
+
+        self._subscribers: Set[StreamSubscription] = set()
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self._frames_published = 0
+        self._frames_dropped = 0
+        self._publish_times: Deque[float] = deque(maxlen=stats_window)
+        self._capture_latencies: Deque[float] = deque(maxlen=stats_window)
+        self._encode_latencies: Deque[float] = deque(maxlen=stats_window)
+        self._frame_latencies: Deque[float] = deque(maxlen=stats_window)
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def configure(self, fps: Optional[float] = None, quality: Optional[int] = None) -> None:
+        """Change the target frame rate or JPEG quality; a running producer picks them up on its next frame."""
+        if fps is not None:
+            self.fps = fps
+        if quality is not None:
+            self.quality = quality
+
+    def subscribe(self) -> StreamSubscription:
+        """Register a client and start the producer if it is not already running."""
+        if self.closed:
+            raise RuntimeError(f"Stream hub for '{self.camera_name}' is closed")
+        self._loop = asyncio.get_running_loop()
+        subscription = StreamSubscription(self, self.subscriber_queue_size)
+        self._subscribers.add(subscription)
+        if not self.running:
+            self._task = asyncio.create_task(self._produce(), name=f"mjpeg-stream:{self.camera_name}")
+        return subscription
+
+    def _unsubscribe(self, subscription: StreamSubscription) -> None:
+        self._subscribers.discard(subscription)
+
+    def close(self) -> None:
+        """Stop the producer and end every subscription.
+
+        Safe to call from any thread: synchronous endpoints run in FastAPI's threadpool, so the shutdown is handed to
+        the event loop the subscriptions live on.
+        """
+        self.closed = True
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            in_loop = asyncio.get_running_loop() is loop
+        except RuntimeError:
+            in_loop = False
+        if in_loop:
+            self._shutdown()
+        else:
+            loop.call_soon_threadsafe(self._shutdown)
+
+    def _shutdown(self) -> None:
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        self._end_subscriptions()
+
+    def _end_subscriptions(self, final_part: Optional[bytes] = None) -> None:
+        subscribers = list(self._subscribers)
+        self._subscribers.clear()
+        for subscription in subscribers:
+            if final_part is not None:
+                subscription._offer(_Frame(final_part, self._loop.time()), terminal=True)
+            subscription._offer(None, terminal=True)
+
+    def _publish(self, frame: _Frame) -> None:
+        for subscription in list(self._subscribers):
+            subscription._offer(frame)
+
+    async def _produce(self) -> None:
+        loop = asyncio.get_running_loop()
+        consecutive_timeouts = 0
+        next_deadline = loop.time()
+        self.logger.info(f"Starting stream for '{self.camera_name}' with quality={self.quality}, fps={self.fps}")
+
+        while self._subscribers:
+            capture_started = loop.time()
+            try:
+                image = await asyncio.wait_for(self._capture(), timeout=self.capture_timeout)
+            except asyncio.TimeoutError:
+                consecutive_timeouts += 1
+                self.logger.warning(
+                    f"Frame capture timeout ({consecutive_timeouts}/{self.max_consecutive_timeouts}) "
+                    f"for {self.camera_name} - capture took >{self.capture_timeout}s. "
+                    f"Camera may have high exposure time configured."
+                )
+                if consecutive_timeouts >= self.max_consecutive_timeouts:
+                    self.logger.error(
+                        f"Stream terminated for '{self.camera_name}' after {self.max_consecutive_timeouts} "
+                        f"consecutive timeouts. Camera exposure time may be too high (>{self.capture_timeout}s). "
+                        f"Configure camera with lower exposure time for streaming."
+                    )
+                    error_msg = (
+                        f"Stream terminated: Camera '{self.camera_name}' capture timeout.\n"
+                        f"Exposure time may be too high. Configure camera with exposure <1000ms for streaming."
+                    )
+                    self.closed = True
+                    self._end_subscriptions(mjpeg_part(error_msg.encode(), "text/plain"))
+                    return
+                # Wait before retry
+                await asyncio.sleep(1.0)
+                next_deadline = loop.time()
+                continue
+            except Exception as e:
+                self.logger.warning(f"Frame capture error for {self.camera_name}: {e}")
+                if self._is_active is not None and not self._is_active():
+                    self.logger.info(f"Camera '{self.camera_name}' no longer active, stopping stream")
+                    self.closed = True
+                    self._end_subscriptions()
+                    return
+                await asyncio.sleep(0.1)
+                next_deadline = loop.time()
+                continue
+
+            consecutive_timeouts = 0
+            captured = loop.time()
+            self._capture_latencies.append(captured - capture_started)
+
+            if image is not None:
+                part = await asyncio.to_thread(encode_mjpeg_part, image, self.quality)
+                if part is not None:
+                    published = loop.time()
+                    self._encode_latencies.append(published - captured)
+                    self._publish_times.append(published)
+                    self._frames_published += 1
+                    self._publish(_Frame(part, capture_started))
+
+            # Pace against deadlines so capture and encode time count toward the frame interval. When a frame
+            # overruns its slot the schedule restarts from now instead of bursting to catch up.
+            next_deadline += 1.0 / self.fps
+            delay = next_deadline - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            else:
+                next_deadline = loop.time()
+
+    def stats(self) -> StreamStats:
+        """Return fps and latency statistics over the recent frame window."""
+
+        def mean_ms(samples: Deque[float]) -> float:
+            return 1000.0 * sum(samples) / len(samples) if samples else 0.0
+
+        fps = 0.0
+        if len(self._publish_times) > 1:
+            span = self._publish_times[-1] - self._publish_times[0]
+            if span > 0:
+                fps = (len(self._publish_times) - 1) / span
+
+        return StreamStats(
+            subscribers=self.subscriber_count,
+            target_fps=self.fps,
+            fps=fps,
+            quality=self.quality,
+            frames_published=self._frames_published,
+            frames_dropped=self._frames_dropped,
+            capture_latency_ms=mean_ms(self._capture_latencies),
+            encode_latency_ms=mean_ms(self._encode_latencies),
+            frame_latency_ms=mean_ms(self._frame_latencies),
+        )
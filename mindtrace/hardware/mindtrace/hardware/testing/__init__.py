@@ -22,12 +22,14 @@ def register_benchmark_suites(*, runner: TestRunner | None = None, replace: bool
         HardwareCameraServiceCaptureSmokeSuite,
         HardwareCameraServiceCaptureStressSuite,
     )
+    from mindtrace.hardware.testing.suites.camera_transport import HardwareCameraTransportSuite
 
     for cls in (
         HardwareCameraManagerCaptureSmokeSuite,
         HardwareCameraManagerCaptureStressSuite,
         HardwareCameraServiceCaptureSmokeSuite,
         HardwareCameraServiceCaptureStressSuite,
+        HardwareCameraTransportSuite,
     ):
         if replace or cls.suite_id not in target.registered_suites():
             target.register_test_suite(cls, replace=replace)
@@ -0,0 +1,223 @@
+"""CameraManagerService capture transport benchmark: base64 JSON vs. raw bytes vs. shared memory."""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import io
+import time
+from types import MappingProxyType
+from typing import Any, Literal
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+from mindtrace.core import BenchReporter, BenchResult, BenchResultSchema, BenchSuiteConfig, BenchTestSuite, TaskSchema
+from mindtrace.hardware.services.cameras.models import CameraOpenBatchRequest
+from mindtrace.hardware.services.cameras.service import CameraManagerService
+from mindtrace.hardware.services.cameras.transport import (
+    attach_shared_memory,
+    boundary_from_content_type,
+    decode_frame,
+    detach_shared_memory,
+    parse_multipart_frames,
+    read_shared_frame,
+)
+from mindtrace.hardware.testing.suites._camera_common import (
+    DEFAULT_MOCK_CAMERAS,
+    HardwareCameraServiceResources,
+    camera_names_from_config,
+    make_result,
+)
+
+TransportMode = Literal["json", "json_batch", "raw", "raw_batch", "shared"]
+TRANSPORT_MODES: tuple[str, ...] = ("json", "json_batch", "raw", "raw_batch", "shared")
+
+
+class HardwareCameraTransportInput(BaseModel):
+    cameras: list[str] = Field(
+        default_factory=lambda: list(DEFAULT_MOCK_CAMERAS),
+        description="Camera names to open and capture from. Mock camera names are valid defaults.",
+    )
+    include_mocks: bool = Field(True, description="Whether discovery/open should include mock cameras.")
+    modes: list[TransportMode] = Field(
+        default_factory=lambda: list(TRANSPORT_MODES),
+        description="'json' / 'json_batch' use /cameras/capture[/batch] with base64 images; 'raw' / 'raw_batch' "
+        "the octet-stream and multipart endpoints; 'shared' writes into a client-owned shared memory segment "
+        "(in-process service or a service on this host only).",
+    )
+    json_format: Literal["png", "jpeg", "bmp"] = Field("png", description="Wire encoding of the JSON modes.")
+    iterations: int = Field(20, ge=1, description="Captures per mode.")
+
+
+class HardwareCameraTransportSuite(BenchTestSuite):
+    suite_id = "hardware.stress.camera_capture_transport"
+    title = "Hardware stress — CameraManagerService capture transport"
+    description = (
+        "Captures from the configured cameras through CameraManagerService over HTTP (the in-process app via "
+        "httpx's ASGI transport unless a service_url is given) with each transport mode, decoding every response "
+        "to a numpy array the way a client would. Reports per-mode latency and bytes on the wire; decoded frames "
+        "of each mode must match the first mode's shape."
+    )
+    tags = frozenset({"stress", "hardware", "camera", "service"})
+    requires = ("camera_service",)
+    safety = "Defaults to mock cameras and in-process service; physical cameras are touched only when explicitly named."
+    task_schema = TaskSchema(name=suite_id, input_schema=HardwareCameraTransportInput, output_schema=BenchResultSchema)
+    resource_schema = HardwareCameraServiceResources
+    profiles = MappingProxyType(
+        {
+            "smoke": {"duration_seconds": 30.0, "cameras": ["MockBasler:mock_basler_1"], "iterations": 2},
+            "stress": {
+                "duration_seconds": 120.0,
+                "cameras": ["MockBasler:mock_basler_1", "MockBasler:mock_basler_2"],
+                "iterations": 20,
+            },
+        }
+    )
+
+    def execute_bench(self, config: BenchSuiteConfig, reporter: BenchReporter) -> BenchResult:
+        return asyncio.run(self._run(config, reporter))
+
+    async def _run(self, config: BenchSuiteConfig, reporter: BenchReporter) -> BenchResult:
+        import httpx
+
+        started = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        monotonic_start = time.perf_counter()
+        cameras = camera_names_from_config(config)
+        modes = [str(mode).lower() for mode in config.parameters.get("modes") or TRANSPORT_MODES]
+        json_format = str(config.parameters.get("json_format", "png")).lower()
+        iterations = int(config.parameters.get("iterations", 20))
+        service_url = config.resources.get("service_url")
+        deadline = reporter.deadline(config.duration_seconds)
+
+        owned_service: CameraManagerService | None = None
+        if service_url:
+            client = httpx.AsyncClient(base_url=str(service_url), timeout=120.0)
+        else:
+            owned_service = CameraManagerService(include_mocks=bool(config.parameters.get("include_mocks", True)))
+            client = httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=owned_service.app), base_url="http://camera-service", timeout=120.0
+            )
+        segments: dict[str, Any] = {}
+        mode_metrics: dict[str, Any] = {}
+        reference_shapes: dict[str, tuple[int, ...]] | None = None
+
+        async def capture(mode: str) -> tuple[dict[str, np.ndarray], int]:
+            if mode == "json":
+                frames, wire = {}, 0
+                for camera in cameras:
+                    response = await _post(client, "/cameras/capture", camera=camera, output_format=json_format)
+                    wire += len(response.content)
+                    frames[camera] = _decode_json_image(response.json()["data"])
+                return frames, wire
+            if mode == "json_batch":
+                response = await _post(client, "/cameras/capture/batch", cameras=cameras, output_format=json_format)
+                data = response.json()["data"]
+                return {camera: _decode_json_image(data[camera]) for camera in cameras}, len(response.content)
+            if mode == "raw":
+                frames, wire = {}, 0
+                for camera in cameras:
+                    response = await _post(client, "/cameras/capture/raw", camera=camera)
+                    wire += len(response.content)
+                    frames[camera] = decode_frame(response.headers, response.content)
+                return frames, wire
+            if mode == "raw_batch":
+                response = await _post(client, "/cameras/capture/batch/raw", cameras=cameras)
+                parsed = parse_multipart_frames(
+                    response.content, boundary_from_content_type(response.headers["content-type"])
+                )
+                for camera, frame in parsed.items():
+                    if not isinstance(frame, np.ndarray):
+                        raise frame
+                return parsed, len(response.content)
+            if mode == "shared":
+                frames, wire = {}, 0
+                for camera in cameras:
+                    response = await _post(client, "/cameras/capture/shared", camera=camera)
+                    result = response.json()["data"]
+                    if not result["success"]:
+                        raise RuntimeError(result["error"])
+                    segment = segments.get(camera)
+                    if segment is None or segment.name != result["shm_name"]:
+                        if segment is not None:
+                            detach_shared_memory(segment)
+                        segment = segments[camera] = attach_shared_memory(result["shm_name"])
+                    wire += len(response.content)
+                    # Copy out so the timing includes getting pixels the caller may keep.
+                    frames[camera] = read_shared_frame(segment, result["shape"], result["dtype"]).copy()
+                return frames, wire
+            raise ValueError(f"Unknown transport mode '{mode}'")
+
+        try:
+            await _post(
+                client,
+                "/cameras/open/batch",
+                **CameraOpenBatchRequest(cameras=cameras, test_connection=False).model_dump(),
+            )
+            for mode in modes:
+                latencies: list[float] = []
+                wire_bytes = 0
+                while len(latencies) < iterations and time.perf_counter() < deadline and not reporter.is_cancelled():
+                    op_start = time.perf_counter()
+                    try:
+                        frames, wire = await capture(mode)
+                        latency = time.perf_counter() - op_start
+                        shapes = {camera: frame.shape for camera, frame in frames.items()}
+                        if reference_shapes is None:
+                            reference_shapes = shapes
+                        elif shapes != reference_shapes:
+                            raise ValueError(f"{mode} frame shapes {shapes} differ from {reference_shapes}")
+                    except Exception as exc:  # noqa: BLE001 - benchmark records failures and moves on
+                        reporter.record_operation(
+                            success=False, latency_seconds=time.perf_counter() - op_start, error=exc, mode=mode
+                        )
+                        break
+                    reporter.record_operation(success=True, latency_seconds=latency, bytes_processed=wire, mode=mode)
+                    latencies.append(latency)
+                    wire_bytes += wire
+                mode_metrics[f"{mode}_captures"] = len(latencies)
+                mode_metrics[f"{mode}_mean_latency_seconds"] = sum(latencies) / len(latencies) if latencies else 0.0
+                mode_metrics[f"{mode}_min_latency_seconds"] = min(latencies, default=0.0)
+                mode_metrics[f"{mode}_wire_bytes_per_capture"] = wire_bytes // len(latencies) if latencies else 0
+        finally:
+            for segment in segments.values():
+                detach_shared_memory(segment)
+            try:
+                await client.post("/cameras/close/all", json={})
+            except Exception:  # noqa: BLE001 - best-effort cleanup
+                pass
+            await client.aclose()
+            if owned_service is not None:
+                await owned_service.shutdown_cleanup()
+
+        return make_result(
+            config=config,
+            reporter=reporter,
+            started=started,
+            monotonic_start=monotonic_start,
+            cameras=cameras,
+            mode="camera_capture_transport",
+            extra_metrics={
+                **mode_metrics,
+                "modes": modes,
+                "json_format": json_format,
+                "iterations": iterations,
+                "frame_shapes": {camera: list(shape) for camera, shape in (reference_shapes or {}).items()},
+                "service_url": str(service_url) if service_url else None,
+            },
+        )
+
+
+async def _post(client: Any, endpoint: str, **payload: Any) -> Any:
+    response = await client.post(endpoint, json=payload)
+    response.raise_for_status()
+    return response
+
+
+def _decode_json_image(result: dict[str, Any]) -> np.ndarray:
+    """Decode a base64 ``CaptureResult.image_data`` to an RGB array, as a JSON client has to."""
+    from PIL import Image
+
+    if not result.get("success") or not result.get("image_data"):
+        raise RuntimeError(result.get("error") or "capture returned no image")
+    return np.asarray(Image.open(io.BytesIO(base64.b64decode(result["image_data"]))))
@@ -3,12 +3,14 @@ from mindtrace.jobs.core.orchestrator import Orchestrator
 from mindtrace.jobs.local.client import LocalClient
 from mindtrace.jobs.local.consumer_backend import LocalConsumerBackend
 from mindtrace.jobs.local.fifo_queue import LocalQueue
+from mindtrace.jobs.local.journal import JournaledQueue, LocalJournal
 from mindtrace.jobs.local.priority_queue import LocalPriorityQueue
 from mindtrace.jobs.local.stack import LocalStack
 from mindtrace.jobs.rabbitmq.client import RabbitMQClient
 from mindtrace.jobs.rabbitmq.consumer_backend import RabbitMQConsumerBackend
 from mindtrace.jobs.redis.client import RedisClient
 from mindtrace.jobs.redis.consumer_backend import RedisConsumerBackend
+from mindtrace.jobs.redis.consumer_runtime import QueueConsumerStats, RedisConsumerRuntime
 from mindtrace.jobs.types.job_specs import BackendType, ExecutionStatus, Job, JobSchema
 from mindtrace.jobs.utils.schemas import job_from_schema
 
@@ -17,7 +19,9 @@ __all__ = [
     "Consumer",
     "ExecutionStatus",
     "Job",
+    "JournaledQueue",
     "LocalClient",
+    "LocalJournal",
     "LocalPriorityQueue",
     "LocalQueue",
     "LocalStack",
@@ -30,5 +34,7 @@ __all__ = [
     "job_from_schema",
     "LocalConsumerBackend",
     "RedisConsumerBackend",
+    "RedisConsumerRuntime",
+    "QueueConsumerStats",
     "RabbitMQConsumerBackend",
 ]
@@ -40,30 +40,34 @@ class Consumer(Mindtrace):
             backend_args["cls"], consumer_frontend=self, **backend_args["kwargs"], queue_name=queue_name
         )
 
-    def consume(self, num_messages: int = 0, queues: str | list[str] | None = None, block: bool = True) -> None:
+    def consume(
+        self, num_messages: int = 0, queues: str | list[str] | None = None, block: bool = True, **kwargs
+    ) -> None:
         """Consume messages from the queue.
 
         Args:
             num_messages: Number of messages to process. If 0, runs indefinitely.
             queues: Queue(s) to consume from. If None, uses the consumer's default queue.
             block: Whether to block when no messages are available.
+            **kwargs: Backend-specific options, e.g. ``concurrency``, ``worker_type`` and ``prefetch`` for Redis.
         """
         if not self.consumer_backend:
             raise RuntimeError("Consumer not connected. Call connect() first.")
 
-        self.consumer_backend.consume(num_messages, queues=queues, block=block)
+        self.consumer_backend.consume(num_messages, queues=queues, block=block, **kwargs)
 
-    def consume_until_empty(self, queues: str | list[str] | None = None, block: bool = True) -> None:
+    def consume_until_empty(self, queues: str | list[str] | None = None, block: bool = True, **kwargs) -> None:
         """Consume messages until all specified queues are empty.
 
         Args:
             queues: Queue(s) to consume from. If None, uses the consumer's default queue.
             block: Whether to block when no messages are available.
+            **kwargs: Backend-specific options, as for :meth:`consume`.
         """
         if not self.consumer_backend:
             raise RuntimeError("Consumer not connected. Call connect() first.")
 
-        self.consumer_backend.consume_until_empty(queues=queues, block=block)
+        self.consumer_backend.consume_until_empty(queues=queues, block=block, **kwargs)
 
     @abstractmethod
     def run(self, job_dict: dict) -> dict:
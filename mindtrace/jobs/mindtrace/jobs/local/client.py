@@ -2,7 +2,8 @@ import json
 import threading
 import uuid
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Optional, Union
+from queue import Empty
+from typing import TYPE_CHECKING, Any, Literal, Optional, Union
 
 import pydantic
 
@@ -10,6 +11,7 @@ from mindtrace.core import ifnone
 from mindtrace.jobs.base.orchestrator_backend import OrchestratorBackend
 from mindtrace.jobs.local.consumer_backend import LocalConsumerBackend
 from mindtrace.jobs.local.fifo_queue import LocalQueue
+from mindtrace.jobs.local.journal import LocalJournal
 from mindtrace.jobs.local.priority_queue import LocalPriorityQueue
 from mindtrace.jobs.local.stack import LocalStack
 from mindtrace.registry import Registry
@@ -26,6 +28,11 @@ class LocalClient(OrchestratorBackend):
 
     The client maintains a registry of declared queues and a store for job results. Queues are stored in a registry.
     Job results can be stored to a separate internal registry as well.
+
+    Two queue engines are available. The default ``"registry"`` engine stores every queue as a single registry object,
+    which is rewritten in full on every publish and pop. The ``"journal"`` engine stores each queue as an append-only
+    segment log (see :class:`~mindtrace.jobs.local.journal.JournaledQueue`), making publish, pop and count O(1)
+    regardless of queue length.
     """
 
     def __init__(
@@ -33,6 +40,8 @@ class LocalClient(OrchestratorBackend):
         client_dir: str | Path | None = None,
         broker_id: str | None = None,
         backend: Registry | None = None,
+        queue_engine: Literal["registry", "journal"] = "registry",
+        journal_options: dict[str, Any] | None = None,
     ):
         """
         Initialize the LocalClient.
@@ -40,22 +49,42 @@ class LocalClient(OrchestratorBackend):
         Args:
             client_dir: The directory to store the client. If None, uses the default from config.
             broker_id: The ID of the broker.
-            backend: The backend to use for storage. If None, uses the default from config.
+            backend: The backend to use for storage. If None, uses the default from config. Only supported by the
+                ``"registry"`` queue engine.
+            queue_engine: ``"registry"`` to store queues as registry objects, or ``"journal"`` to store them as
+                append-only segment logs under ``client_dir / "journal"``.
+            journal_options: Keyword arguments forwarded to each journaled queue (e.g. ``fsync_every``,
+                ``segment_max_bytes``). Only used by the ``"journal"`` queue engine.
+
+        Raises:
+            ValueError: If ``queue_engine`` is unknown, or if a ``backend`` is given with the ``"journal"`` engine.
         """
         super().__init__()
         self.broker_id = ifnone(broker_id, default="mindtrace.default_broker")
+        if queue_engine not in ("registry", "journal"):
+            raise ValueError(f"Unknown queue engine '{queue_engine}'. Expected 'registry' or 'journal'.")
+        if queue_engine == "journal" and backend is not None:
+            raise ValueError("The 'journal' queue engine stores queues under client_dir and cannot use a backend.")
+        self.queue_engine = queue_engine
 
         # Preserve client_dir for job results even when backend is provided
         if client_dir is not None:
             client_dir = Path(client_dir).expanduser().resolve()
 
-        if backend is None:
+        if queue_engine == "journal":
             if client_dir is None:
                 client_dir = self.config["MINDTRACE_DIR_PATHS"]["ORCHESTRATOR_LOCAL_CLIENT_DIR"]
                 client_dir = Path(client_dir).expanduser().resolve()
-            backend = Registry(backend=client_dir, mutable=True)
-
-        self.queues: Registry[str, LocalJobQueue] = backend
+            self.queues: Registry[str, LocalJobQueue] | LocalJournal = LocalJournal(
+                client_dir / "journal", **(journal_options or {})
+            )
+        else:
+            if backend is None:
+                if client_dir is None:
+                    client_dir = self.config["MINDTRACE_DIR_PATHS"]["ORCHESTRATOR_LOCAL_CLIENT_DIR"]
+                    client_dir = Path(client_dir).expanduser().resolve()
+                backend = Registry(backend=client_dir, mutable=True)
+            self.queues = backend
         self._lock = threading.Lock()
 
         # Co-locate job results with the selected client directory when available
@@ -75,6 +104,10 @@ class LocalClient(OrchestratorBackend):
 
     def declare_queue(self, queue_name: str, queue_type: str = "fifo", **kwargs) -> dict[str, str]:
         """Declare a queue of type 'fifo', 'stack', or 'priority'."""
+        if isinstance(self.queues, LocalJournal):
+            if not self.queues.declare(queue_name, queue_type):
+                return {"status": "success", "message": f"Queue '{queue_name}' already exists."}
+            return {"status": "success", "message": f"Queue '{queue_name}' declared successfully."}
         if queue_name in self.queues:
             return {
                 "status": "success",
@@ -111,6 +144,12 @@ class LocalClient(OrchestratorBackend):
         if "job_id" not in message_dict or message_dict["job_id"] is None:
             message_dict["job_id"] = str(uuid.uuid1())
         body = json.dumps(message_dict)
+        if isinstance(self.queues, LocalJournal):
+            if queue_instance.queue_type == "priority" and priority is not None:
+                queue_instance.push(item=body, priority=priority)
+            else:
+                queue_instance.push(item=body)
+            return message_dict["job_id"]
         if isinstance(queue_instance, LocalPriorityQueue) and priority is not None:
             queue_instance.push(item=body, priority=priority)
         else:
@@ -130,6 +169,18 @@ class LocalClient(OrchestratorBackend):
         """
         block = kwargs.get("block", True)
         timeout = kwargs.get("timeout", None)
+        if isinstance(self.queues, LocalJournal):
+            queue_instance = self.queues.get(queue_name)
+            try:
+                raw_message = queue_instance.pop(block=block, timeout=timeout)
+            except Empty:
+                self.logger.debug(f"Queue '{queue_name}' is empty.")
+                return None
+            try:
+                return json.loads(raw_message)
+            except Exception as e:
+                self.logger.warning(f"Error decoding message from queue '{queue_name}': {e}")
+                return None
         queue_instance: LocalJobQueue = self.queues.load(queue_name)
         try:
             raw_message = queue_instance.pop(block=block, timeout=timeout)
@@ -145,6 +196,9 @@ class LocalClient(OrchestratorBackend):
 
     def clean_queue(self, queue_name: str, **kwargs) -> dict[str, str]:
         """Remove all messages from the specified queue."""
+        if isinstance(self.queues, LocalJournal):
+            self.queues.get(queue_name).clean()
+            return {"status": "success", "message": f"Cleaned queue '{queue_name}'."}
         queue_instance: LocalJobQueue = self.queues.load(queue_name)
         queue_instance.clean()
         self.queues.save(queue_name, queue_instance, on_conflict=OnConflict.OVERWRITE)
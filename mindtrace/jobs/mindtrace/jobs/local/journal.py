@@ -0,0 +1,645 @@
+"""Append-only journaled queue engine for the local job backend.
+
+Each queue lives in its own directory as a sequence of append-only segment files. A publish appends a ``PUSH`` record
+and a pop appends a ``POP`` tombstone, so both cost O(1) disk work regardless of how many messages are queued. An
+in-memory index, rebuilt from the segments when a queue is opened and tailed incrementally afterwards, maps live
+sequence numbers to payload offsets. Segments whose messages have all been consumed are dropped from the front of the
+log, and when tombstones dominate the log it is compacted into a single snapshot segment.
+
+Every record is flushed to the OS as soon as it is written, so a process crash never loses acknowledged records;
+``fsync`` calls are batched (see ``fsync_every`` / ``fsync_interval``) to bound what a power failure can lose. Torn or
+corrupt records at the tail of a segment are truncated on recovery.
+
+Multiple processes may share one journal directory: operations are serialized with an advisory file lock and each
+process catches up on records appended by others before serving a request.
+"""
+
+from __future__ import annotations
+
+import heapq
+import json
+import os
+import platform
+import struct
+import threading
+import time
+import zlib
+from collections import deque
+from pathlib import Path
+from queue import Empty
+from typing import Literal
+from urllib.parse import quote
+
+if platform.system() == "Windows":  # pragma: no cover - advisory locks are POSIX-only
+    fcntl = None
+else:
+    import fcntl
+
+from mindtrace.core import Mindtrace
+
+QueueType = Literal["fifo", "stack", "priority"]
+
+_OP_PUSH = 1
+_OP_POP = 2
+_OP_CLEAR = 3
+
+# crc32, op, seq, priority, payload length
+_HEADER = struct.Struct("<IBQqI")
+_SEGMENT_PREFIX = "segment-"
+_SEGMENT_SUFFIX = ".log"
+_COMPACT_SUFFIX = ".compact"
+_QUEUE_META_FILE = "queue.json"
+_LOCK_FILE = "LOCK"
+
+
+def _segment_name(segment_id: int) -> str:
+    return f"{_SEGMENT_PREFIX}{segment_id:012d}{_SEGMENT_SUFFIX}"
+
+
+def _encode_record(op: int, seq: int, priority: int = 0, payload: bytes = b"") -> bytes:
+    body = _HEADER.pack(0, op, seq, priority, len(payload))[4:] + payload
+    return struct.pack("<I", zlib.crc32(body)) + body
+
+
+def _fsync_dir(path: Path) -> None:
+    if fcntl is None:  # pragma: no cover - directories cannot be fsynced on Windows
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class JournaledQueue(Mindtrace):
+    """A durable fifo, stack or priority queue stored as an append-only segment log.
+
+    ``push``/``pop`` are O(1) for fifo and stack queues and O(log n) for priority queues, and ``qsize`` is O(1). Items
+    are strings; higher ``priority`` values are popped first and equal priorities are served in publish order.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        queue_type: QueueType = "fifo",
+        *,
+        segment_max_bytes: int = 8 * 1024 * 1024,
+        fsync_every: int = 256,
+        fsync_interval: float = 1.0,
+        compact_min_records: int = 10_000,
+        poll_interval: float = 0.05,
+        **kwargs,
+    ):
+        """Open (or create) a journaled queue.
+
+        Args:
+            path: Directory holding the queue's segment files.
+            queue_type: One of ``"fifo"``, ``"stack"`` or ``"priority"``.
+            segment_max_bytes: Size after which the active segment is sealed and a new one is started.
+            fsync_every: Number of records written between ``fsync`` calls. ``1`` syncs every record, ``0`` only syncs
+                on ``flush``/``close`` and when ``fsync_interval`` elapses.
+            fsync_interval: Maximum number of seconds between ``fsync`` calls while records are being written.
+            compact_min_records: Minimum number of dead records before the log is rewritten into a snapshot segment.
+            poll_interval: Seconds between checks for records appended by other processes while a pop blocks.
+        """
+        super().__init__(**kwargs)
+        if queue_type not in ("fifo", "stack", "priority"):
+            raise TypeError(f"Unknown queue type '{queue_type}'.")
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._dir = str(self.path)
+        self.queue_type = queue_type
+        self.segment_max_bytes = segment_max_bytes
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+        self.compact_min_records = compact_min_records
+        self.poll_interval = poll_interval
+
+        self._lock = threading.RLock()
+        self._not_empty = threading.Condition(self._lock)
+        self._lock_file = open(self.path / _LOCK_FILE, "a+b")
+        self._writer = None
+        self._writer_segment: int | None = None
+        self._readers: dict[int, object] = {}
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        self._closed = False
+
+        with self._locked():
+            self._reload()
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Public API
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def push(self, item: str, priority: int = 0) -> int:
+        """Append an item to the queue and return its sequence number."""
+        payload = item.encode("utf-8")
+        with self._locked():
+            seq = self._next_seq
+            segment_id, offset = self._append(_encode_record(_OP_PUSH, seq, int(priority), payload))
+            self._index_push(seq, segment_id, offset + _HEADER.size, len(payload), int(priority))
+            self._next_seq = seq + 1
+            self._not_empty.notify()
+            return seq
+
+    def pop(self, block: bool = True, timeout: float | None = None) -> str:
+        """Remove and return the next item.
+
+        Args:
+            block: If True, wait until an item is available.
+            timeout: Maximum number of seconds to wait when blocking. ``None`` waits indefinitely.
+
+        Raises:
+            queue.Empty: If no item is available (immediately when non-blocking, or once the timeout expires).
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._locked():
+            while True:
+                seq = self._peek()
+                if seq is not None:
+                    break
+                if not block:
+                    raise Empty
+                wait = self.poll_interval
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise Empty
+                    wait = min(wait, remaining)
+                self._release_file_lock()
+                try:
+                    self._not_empty.wait(wait)
+                finally:
+                    self._acquire_file_lock()
+                self._catch_up()
+
+            segment_id, offset, length, _ = self._entries[seq]
+            payload = self._read_payload(segment_id, offset, length)
+            self._append(_encode_record(_OP_POP, seq))
+            self._index_pop(seq)
+            self._maybe_compact()
+            return payload.decode("utf-8")
+
+    def qsize(self) -> int:
+        """Return the number of messages currently in the queue."""
+        with self._locked():
+            return len(self._entries)
+
+    def empty(self) -> bool:
+        """Return True if the queue holds no messages."""
+        return self.qsize() == 0
+
+    def clean(self) -> int:
+        """Remove all messages and return how many were removed."""
+        with self._locked():
+            count = len(self._entries)
+            self._append(_encode_record(_OP_CLEAR, self._next_seq))
+            self._sync()
+            self._clear_index()
+            self._drop_dead_segments()
+            return count
+
+    def compact(self) -> None:
+        """Rewrite the live messages into a single snapshot segment and drop all older segments."""
+        with self._locked():
+            self._compact()
+
+    def flush(self) -> None:
+        """Force all written records to stable storage."""
+        with self._lock:
+            self._sync()
+
+    def close(self) -> None:
+        """Sync outstanding records and release file handles."""
+        with self._lock:
+            if self._closed:
+                return
+            self._sync()
+            self._close_writer()
+            self._close_readers()
+            self._lock_file.close()
+            self._closed = True
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Locking
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def _locked(self):
+        return _JournalLock(self)
+
+    def _acquire_file_lock(self) -> None:
+        if fcntl is not None:
+            fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_EX)
+
+    def _release_file_lock(self) -> None:
+        if fcntl is not None:
+            fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_UN)
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Index
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def _reset_index(self) -> None:
+        # seq -> (segment id, payload offset, payload length, priority)
+        self._entries: dict[int, tuple[int, int, int, int]] = {}
+        self._order: deque[int] | list[tuple[int, int]] = [] if self.queue_type == "priority" else deque()
+        self._segment_live: dict[int, int] = {}
+        self._segment_records: dict[int, int] = {}
+
+    def _clear_index(self) -> None:
+        """Forget every live message while keeping track of the (now dead) segments still on disk."""
+        self._entries = {}
+        self._order = [] if self.queue_type == "priority" else deque()
+        self._segment_live = dict.fromkeys(self._segment_live, 0)
+
+    def _index_push(self, seq: int, segment_id: int, offset: int, length: int, priority: int) -> None:
+        self._entries[seq] = (segment_id, offset, length, priority)
+        if self.queue_type == "priority":
+            heapq.heappush(self._order, (-priority, seq))
+        else:
+            self._order.append(seq)
+        self._segment_live[segment_id] = self._segment_live.get(segment_id, 0) + 1
+
+    def _index_pop(self, seq: int) -> None:
+        entry = self._entries.pop(seq, None)
+        if entry is not None:
+            self._segment_live[entry[0]] -= 1
+
+    def _peek(self) -> int | None:
+        """Return the next live sequence number, lazily discarding entries popped elsewhere."""
+        order = self._order
+        if self.queue_type == "priority":
+            while order and order[0][1] not in self._entries:
+                heapq.heappop(order)
+            return order[0][1] if order else None
+        if self.queue_type == "stack":
+            while order and order[-1] not in self._entries:
+                order.pop()
+            return order[-1] if order else None
+        while order and order[0] not in self._entries:
+            order.popleft()
+        return order[0] if order else None
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Segment I/O
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def _segment_path(self, segment_id: int) -> str:
+        # Plain strings keep path construction off the per-operation hot path.
+        return os.path.join(self._dir, _segment_name(segment_id))
+
+    def _unlink_segment(self, segment_id: int) -> None:
+        reader = self._readers.pop(segment_id, None)
+        if reader is not None:
+            reader.close()
+        try:
+            os.unlink(self._segment_path(segment_id))
+        except FileNotFoundError:
+            pass
+
+    def _segment_ids(self) -> list[int]:
+        ids = []
+        for entry in os.scandir(self.path):
+            name = entry.name
+            if name.startswith(_SEGMENT_PREFIX) and name.endswith(_SEGMENT_SUFFIX):
+                ids.append(int(name[len(_SEGMENT_PREFIX) : -len(_SEGMENT_SUFFIX)]))
+            elif name.endswith(_COMPACT_SUFFIX):
+                # Leftover from a compaction interrupted before its rename; the original segments are intact.
+                os.unlink(entry.path)
+        return sorted(ids)
+
+    def _reload(self) -> None:
+        """Rebuild the index from every segment on disk, truncating torn records at the tail."""
+        self._close_writer()
+        self._close_readers()
+        self._reset_index()
+        self._next_seq = 0
+        self._read_segment = None
+        self._read_offset = 0
+        for segment_id in self._segment_ids():
+            self._replay(segment_id, 0)
+        self._drop_dead_segments()
+
+    def _catch_up(self) -> None:
+        """Apply records appended by other processes since this process last looked at the log."""
+        if self._read_segment is None:
+            if self._segment_ids():
+                self._reload()
+            return
+        try:
+            size = os.path.getsize(self._segment_path(self._read_segment))
+        except FileNotFoundError:
+            # Another process compacted or dropped the segment we were tailing.
+            self._reload()
+            return
+        if size > self._read_offset:
+            self._replay(self._read_segment, self._read_offset)
+        next_segment = self._read_segment + 1
+        while os.path.exists(self._segment_path(next_segment)):
+            self._replay(next_segment, 0)
+            next_segment += 1
+
+    def _replay(self, segment_id: int, start: int) -> None:
+        path = self._segment_path(segment_id)
+        with open(path, "rb") as f:
+            f.seek(start)
+            data = f.read()
+        position = 0
+        records = 0
+        while position + _HEADER.size <= len(data):
+            crc, op, seq, priority, length = _HEADER.unpack_from(data, position)
+            end = position + _HEADER.size + length
+            if end > len(data) or zlib.crc32(data[position + 4 : end]) != crc:
+                break
+            if op == _OP_PUSH:
+                self._index_push(seq, segment_id, start + position + _HEADER.size, length, priority)
+                self._next_seq = max(self._next_seq, seq + 1)
+            elif op == _OP_POP:
+                self._index_pop(seq)
+                self._next_seq = max(self._next_seq, seq + 1)
+            elif op == _OP_CLEAR:
+                self._clear_index()
+                self._next_seq = max(self._next_seq, seq)
+            records += 1
+            position = end
+        if position < len(data):
+            self.logger.warning(
+                f"Truncating {len(data) - position} byte(s) of incomplete or corrupt records from {path}."
+            )
+            with open(path, "r+b") as f:
+                f.truncate(start + position)
+                os.fsync(f.fileno())
+        self._segment_records[segment_id] = self._segment_records.get(segment_id, 0) + records
+        self._segment_live.setdefault(segment_id, 0)
+        self._read_segment = segment_id
+        self._read_offset = start + position
+
+    def _read_payload(self, segment_id: int, offset: int, length: int) -> bytes:
+        reader = self._readers.get(segment_id)
+        if reader is None:
+            reader = self._readers[segment_id] = open(self._segment_path(segment_id), "rb")
+        reader.seek(offset)
+        return reader.read(length)
+
+    def _close_readers(self) -> None:
+        for reader in self._readers.values():
+            reader.close()
+        self._readers.clear()
+
+    def _append(self, record: bytes) -> tuple[int, int]:
+        """Write ``record`` to the active segment and return ``(segment_id, record_offset)``."""
+        if self._read_segment is None or self._read_offset >= self.segment_max_bytes:
+            segment_id = 0 if self._read_segment is None else self._read_segment + 1
+            self._open_writer(segment_id)
+            self._read_segment = segment_id
+            self._read_offset = 0
+            self._segment_live.setdefault(segment_id, 0)
+            self._segment_records.setdefault(segment_id, 0)
+        elif self._writer_segment != self._read_segment:
+            self._open_writer(self._read_segment)
+
+        offset = self._read_offset
+        self._writer.write(record)
+        self._writer.flush()
+        self._read_offset += len(record)
+        self._segment_records[self._read_segment] += 1
+
+        self._unsynced += 1
+        if (self.fsync_every and self._unsynced >= self.fsync_every) or (
+            time.monotonic() - self._last_sync >= self.fsync_interval
+        ):
+            self._sync()
+        return self._read_segment, offset
+
+    def _open_writer(self, segment_id: int) -> None:
+        self._sync()
+        self._close_writer()
+        created = not os.path.exists(self._segment_path(segment_id))
+        self._writer = open(self._segment_path(segment_id), "ab")
+        self._writer_segment = segment_id
+        if created:
+            _fsync_dir(self.path)
+
+    def _close_writer(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+            self._writer_segment = None
+
+    def _sync(self) -> None:
+        if self._writer is not None and self._unsynced:
+            self._writer.flush()
+            os.fsync(self._writer.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Compaction
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def _drop_dead_segments(self) -> None:
+        """Delete leading sealed segments that no longer hold live messages.
+
+        A tombstone is always written to the same or a later segment than the message it removes, so once every
+        segment up to ``N`` is dead, their tombstones are irrelevant to replay and the prefix can be dropped.
+        """
+        dropped = False
+        for segment_id in sorted(self._segment_live):
+            if segment_id == self._read_segment or self._segment_live[segment_id] > 0:
+                break
+            self._unlink_segment(segment_id)
+            del self._segment_live[segment_id]
+            self._segment_records.pop(segment_id, None)
+            dropped = True
+        if dropped:
+            _fsync_dir(self.path)
+
+    def _maybe_compact(self) -> None:
+        self._drop_dead_segments()
+        dead = sum(self._segment_records.values()) - len(self._entries)
+        if dead >= self.compact_min_records and dead > 2 * len(self._entries):
+            self._compact()
+
+    def _compact(self) -> None:
+        """Write ``CLEAR`` plus every live message into a new segment, then drop all older segments.
+
+        The snapshot is written under a temporary name and renamed into place, so a crash either leaves the old
+        segments untouched or leaves a complete snapshot whose leading ``CLEAR`` supersedes them on replay.
+        """
+        if self._read_segment is None:
+            return
+        self._sync()
+        old_segments = sorted(self._segment_live)
+        segment_id = self._read_segment + 1
+        final_path = self._segment_path(segment_id)
+        tmp_path = final_path + _COMPACT_SUFFIX
+
+        live = sorted(self._entries.items())
+        new_entries = []
+        with open(tmp_path, "wb") as out:
+            out.write(_encode_record(_OP_CLEAR, self._next_seq))
+            position = _HEADER.size
+            for seq, (src_segment, offset, length, priority) in live:
+                payload = self._read_payload(src_segment, offset, length)
+                record = _encode_record(_OP_PUSH, seq, priority, payload)
+                out.write(record)
+                new_entries.append((seq, position + _HEADER.size, length, priority))
+                position += len(record)
+            out.flush()
+            os.fsync(out.fileno())
+        os.replace(tmp_path, final_path)
+        _fsync_dir(self.path)
+
+        self._close_writer()
+        for old in old_segments:
+            self._unlink_segment(old)
+        _fsync_dir(self.path)
+
+        self._reset_index()
+        for seq, offset, length, priority in new_entries:
+            self._index_push(seq, segment_id, offset, length, priority)
+        self._segment_live.setdefault(segment_id, 0)
+        self._segment_records[segment_id] = len(new_entries) + 1
+        self._read_segment = segment_id
+        self._read_offset = position
+        self.logger.debug(f"Compacted journal {self.path.name}: {len(new_entries)} live message(s) retained.")
+
+
+class _JournalLock:
+    """Context manager taking the in-process lock, the cross-process file lock, and catching up on the log."""
+
+    __slots__ = ("_queue",)
+
+    def __init__(self, queue: JournaledQueue):
+        self._queue = queue
+
+    def __enter__(self):
+        queue = self._queue
+        queue._lock.acquire()
+        if queue._closed:
+            queue._lock.release()
+            raise RuntimeError(f"Journaled queue at {queue.path} is closed.")
+        try:
+            queue._acquire_file_lock()
+            if hasattr(queue, "_entries"):
+                queue._catch_up()
+        except BaseException:
+            queue._release_file_lock()
+            queue._lock.release()
+            raise
+        return queue
+
+    def __exit__(self, exc_type, exc, tb):
+        queue = self._queue
+        try:
+            queue._release_file_lock()
+        finally:
+            queue._lock.release()
+        return False
+
+
+class LocalJournal(Mindtrace):
+    """A directory of :class:`JournaledQueue` instances keyed by queue name.
+
+    Each queue is stored in its own sub-directory together with a small ``queue.json`` recording its type, so queues
+    declared by one process are visible to every other process sharing the directory.
+    """
+
+    def __init__(self, root: str | Path, **queue_options):
+        """Initialize the journal.
+
+        Args:
+            root: Directory holding one sub-directory per queue.
+            **queue_options: Keyword arguments forwarded to every :class:`JournaledQueue`.
+        """
+        super().__init__()
+        self.root = Path(root).expanduser().resolve()
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.queue_options = queue_options
+        self._queues: dict[str, JournaledQueue] = {}
+        self._lock = threading.Lock()
+
+    def _queue_dir(self, name: str) -> Path:
+        return self.root / quote(name, safe="")
+
+    def __contains__(self, name: str) -> bool:
+        return (self._queue_dir(name) / _QUEUE_META_FILE).exists()
+
+    def declare(self, name: str, queue_type: str = "fifo") -> bool:
+        """Create a queue if it does not exist yet.
+
+        Returns:
+            True if the queue was created, False if it already existed.
+        """
+        queue_type = queue_type.lower()
+        if queue_type not in ("fifo", "stack", "priority"):
+            raise TypeError(f"Unknown queue type '{queue_type}'.")
+        with self._lock:
+            if name in self:
+                return False
+            queue_dir = self._queue_dir(name)
+            queue_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = queue_dir / f"{_QUEUE_META_FILE}.tmp"
+            tmp_path.write_text(json.dumps({"name": name, "queue_type": queue_type}))
+            os.replace(tmp_path, queue_dir / _QUEUE_META_FILE)
+            return True
+
+    def get(self, name: str) -> JournaledQueue:
+        """Return the open queue called ``name``.
+
+        Raises:
+            KeyError: If the queue has not been declared.
+        """
+        with self._lock:
+            queue = self._queues.get(name)
+            if queue is not None and not queue._closed:
+                return queue
+            meta_path = self._queue_dir(name) / _QUEUE_META_FILE
+            try:
+                meta = json.loads(meta_path.read_text())
+            except FileNotFoundError:
+                raise KeyError(f"Queue '{name}' is not declared.") from None
+            queue = JournaledQueue(self._queue_dir(name), meta["queue_type"], **self.queue_options)
+            self._queues[name] = queue
+            return queue
+
+    def __getitem__(self, name: str) -> JournaledQueue:
+        return self.get(name)
+
+    def delete(self, name: str) -> None:
+        """Close and remove a queue together with all its segments. Deleting an unknown queue is a no-op."""
+        with self._lock:
+            queue = self._queues.pop(name, None)
+            if queue is not None:
+                queue.close()
+            queue_dir = self._queue_dir(name)
+            if not queue_dir.exists():
+                return
+            (queue_dir / _QUEUE_META_FILE).unlink(missing_ok=True)
+            for path in queue_dir.iterdir():
+                path.unlink(missing_ok=True)
+            queue_dir.rmdir()
+
+    def names(self) -> list[str]:
+        """Return the names of all declared queues."""
+        names = []
+        for meta_path in self.root.glob(f"*/{_QUEUE_META_FILE}"):
+            try:
+                names.append(json.loads(meta_path.read_text())["name"])
+            except (FileNotFoundError, json.JSONDecodeError, KeyError):
+                continue
+        return sorted(names)
+
+    def close(self) -> None:
+        """Close every open queue."""
+        with self._lock:
+            for queue in self._queues.values():
+                queue.close()
+            self._queues.clear()
@@ -0,0 +1,87 @@
+import json
+import pickle
+from typing import Any
+
+
+class QueueCodec:
+    """Turns queue items into the bytes stored in Redis and back.
+
+    Subclasses set ``name`` and implement ``encode`` / ``decode``. Pass an instance (or the name of a built-in codec)
+    as the ``codec`` argument of a Redis queue to change how its items are serialized.
+    """
+
+    name = "base"
+
+    def encode(self, item: Any) -> bytes:
+        """Serialize an item to bytes."""
+        raise NotImplementedError
+
+    def decode(self, data: bytes) -> Any:
+        """Deserialize bytes produced by ``encode``."""
+        raise NotImplementedError
+
+    def __repr__(self):
+        return f"{type(self).__name__}()"
+
+
+class JsonCodec(QueueCodec):
+    """Compact UTF-8 JSON. Items must be JSON-serializable; tuples come back as lists."""
+
+    name = "json"
+
+    def encode(self, item: Any) -> bytes:
+        return json.dumps(item, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    def decode(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class MsgpackCodec(QueueCodec):
+    """MessagePack via the optional ``msgpack`` package; smaller and faster than JSON and keeps ``bytes`` values."""
+
+    name = "msgpack"
+
+    def __init__(self):
+        try:
+            import msgpack
+        except ImportError as e:
+            raise ImportError(
+                "MsgpackCodec requires the 'msgpack' package. Install it with `pip install msgpack`."
+            ) from e
+        self._packb = msgpack.packb
+        self._unpackb = msgpack.unpackb
+
+    def encode(self, item: Any) -> bytes:
+        return self._packb(item, use_bin_type=True)
+
+    def decode(self, data: bytes) -> Any:
+        return self._unpackb(data, raw=False)
+
+
+class PickleCodec(QueueCodec):
+    """Pickle, for arbitrary Python objects. Only use it when every producer is trusted: decoding runs pickle."""
+
+    name = "pickle"
+
+    def encode(self, item: Any) -> bytes:
+        return pickle.dumps(item, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def decode(self, data: bytes) -> Any:
+        return pickle.loads(data)
+
+
+CODECS: dict[str, type[QueueCodec]] = {cls.name: cls for cls in (JsonCodec, MsgpackCodec, PickleCodec)}
+
+
+def resolve_codec(codec: str | QueueCodec) -> QueueCodec:
+    """Return ``codec`` if it is a ``QueueCodec``, else a new instance of the built-in codec with that name.
+
+    Raises:
+        ValueError: If the name is not one of ``CODECS``.
+    """
+    if isinstance(codec, QueueCodec):
+        return codec
+    try:
+        return CODECS[codec.lower()]()
+    except KeyError:
+        raise ValueError(f"Unknown queue codec '{codec}'. Expected one of {sorted(CODECS)} or a QueueCodec.") from None
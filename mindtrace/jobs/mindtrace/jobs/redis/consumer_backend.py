@@ -1,56 +1,69 @@
 import json
-import time
 from queue import Empty
 from typing import Optional
 
 from mindtrace.core import ifnone
 from mindtrace.jobs.base.consumer_base import ConsumerBackendBase
 from mindtrace.jobs.redis.connection import RedisConnection
+from mindtrace.jobs.redis.consumer_runtime import QueueConsumerStats, RedisConsumerRuntime, WorkerType
+from mindtrace.jobs.redis.fifo_queue import RedisQueue
+from mindtrace.jobs.redis.priority import RedisPriorityQueue
 
 
 class RedisConsumerBackend(ConsumerBackendBase):
-    """Redis consumer backend with blocking operations."""
-
-    def __init__(self, queue_name: str, consumer_frontend, host: str, port: int, db: int, poll_timeout: int = 5):
+    """Redis consumer backend with blocking operations.
+
+    ``consume`` and ``consume_until_empty`` run a :class:`~mindtrace.jobs.redis.consumer_runtime.RedisConsumerRuntime`:
+    each queue is read by its own blocking receive, up to ``prefetch`` messages per queue are buffered, and
+    ``concurrency`` workers (threads, or asyncio tasks with ``worker_type="asyncio"``) process them round-robin across
+    queues. ``concurrency``, ``worker_type`` and ``prefetch`` can also be passed to ``consume`` for one call.
+    """
+
+    def __init__(
+        self,
+        queue_name: str,
+        consumer_frontend,
+        host: str,
+        port: int,
+        db: int,
+        poll_timeout: int = 5,
+        concurrency: int = 1,
+        worker_type: WorkerType = "thread",
+        prefetch: int | None = None,
+        max_backoff: float = 5.0,
+    ):
         super().__init__(queue_name, consumer_frontend)
         self.poll_timeout = poll_timeout
+        self.concurrency = concurrency
+        self.worker_type = worker_type
+        self.prefetch = prefetch
+        self.max_backoff = max_backoff
         self.queues = [queue_name] if queue_name else []
         self.connection = RedisConnection(host=host, port=port, db=db)
+        self.runtime: RedisConsumerRuntime | None = None
 
     def consume(
         self, num_messages: int = 0, *, queues: str | list[str] | None = None, block: bool = True, **kwargs
     ) -> None:
-        """Consume messages from Redis queue(s)."""
+        """Consume messages from Redis queue(s).
+
+        Args:
+            num_messages: Number of messages to handle (processed or failed). If 0, runs until interrupted.
+            queues: Queue(s) to consume from. If None, uses the backend's default queue.
+            block: Wait for messages. If False, stop once every queue is empty.
+            **kwargs: ``concurrency``, ``worker_type`` or ``prefetch`` to override the backend settings for this call.
+        """
         if isinstance(queues, str):
             queues = [queues]
         queues = ifnone(queues, default=self.queues)
 
-        # Guard against empty queue list to avoid infinite loop
         if not queues:
             self.logger.warning("No queues provided; nothing to consume.")
             return
 
-        messages_consumed = 0
+        self.runtime = self._make_runtime(queues, **kwargs)
         try:
-            while num_messages == 0 or messages_consumed < num_messages:
-                for queue in queues:
-                    try:
-                        message = self.receive_message(queue, block=block, timeout=self.poll_timeout)
-                        if message:
-                            self.logger.debug(
-                                f"Received message from queue '{queue}': processing {messages_consumed + 1}"
-                            )
-                            if self.process_message(message):
-                                messages_consumed += 1
-                        elif not block:
-                            return
-                    except Exception as e:
-                        self.logger.debug(f"No message available in queue '{queue}' or error occurred: {e}")
-                        if not block:
-                            return
-                        time.sleep(1)
-        except KeyboardInterrupt:
-            self.logger.info("Consumption interrupted by user.")
+            self.runtime.run(num_messages, until_empty=not block)
         finally:
             self.logger.info(f"Stopped consuming messages from queues: {queues}.")
 
@@ -71,17 +84,45 @@ class RedisConsumerBackend(ConsumerBackendBase):
             self.logger.debug(f"Message content: {message}")
             return False
 
+    async def aprocess_message(self, message) -> bool:
+        """Process a single message with a coroutine ``run`` method of the consumer frontend."""
+        if not isinstance(message, dict):
+            self.logger.warning(f"Received non-dict message: {type(message)}")
+            return False
+        job_id = message.get("id", "unknown")
+        try:
+            await self.consumer_frontend.run(message)
+        except Exception as e:
+            self.logger.error(f"Error processing dict job {job_id}: {str(e)}")
+            return False
+        self.logger.debug(f"Successfully processed dict job {job_id}")
+        return True
+
     def consume_until_empty(self, *, queues: str | list[str] | None = None, block: bool = True, **kwargs) -> None:
-        """Consume messages from the queue(s) until empty."""
+        """Consume messages from the queue(s) until empty.
+
+        Each queue is read until a receive comes back short; the call returns once every received message is handled.
+        ``block`` is accepted for interface compatibility, and ``kwargs`` are handled as in :meth:`consume`.
+        """
         if isinstance(queues, str):
             queues = [queues]
         queues = ifnone(queues, default=self.queues)
 
-        while any(self.connection.count_queue_messages(q) > 0 for q in queues):
-            self.consume(num_messages=1, queues=queues, block=block)
+        if queues:
+            self.runtime = self._make_runtime(queues, **kwargs)
+            self.runtime.run(until_empty=True)
 
         self.logger.info(f"Stopped consuming messages from queues: {queues} (queues empty).")
 
+    def stop(self) -> None:
+        """Stop a running ``consume`` call from another thread; messages being processed are finished first."""
+        if self.runtime is not None:
+            self.runtime.stop()
+
+    def stats(self) -> dict[str, QueueConsumerStats]:
+        """Return per-queue throughput and latency counters of the current or last ``consume`` call."""
+        return self.runtime.stats() if self.runtime is not None else {}
+
     def close(self):
         """Close the Redis connection and clean up resources."""
         if hasattr(self, "connection") and self.connection is not None:
@@ -104,10 +145,7 @@ class RedisConsumerBackend(ConsumerBackendBase):
 
         Returns the message as a dict.
         """
-        with self.connection._local_lock:
-            if queue_name not in self.connection.queues:
-                raise KeyError(f"Queue '{queue_name}' is not declared.")
-            instance = self.connection.queues[queue_name]
+        instance = self._queue_instance(queue_name)
         try:
             if hasattr(instance, "get"):
                 raw_message = instance.get(block=False, timeout=None)
@@ -121,3 +159,78 @@ class RedisConsumerBackend(ConsumerBackendBase):
             return None
         except Exception:
             return None
+
+    def fetch_messages(
+        self, queue_name: str, count: int, *, block: bool = True, timeout: float | None = None
+    ) -> list[tuple[object, float | None]]:
+        """Take up to ``count`` messages from a declared queue.
+
+        Blocks for the first message (if ``block``), then takes whatever else is already queued. Priority queues are
+        read with a single ``ZPOPMAX``. Messages that are not valid JSON are returned undecoded so the worker can
+        report them as failed.
+
+        Returns:
+            ``(message, score)`` pairs; ``score`` is the sorted-set score of a priority-queue message (pass it to
+            ``requeue_message``) and None for other queues.
+        Raises:
+            KeyError: If the queue is not declared.
+        """
+        instance = self._queue_instance(queue_name)
+        if isinstance(instance, RedisPriorityQueue):
+            try:
+                entries = instance.pop_many(count, block=block, timeout=timeout, with_priority=True)
+            except Empty:
+                return []
+            return [(_decode(raw), score) for raw, score in entries]
+        entries = []
+        try:
+            entries.append(instance.pop(block=block, timeout=timeout))
+            while len(entries) < count:
+                entries.append(instance.pop(block=False))
+        except Empty:
+            pass
+        return [(_decode(raw), None) for raw in entries]
+
+    def requeue_message(self, queue_name: str, message, *, score: float | None = None) -> None:
+        """Return a message that was received but not processed to the front of its queue.
+
+        FIFO and stack messages are pushed back onto the head of their list, so they are received again before
+        messages published after them. Priority-queue messages are re-added with the ``score`` ``fetch_messages``
+        returned for them, which keeps both their priority and their place among messages of that priority. To
+        return several messages of a list queue in order, requeue them last-received first.
+        """
+        instance = self._queue_instance(queue_name)
+        body = json.dumps(message) if isinstance(message, dict) else message
+        if isinstance(instance, RedisPriorityQueue):
+            if score is None:
+                instance.push(body)
+            else:
+                instance.push_back([(body, score)])
+        elif isinstance(instance, RedisQueue):
+            instance.push_front(body)
+        else:
+            instance.push(body)
+
+    def _make_runtime(self, queues: list[str], **kwargs) -> RedisConsumerRuntime:
+        return RedisConsumerRuntime(
+            self,
+            queues,
+            concurrency=kwargs.get("concurrency", self.concurrency),
+            worker_type=kwargs.get("worker_type", self.worker_type),
+            prefetch=kwargs.get("prefetch", self.prefetch),
+            receive_timeout=self.poll_timeout,
+            backoff_max=self.max_backoff,
+        )
+
+    def _queue_instance(self, queue_name: str):
+        with self.connection._local_lock:
+            if queue_name not in self.connection.queues:
+                raise KeyError(f"Queue '{queue_name}' is not declared.")
+            return self.connection.queues[queue_name]
+
+
+def _decode(raw):
+    try:
+        return json.loads(raw)
+    except (TypeError, ValueError):
+        return raw
@@ -0,0 +1,414 @@
+"""Concurrent, prefetching consumer runtime for the Redis job backend.
+
+:class:`RedisConsumerRuntime` drives a :class:`~mindtrace.jobs.redis.consumer_backend.RedisConsumerBackend`:
+
+- One fetcher thread per queue waits in a blocking receive (``BLPOP`` / ``BZPOPMAX``), so a job on any queue is
+  picked up as soon as it is published and idle queues cost no round trips.
+- Each queue has a prefetch window: at most ``prefetch`` of its messages are held by the runtime (buffered or being
+  processed) at a time.
+- A pool of ``concurrency`` workers — threads, or tasks on an asyncio loop — takes buffered messages from the queues
+  round-robin, so a busy queue cannot starve the others.
+- A message occupies its prefetch slot until its handler returns ("ack after process"); messages still buffered when
+  the runtime stops are pushed back onto their queue instead of being dropped.
+- Receive errors back off exponentially with jitter, from ``backoff_initial`` up to ``backoff_max``, and reset after
+  the next successful receive.
+
+Redis lists and sorted sets have no broker-side acknowledgement, so a message a worker was processing when the
+process died is lost, as before; the runtime only guarantees that messages it merely prefetched are returned.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Literal
+
+from mindtrace.core import Mindtrace
+
+if TYPE_CHECKING:  # pragma: no cover
+    from mindtrace.jobs.redis.consumer_backend import RedisConsumerBackend
+
+WorkerType = Literal["thread", "asyncio"]
+
+
+@dataclass(frozen=True)
+class QueueConsumerStats:
+    """Per-queue counters of one :class:`RedisConsumerRuntime` run.
+
+    Attributes:
+        queue: Queue name.
+        received: Messages taken from Redis.
+        processed: Messages whose handler succeeded.
+        failed: Messages whose handler failed or that could not be decoded.
+        requeued: Prefetched messages pushed back when the runtime stopped.
+        in_flight: Messages currently buffered or being processed.
+        receive_errors: Receives that raised (each one triggers a back-off).
+        messages_per_second: Handled (processed + failed) messages per second since the run started.
+        mean_latency_ms: Mean handler duration.
+        max_latency_ms: Longest handler duration.
+        mean_wait_ms: Mean time a message spent in the prefetch buffer before a worker took it.
+    """
+
+    queue: str
+    received: int
+    processed: int
+    failed: int
+    requeued: int
+    in_flight: int
+    receive_errors: int
+    messages_per_second: float
+    mean_latency_ms: float
+    max_latency_ms: float
+    mean_wait_ms: float
+
+
+class _Delivery:
+    __slots__ = ("queue", "message", "score", "received_at")
+
+    def __init__(self, queue: str, message: Any, score: float | None, received_at: float) -> None:
+        self.queue = queue
+        self.message = message
+        self.score = score
+        self.received_at = received_at
+
+
+class _QueueState:
+    def __init__(self, name: str, prefetch: int) -> None:
+        self.name = name
+        self.free = prefetch
+        self.buffer: deque[_Delivery] = deque()
+        self.drained = False
+        self.processing = 0
+        self.received = 0
+        self.processed = 0
+        self.failed = 0
+        self.requeued = 0
+        self.receive_errors = 0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+        self.wait_total = 0.0
+
+
+class RedisConsumerRuntime(Mindtrace):
+    """Consume several Redis queues with a worker pool, prefetch windows and blocking receives.
+
+    Args:
+        backend: The consumer backend whose ``fetch_messages``, ``requeue_message`` and ``process_message`` /
+            ``aprocess_message`` do the Redis and handler work.
+        queues: Names of the declared queues to consume.
+        concurrency: Messages processed at the same time.
+        worker_type: ``"thread"`` runs handlers on ``concurrency`` threads. ``"asyncio"`` runs them as tasks on an
+            event loop thread: coroutine ``run`` methods are awaited directly, plain ones run in
+            :func:`asyncio.to_thread`.
+        prefetch: Messages per queue the runtime may hold (buffered or processing). Defaults to ``concurrency``.
+        receive_timeout: Seconds a blocking receive waits before the fetcher re-checks for shutdown.
+        backoff_initial: First back-off, in seconds, after a failed receive.
+        backoff_max: Back-off ceiling in seconds.
+        **kwargs: Forwarded to :class:`~mindtrace.core.Mindtrace`.
+
+    Example:
+        ```python
+        runtime = RedisConsumerRuntime(backend, ["images", "reports"], concurrency=8, prefetch=16)
+        runtime.run()  # until runtime.stop() or Ctrl+C
+        print(runtime.stats()["images"].messages_per_second)
+        ```
+    """
+
+    def __init__(
+        self,
+        backend: RedisConsumerBackend,
+        queues: list[str],
+        *,
+        concurrency: int = 1,
+        worker_type: WorkerType = "thread",
+        prefetch: int | None = None,
+        receive_timeout: float = 5.0,
+        backoff_initial: float = 0.05,
+        backoff_max: float = 5.0,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+        if worker_type not in ("thread", "asyncio"):
+            raise ValueError(f"worker_type must be 'thread' or 'asyncio', got {worker_type!r}")
+        prefetch = concurrency if prefetch is None else prefetch
+        if prefetch < 1:
+            raise ValueError(f"prefetch must be at least 1, got {prefetch}")
+        if not queues:
+            raise ValueError("At least one queue is required.")
+        self.backend = backend
+        self.queues = list(dict.fromkeys(queues))
+        self.concurrency = concurrency
+        self.worker_type = worker_type
+        self.prefetch = prefetch
+        self.receive_timeout = receive_timeout
+        self.backoff_initial = backoff_initial
+        self.backoff_max = backoff_max
+
+        self._cond = threading.Condition()
+        self._stopping = threading.Event()
+        self._states = {name: _QueueState(name, prefetch) for name in self.queues}
+        self._next_queue = 0
+        self._limit = 0
+        self._dispatched = 0
+        self._handled = 0
+        self._processing = 0
+        self._until_empty = False
+        self._started_at = time.perf_counter()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def run(self, num_messages: int = 0, *, until_empty: bool = False) -> int:
+        """Consume until ``num_messages`` are handled, the queues are empty, or :meth:`stop` is called.
+
+        Args:
+            num_messages: Messages to handle before returning; ``0`` means no limit.
+            until_empty: Receive without blocking and return once every queue is empty and all received messages
+                are handled.
+
+        Returns:
+            The number of messages handled (processed or failed).
+        """
+        self._stopping.clear()
+        self._limit = num_messages
+        self._until_empty = until_empty
+        self._started_at = time.perf_counter()
+        with self._cond:
+            self._dispatched = self._handled = 0
+            for state in self._states.values():
+                state.drained = False
+
+        fetchers = [
+            threading.Thread(target=self._fetch_loop, args=(state,), name=f"redis-fetch-{state.name}", daemon=True)
+            for state in self._states.values()
+        ]
+        if self.worker_type == "asyncio":
+            workers = [threading.Thread(target=self._run_event_loop, name="redis-consumer-loop", daemon=True)]
+        else:
+            workers = [
+                threading.Thread(target=self._worker_loop, name=f"redis-consumer-{i}", daemon=True)
+                for i in range(self.concurrency)
+            ]
+        for thread in fetchers + workers:
+            thread.start()
+
+        try:
+            with self._cond:
+                while not self._finished():
+                    self._cond.wait(0.5)
+        except KeyboardInterrupt:
+            self.logger.info("Consumption interrupted by user.")
+        finally:
+            self.stop()
+            for thread in workers:
+                thread.join()
+            for thread in fetchers:
+                thread.join(timeout=self.receive_timeout + 1.0)
+            self._requeue_buffered()
+        return self._handled
+
+    def stop(self) -> None:
+        """Ask fetchers and workers to stop; workers finish the message they are processing."""
+        self._stopping.set()
+        with self._cond:
+            self._cond.notify_all()
+
+    def stats(self) -> dict[str, QueueConsumerStats]:
+        """Return counters per queue for the current or last run."""
+        elapsed = max(time.perf_counter() - self._started_at, 1e-9)
+        with self._cond:
+            return {
+                name: QueueConsumerStats(
+                    queue=name,
+                    received=s.received,
+                    processed=s.processed,
+                    failed=s.failed,
+                    requeued=s.requeued,
+                    in_flight=len(s.buffer) + s.processing,
+                    receive_errors=s.receive_errors,
+                    messages_per_second=(s.processed + s.failed) / elapsed,
+                    mean_latency_ms=1000.0 * s.latency_total / max(s.processed + s.failed, 1),
+                    max_latency_ms=1000.0 * s.latency_max,
+                    mean_wait_ms=1000.0 * s.wait_total / max(s.processed + s.failed, 1),
+                )
+                for name, s in self._states.items()
+            }
+
+    # ------------------------------------------------------------------
+    # Fetching
+    # ------------------------------------------------------------------
+
+    def _fetch_loop(self, state: _QueueState) -> None:
+        backoff = self.backoff_initial
+        while True:
+            with self._cond:
+                while not self._stopping.is_set() and (wanted := self._wanted(state)) == 0:
+                    self._cond.wait()
+                if self._stopping.is_set():
+                    return
+                state.free -= wanted
+            try:
+                received = self.backend.fetch_messages(
+                    state.name, wanted, block=not self._until_empty, timeout=self.receive_timeout
+                )
+            except Exception as e:
+                with self._cond:
+                    state.free += wanted
+                    state.receive_errors += 1
+                delay = backoff * random.uniform(0.5, 1.0)
+                self.logger.warning(f"Receiving from queue '{state.name}' failed, retrying in {delay:.2f}s: {e}")
+                backoff = min(backoff * 2, self.backoff_max)
+                if self._stopping.wait(delay):
+                    return
+                continue
+            backoff = self.backoff_initial
+
+            now = time.perf_counter()
+            deliveries = [_Delivery(state.name, message, score, now) for message, score in received]
+            with self._cond:
+                state.free += wanted - len(received)
+                state.received += len(received)
+                # run() may already have returned the buffer once stopping; a receive that outlived it hands
+                # back its own messages instead.
+                late = self._stopping.is_set()
+                if not late:
+                    state.buffer.extend(deliveries)
+                if self._until_empty and len(received) < wanted:
+                    state.drained = True
+                self._cond.notify_all()
+            if late:
+                self._requeue([(state, delivery) for delivery in reversed(deliveries)])
+                return
+            if state.drained:
+                return
+
+    def _wanted(self, state: _QueueState) -> int:
+        """Free prefetch slots of ``state``, capped so the runtime never holds more than ``num_messages`` still needs."""
+        if not self._limit:
+            return state.free
+        held = sum(self.prefetch - s.free - s.processing for s in self._states.values())  # buffered or being fetched
+        return max(0, min(state.free, self._limit - self._dispatched - held))
+
+    def _requeue_buffered(self) -> None:
+        with self._cond:
+            # Last received first, so messages pushed back onto the head of a list keep their order.
+            leftovers = [(state, delivery) for state in self._states.values() for delivery in reversed(state.buffer)]
+            for state in self._states.values():
+                state.buffer.clear()
+        self._requeue(leftovers)
+
+    def _requeue(self, leftovers: list[tuple[_QueueState, _Delivery]]) -> None:
+        """Return received but unhandled deliveries to their queues, in the given order."""
+        returned = 0
+        for state, delivery in leftovers:
+            try:
+                self.backend.requeue_message(delivery.queue, delivery.message, score=delivery.score)
+            except Exception as e:
+                self.logger.error(f"Could not return a prefetched message to queue '{delivery.queue}': {e}")
+                continue
+            with self._cond:
+                state.free += 1
+                state.requeued += 1
+            returned += 1
+        if returned:
+            self.logger.info(f"Returned {returned} prefetched message(s) to their queues.")
+
+    # ------------------------------------------------------------------
+    # Dispatch
+    # ------------------------------------------------------------------
+
+    def _finished(self) -> bool:
+        if self._stopping.is_set():
+            return True
+        if self._limit and self._handled >= self._limit:
+            return True
+        if self._until_empty:
+            return self._processing == 0 and all(s.drained and not s.buffer for s in self._states.values())
+        return False
+
+    def _take(self, wait: bool = True) -> _Delivery | None:
+        """Return the next delivery round-robin across queues, or None once the runtime is done dispatching."""
+        with self._cond:
+            while True:
+                if self._stopping.is_set() or (self._limit and self._dispatched >= self._limit):
+                    return None
+                for offset in range(len(self.queues)):
+                    state = self._states[self.queues[(self._next_queue + offset) % len(self.queues)]]
+                    if state.buffer:
+                        self._next_queue = (self._next_queue + offset + 1) % len(self.queues)
+                        self._dispatched += 1
+                        self._processing += 1
+                        state.processing += 1
+                        return state.buffer.popleft()
+                if self._finished() or not wait:
+                    return None
+                self._cond.wait()
+
+    def _ack(self, delivery: _Delivery, ok: bool, started: float) -> None:
+        elapsed = time.perf_counter() - started
+        with self._cond:
+            state = self._states[delivery.queue]
+            state.free += 1
+            state.processing -= 1
+            if ok:
+                state.processed += 1
+            else:
+                state.failed += 1
+            state.latency_total += elapsed
+            state.latency_max = max(state.latency_max, elapsed)
+            state.wait_total += started - delivery.received_at
+            self._processing -= 1
+            self._handled += 1
+            self._cond.notify_all()
+
+    def _worker_loop(self) -> None:
+        while (delivery := self._take()) is not None:
+            started = time.perf_counter()
+            try:
+                ok = self.backend.process_message(delivery.message)
+            except Exception as e:
+                self.logger.error(f"Error processing message from queue '{delivery.queue}': {e}")
+                ok = False
+            self._ack(delivery, bool(ok), started)
+
+    def _run_event_loop(self) -> None:
+        asyncio.run(self._async_dispatch())
+
+    async def _async_dispatch(self) -> None:
+        slots = asyncio.Semaphore(self.concurrency)
+        tasks: set[asyncio.Task] = set()
+        run_is_async = inspect.iscoroutinefunction(getattr(self.backend.consumer_frontend, "run", None))
+
+        async def handle(delivery: _Delivery) -> None:
+            started = time.perf_counter()
+            try:
+                if run_is_async:
+                    ok = await self.backend.aprocess_message(delivery.message)
+                else:
+                    ok = await asyncio.to_thread(self.backend.process_message, delivery.message)
+            except Exception as e:
+                self.logger.error(f"Error processing message from queue '{delivery.queue}': {e}")
+                ok = False
+            finally:
+                slots.release()
+            self._ack(delivery, bool(ok), started)
+
+        while True:
+            await slots.acquire()
+            delivery = self._take(wait=False) or await asyncio.to_thread(self._take)
+            if delivery is None:
+                slots.release()
+                break
+            task = asyncio.create_task(handle(delivery))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        if tasks:
+            await asyncio.gather(*tasks)
@@ -24,6 +24,10 @@ class RedisQueue:
         """Serialize and add an item to the queue."""
         self.__db.rpush(self.key, pickle.dumps(item))
 
+    def push_front(self, item):
+        """Serialize and add an item to the head of the queue, e.g. to return an item that was popped but not used."""
+        self.__db.lpush(self.key, pickle.dumps(item))
+
     def pop(self, block=True, timeout=None):
         """Remove and return an item from the queue.
         Args:
@@ -1,18 +1,43 @@
-import pickle
+import struct
 from queue import Empty
 
 import redis
 
+from mindtrace.jobs.redis.codecs import QueueCodec, resolve_codec
+
+MAX_PRIORITY = (1 << 20) - 1  # |priority| * 2**32 must stay below 2**53 to be exact in a double score
+_SEQ_SPAN = 1 << 32
+_SEQ_PREFIX = struct.Struct(">Q")
+
 
 class RedisPriorityQueue:
     """A priority message queue backed by Redis.
     This class uses a Redis sorted set to store messages with priorities.
-    Higher numerical priority values are retrieved first (higher priority).
+    Higher numerical priority values are retrieved first (higher priority); items of equal priority are retrieved in
+    the order they were pushed, across all producers.
+
+    Every push takes a number from a per-queue counter (``INCRBY <key>:seq``). The sorted-set score packs the priority
+    above the low 32 bits and the inverted sequence number into them, so ``ZPOPMAX`` returns the oldest item of the
+    highest priority, and the member is the sequence number followed by the encoded item, so equal items pushed twice
+    are kept as two entries. Blocking pops use ``BZPOPMAX`` and return as soon as an item arrives.
+
+    Priorities must be integers in ``[-MAX_PRIORITY, MAX_PRIORITY]``. FIFO order within a priority holds for
+    2**32 pushes between two moments the queue is drained.
     """
 
-    def __init__(self, name, namespace="priority_queue", **redis_kwargs):
+    def __init__(self, name, namespace="priority_queue", codec: str | QueueCodec = "json", **redis_kwargs):
+        """Initialize a RedisPriorityQueue object.
+        Args:
+            name: Name of the queue.
+            namespace: Namespace prefix for the Redis key.
+            codec: Item serializer: "json" (default), "msgpack", "pickle" or a QueueCodec instance. Producers and
+                consumers of one queue must use the same codec.
+            redis_kwargs: Additional keyword arguments for redis.Redis.
+        """
         self.__db = redis.Redis(**redis_kwargs)
         self.key = f"{namespace}:{name}"
+        self.seq_key = f"{self.key}:seq"
+        self.codec = resolve_codec(codec)
 
     def push(self, item, priority=0):
         """Serialize and add an item to the priority queue.
@@ -20,38 +45,89 @@ class RedisPriorityQueue:
             item: The item to add to the queue.
             priority: Priority value (higher numbers = higher priority).
         """
-        import random
+        priority = _check_priority(priority)
+        seq = self.__db.incr(self.seq_key)
+        self.__db.zadd(self.key, {self._member(seq, item): _score(priority, seq)})
 
-        random.seed(hash(str(item)) % 2147483647)  # Deterministic seed based on item content
-        tie_breaker = random.random() * 1e-10  # Very small tie breaker
-        score = priority + tie_breaker
-        self.__db.zadd(self.key, {pickle.dumps(item): score})
+    def push_many(self, items, priority=0):
+        """Serialize and add several items in two round trips; they become visible to consumers together.
+        Args:
+            items: Items to add, in FIFO order.
+            priority: One priority for every item, or a sequence with one priority per item.
+        Raises:
+            ValueError: If a priority is out of range or the number of priorities does not match the items.
+        """
+        items = list(items)
+        if isinstance(priority, (list, tuple)):
+            if len(priority) != len(items):
+                raise ValueError(f"Got {len(priority)} priorities for {len(items)} items.")
+            priorities = [_check_priority(p) for p in priority]
+        else:
+            priorities = [_check_priority(priority)] * len(items)
+        if not items:
+            return
+        first = self.__db.incrby(self.seq_key, len(items)) - len(items) + 1
+        mapping = {
+            self._member(seq, item): _score(p, seq)
+            for seq, item, p in zip(range(first, first + len(items)), items, priorities)
+        }
+        self.__db.zadd(self.key, mapping)
 
     def pop(self, block=True, timeout=None):
         """Remove and return the highest priority item from the queue.
         Args:
             block: If True, block until an item is available.
-            timeout: Maximum time to block in seconds (if block=True).
+            timeout: Maximum time to block in seconds (if block=True). None waits indefinitely.
         Raises:
             queue.Empty: If no item is available (in non-blocking mode or if the timeout expires).
         """
-        if block:
-            import time
-
-            start_time = time.time()
-            while True:
-                items = self.__db.zpopmax(self.key, 1)
-                if items:
-                    return pickle.loads(items[0][0])
-                if timeout is not None and (time.time() - start_time) > timeout:
-                    raise Empty
-                time.sleep(0.1)  # Sleep briefly before checking again
-        else:
-            items = self.__db.zpopmax(self.key, 1)
-            if items:
-                return pickle.loads(items[0][0])
-            else:
+        if block and (timeout is None or timeout > 0):
+            item = self.__db.bzpopmax(self.key, timeout=0 if timeout is None else timeout)
+            if item:
+                return self._decode(item[1])
+            raise Empty
+        items = self.__db.zpopmax(self.key, 1)
+        if items:
+            return self._decode(items[0][0])
+        raise Empty
+
+    def pop_many(self, count, block=True, timeout=None, with_priority=False):
+        """Remove and return up to ``count`` items, highest priority first, with one ``ZPOPMAX``.
+        When blocking on an empty queue, waits with ``BZPOPMAX`` for the first item and then takes whatever else is
+        already queued, up to ``count``.
+        Args:
+            count: Maximum number of items to return.
+            block: If True, block until at least one item is available.
+            timeout: Maximum time to block in seconds (if block=True). None waits indefinitely.
+            with_priority: Return ``(item, score)`` pairs, where ``score`` is the raw sorted-set score that encodes the
+                priority and queue position; pass the pairs to ``push_back`` to return items to where they were.
+        Raises:
+            queue.Empty: If no item is available (in non-blocking mode or if the timeout expires).
+        """
+        if count < 1:
+            raise ValueError(f"count must be at least 1, got {count}")
+        entries = self.__db.zpopmax(self.key, count)
+        if not entries:
+            if not block or (timeout is not None and timeout <= 0):
+                raise Empty
+            first = self.__db.bzpopmax(self.key, timeout=0 if timeout is None else timeout)
+            if not first:
                 raise Empty
+            entries = [(first[1], first[2])] + (self.__db.zpopmax(self.key, count - 1) if count > 1 else [])
+        if with_priority:
+            return [(self._decode(member), score) for member, score in entries]
+        return [self._decode(member) for member, _ in entries]
+
+    def push_back(self, entries):
+        """Return items taken with ``pop_many(with_priority=True)`` to their original place in the queue.
+        The items are re-added with their original score and sequence number, so they come out ahead of items of the
+        same priority that were pushed after them.
+        Args:
+            entries: ``(item, score)`` pairs as returned by ``pop_many(with_priority=True)``.
+        """
+        mapping = {self._member(_SEQ_SPAN - 1 - int(score) % _SEQ_SPAN, item): score for item, score in entries}
+        if mapping:
+            self.__db.zadd(self.key, mapping)
 
     def qsize(self):
         """Return the approximate size of the priority queue."""
@@ -60,3 +136,19 @@ class RedisPriorityQueue:
     def empty(self):
         """Return True if the priority queue is empty, False otherwise."""
         return self.qsize() == 0
+
+    def _member(self, seq, item):
+        return _SEQ_PREFIX.pack(seq) + self.codec.encode(item)
+
+    def _decode(self, member):
+        return self.codec.decode(member[_SEQ_PREFIX.size :])
+
+
+def _check_priority(priority):
+    if int(priority) != priority or abs(priority) > MAX_PRIORITY:
+        raise ValueError(f"Priority must be an integer in [-{MAX_PRIORITY}, {MAX_PRIORITY}], got {priority!r}.")
+    return int(priority)
+
+
+def _score(priority, seq):
+    return priority * _SEQ_SPAN + (_SEQ_SPAN - 1 - seq % _SEQ_SPAN)
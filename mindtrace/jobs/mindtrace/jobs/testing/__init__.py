@@ -0,0 +1,22 @@
+"""Embedded benchmark suites for ``mindtrace-jobs``.
+
+Use ``register_benchmark_suites`` directly or discover it through the
+``mindtrace.benchmark_suites`` entry point group.
+"""
+
+from __future__ import annotations
+
+from mindtrace.core import TestRunner
+
+
+def register_benchmark_suites(*, runner: TestRunner | None = None, replace: bool = True) -> None:
+    """Register jobs benchmark suites on ``runner`` or the default runner."""
+
+    target = runner or TestRunner.default()
+
+    from mindtrace.jobs.testing.suites.local_queue import LocalQueueThroughputSuite
+    from mindtrace.jobs.testing.suites.redis_priority_queue import RedisPriorityQueueSuite
+
+    for cls in (LocalQueueThroughputSuite, RedisPriorityQueueSuite):
+        if replace or cls.suite_id not in target.registered_suites():
+            target.register_test_suite(cls, replace=replace)
@@ -0,0 +1 @@
+"""Jobs benchmark suite implementations."""
@@ -0,0 +1,162 @@
+"""LocalClient publish / count / receive throughput at a given queue depth."""
+
+from __future__ import annotations
+
+import logging
+import time
+from pathlib import Path
+from shutil import rmtree
+from tempfile import mkdtemp
+from types import MappingProxyType
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+from mindtrace.core import (
+    BenchReporter,
+    BenchResult,
+    BenchResultSchema,
+    BenchSuiteConfig,
+    BenchTestSuite,
+    TaskSchema,
+    utc_now_iso,
+)
+from mindtrace.core.testing.workloads import deterministic_payload, parse_size_bytes
+from mindtrace.jobs.local.client import LocalClient
+
+
+class LocalQueueThroughputInput(BaseModel):
+    queue_engine: Literal["journal", "registry"] = Field("journal", description="LocalClient queue engine.")
+    queue_type: Literal["fifo", "stack", "priority"] = Field("fifo", description="Declared queue type.")
+    queued_jobs: int = Field(10_000, ge=1, description="Number of jobs published before the queue is drained.")
+    payload_size: str = Field("256B", description="Generated job payload size, e.g. '256B' or '4KiB'.")
+    fsync_every: int = Field(256, ge=0, description="Journal records written between fsync calls.")
+
+
+class LocalQueueThroughputResources(BaseModel):
+    """Uses only a temporary local directory."""
+
+
+class _BenchJob(BaseModel):
+    payload: str
+    job_id: str | None = None
+
+
+class LocalQueueThroughputSuite(BenchTestSuite):
+    suite_id = "jobs.stress.local_queue_throughput"
+    title = "Jobs stress — LocalClient queue throughput"
+    description = (
+        "Publishes ``queued_jobs`` messages to a ``LocalClient`` queue, measures ``count_queue_messages`` at full "
+        "depth, then drains the queue. Reports publish and receive throughput separately for the selected engine."
+    )
+    tags = frozenset({"stress", "jobs"})
+    requires = ("local_disk",)
+    safety = "Writes only to a temporary directory that is removed afterwards."
+    task_schema = TaskSchema(
+        name=suite_id,
+        input_schema=LocalQueueThroughputInput,
+        output_schema=BenchResultSchema,
+    )
+    resource_schema = LocalQueueThroughputResources
+    profiles = MappingProxyType(
+        {
+            "smoke": {"duration_seconds": 30.0, "queued_jobs": 200},
+            "stress": {"duration_seconds": 300.0, "queue_engine": "journal", "queued_jobs": 10_000},
+            "stress_100k": {"duration_seconds": 1800.0, "queue_engine": "journal", "queued_jobs": 100_000},
+            "registry_baseline": {"duration_seconds": 300.0, "queue_engine": "registry", "queued_jobs": 10_000},
+        },
+    )
+
+    def execute_bench(self, config: BenchSuiteConfig, reporter: BenchReporter) -> BenchResult:
+        started = utc_now_iso()
+        monotonic_start = time.perf_counter()
+        queue_engine = str(config.parameters.get("queue_engine", "journal")).lower()
+        queue_type = str(config.parameters.get("queue_type", "fifo")).lower()
+        queued_jobs = int(config.parameters.get("queued_jobs", 10_000))
+        payload_size = parse_size_bytes(config.parameters.get("payload_size"), default=256)
+        fsync_every = int(config.parameters.get("fsync_every", 256))
+        message = _BenchJob(payload=deterministic_payload(payload_size).decode("ascii"))
+        deadline = reporter.deadline(config.duration_seconds)
+
+        # Per-message debug logging would dominate the measurement.
+        logging.getLogger("mindtrace.jobs").setLevel(logging.WARNING)
+        client_dir = Path(mkdtemp(prefix="mindtrace-jobs-local-queue-"))
+        published = received = 0
+        publish_seconds = receive_seconds = count_seconds = 0.0
+        try:
+            client = LocalClient(
+                client_dir=client_dir,
+                queue_engine=queue_engine,
+                journal_options={"fsync_every": fsync_every},
+            )
+            queue_name = "bench-local-queue"
+            client.declare_queue(queue_name, queue_type=queue_type)
+
+            phase_start = time.perf_counter()
+            while published < queued_jobs and time.perf_counter() < deadline and not reporter.is_cancelled():
+                op_start = time.perf_counter()
+                try:
+                    client.publish(queue_name, message, priority=published % 10)
+                except Exception as exc:  # noqa: BLE001 - benchmark records backend failures
+                    reporter.record_operation(success=False, latency_seconds=time.perf_counter() - op_start, error=exc)
+                    continue
+                reporter.record_operation(
+                    success=True, latency_seconds=time.perf_counter() - op_start, bytes_processed=payload_size
+                )
+                published += 1
+            publish_seconds = time.perf_counter() - phase_start
+
+            count_start = time.perf_counter()
+            depth = client.count_queue_messages(queue_name)
+            count_seconds = time.perf_counter() - count_start
+            if depth != published:
+                reporter.record_operation(
+                    success=False,
+                    latency_seconds=count_seconds,
+                    error=AssertionError(f"count_queue_messages returned {depth}, expected {published}"),
+                )
+
+            phase_start = time.perf_counter()
+            while received < published and time.perf_counter() < deadline and not reporter.is_cancelled():
+                op_start = time.perf_counter()
+                result = client.receive_message(queue_name, block=False)
+                latency = time.perf_counter() - op_start
+                if result is None:
+                    reporter.record_operation(
+                        success=False, latency_seconds=latency, error=LookupError("queue drained early")
+                    )
+                    break
+                reporter.record_operation(success=True, latency_seconds=latency, bytes_processed=payload_size)
+                received += 1
+            receive_seconds = time.perf_counter() - phase_start
+        finally:
+            rmtree(client_dir, ignore_errors=True)
+
+        elapsed = time.perf_counter() - monotonic_start
+        completed = published == queued_jobs and received == queued_jobs
+        return BenchResult(
+            suite_id=config.suite_id,
+            status="passed" if reporter.failures == 0 and completed else "failed",
+            started_at=started,
+            ended_at=utc_now_iso(),
+            duration_seconds=elapsed,
+            operations=reporter.operations,
+            successes=reporter.successes,
+            failures=reporter.failures,
+            bytes_processed=reporter.bytes_processed,
+            latency_seconds=reporter.latency_seconds,
+            error_counts=reporter.error_counts,
+            metrics={
+                **reporter.metrics,
+                "queue_engine": queue_engine,
+                "queue_type": queue_type,
+                "queued_jobs": queued_jobs,
+                "published": published,
+                "received": received,
+                "payload_size_bytes": payload_size,
+                "fsync_every": fsync_every,
+                "publish_ops_per_second": published / publish_seconds if publish_seconds > 0 else 0.0,
+                "receive_ops_per_second": received / receive_seconds if receive_seconds > 0 else 0.0,
+                "count_at_depth_seconds": count_seconds,
+            },
+        )
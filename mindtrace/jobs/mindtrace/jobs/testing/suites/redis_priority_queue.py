@@ -0,0 +1,260 @@
+"""RedisPriorityQueue enqueue / dequeue throughput and blocking hand-off latency."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from queue import Empty
+from types import MappingProxyType
+from typing import Literal
+from uuid import uuid4
+
+from pydantic import BaseModel, Field
+
+from mindtrace.core import (
+    BenchReporter,
+    BenchResult,
+    BenchResultSchema,
+    BenchSuiteConfig,
+    BenchTestSuite,
+    TaskSchema,
+    utc_now_iso,
+)
+from mindtrace.core.testing import latency_summary
+from mindtrace.core.testing.workloads import deterministic_payload, parse_size_bytes
+from mindtrace.jobs.redis.priority import RedisPriorityQueue
+
+QueueMode = Literal["single", "batch", "handoff"]
+QUEUE_MODES: tuple[str, ...] = ("single", "batch", "handoff")
+
+
+class RedisPriorityQueueInput(BaseModel):
+    modes: list[QueueMode] = Field(
+        default_factory=lambda: list(QUEUE_MODES),
+        description="'single' pushes and pops one item per call; 'batch' uses push_many / pop_many; 'handoff' has a "
+        "consumer blocked in pop() while items are pushed one at a time and measures push-to-pop latency.",
+    )
+    queued_jobs: int = Field(10_000, ge=1, description="Items pushed and drained per throughput mode.")
+    handoff_jobs: int = Field(500, ge=1, description="Items handed to the blocked consumer in 'handoff' mode.")
+    batch_size: int = Field(100, ge=1, description="Items per push_many / pop_many call in 'batch' mode.")
+    priorities: int = Field(10, ge=1, description="Distinct priorities cycled through while pushing.")
+    payload_size: str = Field("256B", description="Generated payload size per item, e.g. '256B' or '4KiB'.")
+    codec: Literal["json", "msgpack", "pickle"] = Field("json", description="Queue codec.")
+
+
+class RedisPriorityQueueResources(BaseModel):
+    redis_host: str = Field("localhost", description="Redis host.")
+    redis_port: int = Field(6379, description="Redis port.")
+    redis_db: int = Field(0, description="Redis database number.")
+
+
+class RedisPriorityQueueSuite(BenchTestSuite):
+    suite_id = "jobs.stress.redis_priority_queue"
+    title = "Jobs stress — RedisPriorityQueue throughput and hand-off latency"
+    description = (
+        "Pushes ``queued_jobs`` items to a fresh RedisPriorityQueue and drains it, one item per call ('single') or "
+        "``batch_size`` per call ('batch'), checking that items come out in priority-then-FIFO order. 'handoff' "
+        "pushes items to a consumer blocked in pop() and reports the push-to-pop latency percentiles."
+    )
+    tags = frozenset({"stress", "jobs", "redis"})
+    requires = ("redis",)
+    safety = "Uses a uniquely named queue key in the configured Redis database and deletes it afterwards."
+    task_schema = TaskSchema(name=suite_id, input_schema=RedisPriorityQueueInput, output_schema=BenchResultSchema)
+    resource_schema = RedisPriorityQueueResources
+    profiles = MappingProxyType(
+        {
+            "smoke": {"duration_seconds": 30.0, "queued_jobs": 200, "handoff_jobs": 50},
+            "stress": {"duration_seconds": 300.0, "queued_jobs": 10_000, "handoff_jobs": 500},
+            "stress_100k": {"duration_seconds": 1800.0, "queued_jobs": 100_000, "handoff_jobs": 2_000},
+        },
+    )
+
+    def execute_bench(self, config: BenchSuiteConfig, reporter: BenchReporter) -> BenchResult:
+        started = utc_now_iso()
+        monotonic_start = time.perf_counter()
+        modes = [str(mode).lower() for mode in config.parameters.get("modes") or QUEUE_MODES]
+        queued_jobs = int(config.parameters.get("queued_jobs", 10_000))
+        handoff_jobs = int(config.parameters.get("handoff_jobs", 500))
+        batch_size = int(config.parameters.get("batch_size", 100))
+        priorities = int(config.parameters.get("priorities", 10))
+        payload_size = parse_size_bytes(config.parameters.get("payload_size"), default=256)
+        codec = str(config.parameters.get("codec", "json")).lower()
+        redis_params = {
+            "host": str(config.resources.get("redis_host", "localhost")),
+            "port": int(config.resources.get("redis_port", 6379)),
+            "db": int(config.resources.get("redis_db", 0)),
+        }
+        payload = deterministic_payload(payload_size).decode("ascii")
+        deadline = reporter.deadline(config.duration_seconds)
+
+        logging.getLogger("mindtrace.jobs").setLevel(logging.WARNING)
+        mode_metrics: dict[str, object] = {}
+        completed = True
+
+        def expected_order(count: int) -> list[int]:
+            # Highest priority first, then push order; item i was pushed with priority i % priorities.
+            return sorted(range(count), key=lambda i: (-(i % priorities), i))
+
+        for mode in modes:
+            queue_name = f"bench-{uuid4().hex}"
+            queue = RedisPriorityQueue(queue_name, codec=codec, **redis_params)
+            try:
+                if mode == "handoff":
+                    consumer = RedisPriorityQueue(queue_name, codec=codec, **redis_params)
+                    handoff = self._run_handoff(queue, consumer, handoff_jobs, payload, deadline, reporter)
+                    completed = completed and len(handoff) == handoff_jobs
+                    summary = latency_summary(handoff)
+                    mode_metrics["handoff_items"] = len(handoff)
+                    for name in ("p50", "p95", "p99"):
+                        value = summary[f"latency_{name}_seconds"]
+                        mode_metrics[f"handoff_{name}_ms"] = value * 1000.0 if value is not None else None
+                    mode_metrics["handoff_max_ms"] = max(handoff, default=0.0) * 1000.0
+                    continue
+
+                step = batch_size if mode == "batch" else 1
+                pushed = 0
+                phase_start = time.perf_counter()
+                while pushed < queued_jobs and time.perf_counter() < deadline and not reporter.is_cancelled():
+                    chunk = range(pushed, min(pushed + step, queued_jobs))
+                    items = [{"i": i, "payload": payload} for i in chunk]
+                    op_start = time.perf_counter()
+                    try:
+                        if mode == "batch":
+                            queue.push_many(items, priority=[i % priorities for i in chunk])
+                        else:
+                            queue.push(items[0], priority=chunk[0] % priorities)
+                    except Exception as exc:  # noqa: BLE001 - benchmark records backend failures
+                        reporter.record_operation(
+                            success=False, latency_seconds=time.perf_counter() - op_start, error=exc, mode=mode
+                        )
+                        break
+                    reporter.record_operation(
+                        success=True,
+                        latency_seconds=time.perf_counter() - op_start,
+                        bytes_processed=payload_size * len(items),
+                        mode=f"{mode}_push",
+                    )
+                    pushed += len(items)
+                push_seconds = time.perf_counter() - phase_start
+
+                popped: list[int] = []
+                phase_start = time.perf_counter()
+                while len(popped) < pushed and time.perf_counter() < deadline and not reporter.is_cancelled():
+                    op_start = time.perf_counter()
+                    try:
+                        if mode == "batch":
+                            items = queue.pop_many(batch_size, block=False)
+                        else:
+                            items = [queue.pop(block=False)]
+                    except Exception as exc:  # noqa: BLE001 - includes queue.Empty when items went missing
+                        reporter.record_operation(
+                            success=False, latency_seconds=time.perf_counter() - op_start, error=exc, mode=mode
+                        )
+                        break
+                    reporter.record_operation(
+                        success=True,
+                        latency_seconds=time.perf_counter() - op_start,
+                        bytes_processed=payload_size * len(items),
+                        mode=f"{mode}_pop",
+                    )
+                    popped.extend(item["i"] for item in items)
+                pop_seconds = time.perf_counter() - phase_start
+
+                if popped != expected_order(pushed):
+                    reporter.record_operation(
+                        success=False,
+                        latency_seconds=0.0,
+                        error=AssertionError(f"{mode}: items did not come out in priority-then-FIFO order"),
+                        mode=mode,
+                    )
+                completed = completed and pushed == queued_jobs and len(popped) == queued_jobs
+                mode_metrics[f"{mode}_pushed"] = pushed
+                mode_metrics[f"{mode}_popped"] = len(popped)
+                mode_metrics[f"{mode}_enqueue_items_per_second"] = pushed / push_seconds if push_seconds > 0 else 0.0
+                mode_metrics[f"{mode}_dequeue_items_per_second"] = len(popped) / pop_seconds if pop_seconds > 0 else 0.0
+            finally:
+                _delete_queue(queue, redis_params)
+
+        elapsed = time.perf_counter() - monotonic_start
+        return BenchResult(
+            suite_id=config.suite_id,
+            status="passed" if reporter.failures == 0 and completed else "failed",
+            started_at=started,
+            ended_at=utc_now_iso(),
+            duration_seconds=elapsed,
+            operations=reporter.operations,
+            successes=reporter.successes,
+            failures=reporter.failures,
+            bytes_processed=reporter.bytes_processed,
+            latency_seconds=reporter.latency_seconds,
+            error_counts=reporter.error_counts,
+            metrics={
+                **reporter.metrics,
+                **mode_metrics,
+                "modes": modes,
+                "queued_jobs": queued_jobs,
+                "handoff_jobs": handoff_jobs,
+                "batch_size": batch_size,
+                "priorities": priorities,
+                "payload_size_bytes": payload_size,
+                "codec": codec,
+            },
+        )
+
+    @staticmethod
+    def _run_handoff(
+        queue: RedisPriorityQueue,
+        consumer: RedisPriorityQueue,
+        jobs: int,
+        payload: str,
+        deadline: float,
+        reporter: BenchReporter,
+    ) -> list[float]:
+        """Push ``jobs`` items, each once the consumer has taken the previous one; return push-to-pop seconds."""
+        latencies: list[float] = []
+        taken = threading.Event()
+        errors: list[BaseException] = []
+
+        def consume() -> None:
+            while len(latencies) < jobs:
+                try:
+                    item = consumer.pop(block=True, timeout=max(deadline - time.perf_counter(), 0.001))
+                except Empty:
+                    return
+                except Exception as exc:  # noqa: BLE001 - reported by the producer side
+                    errors.append(exc)
+                    return
+                latencies.append(time.perf_counter() - item["pushed_at"])
+                taken.set()
+
+        thread = threading.Thread(target=consume, name="redis-priority-handoff", daemon=True)
+        thread.start()
+        try:
+            for i in range(jobs):
+                if time.perf_counter() >= deadline or reporter.is_cancelled() or errors:
+                    break
+                taken.clear()
+                # Let the consumer block in BZPOPMAX before the push, as an idle worker would be.
+                time.sleep(0.002)
+                queue.push({"i": i, "pushed_at": time.perf_counter(), "payload": payload}, priority=i % 3)
+                if not taken.wait(timeout=max(deadline - time.perf_counter(), 0.001)):
+                    break
+                reporter.record_operation(success=True, latency_seconds=latencies[-1], mode="handoff")
+        finally:
+            thread.join(timeout=max(deadline - time.perf_counter(), 0.0) + 1.0)
+        for exc in errors:
+            reporter.record_operation(success=False, latency_seconds=0.0, error=exc, mode="handoff")
+        return latencies
+
+
+def _delete_queue(queue: RedisPriorityQueue, redis_params: dict[str, object]) -> None:
+    import redis
+
+    client = redis.Redis(**redis_params)
+    try:
+        client.delete(queue.key, queue.seq_key)
+    except Exception:  # noqa: BLE001 - best-effort cleanup
+        pass
+    finally:
+        client.close()
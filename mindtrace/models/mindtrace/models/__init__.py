@@ -44,6 +44,7 @@ from mindtrace.models.serving import (
 
 # -- Tracking ----------------------------------------------------------------
 from mindtrace.models.tracking import (
+    BackgroundTracker,
     CompositeTracker,
     HuggingFaceTrackerBridge,
     MLflowTracker,
@@ -63,6 +64,7 @@ from mindtrace.models.training import (
     ModelCheckpoint,
     OptunaCallback,
     ProgressLogger,
+    StreamingDatalakeDataset,
     Trainer,
     UnfreezeSchedule,
     build_datalake_loader,
@@ -128,6 +130,7 @@ __all__ = [
     # tracking
     "Tracker",
     "CompositeTracker",
+    "BackgroundTracker",
     "MLflowTracker",
     "WandBTracker",
     "TensorBoardTracker",
@@ -147,6 +150,7 @@ __all__ = [
     "build_scheduler",
     # training — datalake bridge
     "DatalakeDataset",
+    "StreamingDatalakeDataset",
     "build_datalake_loader",
     # training — losses
     "FocalLoss",
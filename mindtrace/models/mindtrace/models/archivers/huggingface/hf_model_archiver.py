@@ -25,9 +25,11 @@ class HuggingFaceModelArchiver(Archiver):
     """Archiver for HuggingFace Transformers models.
 
     Serialization format:
-        - model files: config.json, pytorch_model.bin or model.safetensors
+        - model files: config.json, model.safetensors (sharded for large models)
         - processor files: preprocessor_config.json, tokenizer files (if applicable)
-        - adapter/ directory: PEFT adapter config and weights (if applicable)
+        - adapter/ directory: PEFT adapter config and adapter_model.safetensors (if applicable)
+
+    Artifacts saved with ``pytorch_model.bin`` or ``adapter.bin`` weights still load.
 
     Example:
         >>> from transformers import AutoModelForImageClassification
@@ -60,7 +62,7 @@ class HuggingFaceModelArchiver(Archiver):
         if self._is_peft_model(model):
             self._save_peft_model(model)
         else:
-            model.save_pretrained(self.uri)
+            model.save_pretrained(self.uri, safe_serialization=True)
             self.logger.debug(f"Saved HuggingFace model to {self.uri}")
             # Save adapter if a plain PreTrainedModel happens to have one attached
             self._save_peft_adapter(model)
@@ -85,7 +87,7 @@ class HuggingFaceModelArchiver(Archiver):
         # Deep copy to avoid mutating the original model
         model_copy = copy.deepcopy(model)
         merged = model_copy.merge_and_unload()
-        merged.save_pretrained(self.uri)
+        merged.save_pretrained(self.uri, safe_serialization=True)
         self.logger.debug(f"Saved PeftModel (merged) to {self.uri}")
 
         # Save adapter config + weights for provenance and potential re-attachment
@@ -96,10 +98,7 @@ class HuggingFaceModelArchiver(Archiver):
         if peft_config:
             peft_config.save_pretrained(adapter_dir)
 
-        import torch
-
-        adapter_state_dict = get_peft_model_state_dict(model)
-        torch.save(adapter_state_dict, os.path.join(adapter_dir, "adapter.bin"))
+        self._save_adapter_weights(get_peft_model_state_dict(model), adapter_dir)
 
         # Mark this as a merged save so the loader knows not to re-apply adapter
         meta_path = os.path.join(adapter_dir, "archiver_meta.json")
@@ -119,7 +118,6 @@ class HuggingFaceModelArchiver(Archiver):
             return
 
         try:
-            import torch
             from peft import get_peft_model_state_dict
         except ImportError:
             raise ImportError(
@@ -136,18 +134,31 @@ class HuggingFaceModelArchiver(Archiver):
             peft_config.save_pretrained(adapter_dir)
 
         # Save adapter weights
-        adapter_state_dict = get_peft_model_state_dict(model)
-        torch.save(adapter_state_dict, os.path.join(adapter_dir, "adapter.bin"))
+        self._save_adapter_weights(get_peft_model_state_dict(model), adapter_dir)
 
         self.logger.debug(f"Saved PEFT adapter to {adapter_dir}")
 
-    def load(self, data_type: Type[Any]) -> Any:
+    @staticmethod
+    def _save_adapter_weights(adapter_state_dict: dict, adapter_dir: str) -> None:
+        """Write PEFT adapter weights as ``adapter_model.safetensors``."""
+        from safetensors.torch import save_file
+
+        save_file(
+            {name: tensor.contiguous() for name, tensor in adapter_state_dict.items()},
+            os.path.join(adapter_dir, "adapter_model.safetensors"),
+        )
+
+    def load(self, data_type: Type[Any], lazy: bool = False) -> Any:
         """Load the HuggingFace model from storage.
 
         Uses dynamic class detection from config.json to load the correct model type.
 
         Args:
             data_type: The expected type (PreTrainedModel or subclass).
+            lazy: Pass ``low_cpu_mem_usage=True`` to ``from_pretrained`` so the
+                model is built on the ``meta`` device and filled directly from
+                the memory-mapped safetensors files, skipping random
+                initialisation and the intermediate full state dict.
 
         Returns:
             The loaded model instance.
@@ -168,7 +179,10 @@ class HuggingFaceModelArchiver(Archiver):
         model_cls = self._get_model_class(config)
 
         # Load the model
-        model = model_cls.from_pretrained(self.uri, config=config)
+        if lazy:
+            model = model_cls.from_pretrained(self.uri, config=config, low_cpu_mem_usage=True)
+        else:
+            model = model_cls.from_pretrained(self.uri, config=config)
         self.logger.debug(f"Loaded HuggingFace model ({model_cls.__name__}) from {self.uri}")
 
         # Load PEFT adapter if present
@@ -214,7 +228,9 @@ class HuggingFaceModelArchiver(Archiver):
 
         adapter_dir = os.path.join(self.uri, "adapter")
         adapter_config_path = os.path.join(adapter_dir, "adapter_config.json")
-        adapter_weights_path = os.path.join(adapter_dir, "adapter.bin")
+        adapter_weights_path = os.path.join(adapter_dir, "adapter_model.safetensors")
+        if not os.path.exists(adapter_weights_path):
+            adapter_weights_path = os.path.join(adapter_dir, "adapter.bin")
 
         if not (os.path.exists(adapter_config_path) and os.path.exists(adapter_weights_path)):
             return model
@@ -242,7 +258,12 @@ class HuggingFaceModelArchiver(Archiver):
         model = inject_adapter_in_model(peft_config, model)
 
         # Load adapter weights
-        adapter_state = torch.load(adapter_weights_path, map_location="cpu")
+        if adapter_weights_path.endswith(".safetensors"):
+            from safetensors.torch import load_file
+
+            adapter_state = load_file(adapter_weights_path)
+        else:
+            adapter_state = torch.load(adapter_weights_path, map_location="cpu")
         set_peft_model_state_dict(model, adapter_state)
 
         self.logger.debug(f"Loaded PEFT adapter from {adapter_dir}")
@@ -1,11 +1,15 @@
 """Archiver for timm (PyTorch Image Models) models.
 
 Handles saving and loading of timm models with their architecture
-configuration and weights.
+configuration and weights. Weights are stored as safetensors and read
+through a memory map, so a load does not unpickle and copy the whole
+state dict, and ``lazy=True`` loads leave the parameters backed by the
+file's pages.
 """
 
 import json
 import os
+from itertools import chain
 from typing import Any, Type
 
 import torch
@@ -14,6 +18,7 @@ from mindtrace.registry import Archiver
 
 try:
     import timm
+    from safetensors.torch import load_file, save_file, save_model
 
     _TIMM_AVAILABLE = True
 except ImportError:
@@ -25,7 +30,11 @@ class TimmModelArchiver(Archiver):
 
     Serialization format:
         - config.json: Model configuration (architecture, num_classes, etc.)
-        - model.pt: PyTorch state_dict
+        - model.safetensors: PyTorch state_dict (tied weights stored once)
+        - buffers.safetensors: Non-persistent buffers, only when the model has any
+          (needed to rebuild them after a ``lazy`` meta-device load)
+
+    Artifacts saved before safetensors storage (``model.pt``) still load.
 
     Example:
         >>> import timm
@@ -35,6 +44,8 @@ class TimmModelArchiver(Archiver):
         >>> registry = Registry()
         >>> registry.save("resnet:v1", model)
         >>> loaded_model = registry.load("resnet:v1")
+        >>> # Parameters backed by the memory-mapped weights file, without random init
+        >>> lazy_model = registry.load("resnet:v1", lazy=True)
     """
 
     def __init__(self, uri: str, **kwargs):
@@ -66,9 +77,13 @@ class TimmModelArchiver(Archiver):
         with open(config_path, "w") as f:
             json.dump(config, f, indent=2)
 
-        # Save state dict
-        model_path = os.path.join(self.uri, "model.pt")
-        torch.save(model.state_dict(), model_path)
+        # Save state dict; save_model drops duplicate names of tied weights
+        save_model(model, os.path.join(self.uri, "model.safetensors"), force_contiguous=True)
+
+        # Non-persistent buffers are not in the state dict, but a meta-device load cannot rebuild them
+        buffers = self._non_persistent_buffers(model)
+        if buffers:
+            save_file(buffers, os.path.join(self.uri, "buffers.safetensors"))
 
         self.logger.debug(f"Saved timm model ({config['architecture']}) to {self.uri}")
 
@@ -114,11 +129,29 @@ class TimmModelArchiver(Archiver):
 
         return config
 
-    def load(self, data_type: Type[Any]) -> Any:
+    @staticmethod
+    def _non_persistent_buffers(model: Any) -> dict[str, torch.Tensor]:
+        """Return the buffers that ``state_dict()`` leaves out, as contiguous tensors."""
+        persistent = set(model.state_dict())
+        return {
+            name: buffer.contiguous()
+            for name, buffer in model.named_buffers()
+            if name not in persistent and buffer is not None
+        }
+
+    def load(self, data_type: Type[Any], lazy: bool = False) -> Any:
         """Load the timm model from storage.
 
         Args:
             data_type: The expected type.
+            lazy: Build the model on the ``meta`` device and assign the
+                memory-mapped tensors as its parameters instead of copying
+                them into freshly initialised ones. Pages are read on first
+                use and, with a registry that loads in place (``pull_mode``
+                ``"direct"`` or ``"link"``), shared by every process that
+                loads the same artifact. Writes stay private to the process.
+                Tied weights come back as separate parameters sharing
+                storage, so prefer the default for training.
 
         Returns:
             The loaded timm model instance.
@@ -127,12 +160,15 @@ class TimmModelArchiver(Archiver):
             raise ImportError("timm is not installed")
 
         config_path = os.path.join(self.uri, "config.json")
-        model_path = os.path.join(self.uri, "model.pt")
+        model_path = os.path.join(self.uri, "model.safetensors")
+        legacy_model_path = os.path.join(self.uri, "model.pt")
 
         if not os.path.exists(config_path):
             raise FileNotFoundError(f"Config not found at {config_path}")
         if not os.path.exists(model_path):
-            raise FileNotFoundError(f"Model weights not found at {model_path}")
+            if not os.path.exists(legacy_model_path):
+                raise FileNotFoundError(f"Model weights not found at {model_path}")
+            model_path = legacy_model_path
 
         # Load config
         with open(config_path, "r") as f:
@@ -157,16 +193,64 @@ class TimmModelArchiver(Archiver):
             create_kwargs["drop_rate"] = config["drop_rate"]
 
         # Create model
-        model = timm.create_model(architecture, **create_kwargs)
+        model = self._create_model(architecture, create_kwargs, meta=lazy)
 
-        # Load state dict
-        state_dict = torch.load(model_path, map_location="cpu")
-        model.load_state_dict(state_dict)
+        # Load state dict; both formats are memory-mapped rather than read into memory up front
+        if model_path == legacy_model_path:
+            state_dict = torch.load(model_path, map_location="cpu", mmap=True)
+        else:
+            state_dict = load_file(model_path)
+        self._restore_tied_entries(model, state_dict)
+        model.load_state_dict(state_dict, assign=lazy)
+        if lazy:
+            self._materialize_meta_buffers(model, architecture, create_kwargs)
 
-        self.logger.debug(f"Loaded timm model ({architecture}) from {self.uri}")
+        self.logger.debug(f"Loaded timm model ({architecture}) from {self.uri}{' lazily' if lazy else ''}")
 
         return model
 
+    def _create_model(self, architecture: str, create_kwargs: dict, meta: bool) -> Any:
+        """Create the model, on the ``meta`` device when ``meta`` is set and the architecture allows it."""
+        if not meta:
+            return timm.create_model(architecture, **create_kwargs)
+        try:
+            with torch.device("meta"):
+                return timm.create_model(architecture, **create_kwargs)
+        except Exception as exc:  # e.g. ``.item()`` on a meta tensor inside __init__
+            self.logger.debug(f"Could not build {architecture} on the meta device ({exc}); building on CPU.")
+            return timm.create_model(architecture, **create_kwargs)
+
+    @staticmethod
+    def _restore_tied_entries(model: Any, state_dict: dict[str, torch.Tensor]) -> None:
+        """Add the names that ``save_model`` dropped for tied weights back to ``state_dict``."""
+        tensors = chain(model.named_parameters(remove_duplicate=False), model.named_buffers(remove_duplicate=False))
+        groups: dict[int, list[str]] = {}
+        for name, tensor in tensors:
+            groups.setdefault(id(tensor), []).append(name)
+        for names in groups.values():
+            stored = next((name for name in names if name in state_dict), None)
+            if stored is not None:
+                for name in names:
+                    state_dict.setdefault(name, state_dict[stored])
+
+    def _materialize_meta_buffers(self, model: Any, architecture: str, create_kwargs: dict) -> None:
+        """Fill the non-persistent buffers a meta-device build leaves empty.
+
+        They are read from ``buffers.safetensors`` when the artifact has one; older artifacts fall back to a
+        regular CPU build of the model to copy them from.
+        """
+        missing = [name for name, buffer in model.named_buffers() if buffer is not None and buffer.is_meta]
+        if not missing:
+            return
+        buffers_path = os.path.join(self.uri, "buffers.safetensors")
+        if os.path.exists(buffers_path):
+            source = load_file(buffers_path)
+        else:
+            source = dict(timm.create_model(architecture, **create_kwargs).named_buffers())
+        for name in missing:
+            module_name, _, buffer_name = name.rpartition(".")
+            model.get_submodule(module_name).register_buffer(buffer_name, source[name], persistent=False)
+
 
 def _register_timm_archiver():
     """Register the timm archiver if timm is available.
@@ -14,6 +14,7 @@ callers can import directly from this package::
 from __future__ import annotations
 
 from mindtrace.models.evaluation.metrics.classification import (
+    ClassificationMetricAccumulator,
     accuracy,
     classification_report,
     confusion_matrix,
@@ -22,13 +23,15 @@ from mindtrace.models.evaluation.metrics.classification import (
     top_k_accuracy,
 )
 from mindtrace.models.evaluation.metrics.detection import (
+    DetectionMetricAccumulator,
     average_precision,
     box_iou,
     mean_average_precision,
     mean_average_precision_50_95,
 )
-from mindtrace.models.evaluation.metrics.regression import mae, mse, r2_score, rmse
+from mindtrace.models.evaluation.metrics.regression import RegressionMetricAccumulator, mae, mse, r2_score, rmse
 from mindtrace.models.evaluation.metrics.segmentation import (
+    SegmentationMetricAccumulator,
     dice_score,
     frequency_weighted_iou,
     mean_iou,
@@ -37,6 +40,7 @@ from mindtrace.models.evaluation.metrics.segmentation import (
 
 __all__ = [
     # classification
+    "ClassificationMetricAccumulator",
     "accuracy",
     "classification_report",
     "confusion_matrix",
@@ -44,16 +48,19 @@ __all__ = [
     "roc_auc_score",
     "top_k_accuracy",
     # detection
+    "DetectionMetricAccumulator",
     "average_precision",
     "box_iou",
     "mean_average_precision",
     "mean_average_precision_50_95",
     # regression
+    "RegressionMetricAccumulator",
     "mae",
     "mse",
     "rmse",
     "r2_score",
     # segmentation
+    "SegmentationMetricAccumulator",
     "dice_score",
     "frequency_weighted_iou",
     "mean_iou",
@@ -35,6 +35,96 @@ def _build_confusion_matrix(preds: np.ndarray, targets: np.ndarray, num_classes:
     return cm
 
 
+def _precision_recall_f1_from_confusion_matrix(
+    cm: np.ndarray, average: str
+) -> tuple[float | np.ndarray, float | np.ndarray, float | np.ndarray]:
+    """Derive precision, recall, and F1 from a confusion matrix.
+
+    Args:
+        cm: (num_classes, num_classes) confusion matrix, ``[true, pred]``.
+        average: ``"macro"``, ``"micro"``, ``"weighted"``, or ``"none"``.
+
+    Returns:
+        Tuple of ``(precision, recall, f1)`` as in :func:`precision_recall_f1`.
+    """
+    cm = cm.astype(np.float64)
+    # tp[c] = cm[c, c]
+    tp = np.diag(cm)
+    # fp[c] = sum of column c minus diagonal (predicted as c but was something else)
+    fp = cm.sum(axis=0) - tp
+    # fn[c] = sum of row c minus diagonal (true class c but predicted as something else)
+    fn = cm.sum(axis=1) - tp
+    support = cm.sum(axis=1)  # true count per class
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        prec_per_class = np.where((tp + fp) > 0, tp / (tp + fp), 0.0)
+        rec_per_class = np.where((tp + fn) > 0, tp / (tp + fn), 0.0)
+        f1_per_class = np.where(
+            (prec_per_class + rec_per_class) > 0,
+            2 * prec_per_class * rec_per_class / (prec_per_class + rec_per_class),
+            0.0,
+        )
+
+    if average == "none":
+        return prec_per_class, rec_per_class, f1_per_class
+
+    if average == "macro":
+        return float(np.mean(prec_per_class)), float(np.mean(rec_per_class)), float(np.mean(f1_per_class))
+
+    if average == "weighted":
+        total = support.sum()
+        if total == 0:
+            return 0.0, 0.0, 0.0
+        weights = support / total
+        return (
+            float(np.dot(prec_per_class, weights)),
+            float(np.dot(rec_per_class, weights)),
+            float(np.dot(f1_per_class, weights)),
+        )
+
+    # average == "micro": aggregate TP, FP, FN globally
+    tp_total = tp.sum()
+    fp_total = fp.sum()
+    fn_total = fn.sum()
+    micro_prec = tp_total / (tp_total + fp_total) if (tp_total + fp_total) > 0 else 0.0
+    micro_rec = tp_total / (tp_total + fn_total) if (tp_total + fn_total) > 0 else 0.0
+    denom = micro_prec + micro_rec
+    micro_f1 = 2 * micro_prec * micro_rec / denom if denom > 0 else 0.0
+    return float(micro_prec), float(micro_rec), float(micro_f1)
+
+
+def _classification_report_from_confusion_matrix(cm: np.ndarray, class_names: list[str] | None) -> dict[str, Any]:
+    """Build the :func:`classification_report` dict from a non-empty confusion matrix."""
+    num_classes = cm.shape[0]
+    prec_none, rec_none, f1_none = _precision_recall_f1_from_confusion_matrix(cm, "none")
+    support = cm.sum(axis=1).astype(np.int64)
+
+    per_class: dict[str | int, dict[str, float | int]] = {}
+    for c in range(num_classes):
+        key: str | int = class_names[c] if class_names is not None else c
+        per_class[key] = {
+            "precision": float(prec_none[c]),  # type: ignore[index]
+            "recall": float(rec_none[c]),  # type: ignore[index]
+            "f1": float(f1_none[c]),  # type: ignore[index]
+            "support": int(support[c]),
+        }
+
+    macro_p, macro_r, macro_f = _precision_recall_f1_from_confusion_matrix(cm, "macro")
+    micro_p, micro_r, micro_f = _precision_recall_f1_from_confusion_matrix(cm, "micro")
+    weighted_p, weighted_r, weighted_f = _precision_recall_f1_from_confusion_matrix(cm, "weighted")
+    num_samples = int(cm.sum())
+
+    return {
+        "per_class": per_class,
+        "macro": {"precision": macro_p, "recall": macro_r, "f1": macro_f},
+        "micro": {"precision": micro_p, "recall": micro_r, "f1": micro_f},
+        "weighted": {"precision": weighted_p, "recall": weighted_r, "f1": weighted_f},
+        "accuracy": float(np.trace(cm) / num_samples),
+        "num_samples": num_samples,
+        "num_classes": num_classes,
+    }
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -131,50 +221,7 @@ def precision_recall_f1(
     if average not in valid_averages:
         raise ValueError(f"average must be one of {valid_averages}, got '{average}'.")
 
-    cm = _build_confusion_matrix(preds, targets, num_classes).astype(np.float64)
-    # tp[c] = cm[c, c]
-    tp = np.diag(cm)
-    # fp[c] = sum of column c minus diagonal (predicted as c but was something else)
-    fp = cm.sum(axis=0) - tp
-    # fn[c] = sum of row c minus diagonal (true class c but predicted as something else)
-    fn = cm.sum(axis=1) - tp
-    support = cm.sum(axis=1)  # true count per class
-
-    with np.errstate(divide="ignore", invalid="ignore"):
-        prec_per_class = np.where((tp + fp) > 0, tp / (tp + fp), 0.0)
-        rec_per_class = np.where((tp + fn) > 0, tp / (tp + fn), 0.0)
-        f1_per_class = np.where(
-            (prec_per_class + rec_per_class) > 0,
-            2 * prec_per_class * rec_per_class / (prec_per_class + rec_per_class),
-            0.0,
-        )
-
-    if average == "none":
-        return prec_per_class, rec_per_class, f1_per_class
-
-    if average == "macro":
-        return float(np.mean(prec_per_class)), float(np.mean(rec_per_class)), float(np.mean(f1_per_class))
-
-    if average == "weighted":
-        total = support.sum()
-        if total == 0:
-            return 0.0, 0.0, 0.0
-        weights = support / total
-        return (
-            float(np.dot(prec_per_class, weights)),
-            float(np.dot(rec_per_class, weights)),
-            float(np.dot(f1_per_class, weights)),
-        )
-
-    # average == "micro": aggregate TP, FP, FN globally
-    tp_total = tp.sum()
-    fp_total = fp.sum()
-    fn_total = fn.sum()
-    micro_prec = tp_total / (tp_total + fp_total) if (tp_total + fp_total) > 0 else 0.0
-    micro_rec = tp_total / (tp_total + fn_total) if (tp_total + fn_total) > 0 else 0.0
-    denom = micro_prec + micro_rec
-    micro_f1 = 2 * micro_prec * micro_rec / denom if denom > 0 else 0.0
-    return float(micro_prec), float(micro_rec), float(micro_f1)
+    return _precision_recall_f1_from_confusion_matrix(_build_confusion_matrix(preds, targets, num_classes), average)
 
 
 def confusion_matrix(preds: np.ndarray, targets: np.ndarray, num_classes: int) -> np.ndarray:
@@ -322,37 +369,119 @@ def classification_report(
 
     preds_arr = np.asarray(preds, dtype=np.int64).ravel()
     targets_arr = np.asarray(targets, dtype=np.int64).ravel()
+    if preds_arr.shape[0] == 0:
+        raise ValueError("preds and targets must not be empty.")
+    if preds_arr.shape != targets_arr.shape:
+        raise ValueError(f"Shape mismatch: preds {preds_arr.shape} vs targets {targets_arr.shape}.")
 
-    prec_none, rec_none, f1_none = precision_recall_f1(preds_arr, targets_arr, num_classes, average="none")
-    cm = _build_confusion_matrix(preds_arr, targets_arr, num_classes)
-    support = cm.sum(axis=1).astype(np.int64)
+    return _classification_report_from_confusion_matrix(
+        _build_confusion_matrix(preds_arr, targets_arr, num_classes), class_names
+    )
 
-    per_class: dict[str | int, dict[str, float | int]] = {}
-    for c in range(num_classes):
-        key: str | int = class_names[c] if class_names is not None else c
-        per_class[key] = {
-            "precision": float(prec_none[c]),  # type: ignore[index]
-            "recall": float(rec_none[c]),  # type: ignore[index]
-            "f1": float(f1_none[c]),  # type: ignore[index]
-            "support": int(support[c]),
-        }
 
-    macro_p, macro_r, macro_f = precision_recall_f1(preds_arr, targets_arr, num_classes, average="macro")
-    micro_p, micro_r, micro_f = precision_recall_f1(preds_arr, targets_arr, num_classes, average="micro")
-    weighted_p, weighted_r, weighted_f = precision_recall_f1(preds_arr, targets_arr, num_classes, average="weighted")
+class ClassificationMetricAccumulator:
+    """Streaming classification metrics backed by a single confusion matrix.
 
-    return {
-        "per_class": per_class,
-        "macro": {"precision": macro_p, "recall": macro_r, "f1": macro_f},
-        "micro": {"precision": micro_p, "recall": micro_r, "f1": micro_f},
-        "weighted": {"precision": weighted_p, "recall": weighted_r, "f1": weighted_f},
-        "accuracy": accuracy(preds_arr, targets_arr),
-        "num_samples": int(preds_arr.shape[0]),
-        "num_classes": num_classes,
-    }
+    :meth:`update` folds one batch into a ``(num_classes, num_classes)``
+    int64 confusion matrix, so memory does not grow with the number of
+    samples.  Accumulators built over disjoint shards combine exactly with
+    :meth:`merge`, and :meth:`compute` returns the same values as calling
+    :func:`accuracy`, :func:`precision_recall_f1` and
+    :func:`classification_report` on the concatenated arrays.
+
+    Args:
+        num_classes: Total number of classes.
+
+    Example::
+
+        acc = ClassificationMetricAccumulator(num_classes=10)
+        for preds, targets in batches:
+            acc.update(preds, targets)
+        acc.compute()["f1"]
+    """
+
+    def __init__(self, num_classes: int) -> None:
+        self.num_classes = int(num_classes)
+        self.reset()
+
+    def reset(self) -> None:
+        """Zero the confusion matrix."""
+        self._cm = np.zeros((self.num_classes, self.num_classes), dtype=np.int64)
+
+    @property
+    def num_samples(self) -> int:
+        """Number of samples accumulated so far."""
+        return int(self._cm.sum())
+
+    @property
+    def confusion_matrix(self) -> np.ndarray:
+        """Copy of the accumulated ``[true, pred]`` confusion matrix."""
+        return self._cm.copy()
+
+    def update(self, preds: np.ndarray, targets: np.ndarray) -> None:
+        """Add one batch of predictions.
+
+        Args:
+            preds: (N,) integer class index predictions.
+            targets: (N,) integer class index ground-truth labels.
+
+        Raises:
+            ValueError: If shapes differ or a label falls outside
+                ``[0, num_classes)``.
+        """
+        preds = np.asarray(preds, dtype=np.int64).ravel()
+        targets = np.asarray(targets, dtype=np.int64).ravel()
+        if preds.shape != targets.shape:
+            raise ValueError(f"Shape mismatch: preds {preds.shape} vs targets {targets.shape}.")
+        if preds.shape[0] == 0:
+            return
+        low = min(int(preds.min()), int(targets.min()))
+        high = max(int(preds.max()), int(targets.max()))
+        if low < 0 or high >= self.num_classes:
+            raise ValueError(f"Class indices must lie in [0, {self.num_classes}), got values in [{low}, {high}].")
+        self._cm += _build_confusion_matrix(preds, targets, self.num_classes)
+
+    def merge(self, other: ClassificationMetricAccumulator) -> None:
+        """Add the counts of another accumulator with the same number of classes.
+
+        Raises:
+            ValueError: If *other* has a different ``num_classes``.
+        """
+        if other.num_classes != self.num_classes:
+            raise ValueError(f"Cannot merge accumulators with {other.num_classes} and {self.num_classes} classes.")
+        self._cm += other._cm
+
+    def compute(self, class_names: list[str] | None = None) -> dict[str, Any]:
+        """Return the accumulated metrics.
+
+        Args:
+            class_names: Optional class names used to key the per-class
+                entries of the report.
+
+        Returns:
+            Dictionary with ``accuracy``, macro ``precision``, ``recall`` and
+            ``f1``, and the full ``classification_report``.
+
+        Raises:
+            ValueError: If nothing has been accumulated, or *class_names* has
+                the wrong length.
+        """
+        if self.num_samples == 0:
+            raise ValueError("preds and targets must not be empty.")
+        if class_names is not None and len(class_names) != self.num_classes:
+            raise ValueError(f"class_names has {len(class_names)} entries but num_classes={self.num_classes}.")
+        report = _classification_report_from_confusion_matrix(self._cm, class_names)
+        return {
+            "accuracy": report["accuracy"],
+            "precision": report["macro"]["precision"],
+            "recall": report["macro"]["recall"],
+            "f1": report["macro"]["f1"],
+            "classification_report": report,
+        }
 
 
 __all__ = [
+    "ClassificationMetricAccumulator",
     "accuracy",
     "classification_report",
     "confusion_matrix",
@@ -3,72 +3,62 @@
 Provides IoU computation, per-class Average Precision (AP) with 101-point
 interpolation, mean Average Precision (mAP) at a fixed IoU threshold, and
 COCO-style mAP averaged over IoU thresholds 0.50:0.05:0.95.
+
+:class:`DetectionMetricAccumulator` is the engine behind the mAP functions: it
+computes one IoU matrix per image, matches every IoU threshold in the same
+pass, and can be fed batch by batch with :meth:`~DetectionMetricAccumulator.update`.
 """
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+
 import numpy as np
 
+# COCO IoU thresholds [0.50, 0.55, …, 0.95].
+COCO_IOU_THRESHOLDS: np.ndarray = np.arange(0.50, 1.00, 0.05)
+
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
 
 
-def _match_predictions(
-    pred_boxes: np.ndarray,
-    pred_scores: np.ndarray,
-    gt_boxes: np.ndarray,
-    iou_threshold: float,
-) -> tuple[np.ndarray, np.ndarray]:
-    """Match predictions to ground-truth boxes for a single image and class.
+def _match_predictions(iou: np.ndarray, iou_thresholds: np.ndarray) -> np.ndarray:
+    """Greedily match predictions to ground-truth boxes at every IoU threshold at once.
 
-    Greedy matching: predictions are sorted by descending score.  Each
-    prediction is matched to the unmatched GT box with the highest IoU above
-    *iou_threshold* (if any).
+    Predictions are taken in row order (callers sort rows by descending
+    score).  At each threshold, a prediction is matched to the unmatched GT
+    box with the highest IoU strictly above the threshold; ties go to the
+    lowest GT index.
 
     Args:
-        pred_boxes: (N, 4) predicted boxes in xyxy format.
-        pred_scores: (N,) confidence scores.
-        gt_boxes: (M, 4) ground-truth boxes in xyxy format.
-        iou_threshold: Minimum IoU for a valid match.
+        iou: (N, M) IoU matrix between score-sorted predictions and GT boxes.
+        iou_thresholds: (T,) IoU thresholds.
 
     Returns:
-        Tuple of:
-
-        * ``matched_scores`` — (N,) confidence scores sorted by descending
-          confidence.
-        * ``is_tp`` — (N,) bool array; ``True`` where the prediction was
-          matched to a unique GT box.
+        (N, T) bool array; ``True`` where the prediction was matched to a
+        unique GT box at that threshold.
     """
-    n_preds = pred_boxes.shape[0]
-    n_gt = gt_boxes.shape[0]
-
-    order = np.argsort(-pred_scores)
-    sorted_scores = pred_scores[order]
-    sorted_boxes = pred_boxes[order]
-
-    is_tp = np.zeros(n_preds, dtype=bool)
-
+    n_preds, n_gt = iou.shape
+    is_tp = np.zeros((n_preds, iou_thresholds.shape[0]), dtype=bool)
     if n_gt == 0:
-        return sorted_scores, is_tp
+        return is_tp
 
-    gt_matched = np.zeros(n_gt, dtype=bool)
-    iou_mat = box_iou(sorted_boxes, gt_boxes)  # (N, M)
+    cutoffs = iou_thresholds - 1e-10  # require strictly above threshold
+    # Rows that clear no threshold are false positives everywhere and cannot claim a GT box.
+    candidates = np.flatnonzero(iou.max(axis=1) > cutoffs.min())
+    if candidates.shape[0] == 0:
+        return is_tp
 
-    for i in range(n_preds):
-        best_iou = iou_threshold - 1e-10  # require strictly above threshold
-        best_j = -1
-        for j in range(n_gt):
-            if gt_matched[j]:
-                continue
-            if iou_mat[i, j] > best_iou:
-                best_iou = iou_mat[i, j]
-                best_j = j
-        if best_j >= 0:
-            is_tp[i] = True
-            gt_matched[best_j] = True
-
-    return sorted_scores, is_tp
+    gt_taken = np.zeros((iou_thresholds.shape[0], n_gt), dtype=bool)
+    rows = np.arange(iou_thresholds.shape[0])
+    for i in candidates:
+        available = np.where(gt_taken, -1.0, iou[i])
+        best_j = available.argmax(axis=1)
+        matched = available[rows, best_j] > cutoffs
+        is_tp[i] = matched
+        gt_taken[rows[matched], best_j[matched]] = True
+    return is_tp
 
 
 # ---------------------------------------------------------------------------
@@ -151,25 +141,206 @@ def average_precision(
 
     # Sort by descending score.
     order = np.argsort(-pred_scores)
-    matched_sorted = pred_matched[order]
+    return _interpolated_average_precision(pred_matched[order], num_gt)
+
 
+def _interpolated_average_precision(matched_sorted: np.ndarray, num_gt: int) -> float:
+    """101-point interpolated AP for match flags already sorted by descending score."""
     cum_tp = np.cumsum(matched_sorted.astype(np.float64))
     cum_fp = np.cumsum((~matched_sorted).astype(np.float64))
 
     precision_curve = cum_tp / (cum_tp + cum_fp)
     recall_curve = cum_tp / num_gt
 
-    # 101-point interpolation at recall thresholds [0.0, 0.01, ..., 1.0].
+    # 101-point interpolation at recall thresholds [0.0, 0.01, ..., 1.0]:
+    # maximum precision at recall >= r, read off the right-to-left running max.
     recall_thresholds = np.linspace(0.0, 1.0, 101)
-    ap = 0.0
-    for r in recall_thresholds:
-        # Maximum precision at recall >= r.
-        mask = recall_curve >= r
-        ap += np.max(precision_curve[mask]) if mask.any() else 0.0
+    precision_envelope = np.maximum.accumulate(precision_curve[::-1])[::-1]
+    first_reaching = np.searchsorted(recall_curve, recall_thresholds, side="left")
+    reached = first_reaching < recall_curve.shape[0]
+    interpolated = np.zeros(101)
+    interpolated[reached] = precision_envelope[first_reaching[reached]]
 
+    # Plain left-to-right addition (builtin sum() compensates) keeps results bit-identical to a per-threshold loop.
+    ap = 0.0
+    for value in interpolated.tolist():
+        ap += value
     return float(ap / 101)
 
 
+class DetectionMetricAccumulator:
+    """Streaming mAP over one or more IoU thresholds.
+
+    Call :meth:`update` once per batch of images and :meth:`compute` at the
+    end.  Per image, one IoU matrix is computed per class and predictions are
+    matched at all thresholds in a single pass.  State is a label, a score
+    and a ``(T,)`` bool match row per prediction, packed into one array each
+    per batch, plus per-class GT counts; boxes are never kept.
+
+    Results are identical to evaluating each threshold separately with the
+    greedy matching described in :func:`mean_average_precision`.
+
+    Args:
+        num_classes: Total number of classes.  Labels outside
+            ``[0, num_classes)`` are ignored.
+        iou_thresholds: IoU thresholds for a true-positive match.  Defaults
+            to the COCO thresholds 0.50:0.05:0.95.
+
+    Example::
+
+        acc = DetectionMetricAccumulator(num_classes=80)
+        for preds, targets in batches:
+            acc.update(preds, targets)
+        acc.compute()["mAP"]  # COCO mAP@50:95
+    """
+
+    def __init__(self, num_classes: int, iou_thresholds: Sequence[float] | np.ndarray = COCO_IOU_THRESHOLDS) -> None:
+        self.num_classes = int(num_classes)
+        self.iou_thresholds = np.asarray(iou_thresholds, dtype=np.float64).ravel()
+        if self.iou_thresholds.shape[0] == 0:
+            raise ValueError("iou_thresholds must contain at least one threshold.")
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop all accumulated predictions and GT counts."""
+        self._labels: list[np.ndarray] = []
+        self._scores: list[np.ndarray] = []
+        self._matched: list[np.ndarray] = []
+        self._num_gt = np.zeros(self.num_classes, dtype=np.int64)
+        self.num_images = 0
+
+    def update(self, predictions: list[dict], targets: list[dict]) -> None:
+        """Match one batch of images and fold the result into the running state.
+
+        Args:
+            predictions: Per-image prediction dicts with ``"boxes"``,
+                ``"scores"`` and ``"labels"`` (see :func:`mean_average_precision`).
+            targets: Per-image ground-truth dicts with ``"boxes"`` and
+                ``"labels"``.
+
+        Raises:
+            ValueError: If *predictions* and *targets* have different lengths.
+        """
+        if len(predictions) != len(targets):
+            raise ValueError(f"predictions ({len(predictions)}) and targets ({len(targets)}) must have equal length.")
+
+        n_thresholds = self.iou_thresholds.shape[0]
+        labels: list[np.ndarray] = []
+        scores: list[np.ndarray] = []
+        matched: list[np.ndarray] = []
+
+        for pred, tgt in zip(predictions, targets):
+            pred_boxes = np.asarray(pred.get("boxes", np.zeros((0, 4))), dtype=np.float64).reshape(-1, 4)
+            pred_scores = np.asarray(pred.get("scores", np.zeros(0)), dtype=np.float64).ravel()
+            pred_labels = np.asarray(pred.get("labels", np.zeros(0, dtype=np.int64)), dtype=np.int64).ravel()
+            gt_boxes = np.asarray(tgt.get("boxes", np.zeros((0, 4))), dtype=np.float64).reshape(-1, 4)
+            gt_labels = np.asarray(tgt.get("labels", np.zeros(0, dtype=np.int64)), dtype=np.int64).ravel()
+            self.num_images += 1
+
+            gt_valid = (gt_labels >= 0) & (gt_labels < self.num_classes)
+            gt_per_class = np.bincount(gt_labels[gt_valid], minlength=self.num_classes)
+            self._num_gt += gt_per_class
+
+            pred_valid = (pred_labels >= 0) & (pred_labels < self.num_classes)
+            pred_has_gt = np.zeros(pred_labels.shape[0], dtype=bool)
+            pred_has_gt[pred_valid] = gt_per_class[pred_labels[pred_valid]] > 0
+
+            # Predictions of classes with no GT in this image are false positives at every threshold.
+            unmatched = pred_valid & ~pred_has_gt
+            if unmatched.any():
+                labels.append(pred_labels[unmatched])
+                scores.append(pred_scores[unmatched])
+                matched.append(np.zeros((int(unmatched.sum()), n_thresholds), dtype=bool))
+            if not pred_has_gt.any():
+                continue
+
+            # One IoU matrix per image; each class matches on its own block of it.
+            pred_rows = np.flatnonzero(pred_has_gt)
+            iou = box_iou(pred_boxes[pred_rows], gt_boxes)
+            for c in np.unique(pred_labels[pred_rows]).tolist():
+                rows = np.flatnonzero(pred_labels[pred_rows] == c)
+                order = rows[np.argsort(-pred_scores[pred_rows[rows]])]
+                labels.append(np.full(order.shape[0], c, dtype=np.int64))
+                scores.append(pred_scores[pred_rows[order]])
+                matched.append(
+                    _match_predictions(iou[np.ix_(order, np.flatnonzero(gt_labels == c))], self.iou_thresholds)
+                )
+
+        if labels:
+            self._labels.append(np.concatenate(labels).astype(np.int32))
+            self._scores.append(np.concatenate(scores))
+            self._matched.append(np.concatenate(matched))
+
+    def merge(self, other: DetectionMetricAccumulator) -> None:
+        """Append another accumulator's matches, as if its batches were passed to :meth:`update` next.
+
+        Merging shards in dataset order gives exactly the result of one
+        accumulator over the whole dataset.
+
+        Raises:
+            ValueError: If *other* has a different ``num_classes`` or IoU thresholds.
+        """
+        if other.num_classes != self.num_classes or not np.array_equal(other.iou_thresholds, self.iou_thresholds):
+            raise ValueError("Cannot merge accumulators with different num_classes or iou_thresholds.")
+        self._labels.extend(other._labels)
+        self._scores.extend(other._scores)
+        self._matched.extend(other._matched)
+        self._num_gt += other._num_gt
+        self.num_images += other.num_images
+
+    def average_precisions(self) -> np.ndarray:
+        """Return the ``(num_classes, T)`` AP matrix; rows of classes without GT boxes are ``NaN``."""
+        ap = np.full((self.num_classes, self.iou_thresholds.shape[0]), np.nan)
+        ap[self._num_gt > 0] = 0.0
+        if not self._labels:
+            return ap
+        labels = np.concatenate(self._labels)
+        # Stable grouping keeps each class's predictions in update order.
+        by_class = np.argsort(labels, kind="stable")
+        class_ids, starts = np.unique(labels[by_class], return_index=True)
+        groups = np.split(by_class, starts[1:])
+        scores = np.concatenate(self._scores)
+        matched = np.concatenate(self._matched)
+        for c, group in zip(class_ids.tolist(), groups):
+            num_gt = int(self._num_gt[c])
+            if num_gt == 0:
+                continue
+            class_scores = scores[group]
+            class_matched = matched[group][np.argsort(-class_scores)]
+            for t in range(self.iou_thresholds.shape[0]):
+                ap[c, t] = _interpolated_average_precision(class_matched[:, t], num_gt)
+        return ap
+
+    def compute(self) -> dict:
+        """Return the accumulated metrics.
+
+        Returns:
+            Dictionary with:
+
+            * ``"mAP"`` — mAP averaged over the IoU thresholds.
+            * ``"mAP_per_threshold"`` — ``{threshold: float}`` mAP at each
+              threshold, keyed by the threshold rounded to two decimals.
+            * ``"AP_per_class"`` — ``{class_id: float}`` per-class AP
+              averaged over thresholds; ``0.0`` for classes without GT.
+            * ``"AP_per_class_per_threshold"`` — ``{threshold: {class_id: float}}``.
+        """
+        ap = self.average_precisions()
+        has_gt = ~np.isnan(ap[:, 0])
+        map_per_threshold = {
+            round(float(iou_t), 2): float(np.mean(ap[has_gt, t].tolist())) if has_gt.any() else 0.0
+            for t, iou_t in enumerate(self.iou_thresholds)
+        }
+        return {
+            "mAP": float(np.mean(list(map_per_threshold.values()))),
+            "mAP_per_threshold": map_per_threshold,
+            "AP_per_class": {c: float(np.mean(ap[c].tolist())) if has_gt[c] else 0.0 for c in range(self.num_classes)},
+            "AP_per_class_per_threshold": {
+                round(float(iou_t), 2): {c: float(ap[c, t]) if has_gt[c] else 0.0 for c in range(self.num_classes)}
+                for t, iou_t in enumerate(self.iou_thresholds)
+            },
+        }
+
+
 def mean_average_precision(
     predictions: list[dict],
     targets: list[dict],
@@ -203,70 +374,12 @@ def mean_average_precision(
     Raises:
         ValueError: If *predictions* and *targets* have different lengths.
     """
-    if len(predictions) != len(targets):
-        raise ValueError(f"predictions ({len(predictions)}) and targets ({len(targets)}) must have equal length.")
-
-    # Aggregate per-class scores, matched flags, and GT counts.
-    class_scores: dict[int, list[np.ndarray]] = {c: [] for c in range(num_classes)}
-    class_matched: dict[int, list[np.ndarray]] = {c: [] for c in range(num_classes)}
-    class_num_gt: dict[int, int] = {c: 0 for c in range(num_classes)}
-
-    for pred, tgt in zip(predictions, targets):
-        pred_boxes = np.asarray(pred.get("boxes", np.zeros((0, 4))), dtype=np.float64)
-        pred_scores_img = np.asarray(pred.get("scores", np.zeros(0)), dtype=np.float64)
-        pred_labels = np.asarray(pred.get("labels", np.zeros(0, dtype=np.int64)), dtype=np.int64)
-
-        gt_boxes = np.asarray(tgt.get("boxes", np.zeros((0, 4))), dtype=np.float64)
-        gt_labels = np.asarray(tgt.get("labels", np.zeros(0, dtype=np.int64)), dtype=np.int64)
-
-        for c in range(num_classes):
-            pred_mask = pred_labels == c
-            gt_mask = gt_labels == c
-
-            c_pred_boxes = pred_boxes[pred_mask] if pred_mask.any() else np.zeros((0, 4))
-            c_pred_scores = pred_scores_img[pred_mask] if pred_mask.any() else np.zeros(0)
-            c_gt_boxes = gt_boxes[gt_mask] if gt_mask.any() else np.zeros((0, 4))
-            c_num_gt = int(gt_mask.sum())
-
-            class_num_gt[c] += c_num_gt
-
-            if c_pred_boxes.shape[0] == 0:
-                continue
-
-            if c_gt_boxes.shape[0] == 0:
-                # All predictions are false positives for this class on this image.
-                class_scores[c].append(c_pred_scores)
-                class_matched[c].append(np.zeros(c_pred_boxes.shape[0], dtype=bool))
-                continue
-
-            sorted_scores, is_tp = _match_predictions(c_pred_boxes, c_pred_scores, c_gt_boxes, iou_threshold)
-            class_scores[c].append(sorted_scores)
-            class_matched[c].append(is_tp)
-
-    ap_per_class: dict[int, float] = {}
-    ap_values: list[float] = []
-
-    for c in range(num_classes):
-        if class_num_gt[c] == 0:
-            ap_per_class[c] = 0.0
-            continue
-
-        if class_scores[c]:
-            all_scores = np.concatenate(class_scores[c])
-            all_matched = np.concatenate(class_matched[c])
-        else:
-            all_scores = np.zeros(0)
-            all_matched = np.zeros(0, dtype=bool)
-
-        ap = average_precision(all_scores, all_matched, class_num_gt[c])
-        ap_per_class[c] = ap
-        ap_values.append(ap)
-
-    map_value = float(np.mean(ap_values)) if ap_values else 0.0
-
+    accumulator = DetectionMetricAccumulator(num_classes, iou_thresholds=[iou_threshold])
+    accumulator.update(predictions, targets)
+    result = accumulator.compute()
     return {
-        "mAP": map_value,
-        "AP_per_class": ap_per_class,
+        "mAP": result["mAP"],
+        "AP_per_class": result["AP_per_class"],
     }
 
 
@@ -291,25 +404,31 @@ def mean_average_precision_50_95(
         * ``"mAP@50"`` — mAP at IoU 0.50.
         * ``"mAP@75"`` — mAP at IoU 0.75.
     """
-    thresholds = np.arange(0.50, 1.00, 0.05)  # [0.50, 0.55, …, 0.95]
-    map_at_threshold: dict[float, float] = {}
+    accumulator = DetectionMetricAccumulator(num_classes)
+    accumulator.update(predictions, targets)
+    return coco_map_summary(accumulator.compute())
 
-    for iou_t in thresholds:
-        result = mean_average_precision(predictions, targets, num_classes, iou_threshold=float(iou_t))
-        map_at_threshold[round(float(iou_t), 2)] = result["mAP"]
 
-    map_50_95 = float(np.mean(list(map_at_threshold.values())))
+def coco_map_summary(result: dict) -> dict[str, float]:
+    """Reduce a COCO-threshold :meth:`DetectionMetricAccumulator.compute` result to the headline keys.
 
+    Returns:
+        Dictionary with ``"mAP@50:95"``, ``"mAP@50"`` and ``"mAP@75"``.
+    """
+    map_at_threshold = result["mAP_per_threshold"]
     return {
-        "mAP@50:95": map_50_95,
+        "mAP@50:95": result["mAP"],
         "mAP@50": map_at_threshold.get(0.5, 0.0),
         "mAP@75": map_at_threshold.get(0.75, 0.0),
     }
 
 
 __all__ = [
+    "COCO_IOU_THRESHOLDS",
+    "DetectionMetricAccumulator",
     "average_precision",
     "box_iou",
+    "coco_map_summary",
     "mean_average_precision",
     "mean_average_precision_50_95",
 ]
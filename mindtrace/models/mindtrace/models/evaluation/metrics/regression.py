@@ -81,4 +81,100 @@ def r2_score(predictions: np.ndarray, targets: np.ndarray) -> float:
     return float(1.0 - ss_res / ss_tot)
 
 
-__all__ = ["mae", "mse", "rmse", "r2_score"]
+class RegressionMetricAccumulator:
+    """Streaming MAE, MSE, RMSE and R² from running sums.
+
+    State is five scalars: the sample count, the sums of absolute and squared
+    errors, and the running mean and sum of squared deviations of the
+    targets (combined across batches with Chan et al.'s parallel update), so
+    memory is constant.  Results agree with :func:`mae`, :func:`mse`,
+    :func:`rmse` and :func:`r2_score` on the concatenated arrays up to
+    floating-point rounding.
+
+    Example::
+
+        acc = RegressionMetricAccumulator()
+        for preds, targets in batches:
+            acc.update(preds, targets)
+        acc.compute()["r2"]
+    """
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop all accumulated statistics."""
+        self.num_samples = 0
+        self._sum_abs_error = 0.0
+        self._sum_sq_error = 0.0
+        self._target_mean = 0.0
+        self._target_m2 = 0.0
+
+    def update(self, predictions: np.ndarray, targets: np.ndarray) -> None:
+        """Add one batch.
+
+        Args:
+            predictions: Predicted values array.
+            targets: Ground-truth values array with the same number of elements.
+
+        Raises:
+            ValueError: If the arrays have different numbers of elements.
+        """
+        preds = np.asarray(predictions, dtype=np.float64).ravel()
+        tgts = np.asarray(targets, dtype=np.float64).ravel()
+        if preds.shape != tgts.shape:
+            raise ValueError(f"Shape mismatch: predictions {preds.shape} vs targets {tgts.shape}.")
+        if preds.shape[0] == 0:
+            return
+        errors = tgts - preds
+        batch_mean = float(np.mean(tgts))
+        self._combine(
+            preds.shape[0],
+            float(np.sum(np.abs(errors))),
+            float(np.sum(errors**2)),
+            batch_mean,
+            float(np.sum((tgts - batch_mean) ** 2)),
+        )
+
+    def merge(self, other: RegressionMetricAccumulator) -> None:
+        """Fold another accumulator's statistics into this one."""
+        if other.num_samples:
+            self._combine(
+                other.num_samples, other._sum_abs_error, other._sum_sq_error, other._target_mean, other._target_m2
+            )
+
+    def _combine(self, count: int, sum_abs_error: float, sum_sq_error: float, mean: float, m2: float) -> None:
+        """Merge the statistics of *count* further samples into the running state."""
+        total = self.num_samples + count
+        delta = mean - self._target_mean
+        self._target_m2 += m2 + delta * delta * self.num_samples * count / total
+        self._target_mean += delta * count / total
+        self._sum_abs_error += sum_abs_error
+        self._sum_sq_error += sum_sq_error
+        self.num_samples = total
+
+    def compute(self) -> dict[str, float]:
+        """Return the accumulated metrics.
+
+        Returns:
+            Dictionary with ``mae``, ``mse``, ``rmse`` and ``r2``.
+
+        Raises:
+            ValueError: If nothing has been accumulated.
+        """
+        if self.num_samples == 0:
+            raise ValueError("predictions and targets must not be empty.")
+        mse_value = self._sum_sq_error / self.num_samples
+        if self._target_m2 == 0.0:
+            r2 = 1.0 if self._sum_sq_error == 0.0 else 0.0
+        else:
+            r2 = 1.0 - self._sum_sq_error / self._target_m2
+        return {
+            "mae": self._sum_abs_error / self.num_samples,
+            "mse": mse_value,
+            "rmse": float(np.sqrt(mse_value)),
+            "r2": float(r2),
+        }
+
+
+__all__ = ["RegressionMetricAccumulator", "mae", "mse", "rmse", "r2_score"]
@@ -32,19 +32,21 @@ def _segmentation_confusion_matrix(
     Returns:
         (num_classes, num_classes) int64 confusion matrix.
     """
-    preds = np.asarray(preds, dtype=np.int64).ravel()
-    targets = np.asarray(targets, dtype=np.int64).ravel()
+    preds = np.asarray(preds).ravel()
+    targets = np.asarray(targets).ravel()
 
+    # Boolean indexing copies, so the in-place steps below never touch the caller's arrays.
     valid_mask = targets != ignore_index
-    preds = preds[valid_mask]
-    targets = targets[valid_mask]
+    preds = preds[valid_mask].astype(np.int64, copy=False)
+    targets = targets[valid_mask].astype(np.int64, copy=False)
 
     # Clamp predictions that are out-of-range to avoid corrupting the matrix.
-    preds = np.clip(preds, 0, num_classes - 1)
-    targets = np.clip(targets, 0, num_classes - 1)
+    np.clip(preds, 0, num_classes - 1, out=preds)
+    np.clip(targets, 0, num_classes - 1, out=targets)
 
-    flat = targets * num_classes + preds
-    cm = np.bincount(flat, minlength=num_classes * num_classes).reshape(num_classes, num_classes)
+    targets *= num_classes
+    targets += preds
+    cm = np.bincount(targets, minlength=num_classes * num_classes).reshape(num_classes, num_classes)
     return cm.astype(np.int64)
 
 
@@ -68,13 +70,61 @@ def _confusion_stats(
         num_classes)`` float64 confusion matrix and *tp*, *fp*, *fn* are
         1-D float64 arrays of length *num_classes*.
     """
-    cm = _segmentation_confusion_matrix(preds, targets, num_classes, ignore_index).astype(np.float64)
+    return _stats_from_confusion_matrix(_segmentation_confusion_matrix(preds, targets, num_classes, ignore_index))
+
+
+def _stats_from_confusion_matrix(cm: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Derive per-class TP, FP, FN from an integer confusion matrix.
+
+    Returns:
+        Tuple ``(cm, tp, fp, fn)`` as float64 arrays, as in :func:`_confusion_stats`.
+    """
+    cm = cm.astype(np.float64)
     tp = np.diag(cm)
     fp = cm.sum(axis=0) - tp
     fn = cm.sum(axis=1) - tp
     return cm, tp, fp, fn
 
 
+def _mean_iou_from_confusion_matrix(cm: np.ndarray) -> dict[str, float | list[float]]:
+    """Compute the :func:`mean_iou` result from an integer confusion matrix."""
+    _, tp, fp, fn = _stats_from_confusion_matrix(cm)
+    denom = tp + fp + fn
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        iou_per_class = np.where(denom > 0, tp / denom, np.nan)
+
+    valid = ~np.isnan(iou_per_class)
+    miou = float(np.mean(iou_per_class[valid])) if valid.any() else 0.0
+
+    # Replace NaN with 0.0 for the returned list so callers get plain floats.
+    iou_list = [float(v) if not np.isnan(v) else 0.0 for v in iou_per_class]
+
+    return {
+        "mIoU": miou,
+        "iou_per_class": iou_list,
+    }
+
+
+def _dice_from_confusion_matrix(cm: np.ndarray) -> dict[str, float | list[float]]:
+    """Compute the :func:`dice_score` result from an integer confusion matrix."""
+    _, tp, fp, fn = _stats_from_confusion_matrix(cm)
+    denom = 2.0 * tp + fp + fn
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        dice_per_class = np.where(denom > 0, 2.0 * tp / denom, np.nan)
+
+    valid = ~np.isnan(dice_per_class)
+    mean_d = float(np.mean(dice_per_class[valid])) if valid.any() else 0.0
+
+    dice_list = [float(v) if not np.isnan(v) else 0.0 for v in dice_per_class]
+
+    return {
+        "mean_dice": mean_d,
+        "dice_per_class": dice_list,
+    }
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -132,22 +182,7 @@ def mean_iou(
         * ``"mIoU"`` — scalar mean IoU (float).
         * ``"iou_per_class"`` — list of per-class IoU values (float).
     """
-    cm, tp, fp, fn = _confusion_stats(preds, targets, num_classes, ignore_index)
-    denom = tp + fp + fn
-
-    with np.errstate(divide="ignore", invalid="ignore"):
-        iou_per_class = np.where(denom > 0, tp / denom, np.nan)
-
-    valid = ~np.isnan(iou_per_class)
-    miou = float(np.mean(iou_per_class[valid])) if valid.any() else 0.0
-
-    # Replace NaN with 0.0 for the returned list so callers get plain floats.
-    iou_list = [float(v) if not np.isnan(v) else 0.0 for v in iou_per_class]
-
-    return {
-        "mIoU": miou,
-        "iou_per_class": iou_list,
-    }
+    return _mean_iou_from_confusion_matrix(_segmentation_confusion_matrix(preds, targets, num_classes, ignore_index))
 
 
 def dice_score(
@@ -177,21 +212,7 @@ def dice_score(
         * ``"mean_dice"`` — scalar mean Dice score (float).
         * ``"dice_per_class"`` — list of per-class Dice values (float).
     """
-    cm, tp, fp, fn = _confusion_stats(preds, targets, num_classes, ignore_index)
-    denom = 2.0 * tp + fp + fn
-
-    with np.errstate(divide="ignore", invalid="ignore"):
-        dice_per_class = np.where(denom > 0, 2.0 * tp / denom, np.nan)
-
-    valid = ~np.isnan(dice_per_class)
-    mean_d = float(np.mean(dice_per_class[valid])) if valid.any() else 0.0
-
-    dice_list = [float(v) if not np.isnan(v) else 0.0 for v in dice_per_class]
-
-    return {
-        "mean_dice": mean_d,
-        "dice_per_class": dice_list,
-    }
+    return _dice_from_confusion_matrix(_segmentation_confusion_matrix(preds, targets, num_classes, ignore_index))
 
 
 def frequency_weighted_iou(
@@ -237,7 +258,100 @@ def frequency_weighted_iou(
     return float(np.dot(freq, iou_per_class))
 
 
+class SegmentationMetricAccumulator:
+    """Streaming segmentation metrics backed by a single confusion matrix.
+
+    Each :meth:`update` reduces a batch of masks to a ``(num_classes,
+    num_classes)`` int64 confusion matrix plus two pixel counters, so memory
+    is independent of the number and resolution of masks evaluated.
+    Accumulators built over disjoint shards combine exactly with
+    :meth:`merge`, and :meth:`compute` returns the same values as
+    :func:`mean_iou`, :func:`dice_score` and :func:`pixel_accuracy` on the
+    concatenated masks.
+
+    Args:
+        num_classes: Total number of classes.
+        ignore_index: Pixels whose *target* label equals this value are
+            excluded from IoU and Dice (but, as in :func:`pixel_accuracy`,
+            not from pixel accuracy).
+
+    Example::
+
+        acc = SegmentationMetricAccumulator(num_classes=19, ignore_index=255)
+        for preds, targets in batches:
+            acc.update(preds, targets)
+        acc.compute()["mIoU"]
+    """
+
+    def __init__(self, num_classes: int, ignore_index: int = -1) -> None:
+        self.num_classes = int(num_classes)
+        self.ignore_index = int(ignore_index)
+        self.reset()
+
+    def reset(self) -> None:
+        """Zero the confusion matrix and pixel counters."""
+        self._cm = np.zeros((self.num_classes, self.num_classes), dtype=np.int64)
+        self.correct_pixels = 0
+        self.total_pixels = 0
+
+    @property
+    def confusion_matrix(self) -> np.ndarray:
+        """Copy of the accumulated ``[true, pred]`` confusion matrix."""
+        return self._cm.copy()
+
+    def update(self, preds: np.ndarray, targets: np.ndarray) -> None:
+        """Add one batch of masks.
+
+        Args:
+            preds: (N, H, W) integer class index predictions.
+            targets: (N, H, W) integer class index ground-truth labels.
+
+        Raises:
+            ValueError: If *preds* and *targets* shapes differ.
+        """
+        preds = np.asarray(preds)
+        targets = np.asarray(targets)
+        if preds.shape != targets.shape:
+            raise ValueError(f"Shape mismatch: preds {preds.shape} vs targets {targets.shape}.")
+        self._cm += _segmentation_confusion_matrix(preds, targets, self.num_classes, self.ignore_index)
+        self.correct_pixels += int(np.count_nonzero(preds == targets))
+        self.total_pixels += preds.size
+
+    def merge(self, other: SegmentationMetricAccumulator) -> None:
+        """Add the counts of another accumulator with the same configuration.
+
+        Raises:
+            ValueError: If *other* has a different ``num_classes`` or ``ignore_index``.
+        """
+        if (other.num_classes, other.ignore_index) != (self.num_classes, self.ignore_index):
+            raise ValueError(
+                f"Cannot merge accumulators with (num_classes, ignore_index)="
+                f"{(other.num_classes, other.ignore_index)} and {(self.num_classes, self.ignore_index)}."
+            )
+        self._cm += other._cm
+        self.correct_pixels += other.correct_pixels
+        self.total_pixels += other.total_pixels
+
+    def compute(self) -> dict[str, float | list[float]]:
+        """Return the accumulated metrics.
+
+        Returns:
+            Dictionary with ``mIoU``, ``mean_dice``, ``pixel_accuracy``,
+            ``iou_per_class`` and ``dice_per_class``.
+        """
+        iou_result = _mean_iou_from_confusion_matrix(self._cm)
+        dice_result = _dice_from_confusion_matrix(self._cm)
+        return {
+            "mIoU": iou_result["mIoU"],
+            "mean_dice": dice_result["mean_dice"],
+            "pixel_accuracy": float(self.correct_pixels / self.total_pixels) if self.total_pixels > 0 else 0.0,
+            "iou_per_class": iou_result["iou_per_class"],
+            "dice_per_class": dice_result["dice_per_class"],
+        }
+
+
 __all__ = [
+    "SegmentationMetricAccumulator",
     "dice_score",
     "frequency_weighted_iou",
     "mean_iou",
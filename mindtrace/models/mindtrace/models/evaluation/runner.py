@@ -1,13 +1,16 @@
 """EvaluationRunner — orchestrates model inference and metric computation.
 
-Iterates a dataloader, accumulates predictions and targets as NumPy arrays,
-calls the appropriate metric functions, and optionally logs scalar results via
-a :class:`~mindtrace.models.tracking.tracker.Tracker`.
+Iterates a dataloader, folds each batch into a task-specific metric
+accumulator (confusion matrices, running sums, or detection match tables), and
+optionally logs scalar results via a
+:class:`~mindtrace.models.tracking.tracker.Tracker`.  Memory stays bounded by
+the accumulator state rather than growing with the dataset.
 """
 
 from __future__ import annotations
 
-from typing import Any, Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Sequence
 
 import numpy as np
 
@@ -21,20 +24,13 @@ try:
 except ImportError:  # pragma: no cover
     _TORCH_AVAILABLE = False
 
-from mindtrace.models.evaluation.metrics.classification import (
-    accuracy,
-    classification_report,
-)
+from mindtrace.models.evaluation.metrics.classification import ClassificationMetricAccumulator
 from mindtrace.models.evaluation.metrics.detection import (
-    mean_average_precision,
-    mean_average_precision_50_95,
-)
-from mindtrace.models.evaluation.metrics.regression import mae, mse, r2_score, rmse
-from mindtrace.models.evaluation.metrics.segmentation import (
-    dice_score,
-    mean_iou,
-    pixel_accuracy,
+    DetectionMetricAccumulator,
+    coco_map_summary,
 )
+from mindtrace.models.evaluation.metrics.regression import RegressionMetricAccumulator
+from mindtrace.models.evaluation.metrics.segmentation import SegmentationMetricAccumulator
 
 _SUPPORTED_TASKS = frozenset({"classification", "detection", "regression", "segmentation"})
 
@@ -50,9 +46,12 @@ class EvaluationRunner(Mindtrace):
     """Run evaluation over a dataloader and compute a set of metrics.
 
     The runner handles device placement, model-eval-mode activation, and
-    accumulation of predictions across batches before computing metrics in a
-    single pass.  It is intentionally task-agnostic at the interface level —
-    the *task* argument selects which metrics are computed.
+    streaming accumulation of metric state across batches: predictions are
+    reduced per batch (e.g. into a confusion matrix) and never retained, so
+    memory does not grow with the dataset.  It is intentionally task-agnostic
+    at the interface level — the *task* argument selects which metrics are
+    computed.  :meth:`run_sharded` evaluates several loaders concurrently and
+    merges their accumulators.
 
     Args:
         model: PyTorch ``nn.Module``.  Moved to *device* automatically on
@@ -177,8 +176,8 @@ class EvaluationRunner(Mindtrace):
 
         1. Sets the model to eval mode.
         2. Iterates *loader* under ``torch.inference_mode()``.
-        3. Accumulates all predictions and targets as NumPy arrays.
-        4. Calls the task-appropriate metric functions.
+        3. Folds each batch into the task's metric accumulator.
+        4. Computes the task-appropriate metrics from the accumulator.
         5. Logs scalar metrics via the tracker (if provided).
         6. Returns the full results dict.
 
@@ -203,16 +202,71 @@ class EvaluationRunner(Mindtrace):
             raise ValueError("EvaluationRunner.run(): loader is required — pass it directly or set it at init time.")
 
         self._model.eval()
+        accumulator = self._new_accumulator()
+        self._accumulate(loader, accumulator)
+        results = self._summarize(accumulator)
+        self._log_results(results, step)
+        return results
 
-        if self._task == "classification":
-            results = self._run_classification(loader)
-        elif self._task == "detection":
-            results = self._run_detection(loader)
-        elif self._task == "regression":
-            results = self._run_regression(loader)
-        else:
-            results = self._run_segmentation(loader)
+    def run_sharded(
+        self,
+        loaders: Sequence[Any],
+        *,
+        step: int | None = None,
+        max_workers: int | None = None,
+    ) -> dict[str, Any]:
+        """Evaluate several loader shards concurrently and merge the results.
+
+        Each shard is iterated on its own worker thread into its own
+        accumulator; the accumulators are then merged in shard order and the
+        metrics computed once.  Confusion-matrix and detection accumulators
+        merge exactly, so the result equals :meth:`run` over the shards
+        concatenated in order (regression agrees up to floating-point
+        rounding).  PyTorch releases the GIL during forward passes, so shards
+        overlap data loading, host-device copies and inference.
+
+        Args:
+            loaders: One iterable dataloader per shard, e.g. built over
+                disjoint ``torch.utils.data.Subset`` ranges.
+            step: Optional step or epoch index passed to ``tracker.log``.
+            max_workers: Maximum concurrent shards.  Defaults to one thread
+                per loader.
+
+        Returns:
+            Results dictionary, as for :meth:`run`.
+
+        Raises:
+            ValueError: If *loaders* is empty.
+        """
+        loaders = list(loaders)
+        if not loaders:
+            raise ValueError("EvaluationRunner.run_sharded(): at least one loader is required.")
+
+        self._model.eval()
+
+        def evaluate_shard(loader: Any) -> Any:
+            accumulator = self._new_accumulator()
+            self._accumulate(loader, accumulator)
+            return accumulator
+
+        with ThreadPoolExecutor(max_workers=max_workers or len(loaders)) as executor:
+            shards = list(executor.map(evaluate_shard, loaders))
+
+        merged = shards[0]
+        for shard in shards[1:]:
+            merged.merge(shard)
+        self.logger.debug("EvaluationRunner: merged %d shard accumulators.", len(shards))
+
+        results = self._summarize(merged)
+        self._log_results(results, step)
+        return results
+
+    # ------------------------------------------------------------------
+    # Task-specific accumulation
+    # ------------------------------------------------------------------
 
+    def _log_results(self, results: dict[str, Any], step: int | None) -> None:
+        """Forward scalar entries of *results* to the tracker, if one is set."""
         if self._tracker is not None:
             scalars = {k: v for k, v in results.items() if isinstance(v, (int, float))}
             try:
@@ -222,12 +276,6 @@ class EvaluationRunner(Mindtrace):
             except Exception as exc:
                 self.logger.warning("EvaluationRunner: tracker.log failed: %s", exc)
 
-        return results
-
-    # ------------------------------------------------------------------
-    # Task-specific runners
-    # ------------------------------------------------------------------
-
     def _parse_batch(self, batch: Any) -> tuple[Any, Any]:
         """Extract inputs and targets from a batch.
 
@@ -256,121 +304,114 @@ class EvaluationRunner(Mindtrace):
             return tensor.detach().cpu().numpy()
         return np.asarray(tensor)
 
-    def _run_classification(self, loader: Any) -> dict[str, Any]:
-        """Accumulate classification predictions and compute metrics.
+    def _new_accumulator(self) -> Any:
+        """Create an empty metric accumulator for the configured task."""
+        if self._task == "classification":
+            return ClassificationMetricAccumulator(self._num_classes)
+        if self._task == "detection":
+            return DetectionMetricAccumulator(self._num_classes)
+        if self._task == "regression":
+            return RegressionMetricAccumulator()
+        return SegmentationMetricAccumulator(self._num_classes)
+
+    def _accumulate(self, loader: Any, accumulator: Any) -> None:
+        """Run the model over *loader*, folding every batch into *accumulator*.
+
+        Expected batch formats per task:
+
+        * **classification**: inputs ``(B, *)``; targets ``(B,)`` class indices.
+        * **segmentation**: inputs ``(B, C, H, W)``; targets ``(B, H, W)``
+          class-index masks.
+        * **regression**: inputs accepted by the model; targets ``(B,)`` or
+          ``(B, 1)`` floats.
+        * **detection**: the model returns one ``{"boxes", "scores",
+          "labels"}`` dict per image; targets are ``{"boxes", "labels"}``
+          dicts.  Inputs may be a tensor or a list of per-image tensors.
 
         Args:
             loader: Dataloader yielding ``(inputs, targets)`` batches.
-                Inputs: ``(B, *)`` tensors.
-                Targets: ``(B,)`` integer class indices.
-
-        Returns:
-            Dict with keys: ``accuracy``, ``precision``, ``recall``, ``f1``,
-            ``classification_report``.
+            accumulator: Accumulator returned by :meth:`_new_accumulator`.
         """
-        all_preds: list[np.ndarray] = []
-        all_targets: list[np.ndarray] = []
-
         with torch.inference_mode():
             for batch in loader:
                 inputs, targets = self._parse_batch(batch)
-                inputs = inputs.to(self._device) if hasattr(inputs, "to") else inputs
-                logits = self._model(inputs)
-                preds = self._to_numpy(torch.argmax(logits, dim=1))
-                all_preds.append(preds)
-                all_targets.append(self._to_numpy(targets))
+                if hasattr(inputs, "to"):
+                    inputs = inputs.to(self._device)
+                elif self._task == "detection" and isinstance(inputs, (list, tuple)):
+                    inputs = [x.to(self._device) if hasattr(x, "to") else x for x in inputs]
 
-        if not all_preds:
-            self.logger.warning("EvaluationRunner: loader was empty; returning zero metrics.")
-            return {**_ZERO_METRICS["classification"], "classification_report": {}}
+                outputs = self._model(inputs)
 
-        preds_arr = np.concatenate(all_preds, axis=0)
-        targets_arr = np.concatenate(all_targets, axis=0)
+                if self._task == "detection":
+                    # Matched per batch, so only scores and match flags outlive the loop.
+                    accumulator.update(
+                        [
+                            {
+                                "boxes": self._to_numpy(out["boxes"]),
+                                "scores": self._to_numpy(out["scores"]),
+                                "labels": self._to_numpy(out["labels"]),
+                            }
+                            for out in outputs
+                        ],
+                        [
+                            {
+                                "boxes": self._to_numpy(tgt["boxes"]),
+                                "labels": self._to_numpy(tgt["labels"]),
+                            }
+                            for tgt in targets
+                        ],
+                    )
+                elif self._task == "regression":
+                    accumulator.update(self._to_numpy(outputs).ravel(), self._to_numpy(targets).ravel())
+                else:
+                    # Classification and segmentation reduce logits to class indices on the device.
+                    accumulator.update(self._to_numpy(torch.argmax(outputs, dim=1)), self._to_numpy(targets))
 
-        from mindtrace.models.evaluation.metrics.classification import precision_recall_f1
+    def _summarize(self, accumulator: Any) -> dict[str, Any]:
+        """Compute and log the task's results dict from a filled accumulator.
 
-        acc = accuracy(preds_arr, targets_arr)
-        prec, rec, f1 = precision_recall_f1(preds_arr, targets_arr, self._num_classes, average="macro")
-        report = classification_report(
-            preds_arr,
-            targets_arr,
-            self._num_classes,
-            class_names=self._class_names,
-        )
+        Returns zero metrics (with a warning) when nothing was accumulated.
+        """
+        if self._task == "classification":
+            return self._summarize_classification(accumulator)
+        if self._task == "detection":
+            return self._summarize_detection(accumulator)
+        if self._task == "regression":
+            return self._summarize_regression(accumulator)
+        return self._summarize_segmentation(accumulator)
+
+    def _summarize_classification(self, accumulator: ClassificationMetricAccumulator) -> dict[str, Any]:
+        """Return ``accuracy``, ``precision``, ``recall``, ``f1`` and ``classification_report``."""
+        if accumulator.num_samples == 0:
+            self.logger.warning("EvaluationRunner: loader was empty; returning zero metrics.")
+            return {**_ZERO_METRICS["classification"], "classification_report": {}}
+
+        results = accumulator.compute(class_names=self._class_names)
 
         self.logger.info(
             "EvaluationRunner [classification]: accuracy=%.4f precision=%.4f recall=%.4f f1=%.4f",
-            acc,
-            prec,
-            rec,
-            f1,
+            results["accuracy"],
+            results["precision"],
+            results["recall"],
+            results["f1"],
         )
 
-        return {
-            "accuracy": acc,
-            "precision": prec,
-            "recall": rec,
-            "f1": f1,
-            "classification_report": report,
-        }
-
-    def _run_detection(self, loader: Any) -> dict[str, Any]:
-        """Accumulate detection predictions and compute mAP metrics.
-
-        Each batch element must expose:
-
-        * Model output: list of dicts with ``"boxes"``, ``"scores"``,
-          ``"labels"`` keys (one dict per image).
-        * Target: list of dicts with ``"boxes"`` and ``"labels"`` keys.
-
-        Args:
-            loader: Dataloader yielding ``(inputs, targets)`` batches.
-
-        Returns:
-            Dict with keys: ``mAP@50``, ``mAP@75``, ``mAP@50:95``.
-        """
-        all_preds: list[dict] = []
-        all_targets: list[dict] = []
-
-        with torch.inference_mode():
-            for batch in loader:
-                inputs, targets = self._parse_batch(batch)
-                if hasattr(inputs, "to"):
-                    inputs = inputs.to(self._device)
-                elif isinstance(inputs, (list, tuple)):
-                    inputs = [x.to(self._device) if hasattr(x, "to") else x for x in inputs]
-
-                outputs = self._model(inputs)
-
-                for out in outputs:
-                    all_preds.append(
-                        {
-                            "boxes": self._to_numpy(out["boxes"]),
-                            "scores": self._to_numpy(out["scores"]),
-                            "labels": self._to_numpy(out["labels"]),
-                        }
-                    )
-
-                for tgt in targets:
-                    all_targets.append(
-                        {
-                            "boxes": self._to_numpy(tgt["boxes"]),
-                            "labels": self._to_numpy(tgt["labels"]),
-                        }
-                    )
+        return results
 
-        if not all_preds:
+    def _summarize_detection(self, accumulator: DetectionMetricAccumulator) -> dict[str, Any]:
+        """Return ``mAP@50``, ``mAP@75``, ``mAP@50:95`` and ``AP_per_class`` (at IoU 0.5)."""
+        if accumulator.num_images == 0:
             self.logger.warning("EvaluationRunner: loader was empty; returning zero metrics.")
             return dict(_ZERO_METRICS["detection"])
 
-        coco_result = mean_average_precision_50_95(all_preds, all_targets, self._num_classes)
-        map50_result = mean_average_precision(all_preds, all_targets, self._num_classes, iou_threshold=0.5)
+        metrics = accumulator.compute()
+        coco_result = coco_map_summary(metrics)
 
         results: dict[str, Any] = {
-            "mAP@50": map50_result["mAP"],
+            "mAP@50": coco_result["mAP@50"],
             "mAP@75": coco_result["mAP@75"],
             "mAP@50:95": coco_result["mAP@50:95"],
-            "AP_per_class": map50_result["AP_per_class"],
+            "AP_per_class": metrics["AP_per_class_per_threshold"][0.5],
         }
 
         self.logger.info(
@@ -382,48 +423,13 @@ class EvaluationRunner(Mindtrace):
 
         return results
 
-    def _run_segmentation(self, loader: Any) -> dict[str, Any]:
-        """Accumulate segmentation predictions and compute IoU / Dice metrics.
-
-        Args:
-            loader: Dataloader yielding ``(inputs, targets)`` batches.
-                Inputs: ``(B, C, H, W)`` tensors.
-                Targets: ``(B, H, W)`` integer class-index tensors.
-
-        Returns:
-            Dict with keys: ``mIoU``, ``mean_dice``, ``pixel_accuracy``,
-            ``iou_per_class``, ``dice_per_class``.
-        """
-        all_preds: list[np.ndarray] = []
-        all_targets: list[np.ndarray] = []
-
-        with torch.inference_mode():
-            for batch in loader:
-                inputs, targets = self._parse_batch(batch)
-                inputs = inputs.to(self._device) if hasattr(inputs, "to") else inputs
-                logits = self._model(inputs)
-                preds = self._to_numpy(torch.argmax(logits, dim=1))
-                all_preds.append(preds)
-                all_targets.append(self._to_numpy(targets))
-
-        if not all_preds:
+    def _summarize_segmentation(self, accumulator: SegmentationMetricAccumulator) -> dict[str, Any]:
+        """Return ``mIoU``, ``mean_dice``, ``pixel_accuracy``, ``iou_per_class`` and ``dice_per_class``."""
+        if accumulator.total_pixels == 0:
             self.logger.warning("EvaluationRunner: loader was empty; returning zero metrics.")
             return dict(_ZERO_METRICS["segmentation"])
 
-        preds_arr = np.concatenate(all_preds, axis=0)
-        targets_arr = np.concatenate(all_targets, axis=0)
-
-        pix_acc = pixel_accuracy(preds_arr, targets_arr)
-        iou_result = mean_iou(preds_arr, targets_arr, self._num_classes)
-        dice_result = dice_score(preds_arr, targets_arr, self._num_classes)
-
-        results: dict[str, Any] = {
-            "mIoU": iou_result["mIoU"],
-            "mean_dice": dice_result["mean_dice"],
-            "pixel_accuracy": pix_acc,
-            "iou_per_class": iou_result["iou_per_class"],
-            "dice_per_class": dice_result["dice_per_class"],
-        }
+        results: dict[str, Any] = dict(accumulator.compute())
 
         self.logger.info(
             "EvaluationRunner [segmentation]: mIoU=%.4f mean_dice=%.4f pixel_accuracy=%.4f",
@@ -434,42 +440,13 @@ class EvaluationRunner(Mindtrace):
 
         return results
 
-    def _run_regression(self, loader: Any) -> dict[str, Any]:
-        """Accumulate regression predictions and compute scalar metrics.
-
-        Args:
-            loader: Dataloader yielding ``(inputs, targets)`` batches.
-                Inputs: any tensor accepted by the model.
-                Targets: ``(B,)`` or ``(B, 1)`` float tensors.
-
-        Returns:
-            Dict with keys: ``mae``, ``mse``, ``rmse``, ``r2``.
-        """
-        all_preds: list[np.ndarray] = []
-        all_targets: list[np.ndarray] = []
-
-        with torch.inference_mode():
-            for batch in loader:
-                inputs, targets = self._parse_batch(batch)
-                inputs = inputs.to(self._device) if hasattr(inputs, "to") else inputs
-                raw_output = self._model(inputs)
-                preds_np = self._to_numpy(raw_output).ravel()
-                all_preds.append(preds_np)
-                all_targets.append(self._to_numpy(targets).ravel())
-
-        if not all_preds:
+    def _summarize_regression(self, accumulator: RegressionMetricAccumulator) -> dict[str, Any]:
+        """Return ``mae``, ``mse``, ``rmse`` and ``r2``."""
+        if accumulator.num_samples == 0:
             self.logger.warning("EvaluationRunner: loader was empty; returning zero metrics.")
             return dict(_ZERO_METRICS["regression"])
 
-        preds_arr = np.concatenate(all_preds, axis=0)
-        targets_arr = np.concatenate(all_targets, axis=0)
-
-        results: dict[str, Any] = {
-            "mae": mae(preds_arr, targets_arr),
-            "mse": mse(preds_arr, targets_arr),
-            "rmse": rmse(preds_arr, targets_arr),
-            "r2": r2_score(preds_arr, targets_arr),
-        }
+        results: dict[str, Any] = accumulator.compute()
 
         self.logger.info(
             "EvaluationRunner [regression]: mae=%.4f mse=%.4f rmse=%.4f r2=%.4f",
@@ -21,6 +21,7 @@ Optional subpackages (each requires additional dependencies):
     Requires: ``torch-model-archiver``, ``torchserve``.
 """
 
+from mindtrace.models.serving.batching import BatchTiming, MicroBatcher
 from mindtrace.models.serving.results import (
     ClassificationResult,
     DetectionResult,
@@ -30,6 +31,8 @@ from mindtrace.models.serving.schemas import ModelInfo, PredictRequest, PredictR
 from mindtrace.models.serving.service import ModelService, resolve_device
 
 __all__ = [
+    "BatchTiming",
+    "MicroBatcher",
     "ModelInfo",
     "ModelService",
     "PredictRequest",
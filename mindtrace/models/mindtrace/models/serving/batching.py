@@ -0,0 +1,201 @@
+"""Dynamic micro-batching for model services.
+
+A :class:`MicroBatcher` queues items submitted concurrently (typically one per
+HTTP request, each handled on its own server thread) and hands them to a
+single worker thread that processes them in batches.  A batch is dispatched
+as soon as ``max_batch_size`` items are waiting or ``max_wait_s`` has passed
+since its first item arrived, whichever comes first, so an idle service adds
+at most ``max_wait_s`` of latency while a busy one runs full batches.
+
+Example::
+
+    batcher = MicroBatcher(lambda xs: [x * 2 for x in xs], max_batch_size=16, max_wait_s=0.005)
+    result, timing = batcher.run(21)   # -> 42, BatchTiming(queue_wait_s=..., compute_s=..., batch_size=...)
+    batcher.close()
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+@dataclass(frozen=True)
+class BatchTiming:
+    """Where the time went for one batched item.
+
+    Attributes:
+        queue_wait_s: Seconds between submission and the start of its batch.
+        compute_s: Seconds spent processing the whole batch the item was part of.
+        batch_size: Number of items in that batch.
+    """
+
+    queue_wait_s: float
+    compute_s: float
+    batch_size: int
+
+
+@dataclass
+class _Pending:
+    item: Any
+    future: Future
+    enqueued_at: float
+
+
+_STOP = object()
+
+
+class MicroBatcher(Generic[T, R]):
+    """Coalesce concurrently submitted items into batches processed on one worker thread.
+
+    Args:
+        process_batch: Called with a list of items; must return one result per
+            item, in order.  A result that is an exception instance is raised
+            to that item's caller only.  If the call itself raises, every item
+            in the batch fails with that exception.
+        max_batch_size: Upper bound on the number of items per batch.
+        max_wait_s: Longest time the first item of a batch waits for more
+            items to arrive.
+        name: Name of the worker thread.
+    """
+
+    def __init__(
+        self,
+        process_batch: Callable[[list[T]], Sequence[R | BaseException]],
+        *,
+        max_batch_size: int = 8,
+        max_wait_s: float = 0.005,
+        name: str = "micro-batcher",
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        if max_wait_s < 0:
+            raise ValueError("max_wait_s must be non-negative")
+        self.process_batch = process_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait_s = max_wait_s
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._batches = 0
+        self._items = 0
+        self._queue_wait_s = 0.0
+        self._compute_s = 0.0
+        self._max_batch_seen = 0
+        self._worker = threading.Thread(target=self._run_worker, name=name, daemon=True)
+        self._worker.start()
+
+    # ------------------------------------------------------------------
+    # Submission
+    # ------------------------------------------------------------------
+
+    def submit(self, item: T) -> Future:
+        """Queue ``item`` and return a future resolving to ``(result, BatchTiming)``."""
+        future: Future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("MicroBatcher is closed")
+            self._queue.put(_Pending(item=item, future=future, enqueued_at=time.perf_counter()))
+        return future
+
+    def run(self, item: T, timeout: float | None = None) -> tuple[R, BatchTiming]:
+        """Submit ``item`` and block until its batch has been processed."""
+        return self.submit(item).result(timeout=timeout)
+
+    def close(self, timeout: float | None = None) -> None:
+        """Stop accepting items, finish the items already queued, and stop the worker."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_STOP)
+        self._worker.join(timeout=timeout)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def stats(self) -> dict[str, Any]:
+        """Counters accumulated since the batcher was created."""
+        with self._lock:
+            batches, items = self._batches, self._items
+            return {
+                "max_batch_size": self.max_batch_size,
+                "max_wait_s": self.max_wait_s,
+                "batches": batches,
+                "items": items,
+                "mean_batch_size": items / batches if batches else 0.0,
+                "largest_batch": self._max_batch_seen,
+                "mean_queue_wait_s": self._queue_wait_s / items if items else 0.0,
+                "mean_compute_s": self._compute_s / batches if batches else 0.0,
+            }
+
+    # ------------------------------------------------------------------
+    # Worker
+    # ------------------------------------------------------------------
+
+    def _run_worker(self) -> None:
+        stopping = False
+        while not stopping:
+            first = self._queue.get()
+            if first is _STOP:
+                break
+            batch = [first]
+            deadline = first.enqueued_at + self.max_wait_s
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.perf_counter()
+                try:
+                    pending = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if pending is _STOP:
+                    stopping = True
+                    break
+                batch.append(pending)
+            self._dispatch(batch)
+
+        # Items queued behind the stop marker were accepted before close(); process them too.
+        leftovers = []
+        while True:
+            try:
+                pending = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if pending is not _STOP:
+                leftovers.append(pending)
+        for start in range(0, len(leftovers), self.max_batch_size):
+            self._dispatch(leftovers[start : start + self.max_batch_size])
+
+    def _dispatch(self, batch: list[_Pending]) -> None:
+        started = time.perf_counter()
+        try:
+            results = list(self.process_batch([pending.item for pending in batch]))
+            if len(results) != len(batch):
+                raise RuntimeError(f"process_batch returned {len(results)} results for a batch of {len(batch)} items")
+        except BaseException as exc:  # noqa: BLE001 - every caller in the batch sees the failure
+            results = [exc] * len(batch)
+        compute_s = time.perf_counter() - started
+
+        waits = [started - pending.enqueued_at for pending in batch]
+        with self._lock:
+            self._batches += 1
+            self._items += len(batch)
+            self._queue_wait_s += sum(waits)
+            self._compute_s += compute_s
+            self._max_batch_seen = max(self._max_batch_seen, len(batch))
+
+        for pending, result, wait in zip(batch, results, waits):
+            if isinstance(result, BaseException):
+                pending.future.set_exception(result)
+            else:
+                pending.future.set_result(
+                    (result, BatchTiming(queue_wait_s=wait, compute_s=compute_s, batch_size=len(batch)))
+                )
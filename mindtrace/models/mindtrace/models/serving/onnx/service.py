@@ -1,14 +1,24 @@
 """OnnxModelService — ModelService backed by an ONNX model via onnxruntime.
 
 Integrates with the mindtrace registry: when a ``Registry`` instance is
-provided, ``load_model`` pulls the ``onnx.ModelProto`` via
-``OnnxModelArchiver``, serialises it to bytes, and creates an
-``onnxruntime.InferenceSession`` from those bytes — no temporary files
-required.  When no registry is given a local ``.onnx`` file path is used.
+provided, ``load_model`` opens the stored ``OnnxModelArchiver`` artifact with
+``Registry.open_artifact`` and creates the ``onnxruntime.InferenceSession``
+straight from its ``model.onnx`` file, so the weights are never held as an
+``onnx.ModelProto`` plus a serialised copy.  With
+``cache_optimized_model=True`` the graph produced by ORT's optimizer is saved
+back into the registry, keyed by the source artifact hash, the onnxruntime
+version, the providers and the optimization level, and later cold starts load
+it with optimization disabled.  When no registry is given a local ``.onnx``
+file path is used.
 
 Execution providers are selected automatically (CUDA → CPU) unless
 ``providers`` is passed explicitly.
 
+With ``max_batch_size > 1`` concurrent :meth:`~OnnxModelService.predict_array`
+calls are also micro-batched: their inputs are concatenated along the batch
+axis, run through one ``session.run``, and the outputs are split back per
+call.  This requires a model whose inputs have a dynamic leading dimension.
+
 Usage (registry path)::
 
     from mindtrace.registry import Registry
@@ -40,13 +50,20 @@ Usage (file path)::
 
 from __future__ import annotations
 
+import hashlib
+import json
+import platform
+import tempfile
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 import numpy as np
 
+from mindtrace.models.serving.batching import MicroBatcher
 from mindtrace.models.serving.schemas import ModelInfo, PredictRequest, PredictResponse
 from mindtrace.models.serving.service import ModelService
+from mindtrace.registry.core.exceptions import RegistryObjectNotFound
 
 
 def _require_onnxruntime() -> Any:
@@ -71,6 +88,19 @@ def _default_providers() -> list[str]:
     return ["CPUExecutionProvider"]
 
 
+@contextmanager
+def _overridden_options(options: Any, **overrides: Any) -> Iterator[Any]:
+    """Temporarily set attributes on an ``onnxruntime.SessionOptions``, restoring the caller's values on exit."""
+    previous = {name: getattr(options, name) for name in overrides}
+    try:
+        for name, value in overrides.items():
+            setattr(options, name, value)
+        yield options
+    finally:
+        for name, value in previous.items():
+            setattr(options, name, value)
+
+
 class OnnxModelService(ModelService):
     """Abstract ``ModelService`` whose inference backend is an ONNX model.
 
@@ -91,6 +121,12 @@ class OnnxModelService(ModelService):
             to auto-detection (CUDA when available, else CPU).
         session_options: An ``onnxruntime.SessionOptions`` instance for
             advanced session configuration.  ``None`` uses the defaults.
+        cache_optimized_model: When loading from the registry, persist the
+            ORT-optimized graph under ``"<name>:<version>:ort-optimized-<digest>"``
+            on first load and reuse it on later cold starts.  The optimized
+            graph is specific to the onnxruntime version, providers, graph
+            optimization level and host architecture, all of which are part
+            of the digest.
         **kwargs: Forwarded to :class:`~mindtrace.models.serving.service.ModelService`.
     """
 
@@ -102,13 +138,16 @@ class OnnxModelService(ModelService):
         model_path: str | Path | None = None,
         providers: list[str] | None = None,
         session_options: Any = None,
+        cache_optimized_model: bool = False,
         **kwargs: Any,
     ) -> None:
         self.model_path: Path | None = Path(model_path) if model_path else None
         self.providers: list[str] = providers or _default_providers()
         self.session_options: Any = session_options
+        self.cache_optimized_model = cache_optimized_model
         self.session: Any = None  # onnxruntime.InferenceSession
-        self._onnx_metadata: dict = {}  # populated from ModelProto when using registry
+        self._onnx_metadata: dict = {}  # populated from the archiver metadata when using registry
+        self._array_batcher: MicroBatcher | None = None
 
         if self.model_path is None and kwargs.get("registry") is None:
             raise ValueError(
@@ -117,6 +156,23 @@ class OnnxModelService(ModelService):
 
         super().__init__(**kwargs)
 
+        if self.max_batch_size > 1 and self.session is not None:
+            static = {
+                name: shape[0] for name, shape in self.input_shapes.items() if shape and isinstance(shape[0], int)
+            }
+            if static:
+                self.logger.warning(
+                    "Not batching predict_array calls: inputs have a fixed batch dimension %s.",
+                    static,
+                )
+            else:
+                self._array_batcher = MicroBatcher(
+                    self._run_coalesced,
+                    max_batch_size=self.max_batch_size,
+                    max_wait_s=self.max_batch_wait_s,
+                    name=f"{self.model_name or type(self).__name__}-array-batcher",
+                )
+
     # ------------------------------------------------------------------
     # ModelService interface
     # ------------------------------------------------------------------
@@ -124,9 +180,12 @@ class OnnxModelService(ModelService):
     def load_model(self) -> None:
         """Load the ONNX model and create an onnxruntime InferenceSession.
 
-        When a registry is attached, the ``onnx.ModelProto`` is fetched via
-        ``OnnxModelArchiver``, serialised to a byte-string, and passed
-        directly to ``onnxruntime.InferenceSession`` — no temp file needed.
+        When a registry is attached, the ``OnnxModelArchiver`` artifact is
+        opened in place (or pulled once into a temporary directory) and the
+        session is created from its ``model.onnx`` path; external-data files
+        stored next to it resolve as usual.  Artifacts without a
+        ``model.onnx`` file fall back to loading the ``onnx.ModelProto`` and
+        passing its serialised bytes.
 
         When no registry is provided, the session is created from
         ``self.model_path``.
@@ -134,28 +193,22 @@ class OnnxModelService(ModelService):
         ort = _require_onnxruntime()
 
         if self.registry is not None:
-            self.logger.info(
-                "Loading ONNX model from registry: %s:%s",
-                self.model_name,
-                self.model_version,
-            )
-            model_proto = self.registry.load(f"{self.model_name}:{self.model_version}")
-            # Serialise ModelProto → bytes so onnxruntime can consume it
-            model_bytes = model_proto.SerializeToString()
-            self.session = ort.InferenceSession(
-                model_bytes,
-                sess_options=self.session_options,
-                providers=self.providers,
-            )
-            # Cache lightweight metadata from the proto
-            self._onnx_metadata = {
-                "ir_version": model_proto.ir_version,
-                "producer_name": model_proto.producer_name,
-                "producer_version": model_proto.producer_version,
-                "opset_imports": [
-                    {"domain": op.domain or "ai.onnx", "version": op.version} for op in model_proto.opset_import
-                ],
-            }
+            name = f"{self.model_name}:{self.model_version}"
+            self.logger.info("Loading ONNX model from registry: %s", name)
+            with self.registry.open_artifact(name) as (artifact_dir, metadata):
+                model_file = artifact_dir / "model.onnx"
+                if model_file.is_file():
+                    self._onnx_metadata = self._read_archiver_metadata(artifact_dir)
+                    if self.cache_optimized_model:
+                        self.session = self._load_with_optimized_cache(ort, name, model_file, metadata)
+                    else:
+                        self.session = ort.InferenceSession(
+                            str(model_file),
+                            sess_options=self.session_options,
+                            providers=self.providers,
+                        )
+                else:
+                    self.session = self._load_from_proto(ort, name)
         else:
             if self.model_path is None or not self.model_path.exists():
                 raise FileNotFoundError(
@@ -176,6 +229,86 @@ class OnnxModelService(ModelService):
             self.session.get_providers(),
         )
 
+    def _load_from_proto(self, ort: Any, name: str) -> Any:
+        """Materialise the ``onnx.ModelProto`` and create the session from its serialised bytes."""
+        model_proto = self.registry.load(name)
+        session = ort.InferenceSession(
+            model_proto.SerializeToString(),
+            sess_options=self.session_options,
+            providers=self.providers,
+        )
+        self._onnx_metadata = {
+            "ir_version": model_proto.ir_version,
+            "producer_name": model_proto.producer_name,
+            "producer_version": model_proto.producer_version,
+            "opset_imports": [
+                {"domain": op.domain or "ai.onnx", "version": op.version} for op in model_proto.opset_import
+            ],
+        }
+        return session
+
+    @staticmethod
+    def _read_archiver_metadata(artifact_dir: Path) -> dict:
+        """Return the ONNX fields that ``OnnxModelArchiver`` wrote to ``metadata.json``."""
+        metadata_file = artifact_dir / "metadata.json"
+        stored = json.loads(metadata_file.read_text()) if metadata_file.is_file() else {}
+        return {
+            "ir_version": stored.get("ir_version"),
+            "producer_name": stored.get("producer_name", ""),
+            "producer_version": stored.get("producer_version", ""),
+            "opset_imports": stored.get("opset_imports", []),
+        }
+
+    def _optimized_model_key(self, ort: Any, source_hash: str) -> str:
+        """Registry name under which the ORT-optimized graph of the current model is cached.
+
+        The digest covers everything that makes an optimized graph non-portable:
+        the source artifact, the onnxruntime version, the providers, the graph
+        optimization level and the host architecture.
+        """
+        options = self.session_options if self.session_options is not None else ort.SessionOptions()
+        fingerprint = {
+            "source_hash": source_hash,
+            "onnxruntime": ort.__version__,
+            "providers": list(self.providers),
+            "graph_optimization_level": str(options.graph_optimization_level),
+            "machine": platform.machine(),
+        }
+        digest = hashlib.sha256(json.dumps(fingerprint, sort_keys=True).encode()).hexdigest()[:16]
+        return f"{self.model_name}:{self.model_version}:ort-optimized-{digest}"
+
+    def _load_with_optimized_cache(self, ort: Any, name: str, model_file: Path, metadata: dict) -> Any:
+        """Create the session from a cached optimized graph, or optimize ``model_file`` and cache the result."""
+        options = self.session_options if self.session_options is not None else ort.SessionOptions()
+        cache_key = self._optimized_model_key(ort, metadata.get("hash", ""))
+
+        try:
+            with self.registry.open_artifact(cache_key) as (cache_dir, _):
+                cached_file = cache_dir / "model.onnx"
+                with _overridden_options(options, graph_optimization_level=ort.GraphOptimizationLevel.ORT_DISABLE_ALL):
+                    session = ort.InferenceSession(str(cached_file), sess_options=options, providers=self.providers)
+            self.logger.info("Loaded ORT-optimized graph for %s from registry: %s", name, cache_key)
+            self._onnx_metadata["optimized_model"] = cache_key
+            return session
+        except RegistryObjectNotFound:
+            pass
+
+        with tempfile.TemporaryDirectory() as tmp:
+            optimized_file = Path(tmp) / "model.onnx"
+            with _overridden_options(options, optimized_model_filepath=str(optimized_file)):
+                session = ort.InferenceSession(str(model_file), sess_options=options, providers=self.providers)
+            if not optimized_file.is_file():
+                self.logger.warning("onnxruntime did not write an optimized graph for %s; not caching it.", name)
+                return session
+            try:
+                self.registry.save(cache_key, optimized_file, metadata={"source": name, "onnx": self._onnx_metadata})
+            except Exception as exc:  # noqa: BLE001 - the session is usable; caching is best-effort
+                self.logger.warning("Could not cache the ORT-optimized graph for %s as %s: %s", name, cache_key, exc)
+                return session
+        self.logger.info("Cached ORT-optimized graph for %s in registry: %s", name, cache_key)
+        self._onnx_metadata["optimized_model"] = cache_key
+        return session
+
     def predict(self, request: PredictRequest) -> PredictResponse:
         """Run inference on a :class:`PredictRequest` (images as file paths / base64).
 
@@ -232,8 +365,14 @@ class OnnxModelService(ModelService):
             svc.load_model()
             out  = svc.predict_array({"pixel_values": img_array})
             pred = out["logits"].argmax(axis=1)
+
+        When micro-batching is enabled, calls made concurrently from
+        different threads are coalesced into a single ``session.run``.
         """
-        return self.run(inputs)
+        if self._array_batcher is None:
+            return self.run(inputs)
+        outputs, _ = self._array_batcher.run(inputs)
+        return outputs
 
     # ------------------------------------------------------------------
     # Inference helper
@@ -256,6 +395,43 @@ class OnnxModelService(ModelService):
         raw_outputs = self.session.run(self.output_names, inputs)
         return dict(zip(self.output_names, raw_outputs))
 
+    def _run_coalesced(self, calls: list[dict[str, np.ndarray]]) -> list[dict[str, np.ndarray] | Exception]:
+        """Batcher callback: concatenate compatible calls along axis 0 and run them in one session call.
+
+        Calls are compatible when they feed the same input names with the same
+        per-sample shape and dtype; each compatible group is run separately.
+        """
+        groups: dict[tuple, list[int]] = {}
+        for index, inputs in enumerate(calls):
+            signature = tuple(sorted((name, array.shape[1:], array.dtype.str) for name, array in inputs.items()))
+            groups.setdefault(signature, []).append(index)
+
+        results: list[dict[str, np.ndarray] | Exception] = [None] * len(calls)  # type: ignore[list-item]
+        for indices in groups.values():
+            try:
+                if len(indices) == 1:
+                    results[indices[0]] = self.run(calls[indices[0]])
+                    continue
+                group = [calls[index] for index in indices]
+                sizes = [len(next(iter(inputs.values()))) for inputs in group]
+                batched = {name: np.concatenate([inputs[name] for inputs in group]) for name in group[0]}
+                outputs = self.run(batched)
+                total = sum(sizes)
+                for name, output in outputs.items():
+                    if output.ndim == 0 or output.shape[0] != total:
+                        raise ValueError(
+                            f"ONNX output '{name}' has shape {output.shape}, which cannot be split across "
+                            f"{len(group)} batched calls with {total} samples in total"
+                        )
+                split_points = np.cumsum(sizes)[:-1]
+                per_output = {name: np.split(output, split_points) for name, output in outputs.items()}
+                for position, index in enumerate(indices):
+                    results[index] = {name: parts[position] for name, parts in per_output.items()}
+            except Exception as exc:
+                for index in indices:
+                    results[index] = exc
+        return results
+
     # ------------------------------------------------------------------
     # Introspection
     # ------------------------------------------------------------------
@@ -318,6 +494,9 @@ class OnnxModelService(ModelService):
 
     async def shutdown_cleanup(self) -> None:
         """Release onnxruntime session resources before shutdown."""
+        if self._array_batcher is not None:
+            self._array_batcher.close()
+            self._array_batcher = None
         if self.session is not None:
             self.logger.info("Releasing ONNX inference session.")
             del self.session
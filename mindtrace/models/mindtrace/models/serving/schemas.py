@@ -41,10 +41,19 @@ class PredictResponse(BaseModel):
         results: Per-image inference results. The concrete type depends on the
             model (detections, classifications, masks, etc.).
         timing_s: Wall-clock inference time in seconds.
+        queue_wait_s: Seconds the request waited to join a batch.  Only set
+            when the service batches requests (``max_batch_size > 1``).
+        compute_s: Seconds spent running the batch the request was part of.
+            Only set when the service batches requests.
+        batch_size: Number of requests in that batch.  Only set when the
+            service batches requests.
     """
 
     results: list[Any]
     timing_s: float
+    queue_wait_s: float | None = None
+    compute_s: float | None = None
+    batch_size: int | None = None
 
 
 class ModelInfo(BaseModel):
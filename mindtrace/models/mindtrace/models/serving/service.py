@@ -17,11 +17,13 @@ MINDTRACE_REGISTRY_PATH
 
 from __future__ import annotations
 
+import json
 import os
 import time
 from abc import abstractmethod
 from typing import Any
 
+from mindtrace.models.serving.batching import MicroBatcher
 from mindtrace.models.serving.schemas import (
     ModelInfo,
     PredictRequest,
@@ -72,6 +74,12 @@ class ModelService(Service):
     1. Resolves the compute device (``"auto"`` -> ``"cuda"`` / ``"cpu"``).
     2. Calls :meth:`load_model`.
     3. Registers the ``/predict`` and ``/info`` endpoints.
+
+    Passing ``max_batch_size > 1`` turns on dynamic micro-batching: concurrent
+    ``/predict`` requests are queued and coalesced (up to ``max_batch_size``
+    requests, waiting at most ``max_batch_wait_s`` for a batch to fill) into
+    one :meth:`predict_batch` call, and each response reports its
+    ``queue_wait_s``, ``compute_s`` and ``batch_size``.
     """
 
     # Subclasses should override this with their model's task type
@@ -85,6 +93,8 @@ class ModelService(Service):
         model_version: str = "",
         device: str = "auto",
         registry: Any = None,
+        max_batch_size: int = 1,
+        max_batch_wait_s: float = 0.005,
         live_service: bool = True,
         **kwargs,
     ) -> None:
@@ -102,6 +112,12 @@ class ModelService(Service):
                 ``self.registry.load(f"{self.model_name}:{self.model_version}")``
                 in their :meth:`load_model` implementation.  ``None`` is
                 allowed when a subclass manages loading independently.
+            max_batch_size: Maximum number of concurrent ``/predict``
+                requests coalesced into one :meth:`predict_batch` call.
+                ``1`` (the default) disables batching and calls
+                :meth:`predict` once per request.
+            max_batch_wait_s: Longest time the first request of a batch
+                waits for more requests before the batch is run.
             live_service: When ``False`` the instance is used only for
                 endpoint discovery (e.g. by
                 ``generate_connection_manager``).  Model loading and
@@ -115,6 +131,9 @@ class ModelService(Service):
         self.model_version: str = model_version
         self.device: str = resolve_device(device)
         self.registry: Any = registry
+        self.max_batch_size: int = max_batch_size
+        self.max_batch_wait_s: float = max_batch_wait_s
+        self._predict_batcher: MicroBatcher | None = None
 
         # In non-live mode (endpoint discovery only), skip heavy init.
         if not live_service:
@@ -183,6 +202,19 @@ class ModelService(Service):
         self.load_model()
         self.logger.info("Model loaded successfully on %s.", self.device)
 
+        if self.max_batch_size > 1:
+            self._predict_batcher = MicroBatcher(
+                self._predict_coalesced,
+                max_batch_size=self.max_batch_size,
+                max_wait_s=self.max_batch_wait_s,
+                name=f"{self.model_name or type(self).__name__}-predict-batcher",
+            )
+            self.logger.info(
+                "Micro-batching enabled: max_batch_size=%d max_batch_wait_s=%.4f",
+                self.max_batch_size,
+                self.max_batch_wait_s,
+            )
+
         # Register endpoints.
         self.add_endpoint(
             path="predict",
@@ -225,16 +257,57 @@ class ModelService(Service):
     # Concrete helpers
     # ------------------------------------------------------------------
 
+    def predict_batch(self, requests: list[PredictRequest]) -> list[PredictResponse]:
+        """Run inference for several requests that share the same ``params``.
+
+        Used when micro-batching is enabled.  The default implementation
+        concatenates the requests' images into a single request, calls
+        :meth:`predict` once, and splits the per-image ``results`` back into
+        one response per request.  Override it when ``results`` are not one
+        entry per image or when a model can batch more efficiently.
+
+        Args:
+            requests: Requests to run together; all have identical ``params``.
+
+        Returns:
+            One response per request, in the same order.
+        """
+        if len(requests) == 1:
+            return [self.predict(requests[0])]
+
+        merged = PredictRequest(
+            images=[image for request in requests for image in request.images],
+            params=requests[0].params,
+        )
+        response = self.predict(merged)
+        if len(response.results) != len(merged.images):
+            raise ValueError(
+                f"{type(self).__name__}.predict returned {len(response.results)} results for {len(merged.images)} "
+                "images, so a batched response cannot be split per request; override predict_batch() for this model."
+            )
+
+        responses = []
+        offset = 0
+        for request in requests:
+            count = len(request.images)
+            responses.append(response.model_copy(update={"results": response.results[offset : offset + count]}))
+            offset += count
+        return responses
+
     def info(self) -> ModelInfo:
         """Return metadata about the currently loaded model.
 
         Subclasses may override this to add model-specific ``extra`` fields.
         """
+        extra: dict[str, Any] = {}
+        if self._predict_batcher is not None:
+            extra["batching"] = self._predict_batcher.stats()
         return ModelInfo(
             name=self.model_name,
             version=self.model_version,
             device=self.device,
             task=self._task,
+            extra=extra,
         )
 
     # ------------------------------------------------------------------
@@ -249,7 +322,13 @@ class ModelService(Service):
             payload.params,
         )
         start = time.perf_counter()
-        response = self.predict(payload)
+        if self._predict_batcher is not None:
+            response, timing = self._predict_batcher.run(payload)
+            response.queue_wait_s = timing.queue_wait_s
+            response.compute_s = timing.compute_s
+            response.batch_size = timing.batch_size
+        else:
+            response = self.predict(payload)
         elapsed = time.perf_counter() - start
 
         # Ensure timing is always populated, even if the subclass set it.
@@ -262,6 +341,28 @@ class ModelService(Service):
         )
         return response
 
+    def _predict_coalesced(self, requests: list[PredictRequest]) -> list[PredictResponse | Exception]:
+        """Batcher callback: run :meth:`predict_batch` once per distinct ``params`` in the batch.
+
+        A failing group only fails its own requests.
+        """
+        groups: dict[str, list[int]] = {}
+        for index, request in enumerate(requests):
+            key = json.dumps(request.params, sort_keys=True, default=repr)
+            groups.setdefault(key, []).append(index)
+
+        results: list[PredictResponse | Exception] = [None] * len(requests)  # type: ignore[list-item]
+        for indices in groups.values():
+            try:
+                responses = self.predict_batch([requests[index] for index in indices])
+                if len(responses) != len(indices):
+                    raise ValueError(f"predict_batch returned {len(responses)} responses for {len(indices)} requests")
+            except Exception as exc:
+                responses = [exc] * len(indices)
+            for index, response in zip(indices, responses):
+                results[index] = response
+        return results
+
     def _handle_info(self) -> ModelInfo:
         """Endpoint handler that returns model metadata."""
         return self.info()
@@ -336,4 +437,7 @@ class ModelService(Service):
             self.model_name,
             self.model_version,
         )
+        if self._predict_batcher is not None:
+            self._predict_batcher.close()
+            self._predict_batcher = None
         await super().shutdown_cleanup()
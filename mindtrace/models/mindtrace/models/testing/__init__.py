@@ -0,0 +1,23 @@
+"""Embedded benchmark suites for ``mindtrace-models``.
+
+Use ``register_benchmark_suites`` directly or discover it through the
+``mindtrace.benchmark_suites`` entry point group.
+"""
+
+from __future__ import annotations
+
+from mindtrace.core import TestRunner
+
+
+def register_benchmark_suites(*, runner: TestRunner | None = None, replace: bool = True) -> None:
+    """Register models benchmark suites on ``runner`` or the default runner."""
+
+    target = runner or TestRunner.default()
+
+    from mindtrace.models.testing.suites.datalake_streaming import DatalakeStreamingSuite
+    from mindtrace.models.testing.suites.detection_metrics import DetectionMapSuite
+    from mindtrace.models.testing.suites.onnx_cold_start import OnnxColdStartSuite
+
+    for cls in (DetectionMapSuite, OnnxColdStartSuite, DatalakeStreamingSuite):
+        if replace or cls.suite_id not in target.registered_suites():
+            target.register_test_suite(cls, replace=replace)
@@ -0,0 +1 @@
+"""Models benchmark suite implementations."""
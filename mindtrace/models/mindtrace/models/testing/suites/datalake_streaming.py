@@ -0,0 +1,248 @@
+"""Datalake → DataLoader throughput: lazy and prefetching ``DatalakeDataset`` vs. ``StreamingDatalakeDataset``."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from pathlib import Path
+from shutil import rmtree
+from tempfile import mkdtemp
+from types import MappingProxyType, SimpleNamespace
+from typing import Any, Literal
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+from mindtrace.core import (
+    BenchReporter,
+    BenchResult,
+    BenchResultSchema,
+    BenchSuiteConfig,
+    BenchTestSuite,
+    TaskSchema,
+    utc_now_iso,
+)
+
+LoaderMode = Literal["lazy", "prefetch", "streaming", "streaming_cached"]
+LOADER_MODES: tuple[str, ...] = ("lazy", "prefetch", "streaming", "streaming_cached")
+
+
+class DatalakeStreamingInput(BaseModel):
+    modes: list[LoaderMode] = Field(
+        default_factory=lambda: list(LOADER_MODES),
+        description="'lazy' is DatalakeDataset(prefetch=False), one round trip per sample; 'prefetch' loads every "
+        "payload while building DatalakeDataset (counted in its time); 'streaming' uses StreamingDatalakeDataset; "
+        "'streaming_cached' times a second epoch served from its disk cache.",
+    )
+    samples: int = Field(2_048, ge=1, description="Image + label rows in the stand-in datalake.")
+    image_size: int = Field(64, ge=1, description="Side of the square uint8 RGB payload of every image datum.")
+    round_trip_ms: float = Field(2.0, ge=0.0, description="Simulated latency of every query_data / get_data call.")
+    batch_size: int = Field(32, ge=1, description="DataLoader batch size.")
+    num_workers: int = Field(0, ge=0, description="DataLoader workers for the streaming modes.")
+    fetch_batch_size: int = Field(64, ge=1, description="Rows per get_data call in the streaming modes.")
+    max_concurrency: int = Field(4, ge=1, description="get_data calls in flight per streaming process.")
+    read_ahead: int = Field(4, ge=1, description="Chunks requested ahead in the streaming modes.")
+    epochs: int = Field(2, ge=1, description="Timed epochs per mode.")
+
+
+class DatalakeStreamingResources(BaseModel):
+    """Uses an in-process datalake stand-in and a temporary directory for the disk cache."""
+
+
+class SimulatedDatalake:
+    """In-memory stand-in for the async ``query_data`` / ``get_data`` API of a Mongo-backed datalake.
+
+    Every call waits ``round_trip_ms`` before answering, like a request to a local MongoDB, so loaders are
+    compared by how many round trips they make and how well they overlap them.
+    """
+
+    def __init__(self, samples: int, image_size: int, round_trip_ms: float, seed: int = 0) -> None:
+        rng = np.random.default_rng(seed)
+        self.image_shape = (image_size, image_size, 3)
+        self.round_trip = round_trip_ms / 1000.0
+        self.rows = [{"_id": i, "image": f"image-{i}", "label": f"label-{i}"} for i in range(samples)]
+        self.datums = {}
+        for i in range(samples):
+            payload = rng.integers(0, 256, size=self.image_shape, dtype=np.uint8).tobytes()
+            self.datums[f"image-{i}"] = SimpleNamespace(id=f"image-{i}", data=payload)
+            self.datums[f"label-{i}"] = SimpleNamespace(id=f"label-{i}", data=i % 10)
+        self.get_calls = 0
+
+    @property
+    def payload_bytes(self) -> int:
+        return int(np.prod(self.image_shape))
+
+    async def query_data(self, query: Any, datums_wanted: int | None = None) -> list[dict[str, Any]]:
+        await asyncio.sleep(self.round_trip)
+        return [dict(row) for row in self.rows[:datums_wanted]]
+
+    async def get_data(self, ids: list[Any]) -> list[Any]:
+        self.get_calls += 1
+        await asyncio.sleep(self.round_trip)
+        return [self.datums[datum_id] for datum_id in ids]
+
+
+class _DecodeTransform:
+    """Decode the raw image bytes to a CHW float tensor; a class so DataLoader workers can pickle it."""
+
+    def __init__(self, image_shape: tuple[int, int, int]) -> None:
+        self.image_shape = image_shape
+
+    def __call__(self, datums: dict[str, Any]) -> tuple[Any, Any]:
+        import torch
+
+        image = np.frombuffer(datums["image"].data, dtype=np.uint8).reshape(self.image_shape)
+        return torch.from_numpy(image.copy()).permute(2, 0, 1).float() / 255.0, torch.tensor(datums["label"].data)
+
+
+class DatalakeStreamingSuite(BenchTestSuite):
+    suite_id = "models.stress.datalake_streaming"
+    title = "Models stress — Datalake training loader throughput"
+    description = (
+        "Builds a DataLoader over an in-process datalake stand-in with simulated per-call latency in each mode and "
+        "iterates ``epochs`` full epochs, decoding every image to a tensor. Every epoch must deliver each sample "
+        "exactly once. Reports samples per second per mode; 'prefetch' includes the bulk load at construction."
+    )
+    tags = frozenset({"stress", "models", "datalake"})
+    requires = ("local_disk",)
+    safety = "In-process data only; the disk cache lives in a temporary directory removed afterwards."
+    task_schema = TaskSchema(name=suite_id, input_schema=DatalakeStreamingInput, output_schema=BenchResultSchema)
+    resource_schema = DatalakeStreamingResources
+    profiles = MappingProxyType(
+        {
+            "smoke": {"duration_seconds": 30.0, "samples": 128, "image_size": 16, "epochs": 1},
+            "stress": {"duration_seconds": 300.0, "samples": 4_096, "image_size": 128, "num_workers": 2},
+        },
+    )
+
+    def execute_bench(self, config: BenchSuiteConfig, reporter: BenchReporter) -> BenchResult:
+        from torch.utils.data import DataLoader
+
+        from mindtrace.models.training.datalake_bridge import DatalakeDataset, StreamingDatalakeDataset
+
+        started = utc_now_iso()
+        monotonic_start = time.perf_counter()
+        modes = [str(mode).lower() for mode in config.parameters.get("modes") or LOADER_MODES]
+        samples = int(config.parameters.get("samples", 2_048))
+        image_size = int(config.parameters.get("image_size", 64))
+        round_trip_ms = float(config.parameters.get("round_trip_ms", 2.0))
+        batch_size = int(config.parameters.get("batch_size", 32))
+        num_workers = int(config.parameters.get("num_workers", 0))
+        fetch_batch_size = int(config.parameters.get("fetch_batch_size", 64))
+        max_concurrency = int(config.parameters.get("max_concurrency", 4))
+        read_ahead = int(config.parameters.get("read_ahead", 4))
+        epochs = int(config.parameters.get("epochs", 2))
+        deadline = reporter.deadline(config.duration_seconds)
+
+        datalake = SimulatedDatalake(samples, image_size, round_trip_ms)
+        transform = _DecodeTransform(datalake.image_shape)
+        query = [{"column": "image", "strategy": "latest"}, {"column": "label", "derived_from": "image"}]
+        cache_root = Path(mkdtemp(prefix="mindtrace-models-datalake-streaming-"))
+        mode_metrics: dict[str, object] = {}
+        completed = True
+
+        def run_epoch(loader: Any) -> int:
+            seen = 0
+            label_sum = 0
+            for _, labels in loader:
+                seen += len(labels)
+                label_sum += int(labels.sum())
+            if seen != samples or label_sum != sum(i % 10 for i in range(samples)):
+                raise ValueError(f"epoch delivered {seen} samples, expected each of {samples} exactly once")
+            return seen
+
+        try:
+            for mode in modes:
+                rates: list[float] = []
+                calls_before = datalake.get_calls
+                dataset: Any = None
+                try:
+                    build_start = time.perf_counter()
+                    if mode in ("lazy", "prefetch"):
+                        dataset = DatalakeDataset(datalake, query, transform, prefetch=mode == "prefetch")
+                        loader = DataLoader(dataset, batch_size=batch_size, shuffle=True)
+                    else:
+                        dataset = StreamingDatalakeDataset(
+                            datalake,
+                            query,
+                            transform,
+                            shuffle=True,
+                            fetch_batch_size=fetch_batch_size,
+                            max_concurrency=max_concurrency,
+                            read_ahead=read_ahead,
+                            cache_dir=cache_root / mode if mode == "streaming_cached" else None,
+                        )
+                        loader = DataLoader(
+                            dataset,
+                            batch_size=batch_size,
+                            num_workers=num_workers,
+                            persistent_workers=num_workers > 0,
+                        )
+                    build_seconds = time.perf_counter() - build_start
+                    if mode == "streaming_cached":
+                        populate_start = time.perf_counter()
+                        run_epoch(loader)
+                        mode_metrics["streaming_cached_populate_seconds"] = time.perf_counter() - populate_start
+
+                    for epoch in range(epochs):
+                        if time.perf_counter() >= deadline or reporter.is_cancelled():
+                            break
+                        op_start = time.perf_counter()
+                        seen = run_epoch(loader)
+                        latency = time.perf_counter() - op_start
+                        if mode == "prefetch" and epoch == 0:
+                            latency += build_seconds
+                        reporter.record_operation(
+                            success=True,
+                            latency_seconds=latency,
+                            bytes_processed=seen * datalake.payload_bytes,
+                            mode=mode,
+                        )
+                        rates.append(seen / latency if latency > 0 else 0.0)
+                except Exception as exc:  # noqa: BLE001 - benchmark records loader failures and moves on
+                    reporter.record_operation(success=False, latency_seconds=0.0, error=exc, mode=mode)
+                finally:
+                    if isinstance(dataset, StreamingDatalakeDataset):
+                        dataset.close()
+
+                completed = completed and len(rates) == epochs
+                mode_metrics[f"{mode}_epochs"] = len(rates)
+                mode_metrics[f"{mode}_mean_samples_per_second"] = sum(rates) / len(rates) if rates else 0.0
+                mode_metrics[f"{mode}_max_samples_per_second"] = max(rates, default=0.0)
+                # DatalakeDataset keeps whatever it fetched, so only the first epoch shows a cold loader.
+                mode_metrics[f"{mode}_first_epoch_samples_per_second"] = rates[0] if rates else 0.0
+                if num_workers == 0 or mode in ("lazy", "prefetch"):
+                    # Worker processes fetch through their own copies, so only in-process calls are counted.
+                    mode_metrics[f"{mode}_get_data_calls"] = datalake.get_calls - calls_before
+        finally:
+            if not config.keep_resources:
+                rmtree(cache_root, ignore_errors=True)
+
+        elapsed = time.perf_counter() - monotonic_start
+        return BenchResult(
+            suite_id=config.suite_id,
+            status="passed" if reporter.failures == 0 and completed else "failed",
+            started_at=started,
+            ended_at=utc_now_iso(),
+            duration_seconds=elapsed,
+            operations=reporter.operations,
+            successes=reporter.successes,
+            failures=reporter.failures,
+            bytes_processed=reporter.bytes_processed,
+            latency_seconds=reporter.latency_seconds,
+            error_counts=reporter.error_counts,
+            metrics={
+                **reporter.metrics,
+                **mode_metrics,
+                "modes": modes,
+                "samples": samples,
+                "image_size": image_size,
+                "round_trip_ms": round_trip_ms,
+                "batch_size": batch_size,
+                "num_workers": num_workers,
+                "fetch_batch_size": fetch_batch_size,
+                "max_concurrency": max_concurrency,
+                "read_ahead": read_ahead,
+                "epochs": epochs,
+            },
+        )
@@ -0,0 +1,278 @@
+"""Detection mAP@50:95 throughput: the streaming multi-threshold accumulator vs. the per-threshold reference."""
+
+from __future__ import annotations
+
+import time
+from types import MappingProxyType
+from typing import Literal
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+from mindtrace.core import (
+    BenchReporter,
+    BenchResult,
+    BenchResultSchema,
+    BenchSuiteConfig,
+    BenchTestSuite,
+    TaskSchema,
+    utc_now_iso,
+)
+from mindtrace.models.evaluation.metrics.detection import (
+    COCO_IOU_THRESHOLDS,
+    DetectionMetricAccumulator,
+    average_precision,
+    box_iou,
+    coco_map_summary,
+)
+
+
+class DetectionMapInput(BaseModel):
+    engine: Literal["accumulator", "reference"] = Field(
+        "accumulator",
+        description="'accumulator' streams batches through DetectionMetricAccumulator; 'reference' re-runs "
+        "per-threshold greedy matching ten times, as mean_average_precision_50_95 did before the accumulator.",
+    )
+    images: int = Field(2_000, ge=1, description="Synthetic images evaluated per operation.")
+    num_classes: int = Field(20, ge=1, description="Number of classes.")
+    gt_per_image: int = Field(8, ge=0, description="Ground-truth boxes per image.")
+    predictions_per_image: int = Field(100, ge=0, description="Predicted boxes per image.")
+    batch_size: int = Field(32, ge=1, description="Images per accumulator update.")
+    seed: int = Field(0, description="Seed for the synthetic boxes.")
+    verify_images: int = Field(
+        200, ge=0, description="Images on which both engines are compared for identical results before timing."
+    )
+
+
+class DetectionMapResources(BaseModel):
+    """Runs entirely in memory on synthetic data."""
+
+
+class DetectionMapSuite(BenchTestSuite):
+    suite_id = "models.stress.detection_map"
+    title = "Models stress — detection mAP@50:95 throughput"
+    description = (
+        "Builds ``images`` synthetic images with jittered true positives and random false positives, then "
+        "repeatedly computes COCO mAP@50:95 with the selected ``engine``. Before timing, both engines are run on "
+        "``verify_images`` images and must agree exactly. Reports images per second."
+    )
+    tags = frozenset({"stress", "models"})
+    requires = ()
+    safety = "CPU only; no files, network, or models are touched."
+    task_schema = TaskSchema(name=suite_id, input_schema=DetectionMapInput, output_schema=BenchResultSchema)
+    resource_schema = DetectionMapResources
+    profiles = MappingProxyType(
+        {
+            "smoke": {"duration_seconds": 10.0, "images": 100, "verify_images": 100},
+            "stress": {"duration_seconds": 60.0, "engine": "accumulator", "images": 5_000, "num_classes": 80},
+            "reference_baseline": {
+                "duration_seconds": 60.0,
+                "engine": "reference",
+                "images": 5_000,
+                "num_classes": 80,
+            },
+        },
+    )
+
+    def execute_bench(self, config: BenchSuiteConfig, reporter: BenchReporter) -> BenchResult:
+        started = utc_now_iso()
+        monotonic_start = time.perf_counter()
+        engine = str(config.parameters.get("engine", "accumulator")).lower()
+        images = int(config.parameters.get("images", 2_000))
+        num_classes = int(config.parameters.get("num_classes", 20))
+        gt_per_image = int(config.parameters.get("gt_per_image", 8))
+        predictions_per_image = int(config.parameters.get("predictions_per_image", 100))
+        batch_size = int(config.parameters.get("batch_size", 32))
+        seed = int(config.parameters.get("seed", 0))
+        verify_images = min(int(config.parameters.get("verify_images", 200)), images)
+
+        predictions, targets = synthetic_detections(
+            images,
+            num_classes=num_classes,
+            gt_per_image=gt_per_image,
+            predictions_per_image=predictions_per_image,
+            seed=seed,
+        )
+
+        def evaluate(preds: list[dict], tgts: list[dict], which: str) -> dict[str, float]:
+            if which == "reference":
+                return reference_mean_average_precision_50_95(preds, tgts, num_classes)
+            accumulator = DetectionMetricAccumulator(num_classes)
+            for start in range(0, len(preds), batch_size):
+                accumulator.update(preds[start : start + batch_size], tgts[start : start + batch_size])
+            return coco_map_summary(accumulator.compute())
+
+        verified: bool | None = None
+        if verify_images:
+            op_start = time.perf_counter()
+            subset = (predictions[:verify_images], targets[:verify_images])
+            expected = evaluate(*subset, "reference")
+            actual = evaluate(*subset, "accumulator")
+            verified = actual == expected
+            if not verified:
+                reporter.record_operation(
+                    success=False,
+                    latency_seconds=time.perf_counter() - op_start,
+                    error=AssertionError(f"accumulator {actual} != reference {expected}"),
+                )
+
+        last_result: dict[str, float] | None = None
+        eval_seconds: list[float] = []
+        deadline = reporter.deadline(config.duration_seconds)
+        while time.perf_counter() < deadline and not reporter.is_cancelled():
+            op_start = time.perf_counter()
+            try:
+                last_result = evaluate(predictions, targets, engine)
+            except Exception as exc:  # noqa: BLE001
+                reporter.record_operation(success=False, latency_seconds=time.perf_counter() - op_start, error=exc)
+                continue
+            eval_seconds.append(time.perf_counter() - op_start)
+            reporter.record_operation(success=True, latency_seconds=eval_seconds[-1])
+
+        elapsed = time.perf_counter() - monotonic_start
+        mean_eval_seconds = sum(eval_seconds) / len(eval_seconds) if eval_seconds else None
+        return BenchResult(
+            suite_id=config.suite_id,
+            status="passed" if reporter.failures == 0 else "failed",
+            started_at=started,
+            ended_at=utc_now_iso(),
+            duration_seconds=elapsed,
+            operations=reporter.operations,
+            successes=reporter.successes,
+            failures=reporter.failures,
+            latency_seconds=reporter.latency_seconds,
+            error_counts=reporter.error_counts,
+            metrics={
+                **reporter.metrics,
+                "engine": engine,
+                "images": images,
+                "num_classes": num_classes,
+                "gt_per_image": gt_per_image,
+                "predictions_per_image": predictions_per_image,
+                "batch_size": batch_size,
+                "verify_images": verify_images,
+                "verified_identical": verified,
+                "mean_eval_seconds": mean_eval_seconds,
+                "images_per_second": images / mean_eval_seconds if mean_eval_seconds else None,
+                **(last_result or {}),
+            },
+        )
+
+
+def synthetic_detections(
+    images: int,
+    *,
+    num_classes: int,
+    gt_per_image: int,
+    predictions_per_image: int,
+    seed: int = 0,
+) -> tuple[list[dict], list[dict]]:
+    """Build per-image prediction and target dicts in the format of :func:`mean_average_precision`.
+
+    Roughly half of the predictions are jittered copies of GT boxes (some relabelled, some duplicated);
+    the rest are random boxes. Scores are rounded to two decimals so tied scores occur.
+    """
+    rng = np.random.default_rng(seed)
+    predictions: list[dict] = []
+    targets: list[dict] = []
+    for _ in range(images):
+        gt_xy = rng.uniform(0, 560, size=(gt_per_image, 2))
+        gt_wh = rng.uniform(16, 200, size=(gt_per_image, 2))
+        gt_boxes = np.concatenate([gt_xy, gt_xy + gt_wh], axis=1)
+        gt_labels = rng.integers(0, num_classes, size=gt_per_image)
+
+        n_matched = predictions_per_image // 2 if gt_per_image else 0
+        source = rng.integers(0, max(gt_per_image, 1), size=n_matched)
+        matched_boxes = gt_boxes[source] + rng.normal(0.0, 0.08, size=(n_matched, 4)) * np.tile(gt_wh[source], 2)
+        matched_labels = np.where(
+            rng.random(n_matched) < 0.9, gt_labels[source], rng.integers(0, num_classes, n_matched)
+        )
+
+        n_random = predictions_per_image - n_matched
+        random_xy = rng.uniform(0, 600, size=(n_random, 2))
+        random_boxes = np.concatenate([random_xy, random_xy + rng.uniform(8, 160, size=(n_random, 2))], axis=1)
+
+        predictions.append(
+            {
+                "boxes": np.concatenate([matched_boxes, random_boxes]),
+                "scores": np.round(rng.random(predictions_per_image), 2),
+                "labels": np.concatenate([matched_labels, rng.integers(0, num_classes, n_random)]),
+            }
+        )
+        targets.append({"boxes": gt_boxes, "labels": gt_labels})
+    return predictions, targets
+
+
+def _reference_match(
+    pred_boxes: np.ndarray, pred_scores: np.ndarray, gt_boxes: np.ndarray, iou_threshold: float
+) -> tuple[np.ndarray, np.ndarray]:
+    order = np.argsort(-pred_scores)
+    sorted_scores = pred_scores[order]
+    is_tp = np.zeros(pred_boxes.shape[0], dtype=bool)
+    gt_matched = np.zeros(gt_boxes.shape[0], dtype=bool)
+    iou_mat = box_iou(pred_boxes[order], gt_boxes)
+    for i in range(pred_boxes.shape[0]):
+        best_iou = iou_threshold - 1e-10
+        best_j = -1
+        for j in range(gt_boxes.shape[0]):
+            if not gt_matched[j] and iou_mat[i, j] > best_iou:
+                best_iou = iou_mat[i, j]
+                best_j = j
+        if best_j >= 0:
+            is_tp[i] = True
+            gt_matched[best_j] = True
+    return sorted_scores, is_tp
+
+
+def _reference_map(predictions: list[dict], targets: list[dict], num_classes: int, iou_threshold: float) -> float:
+    class_scores: dict[int, list[np.ndarray]] = {c: [] for c in range(num_classes)}
+    class_matched: dict[int, list[np.ndarray]] = {c: [] for c in range(num_classes)}
+    class_num_gt = dict.fromkeys(range(num_classes), 0)
+    for pred, tgt in zip(predictions, targets):
+        pred_boxes = np.asarray(pred["boxes"], dtype=np.float64)
+        pred_scores = np.asarray(pred["scores"], dtype=np.float64)
+        pred_labels = np.asarray(pred["labels"], dtype=np.int64)
+        gt_boxes = np.asarray(tgt["boxes"], dtype=np.float64)
+        gt_labels = np.asarray(tgt["labels"], dtype=np.int64)
+        for c in range(num_classes):
+            pred_mask = pred_labels == c
+            gt_mask = gt_labels == c
+            class_num_gt[c] += int(gt_mask.sum())
+            if not pred_mask.any():
+                continue
+            if not gt_mask.any():
+                class_scores[c].append(pred_scores[pred_mask])
+                class_matched[c].append(np.zeros(int(pred_mask.sum()), dtype=bool))
+                continue
+            sorted_scores, is_tp = _reference_match(
+                pred_boxes[pred_mask], pred_scores[pred_mask], gt_boxes[gt_mask], iou_threshold
+            )
+            class_scores[c].append(sorted_scores)
+            class_matched[c].append(is_tp)
+
+    ap_values = [
+        average_precision(np.concatenate(class_scores[c]), np.concatenate(class_matched[c]), class_num_gt[c])
+        if class_scores[c]
+        else 0.0
+        for c in range(num_classes)
+        if class_num_gt[c]
+    ]
+    return float(np.mean(ap_values)) if ap_values else 0.0
+
+
+def reference_mean_average_precision_50_95(
+    predictions: list[dict], targets: list[dict], num_classes: int
+) -> dict[str, float]:
+    """COCO mAP@50:95 computed one threshold at a time with a scalar greedy matching loop.
+
+    This is the implementation the accumulator replaced; it is kept as the parity reference.
+    """
+    map_at_threshold = {
+        round(float(iou_t), 2): _reference_map(predictions, targets, num_classes, float(iou_t))
+        for iou_t in COCO_IOU_THRESHOLDS
+    }
+    return {
+        "mAP@50:95": float(np.mean(list(map_at_threshold.values()))),
+        "mAP@50": map_at_threshold[0.5],
+        "mAP@75": map_at_threshold[0.75],
+    }
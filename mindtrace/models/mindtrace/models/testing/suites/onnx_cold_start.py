@@ -0,0 +1,217 @@
+"""ONNX cold-start latency: proto round-trip vs. artifact-path loading vs. the registry-cached optimized graph."""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from shutil import rmtree
+from tempfile import mkdtemp
+from types import MappingProxyType
+from typing import Any, Literal
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+from mindtrace.core import (
+    BenchReporter,
+    BenchResult,
+    BenchResultSchema,
+    BenchSuiteConfig,
+    BenchTestSuite,
+    TaskSchema,
+    utc_now_iso,
+)
+from mindtrace.registry import LocalRegistryBackend, Registry
+
+LoadMode = Literal["proto", "artifact", "optimized_cache"]
+LOAD_MODES: tuple[str, ...] = ("proto", "artifact", "optimized_cache")
+
+
+class OnnxColdStartInput(BaseModel):
+    load_modes: list[LoadMode] = Field(
+        default_factory=lambda: list(LOAD_MODES),
+        description="'proto' loads the ModelProto and passes its serialised bytes (the previous behaviour); "
+        "'artifact' opens model.onnx from the registry; 'optimized_cache' reuses the ORT-optimized graph "
+        "persisted on the first load.",
+    )
+    hidden_size: int = Field(1024, ge=1, description="Width of each square MatMul weight.")
+    layers: int = Field(8, ge=1, description="Number of MatMul + Add + Relu blocks.")
+    pull_mode: Literal["copy", "reflink", "link", "direct"] = Field(
+        "direct", description="LocalRegistryBackend pull mode for the immutable registry."
+    )
+    iterations: int = Field(10, ge=1, description="Cold starts per load mode.")
+    seed: int = Field(0, description="Seed for the synthetic weights.")
+
+
+class OnnxColdStartResources(BaseModel):
+    """Uses only temporary local directories and the CPU execution provider."""
+
+
+class OnnxColdStartSuite(BenchTestSuite):
+    suite_id = "models.stress.onnx_cold_start"
+    title = "Models stress — ONNX service cold start"
+    description = (
+        "Saves a synthetic ``layers``-deep MLP into an immutable local registry, then repeatedly creates an "
+        "onnxruntime session the way ``OnnxModelService.load_model`` does for each load mode and runs one batch "
+        "through it. Outputs of every mode are compared against those of the first one. Reports per-mode cold-start "
+        "latency; the first, cache-populating load of 'optimized_cache' is reported separately."
+    )
+    tags = frozenset({"stress", "models"})
+    requires = ("local_disk",)
+    safety = "Writes only to temporary directories that are removed afterwards."
+    task_schema = TaskSchema(name=suite_id, input_schema=OnnxColdStartInput, output_schema=BenchResultSchema)
+    resource_schema = OnnxColdStartResources
+    profiles = MappingProxyType(
+        {
+            "smoke": {"duration_seconds": 30.0, "hidden_size": 64, "layers": 2, "iterations": 3},
+            "stress": {"duration_seconds": 300.0, "hidden_size": 1024, "layers": 8, "iterations": 10},
+            "stress_large": {"duration_seconds": 900.0, "hidden_size": 2048, "layers": 24, "iterations": 5},
+        },
+    )
+
+    def execute_bench(self, config: BenchSuiteConfig, reporter: BenchReporter) -> BenchResult:
+        from mindtrace.models.serving.onnx.service import OnnxModelService, _require_onnxruntime
+
+        started = utc_now_iso()
+        monotonic_start = time.perf_counter()
+        load_modes = [str(mode).lower() for mode in config.parameters.get("load_modes") or LOAD_MODES]
+        hidden_size = int(config.parameters.get("hidden_size", 1024))
+        layers = int(config.parameters.get("layers", 8))
+        pull_mode = str(config.parameters.get("pull_mode", "direct")).lower()
+        iterations = int(config.parameters.get("iterations", 10))
+        seed = int(config.parameters.get("seed", 0))
+        deadline = reporter.deadline(config.duration_seconds)
+
+        ort = _require_onnxruntime()
+        model = synthetic_onnx_mlp(hidden_size=hidden_size, layers=layers, seed=seed)
+        model_bytes = model.ByteSize()
+        batch = {"x": np.random.default_rng(seed).standard_normal((4, hidden_size), dtype=np.float32)}
+
+        registry_path = Path(mkdtemp(prefix="mindtrace-models-onnx-cold-start-"))
+        mode_metrics: dict[str, object] = {}
+        completed = True
+        try:
+            registry = Registry(
+                backend=LocalRegistryBackend(uri=registry_path, pull_mode=pull_mode), version_objects=True
+            )
+            registry.save("bench-mlp:v1", model)
+            del model
+            service = OnnxModelService(
+                model_name="bench-mlp",
+                model_version="v1",
+                registry=registry,
+                providers=["CPUExecutionProvider"],
+                live_service=False,
+            )
+            reference: dict[str, np.ndarray] | None = None
+
+            def cold_start(mode: str) -> dict[str, np.ndarray]:
+                service.session = None
+                if mode == "proto":
+                    service.session = service._load_from_proto(ort, "bench-mlp:v1")
+                else:
+                    service.cache_optimized_model = mode == "optimized_cache"
+                    service.load_model()
+                return service.run(batch)
+
+            for mode in load_modes:
+                latencies: list[float] = []
+                if mode == "optimized_cache":
+                    op_start = time.perf_counter()
+                    try:
+                        cold_start(mode)
+                    except Exception as exc:  # noqa: BLE001 - benchmark records load failures
+                        reporter.record_operation(
+                            success=False, latency_seconds=time.perf_counter() - op_start, error=exc
+                        )
+                        completed = False
+                        continue
+                    mode_metrics["optimized_cache_populate_seconds"] = time.perf_counter() - op_start
+                while len(latencies) < iterations and time.perf_counter() < deadline and not reporter.is_cancelled():
+                    op_start = time.perf_counter()
+                    try:
+                        outputs = cold_start(mode)
+                        latency = time.perf_counter() - op_start
+                        if reference is None:
+                            reference = outputs
+                        elif not all(np.allclose(outputs[k], reference[k], rtol=1e-4, atol=1e-4) for k in reference):
+                            raise ValueError(f"{mode} outputs differ from the first loaded session")
+                    except Exception as exc:  # noqa: BLE001 - benchmark records load failures
+                        reporter.record_operation(
+                            success=False, latency_seconds=time.perf_counter() - op_start, error=exc
+                        )
+                        break
+                    reporter.record_operation(success=True, latency_seconds=latency, bytes_processed=model_bytes)
+                    latencies.append(latency)
+
+                completed = completed and len(latencies) == iterations
+                mean = sum(latencies) / len(latencies) if latencies else 0.0
+                mode_metrics[f"{mode}_loads"] = len(latencies)
+                mode_metrics[f"{mode}_mean_cold_start_seconds"] = mean
+                mode_metrics[f"{mode}_min_cold_start_seconds"] = min(latencies, default=0.0)
+            service.session = None
+        except Exception as exc:  # noqa: BLE001 - e.g. setup failure for an unsupported pull mode
+            reporter.record_operation(success=False, latency_seconds=0.0, error=exc)
+            completed = False
+        finally:
+            if not config.keep_resources:
+                rmtree(registry_path, ignore_errors=True)
+
+        elapsed = time.perf_counter() - monotonic_start
+        return BenchResult(
+            suite_id=config.suite_id,
+            status="passed" if reporter.failures == 0 and completed else "failed",
+            started_at=started,
+            ended_at=utc_now_iso(),
+            duration_seconds=elapsed,
+            operations=reporter.operations,
+            successes=reporter.successes,
+            failures=reporter.failures,
+            bytes_processed=reporter.bytes_processed,
+            latency_seconds=reporter.latency_seconds,
+            error_counts=reporter.error_counts,
+            metrics={
+                **reporter.metrics,
+                **mode_metrics,
+                "load_modes": load_modes,
+                "hidden_size": hidden_size,
+                "layers": layers,
+                "model_bytes": model_bytes,
+                "pull_mode": pull_mode,
+                "iterations": iterations,
+                "onnxruntime_version": ort.__version__,
+            },
+        )
+
+
+def synthetic_onnx_mlp(*, hidden_size: int, layers: int, seed: int = 0) -> Any:
+    """Build an ``onnx.ModelProto`` of ``layers`` MatMul + Add + Relu blocks over a dynamic batch.
+
+    The MatMul + Add pairs are fused by onnxruntime's graph optimizer, so the optimized graph differs from
+    the stored one.
+    """
+    from onnx import TensorProto, helper, numpy_helper
+
+    rng = np.random.default_rng(seed)
+    nodes = []
+    initializers = []
+    current = "x"
+    for i in range(layers):
+        weight = rng.standard_normal((hidden_size, hidden_size), dtype=np.float32) / np.sqrt(hidden_size)
+        initializers.append(numpy_helper.from_array(weight.astype(np.float32), f"w{i}"))
+        initializers.append(numpy_helper.from_array(np.full(hidden_size, 0.01, dtype=np.float32), f"b{i}"))
+        nodes.append(helper.make_node("MatMul", [current, f"w{i}"], [f"mm{i}"]))
+        nodes.append(helper.make_node("Add", [f"mm{i}", f"b{i}"], [f"add{i}"]))
+        current = "y" if i == layers - 1 else f"h{i}"
+        nodes.append(helper.make_node("Relu", [f"add{i}"], [current]))
+    graph = helper.make_graph(
+        nodes,
+        "mlp",
+        [helper.make_tensor_value_info("x", TensorProto.FLOAT, [None, hidden_size])],
+        [helper.make_tensor_value_info("y", TensorProto.FLOAT, [None, hidden_size])],
+        initializers,
+    )
+    # Pin the IR version so older onnxruntime releases can load what a newer ``onnx`` package writes.
+    return helper.make_model(
+        graph, producer_name="mindtrace-bench", opset_imports=[helper.make_opsetid("", 17)], ir_version=8
+    )
@@ -24,6 +24,9 @@ Quick start::
     ])
     with composite.run("exp_001", config={"batch_size": 32}):
         composite.log({"val_loss": 0.31}, step=10)
+
+    # Keep slow backends off the training thread
+    composite = CompositeTracker(trackers=[...], background=True)
 """
 
 from __future__ import annotations
@@ -31,6 +34,7 @@ from __future__ import annotations
 from mindtrace.models.tracking.backends.mlflow import MLflowTracker
 from mindtrace.models.tracking.backends.tensorboard import TensorBoardTracker
 from mindtrace.models.tracking.backends.wandb import WandBTracker
+from mindtrace.models.tracking.background import BackgroundTracker, TrackerQueueStats
 from mindtrace.models.tracking.bridges import (
     HuggingFaceTrackerBridge,
     UltralyticsTrackerBridge,
@@ -39,11 +43,13 @@ from mindtrace.models.tracking.registry_bridge import RegistryBridge
 from mindtrace.models.tracking.tracker import CompositeTracker, Tracker
 
 __all__ = [
+    "BackgroundTracker",
     "CompositeTracker",
     "MLflowTracker",
     "RegistryBridge",
     "TensorBoardTracker",
     "Tracker",
+    "TrackerQueueStats",
     "WandBTracker",
     # Bridges
     "UltralyticsTrackerBridge",
@@ -8,6 +8,7 @@ even when ``mlflow`` is not installed; methods that require it raise a clear
 
 from __future__ import annotations
 
+import time
 from typing import Any
 
 from mindtrace.models.tracking.tracker import Tracker
@@ -24,6 +25,7 @@ except ImportError:  # pragma: no cover
     _MLFLOW_AVAILABLE = False
 
 _MLFLOW_INSTALL_MSG = "MLflow is not installed. Install it with: pip install mlflow"
+_MLFLOW_MAX_METRICS_PER_BATCH = 1000  # Server-side limit of a single log_batch request
 
 
 class MLflowTracker(Tracker):
@@ -142,6 +144,36 @@ class MLflowTracker(Tracker):
 
         mlflow.log_metrics(metrics, step=step)
 
+    def log_batch(self, batch: list[tuple[dict[str, float], int]]) -> None:
+        """Log several steps' metrics with one ``MlflowClient.log_batch`` request per 1000 values.
+
+        Falls back to per-step :meth:`log` when no run is active, which lets
+        MLflow start one as ``mlflow.log_metrics`` would.
+
+        Args:
+            batch: ``(metrics, step)`` pairs in logging order.
+
+        Raises:
+            ImportError: If ``mlflow`` is not installed.
+        """
+        if not _MLFLOW_AVAILABLE:  # pragma: no cover
+            raise ImportError(_MLFLOW_INSTALL_MSG)
+
+        run = mlflow.active_run()
+        if run is None:
+            super().log_batch(batch)
+            return
+
+        timestamp = int(time.time() * 1000)
+        entries = [
+            mlflow.entities.Metric(key, float(value), timestamp, step)
+            for metrics, step in batch
+            for key, value in metrics.items()
+        ]
+        client = mlflow.MlflowClient()
+        for start in range(0, len(entries), _MLFLOW_MAX_METRICS_PER_BATCH):
+            client.log_batch(run.info.run_id, metrics=entries[start : start + _MLFLOW_MAX_METRICS_PER_BATCH])
+
     def log_params(self, params: dict[str, Any]) -> None:
         """Log a dictionary of parameters to the active MLflow run.
 
@@ -0,0 +1,313 @@
+"""Background dispatch for experiment trackers.
+
+:class:`BackgroundTracker` wraps any :class:`~mindtrace.models.tracking.tracker.Tracker`
+so that logging never runs on the training thread: calls are queued and a
+dedicated worker thread replays them on the wrapped backend.  Consecutive
+:meth:`~Tracker.log` calls are coalesced per step and handed to the backend's
+:meth:`~Tracker.log_batch` in one go, so a slow MLflow file store, a TensorBoard
+flush or a registry push only delays the worker.
+
+Every backend call happens on the worker thread, including ``start_run`` and
+``finish``, so backends that keep the active run in thread-local state (such as
+MLflow) see a consistent run.
+"""
+
+from __future__ import annotations
+
+import copy
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Literal
+
+from mindtrace.models.tracking.tracker import Tracker
+
+OverflowPolicy = Literal["block", "drop"]
+
+_FLUSH_WINDOW = 256  # Recent flushes the latency statistics are computed over
+
+
+@dataclass(frozen=True)
+class TrackerQueueStats:
+    """Queue and flush statistics of one :class:`BackgroundTracker`.
+
+    Attributes:
+        backend: Class name of the wrapped tracker.
+        queued: Calls waiting for the worker.
+        pending_steps: Coalesced steps held by the worker for the next flush.
+        logged: Metric ``log`` calls accepted from the caller.
+        dropped: Metric ``log`` calls discarded by the ``"drop"`` policy.
+        flushes: ``log_batch`` calls made on the backend.
+        errors: Backend calls that raised.
+        mean_flush_ms: Mean duration of the recent backend ``log_batch`` calls.
+        max_flush_ms: Longest of the recent backend ``log_batch`` calls.
+        last_flush_ms: Duration of the most recent backend ``log_batch`` call.
+    """
+
+    backend: str
+    queued: int
+    pending_steps: int
+    logged: int
+    dropped: int
+    flushes: int
+    errors: int
+    mean_flush_ms: float
+    max_flush_ms: float
+    last_flush_ms: float
+
+
+class _Call:
+    """A non-metric tracker call replayed in order by the worker."""
+
+    __slots__ = ("method", "args", "done", "error")
+
+    def __init__(self, method: str, args: tuple[Any, ...], wait: bool) -> None:
+        self.method = method
+        self.args = args
+        self.done = threading.Event() if wait else None
+        self.error: BaseException | None = None
+
+
+class BackgroundTracker(Tracker):
+    """Run a tracker's calls on a background thread behind a bounded queue.
+
+    Metric dicts passed to :meth:`log` are merged per step and flushed to the
+    wrapped tracker's :meth:`~Tracker.log_batch` when *max_batch_steps* steps
+    are pending, when *flush_interval* seconds have passed since the oldest
+    pending one, before any other call is replayed, and on :meth:`flush` /
+    :meth:`finish`.  Other calls keep their order relative to the metrics.
+
+    When *max_queue_size* calls are already waiting, ``on_full="block"``
+    makes :meth:`log` wait for room and ``on_full="drop"`` discards the new
+    metrics (counted in :meth:`stats`).  Run, parameter, model and artifact
+    calls are never dropped.
+
+    Backend errors are logged and counted instead of raised, since the caller
+    has moved on by the time they happen; only :meth:`finish` re-raises an
+    error from the backend's own ``finish``.
+
+    Args:
+        tracker: The tracker to wrap.
+        max_queue_size: Calls that may wait for the worker before the
+            overflow policy applies.
+        max_batch_steps: Coalesced steps that trigger a flush.
+        flush_interval: Seconds a pending step may wait before it is flushed.
+        on_full: ``"block"`` or ``"drop"``; see above.
+        snapshot_models: Deep-copy models passed to :meth:`log_model` before
+            queueing them, so training can keep updating the weights while
+            the copy is persisted.  Disable only if the caller hands over a
+            model it no longer mutates.
+        **kwargs: Forwarded to :class:`~mindtrace.core.MindtraceABC`.
+
+    Example:
+        ```python
+        tracker = BackgroundTracker(MLflowTracker(experiment_name="detection"), flush_interval=2.0)
+        with tracker.run("exp_001", config={"lr": 1e-3}):
+            for step, loss in enumerate(losses):
+                tracker.log({"train/loss": loss}, step=step)  # returns immediately
+        print(tracker.stats().mean_flush_ms)
+        ```
+    """
+
+    def __init__(
+        self,
+        tracker: Tracker,
+        *,
+        max_queue_size: int = 1024,
+        max_batch_steps: int = 64,
+        flush_interval: float = 1.0,
+        on_full: OverflowPolicy = "block",
+        snapshot_models: bool = True,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        if on_full not in ("block", "drop"):
+            raise ValueError(f"on_full must be 'block' or 'drop', got {on_full!r}")
+        if max_queue_size < 1 or max_batch_steps < 1:
+            raise ValueError("max_queue_size and max_batch_steps must be at least 1")
+        self.tracker = tracker
+        self.max_queue_size = max_queue_size
+        self.max_batch_steps = max_batch_steps
+        self.flush_interval = flush_interval
+        self.on_full = on_full
+        self.snapshot_models = snapshot_models
+
+        self._queue: deque[tuple[dict[str, float], int] | _Call] = deque()
+        self._cond = threading.Condition()
+        self._closed = False
+        self._pending: dict[int, dict[str, float]] = {}
+        self._logged = 0
+        self._dropped = 0
+        self._errors = 0
+        self._flushes = 0
+        self._flush_seconds: deque[float] = deque(maxlen=_FLUSH_WINDOW)
+        self._worker = threading.Thread(
+            target=self._run, name=f"BackgroundTracker-{type(tracker).__name__}", daemon=True
+        )
+        self._worker.start()
+
+    # ------------------------------------------------------------------
+    # Caller side
+    # ------------------------------------------------------------------
+
+    def _put(self, item: tuple[dict[str, float], int] | _Call, *, droppable: bool = False) -> None:
+        with self._cond:
+            if self._closed:
+                raise RuntimeError(f"BackgroundTracker for {type(self.tracker).__name__} is closed")
+            while len(self._queue) >= self.max_queue_size:
+                if droppable and self.on_full == "drop":
+                    self._dropped += 1
+                    return
+                self._cond.wait()
+            self._queue.append(item)
+            if droppable:
+                self._logged += 1
+            self._cond.notify_all()
+
+    def _call(self, method: str, *args: Any, wait: bool = False) -> None:
+        call = _Call(method, args, wait)
+        self._put(call)
+        if call.done is not None:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+
+    def start_run(self, name: str, config: dict[str, Any]) -> None:
+        self._call("start_run", name, dict(config))
+
+    def log(self, metrics: dict[str, float], step: int) -> None:
+        self._put((dict(metrics), step), droppable=True)
+
+    def log_params(self, params: dict[str, Any]) -> None:
+        self._call("log_params", dict(params))
+
+    def log_model(self, model: Any, name: str, version: str) -> None:
+        self._call("log_model", copy.deepcopy(model) if self.snapshot_models else model, name, version)
+
+    def log_artifact(self, path: str) -> None:
+        """Queue an artifact upload; the file must stay unchanged until :meth:`flush` returns."""
+        self._call("log_artifact", path)
+
+    def flush(self) -> None:
+        """Block until every call queued so far has reached the backend."""
+        self._call("flush", wait=True)
+
+    def finish(self) -> None:
+        """Flush, then finish the wrapped tracker's run and wait for it."""
+        self._call("finish", wait=True)
+
+    def close(self) -> None:
+        """Flush outstanding calls and stop the worker thread; the tracker cannot be used afterwards."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._worker.join()
+
+    @property
+    def closed(self) -> bool:
+        """Whether :meth:`close` has been called."""
+        return self._closed
+
+    def stats(self) -> TrackerQueueStats:
+        """Return queue depth, drop counts and backend flush latency."""
+        with self._cond:
+            recent = list(self._flush_seconds)
+            queued = len(self._queue)
+            pending = len(self._pending)
+        return TrackerQueueStats(
+            backend=type(self.tracker).__name__,
+            queued=queued,
+            pending_steps=pending,
+            logged=self._logged,
+            dropped=self._dropped,
+            flushes=self._flushes,
+            errors=self._errors,
+            mean_flush_ms=1000.0 * sum(recent) / len(recent) if recent else 0.0,
+            max_flush_ms=1000.0 * max(recent, default=0.0),
+            last_flush_ms=1000.0 * recent[-1] if recent else 0.0,
+        )
+
+    # ------------------------------------------------------------------
+    # Worker side
+    # ------------------------------------------------------------------
+
+    def _run(self) -> None:
+        oldest_pending = 0.0
+        while True:
+            with self._cond:
+                while not self._queue and not self._closed:
+                    if not self._pending:
+                        self._cond.wait()
+                        continue
+                    remaining = oldest_pending + self.flush_interval - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                if not self._queue:
+                    # Interval elapsed with nothing new, or closing.
+                    closing = self._closed
+                    item = None
+                else:
+                    closing = False
+                    item = self._queue.popleft()
+                    self._cond.notify_all()
+
+            if item is None:
+                self._flush_pending()
+                if closing:
+                    return
+                continue
+
+            if isinstance(item, _Call):
+                self._flush_pending()
+                self._replay(item)
+                continue
+
+            metrics, step = item
+            with self._cond:
+                if not self._pending:
+                    oldest_pending = time.monotonic()
+                self._pending.setdefault(step, {}).update(metrics)
+                full = len(self._pending) >= self.max_batch_steps
+            if full:
+                self._flush_pending()
+
+    def _flush_pending(self) -> None:
+        with self._cond:
+            if not self._pending:
+                return
+            batch = [(metrics, step) for step, metrics in self._pending.items()]
+            self._pending = {}
+        start = time.perf_counter()
+        try:
+            self.tracker.log_batch(batch)
+        except Exception as exc:  # noqa: BLE001 - the caller has moved on; report and keep going
+            self._errors += 1
+            self.logger.warning(
+                "%s.log_batch failed for %d step(s): %s", type(self.tracker).__name__, len(batch), exc, exc_info=True
+            )
+        finally:
+            with self._cond:
+                self._flushes += 1
+                self._flush_seconds.append(time.perf_counter() - start)
+
+    def _replay(self, call: _Call) -> None:
+        try:
+            if call.method != "flush":
+                getattr(self.tracker, call.method)(*call.args)
+        except Exception as exc:  # noqa: BLE001 - the caller has moved on; report and keep going
+            self._errors += 1
+            self.logger.warning(
+                "%s.%s failed: %s", type(self.tracker).__name__, call.method, exc, exc_info=call.done is None
+            )
+            if call.method == "finish":
+                call.error = exc
+        finally:
+            if call.done is not None:
+                call.done.set()
+
+
+__all__ = ["BackgroundTracker", "OverflowPolicy", "TrackerQueueStats"]
@@ -98,6 +98,29 @@ class Tracker(MindtraceABC):
         (e.g. close file handles, end the remote run).
         """
 
+    # ------------------------------------------------------------------
+    # Optional hooks
+    # ------------------------------------------------------------------
+
+    def log_batch(self, batch: list[tuple[dict[str, float], int]]) -> None:
+        """Log several steps' metrics at once.
+
+        The default calls :meth:`log` once per entry; backends with a bulk API
+        override it.  :class:`~mindtrace.models.tracking.background.BackgroundTracker`
+        flushes coalesced metrics through this method.
+
+        Args:
+            batch: ``(metrics, step)`` pairs in logging order.
+        """
+        for metrics, step in batch:
+            self.log(metrics, step)
+
+    def flush(self) -> None:
+        """Block until previously logged data has been handed to the backend.
+
+        A no-op for trackers that log synchronously.
+        """
+
     # ------------------------------------------------------------------
     # Context manager
     # ------------------------------------------------------------------
@@ -210,8 +233,22 @@ class CompositeTracker(Tracker):
     failing backend does not abort the entire logging operation; the
     exception is re-raised only if *all* children fail.
 
+    With ``background=True`` every child is wrapped in a
+    :class:`~mindtrace.models.tracking.background.BackgroundTracker`, giving
+    each backend its own queue and worker thread: logging calls return
+    immediately and a slow backend no longer holds up the others or the
+    training loop.  Child errors are then logged and counted in
+    :meth:`stats` rather than raised.  :meth:`finish` closes the wrappers it
+    created, stopping their worker threads; the next :meth:`start_run` wraps
+    the children again.
+
     Args:
         trackers: Sequence of concrete :class:`Tracker` instances to fan out to.
+        background: Dispatch to every child from a background thread.
+        background_options: Keyword arguments for each
+            :class:`~mindtrace.models.tracking.background.BackgroundTracker`
+            (``max_queue_size``, ``max_batch_steps``, ``flush_interval``,
+            ``on_full``, ``snapshot_models``).
 
     Example:
         ```python
@@ -225,11 +262,20 @@ class CompositeTracker(Tracker):
         ```
     """
 
-    def __init__(self, trackers: list[Tracker], **kwargs: Any) -> None:
+    def __init__(
+        self,
+        trackers: list[Tracker],
+        *,
+        background: bool = False,
+        background_options: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> None:
         """Initialise the composite tracker.
 
         Args:
             trackers: List of child :class:`Tracker` instances.
+            background: Wrap each child in a ``BackgroundTracker``.
+            background_options: Keyword arguments for each ``BackgroundTracker``.
             **kwargs: Accepted for forward compatibility; not forwarded to
                 children.
         """
@@ -240,6 +286,16 @@ class CompositeTracker(Tracker):
                 "Pass a non-empty list via the 'trackers' argument."
             )
         self._trackers: list[Tracker] = list(trackers)
+        self._background_options = background_options or {}
+        # Indices of the BackgroundTracker wrappers this composite created and therefore closes.
+        self._owned: list[int] = []
+        if background:
+            from mindtrace.models.tracking.background import BackgroundTracker
+
+            for index, child in enumerate(self._trackers):
+                if not isinstance(child, BackgroundTracker):
+                    self._trackers[index] = BackgroundTracker(child, **self._background_options)
+                    self._owned.append(index)
         self.logger.debug("CompositeTracker initialised with %d child tracker(s).", len(self._trackers))
 
     # ------------------------------------------------------------------
@@ -288,6 +344,13 @@ class CompositeTracker(Tracker):
             name: Run name forwarded to each child.
             config: Configuration dictionary forwarded to each child.
         """
+        if any(self._trackers[index].closed for index in self._owned):
+            from mindtrace.models.tracking.background import BackgroundTracker
+
+            for index in self._owned:
+                wrapper = self._trackers[index]
+                if wrapper.closed:
+                    self._trackers[index] = BackgroundTracker(wrapper.tracker, **self._background_options)
         self._dispatch("start_run", name, config)
 
     def log(self, metrics: dict[str, float], step: int) -> None:
@@ -325,9 +388,29 @@ class CompositeTracker(Tracker):
         """
         self._dispatch("log_artifact", path)
 
+    def log_batch(self, batch: list[tuple[dict[str, float], int]]) -> None:
+        """Log several steps' metrics on all child trackers.
+
+        Args:
+            batch: ``(metrics, step)`` pairs in logging order.
+        """
+        self._dispatch("log_batch", batch)
+
+    def flush(self) -> None:
+        """Wait until every child has handed its queued data to its backend."""
+        self._dispatch("flush")
+
     def finish(self) -> None:
-        """Finalise the run on all child trackers."""
-        self._dispatch("finish")
+        """Finalise the run on all child trackers, then stop the worker threads of the wrappers it created."""
+        try:
+            self._dispatch("finish")
+        finally:
+            for index in self._owned:
+                self._trackers[index].close()
+
+    def stats(self) -> list[Any]:
+        """Return the :class:`~mindtrace.models.tracking.background.TrackerQueueStats` of background children."""
+        return [child.stats() for child in self._trackers if hasattr(child, "stats")]
 
 
 __all__ = [
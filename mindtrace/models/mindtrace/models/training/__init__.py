@@ -26,6 +26,8 @@ Optimizers & Schedulers
 Datalake Bridge
 ---------------
 - ``DatalakeDataset``: ``torch.utils.data.Dataset`` backed by a Datalake query.
+- ``StreamingDatalakeDataset``: ``IterableDataset`` that streams a Datalake
+  query in concurrent, worker-sharded batches with an optional disk cache.
 - ``build_datalake_loader``: Factory that returns a ``DataLoader`` from a
   Datalake query.  Requires ``mindtrace-datalake`` at runtime.
 """
@@ -41,7 +43,11 @@ from mindtrace.models.training.callbacks import (
     ProgressLogger,
     UnfreezeSchedule,
 )
-from mindtrace.models.training.datalake_bridge import DatalakeDataset, build_datalake_loader
+from mindtrace.models.training.datalake_bridge import (
+    DatalakeDataset,
+    StreamingDatalakeDataset,
+    build_datalake_loader,
+)
 from mindtrace.models.training.optimizers import build_optimizer, build_scheduler
 from mindtrace.models.training.trainer import Trainer
 
@@ -61,5 +67,6 @@ __all__ = [
     "build_scheduler",
     # Datalake bridge
     "DatalakeDataset",
+    "StreamingDatalakeDataset",
     "build_datalake_loader",
 ]
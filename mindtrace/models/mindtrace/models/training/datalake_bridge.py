@@ -41,16 +41,53 @@ Transform Protocol
 The keys in *datums* correspond to the ``"column"`` values in the query.
 The ``Datum.data`` field holds the actual payload (already loaded from the
 registry when ``registry_uri`` is set).
+
+Streaming
+---------
+:class:`DatalakeDataset` either holds every payload in memory or, with
+``prefetch=False``, fetches one sample per round trip from the main process.
+For datasets that do not fit in memory pass ``streaming=True``: the loader is
+then built on :class:`StreamingDatalakeDataset`, which shards the query rows
+across DataLoader workers, fetches them in concurrent batches ahead of the
+training step and can keep transformed samples in a local disk cache::
+
+    train_loader = build_datalake_loader(
+        datalake=datalake,
+        query=query,
+        transform=transform,
+        streaming=True,
+        num_workers=4,
+        datalake_factory=lambda: Datalake.create(mongo_db_uri=..., mongo_db_name=...),
+        cache_dir="/scratch/train-cache",
+    )
 """
 
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
+import hashlib
+import inspect
+import itertools
 import logging
-from typing import TYPE_CHECKING, Any, Callable
+import math
+import os
+import pickle
+import random
+import threading
+from collections import deque
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Iterator
+
+try:
+    from torch.utils.data import IterableDataset as _IterableDataset
+except ImportError:  # pragma: no cover - torch is a declared dependency
+    _IterableDataset = object
 
 logger = logging.getLogger(__name__)
 
+_MISSING = object()
+
 if TYPE_CHECKING:
     # Only for static analysis — no runtime import
     from mindtrace.datalake import Datalake, Datum
@@ -154,6 +191,366 @@ class DatalakeDataset:
         return self._transform(datums)
 
 
+class DiskSampleCache:
+    """Size-bounded LRU cache of transformed samples on local disk.
+
+    Each sample is pickled to its own file under *directory*.  A hit refreshes
+    the file's modification time; once the directory grows past *max_bytes*
+    the least recently used files are deleted until it is back under 90% of
+    the budget.  DataLoader workers may share one directory: writes are atomic
+    renames and a file evicted by another worker simply reads as a miss.
+
+    The cache is keyed by datum IDs only, so it must be cleared whenever the
+    transform changes, and it should only hold deterministic decoding — random
+    augmentations belong in a step applied after the loader.
+    """
+
+    def __init__(self, directory: str | os.PathLike[str], max_bytes: int = 10 * 1024**3) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._bytes = sum(size for _, size, _ in self._entries())
+
+    def _path(self, key: Any) -> Path:
+        return self.directory / (hashlib.sha1(repr(key).encode()).hexdigest() + ".pkl")
+
+    def _entries(self) -> list[tuple[int, int, str]]:
+        entries = []
+        for entry in os.scandir(self.directory):
+            if not entry.name.endswith(".pkl"):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        return entries
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Return the cached sample for *key*, or *default* on a miss."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            self.misses += 1
+            return default
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        self.hits += 1
+        return value
+
+    def put(self, key: Any, value: Any) -> None:
+        """Store *value* under *key*, evicting least recently used samples when over budget."""
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(data) > self.max_bytes:
+            return
+        path = self._path(key)
+        tmp = path.with_name(f"{path.stem}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+        self._bytes += len(data)
+        if self._bytes > self.max_bytes:
+            self._evict()
+
+    def _evict(self) -> None:
+        # The running total is a per-process estimate; rescan so files written by other workers count too.
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        target = int(self.max_bytes * 0.9)
+        for _, size, path in entries:
+            if total <= target:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+        self._bytes = total
+
+    def clear(self) -> None:
+        """Delete every cached sample."""
+        for _, _, path in self._entries():
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+        self._bytes = 0
+
+
+class _FetchWorker:
+    """Per-process event loop thread and Datalake connection used by :class:`StreamingDatalakeDataset`."""
+
+    def __init__(self, max_concurrency: int) -> None:
+        self.pid = os.getpid()
+        self.loop = asyncio.new_event_loop()
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.datalake: Any = None
+        self._thread = threading.Thread(target=self._run_loop, name="DatalakeFetchLoop", daemon=True)
+        self._thread.start()
+
+    def _run_loop(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def submit(self, coro: Any) -> concurrent.futures.Future:
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Any) -> Any:
+        return self.submit(coro).result()
+
+    def close(self) -> None:
+        if self.loop.is_closed():
+            return
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
+
+
+class StreamingDatalakeDataset(_IterableDataset):
+    """PyTorch ``IterableDataset`` that streams samples from a :class:`~mindtrace.datalake.Datalake` query.
+
+    Only the datum ID rows returned by
+    :meth:`~mindtrace.datalake.Datalake.query_data` are held in memory.  Each
+    iteration shards those rows across DDP ranks when ``torch.distributed`` is
+    initialised, then across DataLoader workers, and fetches datums and their
+    payloads in chunks of *fetch_batch_size* rows with up to *max_concurrency*
+    :meth:`~mindtrace.datalake.Datalake.get_data` calls in flight and
+    *read_ahead* chunks requested ahead of the one being consumed.
+
+    Every process — the main one and each DataLoader worker — keeps one event
+    loop running on a background thread for its whole lifetime, so async
+    clients stay bound to a single loop and fetches overlap with the training
+    step.  Worker processes open their own connection through
+    *datalake_factory* when it is given; otherwise they reuse their copy of
+    *datalake*, which is only safe for clients that survive ``fork``.
+
+    Parameters
+    ----------
+    datalake:
+        An initialised :class:`~mindtrace.datalake.Datalake` instance, used for
+        the ID query and by the main process.
+    query:
+        Query or list of joined queries (see :class:`DatalakeDataset`).
+    transform:
+        ``(dict[str, Datum]) -> (inputs, targets)`` callable, run in the
+        consuming process.
+    datums_wanted:
+        Cap the number of base datums returned by the query.
+    shuffle:
+        Shuffle the rows each epoch.  All workers and ranks derive the same
+        order from ``seed`` and the epoch number; the epoch advances on every
+        iteration of this dataset object, so keep ``persistent_workers=True``
+        or call :meth:`set_epoch` when workers are recreated each epoch.
+    seed:
+        Base seed for shuffling.
+    fetch_batch_size:
+        Rows resolved per ``get_data`` call.
+    max_concurrency:
+        Maximum ``get_data`` calls in flight per process.
+    read_ahead:
+        Chunks requested ahead of the one being consumed; bounds memory to
+        roughly ``read_ahead * fetch_batch_size`` samples per process.
+    cache_dir:
+        When set, transformed samples are stored in a :class:`DiskSampleCache`
+        under this directory and later epochs skip the fetch and transform.
+    cache_max_bytes:
+        Size budget of the disk cache.
+    datalake_factory:
+        Zero-argument callable (sync or async) returning a fresh datalake
+        connection; called once in each DataLoader worker.
+    """
+
+    def __init__(
+        self,
+        datalake: "Datalake",
+        query: list[dict[str, Any]] | dict[str, Any],
+        transform: Callable[[dict[str, "Datum"]], tuple[Any, Any]],
+        *,
+        datums_wanted: int | None = None,
+        shuffle: bool = False,
+        seed: int = 0,
+        fetch_batch_size: int = 64,
+        max_concurrency: int = 4,
+        read_ahead: int = 4,
+        cache_dir: str | os.PathLike[str] | None = None,
+        cache_max_bytes: int = 10 * 1024**3,
+        datalake_factory: Callable[[], Any] | None = None,
+    ) -> None:
+        if _IterableDataset is object:
+            raise ImportError("StreamingDatalakeDataset requires PyTorch. Install it with: uv add torch")
+        if fetch_batch_size < 1 or max_concurrency < 1 or read_ahead < 1:
+            raise ValueError("fetch_batch_size, max_concurrency and read_ahead must be at least 1")
+
+        self._datalake = datalake
+        self._transform = transform
+        self._shuffle = shuffle
+        self._seed = seed
+        self._epoch = 0
+        self._fetch_batch_size = fetch_batch_size
+        self._max_concurrency = max_concurrency
+        self._read_ahead = read_ahead
+        self._datalake_factory = datalake_factory
+        self.cache = DiskSampleCache(cache_dir, cache_max_bytes) if cache_dir is not None else None
+
+        self._owner_pid = os.getpid()
+        self._worker: _FetchWorker | None = None
+        worker = self._fetch_worker()
+        id_rows: list[dict[str, Any]] = worker.run(datalake.query_data(query, datums_wanted=datums_wanted))
+        self._id_rows: list[dict[str, Any]] = [{k: v for k, v in row.items() if k != "_id"} for row in id_rows]
+        logger.info("StreamingDatalakeDataset: %d samples from query", len(self._id_rows))
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Spawned workers receive a pickled copy: drop the loop thread, and the
+        # main process's connection when workers open their own.
+        state = self.__dict__.copy()
+        state["_worker"] = None
+        if self._datalake_factory is not None:
+            state["_datalake"] = None
+        return state
+
+    def _fetch_worker(self) -> _FetchWorker:
+        """Return this process's fetch loop, starting it (and its connection) on first use."""
+        worker = self._worker
+        if worker is not None and worker.pid == os.getpid():
+            return worker
+        # A forked worker inherits the parent's _FetchWorker without its thread; it is never touched again.
+        worker = _FetchWorker(self._max_concurrency)
+        if self._datalake_factory is not None and os.getpid() != self._owner_pid:
+            worker.datalake = worker.run(self._open_datalake())
+        else:
+            worker.datalake = self._datalake
+        self._worker = worker
+        return worker
+
+    async def _open_datalake(self) -> Any:
+        datalake = self._datalake_factory()
+        if inspect.isawaitable(datalake):
+            datalake = await datalake
+        return datalake
+
+    def _rank_indices(self, shuffle: bool = True) -> list[int]:
+        """Row indices for this rank, in this epoch's order unless *shuffle* is False.
+
+        Like ``DistributedSampler``, the rows are padded by repeating the first
+        ones until every rank gets the same count: DDP ranks stepping through
+        different numbers of batches would hang in their collectives.
+        """
+        indices = list(range(len(self._id_rows)))
+        if shuffle and self._shuffle:
+            random.Random(self._seed + self._epoch).shuffle(indices)
+        rank, world_size = _distributed_rank()
+        if indices and len(indices) % world_size:
+            padding = world_size - len(indices) % world_size
+            indices += (indices * math.ceil(padding / len(indices)))[:padding]
+        return indices[rank::world_size]
+
+    def _shard_indices(self) -> list[int]:
+        """Row indices for this rank and DataLoader worker, in this epoch's order."""
+        from torch.utils.data import get_worker_info
+
+        info = get_worker_info()
+        worker_id, num_workers = (info.id, info.num_workers) if info is not None else (0, 1)
+        return self._rank_indices()[worker_id::num_workers]
+
+    async def _fetch_chunk(self, worker: _FetchWorker, rows: list[dict[str, Any]]) -> list[tuple[Any, Any, Any]]:
+        """Resolve *rows* to ``(cache_key, cached_sample, datums)`` entries, skipping fetches for cache hits."""
+        keys = [tuple(row.items()) for row in rows]
+        if self.cache is not None:
+            cached = await asyncio.to_thread(lambda: [self.cache.get(key, _MISSING) for key in keys])
+        else:
+            cached = [_MISSING] * len(rows)
+
+        ids = list(
+            dict.fromkeys(
+                datum_id
+                for row, hit in zip(rows, cached)
+                if hit is _MISSING
+                for datum_id in row.values()
+                if datum_id is not None
+            )
+        )
+        by_id: dict[Any, "Datum"] = {}
+        if ids:
+            async with worker.semaphore:
+                fetched: list["Datum"] = await worker.datalake.get_data(ids)
+            by_id = {d.id: d for d in fetched if d.id is not None}
+
+        entries = []
+        for key, row, hit in zip(keys, rows, cached):
+            if hit is not _MISSING:
+                entries.append((key, hit, None))
+                continue
+            try:
+                datums = {col: by_id[datum_id] for col, datum_id in row.items() if datum_id is not None}
+            except KeyError as exc:
+                raise LookupError(f"Datalake returned no datum for id {exc.args[0]!r}") from exc
+            entries.append((key, _MISSING, datums))
+        return entries
+
+    # ------------------------------------------------------------------
+    # Dataset protocol
+    # ------------------------------------------------------------------
+
+    def set_epoch(self, epoch: int) -> None:
+        """Set the epoch used to seed the next shuffle (see ``shuffle``)."""
+        self._epoch = epoch
+
+    def close(self) -> None:
+        """Stop this process's fetch loop; it is restarted if the dataset is iterated again."""
+        worker, self._worker = self._worker, None
+        if worker is not None and worker.pid == os.getpid():
+            worker.close()
+
+    def __len__(self) -> int:
+        return len(self._rank_indices(shuffle=False))
+
+    def __iter__(self) -> Iterator[tuple[Any, Any]]:
+        indices = self._shard_indices()
+        self._epoch += 1
+        worker = self._fetch_worker()
+        size = self._fetch_batch_size
+        chunks = ([self._id_rows[i] for i in indices[start : start + size]] for start in range(0, len(indices), size))
+
+        pending: deque[concurrent.futures.Future] = deque(
+            worker.submit(self._fetch_chunk(worker, chunk)) for chunk in itertools.islice(chunks, self._read_ahead)
+        )
+        try:
+            while pending:
+                entries = pending.popleft().result()
+                chunk = next(chunks, None)
+                if chunk is not None:
+                    pending.append(worker.submit(self._fetch_chunk(worker, chunk)))
+                for key, sample, datums in entries:
+                    if sample is _MISSING:
+                        sample = self._transform(datums)
+                        if self.cache is not None:
+                            self.cache.put(key, sample)
+                    yield sample
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def _distributed_rank() -> tuple[int, int]:
+    """Return ``(rank, world_size)``, or ``(0, 1)`` outside an initialised process group."""
+    try:
+        import torch.distributed as dist
+    except ImportError:
+        return 0, 1
+    if dist.is_available() and dist.is_initialized():
+        return dist.get_rank(), dist.get_world_size()
+    return 0, 1
+
+
 def build_datalake_loader(
     datalake: "Datalake",
     query: list[dict[str, Any]] | dict[str, Any],
@@ -161,9 +558,16 @@ def build_datalake_loader(
     *,
     datums_wanted: int | None = None,
     prefetch: bool = True,
+    streaming: bool = False,
     batch_size: int = 32,
     shuffle: bool = True,
     num_workers: int = 0,
+    fetch_batch_size: int = 64,
+    max_concurrency: int = 4,
+    read_ahead: int = 4,
+    cache_dir: str | os.PathLike[str] | None = None,
+    cache_max_bytes: int = 10 * 1024**3,
+    datalake_factory: Callable[[], Any] | None = None,
     **loader_kwargs: Any,
 ) -> Any:
     """Build a PyTorch ``DataLoader`` from a Datalake query.
@@ -183,13 +587,21 @@ def build_datalake_loader(
         Limit the number of base samples returned by the query.
     prefetch:
         Pre-load all datum payloads into memory during dataset construction.
+        Ignored when ``streaming=True``.
+    streaming:
+        Stream samples through a :class:`StreamingDatalakeDataset` instead of
+        holding them in memory or fetching them one at a time.
     batch_size:
         Mini-batch size passed to ``DataLoader``.
     shuffle:
         Whether to shuffle samples each epoch.
     num_workers:
-        Number of worker processes for the ``DataLoader``.  Set to 0 when
-        ``prefetch=False`` (lazy async fetching is not fork-safe).
+        Number of worker processes for the ``DataLoader``.  Forced to 0 when
+        ``prefetch=False`` without streaming (lazy async fetching is not
+        fork-safe).  Streaming loaders keep their workers alive across epochs
+        (``persistent_workers=True``) unless told otherwise.
+    fetch_batch_size, max_concurrency, read_ahead, cache_dir, cache_max_bytes, datalake_factory:
+        Streaming options, see :class:`StreamingDatalakeDataset`.
     **loader_kwargs:
         Any additional keyword arguments forwarded to ``torch.utils.data.DataLoader``.
 
@@ -219,9 +631,29 @@ def build_datalake_loader(
     except ImportError as exc:
         raise ImportError("build_datalake_loader requires PyTorch. Install it with: uv add torch") from exc
 
+    if streaming:
+        dataset = StreamingDatalakeDataset(
+            datalake=datalake,
+            query=query,
+            transform=transform,
+            datums_wanted=datums_wanted,
+            shuffle=shuffle,
+            fetch_batch_size=fetch_batch_size,
+            max_concurrency=max_concurrency,
+            read_ahead=read_ahead,
+            cache_dir=cache_dir,
+            cache_max_bytes=cache_max_bytes,
+            datalake_factory=datalake_factory,
+        )
+        if num_workers > 0:
+            # Persistent workers keep their event loop and connection between epochs.
+            loader_kwargs.setdefault("persistent_workers", True)
+        return DataLoader(dataset, batch_size=batch_size, num_workers=num_workers, **loader_kwargs)
+
     if not prefetch and num_workers > 0:
         logger.warning(
-            "num_workers=%d with prefetch=False: async fetching is not fork-safe. Forcing num_workers=0.",
+            "num_workers=%d with prefetch=False: async fetching is not fork-safe. Forcing num_workers=0. "
+            "Use streaming=True to fetch from worker processes.",
             num_workers,
         )
         num_workers = 0
@@ -3,10 +3,15 @@
 The ``Trainer`` class orchestrates the full supervised training workflow:
 model forward passes, loss computation, gradient accumulation, mixed-precision
 training, LR scheduling, callback dispatch, and metric history tracking.
+
+Losses stay on the training device during an epoch and are copied to the host
+only every ``log_every_n_steps`` optimizer steps and at epoch end, so the
+loop does not stall on a device sync after every batch.
 """
 
 from __future__ import annotations
 
+import time
 from typing import Any, Callable
 
 import torch
@@ -17,6 +22,57 @@ from torch.optim.lr_scheduler import LRScheduler, ReduceLROnPlateau
 from mindtrace.core import Mindtrace
 from mindtrace.models.training.callbacks import Callback
 
+PROFILE_PHASES: tuple[str, ...] = ("data_wait", "forward", "backward", "optimizer", "callbacks")
+
+_AMP_DTYPES: dict[str, torch.dtype] = {
+    "float16": torch.float16,
+    "fp16": torch.float16,
+    "bfloat16": torch.bfloat16,
+    "bf16": torch.bfloat16,
+}
+
+
+class _PhaseTimer:
+    """Accumulate wall time per training-step phase.
+
+    :meth:`lap` charges the time since the previous lap to a phase.  On CUDA
+    the device is synchronised first, so a phase is charged for the kernels
+    it queued rather than only for launching them; this serialises the host
+    and the device, which is why profiling is opt-in.
+    """
+
+    def __init__(self, device: torch.device) -> None:
+        self._sync = device.type == "cuda" and torch.cuda.is_available()
+        self._device = device
+        self.totals: dict[str, float] = dict.fromkeys(PROFILE_PHASES, 0.0)
+        self._last = time.perf_counter()
+
+    def reset(self) -> None:
+        self._last = time.perf_counter()
+
+    def lap(self, phase: str) -> None:
+        if self._sync:
+            torch.cuda.synchronize(self._device)
+        now = time.perf_counter()
+        self.totals[phase] += now - self._last
+        self._last = now
+
+    def summary(self, steps: int) -> dict[str, float]:
+        """Return the mean milliseconds per batch of every phase and of the whole step."""
+        per_step = {f"profile/{phase}_ms": 1000.0 * total / max(steps, 1) for phase, total in self.totals.items()}
+        per_step["profile/step_ms"] = sum(per_step.values())
+        return per_step
+
+
+class _NullTimer:
+    """Stand-in for :class:`_PhaseTimer` when profiling is off."""
+
+    def reset(self) -> None:
+        pass
+
+    def lap(self, phase: str) -> None:
+        pass
+
 
 class Trainer(Mindtrace):
     """Supervised training loop with mixed precision and callback support.
@@ -34,7 +90,8 @@ class Trainer(Mindtrace):
         tracker: Optional experiment tracker (duck-typed).
         callbacks: Ordered list of active ``Callback`` instances.
         device: Resolved ``torch.device`` used for training.
-        mixed_precision: Whether AMP is active.
+        mixed_precision: Whether AMP was requested.
+        amp_dtype: Autocast dtype when AMP is active, else ``None``.
         gradient_accumulation_steps: Number of micro-batches before an
             optimizer step.
         clip_grad_norm: Maximum gradient norm for clipping, or ``None``.
@@ -42,6 +99,9 @@ class Trainer(Mindtrace):
         stop_training: Set to ``True`` by callbacks (e.g. ``EarlyStopping``)
             to terminate the fit loop after the current epoch.
         history: Dict mapping metric names to per-epoch value lists.
+        global_step: Optimizer steps taken since :meth:`fit` started.
+        log_every_n_steps: Interval, in optimizer steps, at which the running
+            training loss is synchronised and logged as ``train/step_loss``.
 
     Example::
 
@@ -55,6 +115,19 @@ class Trainer(Mindtrace):
             clip_grad_norm=1.0,
         )
         history = trainer.fit(train_loader, val_loader, epochs=20)
+
+        # bfloat16 autocast on CPU, compiled model, per-phase step times
+        trainer = Trainer(
+            model,
+            nn.CrossEntropyLoss(),
+            optimizer,
+            device="cpu",
+            mixed_precision=True,
+            amp_dtype="bfloat16",
+            compile_model=True,
+            log_every_n_steps=50,
+            profile_steps=True,
+        )
     """
 
     def __init__(
@@ -75,6 +148,11 @@ class Trainer(Mindtrace):
         batch_fn: Callable | None = None,
         gradient_checkpointing: bool = False,
         ddp: bool = False,
+        amp_dtype: str | torch.dtype | None = None,
+        log_every_n_steps: int | None = None,
+        non_blocking: bool = True,
+        compile_model: bool | dict[str, Any] = False,
+        profile_steps: bool = False,
     ) -> None:
         """Initialise the trainer.
 
@@ -100,7 +178,10 @@ class Trainer(Mindtrace):
             device: Device string.  ``"auto"`` selects CUDA if available,
                 otherwise CPU.
             mixed_precision: Enable ``torch.amp`` automatic mixed precision.
-                Silently ignored when CUDA is not available.
+                On CUDA this autocasts to *amp_dtype* (``float16`` by default,
+                with a ``GradScaler``).  On other devices it needs
+                ``amp_dtype="bfloat16"`` and is otherwise ignored with a
+                warning.
             gradient_accumulation_steps: Accumulate gradients over this many
                 batches before calling ``optimizer.step()``.  Must be >= 1.
             clip_grad_norm: If set, clips the global gradient norm to this
@@ -118,14 +199,47 @@ class Trainer(Mindtrace):
                 when available; falls back to native PyTorch DDP.  Has no
                 effect when no distributed process group is initialised or
                 when world size is 1.
+            amp_dtype: Autocast dtype, ``"float16"`` or ``"bfloat16"`` (or
+                the ``torch.dtype``).  ``bfloat16`` has the range of
+                ``float32`` and needs no gradient scaler, which is what makes
+                it usable on CPU.
+            log_every_n_steps: Every this many optimizer steps, copy the mean
+                training loss since the last report to the host and send it to
+                the tracker as ``train/step_loss`` at ``step=global_step``.
+                ``None`` only syncs at epoch end.
+            non_blocking: Copy batches to a CUDA device with
+                ``non_blocking=True``.  The copy only overlaps with compute
+                when the loader yields pinned tensors
+                (``DataLoader(pin_memory=True)``); unpinned tensors are copied
+                synchronously as before.
+            compile_model: Run forward passes through
+                :func:`torch.compile`.  ``True`` uses the defaults; a dict is
+                passed as keyword arguments (e.g. ``{"mode":
+                "reduce-overhead"}``).  :attr:`model` stays the uncompiled
+                module, so checkpoints and callbacks see the usual state dict.
+            profile_steps: Time the data wait, forward, backward, optimizer
+                and callback phases of every training step and add their
+                per-batch means as ``profile/<phase>_ms`` (plus
+                ``profile/step_ms``) to the epoch logs, history and tracker.
+                On CUDA this synchronises the device between phases.
 
         Raises:
-            ValueError: If *gradient_accumulation_steps* < 1.
+            ValueError: If *gradient_accumulation_steps* or
+                *log_every_n_steps* < 1, or *amp_dtype* is not a supported
+                dtype.
         """
         super().__init__()
 
         if gradient_accumulation_steps < 1:
             raise ValueError(f"gradient_accumulation_steps must be >= 1, got {gradient_accumulation_steps}")
+        if log_every_n_steps is not None and log_every_n_steps < 1:
+            raise ValueError(f"log_every_n_steps must be >= 1, got {log_every_n_steps}")
+        if isinstance(amp_dtype, str):
+            if amp_dtype.lower() not in _AMP_DTYPES:
+                raise ValueError(f"amp_dtype must be one of {sorted(_AMP_DTYPES)}, got {amp_dtype!r}")
+            amp_dtype = _AMP_DTYPES[amp_dtype.lower()]
+        elif amp_dtype is not None and amp_dtype not in (torch.float16, torch.bfloat16):
+            raise ValueError(f"amp_dtype must be torch.float16 or torch.bfloat16, got {amp_dtype!r}")
 
         self.model = model
         self.loss_fn = loss_fn
@@ -137,6 +251,8 @@ class Trainer(Mindtrace):
         self.gradient_accumulation_steps = gradient_accumulation_steps
         self.clip_grad_norm = clip_grad_norm
         self.batch_fn = batch_fn
+        self.log_every_n_steps = log_every_n_steps
+        self.profile_steps = profile_steps
         self._ddp = ddp
         self._default_train_loader = train_loader
         self._default_val_loader = val_loader
@@ -147,17 +263,28 @@ class Trainer(Mindtrace):
         else:
             self.device = torch.device(device)
 
-        # AMP setup — only activate when CUDA is actually available
-        self._amp_enabled: bool = mixed_precision and self.device.type == "cuda" and torch.cuda.is_available()
+        # AMP setup — float16 needs CUDA; bfloat16 autocast also runs on CPU
+        on_cuda = self.device.type == "cuda" and torch.cuda.is_available()
+        self._amp_enabled: bool = mixed_precision and (on_cuda or amp_dtype == torch.bfloat16)
 
         if mixed_precision and not self._amp_enabled:
-            self.logger.warning("Trainer: mixed_precision=True but CUDA is not available. Running in full precision.")
+            self.logger.warning(
+                "Trainer: mixed_precision=True but CUDA is not available and amp_dtype is not bfloat16. "
+                "Running in full precision."
+            )
 
-        self._scaler: torch.amp.GradScaler | None = torch.amp.GradScaler() if self._amp_enabled else None
+        self.amp_dtype: torch.dtype | None = (amp_dtype or torch.float16) if self._amp_enabled else None
+        # Only pass a dtype to autocast when one was asked for, so the device default applies otherwise.
+        self._autocast_kwargs: dict[str, Any] = {"dtype": amp_dtype} if self._amp_enabled and amp_dtype else {}
+        self._scaler: torch.amp.GradScaler | None = (
+            torch.amp.GradScaler() if self._amp_enabled and on_cuda and self.amp_dtype == torch.float16 else None
+        )
+        self._non_blocking: bool = non_blocking and self.device.type == "cuda"
 
         # Mutable training state
         self.stop_training: bool = False
         self.history: dict[str, list[float]] = {}
+        self.global_step: int = 0
         self._total_epochs: int = 0
 
         self.model.to(self.device)
@@ -200,13 +327,21 @@ class Trainer(Mindtrace):
                 except ImportError:
                     self.logger.debug("Trainer: ddp=True but torch.distributed unavailable.")
 
+        # Compiled forward — self.model keeps pointing at the eager module
+        self._forward_model: nn.Module | Callable = self.model
+        if compile_model:
+            compile_kwargs = compile_model if isinstance(compile_model, dict) else {}
+            self._forward_model = torch.compile(self.model, **compile_kwargs)
+            self.logger.info("Trainer: forward passes compiled with torch.compile(%s).", compile_kwargs)
+
         self.logger.info(
-            "Trainer initialised — device=%s, amp=%s, grad_accum=%d, grad_ckpt=%s, ddp=%s",
+            "Trainer initialised — device=%s, amp=%s, grad_accum=%d, grad_ckpt=%s, ddp=%s, compile=%s",
             self.device,
-            self._amp_enabled,
+            self.amp_dtype if self._amp_enabled else False,
             self.gradient_accumulation_steps,
             gradient_checkpointing,
             ddp,
+            bool(compile_model),
         )
 
     # ------------------------------------------------------------------
@@ -276,6 +411,7 @@ class Trainer(Mindtrace):
         self._total_epochs = epochs
         self.stop_training = False
         self.history = {}
+        self.global_step = 0
 
         self._call_callbacks("on_train_begin")
 
@@ -327,58 +463,89 @@ class Trainer(Mindtrace):
         ``gradient_accumulation_steps`` batches (and always on the final
         batch of the epoch to avoid discarding a partial accumulation window).
 
+        Batch losses are summed on the device.  They are read back only at
+        the ``log_every_n_steps`` interval, at epoch end, and for each batch
+        when a callback overrides :meth:`~Callback.on_batch_end` (which takes
+        the loss as a float).
+
         Args:
             loader: Iterable of training batches.
 
         Returns:
-            Dict with a single key ``"train/loss"`` mapped to the mean batch
-            loss over the epoch.
+            Dict with ``"train/loss"`` mapped to the mean batch loss over the
+            epoch, plus the ``profile/*_ms`` phase means when
+            ``profile_steps`` is enabled.
         """
         self.model.train()
 
-        total_loss = 0.0
+        total_loss = torch.zeros((), device=self.device)
         num_batches = 0
+        window_loss = torch.zeros((), device=self.device)
+        window_batches = 0
+        window_start_step = self.global_step
+        wants_batch_loss = self._callbacks_override("on_batch_end")
+        timer: _PhaseTimer | _NullTimer = _PhaseTimer(self.device) if self.profile_steps else _NullTimer()
+
+        try:
+            num_loader_batches: int | None = len(loader)
+        except TypeError:
+            # Loader doesn't support len()
+            num_loader_batches = None
 
         self.optimizer.zero_grad()
+        timer.reset()
 
         for batch_idx, raw_batch in enumerate(loader):
+            timer.lap("data_wait")
             self._call_callbacks("on_batch_begin", batch=batch_idx)
+            timer.lap("callbacks")
 
             inputs, targets = self._unpack_batch(raw_batch)
             inputs = self._to_device(inputs)
             targets = self._to_device(targets)
+            timer.lap("data_wait")
 
             # Forward + loss
-            if self._amp_enabled and self._scaler is not None:
-                with torch.amp.autocast(device_type=self.device.type):
+            if self._amp_enabled:
+                with torch.amp.autocast(device_type=self.device.type, **self._autocast_kwargs):
                     loss, _outputs = self._compute_loss(inputs, targets)
             else:
                 loss, _outputs = self._compute_loss(inputs, targets)
+            timer.lap("forward")
 
             # Scale loss for accumulation so gradients average correctly
             scaled_loss = loss / self.gradient_accumulation_steps
 
-            if self._amp_enabled and self._scaler is not None:
+            if self._scaler is not None:
                 self._scaler.scale(scaled_loss).backward()
             else:
                 scaled_loss.backward()
+            timer.lap("backward")
 
             is_accumulation_step = (batch_idx + 1) % self.gradient_accumulation_steps == 0
             # Check if this is the last batch (handle partial windows at epoch end)
-            try:
-                is_last_batch = batch_idx == len(loader) - 1  # type: ignore[arg-type]
-            except TypeError:
-                # Loader doesn't support len()
-                is_last_batch = False
+            is_last_batch = num_loader_batches is not None and batch_idx == num_loader_batches - 1
 
             if is_accumulation_step or is_last_batch:
                 self._optimizer_step()
+                self.global_step += 1
+            timer.lap("optimizer")
 
-            batch_loss = loss.item()
-            total_loss += batch_loss
+            detached = loss.detach().float()
+            total_loss += detached
+            window_loss += detached
             num_batches += 1
+            window_batches += 1
+
+            if self.log_every_n_steps is not None and self.global_step - window_start_step >= self.log_every_n_steps:
+                self._log_step({"train/step_loss": (window_loss / window_batches).item()})
+                window_loss.zero_()
+                window_batches = 0
+                window_start_step = self.global_step
 
-            self._call_callbacks("on_batch_end", batch=batch_idx, loss=batch_loss)
+            if wants_batch_loss:
+                self._call_callbacks("on_batch_end", batch=batch_idx, loss=detached.item())
+            timer.lap("callbacks")
 
         if num_batches == 0:
             self.logger.warning("Training epoch produced zero batches. Check your DataLoader.")
@@ -390,20 +557,21 @@ class Trainer(Mindtrace):
             try:
                 from mindtrace.cluster.distributed import all_reduce_mean as _arm  # noqa: PLC0415
 
-                _t = torch.tensor(avg_loss, device=self.device)
-                avg_loss = float(_arm(_t).item())
+                avg_loss = _arm(avg_loss)
             except ImportError:
                 try:
                     import torch.distributed as _dist  # noqa: PLC0415
 
                     if _dist.is_initialized() and _dist.get_world_size() > 1:
-                        _t = torch.tensor(avg_loss, device=self.device)
-                        _dist.all_reduce(_t, op=_dist.ReduceOp.SUM)
-                        avg_loss = float((_t / _dist.get_world_size()).item())
+                        _dist.all_reduce(avg_loss, op=_dist.ReduceOp.SUM)
+                        avg_loss = avg_loss / _dist.get_world_size()
                 except ImportError:
                     pass
 
-        return {"train/loss": avg_loss}
+        metrics = {"train/loss": float(avg_loss.item())}
+        if isinstance(timer, _PhaseTimer):
+            metrics.update(timer.summary(num_batches))
+        return metrics
 
     def _optimizer_step(self) -> None:
         """Execute one optimizer step with optional gradient clipping and AMP scaling.
@@ -415,11 +583,11 @@ class Trainer(Mindtrace):
         This is called once per accumulation window inside :meth:`_train_epoch`.
         """
         if self.clip_grad_norm is not None:
-            if self._amp_enabled and self._scaler is not None:
+            if self._scaler is not None:
                 self._scaler.unscale_(self.optimizer)
             torch.nn.utils.clip_grad_norm_(self.model.parameters(), self.clip_grad_norm)
 
-        if self._amp_enabled and self._scaler is not None:
+        if self._scaler is not None:
             self._scaler.step(self.optimizer)
             self._scaler.update()
         else:
@@ -445,7 +613,7 @@ class Trainer(Mindtrace):
         """
         self.model.eval()
 
-        total_loss = 0.0
+        total_loss = torch.zeros((), device=self.device)
         num_batches = 0
 
         with torch.no_grad():
@@ -455,15 +623,15 @@ class Trainer(Mindtrace):
                 targets = self._to_device(targets)
 
                 if self._amp_enabled:
-                    with torch.amp.autocast(device_type=self.device.type):
+                    with torch.amp.autocast(device_type=self.device.type, **self._autocast_kwargs):
                         loss, _outputs = self._compute_loss(inputs, targets)
                 else:
                     loss, _outputs = self._compute_loss(inputs, targets)
 
-                total_loss += loss.item()
+                total_loss += loss.detach().float()
                 num_batches += 1
 
-        avg_loss = total_loss / max(num_batches, 1)
+        avg_loss = (total_loss / max(num_batches, 1)).item()
         return {"val/loss": avg_loss}
 
     # ------------------------------------------------------------------
@@ -501,7 +669,10 @@ class Trainer(Mindtrace):
     def _to_device(self, data: Any) -> Any:
         """Move *data* to ``self.device``.
 
-        Handles tensors directly and dicts whose values are tensors.
+        Handles tensors directly, dicts whose values are tensors, and lists
+        or tuples of either.  Copies to CUDA are issued with
+        ``non_blocking=True`` unless the trainer was built with
+        ``non_blocking=False``.
 
         Args:
             data: A ``torch.Tensor`` or a ``dict`` mapping strings to
@@ -511,10 +682,13 @@ class Trainer(Mindtrace):
             The same structure with all tensors moved to ``self.device``.
         """
         if isinstance(data, torch.Tensor):
-            return data.to(self.device)
+            return data.to(self.device, non_blocking=self._non_blocking)
 
         if isinstance(data, dict):
-            return {k: v.to(self.device) if isinstance(v, torch.Tensor) else v for k, v in data.items()}
+            return {
+                k: v.to(self.device, non_blocking=self._non_blocking) if isinstance(v, torch.Tensor) else v
+                for k, v in data.items()
+            }
 
         if isinstance(data, (list, tuple)):
             moved = [self._to_device(v) for v in data]
@@ -533,17 +707,35 @@ class Trainer(Mindtrace):
         key or a tuple whose first element is the loss tensor.
         """
         if self.loss_fn is not None:
-            outputs = self.model(inputs)
+            outputs = self._forward_model(inputs)
             loss: torch.Tensor = self.loss_fn(outputs, targets)
             return loss, outputs
 
-        result = self.model(inputs, targets)
+        result = self._forward_model(inputs, targets)
         if isinstance(result, dict):
             return result["loss"], result
         if isinstance(result, tuple):
             return result[0], result
         return result, None
 
+    def _log_step(self, metrics: dict[str, float]) -> None:
+        """Send step-level *metrics* to the tracker at ``self.global_step``."""
+        if self.tracker is None:
+            return
+        try:
+            self.tracker.log(metrics, step=self.global_step)
+        except Exception as exc:
+            self.logger.warning("Trainer: tracker.log failed at step %d: %s", self.global_step, exc)
+
+    def _callbacks_override(self, event: str) -> bool:
+        """Return whether any callback implements *event* beyond the no-op :class:`Callback` hook."""
+        base = getattr(Callback, event)
+        for cb in self.callbacks:
+            method = getattr(cb, event, None)
+            if method is not None and getattr(method, "__func__", None) is not base:
+                return True
+        return False
+
     def _call_callbacks(self, event: str, **kwargs: Any) -> None:
         """Dispatch an event to all registered callbacks.
 
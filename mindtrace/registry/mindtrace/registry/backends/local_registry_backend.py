@@ -11,7 +11,7 @@ import time
 import uuid
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Tuple, Union
+from typing import Any, Dict, List, Literal, Tuple, Union
 
 import yaml
 
@@ -21,9 +21,12 @@ if platform.system() == "Windows":
 
     fcntl = None
 else:
+    import fcntl
+
     msvcrt = None
 
 from mindtrace.core import Timeout
+from mindtrace.registry.backends.local_registry_index import INDEX_FILENAME, LocalRegistryIndex
 from mindtrace.registry.backends.registry_backend import (
     ConcreteVersionArg,
     MetadataArg,
@@ -37,23 +40,76 @@ from mindtrace.registry.core.exceptions import (
 )
 from mindtrace.registry.core.types import OnConflict, OpResult, OpResults
 
+# Linux ioctl cloning a whole file copy-on-write (btrfs, XFS with reflink=1, bcachefs, ...)
+_FICLONE = 0x40049409
+
+PULL_MODES = ("copy", "reflink", "link", "direct")
+
 
 class LocalRegistryBackend(RegistryBackend):
     """A simple local filesystem-based registry backend.
 
     All object directories and registry files are stored under a configurable base directory. The backend provides
     methods for uploading, downloading, and managing object files and metadata.
+
+    With ``content_addressed=True`` every pushed file is stored once under ``_blobs/sha256/`` keyed by the SHA-256 of
+    its contents, and the version directory is assembled from hardlinks to those blobs. Files shared between versions
+    (e.g. unchanged model weights) therefore occupy disk space once, and the per-version ``_blobs`` manifest in the
+    object metadata records which blob backs each file. A blob's hardlink count doubles as its reference count: it is
+    removed when the last version referencing it is deleted. Blobs are made read-only, since writing to one in place
+    would change every version that shares it.
+
+    ``pull_mode`` controls how stored files reach the directory a materializer reads from:
+
+    - ``"copy"`` (default): full copies.
+    - ``"reflink"``: copy-on-write clones where the filesystem supports them, otherwise copies.
+    - ``"link"``: hardlinks, falling back to reflinks and then copies. Pulled files share storage with the registry,
+      so they must be treated as read-only.
+    - ``"direct"``: immutable registries materialize straight from the stored directory without pulling at all;
+      pulls that still happen (e.g. for mutable registries) behave like ``"link"``.
+
+    With ``index=True`` the backend keeps a SQLite index of its object versions (see ``LocalRegistryIndex``), updated
+    right after each metadata file is written or removed. Listing objects and versions, and the LRU order used by the
+    registry cache, are then served from the index rather than by globbing metadata files. The metadata files stay
+    authoritative: an index missing or never built is populated from them on first use, and ``rebuild_index()``
+    resynchronizes one left stale, e.g. by a process writing with ``index=False``.
+
+    Storage structure::
+
+        {uri}/
+          {name}/{version}/...              # Artifact files (hardlinks into _blobs/ when content-addressed)
+          _meta_{name}@{version}.yaml       # Object metadata
+          _blobs/sha256/{ab}/{digest}       # Content-addressed blobs
+          _index.sqlite3                    # Metadata index (index=True)
+          registry_metadata.json            # Global registry config
     """
 
-    def __init__(self, uri: str | Path, lock_timeout: int = 30, **kwargs):
+    def __init__(
+        self,
+        uri: str | Path,
+        lock_timeout: int = 30,
+        content_addressed: bool = False,
+        pull_mode: Literal["copy", "reflink", "link", "direct"] = "copy",
+        index: bool = False,
+        **kwargs,
+    ):
         """Initialize the LocalRegistryBackend.
 
         Args:
             uri (str | Path): The base directory path where all object files and metadata will be stored.
                               Supports "file://" URI scheme which will be automatically stripped.
             lock_timeout: Timeout in seconds for acquiring locks. Default 30. Use shorter values in tests.
+            content_addressed: If True, push deduplicates files across versions through the content-addressed blob
+                store. Versions pushed either way can be pulled and deleted regardless of this setting.
+            pull_mode: How pulled files are materialized: "copy", "reflink", "link" or "direct" (see class docs).
+            index: If True, maintain and query a SQLite metadata index for listing and LRU lookups.
             **kwargs: Additional keyword arguments for the RegistryBackend.
+
+        Raises:
+            ValueError: If ``pull_mode`` is not one of the supported modes.
         """
+        if pull_mode not in PULL_MODES:
+            raise ValueError(f"Unknown pull_mode '{pull_mode}'. Expected one of {PULL_MODES}.")
         if isinstance(uri, str) and uri.startswith("file://"):
             uri = uri[len("file://") :]
         super().__init__(uri=uri, **kwargs)
@@ -61,6 +117,10 @@ class LocalRegistryBackend(RegistryBackend):
         self._uri.mkdir(parents=True, exist_ok=True)
         self._metadata_path = self._uri / "registry_metadata.json"
         self._lock_timeout = lock_timeout
+        self._content_addressed = content_addressed
+        self._pull_mode = pull_mode
+        self._index = LocalRegistryIndex(self._uri / INDEX_FILENAME, timeout=lock_timeout) if index else None
+        self._index_ready = False
         self.logger.debug(f"Initializing LocalBackend with uri: {self._uri}")
 
     @property
@@ -73,6 +133,21 @@ class LocalRegistryBackend(RegistryBackend):
         """The resolved metadata file path for the backend."""
         return self._metadata_path
 
+    @property
+    def content_addressed(self) -> bool:
+        """Whether push stores artifact files in the content-addressed blob store."""
+        return self._content_addressed
+
+    @property
+    def pull_mode(self) -> str:
+        """How pulled files are materialized: "copy", "reflink", "link" or "direct"."""
+        return self._pull_mode
+
+    @property
+    def indexed(self) -> bool:
+        """Whether listing and LRU queries are served from the metadata index."""
+        return self._index is not None
+
     # ─────────────────────────────────────────────────────────────────────────
     # Path Helpers
     # ─────────────────────────────────────────────────────────────────────────
@@ -139,6 +214,186 @@ class LocalRegistryBackend(RegistryBackend):
         """Get the path for a shared lock file."""
         return self._lock_dir(key) / f"_shared_{lock_id}"
 
+    def _blob_path(self, digest: str) -> Path:
+        """Get the content-addressed path for a blob with the given SHA-256 digest."""
+        return self.uri / "_blobs" / "sha256" / digest[:2] / digest
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Content-Addressed Storage
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def _store_blob(self, src: Path, digest: str) -> None:
+        """Atomically copy ``src`` into the blob store under ``digest``."""
+        blob = self._blob_path(digest)
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        tmp = blob.with_name(f".{digest}.{uuid.uuid4().hex}.tmp")
+        try:
+            shutil.copyfile(src, tmp)
+            if platform.system() != "Windows":
+                os.chmod(tmp, 0o444)
+            os.replace(tmp, blob)
+        finally:
+            tmp.unlink(missing_ok=True)
+
+    def _link_blob(self, src: Path, digest: str, dst: Path) -> bool:
+        """Materialize ``dst`` as a hardlink to the blob for ``digest``, storing ``src`` as that blob if needed.
+
+        Falls back to a plain copy of ``src`` when the filesystem does not support hardlinks.
+
+        Returns:
+            True if an existing blob was reused, False if ``src`` had to be stored.
+        """
+        blob = self._blob_path(digest)
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        reused = True
+        # A concurrent delete may collect the blob between the existence check and the link; store it again then.
+        for _ in range(3):
+            if not blob.exists():
+                self._store_blob(src, digest)
+                reused = False
+            try:
+                os.link(blob, dst)
+                return reused
+            except FileNotFoundError:
+                continue
+            except OSError as e:
+                self.logger.debug(f"Hardlinking {blob} failed ({e}); copying {src} instead.")
+                break
+        shutil.copy2(src, dst)
+        return False
+
+    @staticmethod
+    def _clone_file(src: str, dst: str) -> bool:
+        """Reflink ``src`` to ``dst`` as a copy-on-write clone.
+
+        Returns:
+            True if the file was cloned, False if the platform or filesystem cannot clone it.
+        """
+        if fcntl is None or platform.system() != "Linux":
+            return False
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+        except OSError:
+            Path(dst).unlink(missing_ok=True)
+            return False
+        shutil.copystat(src, dst)
+        return True
+
+    def _reflink_file(self, src: str, dst: str) -> None:
+        """``copytree`` copy function that clones files copy-on-write, copying where cloning is unsupported."""
+        if not self._clone_file(src, dst):
+            shutil.copy2(src, dst)
+
+    def _link_file(self, src: str, dst: str) -> None:
+        """``copytree`` copy function that hardlinks files, falling back to a reflink and then a copy."""
+        if os.path.lexists(dst):
+            os.unlink(dst)
+        try:
+            os.link(src, dst)
+        except OSError:
+            self._reflink_file(src, dst)
+
+    def _read_blob_manifest(self, meta_path: Path) -> Dict[str, str]:
+        """Return the ``_blobs`` manifest stored in a metadata file, or an empty dict if there is none."""
+        try:
+            with open(meta_path, "r") as f:
+                meta = yaml.safe_load(f)
+        except (FileNotFoundError, yaml.YAMLError):
+            return {}
+        return (meta.get("_blobs") if isinstance(meta, dict) else None) or {}
+
+    def _release_blobs(self, digests) -> int:
+        """Remove blobs among ``digests`` that are no longer linked from any version directory.
+
+        Returns:
+            Number of blobs removed.
+        """
+        removed = 0
+        for digest in set(digests):
+            blob = self._blob_path(digest)
+            try:
+                if blob.stat().st_nlink <= 1:
+                    blob.unlink()
+                    removed += 1
+            except FileNotFoundError:
+                pass
+        return removed
+
+    def collect_garbage(self) -> int:
+        """Remove every blob that is no longer referenced by a stored version.
+
+        ``delete`` releases blobs eagerly; this sweep reclaims blobs left behind by interrupted pushes, or kept alive
+        by a hardlinked pull directory at the time their last version was deleted.
+
+        Returns:
+            Number of blobs removed.
+        """
+        blob_root = self.uri / "_blobs" / "sha256"
+        if not blob_root.exists():
+            return 0
+        digests = [blob.name for blob in blob_root.glob("*/*") if not blob.name.startswith(".")]
+        removed = self._release_blobs(digests)
+        self.logger.debug(f"Garbage collection removed {removed} unreferenced blob(s).")
+        return removed
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Metadata Index
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def _get_index(self) -> LocalRegistryIndex | None:
+        """Return the metadata index, building it from the metadata files if it has never been built."""
+        if self._index is not None and not self._index_ready:
+            with self._internal_lock("_metadata_index"):
+                if not self._index.is_built():
+                    count = self._index.replace_all(self._scan_metadata_files())
+                    self.logger.debug(f"Built metadata index with {count} object version(s).")
+            self._index_ready = True
+        return self._index
+
+    def _scan_metadata_files(self):
+        """Yield ``(name, version, mtime)`` for every object metadata file in the registry directory."""
+        for meta_file in self.uri.glob("_meta_*.yaml"):
+            name_part, sep, version = meta_file.stem[len("_meta_") :].partition("@")
+            if not sep:
+                continue
+            try:
+                mtime = meta_file.stat().st_mtime
+            except FileNotFoundError:
+                continue
+            yield name_part.replace("%3A", ":"), version, mtime
+
+    def rebuild_index(self) -> int:
+        """Rebuild the metadata index from the metadata files on disk.
+
+        Use this after the registry directory was modified without the index, e.g. by a backend with ``index=False``
+        or a copy of the directory. Entries keep their metadata file mtime as last-access time. Writes that race with
+        the rebuild may be missed, so run it while the registry is idle.
+
+        Returns:
+            Number of indexed object versions.
+
+        Raises:
+            RuntimeError: If the backend was created with ``index=False``.
+        """
+        if self._index is None:
+            raise RuntimeError("Metadata index is disabled. Create the backend with index=True.")
+        with self._internal_lock("_metadata_index"):
+            count = self._index.replace_all(self._scan_metadata_files())
+        self._index_ready = True
+        self.logger.debug(f"Rebuilt metadata index with {count} object version(s).")
+        return count
+
+    def _index_add(self, name: str, version: str) -> None:
+        index = self._get_index()
+        if index is not None:
+            index.add(name, version)
+
+    def _index_remove(self, name: str, version: str) -> None:
+        index = self._get_index()
+        if index is not None:
+            index.remove(name, version)
+
     # ─────────────────────────────────────────────────────────────────────────
     # Internal Locking
     # ─────────────────────────────────────────────────────────────────────────
@@ -463,6 +718,7 @@ class LocalRegistryBackend(RegistryBackend):
                 self._ensure_metadata_parent(meta_path)
                 with open(meta_path, "w") as f:
                     yaml.safe_dump(prepared_metadata, f)
+                self._index_add(name, version)
 
                 self.cleanup_direct_upload_target(staged_target)
                 if is_overwrite:
@@ -518,9 +774,11 @@ class LocalRegistryBackend(RegistryBackend):
 
                     # Check for existing version
                     is_overwrite = False
+                    released_blobs: Dict[str, str] = {}
                     if meta_path.exists():
                         if on_conflict == OnConflict.OVERWRITE:
                             # Remove existing artifacts and metadata before overwriting
+                            released_blobs = self._read_blob_manifest(meta_path)
                             if artifact_dst.exists():
                                 shutil.rmtree(artifact_dst, ignore_errors=True)
                             meta_path.unlink(missing_ok=True)
@@ -532,20 +790,35 @@ class LocalRegistryBackend(RegistryBackend):
 
                     try:
                         # 1. Copy artifacts
-                        self.logger.debug(f"Uploading directory from {obj_path} to {artifact_dst}")
-                        shutil.copytree(obj_path, artifact_dst, dirs_exist_ok=True)
-                        self.logger.debug(f"Upload complete. Contents: {list(artifact_dst.rglob('*'))}")
+                        blob_manifest = None
+                        if self._content_addressed:
+                            files = obj_meta.get("_files") if obj_meta else None
+                            blob_manifest = self._build_blob_manifest(obj_path, files, obj_meta)
+                            self.logger.debug(f"Linking {len(blob_manifest)} file(s) from {obj_path} to {artifact_dst}")
+                            artifact_dst.mkdir(parents=True, exist_ok=True)
+                            reused = sum(
+                                self._link_blob(obj_path / rel, digest, artifact_dst / rel)
+                                for rel, digest in blob_manifest.items()
+                            )
+                            self.logger.debug(f"Upload complete. Reused {reused}/{len(blob_manifest)} stored blob(s).")
+                        else:
+                            self.logger.debug(f"Uploading directory from {obj_path} to {artifact_dst}")
+                            shutil.copytree(obj_path, artifact_dst, dirs_exist_ok=True)
+                            self.logger.debug(f"Upload complete. Contents: {list(artifact_dst.rglob('*'))}")
 
                         # 2. Write metadata (commit point)
                         if obj_meta is not None:
                             # Add path to metadata
                             obj_meta = dict(obj_meta)
                             obj_meta["path"] = str(artifact_dst)
+                            if blob_manifest is not None:
+                                obj_meta["_blobs"] = blob_manifest
 
                             self.logger.debug(f"Saving metadata to {meta_path}: {obj_meta}")
                             self._ensure_metadata_parent(meta_path)
                             with open(meta_path, "w") as f:
                                 yaml.safe_dump(obj_meta, f)
+                            self._index_add(obj_name, obj_version)
 
                         if is_overwrite:
                             results.add(OpResult.overwritten(obj_name, obj_version))
@@ -558,7 +831,13 @@ class LocalRegistryBackend(RegistryBackend):
                             shutil.rmtree(artifact_dst, ignore_errors=True)
                         if meta_path.exists():
                             meta_path.unlink(missing_ok=True)
+                        self._index_remove(obj_name, obj_version)
+                        if blob_manifest:
+                            self._release_blobs(blob_manifest.values())
                         raise RuntimeError(f"Push failed for {obj_name}@{obj_version}: {e}") from e
+                    finally:
+                        if released_blobs:
+                            self._release_blobs(released_blobs.values())
 
             except Exception as e:
                 results.add(OpResult.failed(obj_name, obj_version, e))
@@ -575,6 +854,9 @@ class LocalRegistryBackend(RegistryBackend):
     ) -> OpResults:
         """Copy a directory from the backend store to a local path.
 
+        Files are copied, cloned or hardlinked according to ``pull_mode``. This holds for content-addressed
+        versions too: only ``"link"`` and ``"direct"`` hand out hardlinks to their shared blobs.
+
         Args:
             name: Name of the object(s).
             version: Version string(s).
@@ -609,12 +891,12 @@ class LocalRegistryBackend(RegistryBackend):
                     # Acquire shared lock for read operation in mutable registries
                     with self._internal_lock(f"{obj_name}@{obj_version}", shared=True):
                         self.logger.debug(f"Downloading directory from {src} to {dest_path} (with shared lock)")
-                        shutil.copytree(src, dest_path, dirs_exist_ok=True)
+                        self._pull_tree(src, Path(dest_path))
                         self.logger.debug(f"Download complete. Contents: {list(Path(dest_path).rglob('*'))}")
                 else:
                     # No locking for immutable registries (fast path)
                     self.logger.debug(f"Downloading directory from {src} to {dest_path}")
-                    shutil.copytree(src, dest_path, dirs_exist_ok=True)
+                    self._pull_tree(src, Path(dest_path))
                     self.logger.debug(f"Download complete. Contents: {list(Path(dest_path).rglob('*'))}")
 
                 results.add(OpResult.success(obj_name, obj_version))
@@ -624,6 +906,23 @@ class LocalRegistryBackend(RegistryBackend):
 
         return results
 
+    def _pull_tree(self, src: Path, dest_path: Path) -> None:
+        """Copy a stored version to ``dest_path`` according to the pull mode."""
+        if self._pull_mode in ("link", "direct"):
+            copy_function = self._link_file
+        elif self._pull_mode == "reflink":
+            copy_function = self._reflink_file
+        else:
+            copy_function = shutil.copy2
+        shutil.copytree(src, dest_path, copy_function=copy_function, dirs_exist_ok=True)
+
+    def local_artifact_path(self, name: str, version: str) -> Path | None:
+        """Return the stored directory of ``name@version`` when ``pull_mode="direct"``, else None."""
+        if self._pull_mode != "direct":
+            return None
+        path = self._full_path(self._object_key(name, version))
+        return path if path.is_dir() else None
+
     def delete(
         self,
         name: NameArg,
@@ -632,7 +931,7 @@ class LocalRegistryBackend(RegistryBackend):
     ) -> OpResults:
         """Delete a directory from the backend store.
 
-        Also removes empty parent directories.
+        Also removes empty parent directories, and releases content-addressed blobs no other version references.
 
         Args:
             name: Name of the object(s).
@@ -658,6 +957,7 @@ class LocalRegistryBackend(RegistryBackend):
                 with self._internal_lock(f"{obj_name}@{obj_version}"):
                     target = self._full_path(self._object_key(obj_name, obj_version))
                     meta_path = self._object_metadata_path(obj_name, obj_version)
+                    blob_manifest = self._read_blob_manifest(meta_path)
                     # Delete directory
                     self.logger.debug(f"Deleting directory: {target}")
                     if target.exists():
@@ -667,6 +967,11 @@ class LocalRegistryBackend(RegistryBackend):
                     self.logger.debug(f"Deleting metadata file: {meta_path}")
                     if meta_path.exists():
                         meta_path.unlink()
+                    self._index_remove(obj_name, obj_version)
+
+                    if blob_manifest:
+                        released = self._release_blobs(blob_manifest.values())
+                        self.logger.debug(f"Released {released} unreferenced blob(s) of {obj_name}@{obj_version}.")
 
                     # Cleanup parent if empty (race-safe under concurrent deletes).
                     # Another thread/process may remove `parent` between checks/iteration.
@@ -737,6 +1042,7 @@ class LocalRegistryBackend(RegistryBackend):
                     self._ensure_metadata_parent(meta_path)
                     with open(meta_path, "w") as f:
                         yaml.safe_dump(obj_meta, f)
+                    self._index_add(obj_name, obj_version)
                     results.add(OpResult.overwritten(obj_name, obj_version))
                 else:
                     # on_conflict == "skip" - return skipped result
@@ -746,6 +1052,7 @@ class LocalRegistryBackend(RegistryBackend):
                 self._ensure_metadata_parent(meta_path)
                 with open(meta_path, "w") as f:
                     yaml.safe_dump(obj_meta, f)
+                self._index_add(obj_name, obj_version)
                 results.add(OpResult.success(obj_name, obj_version))
 
         return results
@@ -849,6 +1156,7 @@ class LocalRegistryBackend(RegistryBackend):
                 self.logger.debug(f"Deleting metadata file: {meta_path}")
                 if meta_path.exists():
                     meta_path.unlink()
+                self._index_remove(obj_name, obj_version)
                 results.add(OpResult.success(obj_name, obj_version))
             except Exception as e:
                 results.add(OpResult.failed(obj_name, obj_version, e))
@@ -897,6 +1205,10 @@ class LocalRegistryBackend(RegistryBackend):
         Returns:
             List of object names sorted alphabetically.
         """
+        index = self._get_index()
+        if index is not None:
+            return index.objects()
+
         objects = set()
         # Look for metadata files that follow the pattern _meta_objectname@version.yaml
         for meta_file in self.uri.glob("_meta_*.yaml"):
@@ -921,6 +1233,10 @@ class LocalRegistryBackend(RegistryBackend):
         names = self._to_list(name)
         results: Dict[str, List[str]] = {}
 
+        index = self._get_index()
+        if index is not None:
+            return {obj_name: index.versions(obj_name) for obj_name in names}
+
         for obj_name in names:
             # Build the prefix used in metadata filenames for this object.
             prefix = self._object_metadata_prefix(obj_name)
@@ -975,6 +1291,51 @@ class LocalRegistryBackend(RegistryBackend):
 
         return results
 
+    def latest_version(self, name: str) -> str | None:
+        """Return the highest numeric version of an object, or None if it has none.
+
+        Answered by a single index lookup when ``index=True``; otherwise derived from ``list_versions``.
+        """
+        index = self._get_index()
+        if index is not None:
+            return index.latest(name)
+        numeric = [v for v in self.list_versions(name)[name] if all(part.isdigit() for part in v.split("."))]
+        return numeric[-1] if numeric else None
+
+    def touch(self, name: str, version: str, last_accessed: float | None = None) -> None:
+        """Mark an object version as accessed, for least-recently-used ordering.
+
+        Sets the metadata file mtime, and the index entry when ``index=True``, to ``last_accessed`` (default: now).
+
+        Raises:
+            FileNotFoundError: If the object version does not exist.
+        """
+        timestamp = time.time() if last_accessed is None else last_accessed
+        os.utime(self._object_metadata_path(name, version), (timestamp, timestamp))
+        index = self._get_index()
+        if index is not None and not index.touch(name, version, timestamp):
+            index.add(name, version, timestamp)
+
+    def lru_entries(self) -> List[Tuple[str, str, float]]:
+        """Return ``(name, version, last_accessed)`` for every object version, least recently used first.
+
+        Without an index, recency is the metadata file mtime, falling back to now when it cannot be read.
+        """
+        index = self._get_index()
+        if index is not None:
+            return index.lru()
+
+        entries = []
+        for obj_name, versions in self.list_versions(self.list_objects()).items():
+            for obj_version in versions:
+                last_accessed = time.time()
+                try:
+                    last_accessed = self._object_metadata_path(obj_name, obj_version).stat().st_mtime
+                except Exception:
+                    pass
+                entries.append((obj_name, obj_version, last_accessed))
+        return sorted(entries, key=lambda entry: entry[2])
+
     # ─────────────────────────────────────────────────────────────────────────
     # Materializer Registry
     # ─────────────────────────────────────────────────────────────────────────
@@ -0,0 +1,224 @@
+"""SQLite metadata index for ``LocalRegistryBackend``.
+
+The index mirrors which ``name@version`` metadata files exist under a local registry directory, together with a
+sortable version key and a last-access timestamp, so listing, latest-version and LRU queries become indexed lookups
+instead of directory globs and per-file ``stat`` calls. The metadata files remain the source of truth: the index can
+be dropped at any time and rebuilt from them with ``LocalRegistryBackend.rebuild_index()`` or the
+``mindtrace-registry-rebuild-index`` command.
+"""
+
+import argparse
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Iterable, List, Tuple
+
+INDEX_FILENAME = "_index.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS versions (
+    name TEXT NOT NULL,
+    version TEXT NOT NULL,
+    sort_key TEXT NOT NULL,
+    last_accessed REAL NOT NULL,
+    PRIMARY KEY (name, version)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS versions_by_sort_key ON versions (name, sort_key, version);
+CREATE INDEX IF NOT EXISTS versions_by_last_accessed ON versions (last_accessed);
+CREATE TABLE IF NOT EXISTS index_state (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def version_sort_key(version: str) -> str:
+    """Return a string that sorts like the tuple of a dotted numeric version.
+
+    Each component is zero-padded to a fixed width and joined with ".", which sorts below every digit, so ``"1"`` <
+    ``"1.0"`` < ``"1.9"`` < ``"1.10"``. Non-numeric versions map to ``""`` and sort first.
+    """
+    try:
+        return ".".join(f"{int(part):020d}" for part in version.split("."))
+    except ValueError:
+        return ""
+
+
+class LocalRegistryIndex:
+    """SQLite index of the object versions stored in a local registry directory.
+
+    The database runs in WAL mode so readers in other processes are not blocked by a writer. The connection is opened
+    lazily and shared by all threads of a process behind a lock; it is not pickled with the index.
+
+    Args:
+        path: Path of the SQLite database file.
+        timeout: Seconds to wait for a database lock held by another process.
+    """
+
+    def __init__(self, path: str | Path, timeout: float = 30.0):
+        self.path = Path(path)
+        self.timeout = timeout
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.RLock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_conn"] = None
+        state["_lock"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        """Close the database connection. It is reopened on next use."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Updates
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def add(self, name: str, version: str, last_accessed: float | None = None) -> None:
+        """Record that ``name@version`` exists, marking it as accessed now unless ``last_accessed`` is given."""
+        timestamp = time.time() if last_accessed is None else last_accessed
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO versions (name, version, sort_key, last_accessed) VALUES (?, ?, ?, ?)",
+                (name, version, version_sort_key(version), timestamp),
+            )
+
+    def remove(self, name: str, version: str) -> None:
+        """Forget ``name@version``. Unknown entries are ignored."""
+        with self._lock:
+            self._connection.execute("DELETE FROM versions WHERE name = ? AND version = ?", (name, version))
+
+    def touch(self, name: str, version: str, last_accessed: float | None = None) -> bool:
+        """Update the last-access time of ``name@version``.
+
+        Returns:
+            False if the entry is not indexed.
+        """
+        timestamp = time.time() if last_accessed is None else last_accessed
+        with self._lock:
+            cursor = self._connection.execute(
+                "UPDATE versions SET last_accessed = ? WHERE name = ? AND version = ?", (timestamp, name, version)
+            )
+        return cursor.rowcount > 0
+
+    def replace_all(self, entries: Iterable[Tuple[str, str, float]]) -> int:
+        """Atomically replace the index contents with ``(name, version, last_accessed)`` entries and mark it built.
+
+        Returns:
+            Number of indexed entries.
+        """
+        rows = [(name, version, version_sort_key(version), last_accessed) for name, version, last_accessed in entries]
+        with self._lock:
+            conn = self._connection
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute("DELETE FROM versions")
+                conn.executemany(
+                    "INSERT OR REPLACE INTO versions (name, version, sort_key, last_accessed) VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO index_state (key, value) VALUES ('built_at', ?)", (str(time.time()),)
+                )
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        return len(rows)
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Queries
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def is_built(self) -> bool:
+        """Whether the index has been populated by ``replace_all`` at least once."""
+        with self._lock:
+            row = self._connection.execute("SELECT 1 FROM index_state WHERE key = 'built_at'").fetchone()
+        return row is not None
+
+    def objects(self) -> List[str]:
+        """Return all indexed object names, sorted."""
+        with self._lock:
+            rows = self._connection.execute("SELECT DISTINCT name FROM versions ORDER BY name").fetchall()
+        return [row[0] for row in rows]
+
+    def versions(self, name: str) -> List[str]:
+        """Return the indexed versions of ``name`` in ascending numeric order."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT version FROM versions WHERE name = ? ORDER BY sort_key, version", (name,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def latest(self, name: str) -> str | None:
+        """Return the highest numeric version of ``name``, or None if it has no numeric versions."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT version FROM versions WHERE name = ? AND sort_key != '' ORDER BY sort_key DESC, version DESC "
+                "LIMIT 1",
+                (name,),
+            ).fetchone()
+        return row[0] if row else None
+
+    def lru(self, limit: int | None = None) -> List[Tuple[str, str, float]]:
+        """Return ``(name, version, last_accessed)`` entries, least recently accessed first."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT name, version, last_accessed FROM versions ORDER BY last_accessed, name, version LIMIT ?",
+                (-1 if limit is None else limit,),
+            ).fetchall()
+        return [(name, version, last_accessed) for name, version, last_accessed in rows]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM versions").fetchone()[0]
+
+    def __contains__(self, item: Tuple[str, str]) -> bool:
+        name, version = item
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT 1 FROM versions WHERE name = ? AND version = ?", (name, version)
+            ).fetchone()
+        return row is not None
+
+
+def _build_cli() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Rebuild the metadata index of a local Mindtrace registry")
+    parser.add_argument("uri", help="Local registry directory")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    from mindtrace.registry.backends.local_registry_backend import LocalRegistryBackend
+
+    args = _build_cli().parse_args(argv)
+    uri = Path(args.uri).expanduser()
+    if not uri.is_dir():
+        print(f"Registry directory not found: {uri}")
+        return 1
+    count = LocalRegistryBackend(uri=uri, index=True).rebuild_index()
+    print(f"Indexed {count} object version(s) in {uri / INDEX_FILENAME}.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -2,7 +2,7 @@ from abc import abstractmethod
 from pathlib import Path
 from typing import Any, Dict, List, Tuple, Union
 
-from mindtrace.core import MindtraceABC
+from mindtrace.core import MindtraceABC, compute_file_manifest, hash_algorithm_of
 from mindtrace.registry.core.types import OnConflict, OpResult, OpResults
 
 # Type aliases for cleaner signatures
@@ -109,6 +109,7 @@ class RegistryBackend(MindtraceABC):  # pragma: no cover
                 - "metadata": user metadata
                 - "_files": list of relative file paths
                 - "hash": content hash for verification
+                - "_digests": per-file digests the hash was computed from (optional)
             on_conflict: Behavior when version exists.
                 "skip": Return skipped result.
                 "overwrite": Replace existing version.
@@ -190,6 +191,21 @@ class RegistryBackend(MindtraceABC):  # pragma: no cover
         """
         pass
 
+    def local_artifact_path(self, name: str, version: str) -> Path | None:
+        """Return a local directory that materializers may read a stored version from in place.
+
+        Backends that can expose stored artifacts on the local filesystem override this so immutable registries can
+        skip ``pull`` entirely. The directory must not be modified by the caller.
+
+        Args:
+            name: Name of the object.
+            version: Concrete version string.
+
+        Returns:
+            Path to the stored artifact directory, or None if the version must be pulled (the default).
+        """
+        return None
+
     @abstractmethod
     def delete(
         self,
@@ -406,6 +422,31 @@ class RegistryBackend(MindtraceABC):  # pragma: no cover
         """
         return self.registered_materializers(object_class).get(object_class, None)
 
+    # ─────────────────────────────────────────────────────────────────────────
+    # Content-Addressed Storage
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def _build_blob_manifest(
+        self, local_path: Path, files: List[str] | None = None, metadata: dict | None = None
+    ) -> Dict[str, str]:
+        """Map each file of a local artifact directory to the SHA-256 digest of its contents.
+
+        Backends that store artifacts content-addressed record this mapping as the ``_blobs`` manifest of a version,
+        so unchanged files are stored (and uploaded) once no matter how many versions reference them.
+
+        Args:
+            local_path: Directory holding the materialized artifact.
+            files: Relative file paths to include, usually the ``_files`` manifest. If None, the directory is walked.
+            metadata: Push metadata of the version. When the registry already hashed the artifact with SHA-256, its
+                ``_digests`` manifest is reused instead of reading every file a second time.
+
+        Returns:
+            Dict mapping relative POSIX file paths to hex SHA-256 digests.
+        """
+        if metadata and metadata.get("_digests") and hash_algorithm_of(metadata.get("hash") or "") == "sha256":
+            return dict(metadata["_digests"])
+        return compute_file_manifest(local_path, "sha256", files=files)
+
     # ─────────────────────────────────────────────────────────────────────────
     # Validation
     # ─────────────────────────────────────────────────────────────────────────
@@ -52,6 +52,14 @@ class S3RegistryBackend(RegistryBackend):
 
     Uses `_files` manifest from metadata to avoid expensive blob listing on pull.
 
+    Content-addressed mode (``content_addressed=True``):
+    - Each file is stored once at _blobs/sha256/{ab}/{digest}, keyed by the SHA-256 of its contents
+    - Push only uploads blobs that are not already in the bucket; the ``_blobs`` manifest in the
+      version metadata maps each relative file path to its digest
+    - Every push records one reference marker per blob at _blobs/refs/{digest}/{uuid}; delete removes
+      the version's markers and then any blob left without markers
+    - Versions pushed in either layout can be pulled and deleted regardless of the setting
+
     Local Docker Example (Minio):
         To run a local MinIO registry, first start a MinIO server using docker:
 
@@ -91,6 +99,7 @@ class S3RegistryBackend(RegistryBackend):
         prefix: str = "",
         max_workers: int = 4,
         lock_timeout: int = 30,
+        content_addressed: bool = False,
         **kwargs,
     ):
         """Initialize the S3RegistryBackend.
@@ -106,7 +115,9 @@ class S3RegistryBackend(RegistryBackend):
             secure: Whether to use HTTPS.
             prefix: Optional prefix (subfolder) within the bucket for all registry objects.
             max_workers: Maximum number of parallel workers for batch operations.
-            lock_timeout: Timeout in seconds for acquiring locks (used only for materializer registration). Default 30.
+            lock_timeout: Timeout in seconds for acquiring locks (used for materializer registration and for deleting
+                content-addressed blobs). Default 30.
+            content_addressed: If True, push stores files as deduplicated content-addressed blobs.
             **kwargs: Additional keyword arguments for the RegistryBackend.
         """
         super().__init__(uri=uri, **kwargs)
@@ -119,6 +130,7 @@ class S3RegistryBackend(RegistryBackend):
         self._metadata_path = self._prefixed("registry_metadata.json")
         self._max_workers = max_workers
         self._lock_timeout = lock_timeout
+        self._content_addressed = content_addressed
         self._bucket = bucket
         self.logger.debug(f"Initializing S3Backend with uri: {self._uri}, prefix: {self._prefix}")
 
@@ -181,6 +193,11 @@ class S3RegistryBackend(RegistryBackend):
         """The resolved metadata file path for the backend."""
         return Path(self._metadata_path)
 
+    @property
+    def content_addressed(self) -> bool:
+        """Whether push stores artifact files as content-addressed blobs."""
+        return self._content_addressed
+
     # ─────────────────────────────────────────────────────────────────────────
     # Path Helpers
     # ─────────────────────────────────────────────────────────────────────────
@@ -223,6 +240,14 @@ class S3RegistryBackend(RegistryBackend):
         """Convert object name, version, and UUID to a storage key."""
         return self._prefixed(f"objects/{name}/{version}/{uuid_str}")
 
+    def _blob_key(self, digest: str) -> str:
+        """Get the content-addressed storage key for a blob."""
+        return self._prefixed(f"_blobs/sha256/{digest[:2]}/{digest}")
+
+    def _blob_ref_key(self, digest: str, uuid_str: str) -> str:
+        """Get the key of the marker recording that the push ``uuid_str`` references a blob."""
+        return self._prefixed(f"_blobs/refs/{digest}/{uuid_str}")
+
     def _staging_path(self, name: str, version: str, uuid_str: str) -> str:
         """Get the namespaced staging path for a commit plan."""
         safe_name = quote(name, safe="")
@@ -449,26 +474,161 @@ class S3RegistryBackend(RegistryBackend):
             self.logger.warning(f"Failed to delete UUID folder {folder_prefix}: {e}")
             return False
 
+    def _upload_blobs(
+        self,
+        obj_name: str,
+        obj_version: str,
+        uuid_str: str,
+        obj_path: Path,
+        blob_manifest: Dict[str, str],
+        max_workers: int = 4,
+    ) -> None:
+        """Reference and upload the content-addressed blobs of a push.
+
+        Reference markers are written before the existence check, and the existence check waits out any
+        release currently holding the blob's lock (see ``_release_blobs``). A release that lists references
+        after the marker was written keeps the blob; one that listed them earlier holds the lock until its
+        delete has finished, so the existence check runs afterwards and the blob is re-uploaded.
+
+        Args:
+            obj_name: Object name.
+            obj_version: Object version.
+            uuid_str: UUID of the push, recorded in each reference marker.
+            obj_path: Local directory holding the files.
+            blob_manifest: Mapping of relative file path to SHA-256 digest.
+            max_workers: Maximum parallel workers for existence checks and uploads.
+
+        Raises:
+            RuntimeError: If a reference marker or blob could not be written.
+        """
+        sources: Dict[str, str] = {}
+        for relative_path, digest in blob_manifest.items():
+            sources.setdefault(digest, str(obj_path / relative_path))
+
+        marker = json.dumps({"name": obj_name, "version": obj_version})
+
+        def reference(digest: str) -> bool:
+            return self.storage.upload_string(marker, self._blob_ref_key(digest, uuid_str)).ok
+
+        def missing(digest: str) -> bool:
+            self._wait_for_blob_release(digest)
+            return not self.storage.exists(self._blob_key(digest))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            if not all(executor.map(reference, sources)):
+                raise RuntimeError("Failed to write blob reference markers")
+            to_upload = [digest for digest, absent in zip(sources, executor.map(missing, sources)) if absent]
+
+        if to_upload:
+            files = [(sources[digest], self._blob_key(digest)) for digest in to_upload]
+            batch_result = self.storage.upload_batch(files, fail_if_exists=False, max_workers=max_workers)
+            if batch_result.failed_results:
+                first_error = batch_result.failed_results[0]
+                raise RuntimeError(
+                    f"Failed to upload {len(batch_result.failed_results)} blob(s): {first_error.error_message}"
+                )
+
+        self.logger.debug(f"Uploaded {len(to_upload)}/{len(sources)} new blob(s) for {obj_name}@{obj_version}.")
+
+    def _blob_lock_key(self, digest: str) -> str:
+        """Lock key serializing the deletion of blob ``digest`` against pushes that reuse it."""
+        return f"_blob_{digest}"
+
+    def _wait_for_blob_release(self, digest: str) -> None:
+        """Block while a release holds the lock of blob ``digest``.
+
+        Expired locks are ignored, and the wait is bounded by the lock timeout, which is also the lock TTL.
+        """
+        lock_path = self._lock_path(self._blob_lock_key(digest))
+        deadline = time.time() + self._lock_timeout
+        while time.time() < deadline:
+            result = self.storage.download_string(lock_path)
+            if not result.ok:
+                return
+            try:
+                expires_at = json.loads(result.content.decode("utf-8")).get("expires_at", 0)
+            except (ValueError, AttributeError):
+                return
+            if time.time() >= expires_at:
+                return
+            time.sleep(0.1)
+
+    def _release_blobs(self, uuid_str: str, digests) -> bool:
+        """Drop the reference markers of push ``uuid_str`` and delete blobs that are no longer referenced.
+
+        Each blob is checked and deleted while holding its lock, which pushes wait out before deciding to
+        skip an upload (see ``_upload_blobs``). A blob whose lock cannot be acquired is left in place.
+
+        Args:
+            uuid_str: UUID of the push whose references are released.
+            digests: Digests referenced by that push.
+
+        Returns:
+            True if all markers and unreferenced blobs were deleted.
+        """
+        digests = sorted(set(digests))
+        if not digests:
+            return True
+        batch_result = self.storage.delete_batch([self._blob_ref_key(digest, uuid_str) for digest in digests])
+        cleanup_ok = not [r for r in batch_result.failed_results if r.status != Status.NOT_FOUND]
+
+        for digest in digests:
+            if self.storage.list_objects(prefix=self._prefixed(f"_blobs/refs/{digest}/"), max_results=1):
+                continue
+            lock_key = self._blob_lock_key(digest)
+            lock_id = str(uuid.uuid4())
+            if not self._acquire_lock(lock_key, lock_id, timeout=self._lock_timeout):
+                cleanup_ok = False
+                continue
+            try:
+                # Re-list under the lock: a push that referenced the blob since the first check keeps it.
+                if self.storage.list_objects(prefix=self._prefixed(f"_blobs/refs/{digest}/"), max_results=1):
+                    continue
+                batch_result = self.storage.delete_batch([self._blob_key(digest)])
+                cleanup_ok = cleanup_ok and not [r for r in batch_result.failed_results if r.status != Status.NOT_FOUND]
+            finally:
+                self._release_lock(lock_key, lock_id)
+        return cleanup_ok
+
+    def _delete_version_storage(
+        self,
+        name: str,
+        version: str,
+        uuid_str: str,
+        files_manifest: list | None = None,
+        blob_manifest: dict | None = None,
+    ) -> bool:
+        """Delete the artifact storage of one push, in whichever layout it was written.
+
+        Returns:
+            True if cleanup succeeded, False otherwise.
+        """
+        if blob_manifest is not None:
+            return self._release_blobs(uuid_str, blob_manifest.values())
+        return self._delete_uuid_folder(name, version, uuid_str, files_manifest)
+
     def _attempt_rollback(
         self,
         name: str,
         version: str,
         uuid_str: str,
+        blob_manifest: dict | None = None,
     ) -> bool:
         """Attempt to clean up after a failed push operation.
 
-        Best-effort cleanup of UUID folder and commit plan. If cleanup fails,
+        Best-effort cleanup of UUID folder (or blob references) and commit plan. If cleanup fails,
         the commit plan remains for janitor to handle later.
 
         Args:
             name: Object name.
             version: Object version.
             uuid_str: UUID of the folder to clean up (also used as plan filename).
+            blob_manifest: ``_blobs`` manifest of a content-addressed push, if any.
 
         Returns:
             True if cleanup succeeded, False otherwise.
         """
-        cleanup_ok = self._delete_uuid_folder(name, version, uuid_str)
+        cleanup_ok = self._delete_version_storage(name, version, uuid_str, blob_manifest=blob_manifest)
         if cleanup_ok:
             self._delete_commit_plan(name, version, uuid_str)
         return cleanup_ok
@@ -651,6 +811,7 @@ class S3RegistryBackend(RegistryBackend):
             OpResult indicating success, skip, overwrite, or error.
         """
         uuid_str: str | None = None
+        blob_manifest: Dict[str, str] | None = None
         is_overwrite = on_conflict == OnConflict.OVERWRITE
 
         try:
@@ -678,7 +839,12 @@ class S3RegistryBackend(RegistryBackend):
             remote_key = self._object_key_with_uuid(obj_name, obj_version, uuid_str)
 
             files_manifest = obj_meta.get("_files") if obj_meta else None
-            if files_manifest is not None:
+            if self._content_addressed:
+                # Content-addressed: upload only blobs the bucket does not hold yet
+                files = []
+                blob_manifest = self._build_blob_manifest(obj_path, files_manifest, obj_meta)
+                self._upload_blobs(obj_name, obj_version, uuid_str, obj_path, blob_manifest, max_workers)
+            elif files_manifest is not None:
                 files = [(str(obj_path / f), f"{remote_key}/{f}".replace("\\", "/")) for f in files_manifest]
             else:
                 # Fallback: collect files from directory
@@ -708,12 +874,14 @@ class S3RegistryBackend(RegistryBackend):
             # Step 5: For OVERWRITE mode - check late for old_uuid and old_files (shorter race window)
             old_uuid = None
             old_files = None
+            old_blobs = None
             if is_overwrite:
                 try:
                     result = self.fetch_metadata(obj_name, obj_version).first()
                     if result and result.ok and result.metadata:
                         old_uuid = result.metadata.get("_storage", {}).get("uuid")
                         old_files = result.metadata.get("_files")
+                        old_blobs = result.metadata.get("_blobs")
                 except Exception:
                     pass
 
@@ -724,6 +892,10 @@ class S3RegistryBackend(RegistryBackend):
                 "uuid": uuid_str,
                 "created_at": datetime.now(timezone.utc).isoformat(),
             }
+            if blob_manifest is not None:
+                prepared_meta["path"] = f"s3://{self._bucket}/{self._prefixed('_blobs')}"
+                prepared_meta["_storage"]["layout"] = "content_addressed"
+                prepared_meta["_blobs"] = blob_manifest
 
             # Step 7: Write metadata (the "commit point")
             meta_result = self._save_metadata_single(
@@ -736,7 +908,7 @@ class S3RegistryBackend(RegistryBackend):
 
             # Handle conflict (immutable mode - another writer won the race)
             if meta_result.status == Status.ALREADY_EXISTS:
-                rollback_ok = self._attempt_rollback(obj_name, obj_version, uuid_str)
+                rollback_ok = self._attempt_rollback(obj_name, obj_version, uuid_str, blob_manifest)
                 return OpResult.skipped(
                     obj_name,
                     obj_version,
@@ -745,7 +917,7 @@ class S3RegistryBackend(RegistryBackend):
 
             # Handle any error (.ok checks for OK or OVERWRITTEN)
             if not meta_result.ok:
-                rollback_ok = self._attempt_rollback(obj_name, obj_version, uuid_str)
+                rollback_ok = self._attempt_rollback(obj_name, obj_version, uuid_str, blob_manifest)
                 return OpResult.failed(
                     obj_name,
                     obj_version,
@@ -760,7 +932,7 @@ class S3RegistryBackend(RegistryBackend):
                     # Use old_files manifest if available (avoids list_objects)
                     # If any file deletion fails (including not found), cleanup_ok=False
                     # which means we keep plan for janitor (race detection)
-                    cleanup_ok = self._delete_uuid_folder(obj_name, obj_version, old_uuid, old_files)
+                    cleanup_ok = self._delete_version_storage(obj_name, obj_version, old_uuid, old_files, old_blobs)
                     if cleanup_ok:
                         plan_deleted = self._delete_commit_plan(obj_name, obj_version, uuid_str)
                         cleanup_state = CleanupState.OK if plan_deleted else CleanupState.UNKNOWN
@@ -781,7 +953,7 @@ class S3RegistryBackend(RegistryBackend):
         except Exception as e:
             # Attempt cleanup if we created a commit plan
             if uuid_str:
-                rollback_ok = self._attempt_rollback(obj_name, obj_version, uuid_str)
+                rollback_ok = self._attempt_rollback(obj_name, obj_version, uuid_str, blob_manifest)
                 return OpResult.failed(
                     obj_name,
                     obj_version,
@@ -925,8 +1097,15 @@ class S3RegistryBackend(RegistryBackend):
                 remote_key = self._object_key_with_uuid(obj_name, obj_version, uuid_str)
 
                 files_manifest = obj_metadata.get("_files")
+                blob_manifest = obj_metadata.get("_blobs")
 
-                if files_manifest:
+                if blob_manifest is not None:
+                    for relative_path, digest in blob_manifest.items():
+                        dest_file = dest_path / relative_path
+                        dest_file.parent.mkdir(parents=True, exist_ok=True)
+                        all_files_to_download.append((self._blob_key(digest), str(dest_file)))
+                        file_to_object[str(dest_file)] = (obj_name, obj_version)
+                elif files_manifest:
                     for relative_path in files_manifest:
                         remote_path = f"{remote_key}/{relative_path}".replace("\\", "/")
                         dest_file = dest_path / relative_path
@@ -1034,10 +1213,12 @@ class S3RegistryBackend(RegistryBackend):
                     RuntimeError(f"Failed to delete metadata: {meta_result.error_message}"),
                 )
 
-            # Step 4: Best-effort UUID folder cleanup.
+            # Step 4: Best-effort UUID folder (or blob reference) cleanup.
             # If cleanup fails, keep the plan for janitor.
             files_manifest = metadata.get("_files")
-            cleanup_ok = self._delete_uuid_folder(obj_name, obj_version, uuid_str, files_manifest)
+            cleanup_ok = self._delete_version_storage(
+                obj_name, obj_version, uuid_str, files_manifest, metadata.get("_blobs")
+            )
             if cleanup_ok:
                 self._delete_commit_plan(obj_name, obj_version, uuid_str)
 
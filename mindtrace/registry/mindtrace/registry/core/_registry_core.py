@@ -2,11 +2,23 @@ import os
 import shutil
 import threading
 import time
+from contextlib import contextmanager
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import Any, Dict, List, Tuple, Type
-
-from mindtrace.core import Mindtrace, compute_dir_hash, first_not_none, ifnone, instantiate_target
+from typing import Any, Dict, Iterator, List, Tuple, Type
+
+from mindtrace.core import (
+    HASH_ALGORITHMS,
+    FileDigestCache,
+    Mindtrace,
+    compute_dir_hash,
+    compute_file_manifest,
+    first_not_none,
+    hash_algorithm_of,
+    ifnone,
+    instantiate_target,
+    merkle_root,
+)
 from mindtrace.registry.backends.local_registry_backend import LocalRegistryBackend
 from mindtrace.registry.backends.registry_backend import RegistryBackend
 from mindtrace.registry.core.base_materializer import Materializer
@@ -74,6 +86,9 @@ class _RegistryCore(Mindtrace):
     _default_materializers = {}
     _materializer_lock = threading.Lock()
 
+    # Process-wide digest cache shared by all registries, so verified loads skip files that have not changed
+    _digest_cache = FileDigestCache()
+
     def __init__(
         self,
         backend: str | Path | RegistryBackend | None = None,
@@ -81,6 +96,8 @@ class _RegistryCore(Mindtrace):
         mutable: bool | None = None,
         version_digits: int | None = None,
         versions_cache_ttl: float = 60.0,
+        hash_algorithm: str = "sha256",
+        hash_workers: int | None = None,
         **kwargs,
     ):
         """Initialize the registry core.
@@ -95,10 +112,19 @@ class _RegistryCore(Mindtrace):
                 If explicitly set, must match the stored setting (if any) or a ValueError is raised.
                 Object level concurrency is handled via lock-free MVCC for both mutable and immutable registries.
             versions_cache_ttl: Time-to-live in seconds for the versions cache. Default is 60.0 seconds.
+            hash_algorithm: Algorithm used to hash saved artifacts, one of ``HASH_ALGORITHMS``. ``"blake2b"`` and
+                ``"xxh3_128"`` are faster integrity checks; ``"xxh3_128"`` requires the optional ``xxhash`` package.
+                Loads verify with whichever algorithm the artifact was saved with.
+            hash_workers: Number of threads used to hash artifact files. Defaults to ``min(8, os.cpu_count())``.
             **kwargs: Additional arguments to pass to the backend.
         """
         super().__init__(**kwargs)
 
+        if hash_algorithm not in HASH_ALGORITHMS:
+            raise ValueError(f"hash_algorithm must be one of {HASH_ALGORITHMS}, got '{hash_algorithm}'")
+        self.hash_algorithm = hash_algorithm
+        self._hash_workers = hash_workers
+
         if backend is None:
             registry_dir = Path(self.config["MINDTRACE_DIR_PATHS"]["REGISTRY_DIR"]).expanduser().resolve()
             backend = LocalRegistryBackend(uri=registry_dir, **kwargs)
@@ -327,6 +353,53 @@ class _RegistryCore(Mindtrace):
                 files.append(str(rel_path))
         return sorted(files)
 
+    def _hash_artifact(self, local_path: str | Path) -> Tuple[str, Dict[str, str]]:
+        """Hash a materialized artifact directory.
+
+        Args:
+            local_path: Path to the artifact directory.
+
+        Returns:
+            Tuple of (Merkle root hash, manifest mapping relative file paths to digests).
+        """
+        digests = compute_file_manifest(local_path, self.hash_algorithm, max_workers=self._hash_workers)
+        return merkle_root(digests, self.hash_algorithm), digests
+
+    def _verify_artifact(self, local_path: Path, metadata: dict, name: str, version: str) -> None:
+        """Verify a pulled artifact directory against the hash stored in its metadata.
+
+        Artifacts saved with a per-file manifest are re-hashed in parallel, skipping files whose digest is already
+        cached. Artifacts saved before manifests existed are verified with ``compute_dir_hash``.
+
+        Raises:
+            ValueError: If the computed hash does not match the stored hash.
+        """
+        expected_hash = metadata.get("hash")
+        if not expected_hash:
+            self.logger.warning(f"No hash found in metadata for {name}@{version}. Skipping hash verification.")
+            return
+
+        algorithm = hash_algorithm_of(expected_hash)
+        if algorithm is None:
+            computed_hash = compute_dir_hash(str(local_path))
+            mismatched = []
+        else:
+            digests = compute_file_manifest(
+                local_path, algorithm, max_workers=self._hash_workers, cache=self._digest_cache
+            )
+            computed_hash = merkle_root(digests, algorithm)
+            expected_digests = metadata.get("_digests") or {}
+            mismatched = sorted(
+                path for path in set(digests) | set(expected_digests) if digests.get(path) != expected_digests.get(path)
+            )
+
+        if computed_hash != expected_hash:
+            detail = f" Mismatched files: {', '.join(mismatched)}." if mismatched else ""
+            raise ValueError(
+                f"Artifact hash verification failed for {name}@{version}. "
+                f"Expected hash: {expected_hash}, computed hash: {computed_hash}.{detail}"
+            )
+
     def _resolve_save_version(self, name: str, version: str | None) -> str:
         """Resolve a concrete version string for a write path."""
         if not self.version_objects:
@@ -358,6 +431,7 @@ class _RegistryCore(Mindtrace):
         init_params: Dict[str, Any] | List[Dict[str, Any]] | None = None,
         metadata: Dict[str, Any] | List[Dict[str, Any]] | None = None,
         on_conflict: str | None = None,
+        source_hash: str | None | List[str | None] = None,
     ) -> str | None | BatchResult:
         """Save object(s) to the registry.
 
@@ -375,6 +449,8 @@ class _RegistryCore(Mindtrace):
                 "skip": Don't overwrite existing versions. Single items raise
                     RegistryVersionConflict, batch items return skipped results.
                 "overwrite": Replace existing versions (only allowed if mutable=True).
+            source_hash: Hash of the artifact this object was loaded from, stored as ``source_hash`` so a copy (e.g.
+                the registry cache) can be compared with its source even when the two were hashed differently.
 
         Returns:
             Single item: Resolved version string (raises on conflict).
@@ -403,8 +479,8 @@ class _RegistryCore(Mindtrace):
             )
 
         if isinstance(name, list):
-            return self._save_batch(name, obj, materializer, version, init_params, metadata, on_conflict)
-        return self._save_single(name, obj, materializer, version, init_params, metadata, on_conflict)
+            return self._save_batch(name, obj, materializer, version, init_params, metadata, on_conflict, source_hash)
+        return self._save_single(name, obj, materializer, version, init_params, metadata, on_conflict, source_hash)
 
     def _save_single(
         self,
@@ -415,6 +491,7 @@ class _RegistryCore(Mindtrace):
         init_params: Dict[str, Any] | None = None,
         metadata: Dict[str, Any] | None = None,
         on_conflict: str = OnConflict.SKIP,
+        source_hash: str | None = None,
     ) -> str | None:
         """Save a single object to the registry. Raises on conflict."""
         # In non-versioned mode, always use "1"
@@ -437,15 +514,19 @@ class _RegistryCore(Mindtrace):
 
             mat_instance = instantiate_target(materializer_class, uri=str(temp_dir))
             mat_instance.save(obj)
+            artifact_hash, digests = self._hash_artifact(temp_dir)
 
             push_metadata = {
                 "class": object_class,
                 "materializer": materializer_class,
                 "init_params": ifnone(init_params, default={}),
                 "metadata": ifnone(metadata, default={}),
-                "hash": compute_dir_hash(str(temp_dir)),
+                "hash": artifact_hash,
                 "_files": self._build_file_manifest(temp_dir),
+                "_digests": digests,
             }
+            if source_hash:
+                push_metadata["source_hash"] = source_hash
 
             push_result = self.backend.push(
                 [name],
@@ -483,6 +564,7 @@ class _RegistryCore(Mindtrace):
         init_params: Dict[str, Any] | List[Dict[str, Any]] | None = None,
         metadata: Dict[str, Any] | List[Dict[str, Any]] | None = None,
         on_conflict: str = OnConflict.SKIP,
+        source_hash: str | None | List[str | None] = None,
     ) -> BatchResult:
         """Save multiple objects to the registry. Returns BatchResult with skipped items on conflict."""
         # Normalize inputs to lists
@@ -494,8 +576,16 @@ class _RegistryCore(Mindtrace):
         )
         init_params_list = init_params if isinstance(init_params, list) else [None] * len(names)
         metadata_list = metadata if isinstance(metadata, list) else [None] * len(names)
-
-        if not (len(names) == len(objs_list) == len(versions_list) == len(init_params_list) == len(metadata_list)):
+        source_hash_list = source_hash if isinstance(source_hash, list) else [source_hash] * len(names)
+
+        if not (
+            len(names)
+            == len(objs_list)
+            == len(versions_list)
+            == len(init_params_list)
+            == len(metadata_list)
+            == len(source_hash_list)
+        ):
             raise ValueError("All list inputs must have the same length")
 
         result = BatchResult()
@@ -505,8 +595,8 @@ class _RegistryCore(Mindtrace):
             # Prepare items for batch push
             push_items: List[Tuple[str, str | None, Path, dict]] = []
 
-            for idx, (name, obj, version, obj_init_params, obj_metadata) in enumerate(
-                zip(names, objs_list, versions_list, init_params_list, metadata_list)
+            for idx, (name, obj, version, obj_init_params, obj_metadata, obj_source_hash) in enumerate(
+                zip(names, objs_list, versions_list, init_params_list, metadata_list, source_hash_list)
             ):
                 try:
                     # Resolve version: None -> auto-increment, else validate
@@ -522,15 +612,19 @@ class _RegistryCore(Mindtrace):
                     materializer_class = self._find_materializer(obj, materializer)
                     mat_instance = instantiate_target(materializer_class, uri=str(temp_dir))
                     mat_instance.save(obj)
+                    artifact_hash, digests = self._hash_artifact(temp_dir)
 
                     push_metadata = {
                         "class": f"{type(obj).__module__}.{type(obj).__name__}",
                         "materializer": materializer_class,
                         "init_params": ifnone(obj_init_params, default={}),
                         "metadata": ifnone(obj_metadata, default={}),
-                        "hash": compute_dir_hash(str(temp_dir)),
+                        "hash": artifact_hash,
                         "_files": self._build_file_manifest(temp_dir),
+                        "_digests": digests,
                     }
+                    if obj_source_hash:
+                        push_metadata["source_hash"] = obj_source_hash
                     push_items.append((name, resolved_version, temp_dir, push_metadata))
                 except Exception as e:
                     prep_errors[(name, version or VERSION_PENDING)] = {"error": type(e).__name__, "message": str(e)}
@@ -612,6 +706,43 @@ class _RegistryCore(Mindtrace):
 
         return materializer.load(data_type=object_class, **init_params)
 
+    def _direct_artifact_path(self, name: str, version: str) -> Path | None:
+        """Return the stored directory to materialize ``name@version`` from in place, if the backend exposes one.
+
+        Only immutable registries read in place: a mutable version could be overwritten while it is being read.
+        """
+        if self.mutable:
+            return None
+        path = self.backend.local_artifact_path(name, version)
+        return path if isinstance(path, Path) else None
+
+    @staticmethod
+    def _place_path_output(obj: Path, output_dir: str, name: str, version: str, copy: bool = False) -> Path:
+        """Move (or copy) a materialized Path object into ``output_dir/name@version``.
+
+        Args:
+            obj: Path returned by the materializer.
+            output_dir: Directory to place the object under.
+            name: Object name.
+            version: Object version.
+            copy: Copy instead of moving, used when ``obj`` lives in the registry's own storage.
+
+        Returns:
+            The new location of the object.
+        """
+        output_path = Path(output_dir, f"{name}@{version}")
+        output_path.mkdir(parents=True, exist_ok=True)
+        is_file = obj.is_file()
+        items = [obj] if is_file else list(obj.iterdir())
+        for item in items:
+            if not copy:
+                shutil.move(str(item), str(output_path / item.name))
+            elif item.is_dir():
+                shutil.copytree(item, output_path / item.name, dirs_exist_ok=True)
+            else:
+                shutil.copy2(item, output_path / item.name)
+        return output_path / obj.name if is_file else output_path
+
     def serialization_hints_for_object(
         self,
         obj: Any,
@@ -682,6 +813,53 @@ class _RegistryCore(Mindtrace):
             return self._load_batch(name, version, output_dir, verify, **kwargs)
         return self._load_single(name, version, output_dir, verify, **kwargs)
 
+    @contextmanager
+    def open_artifact(
+        self, name: str, version: str | None = "latest", verify: str = VerifyLevel.NONE
+    ) -> Iterator[Tuple[Path, Dict[str, Any]]]:
+        """Expose the stored files of an object version as a local directory, without materializing the object.
+
+        Lets callers stream large artifacts (e.g. a bytes payload's ``data.txt``) from disk instead of loading them
+        into memory. Immutable registries yield the stored directory in place; otherwise the version is pulled into a
+        temporary directory that is removed on exit. The directory must be treated as read-only.
+
+        Args:
+            name: Object name.
+            version: Version to open. Defaults to "latest".
+            verify: Verification level. Defaults to "none": the caller streams the files, and hashing them first would
+                read the artifact twice; verify what you read instead (e.g. with ``PayloadStream`` checksums). Anything
+                other than "none" hashes the files against the stored hash before yielding.
+
+        Yields:
+            Tuple of (artifact directory, object metadata).
+
+        Raises:
+            RegistryObjectNotFound: If the object version does not exist.
+            ValueError: If hash verification fails.
+        """
+        v = self._resolve_load_version(name, version)
+        result = self.backend.fetch_metadata([name], [v]).first()
+        if not result or not result.ok:
+            raise RegistryObjectNotFound(f"Object {name}@{v} not found.")
+        metadata = result.metadata
+
+        with TemporaryDirectory(dir=self._artifact_store_path) as base_temp_dir:
+            artifact_dir = self._direct_artifact_path(name, v)
+            if artifact_dir is None:
+                artifact_dir = Path(base_temp_dir) / f"{name}_{v}".replace(":", "_")
+                artifact_dir.mkdir(parents=True, exist_ok=True)
+                pull_result = self.backend.pull(
+                    [name], [v], [artifact_dir], acquire_lock=self.mutable, metadata=[metadata]
+                ).first()
+                if pull_result and pull_result.is_error:
+                    if pull_result.exception:
+                        raise pull_result.exception
+                    raise RuntimeError(f"Failed to pull {name}@{v}: {pull_result.message}")
+
+            if verify != VerifyLevel.NONE:
+                self._verify_artifact(artifact_dir, metadata, name, v)
+            yield artifact_dir, metadata
+
     def _load_single(
         self,
         name: str,
@@ -700,44 +878,36 @@ class _RegistryCore(Mindtrace):
             raise RegistryObjectNotFound(f"Object {name}@{v} not found.")
         metadata = result.metadata
 
+        # Immutable registries may materialize straight from a local stored copy; otherwise pull first
+        direct_path = self._direct_artifact_path(name, v)
+
         # Pull and materialize
         with TemporaryDirectory(dir=self._artifact_store_path) as base_temp_dir:
-            temp_dir = Path(base_temp_dir) / f"{name}_{v}".replace(":", "_")
-            temp_dir.mkdir(parents=True, exist_ok=True)
+            if direct_path is not None:
+                temp_dir = direct_path
+            else:
+                temp_dir = Path(base_temp_dir) / f"{name}_{v}".replace(":", "_")
+                temp_dir.mkdir(parents=True, exist_ok=True)
 
-            pull_results = self.backend.pull([name], [v], [temp_dir], acquire_lock=self.mutable, metadata=[metadata])
-            pull_result = pull_results.first()
-            if pull_result and pull_result.is_error:
-                if pull_result.exception:
-                    raise pull_result.exception
-                raise RuntimeError(f"Failed to pull {name}@{v}: {pull_result.message}")
+                pull_results = self.backend.pull(
+                    [name], [v], [temp_dir], acquire_lock=self.mutable, metadata=[metadata]
+                )
+                pull_result = pull_results.first()
+                if pull_result and pull_result.is_error:
+                    if pull_result.exception:
+                        raise pull_result.exception
+                    raise RuntimeError(f"Failed to pull {name}@{v}: {pull_result.message}")
 
             # Hash verification (INTEGRITY or FULL level)
             if verify != VerifyLevel.NONE:
-                expected_hash = metadata.get("hash")
-                if expected_hash:
-                    computed_hash = compute_dir_hash(str(temp_dir))
-                    if computed_hash != expected_hash:
-                        raise ValueError(
-                            f"Artifact hash verification failed for {name}@{v}. "
-                            f"Expected hash: {expected_hash}, computed hash: {computed_hash}"
-                        )
-                else:
-                    self.logger.warning(f"No hash found in metadata for {name}@{v}. Skipping hash verification.")
+                self._verify_artifact(temp_dir, metadata, name, v)
 
             obj = self._materialize(temp_dir, metadata, **kwargs)
 
-            # Move Path objects to output_dir if specified
+            # Move Path objects to output_dir if specified (copy them out of directly-read storage)
             if isinstance(obj, Path) and output_dir and obj.exists():
-                output_path = Path(output_dir, f"{name}@{v}")
-                output_path.mkdir(parents=True, exist_ok=True)
-                if obj.is_file():
-                    shutil.move(str(obj), str(output_path / obj.name))
-                    obj = output_path / obj.name
-                else:
-                    for item in obj.iterdir():
-                        shutil.move(str(item), str(output_path / item.name))
-                    obj = output_path
+                in_storage = direct_path is not None and obj.resolve().is_relative_to(direct_path)
+                obj = self._place_path_output(obj, output_dir, name, v, copy=in_storage)
 
             return obj
 
@@ -786,10 +956,16 @@ class _RegistryCore(Mindtrace):
                 if (n, v) not in fetch_results:
                     result.errors[(n, v)] = {"error": "RegistryObjectNotFound", "message": f"Object {n}@{v} not found."}
 
-        # Pull artifacts in batch
-        items_to_pull = [item for item in valid_items if item not in result.errors]
+        # Pull artifacts in batch (immutable registries read locally stored copies in place)
+        items_to_load = [item for item in valid_items if item not in result.errors]
+        direct_dirs: Dict[tuple[str, str], Path] = {}
+        for n, v in items_to_load:
+            direct_path = self._direct_artifact_path(n, v)
+            if direct_path is not None:
+                direct_dirs[(n, v)] = direct_path
+        items_to_pull = [item for item in items_to_load if item not in direct_dirs]
         with TemporaryDirectory(dir=self._artifact_store_path) as base_temp_dir:
-            temp_dirs = {}
+            temp_dirs = dict(direct_dirs)
             paths = []
             for n, v in items_to_pull:
                 temp_dir = Path(base_temp_dir) / f"{n}_{v}".replace(":", "_")
@@ -833,30 +1009,14 @@ class _RegistryCore(Mindtrace):
 
                     # Hash verification (INTEGRITY or FULL level)
                     if verify != VerifyLevel.NONE:
-                        expected_hash = metadata.get("hash")
-                        if expected_hash:
-                            computed_hash = compute_dir_hash(str(temp_dir))
-                            if computed_hash != expected_hash:
-                                raise ValueError(
-                                    f"Artifact hash verification failed for {n}@{v}. "
-                                    f"Expected: {expected_hash}, computed: {computed_hash}"
-                                )
-                        else:
-                            self.logger.warning(f"No hash found in metadata for {n}@{v}. Skipping hash verification.")
+                        self._verify_artifact(temp_dir, metadata, n, v)
 
                     obj = self._materialize(temp_dir, metadata, **kwargs)
 
-                    # Move Path objects to output_dir if specified
+                    # Move Path objects to output_dir if specified (copy them out of directly-read storage)
                     if isinstance(obj, Path) and output_dir and obj.exists():
-                        output_path = Path(output_dir, f"{n}@{v}")
-                        output_path.mkdir(parents=True, exist_ok=True)
-                        if obj.is_file():
-                            shutil.move(str(obj), str(output_path / obj.name))
-                            obj = output_path / obj.name
-                        else:
-                            for item in obj.iterdir():
-                                shutil.move(str(item), str(output_path / item.name))
-                            obj = output_path
+                        in_storage = (n, v) in direct_dirs and obj.resolve().is_relative_to(temp_dir)
+                        obj = self._place_path_output(obj, output_dir, n, v, copy=in_storage)
 
                     result.results.append(obj)
                     result.succeeded.append((n, v))
@@ -1152,6 +1312,12 @@ class _RegistryCore(Mindtrace):
         """
         return self.backend.list_objects()
 
+    def _has_cached_versions(self, object_name: str) -> bool:
+        """Return True if an unexpired version list for ``object_name`` is cached."""
+        with self._versions_cache_lock:
+            entry = self._versions_cache.get(object_name)
+            return entry is not None and time.time() - entry[1] < self._versions_cache_ttl
+
     def list_versions(self, object_name: str) -> List[str]:
         """List all registered versions for an object.
 
@@ -1446,6 +1612,20 @@ class _RegistryCore(Mindtrace):
         Returns:
             Most recent version string, or None if no versions exist
         """
+        # Indexed backends (``LocalRegistryBackend(index=True)``) answer with one lookup instead of listing every
+        # version. Listing is still used when the version list is already cached, or when the answer is not a version
+        # this registry can parse, so the ``version_digits`` ordering applies.
+        if getattr(self.backend, "indexed", False) is True and not self._has_cached_versions(name):
+            latest = self.backend.latest_version(name)
+            if latest is None:
+                return None
+            if isinstance(latest, str) and not latest.startswith("__temp__"):
+                try:
+                    Version(latest, digits=self.version_digits)
+                    return latest
+                except ValueError:
+                    pass
+
         versions = self.list_versions(name)
         if not versions:
             return None
@@ -6,11 +6,9 @@ and transparently adds local caching when a remote backend is used.
 """
 
 import hashlib
-import os
 import threading
-import time
 from pathlib import Path
-from typing import Any, Dict, List, Type, overload
+from typing import Any, ContextManager, Dict, List, Tuple, Type, overload
 
 from mindtrace.core import Mindtrace
 from mindtrace.registry.backends.local_registry_backend import LocalRegistryBackend
@@ -98,6 +96,8 @@ class Registry(Mindtrace):
         use_cache: bool = True,
         cache_max_entries: int | None = 1024,
         cache_prune_buffer: int | None = None,
+        hash_algorithm: str = "sha256",
+        hash_workers: int | None = None,
         **kwargs,
     ):
         """Initialize the registry.
@@ -120,6 +120,11 @@ class Registry(Mindtrace):
             cache_prune_buffer: Number of entries below ``cache_max_entries`` to
                 prune back to when the cache exceeds its maximum. Defaults to
                 ``min(max(cache_max_entries // 4, 1), 1024)``.
+            hash_algorithm: Algorithm used to hash saved artifacts for integrity
+                verification: ``"sha256"`` (default), ``"blake2b"``, or the fast
+                non-cryptographic ``"xxh3_128"`` (requires the ``xxhash`` package).
+                The local cache uses the same algorithm so staleness checks agree.
+            hash_workers: Number of threads used to hash artifact files.
             **kwargs: Additional arguments forwarded to the backend.
         """
         super().__init__(**kwargs)
@@ -149,15 +154,19 @@ class Registry(Mindtrace):
                 mutable=mutable,
                 version_digits=version_digits,
                 versions_cache_ttl=versions_cache_ttl,
+                hash_algorithm=hash_algorithm,
+                hash_workers=hash_workers,
                 **kwargs,
             )
             cache_dir = self._get_cache_dir(self._remote.backend.uri)
             self._cache: _RegistryCore = _RegistryCore(
-                backend=LocalRegistryBackend(uri=cache_dir),
+                backend=LocalRegistryBackend(uri=cache_dir, index=True),
                 version_objects=self._remote.version_objects,
                 mutable=True,  # cache is always mutable for updates
                 version_digits=self._remote.version_digits,
                 versions_cache_ttl=versions_cache_ttl,
+                hash_algorithm=hash_algorithm,
+                hash_workers=hash_workers,
                 **kwargs,
             )
             self._core = self._remote
@@ -170,6 +179,8 @@ class Registry(Mindtrace):
                 mutable=mutable,
                 version_digits=version_digits,
                 versions_cache_ttl=versions_cache_ttl,
+                hash_algorithm=hash_algorithm,
+                hash_workers=hash_workers,
                 **kwargs,
             )
             self._remote = None  # type: ignore
@@ -319,15 +330,10 @@ class Registry(Mindtrace):
             except Exception:
                 cache_meta = None
 
-            remote_hash = remote_meta.metadata.get("hash") if remote_meta and remote_meta.ok else None
-            cache_hash = cache_meta.metadata.get("hash") if cache_meta and cache_meta.ok else None
-
-            if not remote_hash:
-                return True
-            if not cache_hash:
-                return True
-
-            return remote_hash != cache_hash
+            return not _cache_matches_remote(
+                remote_meta.metadata if remote_meta and remote_meta.ok else None,
+                cache_meta.metadata if cache_meta and cache_meta.ok else None,
+            )
         except Exception as e:
             self.logger.debug(f"Error checking cache staleness for {name}@{version}: {e}")
             return True
@@ -348,17 +354,28 @@ class Registry(Mindtrace):
             remote_meta = remote_results.get((n, v))
             cache_meta = cache_results.get((n, v))
 
-            remote_hash = remote_meta.metadata.get("hash") if remote_meta and remote_meta.ok else None
-            cache_hash = cache_meta.metadata.get("hash") if cache_meta and cache_meta.ok else None
-
             # If we can't verify either side, treat cache as stale (consistent with _is_cache_stale).
-            if not remote_hash or not cache_hash:
-                stale.add(i)
-            elif remote_hash != cache_hash:
+            if not _cache_matches_remote(
+                remote_meta.metadata if remote_meta and remote_meta.ok else None,
+                cache_meta.metadata if cache_meta and cache_meta.ok else None,
+            ):
                 stale.add(i)
 
         return stale
 
+    def _remote_hashes(self, names: List[str], versions: List[str]) -> List[str | None]:
+        """Return the remote ``hash`` of each item, or None where its metadata cannot be read."""
+        try:
+            results = self._remote.backend.fetch_metadata(names, versions)
+        except Exception:
+            return [None] * len(names)
+        hashes = []
+        for key in zip(names, versions):
+            meta = results.get(key)
+            remote_hash = meta.metadata.get("hash") if meta and meta.ok else None
+            hashes.append(remote_hash if isinstance(remote_hash, str) else None)
+        return hashes
+
     def clear_cache(self) -> None:
         """Clear the local cache. No-op if caching is not enabled."""
         if self._cached:
@@ -368,33 +385,25 @@ class Registry(Mindtrace):
             self.logger.debug("Cleared local cache.")
 
     def _list_cache_lru_entries(self) -> List[dict[str, Any]]:
-        """Return live cached object versions with metadata-mtime recency."""
+        """Return live cached object versions with their last-access time, least recently used first."""
         entries: List[dict[str, Any]] = []
         if not self._cached:
             return entries
 
         try:
-            for name in self._cache.list_objects():
-                for version in self._cache.list_versions(name):
-                    last_accessed = time.time()
-                    try:
-                        metadata_path = self._cache.backend._object_metadata_path(name, version)
-                        last_accessed = metadata_path.stat().st_mtime
-                    except Exception:
-                        pass
-                    entries.append({"name": name, "version": version, "last_accessed": last_accessed})
+            for name, version, last_accessed in self._cache.backend.lru_entries():
+                entries.append({"name": name, "version": version, "last_accessed": last_accessed})
         except Exception as e:
             self.logger.debug(f"Could not list cache LRU entries: {e}")
         return entries
 
     def _touch_cache_entry(self, name: str, version: str) -> None:
-        """Mark a concrete cached object version as recently used via metadata mtime."""
+        """Mark a concrete cached object version as recently used."""
         if not self._cached or self._cache_max_entries is None:
             return
 
         try:
-            metadata_path = self._cache.backend._object_metadata_path(name, version)
-            os.utime(metadata_path, None)
+            self._cache.backend.touch(name, version)
         except Exception as e:
             self.logger.debug(f"Could not touch cache metadata for {name}@{version}: {e}")
 
@@ -596,6 +605,15 @@ class Registry(Mindtrace):
             **kwargs,
         )
 
+    def open_artifact(
+        self, name: str, version: str | None = "latest", verify: str = VerifyLevel.NONE
+    ) -> ContextManager[Tuple[Path, Dict[str, Any]]]:
+        """Open the stored files of ``name@version`` as a local directory without materializing the object.
+
+        See :meth:`_RegistryCore.open_artifact`. Reads go to the backing registry, bypassing the local cache.
+        """
+        return self._core.open_artifact(name, version=version, verify=verify)
+
     def create_direct_upload_target(
         self,
         upload_id: str,
@@ -763,7 +781,13 @@ class Registry(Mindtrace):
             try:
                 cache_entries = [(name, cache_v)]
                 new_cache_entries = self._count_new_cache_entries(cache_entries)
-                self._cache.save(name, obj, version=cache_v, on_conflict=OnConflict.OVERWRITE)
+                self._cache.save(
+                    name,
+                    obj,
+                    version=cache_v,
+                    on_conflict=OnConflict.OVERWRITE,
+                    source_hash=self._remote_hashes([name], [cache_v])[0],
+                )
                 self._touch_cache_entry(name, cache_v)
                 self._note_cache_entries_added(new_cache_entries)
                 self._maybe_prune_cache_lru()
@@ -855,6 +879,7 @@ class Registry(Mindtrace):
                         [t[2] for t in to_cache],
                         version=[t[1] for t in to_cache],
                         on_conflict=OnConflict.OVERWRITE,
+                        source_hash=self._remote_hashes([t[0] for t in to_cache], [t[1] for t in to_cache]),
                     )
                     for cache_name, cache_version, _ in to_cache:
                         self._touch_cache_entry(cache_name, cache_version)
@@ -1091,3 +1116,16 @@ class Registry(Mindtrace):
         if name in ("_core", "_remote", "_cache", "_cached"):
             raise AttributeError(name)
         return getattr(self._core, name)
+
+
+def _cache_matches_remote(remote_metadata: dict | None, cache_metadata: dict | None) -> bool:
+    """Return True if a cached copy was made from the current remote artifact.
+
+    The cache re-saves objects, so its own ``hash`` can use a different format than the remote's (e.g. a legacy
+    ``compute_dir_hash`` value on the remote). Copies made from a remote load record the remote hash as
+    ``source_hash``; that is compared when present, the cache's ``hash`` otherwise. Missing hashes never match.
+    """
+    remote_hash = (remote_metadata or {}).get("hash")
+    cache_metadata = cache_metadata or {}
+    cache_hash = cache_metadata.get("source_hash") or cache_metadata.get("hash")
+    return bool(remote_hash) and bool(cache_hash) and remote_hash == cache_hash
@@ -8,7 +8,7 @@ from collections.abc import Mapping
 from dataclasses import dataclass
 from pathlib import Path
 from tempfile import mkdtemp
-from typing import Any, Dict, List, Type
+from typing import Any, ContextManager, Dict, List, Tuple, Type
 
 from mindtrace.core import Mindtrace
 from mindtrace.registry.backends.local_registry_backend import LocalRegistryBackend
@@ -427,6 +427,16 @@ class Store(Mindtrace):
             **kwargs,
         )
 
+    def open_artifact(
+        self, key: str, version: str | None = "latest", verify: str = VerifyLevel.NONE
+    ) -> ContextManager[Tuple[Path, Dict[str, Any]]]:
+        """Open the stored files of an object as a local directory; see :meth:`Registry.open_artifact`."""
+        mount, name, key_version = self.parse_key(key)
+        resolved_version = version if version not in (None, "latest") else (key_version or version)
+        if mount is None:
+            mount = self._resolve_load_location(name, resolved_version)
+        return self.get_mount(mount).registry.open_artifact(name, version=resolved_version, verify=verify)
+
     def load(
         self,
         name: str | List[str],
@@ -14,6 +14,7 @@ def register_benchmark_suites(*, runner: TestRunner | None = None, replace: bool
 
     target = runner or TestRunner.default()
 
+    from mindtrace.registry.testing.suites.local_pull import RegistryLocalPullModesSuite
     from mindtrace.registry.testing.suites.mixed_rw import RegistryMixedRwSuite
     from mindtrace.registry.testing.suites.read_ceiling import RegistryReadCeilingSuite
     from mindtrace.registry.testing.suites.smoke import RegistrySmokeSuite
@@ -26,6 +27,7 @@ def register_benchmark_suites(*, runner: TestRunner | None = None, replace: bool
         RegistryReadCeilingSuite,
         RegistryMixedRwSuite,
         RegistryVersionChurnSuite,
+        RegistryLocalPullModesSuite,
     ):
         if replace or cls.suite_id not in target.registered_suites():
             target.register_test_suite(cls, replace=replace)
@@ -0,0 +1,137 @@
+"""Local registry load latency across ``LocalRegistryBackend`` pull modes."""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from shutil import rmtree
+from tempfile import mkdtemp
+from types import MappingProxyType
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+from mindtrace.core import (
+    BenchReporter,
+    BenchResult,
+    BenchResultSchema,
+    BenchSuiteConfig,
+    BenchTestSuite,
+    TaskSchema,
+    utc_now_iso,
+)
+from mindtrace.core.testing.workloads import deterministic_payload, parse_size_bytes
+from mindtrace.registry import LocalRegistryBackend, Registry
+from mindtrace.registry.backends.local_registry_backend import PULL_MODES
+
+PullMode = Literal["copy", "reflink", "link", "direct"]
+
+
+class RegistryLocalPullModesInput(BaseModel):
+    artifact_size: str = Field("64MiB", description="Generated artifact size, e.g. '16MiB' or '1GiB'.")
+    pull_modes: list[PullMode] = Field(
+        default_factory=lambda: list(PULL_MODES),
+        description="LocalRegistryBackend pull modes to compare.",
+    )
+    iterations: int = Field(20, ge=1, description="Loads per pull mode.")
+    verify: bool = Field(True, description="Compare each loaded payload against the saved payload.")
+
+
+class RegistryLocalPullModesResources(BaseModel):
+    """Uses only temporary local directories."""
+
+
+class RegistryLocalPullModesSuite(BenchTestSuite):
+    suite_id = "registry.stress.local_pull_modes"
+    title = "Registry stress — local pull modes"
+    description = (
+        "Saves one generated artifact per pull mode into an immutable local registry, then measures "
+        "``Registry.load`` latency for copy, reflink, hardlink and direct-path materialization."
+    )
+    tags = frozenset({"stress", "registry"})
+    requires = ("local_disk",)
+    safety = "Writes only to temporary directories that are removed afterwards."
+    task_schema = TaskSchema(
+        name=suite_id,
+        input_schema=RegistryLocalPullModesInput,
+        output_schema=BenchResultSchema,
+    )
+    resource_schema = RegistryLocalPullModesResources
+    profiles = MappingProxyType(
+        {
+            "smoke": {"duration_seconds": 30.0, "artifact_size": "1MiB", "iterations": 3},
+            "stress": {"duration_seconds": 300.0, "artifact_size": "64MiB", "iterations": 20},
+            "stress_1g": {"duration_seconds": 1800.0, "artifact_size": "1GiB", "iterations": 5},
+        },
+    )
+
+    def execute_bench(self, config: BenchSuiteConfig, reporter: BenchReporter) -> BenchResult:
+        started = utc_now_iso()
+        monotonic_start = time.perf_counter()
+        artifact_size = parse_size_bytes(config.parameters.get("artifact_size"), default=64 * 1024 * 1024)
+        pull_modes = [str(mode).lower() for mode in config.parameters.get("pull_modes") or PULL_MODES]
+        iterations = int(config.parameters.get("iterations", 20))
+        verify = bool(config.parameters.get("verify", True))
+        payload = deterministic_payload(artifact_size)
+        deadline = reporter.deadline(config.duration_seconds)
+
+        mode_metrics: dict[str, object] = {}
+        completed = True
+        for mode in pull_modes:
+            registry_path = Path(mkdtemp(prefix=f"mindtrace-registry-pull-{mode}-"))
+            latencies: list[float] = []
+            try:
+                registry = Registry(
+                    backend=LocalRegistryBackend(uri=registry_path, pull_mode=mode),
+                    version_objects=True,
+                )
+                registry.save("bench:artifact", payload, version="1.0.0")
+                while len(latencies) < iterations and time.perf_counter() < deadline and not reporter.is_cancelled():
+                    op_start = time.perf_counter()
+                    try:
+                        loaded = registry.load("bench:artifact", version="1.0.0")
+                        latency = time.perf_counter() - op_start
+                        if verify and loaded != payload:
+                            raise ValueError("payload mismatch")
+                    except Exception as exc:  # noqa: BLE001 - benchmark records backend failures
+                        reporter.record_operation(
+                            success=False, latency_seconds=time.perf_counter() - op_start, error=exc
+                        )
+                        break
+                    reporter.record_operation(success=True, latency_seconds=latency, bytes_processed=artifact_size)
+                    latencies.append(latency)
+            except Exception as exc:  # noqa: BLE001 - e.g. setup failure for an unsupported mode
+                reporter.record_operation(success=False, latency_seconds=0.0, error=exc)
+            finally:
+                if not config.keep_resources:
+                    rmtree(registry_path, ignore_errors=True)
+
+            completed = completed and len(latencies) == iterations
+            mean = sum(latencies) / len(latencies) if latencies else 0.0
+            mode_metrics[f"{mode}_loads"] = len(latencies)
+            mode_metrics[f"{mode}_mean_load_seconds"] = mean
+            mode_metrics[f"{mode}_min_load_seconds"] = min(latencies, default=0.0)
+            mode_metrics[f"{mode}_mb_per_second"] = artifact_size / mean / 1e6 if mean > 0 else 0.0
+
+        elapsed = time.perf_counter() - monotonic_start
+        return BenchResult(
+            suite_id=config.suite_id,
+            status="passed" if reporter.failures == 0 and completed else "failed",
+            started_at=started,
+            ended_at=utc_now_iso(),
+            duration_seconds=elapsed,
+            operations=reporter.operations,
+            successes=reporter.successes,
+            failures=reporter.failures,
+            bytes_processed=reporter.bytes_processed,
+            latency_seconds=reporter.latency_seconds,
+            error_counts=reporter.error_counts,
+            metrics={
+                **reporter.metrics,
+                **mode_metrics,
+                "artifact_size_bytes": artifact_size,
+                "pull_modes": pull_modes,
+                "iterations": iterations,
+                "verify": verify,
+            },
+        )
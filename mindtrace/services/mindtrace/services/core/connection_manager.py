@@ -1,6 +1,8 @@
 """Client-side helper class for communicating with any ServerBase server."""
 
 import asyncio
+import threading
+from collections.abc import AsyncIterator
 from urllib.parse import urljoin
 from uuid import UUID
 
@@ -13,16 +15,147 @@ from urllib3.util.url import Url, parse_url
 from mindtrace.core import Mindtrace, Timeout, ifnone
 from mindtrace.services.core.types import ServerStatus, ShutdownOutput, StatusOutput
 
+DEFAULT_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0)
+
+
+async def _close_with_loop(client: httpx.AsyncClient) -> AsyncIterator[None]:
+    """Async generator that closes ``client`` when its event loop finalizes it (see ``HttpClientPool``)."""
+    try:
+        yield
+    finally:
+        await client.aclose()
+
+
+class HttpClientPool:
+    """Lazily created, keep-alive ``httpx`` clients shared by every request a connection manager makes.
+
+    Reusing one client per connection manager keeps TCP (and TLS) connections open between calls instead of paying
+    connection setup on every request. The sync client is created on first use and is safe to share between threads.
+    ``httpx.AsyncClient`` connections belong to the event loop that opened them, so one async client is kept per
+    running loop. Each async client is also registered with its loop as an async generator, so a loop shut down by
+    ``asyncio.run()`` (or anything else calling ``loop.shutdown_asyncgens()``) closes it on the way out; clients of
+    closed loops are then dropped the next time a new loop asks for one.
+
+    Args:
+        limits: Connection pool limits. Defaults to ``DEFAULT_HTTP_LIMITS``.
+        http2: Negotiate HTTP/2 where the server supports it. Requires the ``h2`` package (``httpx[http2]``).
+        timeout: Default request timeout in seconds; individual requests may override it.
+    """
+
+    def __init__(self, *, limits: httpx.Limits | None = None, http2: bool = False, timeout: float = 60.0):
+        self.limits = limits or DEFAULT_HTTP_LIMITS
+        self.http2 = http2
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._client: httpx.Client | None = None
+        self._async_clients: dict[asyncio.AbstractEventLoop, tuple[httpx.AsyncClient, AsyncIterator[None]]] = {}
+
+    @property
+    def client(self) -> httpx.Client:
+        """The pooled sync client, created on first access."""
+        if self._client is None or self._client.is_closed:
+            with self._lock:
+                if self._client is None or self._client.is_closed:
+                    self._client = httpx.Client(limits=self.limits, http2=self.http2, timeout=self.timeout)
+        return self._client
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """The pooled async client for the running event loop, created on first access from that loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            entry = self._async_clients.get(loop)
+            if entry is not None and not entry[0].is_closed:
+                return entry[0]
+            for stale in [other for other in self._async_clients if other.is_closed()]:
+                del self._async_clients[stale]
+            client = httpx.AsyncClient(limits=self.limits, http2=self.http2, timeout=self.timeout)
+            finalizer = _close_with_loop(client)
+            try:
+                # Starting the generator registers it with the running loop, which finalizes it on shutdown.
+                finalizer.__anext__().send(None)
+            except StopIteration:
+                pass
+            self._async_clients[loop] = (client, finalizer)
+        return client
+
+    def close(self) -> None:
+        """Close the sync client and every async client whose event loop can still run its shutdown.
+
+        Clients of a loop running in another thread are closed on that loop, and clients of an idle loop by running it
+        briefly. A loop that is already closed cannot close its connections any more; its client is only dropped.
+        """
+        with self._lock:
+            client, self._client = self._client, None
+            async_clients, self._async_clients = self._async_clients, {}
+        if client is not None:
+            client.close()
+        try:
+            asyncio.get_running_loop()
+            in_loop = True
+        except RuntimeError:
+            in_loop = False
+        for loop, (async_client, _) in async_clients.items():
+            if async_client.is_closed or loop.is_closed():
+                continue
+            if loop.is_running():
+                asyncio.run_coroutine_threadsafe(async_client.aclose(), loop)
+            elif not in_loop:
+                loop.run_until_complete(async_client.aclose())
+            # Otherwise an idle loop cannot run from inside this one; its own shutdown closes the client.
+
+    async def aclose(self) -> None:
+        """Close the async client of the running loop, then everything :meth:`close` releases."""
+        with self._lock:
+            entry = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if entry is not None:
+            await entry[0].aclose()
+        self.close()
 
-class ConnectionManager(Mindtrace):
-    """Client-side helper class for communicating with Mindtrace servers."""
 
-    def __init__(self, url: Url | None = None, server_id: UUID | None = None, server_pid_file: str | None = None):
+class ConnectionManager(Mindtrace):
+    """Client-side helper class for communicating with Mindtrace servers.
+
+    Generated endpoint methods send their requests through :attr:`http_client` / :attr:`async_http_client`, pooled
+    keep-alive clients owned by this connection manager. ``http_limits`` and ``http2`` configure those pools; the
+    clients are closed when the connection manager's context exits or :meth:`close_clients` is called.
+    """
+
+    def __init__(
+        self,
+        url: Url | None = None,
+        server_id: UUID | None = None,
+        server_pid_file: str | None = None,
+        http_limits: httpx.Limits | None = None,
+        http2: bool = False,
+    ):
         super().__init__()
         self.url = ifnone(url, default=parse_url(self.config["MINDTRACE_DEFAULT_HOST_URLS"]["SERVICE"]))
         self._server_id = server_id
         self._server_pid_file = server_pid_file
         self._mcp_client: Client | None = None
+        self._http = HttpClientPool(limits=http_limits, http2=http2)
+
+    @property
+    def http_client(self) -> httpx.Client:
+        """Pooled keep-alive sync HTTP client used by the generated endpoint methods."""
+        return self._http.client
+
+    @property
+    def async_http_client(self) -> httpx.AsyncClient:
+        """Pooled keep-alive async HTTP client (per event loop) used by the generated async endpoint methods."""
+        return self._http.async_client
+
+    def close_clients(self) -> None:
+        """Close the pooled HTTP clients (see :meth:`HttpClientPool.close`).
+
+        They are recreated transparently if the connection manager is used again.
+        """
+        self._http.close()
+
+    async def aclose_clients(self) -> None:
+        """Async version of :meth:`close_clients` that awaits the current event loop's async client closing."""
+        await self._http.aclose()
 
     def shutdown(self, block: bool = True):
         """Shutdown the server.
@@ -135,6 +268,7 @@ class ConnectionManager(Mindtrace):
         try:
             self.shutdown()
         finally:
+            self._http.close()
             if exc_type is not None:
                 info = (exc_type, exc_val, exc_tb)
                 self.logger.exception("Exception occurred", exc_info=info)
@@ -1,12 +1,13 @@
+import asyncio
 from typing import Any, Type
 
 import httpx
 from fastapi import HTTPException, Path, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from urllib3.util.url import Url
 
-from mindtrace.core import ifnone_url
+from mindtrace.core import ifnone, ifnone_url
 from mindtrace.services.core.connection_manager import ConnectionManager
 from mindtrace.services.core.service import Service
 from mindtrace.services.core.types import ServerStatus
@@ -14,13 +15,39 @@ from mindtrace.services.core.utils import generate_connection_manager
 from mindtrace.services.gateway.proxy_connection_manager import ProxyConnectionManager
 from mindtrace.services.gateway.types import AppConfig, RegisterAppTaskSchema
 
+# Connection-scoped headers (RFC 9110 section 7.6.1) that a proxy must not forward.
+HOP_BY_HOP_HEADERS = frozenset(
+    {
+        "connection",
+        "keep-alive",
+        "proxy-authenticate",
+        "proxy-authorization",
+        "proxy-connection",
+        "te",
+        "trailer",
+        "transfer-encoding",
+        "upgrade",
+    }
+)
+
 
 class Gateway(Service):
+    """Reverse proxy that exposes registered apps under ``/<app name>/...``.
+
+    By default a forwarded request is buffered and the upstream JSON response is re-wrapped in a ``JSONResponse``.
+    Apps registered with ``streaming=True`` are proxied as a pass-through instead: the request and response bodies
+    are piped chunk by chunk and the upstream status, content type and headers are preserved. Apps registered with
+    ``timeout``, ``max_connections`` or ``max_keepalive_connections`` get their own upstream client with those
+    settings; all other apps share :attr:`client`.
+    """
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
         self.registered_routers = {}
+        self.streaming_apps: set[str] = set()
         self.client = httpx.AsyncClient()
+        self._app_clients: dict[str, httpx.AsyncClient] = {}
 
         # Enable CORS for the gateway
         self.app.add_middleware(
@@ -36,6 +63,11 @@ class Gateway(Service):
     def register_app(self, payload: AppConfig):
         """Register a FastAPI app with the gateway."""
         self.registered_routers[payload.name] = str(payload.url)
+        if payload.streaming:
+            self.streaming_apps.add(payload.name)
+        else:
+            self.streaming_apps.discard(payload.name)
+        self._set_app_client(payload)
 
         async def forwarder(request: Request, path: str = Path(...)):
             return await self.forward_request(request, payload.name, path)
@@ -46,30 +78,111 @@ class Gateway(Service):
             methods=["GET", "POST", "PUT", "DELETE", "PATCH"],
         )
 
-    async def forward_request(self, request: Request, app_name: str, path: str):
-        """Forward the request to the registered app."""
-        self.logger.debug(f"Forwarding request {request} to {app_name} at {path}.")
+    def _set_app_client(self, payload: AppConfig):
+        """Give the app a dedicated upstream client if it was registered with its own timeout or pool limits."""
+        stale = self._app_clients.pop(payload.name, None)
+        if stale is not None:
+            self._close_later(stale)
+        if payload.timeout is None and payload.max_connections is None and payload.max_keepalive_connections is None:
+            return
+        default_limits = httpx.Limits()
+        client_kwargs: dict[str, Any] = {
+            "limits": httpx.Limits(
+                max_connections=ifnone(payload.max_connections, default=default_limits.max_connections),
+                max_keepalive_connections=ifnone(
+                    payload.max_keepalive_connections, default=default_limits.max_keepalive_connections
+                ),
+            )
+        }
+        if payload.timeout is not None:
+            client_kwargs["timeout"] = payload.timeout
+        self._app_clients[payload.name] = httpx.AsyncClient(**client_kwargs)
+
+    def _close_later(self, client: httpx.AsyncClient):
+        try:
+            asyncio.get_running_loop().create_task(client.aclose())
+        except RuntimeError:
+            pass  # No loop to close it on; its connections are released when it is garbage collected.
+
+    def client_for(self, app_name: str) -> httpx.AsyncClient:
+        """The upstream client used to forward requests to ``app_name``."""
+        return self._app_clients.get(app_name, self.client)
+
+    def _upstream_url(self, app_name: str, path: str) -> str:
         if app_name not in self.registered_routers:
             raise HTTPException(status_code=404, detail=f"App '{app_name}' not found")
 
         app_url = self.registered_routers[app_name]
         # Ensure proper URL construction with correct path separator
         if app_url.endswith("/"):
-            url = f"{app_url}{path}"
-        else:
-            url = f"{app_url}/{path}"
+            return f"{app_url}{path}"
+        return f"{app_url}/{path}"
+
+    async def forward_request(self, request: Request, app_name: str, path: str):
+        """Forward the request to the registered app."""
+        self.logger.debug(f"Forwarding request {request} to {app_name} at {path}.")
+        url = self._upstream_url(app_name, path)
+        if app_name in self.streaming_apps:
+            return await self.stream_request(request, app_name, url)
+
         method = request.method
         headers = dict(request.headers)
         content = await request.body()
 
         try:
-            response = await self.client.request(method, url, headers=headers, content=content)
+            response = await self.client_for(app_name).request(method, url, headers=headers, content=content)
             self.logger.debug(f"Returning response for {request} from {app_name} at {path}.")
             return JSONResponse(content=response.json(), status_code=response.status_code)
         except httpx.RequestError as e:
             self.logger.warning(f"Exception was raised on forwarded request {request} to {app_name} at {path}.")
             raise HTTPException(status_code=500, detail=str(e))
 
+    async def stream_request(self, request: Request, app_name: str, url: str) -> StreamingResponse:
+        """Proxy the request to ``url`` without buffering either body.
+
+        The request body is streamed upstream as it arrives, and the upstream response body is streamed back
+        undecoded, with its status and headers (minus hop-by-hop headers). The upstream response is closed once the
+        client has received it, or if the client goes away first.
+        """
+        headers = [(key, value) for key, value in request.headers.items() if key.lower() not in HOP_BY_HOP_HEADERS]
+        has_body = "content-length" in request.headers or "transfer-encoding" in request.headers
+        client = self.client_for(app_name)
+        upstream_request = client.build_request(
+            request.method,
+            url,
+            headers=headers,
+            params=request.query_params,
+            content=request.stream() if has_body else None,
+        )
+
+        try:
+            upstream = await client.send(upstream_request, stream=True)
+        except httpx.RequestError as e:
+            self.logger.warning(f"Exception was raised on streamed request {request} to {app_name} at {url}.")
+            raise HTTPException(status_code=500, detail=str(e))
+
+        async def body():
+            try:
+                async for chunk in upstream.aiter_raw():
+                    yield chunk
+            finally:
+                await upstream.aclose()
+
+        response = StreamingResponse(body(), status_code=upstream.status_code)
+        response.raw_headers = [
+            (key.encode("latin-1"), value.encode("latin-1"))
+            for key, value in upstream.headers.multi_items()
+            if key.lower() not in HOP_BY_HOP_HEADERS
+        ]
+        return response
+
+    async def shutdown_cleanup(self):
+        """Close the upstream clients."""
+        await super().shutdown_cleanup()
+        for client in (self.client, *self._app_clients.values()):
+            await client.aclose()
+        self._app_clients.clear()
+
     @classmethod
     def connect(
         cls: Type["Gateway"],
@@ -1,26 +1,35 @@
 from typing import Any, Dict
 
 import httpx
-import requests
 from urllib3.util.url import Url
 
-from mindtrace.services.core.connection_manager import ConnectionManager
+from mindtrace.services.core.connection_manager import ConnectionManager, HttpClientPool
 
 
 class ProxyConnectionManager:
     """A schema-aware proxy that forwards requests through the gateway instead of directly through the wrapped connection manager."""
 
-    def __init__(self, gateway_url: str | Url, app_name: str, original_cm: ConnectionManager):
+    def __init__(
+        self,
+        gateway_url: str | Url,
+        app_name: str,
+        original_cm: ConnectionManager,
+        http_limits: httpx.Limits | None = None,
+        http2: bool = False,
+    ):
         """Initializes the ProxyConnectionManager.
 
         Args:
             gateway_url: The base URL of the gateway.
             app_name: The registered app name.
             original_cm: The original connection manager.
+            http_limits: Connection pool limits for the keep-alive clients used to reach the gateway.
+            http2: Negotiate HTTP/2 with the gateway where supported.
         """
         object.__setattr__(self, "gateway_url", str(gateway_url).rstrip("/"))  # Ensure no trailing slash
         object.__setattr__(self, "app_name", app_name)
         object.__setattr__(self, "original_cm", original_cm)
+        object.__setattr__(self, "_http", HttpClientPool(limits=http_limits, http2=http2))
 
         # Extract service endpoints from the original connection manager
         # Connection managers store the service class they were generated from
@@ -63,7 +72,18 @@ class ProxyConnectionManager:
         endpoints = {}
 
         # Get all methods from the connection manager that look like service endpoints
-        protected_methods = ["shutdown", "ashutdown", "status", "astatus", "url", "endpoints"]
+        protected_methods = [
+            "shutdown",
+            "ashutdown",
+            "status",
+            "astatus",
+            "url",
+            "endpoints",
+            "http_client",
+            "async_http_client",
+            "close_clients",
+            "aclose_clients",
+        ]
 
         for attr_name in dir(original_cm):
             if (
@@ -107,9 +127,8 @@ class ProxyConnectionManager:
                 else:
                     payload = kwargs
 
-                # Make async HTTP request
-                async with httpx.AsyncClient(timeout=60) as client:
-                    response = await client.post(endpoint_url, json=payload)
+                # Make async HTTP request over the pooled keep-alive client
+                response = await self._http.async_client.post(endpoint_url, json=payload)
 
                 if response.status_code != 200:
                     raise RuntimeError(f"Gateway proxy request failed: {response.text}")
@@ -148,7 +167,7 @@ class ProxyConnectionManager:
                     payload = kwargs
 
                 # Make sync HTTP request (always POST for service endpoints)
-                response = requests.post(endpoint_url, json=payload, timeout=60)
+                response = self._http.client.post(endpoint_url, json=payload)
 
                 if response.status_code != 200:
                     raise RuntimeError(f"Gateway proxy request failed: {response.text}")
@@ -173,6 +192,14 @@ class ProxyConnectionManager:
             sync_proxy_method.__doc__ = f"Sync proxy for {endpoint_name} endpoint via gateway"
             return sync_proxy_method
 
+    def close_clients(self):
+        """Close the pooled HTTP clients used to reach the gateway."""
+        self._http.close()
+
+    async def aclose_clients(self):
+        """Async version of :meth:`close_clients` that also closes the current event loop's async client."""
+        await self._http.aclose()
+
     def __getattribute__(self, attr_name):
         """Handle property access by routing through the gateway."""
         # Always allow access to our internal attributes using object.__getattribute__
@@ -180,6 +207,9 @@ class ProxyConnectionManager:
             "gateway_url",
             "app_name",
             "original_cm",
+            "_http",
+            "close_clients",
+            "aclose_clients",
             "_service_endpoints",
             "_generate_proxy_methods",
             "_extract_service_endpoints",
@@ -202,7 +232,7 @@ class ProxyConnectionManager:
         try:
             # Make a GET request to the gateway for property access
             endpoint_url = f"{self.gateway_url}/{self.app_name}/{attr_name}"
-            response = requests.get(endpoint_url, timeout=60)
+            response = self._http.client.get(endpoint_url)
 
             if response.status_code == 200:
                 try:
@@ -211,7 +241,7 @@ class ProxyConnectionManager:
                     return response.text
             else:
                 # If GET fails, try POST (for methods that might be called as properties)
-                response = requests.post(endpoint_url, timeout=60)
+                response = self._http.client.post(endpoint_url)
                 if response.status_code == 200:
                     try:
                         return response.json()
@@ -222,7 +252,7 @@ class ProxyConnectionManager:
                         f"Gateway request failed for '{attr_name}': {response.status_code} - {response.text}"
                     )
 
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             raise AttributeError(f"Gateway request failed for '{attr_name}': {e}")
 
     def __getattr__(self, attr_name):
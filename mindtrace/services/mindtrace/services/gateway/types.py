@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from urllib3.util.url import Url
 
 from mindtrace.core import TaskSchema
@@ -7,6 +7,16 @@ from mindtrace.core import TaskSchema
 class AppConfig(BaseModel):
     name: str
     url: str | Url
+    streaming: bool = Field(
+        False,
+        description="Pipe request and response bodies through the gateway chunk by chunk instead of buffering them. "
+        "Preserves the upstream status, content type and headers, so non-JSON responses are passed through as-is.",
+    )
+    timeout: float | None = Field(None, gt=0, description="Per-app upstream timeout in seconds.")
+    max_connections: int | None = Field(None, ge=1, description="Per-app upper bound on upstream connections.")
+    max_keepalive_connections: int | None = Field(
+        None, ge=0, description="Per-app upper bound on idle keep-alive upstream connections."
+    )
 
 
 RegisterAppTaskSchema = TaskSchema(name="register_app", input_schema=AppConfig)
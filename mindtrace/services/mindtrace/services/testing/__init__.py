@@ -0,0 +1,21 @@
+"""Embedded benchmark suites for ``mindtrace-services``.
+
+Use ``register_benchmark_suites`` directly or discover it through the
+``mindtrace.benchmark_suites`` entry point group.
+"""
+
+from __future__ import annotations
+
+from mindtrace.core import TestRunner
+
+
+def register_benchmark_suites(*, runner: TestRunner | None = None, replace: bool = True) -> None:
+    """Register services benchmark suites on ``runner`` or the default runner."""
+
+    target = runner or TestRunner.default()
+
+    from mindtrace.services.testing.suites.connection_manager import ConnectionManagerCallRateSuite
+
+    for cls in (ConnectionManagerCallRateSuite,):
+        if replace or cls.suite_id not in target.registered_suites():
+            target.register_test_suite(cls, replace=replace)
@@ -0,0 +1 @@
+"""Services benchmark suite implementations."""
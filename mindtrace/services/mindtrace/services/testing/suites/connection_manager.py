@@ -0,0 +1,210 @@
+"""ConnectionManager request rate against a local HTTP endpoint: pooled keep-alive clients vs. a client per call."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import MappingProxyType
+from typing import Literal
+
+import httpx
+from pydantic import BaseModel, Field
+from urllib3.util.url import parse_url
+
+from mindtrace.core import (
+    BenchReporter,
+    BenchResult,
+    BenchResultSchema,
+    BenchSuiteConfig,
+    BenchTestSuite,
+    TaskSchema,
+    utc_now_iso,
+)
+from mindtrace.core.testing.workloads import deterministic_payload, parse_size_bytes
+from mindtrace.services.core.connection_manager import ConnectionManager
+
+
+class ConnectionManagerCallRateInput(BaseModel):
+    client_mode: Literal["pooled", "per_call"] = Field(
+        "pooled",
+        description="'pooled' sends through the ConnectionManager's keep-alive clients; 'per_call' opens a new "
+        "client (and connection) for every request, as generated methods did before pooling.",
+    )
+    api: Literal["sync", "async"] = Field("sync", description="Exercise the sync or the async request path.")
+    calls: int = Field(2_000, ge=1, description="Number of requests to send.")
+    concurrency: int = Field(1, ge=1, description="Requests in flight at once (threads for sync, tasks for async).")
+    payload_size: str = Field("256B", description="JSON request payload size, e.g. '256B' or '4KiB'.")
+
+
+class ConnectionManagerCallRateResources(BaseModel):
+    """Uses only an HTTP server bound to 127.0.0.1 for the duration of the run."""
+
+
+class _EchoHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without TCP_NODELAY delayed ACKs dominate every response.
+    disable_nagle_algorithm = True
+
+    def do_POST(self) -> None:  # noqa: N802 - http.server naming
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args) -> None:  # noqa: A002 - http.server signature
+        pass
+
+
+class ConnectionManagerCallRateSuite(BenchTestSuite):
+    suite_id = "services.stress.connection_manager_call_rate"
+    title = "Services stress — ConnectionManager call rate"
+    description = (
+        "Sends ``calls`` small JSON POSTs to a local HTTP server the way generated ConnectionManager methods do, "
+        "either through the connection manager's pooled keep-alive clients or through a new client per call. "
+        "Reports calls per second so the two modes can be compared."
+    )
+    tags = frozenset({"stress", "services"})
+    requires = ("local_network",)
+    safety = "Binds a temporary HTTP server to 127.0.0.1 on an ephemeral port."
+    task_schema = TaskSchema(
+        name=suite_id,
+        input_schema=ConnectionManagerCallRateInput,
+        output_schema=BenchResultSchema,
+    )
+    resource_schema = ConnectionManagerCallRateResources
+    profiles = MappingProxyType(
+        {
+            "smoke": {"duration_seconds": 30.0, "calls": 100},
+            "stress": {"duration_seconds": 300.0, "client_mode": "pooled", "calls": 5_000, "concurrency": 8},
+            "per_call_baseline": {
+                "duration_seconds": 300.0,
+                "client_mode": "per_call",
+                "calls": 5_000,
+                "concurrency": 8,
+            },
+            "async_stress": {
+                "duration_seconds": 300.0,
+                "client_mode": "pooled",
+                "api": "async",
+                "calls": 5_000,
+                "concurrency": 32,
+            },
+        },
+    )
+
+    def execute_bench(self, config: BenchSuiteConfig, reporter: BenchReporter) -> BenchResult:
+        started = utc_now_iso()
+        monotonic_start = time.perf_counter()
+        client_mode = str(config.parameters.get("client_mode", "pooled")).lower()
+        api = str(config.parameters.get("api", "sync")).lower()
+        calls = int(config.parameters.get("calls", 2_000))
+        concurrency = int(config.parameters.get("concurrency", 1))
+        payload_size = parse_size_bytes(config.parameters.get("payload_size"), default=256)
+        payload = {"data": deterministic_payload(payload_size).decode("ascii")}
+        request_bytes = len(json.dumps(payload))
+        deadline = reporter.deadline(config.duration_seconds)
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _EchoHandler)
+        server.daemon_threads = True
+        server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+        server_thread.start()
+        url = f"http://127.0.0.1:{server.server_address[1]}/echo"
+        cm = ConnectionManager(url=parse_url(url))
+
+        def should_continue() -> bool:
+            return time.perf_counter() < deadline and not reporter.is_cancelled()
+
+        def record(op_start: float, response: httpx.Response | None, error: Exception | None) -> None:
+            latency = time.perf_counter() - op_start
+            if error is None and response is not None and response.status_code != 200:
+                error = httpx.HTTPStatusError(
+                    f"HTTP {response.status_code}", request=response.request, response=response
+                )
+            if error is not None:
+                reporter.record_operation(success=False, latency_seconds=latency, error=error)
+            else:
+                reporter.record_operation(success=True, latency_seconds=latency, bytes_processed=request_bytes)
+
+        def sync_call(_: int) -> None:
+            if not should_continue():
+                return
+            op_start = time.perf_counter()
+            try:
+                if client_mode == "pooled":
+                    response = cm.http_client.post(url, json=payload, timeout=60)
+                else:
+                    response = httpx.post(url, json=payload, timeout=60)
+            except Exception as exc:  # noqa: BLE001 - benchmark records transport failures
+                record(op_start, None, exc)
+                return
+            record(op_start, response, None)
+
+        async def async_calls() -> None:
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def one_call() -> None:
+                async with semaphore:
+                    if not should_continue():
+                        return
+                    op_start = time.perf_counter()
+                    try:
+                        if client_mode == "pooled":
+                            response = await cm.async_http_client.post(url, json=payload, timeout=60)
+                        else:
+                            async with httpx.AsyncClient(timeout=60) as client:
+                                response = await client.post(url, json=payload)
+                    except Exception as exc:  # noqa: BLE001 - benchmark records transport failures
+                        record(op_start, None, exc)
+                        return
+                    record(op_start, response, None)
+
+            try:
+                await asyncio.gather(*(one_call() for _ in range(calls)))
+            finally:
+                await cm.aclose_clients()
+
+        phase_start = time.perf_counter()
+        try:
+            if api == "async":
+                asyncio.run(async_calls())
+            else:
+                with ThreadPoolExecutor(max_workers=concurrency) as pool:
+                    list(pool.map(sync_call, range(calls)))
+        finally:
+            call_seconds = time.perf_counter() - phase_start
+            cm.close_clients()
+            server.shutdown()
+            server.server_close()
+            server_thread.join(timeout=5)
+
+        elapsed = time.perf_counter() - monotonic_start
+        completed = reporter.successes == calls
+        return BenchResult(
+            suite_id=config.suite_id,
+            status="passed" if reporter.failures == 0 and completed else "failed",
+            started_at=started,
+            ended_at=utc_now_iso(),
+            duration_seconds=elapsed,
+            operations=reporter.operations,
+            successes=reporter.successes,
+            failures=reporter.failures,
+            bytes_processed=reporter.bytes_processed,
+            latency_seconds=reporter.latency_seconds,
+            error_counts=reporter.error_counts,
+            metrics={
+                **reporter.metrics,
+                "client_mode": client_mode,
+                "api": api,
+                "calls": calls,
+                "concurrency": concurrency,
+                "payload_size_bytes": payload_size,
+                "calls_per_second": reporter.successes / call_seconds if call_seconds > 0 else 0.0,
+            },
+        )
@@ -33,6 +33,7 @@ def test_registry_testing_registers_expected_ids_and_schemas() -> None:
         "registry.stress.read_ceiling",
         "registry.stress.mixed_rw",
         "registry.stress.version_churn",
+        "registry.stress.local_pull_modes",
     }
     assert expected.issubset(ids)
 
@@ -77,6 +78,8 @@ def test_datalake_testing_registers_expected_ids_and_schemas() -> None:
         "datalake.stress.create_asset_from_object",
         "datalake.stress.collection_item",
         "datalake.stress.retention",
+        "datalake.stress.dataset_view",
+        "datalake.stress.export",
     }
     assert expected.issubset(ids)
 
@@ -88,3 +91,83 @@ def test_datalake_testing_registers_expected_ids_and_schemas() -> None:
     assert "concurrency" in input_properties
     assert input_properties["concurrency"]["default"] == 1
     assert mongo_insert.profiles["stress"]["concurrency"] == 1
+
+    dataset_view = TestRunner.get_suite_schema("datalake.stress.dataset_view")
+    assert {"dataset_size", "selectivity"} <= set(dataset_view.task_schema["input_json_schema"]["properties"])
+
+    export = TestRunner.get_suite_schema("datalake.stress.export")
+    assert {"concurrency", "export_format"} <= set(export.task_schema["input_json_schema"]["properties"])
+    assert export.profiles["sequential_baseline"]["concurrency"] == 1
+
+
+def test_jobs_testing_registers_expected_ids_and_schemas() -> None:
+    import mindtrace.jobs.testing as jt
+    from mindtrace.core import TestRunner
+
+    TestRunner.clear_registry()
+    jt.register_benchmark_suites()
+
+    ids = sorted(TestRunner.registered_suites())
+    expected = {"jobs.stress.local_queue_throughput", "jobs.stress.redis_priority_queue"}
+    assert expected.issubset(ids)
+
+    for suite_id in expected:
+        _assert_suite_schema_contract(TestRunner.get_suite_schema(suite_id), suite_id=suite_id)
+
+    local_queue = TestRunner.get_suite_schema("jobs.stress.local_queue_throughput")
+    assert local_queue.profiles["stress"]["queued_jobs"] == 10_000
+    assert local_queue.profiles["stress_100k"]["queued_jobs"] == 100_000
+
+    redis_priority = TestRunner.get_suite_schema("jobs.stress.redis_priority_queue")
+    assert {"modes", "batch_size", "codec"} <= set(redis_priority.task_schema["input_json_schema"]["properties"])
+
+
+def test_services_testing_registers_expected_ids_and_schemas() -> None:
+    import mindtrace.services.testing as st
+    from mindtrace.core import TestRunner
+
+    TestRunner.clear_registry()
+    st.register_benchmark_suites()
+
+    ids = sorted(TestRunner.registered_suites())
+    expected = {"services.stress.connection_manager_call_rate"}
+    assert expected.issubset(ids)
+
+    for suite_id in expected:
+        _assert_suite_schema_contract(TestRunner.get_suite_schema(suite_id), suite_id=suite_id)
+
+    call_rate = TestRunner.get_suite_schema("services.stress.connection_manager_call_rate")
+    input_properties = call_rate.task_schema["input_json_schema"]["properties"]
+    assert input_properties["client_mode"]["default"] == "pooled"
+    assert call_rate.profiles["per_call_baseline"]["client_mode"] == "per_call"
+
+
+def test_models_testing_registers_expected_ids_and_schemas() -> None:
+    import mindtrace.models.testing as mt
+    from mindtrace.core import TestRunner
+
+    TestRunner.clear_registry()
+    mt.register_benchmark_suites()
+
+    ids = sorted(TestRunner.registered_suites())
+    expected = {
+        "models.stress.detection_map",
+        "models.stress.onnx_cold_start",
+        "models.stress.datalake_streaming",
+    }
+    assert expected.issubset(ids)
+
+    for suite_id in expected:
+        _assert_suite_schema_contract(TestRunner.get_suite_schema(suite_id), suite_id=suite_id)
+
+    detection_map = TestRunner.get_suite_schema("models.stress.detection_map")
+    assert detection_map.task_schema["input_json_schema"]["properties"]["engine"]["default"] == "accumulator"
+    assert detection_map.profiles["reference_baseline"]["engine"] == "reference"
+
+    cold_start = TestRunner.get_suite_schema("models.stress.onnx_cold_start")
+    assert cold_start.task_schema["input_json_schema"]["properties"]["pull_mode"]["default"] == "direct"
+    assert cold_start.profiles["smoke"]["layers"] == 2
+
+    streaming = TestRunner.get_suite_schema("models.stress.datalake_streaming")
+    assert streaming.task_schema["input_json_schema"]["properties"]["round_trip_ms"]["default"] == 2.0
+    assert streaming.profiles["stress"]["num_workers"] == 2
@@ -278,3 +278,152 @@ def test_compute_dir_hash_special_characters_in_path():
         # Compute again to verify determinism
         hash_value2 = compute_dir_hash(temp_dir)
         assert hash_value == hash_value2
+
+
+def test_compute_file_hash_matches_sha256(tmp_path):
+    """Test that compute_file_hash returns the SHA256 of the file contents regardless of chunk size."""
+    import hashlib
+
+    from mindtrace.core import compute_file_hash
+
+    test_file = tmp_path / "blob.bin"
+    test_file.write_bytes(b"0123456789" * 1000)
+
+    expected = hashlib.sha256(b"0123456789" * 1000).hexdigest()
+    assert compute_file_hash(test_file) == expected
+    assert compute_file_hash(str(test_file), chunk_size=7) == expected
+
+
+def test_compute_file_manifest_matches_file_hashes(tmp_path):
+    """Test that the parallel manifest holds the per-file hash of every file, keyed by POSIX path."""
+    from mindtrace.core import compute_file_hash, compute_file_manifest
+
+    (tmp_path / "a.txt").write_text("A")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "b.txt").write_text("B")
+
+    manifest = compute_file_manifest(tmp_path, max_workers=4)
+
+    assert list(manifest) == ["a.txt", "sub/b.txt"]
+    assert manifest["sub/b.txt"] == compute_file_hash(tmp_path / "sub" / "b.txt")
+    assert compute_file_manifest(tmp_path, max_workers=1) == manifest
+    assert compute_file_manifest(tmp_path, files=["sub/b.txt"]) == {"sub/b.txt": manifest["sub/b.txt"]}
+
+
+def test_merkle_root_is_prefixed_and_content_sensitive(tmp_path):
+    """Test that the Merkle root records its algorithm and changes when any file changes."""
+    from mindtrace.core import compute_file_manifest, hash_algorithm_of, merkle_root
+
+    (tmp_path / "a.txt").write_text("A")
+    root = merkle_root(compute_file_manifest(tmp_path))
+
+    assert root.startswith("sha256:")
+    assert hash_algorithm_of(root) == "sha256"
+    assert hash_algorithm_of(compute_dir_hash(tmp_path)) is None
+
+    (tmp_path / "a.txt").write_text("B")
+    assert merkle_root(compute_file_manifest(tmp_path)) != root
+
+
+def test_blake2b_manifest(tmp_path):
+    """Test hashing with the BLAKE2b integrity mode."""
+    import hashlib
+
+    from mindtrace.core import compute_file_manifest, merkle_root
+
+    (tmp_path / "a.txt").write_bytes(b"A")
+    manifest = compute_file_manifest(tmp_path, "blake2b")
+
+    assert manifest == {"a.txt": hashlib.blake2b(b"A", digest_size=32).hexdigest()}
+    assert merkle_root(manifest, "blake2b").startswith("blake2b:")
+
+
+def test_unknown_hash_algorithm_raises(tmp_path):
+    """Test that an unknown algorithm is rejected before any file is read."""
+    import pytest
+
+    from mindtrace.core import compute_file_manifest
+
+    with pytest.raises(ValueError, match="Unknown hash algorithm"):
+        compute_file_manifest(tmp_path, "md5")
+
+
+def test_file_digest_cache_skips_unchanged_files(tmp_path):
+    """Test that cached digests are reused for unchanged files and refreshed when a file changes."""
+    import os
+    from unittest.mock import patch
+
+    from mindtrace.core import FileDigestCache, compute_file_manifest
+    from mindtrace.core.utils import hashing
+
+    test_file = tmp_path / "a.txt"
+    test_file.write_text("A")
+    cache = FileDigestCache()
+
+    first = compute_file_manifest(tmp_path, cache=cache)
+    assert len(cache) == 1
+
+    with patch.object(hashing, "compute_file_hash", wraps=hashing.compute_file_hash) as spy:
+        assert compute_file_manifest(tmp_path, cache=cache) == first
+        spy.assert_not_called()
+
+        test_file.write_text("BB")
+        stat = test_file.stat()
+        os.utime(test_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        second = compute_file_manifest(tmp_path, cache=cache)
+        spy.assert_called_once()
+
+    assert second != first
+
+
+def test_file_digest_cache_evicts_least_recently_used():
+    """Test that the digest cache stays within its bound."""
+    from types import SimpleNamespace
+
+    from mindtrace.core import FileDigestCache
+
+    cache = FileDigestCache(max_entries=2)
+    stats = [SimpleNamespace(st_dev=1, st_ino=i, st_size=1, st_mtime_ns=1, st_ctime_ns=1) for i in range(3)]
+    for i, stat in enumerate(stats):
+        cache.put(f"/data/{i}", stat, "sha256", str(i))
+
+    assert len(cache) == 2
+    assert cache.get("/data/0", stats[0], "sha256") is None
+    assert cache.get("/data/2", stats[2], "sha256") == "2"
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_file_digest_cache_does_not_match_recycled_inode_in_another_directory():
+    """A file elsewhere with the same device, inode, size and times must not get a cached digest."""
+    from types import SimpleNamespace
+
+    from mindtrace.core import FileDigestCache
+
+    cache = FileDigestCache()
+    stat = SimpleNamespace(st_dev=1, st_ino=42, st_size=5, st_mtime_ns=1, st_ctime_ns=1)
+    cache.put("/tmp/pull-a/model.bin", stat, "sha256", "digest-a")
+
+    assert cache.get("/tmp/pull-a/model.bin", stat, "sha256") == "digest-a"
+    assert cache.get("/tmp/pull-b/model.bin", stat, "sha256") is None
+
+
+def test_compute_file_manifest_rehashes_same_inode_at_new_path(tmp_path):
+    """A file seen under another directory is read again, even with the same inode, size and times."""
+    from unittest.mock import patch
+
+    from mindtrace.core import FileDigestCache, compute_file_manifest
+    from mindtrace.core.utils import hashing
+
+    cache = FileDigestCache()
+    first_dir, second_dir = tmp_path / "pull-1", tmp_path / "pull-2"
+    first_dir.mkdir()
+    (first_dir / "weights.bin").write_bytes(b"AAAA")
+    compute_file_manifest(first_dir, cache=cache)
+
+    # Renaming the directory keeps the file's inode and times, as a recycled inode in a new pull directory would.
+    first_dir.rename(second_dir)
+    with patch.object(hashing, "compute_file_hash", wraps=hashing.compute_file_hash) as spy:
+        compute_file_manifest(second_dir, cache=cache)
+        compute_file_manifest(second_dir, cache=cache)
+    spy.assert_called_once()
@@ -1673,3 +1673,29 @@ def test_close_releases_lazy_sync_client(mock_mongo_connection):
     backend.close()
     sync_stub.close.assert_called_once()
     assert backend._sync_client is None
+
+
+@pytest.mark.asyncio
+async def test_find_one_and_update_applies_update_atomically():
+    """``find_one_and_update`` sends the filter and update operators in one call and returns the updated model."""
+    from pymongo import ReturnDocument
+
+    from mindtrace.database.backends.mongo_odm import MongoMindtraceODM
+
+    backend = MongoMindtraceODM(MotorDoc, "mongodb://localhost:27017", "test_db")
+    backend._is_initialized = True
+    oid = ObjectId()
+    mock_coll = MagicMock()
+    mock_coll.find_one_and_update = AsyncMock(
+        side_effect=[{"_id": oid, "name": "A", "age": 2, "email": "a@b.com"}, None]
+    )
+    query = {"name": "A", "age": {"$lt": 2}}
+    update = {"$set": {"age": 2}}
+
+    with patch.object(backend, "_motor_collection", return_value=mock_coll):
+        out = await backend.find_one_and_update(query, update)
+        assert out.age == 2
+        assert str(out.id) == str(oid)
+        assert await backend.find_one_and_update(query, update) is None
+
+    mock_coll.find_one_and_update.assert_called_with(query, update, return_document=ReturnDocument.AFTER)
@@ -0,0 +1,294 @@
+"""Tests for :mod:`mindtrace.datalake.exporters.streaming`."""
+
+import asyncio
+import io
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+from export_test_utils import png_bytes, sample_annotation_record, sample_asset
+
+from mindtrace.datalake.exporters import (
+    ExportProgress,
+    export_dataset_to_format,
+    stream_dataset_version_export,
+)
+from mindtrace.datalake.exporters.base import build_exportable_dataset_from_resolved_version_async
+from mindtrace.datalake.exporters.streaming import StreamingExportWriter, write_json_object
+from mindtrace.datalake.types import (
+    AnnotationSet,
+    DatasetVersion,
+    Datum,
+    ResolvedDatasetVersion,
+    ResolvedDatum,
+)
+
+
+def _resolved_datum(index: int, split: str | None) -> ResolvedDatum:
+    asset = sample_asset(f"asset_{index}")
+    records = [
+        sample_annotation_record(f"ann_{index}_box", label=f"label_{index % 3}", asset_id=asset.asset_id),
+        sample_annotation_record(f"ann_{index}_poly", kind="polygon", label="zone", asset_id=asset.asset_id),
+        sample_annotation_record(f"ann_{index}_point", kind="keypoint", label="tip", asset_id=asset.asset_id),
+    ]
+    annotation_set = AnnotationSet(
+        annotation_set_id=f"set_{index}",
+        name=f"set-{index}",
+        purpose="ground_truth",
+        source_type="human",
+        status="active",
+        annotation_record_ids=[record.annotation_id for record in records],
+    )
+    datum = Datum(
+        datum_id=f"datum_{index}",
+        asset_refs={"image": asset.asset_id},
+        split=split,
+        metadata={"index": index},
+        annotation_set_ids=[annotation_set.annotation_set_id],
+    )
+    return ResolvedDatum(
+        datum=datum,
+        assets={"image": asset},
+        annotation_sets=[annotation_set],
+        annotation_records={annotation_set.annotation_set_id: records},
+    )
+
+
+class _FakeSource:
+    """Datalake stand-in whose payload fetches finish out of submission order."""
+
+    def __init__(self, resolved: list[ResolvedDatum]):
+        self.resolved = {item.datum.datum_id: item for item in resolved}
+        self.dataset_version = DatasetVersion(
+            dataset_name="dataset-a",
+            version="1.0.0",
+            description="Streaming export test",
+            manifest=[item.datum.datum_id for item in resolved],
+        )
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get_dataset_version(self, dataset_name, version, *, include_manifest=True):
+        return self.dataset_version
+
+    async def iter_dataset_version_datum_ids(self, dataset_name, version):
+        for datum_id in self.dataset_version.manifest:
+            yield datum_id
+
+    async def resolve_datum(self, datum_id):
+        return self.resolved[datum_id]
+
+    async def get_asset_payload(self, asset_id):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            index = int(asset_id.rsplit("_", 1)[1])
+            await asyncio.sleep(0.01 / (1 + index % 4))
+            return png_bytes((8 + index, 6))
+        finally:
+            self.in_flight -= 1
+
+    def resolved_version(self) -> ResolvedDatasetVersion:
+        return ResolvedDatasetVersion(
+            dataset_version=self.dataset_version,
+            datums=[self.resolved[datum_id] for datum_id in self.dataset_version.manifest],
+        )
+
+
+def _read_tree(root: Path) -> dict[str, bytes]:
+    return {path.relative_to(root).as_posix(): path.read_bytes() for path in root.rglob("*") if path.is_file()}
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {},
+        {"b": [], "a": {"x": [1, {"y": "line\nbreak"}]}},
+        {"annotations": [], "images": [{"id": 1, "size": [1, 2]}, {"id": 2}], "info": {}, "licenses": []},
+    ],
+)
+def test_write_json_object_matches_json_dumps(value):
+    streamed = {key: iter(item) if isinstance(item, list) else item for key, item in value.items()}
+    handle = io.StringIO()
+    write_json_object(handle, streamed)
+    assert handle.getvalue() == json.dumps(value, indent=2, sort_keys=True)
+
+
+def test_streaming_export_writer_requires_the_writer_hooks(tmp_path: Path):
+    class PartialWriter(StreamingExportWriter):
+        def stage(self, item):
+            raise AssertionError("not called")
+
+    with pytest.raises(TypeError, match="abstract"):
+        PartialWriter(tmp_path)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("splits", [["train", "val", None], [None, None, None]])
+async def test_streaming_coco_export_matches_in_memory_exporter(tmp_path: Path, splits):
+    source = _FakeSource([_resolved_datum(index, splits[index % len(splits)]) for index in range(7)])
+
+    dataset = await build_exportable_dataset_from_resolved_version_async(source, source.resolved_version())
+    expected = export_dataset_to_format(dataset, format="coco", destination=tmp_path / "in-memory")
+    result = await stream_dataset_version_export(
+        source, "dataset-a", "1.0.0", format="coco", destination=tmp_path / "streamed", concurrency=3
+    )
+
+    assert _read_tree(tmp_path / "streamed") == _read_tree(tmp_path / "in-memory")
+    assert sorted(result.files_written) == sorted(expected.files_written)
+    assert result.warnings == expected.warnings
+    assert (result.asset_count, result.annotation_count) == (7, 21)
+
+
+@pytest.mark.asyncio
+async def test_streaming_coco_export_registers_categories_of_skipped_annotations(tmp_path: Path):
+    resolved = [_resolved_datum(index, None) for index in range(3)]
+    # The only "sliver" annotation is a degenerate polygon, which both exporters skip with a warning.
+    sliver = sample_annotation_record("ann_sliver", kind="polygon", label="sliver", asset_id="asset_1")
+    sliver = sliver.model_copy(update={"geometry": {"vertices": [[0, 0], [5, 5]]}})
+    annotation_set = resolved[1].annotation_sets[0]
+    annotation_set.annotation_record_ids.append(sliver.annotation_id)
+    resolved[1].annotation_records[annotation_set.annotation_set_id].append(sliver)
+    source = _FakeSource(resolved)
+
+    dataset = await build_exportable_dataset_from_resolved_version_async(source, source.resolved_version())
+    expected = export_dataset_to_format(dataset, format="coco", destination=tmp_path / "in-memory")
+    result = await stream_dataset_version_export(
+        source, "dataset-a", "1.0.0", format="coco", destination=tmp_path / "streamed", concurrency=2
+    )
+
+    assert _read_tree(tmp_path / "streamed") == _read_tree(tmp_path / "in-memory")
+    assert result.warnings == expected.warnings
+    assert any("ann_sliver" in warning for warning in result.warnings)
+    categories = json.loads((tmp_path / "streamed" / "annotations.json").read_text())["categories"]
+    assert {"name": "sliver", "supercategory": "polygon"} in [
+        {key: row[key] for key in ("name", "supercategory")} for row in categories
+    ]
+
+
+@pytest.mark.asyncio
+async def test_streaming_export_bounds_concurrency_and_reports_progress(tmp_path: Path):
+    source = _FakeSource([_resolved_datum(index, "train") for index in range(10)])
+    updates: list[ExportProgress] = []
+
+    await stream_dataset_version_export(
+        source,
+        "dataset-a",
+        "1.0.0",
+        format="coco",
+        destination=tmp_path / "coco",
+        include_media=False,
+        concurrency=4,
+        progress_callback=updates.append,
+    )
+
+    assert 1 < source.max_in_flight <= 4
+    assert [update.processed_datums for update in updates] == list(range(1, 11))
+    assert updates[-1].total_datums == 10
+    assert updates[-1].exported_assets == 10
+    assert updates[-1].payload_bytes > 0
+    assert not (tmp_path / "coco" / "images").exists()
+
+
+@pytest.mark.asyncio
+async def test_streaming_export_skips_datums_without_assets(tmp_path: Path):
+    empty = _resolved_datum(1, "train")
+    empty.datum.asset_refs = {}
+    empty.assets = {}
+    source = _FakeSource([_resolved_datum(0, "train"), empty])
+    source.resolved["datum_1"] = empty
+
+    result = await stream_dataset_version_export(
+        source, "dataset-a", "1.0.0", format="coco", destination=tmp_path / "coco"
+    )
+
+    assert result.asset_count == 1
+    assert "Skipped datum datum_1 because it does not reference any assets." in result.warnings
+
+
+@pytest.mark.asyncio
+async def test_streaming_export_failure_cancels_pending_fetches(tmp_path: Path):
+    source = _FakeSource([_resolved_datum(index, "train") for index in range(6)])
+    original = source.get_asset_payload
+
+    async def failing_payload(asset_id):
+        if asset_id == "asset_2":
+            raise FileNotFoundError("payload missing")
+        return await original(asset_id)
+
+    source.get_asset_payload = failing_payload
+
+    with pytest.raises(FileNotFoundError, match="payload missing"):
+        await stream_dataset_version_export(
+            source, "dataset-a", "1.0.0", format="coco", destination=tmp_path / "coco", concurrency=2
+        )
+    assert source.in_flight == 0
+    assert not (tmp_path / "coco" / "annotations").exists()
+
+
+@pytest.mark.asyncio
+async def test_streaming_export_validates_arguments(tmp_path: Path):
+    source = _FakeSource([_resolved_datum(0, "train")])
+    with pytest.raises(ValueError, match="concurrency must be at least 1"):
+        await stream_dataset_version_export(
+            source, "dataset-a", "1.0.0", format="coco", destination=tmp_path / "a", concurrency=0
+        )
+    with pytest.raises(ValueError, match="Unsupported dataset export format"):
+        await stream_dataset_version_export(source, "dataset-a", "1.0.0", format="voc", destination=tmp_path / "b")
+
+
+class _FakeGeneratedDataset:
+    def __init__(self, rows):
+        self.rows = rows
+
+    @classmethod
+    def from_generator(cls, generator, gen_kwargs):
+        return cls(list(generator(**gen_kwargs)))
+
+    def save_to_disk(self, path: str):
+        Path(path).mkdir(parents=True, exist_ok=True)
+        (Path(path) / "dataset.json").write_text(json.dumps(self.rows, sort_keys=True))
+
+
+class _FakeDatasetDict(dict):
+    def save_to_disk(self, path: str):
+        serialized = {name: dataset.rows for name, dataset in self.items()}
+        (Path(path) / "dataset_dict.json").write_text(json.dumps(serialized, sort_keys=True))
+
+
+@pytest.mark.asyncio
+async def test_streaming_huggingface_export_spools_rows_per_split(tmp_path: Path, monkeypatch):
+    from mindtrace.datalake.exporters import huggingface as huggingface_exporter
+
+    fake_module = SimpleNamespace(Dataset=_FakeGeneratedDataset, DatasetDict=_FakeDatasetDict)
+    monkeypatch.setattr(huggingface_exporter.importlib, "import_module", lambda name: fake_module)
+    source = _FakeSource([_resolved_datum(index, "train" if index % 2 else "val") for index in range(5)])
+
+    result = await stream_dataset_version_export(
+        source, "dataset-a", "1.0.0", format="huggingface", destination=tmp_path / "hf", concurrency=2
+    )
+    payload = json.loads((tmp_path / "hf" / "dataset_dict.json").read_text())
+
+    assert [row["asset_id"] for row in payload["val"]] == ["asset_0", "asset_2", "asset_4"]
+    assert [row["image_path"] for row in payload["train"]] == ["media/train/asset_1.png", "media/train/asset_3.png"]
+    assert (tmp_path / "hf" / "media" / "train" / "asset_1.png").read_bytes() == png_bytes((9, 6))
+    assert result.files_written[-1] == "."
+    assert result.annotation_count == 15
+
+
+@pytest.mark.asyncio
+async def test_streaming_huggingface_export_checks_dependency_before_writing(tmp_path: Path, monkeypatch):
+    from mindtrace.datalake.exporters import huggingface as huggingface_exporter
+
+    monkeypatch.setattr(
+        huggingface_exporter.importlib, "import_module", Mock(side_effect=ImportError("datasets missing"))
+    )
+    source = _FakeSource([_resolved_datum(0, "train")])
+
+    with pytest.raises(ImportError, match=r"mindtrace-datalake\[export-huggingface\]"):
+        await stream_dataset_version_export(
+            source, "dataset-a", "1.0.0", format="huggingface", destination=tmp_path / "hf"
+        )
+    assert not (tmp_path / "hf").exists()
@@ -102,6 +102,18 @@ class FakeReplicationTaskDatabase:
         self._tasks[task.task_id] = task
         return task
 
+    async def find_one_and_update(self, query: dict, update: dict) -> ReplicationTask | None:
+        for task in self._tasks.values():
+            matches = all(
+                getattr(task, key) not in value["$nin"] if isinstance(value, dict) else getattr(task, key) == value
+                for key, value in query.items()
+            )
+            if matches:
+                updated = task.model_copy(update=update["$set"])
+                self._tasks[task.task_id] = updated
+                return updated
+        return None
+
     async def delete(self, pk: str) -> None:
         for tid, task in list(self._tasks.items()):
             oid = getattr(task, "id", None)
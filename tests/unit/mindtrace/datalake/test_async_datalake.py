@@ -9,6 +9,7 @@ from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from bson import ObjectId
 from datalake_unit_mongo_uri import DATALAKE_UNIT_MONGO_URI
 from export_test_utils import (
     png_bytes as export_fixture_png_bytes,
@@ -45,6 +46,7 @@ from mindtrace.datalake.types import (
     Collection,
     CollectionItem,
     DatasetVersion,
+    DatasetVersionMember,
     Datum,
     DirectUploadSession,
     DuplicateAliasError,
@@ -57,6 +59,11 @@ from mindtrace.datalake.types import (
 from mindtrace.registry.core.exceptions import RegistryObjectNotFound, StoreLocationNotFound
 
 
+def _view_doc(datum: Datum, ordinal: int, **extra) -> dict:
+    """Raw document as yielded by the dataset view aggregation."""
+    return {**datum.model_dump(exclude={"id"}), "_view_ordinal": ordinal, **extra}
+
+
 class TestAsyncDatalakeUnit:
     @staticmethod
     def _async_iterable(items):
@@ -474,6 +481,147 @@ class TestAsyncDatalakeUnit:
     def test_matches_structured_filters_accepts_empty_filters(self, async_datalake):
         assert async_datalake._matches_structured_filters({"kind": "image"}, []) is True
 
+    @pytest.mark.parametrize(
+        ("filter_item", "expected"),
+        [
+            pytest.param(
+                StructuredFilter(field="split", op="eq", value="train"),
+                {"$and": [{"split": {"$eq": "train"}}, {"split": {"$not": {"$type": "array"}}}]},
+                id="eq",
+            ),
+            pytest.param(
+                StructuredFilter(field="tags", op="eq", value=["a", "b"]), {"tags": {"$eq": ["a", "b"]}}, id="eq-list"
+            ),
+            pytest.param(
+                StructuredFilter(field="split", op="ne", value=None),
+                {"$nor": [{"$and": [{"split": {"$eq": None}}, {"split": {"$not": {"$type": "array"}}}]}]},
+                id="ne",
+            ),
+            pytest.param(
+                StructuredFilter(field="metadata.rank", op="gte", value=3),
+                {"$and": [{"metadata.rank": {"$gte": 3}}, {"metadata.rank": {"$not": {"$type": "array"}}}]},
+                id="gte",
+            ),
+            pytest.param(
+                StructuredFilter(field="rank", op="lt", value=3),
+                {"$and": [{"rank": {"$lt": 3}}, {"rank": {"$not": {"$type": "array"}}}]},
+                id="lt",
+            ),
+            pytest.param(
+                StructuredFilter(field="tag", op="in", value=("a", "b")),
+                {"$and": [{"tag": {"$in": ["a", "b"]}}, {"tag": {"$not": {"$type": "array"}}}]},
+                id="in",
+            ),
+            pytest.param(
+                StructuredFilter(field="tag", op="in", value=["a", ["b", "c"]]),
+                {
+                    "$or": [
+                        {"$and": [{"tag": {"$in": ["a"]}}, {"tag": {"$not": {"$type": "array"}}}]},
+                        {"tag": {"$in": [["b", "c"]]}},
+                    ]
+                },
+                id="in-list-values",
+            ),
+            pytest.param(
+                StructuredFilter(field="tag", op="in", value=None),
+                {"$and": [{"tag": {"$in": []}}, {"tag": {"$not": {"$type": "array"}}}]},
+                id="in-none",
+            ),
+            pytest.param(
+                StructuredFilter(field="name", op="contains", value="a.b"),
+                {
+                    "$or": [
+                        {
+                            "$and": [
+                                {"name": {"$type": "string"}},
+                                {"name": {"$not": {"$type": "array"}}},
+                                {"name": {"$regex": "a\\.b"}},
+                            ]
+                        },
+                        {"name": {"$elemMatch": {"$eq": "a.b"}}},
+                    ]
+                },
+                id="contains-str",
+            ),
+            pytest.param(
+                StructuredFilter(field="ids", op="contains", value=3),
+                {"ids": {"$elemMatch": {"$eq": 3}}},
+                id="contains",
+            ),
+            pytest.param(
+                StructuredFilter(field="kind", op="exists", value=True),
+                {"$nor": [{"$and": [{"kind": {"$eq": None}}, {"kind": {"$not": {"$type": "array"}}}]}]},
+                id="exists",
+            ),
+            pytest.param(
+                StructuredFilter(field="kind", op="exists", value=False),
+                {"$and": [{"kind": {"$eq": None}}, {"kind": {"$not": {"$type": "array"}}}]},
+                id="not-exists",
+            ),
+        ],
+    )
+    def test_compile_structured_filters_variants(self, async_datalake, filter_item, expected):
+        assert async_datalake._compile_structured_filters([filter_item]) == expected
+
+    def test_compile_structured_filters_combines_clauses(self, async_datalake):
+        assert async_datalake._compile_structured_filters([]) == {}
+        assert async_datalake._compile_structured_filters(
+            [
+                StructuredFilter(field="split", op="eq", value="train"),
+                StructuredFilter(field="metadata.rank", op="gt", value=1),
+            ]
+        ) == {
+            "$and": [
+                {"$and": [{"split": {"$eq": "train"}}, {"split": {"$not": {"$type": "array"}}}]},
+                {"$and": [{"metadata.rank": {"$gt": 1}}, {"metadata.rank": {"$not": {"$type": "array"}}}]},
+            ]
+        }
+
+    @pytest.mark.parametrize(
+        ("filter_item", "matches", "query"),
+        [
+            pytest.param(
+                StructuredFilter(field="tags", op="eq", value="a"),
+                False,
+                {"$and": [{"tags": {"$eq": "a"}}, {"tags": {"$not": {"$type": "array"}}}]},
+                id="eq-element",
+            ),
+            pytest.param(
+                StructuredFilter(field="tags", op="eq", value=["a", "b"]),
+                True,
+                {"tags": {"$eq": ["a", "b"]}},
+                id="eq-whole",
+            ),
+            pytest.param(
+                StructuredFilter(field="tags", op="ne", value="a"),
+                True,
+                {"$nor": [{"$and": [{"tags": {"$eq": "a"}}, {"tags": {"$not": {"$type": "array"}}}]}]},
+                id="ne-element",
+            ),
+            pytest.param(
+                StructuredFilter(field="tags", op="in", value=["a", "c"]),
+                False,
+                {"$and": [{"tags": {"$in": ["a", "c"]}}, {"tags": {"$not": {"$type": "array"}}}]},
+                id="in-element",
+            ),
+            pytest.param(
+                StructuredFilter(field="tags", op="in", value=[["a", "b"]]),
+                True,
+                {"tags": {"$in": [["a", "b"]]}},
+                id="in-whole",
+            ),
+        ],
+    )
+    def test_structured_filters_compare_list_fields_as_whole_values(self, async_datalake, filter_item, matches, query):
+        # Mongo would match a single element of {"tags": ["a", "b"]}; the compiled queries exclude arrays from
+        # scalar comparisons, so both paths agree.
+        assert async_datalake._matches_structured_filters({"tags": ["a", "b"]}, [filter_item]) is matches
+        assert async_datalake._compile_structured_filters([filter_item]) == query
+
+    def test_compile_structured_filters_rejects_scalar_in_value(self, async_datalake):
+        with pytest.raises(ValueError, match="requires a list value"):
+            async_datalake._compile_structured_filters([StructuredFilter(field="tag", op="in", value="abc")])
+
     @pytest.mark.asyncio
     async def test_list_assets_page_builds_and_consumes_cursor(self, async_datalake, mock_odm):
         asset_1 = Asset(
@@ -703,8 +851,14 @@ class TestAsyncDatalakeUnit:
         )
 
         async_datalake.get_dataset_version = AsyncMock(return_value=dataset_version)
-        async_datalake.datum_database = MagicMock()
-        async_datalake.datum_database.find = AsyncMock(return_value=[datum_2, datum_1])
+        async_datalake.dataset_version_database = MagicMock()
+        async_datalake.dataset_version_database.aggregate = AsyncMock(
+            side_effect=[
+                [_view_doc(datum_1, 0), _view_doc(datum_2, 1)],
+                [{"total": 2}],
+                [_view_doc(datum_2, 1)],
+            ]
+        )
         async_datalake.asset_database = MagicMock()
         async_datalake.asset_database.find = AsyncMock(return_value=[asset_2, asset_1])
 
@@ -723,7 +877,14 @@ class TestAsyncDatalakeUnit:
         assert first_page.page.has_more is True
         assert first_page.items[0].datum_id == "datum_1"
         assert first_page.items[0].assets == {"image": asset_1}
-        assert async_datalake.datum_database.find.await_count == 2
+        page_pipeline = async_datalake.dataset_version_database.aggregate.await_args_list[0].args[0]
+        assert page_pipeline[0] == {"$match": {"dataset_version_id": dataset_version.dataset_version_id}}
+        assert page_pipeline[-2:] == [
+            {"$match": {"$and": [{"split": {"$eq": "train"}}, {"split": {"$not": {"$type": "array"}}}]}},
+            {"$limit": 2},
+        ]
+        count_pipeline = async_datalake.dataset_version_database.aggregate.await_args_list[1].args[0]
+        assert count_pipeline[-1] == {"$count": "total"}
         async_datalake.asset_database.find.assert_awaited_once_with({"asset_id": {"$in": ["asset_1"]}})
 
         decoded = async_datalake._decode_cursor(
@@ -746,7 +907,9 @@ class TestAsyncDatalakeUnit:
         assert second_page.items[0].datum_id == "datum_2"
         assert second_page.items[0].assets is None
         assert second_page.page.has_more is False
-        assert async_datalake.datum_database.find.await_count == 3
+        second_pipeline = async_datalake.dataset_version_database.aggregate.await_args_list[2].args[0]
+        assert second_pipeline[1] == {"$project": {"_id": 0, "manifest": {"$slice": ["$manifest", 1, 1]}}}
+        assert second_pipeline[3] == {"$project": {"ordinal": {"$add": ["$offset", 1]}, "datum_id": "$manifest"}}
 
     @pytest.mark.asyncio
     async def test_view_dataset_version_page_supports_annotation_expansion_and_filter_skips(self, async_datalake):
@@ -755,7 +918,6 @@ class TestAsyncDatalakeUnit:
             version="1.0.0",
             manifest=["datum_skip", "datum_keep"],
         )
-        skipped = Datum(datum_id="datum_skip", asset_refs={"image": "asset_skip"}, split="val")
         kept = Datum(
             datum_id="datum_keep",
             asset_refs={"image": "asset_keep"},
@@ -774,8 +936,8 @@ class TestAsyncDatalakeUnit:
         annotation_record.annotation_id = "ann_1"
 
         async_datalake.get_dataset_version = AsyncMock(return_value=dataset_version)
-        async_datalake.datum_database = MagicMock()
-        async_datalake.datum_database.find = AsyncMock(return_value=[kept, skipped])
+        async_datalake.dataset_version_database = MagicMock()
+        async_datalake.dataset_version_database.aggregate = AsyncMock(return_value=[_view_doc(kept, 1)])
         async_datalake.annotation_set_database = MagicMock()
         async_datalake.annotation_set_database.find = AsyncMock(return_value=[annotation_set])
         async_datalake.annotation_record_database = MagicMock()
@@ -808,21 +970,16 @@ class TestAsyncDatalakeUnit:
         )
 
     @pytest.mark.asyncio
-    async def test_view_dataset_version_page_scans_manifest_in_chunks_for_sparse_filters(self, async_datalake):
-        skipped_datums = [Datum(datum_id=f"datum_skip_{index}", split="val") for index in range(100)]
+    async def test_view_dataset_version_page_filters_sparse_manifests_in_one_aggregation(self, async_datalake):
         kept_datum = Datum(datum_id="datum_keep", split="train", metadata={"rank": 101})
-        manifest = [datum.datum_id for datum in skipped_datums] + [kept_datum.datum_id]
+        manifest = [f"datum_skip_{index}" for index in range(100)] + [kept_datum.datum_id]
         dataset_version = DatasetVersion(dataset_name="demo", version="1.0.0", manifest=manifest)
-        datums_by_id = {datum.datum_id: datum for datum in [*skipped_datums, kept_datum]}
 
         async_datalake.get_dataset_version = AsyncMock(return_value=dataset_version)
         async_datalake.datum_database = MagicMock()
-
-        async def datum_find_side_effect(query):
-            ids = query["datum_id"]["$in"]
-            return [datums_by_id[datum_id] for datum_id in reversed(ids)]
-
-        async_datalake.datum_database.find = AsyncMock(side_effect=datum_find_side_effect)
+        async_datalake.datum_database.find = AsyncMock()
+        async_datalake.dataset_version_database = MagicMock()
+        async_datalake.dataset_version_database.aggregate = AsyncMock(return_value=[_view_doc(kept_datum, 100)])
 
         page = await async_datalake.view_dataset_version_page(
             "demo",
@@ -833,7 +990,83 @@ class TestAsyncDatalakeUnit:
 
         assert [row.datum_id for row in page.items] == ["datum_keep"]
         assert page.page.has_more is False
-        assert async_datalake.datum_database.find.await_count == 2
+        async_datalake.dataset_version_database.aggregate.assert_awaited_once()
+        async_datalake.datum_database.find.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_view_dataset_version_page_cursor_resumes_after_last_ordinal(self, async_datalake):
+        datum = Datum(datum_id="datum_9", split="train")
+        dataset_version = DatasetVersion(
+            dataset_name="demo",
+            version="1.0.0",
+            manifest=[f"datum_{index}" for index in range(10)],
+        )
+        resource = "dataset_version_view:demo:1.0.0"
+        cursor = async_datalake._encode_cursor(
+            CursorEnvelope(
+                resource=resource,
+                sort="manifest_order",
+                filter_fingerprint=async_datalake._cursor_filter_fingerprint([]),
+                last_key={"ordinal": 6, "datum_id": "datum_6"},
+            )
+        )
+
+        async_datalake.get_dataset_version = AsyncMock(return_value=dataset_version)
+        async_datalake.dataset_version_database = MagicMock()
+        async_datalake.dataset_version_database.aggregate = AsyncMock(
+            return_value=[_view_doc(datum, 9, _id=ObjectId())]
+        )
+
+        page = await async_datalake.view_dataset_version_page(
+            "demo",
+            "1.0.0",
+            limit=2,
+            cursor=cursor,
+            expand=DatasetViewExpand(assets=False),
+        )
+
+        assert [row.datum_id for row in page.items] == ["datum_9"]
+        assert page.page.has_more is False
+        pipeline = async_datalake.dataset_version_database.aggregate.await_args.args[0]
+        assert pipeline[1] == {"$project": {"_id": 0, "manifest": {"$slice": ["$manifest", 7, 3]}}}
+        assert pipeline[-1] == {"$limit": 3}
+        assert not any("$match" in stage and stage is not pipeline[0] for stage in pipeline)
+
+    @pytest.mark.asyncio
+    async def test_view_dataset_version_page_reads_collection_storage_members(self, async_datalake):
+        datum = Datum(datum_id="datum_3", split="train")
+        dataset_version = DatasetVersion(
+            dataset_name="demo",
+            version="1.0.0",
+            manifest_storage="collection",
+            datum_count=10,
+        )
+        async_datalake.get_dataset_version = AsyncMock(return_value=dataset_version)
+        async_datalake.dataset_version_database = MagicMock()
+        async_datalake.dataset_version_database.aggregate = AsyncMock()
+        async_datalake.dataset_version_member_database = MagicMock()
+        async_datalake.dataset_version_member_database.aggregate = AsyncMock(return_value=[_view_doc(datum, 3)])
+
+        page = await async_datalake.view_dataset_version_page(
+            "demo",
+            "1.0.0",
+            limit=5,
+            filters=[StructuredFilter(field="split", op="eq", value="train")],
+            expand=DatasetViewExpand(assets=False),
+        )
+
+        assert [row.datum_id for row in page.items] == ["datum_3"]
+        async_datalake.dataset_version_database.aggregate.assert_not_awaited()
+        pipeline = async_datalake.dataset_version_member_database.aggregate.await_args.args[0]
+        assert pipeline[:3] == [
+            {"$match": {"dataset_version_id": dataset_version.dataset_version_id, "ordinal": {"$gte": 0}}},
+            {"$sort": {"ordinal": 1}},
+            {"$project": {"_id": 0, "ordinal": 1, "datum_id": 1}},
+        ]
+        assert pipeline[-2:] == [
+            {"$match": {"$and": [{"split": {"$eq": "train"}}, {"split": {"$not": {"$type": "array"}}}]}},
+            {"$limit": 6},
+        ]
 
     @pytest.mark.asyncio
     async def test_view_dataset_version_page_rejects_unsupported_sort(self, async_datalake):
@@ -848,14 +1081,14 @@ class TestAsyncDatalakeUnit:
         async_datalake.config["MINDTRACE_DATALAKE"]["DEFAULT_PAGE_LIMIT"] = 7
         async_datalake.config["MINDTRACE_DATALAKE"]["MAX_PAGE_LIMIT"] = 9
         async_datalake.get_dataset_version = AsyncMock(return_value=dataset_version)
-        async_datalake.datum_database = MagicMock()
-        async_datalake.datum_database.find = AsyncMock(return_value=[datum])
+        async_datalake.dataset_version_database = MagicMock()
+        async_datalake.dataset_version_database.aggregate = AsyncMock(return_value=[_view_doc(datum, 0)])
 
         page = await async_datalake.view_dataset_version_page("demo", "1.0.0")
 
         assert page.page.limit == 7
-        async_datalake.get_dataset_version.assert_awaited_once_with("demo", "1.0.0")
-        async_datalake.datum_database.find.assert_awaited_once_with({"datum_id": {"$in": ["datum_1"]}})
+        async_datalake.get_dataset_version.assert_awaited_once_with("demo", "1.0.0", include_manifest=False)
+        assert async_datalake.dataset_version_database.aggregate.await_args.args[0][-1] == {"$limit": 8}
 
     @pytest.mark.asyncio
     async def test_view_dataset_version_page_rejects_configured_max_before_lookup(self, async_datalake):
@@ -911,6 +1144,30 @@ class TestAsyncDatalakeUnit:
         assert info == {"size": 123}
         assert copied.version == "v2"
 
+    @pytest.mark.asyncio
+    async def test_open_object_file_yields_stored_payload_path(self, async_datalake, mock_store, tmp_path):
+        (tmp_path / "data.txt").write_bytes(b"payload")
+        artifact = mock_store.open_artifact.return_value
+        artifact.__enter__.return_value = (tmp_path, {"class": "builtins.bytes"})
+
+        async with async_datalake.open_object_file(
+            StorageRef(mount="nas", name="images/cat.jpg", version="v1")
+        ) as path:
+            assert path.read_bytes() == b"payload"
+
+        assert mock_store.open_artifact.call_args.kwargs["version"] == "v1"
+        artifact.__exit__.assert_called_once_with(None, None, None)
+
+    @pytest.mark.asyncio
+    async def test_open_object_file_rejects_non_bytes_objects(self, async_datalake, mock_store, tmp_path):
+        artifact = mock_store.open_artifact.return_value
+        artifact.__enter__.return_value = (tmp_path, {"class": "builtins.dict"})
+
+        with pytest.raises(ValueError, match="not raw bytes"):
+            async with async_datalake.open_object_file(StorageRef(mount="nas", name="meta.json", version="v1")):
+                pass
+        artifact.__exit__.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_put_object_offloads_store_save_and_allows_concurrent_writes(self, async_datalake, mock_store):
         active = 0
@@ -1632,6 +1889,175 @@ class TestAsyncDatalakeUnit:
 
         async_datalake.get_annotation_set.assert_awaited_once_with("set_2")
 
+    @pytest.mark.asyncio
+    async def test_create_datums_checks_references_in_bulk_and_inserts_once(self, async_datalake, mock_odm):
+        storage_ref = StorageRef(mount="temp", name="x")
+        assets = [
+            Asset(asset_id=f"asset_{index}", kind="image", media_type="image/png", storage_ref=storage_ref)
+            for index in range(2)
+        ]
+        annotation_set = AnnotationSet(
+            annotation_set_id="set_1", name="gt", purpose="ground_truth", source_type="human"
+        )
+
+        async def find(query):
+            if "asset_id" in query:
+                return assets
+            return [annotation_set]
+
+        mock_odm.find = AsyncMock(side_effect=find)
+        mock_odm.insert_many = AsyncMock(side_effect=lambda documents, ordered: documents)
+
+        datums = await async_datalake.create_datums(
+            [
+                {"asset_refs": {"image": "asset_0"}, "split": "train", "annotation_set_ids": ["set_1"]},
+                {"asset_refs": {"image": "asset_1", "thumb": "asset_0"}, "metadata": {"source": "demo"}},
+            ]
+        )
+
+        assert [datum.asset_refs for datum in datums] == [
+            {"image": "asset_0"},
+            {"image": "asset_1", "thumb": "asset_0"},
+        ]
+        assert datums[0].split == "train"
+        assert datums[0].annotation_set_ids == ["set_1"]
+        assert datums[1].metadata == {"source": "demo"}
+        assert mock_odm.find.await_args_list[0].args[0] == {"asset_id": {"$in": ["asset_0", "asset_1"]}}
+        assert mock_odm.find.await_count == 2
+        mock_odm.insert_many.assert_awaited_once()
+        assert await async_datalake.create_datums([]) == []
+
+    @pytest.mark.asyncio
+    async def test_create_datums_rejects_missing_references(self, async_datalake, mock_odm):
+        mock_odm.find = AsyncMock(return_value=[])
+        mock_odm.insert_many = AsyncMock()
+
+        with pytest.raises(DocumentNotFoundError, match="Asset with asset_id asset_missing not found"):
+            await async_datalake.create_datums([{"asset_refs": {"image": "asset_missing"}}])
+        with pytest.raises(ValueError, match="non-empty asset ids"):
+            await async_datalake.create_datums([{"asset_refs": {"image": " "}}])
+        mock_odm.insert_many.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_create_assets_from_objects_saves_payloads_and_inserts_once(self, async_datalake, mock_odm):
+        async_datalake.put_object = AsyncMock(
+            side_effect=lambda **kwargs: StorageRef(mount=kwargs["mount"] or "temp", name=kwargs["name"], version="v1")
+        )
+        mock_odm.insert_many = AsyncMock(side_effect=lambda documents, ordered: documents)
+        async_datalake.ensure_primary_asset_aliases = AsyncMock()
+
+        assets = await async_datalake.create_assets_from_objects(
+            [
+                {
+                    "name": "images/a.jpg",
+                    "obj": b"a",
+                    "kind": "image",
+                    "media_type": "image/jpeg",
+                    "size_bytes": 1,
+                    "asset_metadata": {"source": "demo"},
+                    "on_conflict": "overwrite",
+                },
+                {"name": "masks/a.png", "obj": b"m", "kind": "mask", "media_type": "image/png", "mount": "nas"},
+            ]
+        )
+
+        assert [asset.kind for asset in assets] == ["image", "mask"]
+        assert [asset.storage_ref.name for asset in assets] == ["images/a.jpg", "masks/a.png"]
+        assert assets[1].storage_ref.mount == "nas"
+        assert assets[0].metadata == {"source": "demo"}
+        assert assets[0].size_bytes == 1
+        assert async_datalake.put_object.await_args_list[0].kwargs["on_conflict"] == "overwrite"
+        mock_odm.insert_many.assert_awaited_once()
+        async_datalake.ensure_primary_asset_aliases.assert_awaited_once_with(assets)
+        assert await async_datalake.create_assets_from_objects([]) == []
+
+    @pytest.mark.asyncio
+    async def test_create_annotation_sets_inserts_records_then_sets(self, async_datalake, mock_odm):
+        schema = AnnotationSchema(
+            name="bbox-demo",
+            version="1.0.0",
+            task_type="detection",
+            allowed_annotation_kinds=["bbox"],
+            labels=[AnnotationLabelDefinition(name="dent", id=7)],
+        )
+        async_datalake.get_annotation_schema = AsyncMock(return_value=schema)
+        mock_odm.insert_many = AsyncMock(side_effect=lambda documents, ordered: documents)
+        record = {
+            "kind": "bbox",
+            "label": "dent",
+            "subject": {"kind": "asset", "id": "asset_1"},
+            "source": {"type": "human", "name": "review-ui"},
+            "geometry": {"type": "bbox", "x": 1, "y": 2, "width": 3, "height": 4},
+        }
+
+        created = await async_datalake.create_annotation_sets(
+            [
+                {
+                    "name": "gt-a",
+                    "purpose": "ground_truth",
+                    "source_type": "human",
+                    "status": "active",
+                    "annotation_schema_id": schema.annotation_schema_id,
+                    "annotations": [record, record],
+                },
+                {
+                    "name": "gt-b",
+                    "purpose": "ground_truth",
+                    "source_type": "human",
+                    "annotation_schema_id": schema.annotation_schema_id,
+                },
+            ]
+        )
+
+        async_datalake.get_annotation_schema.assert_awaited_once_with(schema.annotation_schema_id)
+        inserted_records = mock_odm.insert_many.await_args_list[0].args[0]
+        assert [record.label for record in inserted_records] == ["dent", "dent"]
+        assert len({record.annotation_id for record in inserted_records}) == 2
+        assert created[0].annotation_record_ids == [record.annotation_id for record in inserted_records]
+        assert created[0].status == "active"
+        assert created[1].annotation_record_ids == []
+        assert created[1].status == "draft"
+        assert await async_datalake.create_annotation_sets([]) == []
+
+    @pytest.mark.asyncio
+    async def test_create_annotation_sets_validates_and_rolls_back_records(self, async_datalake, mock_odm):
+        schema = AnnotationSchema(
+            name="cls-demo",
+            version="1.0.0",
+            task_type="classification",
+            allowed_annotation_kinds=["classification"],
+            labels=[AnnotationLabelDefinition(name="cat", id=1)],
+        )
+        async_datalake.get_annotation_schema = AsyncMock(return_value=schema)
+        spec = {
+            "name": "gt",
+            "purpose": "ground_truth",
+            "source_type": "human",
+            "annotation_schema_id": schema.annotation_schema_id,
+            "annotations": [{"kind": "classification", "label": "dog", "source": {"type": "human", "name": "ui"}}],
+        }
+        mock_odm.insert_many = AsyncMock()
+
+        with pytest.raises(AnnotationSchemaValidationError):
+            await async_datalake.create_annotation_sets([spec])
+        mock_odm.insert_many.assert_not_awaited()
+
+        spec["annotations"][0]["label"] = "cat"
+        records: list[AnnotationRecord] = []
+
+        async def insert_many(documents, ordered):
+            if documents and isinstance(documents[0], AnnotationSet):
+                raise RuntimeError("set insert failed")
+            records.extend(documents)
+            return documents
+
+        mock_odm.insert_many = AsyncMock(side_effect=insert_many)
+        async_datalake._rollback_inserted_annotation_records = AsyncMock()
+
+        with pytest.raises(RuntimeError, match="set insert failed"):
+            await async_datalake.create_annotation_sets([spec])
+        async_datalake._rollback_inserted_annotation_records.assert_awaited_once_with(records)
+
     @pytest.mark.asyncio
     async def test_validate_asset_refs_rejects_blank_ids(self, async_datalake):
         with pytest.raises(ValueError, match="non-empty asset ids"):
@@ -1703,17 +2129,15 @@ class TestAsyncDatalakeUnit:
 
     @pytest.mark.asyncio
     async def test_dataset_version_async(self, async_datalake, mock_odm):
-        mock_odm.find.return_value = []
-        async_datalake.get_datum = AsyncMock(
-            side_effect=[
-                Datum(asset_refs={"image": "asset_1"}),
-                Datum(asset_refs={"image": "asset_2"}),
-            ]
-        )
+        mock_odm.find.side_effect = [[], [Datum(datum_id="datum_2"), Datum(datum_id="datum_1")]]
         created = await async_datalake.create_dataset_version(
             dataset_name="demo", version="0.1.0", manifest=["datum_1", "datum_2"]
         )
         assert isinstance(created, DatasetVersion)
+        assert created.manifest_storage == "inline"
+        assert created.size == 2
+        mock_odm.find.assert_awaited_with({"datum_id": {"$in": ["datum_1", "datum_2"]}})
+        mock_odm.find.side_effect = None
         existing = DatasetVersion(dataset_name="demo", version="0.1.0")
         mock_odm.find.return_value = [existing]
         with pytest.raises(ValueError):
@@ -1730,6 +2154,207 @@ class TestAsyncDatalakeUnit:
                 manifest=["datum_1", "datum_1"],
             )
 
+    @pytest.mark.asyncio
+    async def test_create_dataset_version_reports_first_missing_datum(self, async_datalake, mock_odm):
+        mock_odm.find.side_effect = [[], [Datum(datum_id="datum_1")]]
+
+        with pytest.raises(DocumentNotFoundError, match="datum_2 not found"):
+            await async_datalake.create_dataset_version(
+                dataset_name="demo",
+                version="0.1.0",
+                manifest=["datum_1", "datum_2", "datum_3"],
+            )
+
+    @pytest.mark.asyncio
+    async def test_create_dataset_version_with_collection_storage_writes_member_rows(self, async_datalake):
+        manifest = [f"datum_{index}" for index in range(5)]
+        async_datalake.dataset_version_database = MagicMock()
+        async_datalake.dataset_version_database.find = AsyncMock(return_value=[])
+        async_datalake.dataset_version_database.insert = AsyncMock(side_effect=lambda obj: obj)
+        async_datalake.datum_database = MagicMock()
+        async_datalake.datum_database.find = AsyncMock(
+            side_effect=lambda query: [Datum(datum_id=datum_id) for datum_id in query["datum_id"]["$in"]]
+        )
+        async_datalake.dataset_version_member_database = MagicMock()
+        async_datalake.dataset_version_member_database.insert_many = AsyncMock(side_effect=lambda objs, ordered: objs)
+
+        with patch("mindtrace.datalake.async_datalake._DATASET_VERSION_WRITE_BATCH", 2):
+            created = await async_datalake.create_dataset_version(
+                dataset_name="demo",
+                version="0.1.0",
+                manifest=manifest,
+                manifest_storage="collection",
+            )
+
+        assert created.manifest == manifest
+        assert async_datalake.datum_database.find.await_count == 3
+        member_batches = [
+            call.args[0] for call in async_datalake.dataset_version_member_database.insert_many.await_args_list
+        ]
+        assert [len(batch) for batch in member_batches] == [2, 2, 1]
+        members = [member for batch in member_batches for member in batch]
+        assert [(member.ordinal, member.datum_id) for member in members] == list(enumerate(manifest))
+        assert {member.dataset_version_id for member in members} == {created.dataset_version_id}
+        stored = async_datalake.dataset_version_database.insert.await_args.args[0]
+        assert stored.manifest == []
+        assert stored.manifest_storage == "collection"
+        assert stored.datum_count == 5
+        assert stored.size == 5
+
+    @pytest.mark.asyncio
+    async def test_get_dataset_version_loads_collection_manifest_on_request(self, async_datalake):
+        stored = DatasetVersion(dataset_name="demo", version="0.1.0", manifest_storage="collection", datum_count=2)
+        members = [
+            DatasetVersionMember(
+                dataset_version_id=stored.dataset_version_id,
+                dataset_name="demo",
+                version="0.1.0",
+                ordinal=ordinal,
+                datum_id=datum_id,
+            )
+            for ordinal, datum_id in enumerate(["datum_b", "datum_a"])
+        ]
+
+        async def member_iter(query, *, sort, batch_size):
+            assert query == {"dataset_version_id": stored.dataset_version_id}
+            assert sort == [("ordinal", 1)]
+            for member in members:
+                yield member
+
+        async_datalake.dataset_version_database = MagicMock()
+        async_datalake.dataset_version_database.find = AsyncMock(side_effect=lambda query: [stored.model_copy()])
+        async_datalake.dataset_version_member_database = MagicMock()
+        async_datalake.dataset_version_member_database.find_iter = MagicMock(side_effect=member_iter)
+
+        summary = await async_datalake.get_dataset_version("demo", "0.1.0", include_manifest=False)
+        assert summary.manifest == []
+        assert summary.size == 2
+        async_datalake.dataset_version_member_database.find_iter.assert_not_called()
+
+        loaded = await async_datalake.get_dataset_version("demo", "0.1.0")
+        assert loaded.manifest == ["datum_b", "datum_a"]
+
+    @pytest.mark.asyncio
+    async def test_iter_dataset_version_datum_ids_streams_either_layout(self, async_datalake):
+        inline = DatasetVersion(dataset_name="demo", version="0.1.0", manifest=["a", "b"])
+        async_datalake.get_dataset_version = AsyncMock(return_value=inline)
+        assert [datum_id async for datum_id in async_datalake.iter_dataset_version_datum_ids("demo", "0.1.0")] == [
+            "a",
+            "b",
+        ]
+        async_datalake.get_dataset_version.assert_awaited_with("demo", "0.1.0", include_manifest=False)
+
+        stored = DatasetVersion(dataset_name="demo", version="0.2.0", manifest_storage="collection", datum_count=2)
+
+        async def member_iter(query, *, sort, batch_size):
+            assert query == {"dataset_version_id": stored.dataset_version_id}
+            assert sort == [("ordinal", 1)]
+            assert batch_size == 500
+            for ordinal, datum_id in enumerate(["c", "d"]):
+                yield DatasetVersionMember(
+                    dataset_version_id=stored.dataset_version_id,
+                    dataset_name="demo",
+                    version="0.2.0",
+                    ordinal=ordinal,
+                    datum_id=datum_id,
+                )
+
+        async_datalake.get_dataset_version = AsyncMock(return_value=stored)
+        async_datalake.dataset_version_member_database = MagicMock()
+        async_datalake.dataset_version_member_database.find_iter = MagicMock(side_effect=member_iter)
+        datum_ids = [
+            datum_id
+            async for datum_id in async_datalake.iter_dataset_version_datum_ids("demo", "0.2.0", batch_size=500)
+        ]
+        assert datum_ids == ["c", "d"]
+
+    @pytest.mark.asyncio
+    async def test_get_dataset_version_datum_ids_by_ordinal(self, async_datalake):
+        inline = DatasetVersion(dataset_name="demo", version="0.1.0", manifest=["a", "b", "c", "d"])
+        async_datalake.get_dataset_version = AsyncMock(return_value=inline)
+        assert await async_datalake.get_dataset_version_datum_ids("demo", "0.1.0", offset=1, limit=2) == ["b", "c"]
+        assert await async_datalake.get_dataset_version_datum_ids("demo", "0.1.0", offset=2) == ["c", "d"]
+        async_datalake.get_dataset_version.assert_awaited_with("demo", "0.1.0", include_manifest=False)
+
+        stored = DatasetVersion(dataset_name="demo", version="0.2.0", manifest_storage="collection", datum_count=4)
+        async_datalake.get_dataset_version = AsyncMock(return_value=stored)
+        async_datalake.dataset_version_member_database = MagicMock()
+        async_datalake.dataset_version_member_database.find_window = AsyncMock(
+            return_value=[
+                DatasetVersionMember(
+                    dataset_version_id=stored.dataset_version_id,
+                    dataset_name="demo",
+                    version="0.2.0",
+                    ordinal=ordinal,
+                    datum_id=datum_id,
+                )
+                for ordinal, datum_id in [(1, "b"), (2, "c")]
+            ]
+        )
+        assert await async_datalake.get_dataset_version_datum_ids("demo", "0.2.0", offset=1, limit=2) == ["b", "c"]
+        async_datalake.dataset_version_member_database.find_window.assert_awaited_once_with(
+            {"dataset_version_id": stored.dataset_version_id, "ordinal": {"$gte": 1}},
+            sort=[("ordinal", 1)],
+            limit=2,
+        )
+        assert await async_datalake.get_dataset_version_datum_ids("demo", "0.2.0", limit=0) == []
+
+        with pytest.raises(ValueError, match="offset must be non-negative"):
+            await async_datalake.get_dataset_version_datum_ids("demo", "0.2.0", offset=-1)
+        with pytest.raises(ValueError, match="limit must be non-negative"):
+            await async_datalake.get_dataset_version_datum_ids("demo", "0.2.0", limit=-1)
+
+    @pytest.mark.asyncio
+    async def test_count_dataset_version_splits_groups_members_server_side(self, async_datalake):
+        stored = DatasetVersion(dataset_name="demo", version="0.1.0", manifest_storage="collection", datum_count=6)
+        async_datalake.get_dataset_version = AsyncMock(return_value=stored)
+        async_datalake.dataset_version_member_database = MagicMock()
+        async_datalake.dataset_version_member_database.aggregate = AsyncMock(
+            return_value=[{"_id": "train", "count": 4}, {"_id": None, "count": 2}]
+        )
+
+        assert await async_datalake.count_dataset_version_splits("demo", "0.1.0") == {"train": 4, None: 2}
+
+        pipeline = async_datalake.dataset_version_member_database.aggregate.await_args.args[0]
+        assert pipeline[0] == {"$match": {"dataset_version_id": stored.dataset_version_id, "ordinal": {"$gte": 0}}}
+        assert pipeline[-1] == {"$group": {"_id": "$datum.split", "count": {"$sum": 1}}}
+
+    @pytest.mark.asyncio
+    async def test_dataset_version_difference_uses_member_lookup_for_collection_storage(self, async_datalake):
+        base = DatasetVersion(dataset_name="demo", version="1", manifest_storage="collection", datum_count=3)
+        other = DatasetVersion(dataset_name="other", version="2", manifest_storage="collection", datum_count=1)
+        async_datalake.get_dataset_version = AsyncMock(side_effect=[base, other])
+        async_datalake.dataset_version_member_database = MagicMock()
+        async_datalake.dataset_version_member_database.aggregate = AsyncMock(
+            return_value=[{"datum_id": "a"}, {"datum_id": "c"}]
+        )
+
+        difference = await async_datalake.dataset_version_difference("demo", "1", "2", other_dataset_name="other")
+
+        assert difference == ["a", "c"]
+        assert async_datalake.get_dataset_version.await_args_list[1].args == ("other", "2")
+        pipeline = async_datalake.dataset_version_member_database.aggregate.await_args.args[0]
+        lookup = pipeline[3]["$lookup"]
+        assert lookup["from"] == "datalake_dataset_version_members"
+        assert {"$eq": ["$dataset_version_id", other.dataset_version_id]} in lookup["pipeline"][0]["$match"]["$expr"][
+            "$and"
+        ]
+        assert pipeline[4:] == [{"$match": {"other": {"$size": 0}}}, {"$project": {"_id": 0, "datum_id": 1}}]
+
+    @pytest.mark.asyncio
+    async def test_dataset_version_difference_against_inline_version(self, async_datalake):
+        base = DatasetVersion(dataset_name="demo", version="1", manifest=["a", "b", "c"])
+        other = DatasetVersion(dataset_name="demo", version="2", manifest=["b"])
+        async_datalake.get_dataset_version = AsyncMock(side_effect=[base, other])
+        async_datalake.dataset_version_database = MagicMock()
+        async_datalake.dataset_version_database.aggregate = AsyncMock(
+            return_value=[{"datum_id": "a"}, {"datum_id": "c"}]
+        )
+
+        assert await async_datalake.dataset_version_difference("demo", "1", "2") == ["a", "c"]
+        pipeline = async_datalake.dataset_version_database.aggregate.await_args.args[0]
+        assert pipeline[-2:] == [{"$match": {"datum_id": {"$nin": ["b"]}}}, {"$project": {"_id": 0, "datum_id": 1}}]
+
     @pytest.mark.asyncio
     async def test_dataset_version_get_list_and_resolve(self, async_datalake, mock_odm):
         dataset_version = DatasetVersion(dataset_name="demo", version="0.1.0", manifest=["datum_1", "datum_2"])
@@ -2699,8 +3324,16 @@ class TestAsyncDatalakeUnit:
     @pytest.mark.asyncio
     async def test_export_dataset_version_to_format_writes_coco(self, tmp_path: Path):
         resolved_dataset_version_mock = export_fixture_resolved_dataset_version()
+        dataset_version = resolved_dataset_version_mock.dataset_version
+
+        async def iter_datum_ids(dataset_name, version):
+            for datum_id in dataset_version.manifest:
+                yield datum_id
+
         fake_datalake = SimpleNamespace(
-            resolve_dataset_version=AsyncMock(return_value=resolved_dataset_version_mock),
+            get_dataset_version=AsyncMock(return_value=dataset_version),
+            iter_dataset_version_datum_ids=iter_datum_ids,
+            resolve_datum=AsyncMock(return_value=resolved_dataset_version_mock.datums[0]),
             get_asset_payload=AsyncMock(return_value=export_fixture_png_bytes()),
         )
 
@@ -2714,7 +3347,8 @@ class TestAsyncDatalakeUnit:
 
         assert result.format == "coco"
         assert (tmp_path / "coco" / "annotations" / "train.json").exists()
-        fake_datalake.resolve_dataset_version.assert_awaited_once_with("dataset-a", "1.0.0")
+        fake_datalake.get_dataset_version.assert_awaited_once_with("dataset-a", "1.0.0", include_manifest=False)
+        fake_datalake.resolve_datum.assert_awaited_once_with("datum_1")
 
 
 def _alias_fixture_make_store():
@@ -0,0 +1,113 @@
+import hashlib
+import threading
+import time
+
+import pytest
+
+from mindtrace.datalake.blocking_payload_io import (
+    PayloadByteBudget,
+    PayloadStream,
+    StreamedPayload,
+    stream_payload_to_path,
+)
+
+
+class TestPayloadStream:
+    def test_bytes_source_is_chunked_and_hashed(self):
+        data = b"0123456789" * 3
+        stream = PayloadStream(data, algorithms=("sha256", "md5"), chunk_size=8)
+
+        chunks = [bytes(chunk) for chunk in stream]
+
+        assert [len(chunk) for chunk in chunks] == [8, 8, 8, 6]
+        assert b"".join(chunks) == data
+        assert stream.total_size == len(data)
+        assert stream.result() == StreamedPayload(
+            size_bytes=len(data),
+            digests={"sha256": hashlib.sha256(data).hexdigest(), "md5": hashlib.md5(data).hexdigest()},
+        )
+
+    def test_file_source_is_streamed_to_path(self, tmp_path):
+        data = bytes(range(256)) * 40
+        source = tmp_path / "source.bin"
+        source.write_bytes(data)
+        target = tmp_path / "nested" / "target.bin"
+
+        result = stream_payload_to_path(target, PayloadStream(source, algorithms=("sha256",), chunk_size=1000))
+
+        assert target.read_bytes() == data
+        assert result.size_bytes == len(data)
+        assert result.digests["sha256"] == hashlib.sha256(data).hexdigest()
+
+    def test_bytes_source_chunks_are_charged_to_budget(self):
+        budget = PayloadByteBudget(16)
+        in_flight = [budget.in_flight for _ in PayloadStream(b"x" * 20, chunk_size=8, budget=budget)]
+        assert in_flight == [8, 8, 4]
+        assert budget.in_flight == 0
+
+    def test_result_reflects_only_consumed_bytes(self):
+        stream = PayloadStream(b"abcdef", chunk_size=4)
+        assert next(iter(stream)) == b"abcd"
+        assert stream.result().size_bytes == 4
+
+    def test_rejects_non_positive_chunk_size(self):
+        with pytest.raises(ValueError, match="chunk_size"):
+            PayloadStream(b"x", chunk_size=0)
+
+
+class TestPayloadByteBudget:
+    def test_rejects_non_positive_budget(self):
+        with pytest.raises(ValueError, match="max_bytes"):
+            PayloadByteBudget(0)
+
+    def test_unbounded_budget_does_not_track(self):
+        budget = PayloadByteBudget()
+        with budget.reserve(10**12):
+            assert budget.in_flight == 0
+
+    def test_oversized_reservation_is_capped_to_budget(self):
+        budget = PayloadByteBudget(10)
+        with budget.reserve(100):
+            assert budget.in_flight == 10
+        assert budget.in_flight == 0
+
+    def test_reservation_blocks_until_bytes_are_released(self):
+        budget = PayloadByteBudget(10)
+        acquired = threading.Event()
+
+        def reserve_more():
+            with budget.reserve(6):
+                acquired.set()
+
+        with budget.reserve(6):
+            worker = threading.Thread(target=reserve_more)
+            worker.start()
+            time.sleep(0.05)
+            assert not acquired.is_set()
+        worker.join(timeout=5)
+        assert acquired.is_set()
+        assert budget.in_flight == 0
+
+    def test_shared_budget_bounds_concurrent_file_streams(self, tmp_path):
+        budget = PayloadByteBudget(16)
+        peak = 0
+        sources = []
+        for index in range(4):
+            path = tmp_path / f"source-{index}.bin"
+            path.write_bytes(bytes([index]) * 100)
+            sources.append(path)
+
+        def drain(path):
+            nonlocal peak
+            for _ in PayloadStream(path, chunk_size=8, budget=budget):
+                peak = max(peak, budget.in_flight)
+                time.sleep(0.001)
+
+        threads = [threading.Thread(target=drain, args=(path,)) for path in sources]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert 0 < peak <= 16
+        assert budget.in_flight == 0
@@ -186,12 +186,16 @@ class TestDatalakeSyncFacade:
             ),
             "delete_annotation_record": None,
             "create_datum": Datum(asset_refs={"image": "asset_1"}),
+            "create_datums": [Datum(asset_refs={"image": "asset_1"})],
             "get_datum": Datum(asset_refs={"image": "asset_1"}),
             "list_datums": [],
             "update_datum": Datum(asset_refs={"image": "asset_1"}),
             "create_dataset_version": DatasetVersion(dataset_name="demo", version="0.1.0"),
             "get_dataset_version": DatasetVersion(dataset_name="demo", version="0.1.0"),
             "list_dataset_versions": [],
+            "get_dataset_version_datum_ids": ["datum_1"],
+            "count_dataset_version_splits": {"train": 1},
+            "dataset_version_difference": ["datum_2"],
             "resolve_datum": ResolvedDatum(datum=Datum(asset_refs={"image": "asset_1"})),
             "resolve_dataset_version": ResolvedDatasetVersion(
                 dataset_version=DatasetVersion(dataset_name="demo", version="0.1.0"), datums=[]
@@ -199,6 +203,8 @@ class TestDatalakeSyncFacade:
             "create_asset_from_object": Asset(
                 kind="image", media_type="image/png", storage_ref=StorageRef(mount="temp", name="hopper.png")
             ),
+            "create_assets_from_objects": [],
+            "create_annotation_sets": [],
             "ensure_primary_asset_alias": AssetAlias.model_construct(
                 alias_id="alias_row",
                 alias="asset_1",
@@ -478,6 +484,11 @@ class TestDatalakeSyncFacade:
         assert isinstance(datalake.update_annotation_record("ann_1", label="dent"), AnnotationRecord)
         datalake.delete_annotation_record("ann_1")
         assert isinstance(datalake.create_datum(asset_refs={"image": "asset_1"}), Datum)
+        datum_specs = [{"asset_refs": {"image": "asset_1"}}]
+        assert isinstance(datalake.create_datums(datum_specs)[0], Datum)
+        mock_backend.create_datums.assert_awaited_once_with(datum_specs)
+        assert datalake.create_annotation_sets([]) == []
+        mock_backend.create_annotation_sets.assert_awaited_once_with([])
         assert isinstance(datalake.get_datum("datum_1"), Datum)
         assert datalake.list_datums() == []
         assert isinstance(datalake.update_datum("datum_1", split="train"), Datum)
@@ -485,6 +496,15 @@ class TestDatalakeSyncFacade:
             datalake.create_dataset_version(dataset_name="demo", version="0.1.0", manifest=[]), DatasetVersion
         )
         assert isinstance(datalake.get_dataset_version("demo", "0.1.0"), DatasetVersion)
+        datalake.get_dataset_version("demo", "0.1.0", include_manifest=False)
+        mock_backend.get_dataset_version.assert_awaited_with("demo", "0.1.0", include_manifest=False)
+        assert datalake.get_dataset_version_datum_ids("demo", "0.1.0", offset=5, limit=1) == ["datum_1"]
+        mock_backend.get_dataset_version_datum_ids.assert_awaited_once_with("demo", "0.1.0", offset=5, limit=1)
+        assert datalake.count_dataset_version_splits("demo", "0.1.0") == {"train": 1}
+        assert datalake.dataset_version_difference("demo", "0.2.0", "0.1.0") == ["datum_2"]
+        mock_backend.dataset_version_difference.assert_awaited_once_with(
+            "demo", "0.2.0", "0.1.0", other_dataset_name=None
+        )
         assert datalake.list_dataset_versions() == []
         assert isinstance(datalake.resolve_datum("datum_1"), ResolvedDatum)
         assert isinstance(datalake.resolve_dataset_version("demo", "0.1.0"), ResolvedDatasetVersion)
@@ -492,6 +512,8 @@ class TestDatalakeSyncFacade:
             datalake.create_asset_from_object(name="hopper.png", obj=b"bytes", kind="image", media_type="image/png"),
             Asset,
         )
+        assert datalake.create_assets_from_objects([]) == []
+        mock_backend.create_assets_from_objects.assert_awaited_once_with([])
         assert isinstance(
             datalake.create_asset_from_uploaded_object(
                 kind="image",
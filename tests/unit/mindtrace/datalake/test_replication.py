@@ -1,4 +1,6 @@
+import asyncio
 import hashlib
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
@@ -10,6 +12,7 @@ from mindtrace.datalake.replication import (
     LOCAL_PAYLOAD_TOMBSTONE_STORAGE_REF,
     ReplicationManager,
     _head_object_size_bytes,
+    _run_bounded,
 )
 from mindtrace.datalake.replication_types import (
     ReplicationBatchRequest,
@@ -19,6 +22,20 @@ from mindtrace.datalake.replication_types import (
 from mindtrace.datalake.types import AnnotationRecord, AnnotationSchema, AnnotationSet, Asset, Datum, StorageRef
 
 
+def _open_object_file_from(datalake, tmp_dir):
+    """Serve ``open_object_file`` from whatever the mocked ``get_object`` returns, staged in a temp file."""
+
+    @asynccontextmanager
+    async def open_object_file(storage_ref):
+        data = await datalake.get_object(storage_ref)
+        path = tmp_dir / f"payload-{len(list(tmp_dir.iterdir()))}.bin"
+        with open(path, "wb") as fp:
+            fp.write(data)
+        yield path
+
+    return open_object_file
+
+
 @pytest.fixture
 def replication_objects():
     storage_ref = StorageRef(mount="source", name="images/cat.jpg", version="v1")
@@ -70,11 +87,12 @@ def replication_objects():
 
 
 @pytest.fixture
-def source_datalake(replication_objects):
+def source_datalake(replication_objects, tmp_path):
     datalake = Mock()
     datalake.mongo_db_name = "source_db"
     datalake.get_asset = AsyncMock(return_value=replication_objects.asset)
     datalake.get_object = AsyncMock(return_value=b"payload-bytes")
+    datalake.open_object_file = _open_object_file_from(datalake, tmp_path)
     datalake.store = Mock()
     datalake.store.build_key = Mock(side_effect=lambda mount, name, version: f"{mount}/{name}@{version}")
     datalake.store.delete = Mock()
@@ -88,7 +106,7 @@ def source_datalake(replication_objects):
 
 
 @pytest.fixture
-def target_datalake():
+def target_datalake(tmp_path):
     datalake = Mock()
     datalake.mongo_db_name = "target_db"
     datalake.get_asset = AsyncMock(side_effect=DocumentNotFoundError("asset missing"))
@@ -101,7 +119,7 @@ def target_datalake():
             upload_session_id="upload_session_1",
             finalize_token="token-1",
             upload_method="local_path",
-            upload_path="/tmp/replication-upload.bin",
+            upload_path=str(tmp_path / "upload.bin"),
             upload_url=None,
             upload_headers={},
         )
@@ -560,6 +578,32 @@ def test_manager_rejects_explicit_same_source_and_target_instance(source_datalak
         ReplicationManager(source_datalake, source_datalake)
 
 
+@pytest.mark.asyncio
+async def test_run_bounded_pulls_items_lazily_and_keeps_order():
+    pulled = active = peak = 0
+
+    def items():
+        nonlocal pulled
+        for index in range(20):
+            pulled += 1
+            yield index
+
+    async def worker(index):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        assert pulled == index + 1  # items are taken one at a time as runners free up, not all up front
+        await asyncio.sleep(0.001 * (index % 3))
+        active -= 1
+        if index == 7:
+            raise RuntimeError("boom")
+
+    outcomes = await _run_bounded(items(), worker, 3)
+
+    assert peak == 3
+    assert [type(outcome).__name__ for outcome in outcomes] == ["NoneType"] * 7 + ["RuntimeError"] + ["NoneType"] * 12
+
+
 def test_local_delete_helpers(replication_objects):
     eligible = Asset.model_validate(
         {
@@ -899,6 +943,74 @@ class TestReplicationTransferAndVerify:
 
         assert len(result.attempted_asset_ids) == 1
 
+    @pytest.mark.asyncio
+    async def test_reconcile_runs_hydrations_concurrently_and_keeps_order(
+        self, source_datalake, target_datalake, replication_objects
+    ):
+        assets = [
+            Asset.model_validate(
+                {
+                    **replication_objects.asset.model_dump(),
+                    "asset_id": f"id{i}",
+                    "payload_status": "missing",
+                    "metadata": {"replication": {"payload_status": "missing"}},
+                }
+            )
+            for i in range(6)
+        ]
+        target_datalake.asset_database.find = AsyncMock(return_value=assets)
+        manager = ReplicationManager(source_datalake, target_datalake)
+        active = peak = 0
+
+        async def hydrate(asset_id, *, mount_map=None):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01 if asset_id != "id0" else 0.03)
+            active -= 1
+            if asset_id == "id3":
+                raise RuntimeError("boom")
+
+        manager.hydrate_asset_payload = hydrate
+
+        result = await manager.reconcile_pending_payloads(ReplicationReconcileRequest(concurrency=3))
+
+        assert peak == 3
+        assert result.attempted_asset_ids == [f"id{i}" for i in range(6)]
+        assert result.verified_asset_ids == ["id0", "id1", "id2", "id4", "id5"]
+        assert result.failed_asset_ids == ["id3"]
+
+    @pytest.mark.asyncio
+    async def test_transfer_payload_respects_per_mount_concurrency(
+        self, source_datalake, target_datalake, replication_objects
+    ):
+        manager = ReplicationManager(source_datalake, target_datalake, mount_concurrency={"remote": 1})
+        active = peak = 0
+        create_session = target_datalake.create_object_upload_session
+
+        async def tracked_create(**kwargs):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return await create_session(**kwargs)
+
+        target_datalake.create_object_upload_session = tracked_create
+
+        await asyncio.gather(
+            manager._transfer_payload(replication_objects.asset, {"source": "remote"}),
+            manager._transfer_payload(replication_objects.asset, {"source": "remote"}),
+        )
+        assert peak == 1
+
+        peak = 0
+        await asyncio.gather(
+            manager._transfer_payload(replication_objects.asset, {}),
+            manager._transfer_payload(replication_objects.asset, {}),
+        )
+        assert peak == 2
+
     @pytest.mark.asyncio
     async def test_set_asset_replication_state_coerces_bad_origin_and_replication(
         self, source_datalake, target_datalake, replication_objects
@@ -985,7 +1097,7 @@ class TestReplicationTransferAndVerify:
         mock_cm.__exit__.return_value = None
         manager = ReplicationManager(source_datalake, target_datalake)
         with patch("mindtrace.datalake.replication.urllib_request.urlopen", return_value=mock_cm) as urlopen_mock:
-            ref = await manager._transfer_payload(replication_objects.asset, {})
+            ref, _ = await manager._transfer_payload(replication_objects.asset, {})
         assert ref.name == "n"
         urlopen_mock.assert_called_once()
 
@@ -1042,6 +1154,31 @@ class TestReplicationTransferAndVerify:
         with pytest.raises(RuntimeError, match="did not produce a storage_ref"):
             await manager._transfer_payload(replication_objects.asset, {})
 
+    @pytest.mark.asyncio
+    async def test_transfer_payload_streams_in_chunks_and_reports_checksum(
+        self, source_datalake, target_datalake, replication_objects
+    ):
+        data = b"payload-bytes"
+        asset = replication_objects.asset.model_copy(
+            update={"checksum": f"sha256:{hashlib.sha256(data).hexdigest()}", "size_bytes": len(data)}
+        )
+        manager = ReplicationManager(source_datalake, target_datalake, chunk_size=4, max_inflight_bytes=8)
+        assert manager.payload_budget.max_bytes == 8
+
+        ref, transferred = await manager._transfer_payload(asset, {})
+
+        assert ref.mount == "remote"
+        assert transferred.size_bytes == len(data)
+        assert transferred.digests["sha256"] == hashlib.sha256(data).hexdigest()
+        upload_path = target_datalake.create_object_upload_session.return_value.upload_path
+        assert open(upload_path, "rb").read() == data
+        assert manager.payload_budget.in_flight == 0
+
+        # Verification reuses the streamed tally instead of reading the source payload a second time.
+        source_datalake.get_object.reset_mock()
+        await manager._verify_transferred_payload(asset, ref, transferred)
+        source_datalake.get_object.assert_not_awaited()
+
     @pytest.mark.asyncio
     async def test_verify_transferred_payload_size_mismatch(
         self, source_datalake, target_datalake, replication_objects
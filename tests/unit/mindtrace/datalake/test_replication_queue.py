@@ -383,6 +383,57 @@ async def test_mark_status_sets_progress_and_terminal_clears_lease():
     assert updated.completed_at is not None
 
 
+@pytest.mark.asyncio
+async def test_renew_lease_extends_lease_for_owner():
+    t = _task(
+        task_id="t1",
+        dedupe_key="dk1",
+        status="hydrating_payloads",
+        claimed_by="w1",
+        lease_expires_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+    )
+    db = FakeReplicationTaskDatabase([t])
+    mgr = ReplicationQueueManager(SimpleNamespace(replication_task_database=db))
+    now = datetime(2025, 1, 1, 0, 0, 30, tzinfo=timezone.utc)
+    renewed = await mgr.renew_lease(t.task_id, worker_id="w1", lease_seconds=60, now=now)
+    assert renewed.lease_expires_at == now + timedelta(seconds=60)
+    assert renewed.claimed_by == "w1"
+
+
+@pytest.mark.asyncio
+async def test_renew_lease_is_a_conditional_update_of_lease_fields_only(queue_manager, task_database):
+    now = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    task_database.find_one_and_update = AsyncMock(return_value=_task(task_id="t1", claimed_by="w1"))
+
+    await queue_manager.renew_lease("t1", worker_id="w1", lease_seconds=60, now=now)
+
+    task_database.find_one_and_update.assert_awaited_once_with(
+        {"task_id": "t1", "claimed_by": "w1", "status": {"$nin": ["cancelled", "complete", "dead"]}},
+        {"$set": {"lease_expires_at": now + timedelta(seconds=60), "updated_at": now}},
+    )
+    task_database.update.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_renew_lease_raises_when_task_changed_during_renewal(queue_manager, task_database):
+    task_database.find_one_and_update = AsyncMock(return_value=None)
+    task_database.find.return_value = [_task(task_id="t1", status="hydrating_payloads", claimed_by="w1")]
+    with pytest.raises(RuntimeError, match="changed while its lease was being renewed"):
+        await queue_manager.renew_lease("t1", worker_id="w1")
+
+
+@pytest.mark.asyncio
+async def test_renew_lease_rejects_other_worker_and_terminal_tasks():
+    stolen = _task(task_id="t1", dedupe_key="dk1", status="claimed", claimed_by="w2")
+    done = _task(task_id="t2", dedupe_key="dk2", status="complete", claimed_by="w1")
+    db = FakeReplicationTaskDatabase([stolen, done])
+    mgr = ReplicationQueueManager(SimpleNamespace(replication_task_database=db))
+    with pytest.raises(RuntimeError, match="claimed by 'w2'"):
+        await mgr.renew_lease("t1", worker_id="w1")
+    with pytest.raises(RuntimeError, match="already complete"):
+        await mgr.renew_lease("t2", worker_id="w1")
+
+
 @pytest.mark.asyncio
 async def test_fail_task_raises_when_worker_mismatch():
     t = _task(task_id="t1", dedupe_key="dk1", claimed_by="a")
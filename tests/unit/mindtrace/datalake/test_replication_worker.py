@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from mindtrace.datalake.replication_queue import ReplicationQueueManager
+from mindtrace.datalake.replication_worker import ReplicationWorker, ReplicationWorkerMetrics
+from mindtrace.datalake.types import ReplicationTask
+from tests.unit.mindtrace.datalake.fake_replication_task_database import FakeReplicationTaskDatabase
+
+
+def _tasks(count: int, *, root_kind: str = "asset") -> list[ReplicationTask]:
+    return [
+        ReplicationTask(
+            task_id=f"t{i}",
+            target_lake_id="remote",
+            root_kind=root_kind,
+            root_id=f"asset_{i}",
+            dedupe_key=f"dk{i}",
+            mount_map={"source": "remote"},
+            next_attempt_at=datetime(2020, 1, 1, tzinfo=timezone.utc) + timedelta(seconds=i),
+        )
+        for i in range(count)
+    ]
+
+
+def _queue(tasks: list[ReplicationTask]) -> tuple[ReplicationQueueManager, FakeReplicationTaskDatabase]:
+    db = FakeReplicationTaskDatabase(tasks)
+    return ReplicationQueueManager(SimpleNamespace(replication_task_database=db)), db
+
+
+def test_worker_requires_manager_or_handler():
+    queue, _ = _queue([])
+    with pytest.raises(ValueError, match="ReplicationManager or a task handler"):
+        ReplicationWorker(queue)
+    with pytest.raises(ValueError, match="concurrency"):
+        ReplicationWorker(queue, handler=AsyncMock(), concurrency=0)
+
+
+@pytest.mark.asyncio
+async def test_drain_completes_backlog_with_bounded_concurrency():
+    queue, db = _queue(_tasks(10))
+    active = peak = 0
+
+    async def handler(task):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.005)
+        active -= 1
+        return SimpleNamespace(size_bytes=100)
+
+    claim_limits = []
+    claim = queue.claim_due_tasks
+
+    async def spy_claim(**kwargs):
+        claim_limits.append(kwargs["limit"])
+        return await claim(**kwargs)
+
+    queue.claim_due_tasks = spy_claim
+    worker = ReplicationWorker(queue, handler=handler, worker_id="w1", concurrency=3)
+
+    metrics = await worker.drain()
+
+    assert peak == 3
+    assert max(claim_limits) <= 3
+    assert metrics.claimed == metrics.completed == 10
+    assert metrics.failed == metrics.in_flight == 0
+    assert metrics.bytes_transferred == 1000
+    assert metrics.max_queue_lag_seconds > 0
+    rows = await db.find({})
+    assert {row.status for row in rows} == {"complete"}
+    assert {row.last_progress_bytes_completed for row in rows} == {100}
+
+
+@pytest.mark.asyncio
+async def test_failed_tasks_are_rescheduled_not_retried_in_drain():
+    queue, db = _queue(_tasks(3))
+
+    async def handler(task):
+        if task.task_id == "t1":
+            raise RuntimeError("transfer failed")
+
+    worker = ReplicationWorker(queue, handler=handler, worker_id="w1", retry_delay_seconds=600)
+    metrics = await worker.drain()
+
+    assert (metrics.completed, metrics.failed) == (2, 1)
+    failed = await queue.get_task("t1")
+    assert failed.status == "failed"
+    assert failed.attempts == 1
+    assert failed.last_error == "transfer failed"
+    assert failed.claimed_by is None
+
+
+@pytest.mark.asyncio
+async def test_default_handler_hydrates_asset_tasks():
+    queue, _ = _queue(_tasks(2))
+    manager = SimpleNamespace(hydrate_asset_payload=AsyncMock(return_value=SimpleNamespace(size_bytes=7)))
+    worker = ReplicationWorker(queue, manager, worker_id="w1")
+
+    metrics = await worker.drain()
+
+    assert metrics.completed == 2
+    assert metrics.bytes_transferred == 14
+    manager.hydrate_asset_payload.assert_any_await("asset_0", mount_map={"source": "remote"})
+
+
+@pytest.mark.asyncio
+async def test_default_handler_rejects_other_root_kinds():
+    queue, _ = _queue(_tasks(1, root_kind="datum"))
+    manager = SimpleNamespace(hydrate_asset_payload=AsyncMock())
+    worker = ReplicationWorker(queue, manager, worker_id="w1")
+
+    metrics = await worker.drain()
+
+    assert metrics.failed == 1
+    assert "No replication handler for root_kind 'datum'" in (await queue.get_task("t0")).last_error
+    manager.hydrate_asset_payload.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_renew_leases_extends_in_flight_tasks():
+    queue, _ = _queue(_tasks(2))
+    release = asyncio.Event()
+
+    async def handler(task):
+        await release.wait()
+
+    worker = ReplicationWorker(queue, handler=handler, worker_id="w1", lease_seconds=60)
+    assert await worker.run_once() == 2
+    await asyncio.sleep(0)
+    before = (await queue.get_task("t0")).lease_expires_at
+
+    await asyncio.sleep(0.01)
+    await worker.renew_leases()
+
+    assert worker.metrics.lease_renewals == 2
+    assert (await queue.get_task("t0")).lease_expires_at > before
+    release.set()
+    await worker.drain()
+    assert worker.metrics.completed == 2
+
+
+@pytest.mark.asyncio
+async def test_run_stops_on_event_after_finishing_in_flight_tasks():
+    queue, db = _queue(_tasks(4))
+
+    async def handler(task):
+        await asyncio.sleep(0.005)
+
+    worker = ReplicationWorker(queue, handler=handler, worker_id="w1", concurrency=2, poll_interval=0.01)
+    stop = asyncio.Event()
+    runner = asyncio.create_task(worker.run(stop))
+    while worker.metrics.completed < 4:
+        await asyncio.sleep(0.005)
+    stop.set()
+    metrics = await asyncio.wait_for(runner, timeout=5)
+
+    assert metrics.completed == 4
+    assert not worker._running
+
+
+def test_metrics_snapshot_reports_throughput():
+    started = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    metrics = ReplicationWorkerMetrics(started_at=started, completed=20, bytes_transferred=2_000)
+    snapshot = metrics.snapshot(now=started + timedelta(seconds=10))
+    assert snapshot["tasks_per_second"] == pytest.approx(2.0)
+    assert snapshot["bytes_per_second"] == pytest.approx(200.0)
@@ -1,5 +1,6 @@
 import asyncio
 import hashlib
+from contextlib import asynccontextmanager
 from pathlib import Path
 from types import SimpleNamespace
 from typing import Any
@@ -55,6 +56,20 @@ def _all_docs_from_insert_many(mock_db: Any) -> list[Any]:
     return docs
 
 
+def _open_object_file_from(datalake, tmp_dir):
+    """Serve ``open_object_file`` from whatever the mocked ``get_object`` returns, staged in a temp file."""
+
+    @asynccontextmanager
+    async def open_object_file(storage_ref):
+        data = await datalake.get_object(storage_ref)
+        path = tmp_dir / f"payload-{len(list(tmp_dir.iterdir()))}.bin"
+        with open(path, "wb") as fp:
+            fp.write(data)
+        yield path
+
+    return open_object_file
+
+
 @pytest.fixture
 def sync_objects():
     storage_ref = StorageRef(mount="source", name="images/cat.jpg", version="v1")
@@ -114,7 +129,7 @@ def sync_objects():
 
 
 @pytest.fixture
-def source_datalake(sync_objects):
+def source_datalake(sync_objects, tmp_path):
     datalake = Mock()
     datalake.mongo_db_name = "source_db"
     source_store = MagicMock()
@@ -129,6 +144,7 @@ def source_datalake(sync_objects):
     datalake.get_annotation_record = AsyncMock(return_value=sync_objects.annotation_record)
     datalake.get_annotation_schema = AsyncMock(return_value=sync_objects.schema)
     datalake.get_object = AsyncMock(return_value=b"payload-bytes")
+    datalake.open_object_file = _open_object_file_from(datalake, tmp_path)
     datalake.object_exists = AsyncMock(return_value=False)
     datalake.ensure_primary_asset_alias = AsyncMock(side_effect=lambda obj: obj)
     datalake.ensure_primary_asset_aliases = AsyncMock()
@@ -136,7 +152,7 @@ def source_datalake(sync_objects):
 
 
 @pytest.fixture
-def target_datalake(sync_objects):
+def target_datalake(sync_objects, tmp_path):
     datalake = Mock()
     datalake.mongo_db_name = "target_db"
     target_store = MagicMock()
@@ -156,7 +172,7 @@ def target_datalake(sync_objects):
             upload_session_id="upload_session_1",
             finalize_token="token-1",
             upload_method="local_path",
-            upload_path="/tmp/upload.bin",
+            upload_path=str(tmp_path / "upload.bin"),
             upload_url=None,
             upload_headers={},
         )
@@ -434,10 +450,10 @@ class TestDatasetSyncManager:
         manager = DatasetSyncManager(source_datalake, target_datalake)
         bundle = await manager.export_dataset_version("demo", "1.0.0")
 
-        with patch.object(Path, "write_bytes", return_value=None) as write_bytes:
-            result = await manager.commit_import(DatasetSyncImportRequest(bundle=bundle, origin_lake_id="lake-a"))
+        result = await manager.commit_import(DatasetSyncImportRequest(bundle=bundle, origin_lake_id="lake-a"))
 
-        write_bytes.assert_called_once_with(b"payload-bytes")
+        upload_path = Path(target_datalake.create_object_upload_session.return_value.upload_path)
+        assert upload_path.read_bytes() == b"payload-bytes"
         target_datalake.create_object_upload_session.assert_awaited_once()
         target_datalake.complete_object_upload_session.assert_awaited_once_with(
             "upload_session_1", finalize_token="token-1"
@@ -464,6 +480,24 @@ class TestDatasetSyncManager:
         assert inserted_dataset_version.metadata["origin"]["entity_id"] == "dataset_version_1"
         assert inserted_dataset_version.metadata["origin"]["dataset_name"] == "demo"
 
+    @pytest.mark.asyncio
+    async def test_commit_import_writes_collection_stored_versions_through_member_insert(
+        self, source_datalake, target_datalake, sync_objects
+    ):
+        source_datalake.get_dataset_version = AsyncMock(
+            return_value=sync_objects.dataset_version.model_copy(update={"manifest_storage": "collection"})
+        )
+        target_datalake._insert_dataset_version = AsyncMock(side_effect=lambda obj: obj)
+        manager = DatasetSyncManager(source_datalake, target_datalake)
+        bundle = await manager.export_dataset_version("demo", "1.0.0")
+
+        await manager.commit_import(DatasetSyncImportRequest(bundle=bundle, origin_lake_id="lake-a"))
+
+        target_datalake.dataset_version_database.insert.assert_not_awaited()
+        inserted_dataset_version = target_datalake._insert_dataset_version.await_args.args[0]
+        assert inserted_dataset_version.manifest_storage == "collection"
+        assert inserted_dataset_version.manifest == sync_objects.dataset_version.manifest
+
     @pytest.mark.asyncio
     async def test_commit_import_transfers_payloads_with_bounded_concurrency(
         self, source_datalake, target_datalake, sync_objects
@@ -761,14 +795,23 @@ class TestDatasetSyncManager:
             media_type="image/jpeg",
         )
 
-        response = SimpleNamespace(status=200)
-        with patch("mindtrace.datalake.sync.urllib_request.urlopen") as urlopen:
-            urlopen.return_value.__enter__.return_value = response
+        uploaded = bytearray()
+
+        def fake_urlopen(request, timeout=None):
+            for chunk in request.data:
+                uploaded.extend(chunk)
+            response = MagicMock()
+            response.__enter__.return_value = SimpleNamespace(status=200)
+            return response
+
+        with patch("mindtrace.datalake.replication.urllib_request.urlopen", side_effect=fake_urlopen) as urlopen:
             storage_ref = await manager._transfer_payload(payload, {})
 
         assert storage_ref.version == "v3"
         request_obj = urlopen.call_args.args[0]
         assert request_obj.full_url == "https://example.test/upload"
+        assert request_obj.get_header("Content-length") == str(len(b"payload-bytes"))
+        assert bytes(uploaded) == b"payload-bytes"
         target_datalake.head_object.assert_awaited_once()
 
     @pytest.mark.asyncio
@@ -1167,7 +1210,7 @@ class TestDatasetSyncManager:
         )
         response = SimpleNamespace(status=500)
 
-        with patch("mindtrace.datalake.sync.urllib_request.urlopen") as urlopen:
+        with patch("mindtrace.datalake.replication.urllib_request.urlopen") as urlopen:
             urlopen.return_value.__enter__.return_value = response
             with pytest.raises(RuntimeError, match="Presigned upload failed"):
                 await manager._transfer_payload(payload, {})
@@ -0,0 +1,226 @@
+"""Tests for the binary / shared-memory capture transport of CameraManagerService."""
+
+from __future__ import annotations
+
+import functools
+from unittest.mock import AsyncMock, Mock
+
+import httpx
+import numpy as np
+import pytest
+
+from mindtrace.hardware.services.cameras.connection_manager import CameraManagerConnectionManager
+from mindtrace.hardware.services.cameras.models import CaptureSharedMemoryRequest
+from mindtrace.hardware.services.cameras.service import CameraManagerService
+from mindtrace.hardware.services.cameras.transport import (
+    ERROR_HEADER,
+    SHARED_FRAME_PREFIX,
+    RawFrameError,
+    SharedFramePool,
+    attach_shared_memory,
+    decode_frame,
+    detach_shared_memory,
+    frame_headers,
+    frame_payload,
+    multipart_chunks,
+    parse_multipart_frames,
+    read_shared_frame,
+)
+
+_FRAME = np.random.default_rng(0).integers(0, 256, size=(48, 64, 3), dtype=np.uint8)
+
+
+class TestRawFrames:
+    @pytest.mark.parametrize(
+        "image",
+        [_FRAME, _FRAME[:, ::2], np.linspace(0, 1, 30, dtype=np.float32).reshape(5, 6), np.zeros((4, 4), np.uint16)],
+    )
+    def test_round_trips_shape_dtype_and_pixels(self, image):
+        decoded = decode_frame(frame_headers(image), bytes(frame_payload(image)))
+
+        np.testing.assert_array_equal(decoded, image)
+        assert decoded.dtype == image.dtype
+
+    def test_decode_views_the_payload_without_copying(self):
+        payload = bytearray(frame_payload(_FRAME))
+
+        decoded = decode_frame(frame_headers(_FRAME), payload)
+        payload[0] ^= 0xFF
+
+        assert decoded[0, 0, 0] == _FRAME[0, 0, 0] ^ 0xFF
+
+    def test_decode_rejects_bad_headers_and_sizes(self):
+        with pytest.raises(RawFrameError, match="headers"):
+            decode_frame({}, b"")
+        with pytest.raises(RawFrameError, match="expected 9216"):
+            decode_frame(frame_headers(_FRAME), b"\x00" * 10)
+
+
+class TestMultipart:
+    def test_round_trips_frames_and_errors(self):
+        # A payload containing the boundary must not confuse a length-delimited parser.
+        tricky = np.frombuffer(b"\r\n--abc\r\n" * 4, dtype=np.uint8).reshape(4, 9)
+        frames = {"A:1": _FRAME, "B:2": RuntimeError("timed\nout"), "C:3": None, "D:4": tricky}
+
+        body = b"".join(bytes(chunk) for chunk in multipart_chunks(frames, "abc"))
+        parsed = parse_multipart_frames(body, "abc")
+
+        assert list(parsed) == ["A:1", "B:2", "C:3", "D:4"]
+        np.testing.assert_array_equal(parsed["A:1"], _FRAME)
+        np.testing.assert_array_equal(parsed["D:4"], tricky)
+        assert str(parsed["B:2"]) == "timed out"
+        assert isinstance(parsed["C:3"], RawFrameError)
+
+    def test_malformed_body_raises(self):
+        with pytest.raises(RawFrameError, match="Malformed"):
+            parse_multipart_frames(b"garbage", "abc")
+
+
+class TestSharedMemory:
+    def test_pool_writes_into_its_own_segments_and_grows_them(self):
+        pool = SharedFramePool()
+        try:
+            name, shape, dtype, nbytes = pool.write("Mock:a", _FRAME)
+            assert name.startswith(SHARED_FRAME_PREFIX)
+            assert nbytes == _FRAME.nbytes
+            segment = attach_shared_memory(name)
+            view = read_shared_frame(segment, shape, dtype)
+            np.testing.assert_array_equal(view, _FRAME)
+            del view
+            detach_shared_memory(segment)
+
+            assert pool.write("Mock:a", _FRAME[:8])[0] == name
+            larger = np.zeros(_FRAME.nbytes + 1, dtype=np.uint8)
+            grown = pool.write("Mock:a", larger)[0]
+            assert grown != name
+            with pytest.raises(FileNotFoundError):
+                attach_shared_memory(name)
+        finally:
+            pool.close()
+
+        with pytest.raises(FileNotFoundError):
+            attach_shared_memory(grown)
+
+    def test_attach_refuses_segments_the_service_did_not_create(self):
+        with pytest.raises(ValueError, match="not a shared frame segment"):
+            attach_shared_memory("psm_other_process")
+
+
+@pytest.fixture(scope="module")
+def _service():
+    service = CameraManagerService(include_mocks=True)
+    yield service
+    service._shared_frames.close()
+
+
+@pytest.fixture
+def service(_service):
+    camera = Mock()
+    camera.capture = AsyncMock(return_value=_FRAME)
+    manager = Mock()
+    manager.active_cameras = ["Mock:a", "Mock:b"]
+    manager.open = AsyncMock(return_value=camera)
+    manager.batch_capture = AsyncMock(return_value={"Mock:a": _FRAME, "Mock:b": None})
+    _service._camera_manager = manager
+    return _service
+
+
+@pytest.fixture
+def asgi_client(service, monkeypatch):
+    """Route every httpx.AsyncClient, including the connection manager's, to the in-process app."""
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        httpx, "AsyncClient", functools.partial(real_client, transport=httpx.ASGITransport(app=service.app))
+    )
+    return httpx.AsyncClient(base_url="http://testserver")
+
+
+class TestServiceEndpoints:
+    @pytest.mark.asyncio
+    async def test_raw_capture_returns_array_bytes_with_geometry_headers(self, asgi_client):
+        response = await asgi_client.post("/cameras/capture/raw", json={"camera": "Mock:a"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/octet-stream"
+        assert response.headers["x-image-shape"] == "48,64,3"
+        assert len(response.content) == _FRAME.nbytes
+        np.testing.assert_array_equal(decode_frame(response.headers, response.content), _FRAME)
+
+    @pytest.mark.asyncio
+    async def test_raw_capture_maps_failures_to_http_errors(self, service, asgi_client):
+        missing = await asgi_client.post("/cameras/capture/raw", json={"camera": "Mock:missing"})
+        service._camera_manager.open.return_value.capture.side_effect = RuntimeError("sensor fault")
+        failed = await asgi_client.post("/cameras/capture/raw", json={"camera": "Mock:a"})
+
+        assert missing.status_code == 404
+        assert failed.status_code == 500
+        assert "sensor fault" in failed.json()["detail"]
+
+    @pytest.mark.asyncio
+    async def test_batch_raw_capture_returns_one_part_per_camera(self, service, asgi_client):
+        response = await asgi_client.post(
+            "/cameras/capture/batch/raw", json={"cameras": ["Mock:a", "Mock:b"], "stage": "s1"}
+        )
+
+        assert response.headers["content-type"].startswith("multipart/mixed; boundary=")
+        assert f"{ERROR_HEADER}: capture returned no image".encode() in response.content
+        service._camera_manager.batch_capture.assert_awaited_once_with(
+            ["Mock:a", "Mock:b"], output_format="numpy", stage="s1", set_name=None
+        )
+
+    @pytest.mark.asyncio
+    async def test_shared_capture_ignores_caller_supplied_segment_names(self, service):
+        response = await service.capture_image_shared(
+            CaptureSharedMemoryRequest.model_validate({"camera": "Mock:a", "shm_name": "victim"})
+        )
+
+        assert response.success is True
+        assert response.data.shm_name.startswith(SHARED_FRAME_PREFIX)
+        assert response.data.nbytes == _FRAME.nbytes
+
+    @pytest.mark.asyncio
+    async def test_shared_capture_refuses_remote_clients(self, service):
+        transport = httpx.ASGITransport(app=service.app, client=("192.0.2.10", 40000))
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as remote:
+            response = await remote.post("/cameras/capture/shared", json={"camera": "Mock:a"})
+
+        assert response.status_code == 403
+        service._camera_manager.open.assert_not_awaited()
+
+
+class TestConnectionManager:
+    @pytest.fixture
+    def cm(self, asgi_client):
+        cm = CameraManagerConnectionManager(url="http://testserver")
+        yield cm
+        cm.release_shared_memory()
+
+    @pytest.mark.asyncio
+    async def test_capture_image_raw(self, cm):
+        np.testing.assert_array_equal(await cm.capture_image_raw("Mock:a"), _FRAME)
+
+    @pytest.mark.asyncio
+    async def test_capture_images_batch_raw_maps_failures_to_none(self, cm):
+        frames = await cm.capture_images_batch_raw(["Mock:a", "Mock:b"])
+
+        np.testing.assert_array_equal(frames["Mock:a"], _FRAME)
+        assert frames["Mock:b"] is None
+
+    @pytest.mark.asyncio
+    async def test_capture_image_shared_attaches_to_the_service_segment_once(self, cm):
+        first = await cm.capture_image_shared("Mock:a")
+        segment = cm._shared_frame_buffers["Mock:a"]
+        second = await cm.capture_image_shared("Mock:a", copy=False)
+
+        np.testing.assert_array_equal(first, _FRAME)
+        np.testing.assert_array_equal(second, _FRAME)
+        # Only the opt-in view shares the segment a later capture overwrites
+        assert not np.shares_memory(first, second)
+        assert segment.size >= _FRAME.nbytes
+        assert cm._shared_frame_buffers["Mock:a"] is segment
+        del second
+
+    @pytest.mark.asyncio
+    async def test_capture_image_shared_raises_on_failure(self, cm):
+        with pytest.raises(RuntimeError, match="not initialized"):
+            await cm.capture_image_shared("Mock:missing")
@@ -839,9 +839,12 @@ class TestCameraManagerServiceCaptureAndHomography:
         CameraManagerService._register_endpoints(service)
 
         endpoint_paths = [entry.args[0] for entry in service.add_endpoint.call_args_list]
-        assert service.add_endpoint.call_count == 47
+        assert service.add_endpoint.call_count == 50
         assert "health" in endpoint_paths
         assert "cameras/capture" in endpoint_paths
+        assert "cameras/capture/raw" in endpoint_paths
+        assert "cameras/capture/batch/raw" in endpoint_paths
+        assert "cameras/capture/shared" in endpoint_paths
         assert "cameras/stream/start" in endpoint_paths
         assert "stream/{camera_name}" in endpoint_paths
         assert "cameras/homography/measure/distance" in endpoint_paths
@@ -26,6 +26,7 @@ def service_and_manager(_shared_camera_service):
     # The shared service is reused across tests in this module — reset any
     # mutable state that individual tests poke at so we don't leak between them.
     service._active_streams = {}
+    service._stream_hubs = {}
     service._capabilities_cache = {}
     manager = Mock()
     manager.active_cameras = ["Basler:cam1"]
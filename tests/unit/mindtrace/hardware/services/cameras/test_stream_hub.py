@@ -0,0 +1,231 @@
+"""Unit tests for the shared MJPEG stream hub and its wiring into CameraManagerService."""
+
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, Mock
+
+import numpy as np
+import pytest
+
+from mindtrace.hardware.services.cameras.models.requests import StreamStatusRequest, StreamStopRequest
+from mindtrace.hardware.services.cameras.service import CameraManagerService
+from mindtrace.hardware.services.cameras.streaming import MjpegStreamHub, encode_mjpeg_part, mjpeg_part
+
+
+class _FakeCamera:
+    """Counts captures and optionally takes ``delay`` seconds per frame."""
+
+    def __init__(self, delay: float = 0.0, error: Exception | None = None):
+        self.delay = delay
+        self.error = error
+        self.captures = 0
+
+    async def capture(self, output_format: str = "numpy"):
+        self.captures += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return np.full((8, 8, 3), self.captures % 256, dtype=np.uint8)
+
+
+async def _take(subscription, count: int) -> list[bytes]:
+    parts = []
+    async for part in subscription:
+        parts.append(part)
+        if len(parts) == count:
+            break
+    return parts
+
+
+def test_encode_mjpeg_part_wraps_jpeg_and_scales_float_frames():
+    part = encode_mjpeg_part(np.full((4, 4, 3), 0.5, dtype=np.float32), quality=90)
+
+    assert part.startswith(b"--frame\r\nContent-Type: image/jpeg\r\n\r\n\xff\xd8")
+    assert part.endswith(b"\xff\xd9\r\n")
+    assert mjpeg_part(b"oops", "text/plain") == b"--frame\r\nContent-Type: text/plain\r\n\r\noops\r\n"
+
+
+@pytest.mark.asyncio
+async def test_subscribers_share_one_capture_and_encode_per_frame():
+    camera = _FakeCamera()
+    hub = MjpegStreamHub("Mock:cam", camera.capture, fps=100)
+    subscriptions = [hub.subscribe() for _ in range(3)]
+
+    received = await asyncio.gather(*(_take(sub, 5) for sub in subscriptions))
+
+    # Every client sees the same encoded bytes, and the camera was captured once per frame rather than per client.
+    assert received[0] == received[1] == received[2]
+    assert camera.captures <= 6
+    hub.close()
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_drops_oldest_frames_without_stalling_others():
+    camera = _FakeCamera()
+    hub = MjpegStreamHub("Mock:cam", camera.capture, fps=200, subscriber_queue_size=2)
+    slow = hub.subscribe()
+    fast = hub.subscribe()
+
+    await _take(fast, 10)
+    # The slow client never read, so it holds only the two newest frames.
+    newest = [await slow.__anext__(), await slow.__anext__()]
+
+    assert slow.frames_dropped >= 8
+    assert newest[1] != newest[0]
+    assert hub.stats().frames_dropped == slow.frames_dropped + fast.frames_dropped
+    hub.close()
+
+
+@pytest.mark.asyncio
+async def test_deadline_pacing_absorbs_capture_time():
+    camera = _FakeCamera(delay=0.03)
+    hub = MjpegStreamHub("Mock:cam", camera.capture, fps=20)
+    loop = asyncio.get_running_loop()
+    subscription = hub.subscribe()
+
+    await _take(subscription, 1)
+    start = loop.time()
+    await _take(subscription, 6)
+    interval = (loop.time() - start) / 6
+
+    # A fixed 1/fps sleep after each 30 ms capture would give ~80 ms per frame.
+    assert interval == pytest.approx(0.05, abs=0.02)
+    stats = hub.stats()
+    assert stats.fps == pytest.approx(20, rel=0.3)
+    assert stats.capture_latency_ms >= 25
+    assert stats.frame_latency_ms >= stats.capture_latency_ms
+    hub.close()
+
+
+@pytest.mark.asyncio
+async def test_producer_stops_with_last_subscriber_and_restarts():
+    camera = _FakeCamera()
+    hub = MjpegStreamHub("Mock:cam", camera.capture, fps=100)
+    subscription = hub.subscribe()
+    await _take(subscription, 2)
+
+    subscription.close()
+    await asyncio.sleep(0.05)
+    assert not hub.running
+    captures = camera.captures
+    await asyncio.sleep(0.05)
+    assert camera.captures == captures
+
+    async with hub.subscribe() as again:
+        assert len(await _take(again, 2)) == 2
+    hub.close()
+
+
+@pytest.mark.asyncio
+async def test_consecutive_timeouts_end_the_stream_with_an_error_part():
+    camera = _FakeCamera(delay=1.0)
+    hub = MjpegStreamHub("Mock:cam", camera.capture, capture_timeout=0.01, max_consecutive_timeouts=1)
+
+    parts = [part async for part in hub.subscribe()]
+
+    assert len(parts) == 1
+    assert parts[0].startswith(b"--frame\r\nContent-Type: text/plain\r\n\r\nStream terminated")
+    assert hub.closed
+    with pytest.raises(RuntimeError, match="closed"):
+        hub.subscribe()
+
+
+@pytest.mark.asyncio
+async def test_error_part_survives_a_one_frame_buffer():
+    camera = _FakeCamera(delay=1.0)
+    hub = MjpegStreamHub(
+        "Mock:cam", camera.capture, capture_timeout=0.01, max_consecutive_timeouts=1, subscriber_queue_size=1
+    )
+
+    parts = [part async for part in hub.subscribe()]
+
+    assert len(parts) == 1
+    assert parts[0].startswith(b"--frame\r\nContent-Type: text/plain\r\n\r\nStream terminated")
+
+
+@pytest.mark.asyncio
+async def test_capture_error_ends_stream_once_camera_is_inactive():
+    camera = _FakeCamera(error=RuntimeError("device gone"))
+    active = {"value": True}
+    hub = MjpegStreamHub("Mock:cam", camera.capture, is_active=lambda: active["value"])
+    subscription = hub.subscribe()
+
+    await asyncio.sleep(0.15)
+    assert hub.running
+    active["value"] = False
+
+    assert await asyncio.wait_for(_take(subscription, 1), timeout=1.0) == []
+    assert hub.closed
+
+
+@pytest.mark.asyncio
+async def test_close_from_another_thread_ends_subscriptions():
+    hub = MjpegStreamHub("Mock:cam", _FakeCamera().capture, fps=50)
+    subscription = hub.subscribe()
+
+    await asyncio.to_thread(hub.close)
+
+    await asyncio.wait_for(_take(subscription, 1000), timeout=1.0)
+    assert hub.closed
+
+
+@pytest.fixture
+def service_with_camera():
+    service = CameraManagerService(include_mocks=True)
+    camera = _FakeCamera()
+    camera.check_connection = AsyncMock(return_value=True)
+    manager = Mock()
+    manager.active_cameras = ["Mock:cam"]
+    manager.open = AsyncMock(return_value=camera)
+    service._camera_manager = manager
+    return service, camera
+
+
+@pytest.mark.asyncio
+async def test_serve_camera_stream_clients_share_a_hub(service_with_camera):
+    service, camera = service_with_camera
+    service._active_streams["Mock:cam"] = {
+        "stream_url": "http://localhost:8002/stream/Mock_cam",
+        "start_time": datetime.now(timezone.utc),
+        "quality": 70,
+        "fps": 100,
+    }
+
+    first = await service.serve_camera_stream("Mock_cam")
+    second = await service.serve_camera_stream("Mock_cam")
+    parts = await asyncio.gather(_take(first.body_iterator, 4), _take(second.body_iterator, 4))
+
+    hub = service._stream_hubs["Mock:cam"]
+    assert first.media_type == "multipart/x-mixed-replace; boundary=frame"
+    assert parts[0] == parts[1]
+    assert (hub.fps, hub.quality, hub.subscriber_count) == (100, 70, 2)
+    assert camera.captures <= 5
+
+    status = await service.get_stream_status(StreamStatusRequest(camera="Mock:cam"))
+    assert status.data.stats.subscribers == 2
+    assert status.data.stats.frames_published >= 4
+
+    service.stop_stream(StreamStopRequest(camera="Mock:cam"))
+    assert hub.closed
+    assert "Mock:cam" not in service._stream_hubs
+    await first.body_iterator.aclose()
+    await second.body_iterator.aclose()
+
+
+@pytest.mark.asyncio
+async def test_serve_camera_stream_subscribes_only_when_body_is_streamed(service_with_camera):
+    service, camera = service_with_camera
+
+    response = await service.serve_camera_stream("Mock_cam")
+    await asyncio.sleep(0.05)
+
+    # A client that disconnected before the body started leaves no subscriber or producer behind.
+    assert "Mock:cam" not in service._stream_hubs
+    assert camera.captures == 0
+
+    assert len(await _take(response.body_iterator, 1)) == 1
+    hub = service._stream_hubs["Mock:cam"]
+    await response.body_iterator.aclose()
+    assert hub.subscriber_count == 0
+    hub.close()
@@ -31,6 +31,7 @@ def test_hardware_testing_registers_expected_ids_and_schemas() -> None:
         "hardware.stress.camera_manager_capture_ceiling",
         "hardware.smoke.camera_service_capture",
         "hardware.stress.camera_service_capture_ceiling",
+        "hardware.stress.camera_capture_transport",
     }
     assert expected.issubset(set(TestRunner.registered_suites()))
 
@@ -51,4 +52,5 @@ def test_hardware_testing_registers_expected_ids_and_schemas() -> None:
     assert {
         "hardware.stress.camera_manager_capture_ceiling",
         "hardware.stress.camera_service_capture_ceiling",
+        "hardware.stress.camera_capture_transport",
     }.issubset(stress_suites)
@@ -0,0 +1,218 @@
+import os
+import queue
+import threading
+import time
+
+import pytest
+
+from mindtrace.jobs.local.journal import JournaledQueue, LocalJournal
+
+
+def _segments(path) -> list[str]:
+    return sorted(name for name in os.listdir(path) if name.endswith(".log"))
+
+
+class TestJournaledQueue:
+    """Tests for JournaledQueue."""
+
+    def test_fifo_order(self, tmp_path):
+        q = JournaledQueue(tmp_path / "q", "fifo")
+        for i in range(5):
+            q.push(f"item-{i}")
+
+        assert q.qsize() == 5
+        assert [q.pop() for _ in range(5)] == [f"item-{i}" for i in range(5)]
+        assert q.empty()
+
+    def test_stack_order(self, tmp_path):
+        q = JournaledQueue(tmp_path / "q", "stack")
+        for i in range(3):
+            q.push(f"item-{i}")
+
+        assert [q.pop() for _ in range(3)] == ["item-2", "item-1", "item-0"]
+
+    def test_priority_order_is_fifo_within_priority(self, tmp_path):
+        q = JournaledQueue(tmp_path / "q", "priority")
+        q.push("low", priority=1)
+        q.push("high-first", priority=10)
+        q.push("high-second", priority=10)
+        q.push("medium", priority=5)
+
+        assert [q.pop() for _ in range(4)] == ["high-first", "high-second", "medium", "low"]
+
+    def test_unknown_queue_type(self, tmp_path):
+        with pytest.raises(TypeError, match="Unknown queue type"):
+            JournaledQueue(tmp_path / "q", "invalid")
+
+    def test_pop_empty_raises(self, tmp_path):
+        q = JournaledQueue(tmp_path / "q")
+        with pytest.raises(queue.Empty):
+            q.pop(block=False)
+
+        start = time.monotonic()
+        with pytest.raises(queue.Empty):
+            q.pop(block=True, timeout=0.05)
+        assert time.monotonic() - start >= 0.05
+
+    def test_blocking_pop_wakes_on_push(self, tmp_path):
+        q = JournaledQueue(tmp_path / "q")
+        timer = threading.Timer(0.05, q.push, args=("late",))
+        timer.start()
+        try:
+            assert q.pop(block=True, timeout=5) == "late"
+        finally:
+            timer.cancel()
+
+    def test_state_survives_reopen(self, tmp_path):
+        q = JournaledQueue(tmp_path / "q", "priority")
+        q.push("a", priority=1)
+        q.push("b", priority=3)
+        q.push("c", priority=2)
+        assert q.pop() == "b"
+        q.close()
+
+        reopened = JournaledQueue(tmp_path / "q", "priority")
+        assert reopened.qsize() == 2
+        assert reopened.pop() == "c"
+        assert reopened.pop() == "a"
+
+    def test_torn_tail_is_truncated_on_recovery(self, tmp_path):
+        q = JournaledQueue(tmp_path / "q")
+        q.push("kept")
+        q.close()
+
+        segment = tmp_path / "q" / _segments(tmp_path / "q")[-1]
+        intact_size = segment.stat().st_size
+        with open(segment, "ab") as f:
+            f.write(b"\x00\x01\x02 partial record")
+
+        recovered = JournaledQueue(tmp_path / "q")
+        assert segment.stat().st_size == intact_size
+        assert recovered.qsize() == 1
+        recovered.push("next")
+        assert [recovered.pop(), recovered.pop()] == ["kept", "next"]
+
+    def test_corrupt_record_is_truncated_on_recovery(self, tmp_path):
+        q = JournaledQueue(tmp_path / "q")
+        q.push("first")
+        q.push("second")
+        q.close()
+
+        segment = tmp_path / "q" / _segments(tmp_path / "q")[-1]
+        data = bytearray(segment.read_bytes())
+        data[-1] ^= 0xFF
+        segment.write_bytes(bytes(data))
+
+        recovered = JournaledQueue(tmp_path / "q")
+        assert recovered.qsize() == 1
+        assert recovered.pop() == "first"
+
+    def test_consumed_segments_are_dropped(self, tmp_path):
+        q = JournaledQueue(tmp_path / "q", segment_max_bytes=256)
+        for i in range(50):
+            q.push(f"message-{i}")
+        assert len(_segments(tmp_path / "q")) > 1
+
+        for _ in range(50):
+            q.pop()
+        assert len(_segments(tmp_path / "q")) == 1
+
+    def test_compaction_keeps_live_messages(self, tmp_path):
+        q = JournaledQueue(tmp_path / "q", "stack", segment_max_bytes=256, compact_min_records=20)
+        q.push("bottom")
+        for i in range(40):
+            q.push(f"message-{i}")
+            q.pop()
+
+        assert len(_segments(tmp_path / "q")) == 1
+        assert q.qsize() == 1
+
+        reopened = JournaledQueue(tmp_path / "q", "stack")
+        assert reopened.pop() == "bottom"
+
+    def test_interrupted_compaction_is_ignored(self, tmp_path):
+        q = JournaledQueue(tmp_path / "q")
+        q.push("a")
+        q.close()
+        (tmp_path / "q" / "segment-000000000001.log.compact").write_bytes(b"garbage")
+
+        reopened = JournaledQueue(tmp_path / "q")
+        assert reopened.pop() == "a"
+        assert not any(name.endswith(".compact") for name in os.listdir(tmp_path / "q"))
+
+    def test_clean(self, tmp_path):
+        q = JournaledQueue(tmp_path / "q", segment_max_bytes=128)
+        for i in range(10):
+            q.push(f"message-{i}")
+
+        assert q.clean() == 10
+        assert q.qsize() == 0
+        assert len(_segments(tmp_path / "q")) == 1
+
+        q.push("after")
+        q.close()
+        reopened = JournaledQueue(tmp_path / "q")
+        assert reopened.qsize() == 1
+        assert reopened.pop() == "after"
+
+    def test_instances_sharing_a_directory_see_each_other(self, tmp_path):
+        producer = JournaledQueue(tmp_path / "q")
+        consumer = JournaledQueue(tmp_path / "q")
+
+        producer.push("a")
+        producer.push("b")
+        assert consumer.qsize() == 2
+        assert consumer.pop() == "a"
+        assert producer.qsize() == 1
+        assert producer.pop() == "b"
+        assert consumer.empty()
+
+    def test_instance_recovers_after_peer_compaction(self, tmp_path):
+        peer = JournaledQueue(tmp_path / "q", "stack", compact_min_records=10)
+        observer = JournaledQueue(tmp_path / "q", "stack")
+        peer.push("bottom")
+        assert observer.qsize() == 1
+
+        for i in range(20):
+            peer.push(f"message-{i}")
+            peer.pop()
+
+        assert observer.qsize() == 1
+        assert observer.pop() == "bottom"
+
+    def test_closed_queue_rejects_operations(self, tmp_path):
+        q = JournaledQueue(tmp_path / "q")
+        q.close()
+        with pytest.raises(RuntimeError, match="closed"):
+            q.push("x")
+
+
+class TestLocalJournal:
+    """Tests for LocalJournal."""
+
+    def test_declare_get_and_delete(self, tmp_path):
+        journal = LocalJournal(tmp_path)
+        assert journal.declare("jobs:inference", "priority") is True
+        assert journal.declare("jobs:inference", "priority") is False
+        assert "jobs:inference" in journal
+        assert journal.names() == ["jobs:inference"]
+        assert journal.get("jobs:inference").queue_type == "priority"
+
+        journal.delete("jobs:inference")
+        assert "jobs:inference" not in journal
+        with pytest.raises(KeyError, match="not declared"):
+            journal.get("jobs:inference")
+
+    def test_declare_unknown_type(self, tmp_path):
+        with pytest.raises(TypeError, match="Unknown queue type"):
+            LocalJournal(tmp_path).declare("q", "invalid")
+
+    def test_delete_unknown_queue_is_noop(self, tmp_path):
+        LocalJournal(tmp_path).delete("missing")
+
+    def test_queue_options_are_forwarded(self, tmp_path):
+        journal = LocalJournal(tmp_path, fsync_every=1, segment_max_bytes=1024)
+        journal.declare("q")
+        q = journal.get("q")
+        assert q.fsync_every == 1
+        assert q.segment_max_bytes == 1024
@@ -361,3 +361,87 @@ class TestLocalClient:
             NotImplementedError, match="LocalConsumerBackend needs to be created with access to a LocalClient instance"
         ):
             _ = client.consumer_backend_args
+
+
+class TestLocalClientJournalEngine:
+    """Tests for LocalClient backed by the journaled queue engine."""
+
+    @pytest.fixture
+    def journal_client(self, tmp_path):
+        return LocalClient(client_dir=tmp_path, queue_engine="journal")
+
+    def test_unknown_queue_engine(self, tmp_path):
+        with pytest.raises(ValueError, match="Unknown queue engine"):
+            LocalClient(client_dir=tmp_path, queue_engine="invalid")
+
+    def test_journal_engine_rejects_backend(self, tmp_path):
+        with pytest.raises(ValueError, match="cannot use a backend"):
+            LocalClient(client_dir=tmp_path, backend=MagicMock(), queue_engine="journal")
+
+    def test_publish_receive_fifo(self, journal_client):
+        journal_client.declare_queue("test-queue")
+        job_id1 = journal_client.publish("test-queue", SampleMessage(data="test1"))
+        job_id2 = journal_client.publish("test-queue", SampleMessage(data="test2"))
+
+        assert journal_client.count_queue_messages("test-queue") == 2
+        received1 = journal_client.receive_message("test-queue")
+        received2 = journal_client.receive_message("test-queue")
+        assert (received1["data"], received1["job_id"]) == ("test1", job_id1)
+        assert (received2["data"], received2["job_id"]) == ("test2", job_id2)
+        assert journal_client.count_queue_messages("test-queue") == 0
+
+    def test_publish_receive_priority(self, journal_client):
+        journal_client.declare_queue("priority-queue", queue_type="priority")
+        journal_client.publish("priority-queue", SampleMessage(data="low"), priority=1)
+        journal_client.publish("priority-queue", SampleMessage(data="high"), priority=10)
+        journal_client.publish("priority-queue", SampleMessage(data="default"), priority=None)
+
+        received = [journal_client.receive_message("priority-queue")["data"] for _ in range(3)]
+        assert received == ["high", "low", "default"]
+
+    def test_declare_existing_and_unknown_type(self, journal_client):
+        assert "declared successfully" in journal_client.declare_queue("test-queue")["message"]
+        assert "already exists" in journal_client.declare_queue("test-queue")["message"]
+        with pytest.raises(TypeError, match="Unknown queue type"):
+            journal_client.declare_queue("invalid-queue", queue_type="invalid")
+
+    def test_receive_empty_queue(self, journal_client):
+        journal_client.declare_queue("test-queue")
+        assert journal_client.receive_message("test-queue", block=False) is None
+        assert journal_client.receive_message("test-queue", block=True, timeout=0.01) is None
+
+    def test_receive_invalid_json(self, journal_client):
+        journal_client.declare_queue("test-queue")
+        journal_client.queues.get("test-queue").push("invalid json content")
+        assert journal_client.receive_message("test-queue", block=False) is None
+        assert journal_client.count_queue_messages("test-queue") == 0
+
+    def test_clean_and_delete_queue(self, journal_client):
+        journal_client.declare_queue("test-queue")
+        for i in range(3):
+            journal_client.publish("test-queue", SampleMessage(x=i))
+
+        assert journal_client.clean_queue("test-queue")["status"] == "success"
+        assert journal_client.count_queue_messages("test-queue") == 0
+
+        assert journal_client.delete_queue("test-queue")["status"] == "success"
+        with pytest.raises(KeyError, match="not declared"):
+            journal_client.count_queue_messages("test-queue")
+        with pytest.raises(KeyError, match="not declared"):
+            journal_client.publish("test-queue", SampleMessage(x=1))
+
+    def test_queues_shared_between_clients(self, tmp_path):
+        producer = LocalClient(client_dir=tmp_path, queue_engine="journal")
+        consumer = LocalClient(client_dir=tmp_path, queue_engine="journal")
+        producer.declare_queue("shared")
+        producer.publish("shared", SampleMessage(x=7))
+
+        assert consumer.count_queue_messages("shared") == 1
+        assert consumer.receive_message("shared", block=False)["x"] == 7
+        assert producer.count_queue_messages("shared") == 0
+
+    def test_journal_options_are_forwarded(self, tmp_path):
+        client = LocalClient(client_dir=tmp_path, queue_engine="journal", journal_options={"fsync_every": 1})
+        client.declare_queue("test-queue")
+        assert client.queues.get("test-queue").fsync_every == 1
+        assert client.queues.root == tmp_path.resolve() / "journal"
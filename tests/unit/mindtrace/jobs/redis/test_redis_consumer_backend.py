@@ -1,9 +1,16 @@
+import asyncio
+import json
+import threading
+import time
 from queue import Empty
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import fakeredis
 import pytest
 
 from mindtrace.jobs.redis.consumer_backend import RedisConsumerBackend
+from mindtrace.jobs.redis.fifo_queue import RedisQueue
+from mindtrace.jobs.redis.priority import RedisPriorityQueue
 
 
 @pytest.fixture
@@ -16,26 +23,6 @@ def backend():
         yield backend, mock_conn
 
 
-def test_consume_processes_messages(backend):
-    backend, mock_conn = backend
-    backend.queues = ["q"]
-    backend.receive_message = MagicMock(side_effect=[{"id": 1}, None])
-    backend.process_message = MagicMock(return_value=True)
-    backend.logger = MagicMock()
-    backend.consume(num_messages=1, block=False)
-    backend.process_message.assert_called_once_with({"id": 1})
-
-
-def test_consume_until_empty(backend):
-    backend, mock_conn = backend
-    backend.queues = ["q"]
-    mock_conn.count_queue_messages.side_effect = [1, 0]
-    backend.consume = MagicMock()
-    backend.logger = MagicMock()
-    backend.consume_until_empty(block=False)
-    backend.consume.assert_called_with(num_messages=1, queues=["q"], block=False)
-
-
 def test_process_message_dict_success(backend):
     backend, _ = backend
     frontend = MagicMock()
@@ -97,25 +84,6 @@ def test_receive_message_queue_not_declared(backend):
         backend.receive_message("not_declared")
 
 
-def test_consume_non_block_returns_immediately_when_no_message(backend):
-    backend, _ = backend
-    backend.queues = ["q"]
-    backend.receive_message = MagicMock(return_value=None)
-    backend.logger = MagicMock()
-    # Should return immediately due to not block and no message
-    backend.consume(num_messages=0, queues=["q"], block=False)
-    backend.receive_message.assert_called_once_with("q", block=False, timeout=backend.poll_timeout)
-
-
-def test_consume_non_block_returns_on_exception(backend):
-    backend, _ = backend
-    backend.queues = ["q"]
-    backend.receive_message = MagicMock(side_effect=Exception("fail"))
-    backend.logger = MagicMock()
-    backend.consume(num_messages=0, queues=["q"], block=False)
-    backend.logger.debug.assert_called()
-
-
 def test_receive_message_uses_get_and_returns_dict(backend):
     backend, mock_conn = backend
     fake_queue = MagicMock()
@@ -138,16 +106,6 @@ def test_receive_message_unsupported_queue_type_returns_none(backend):
     assert backend.receive_message("q") is None
 
 
-def test_consume_until_empty_logs_info(backend):
-    backend, mock_conn = backend
-    backend.queues = ["q"]
-    mock_conn.count_queue_messages.side_effect = [1, 0]
-    backend.consume = MagicMock()
-    backend.logger = MagicMock()
-    backend.consume_until_empty(block=False)
-    backend.logger.info.assert_called()
-
-
 def test_process_message_non_dict_logs(backend):
     backend, _ = backend
     backend.logger = MagicMock()
@@ -157,15 +115,6 @@ def test_process_message_non_dict_logs(backend):
     backend.logger.debug.assert_called()
 
 
-def test_consume_finally_logs_info(backend):
-    backend, _ = backend
-    backend.queues = ["q"]
-    backend.receive_message = MagicMock(side_effect=KeyboardInterrupt)
-    backend.logger = MagicMock()
-    backend.consume(num_messages=1, block=True)
-    backend.logger.info.assert_called()
-
-
 def test_consume_no_queues_returns_immediately(backend):
     backend, _ = backend
     backend.queues = []
@@ -186,55 +135,6 @@ def test_receive_message_general_exception_returns_none(backend):
     assert backend.receive_message("q") is None
 
 
-def test_consume_logs_when_processing_and_increments(backend):
-    backend, _ = backend
-    backend.queues = ["q"]
-    backend.receive_message = MagicMock(return_value={"id": 1})
-    backend.process_message = MagicMock(return_value=True)
-    backend.logger = MagicMock()
-    backend.consume(num_messages=1, block=True)
-    backend.logger.debug.assert_any_call("Received message from queue 'q': processing 1")
-
-
-def test_consume_until_empty_info_log_message(backend):
-    backend, mock_conn = backend
-    backend.queues = ["q"]
-    mock_conn.count_queue_messages.side_effect = [1, 0]
-    backend.consume = MagicMock()
-    backend.logger = MagicMock()
-    backend.consume_until_empty(block=False)
-    backend.logger.info.assert_called_with("Stopped consuming messages from queues: ['q'] (queues empty).")
-
-
-def test_consume_normalizes_string_queues_and_handles_keyboardinterrupt(backend):
-    backend, _ = backend
-    backend.receive_message = MagicMock(side_effect=KeyboardInterrupt)
-    backend.logger = MagicMock()
-    # Pass queues as a string to trigger normalization branch
-    backend.consume(num_messages=1, queues="q", block=True)
-    backend.logger.info.assert_called()
-
-
-def test_consume_exception_block_true_sleeps_once_then_interrupts(backend):
-    backend, _ = backend
-    backend.logger = MagicMock()
-    backend.receive_message = MagicMock(side_effect=[Exception("fail"), KeyboardInterrupt])
-    with patch("time.sleep") as mock_sleep:
-        # Pass queues as a string to hit normalization as well
-        backend.consume(num_messages=1, queues="q", block=True)
-        mock_sleep.assert_called()
-
-
-def test_consume_until_empty_normalizes_string_queue(backend):
-    backend, mock_conn = backend
-    backend.logger = MagicMock()
-    backend.consume = MagicMock()
-    # Make sure string queues normalize
-    mock_conn.count_queue_messages.side_effect = [1, 0]
-    backend.consume_until_empty(queues="q", block=False)
-    backend.consume.assert_called_with(num_messages=1, queues=["q"], block=False)
-
-
 def test_receive_message_get_raises_empty_returns_none(backend):
     backend, mock_conn = backend
     fake_queue = MagicMock()
@@ -256,3 +156,165 @@ def test_del_handles_exceptions_gracefully(backend):
         pytest.fail("__del__ should catch all exceptions from close()")
     # Verify close was called
     backend.close.assert_called_once()
+
+
+@pytest.fixture
+def redis_backend(backend):
+    """The backend with real fifo and priority queues on an in-process fake Redis server."""
+    backend, mock_conn = backend
+    server = fakeredis.FakeServer()
+
+    def fake_redis(**kwargs):
+        return fakeredis.FakeRedis(server=server)
+
+    with (
+        patch("mindtrace.jobs.redis.fifo_queue.redis.Redis", side_effect=fake_redis),
+        patch("mindtrace.jobs.redis.priority.redis.Redis", side_effect=fake_redis),
+    ):
+        mock_conn.queues = {"q": RedisQueue("q"), "p": RedisPriorityQueue("p")}
+        mock_conn._local_lock = threading.Lock()
+        backend.poll_timeout = 0.2
+        backend.logger = MagicMock()
+        yield backend, mock_conn.queues
+
+
+def test_consume_processes_requested_number(redis_backend):
+    backend, queues = redis_backend
+    for i in range(5):
+        queues["q"].push(json.dumps({"id": i}))
+    backend.consume(num_messages=2, queues="q", prefetch=4)
+
+    assert [c.args[0]["id"] for c in backend.consumer_frontend.run.call_args_list] == [0, 1]
+    assert queues["q"].qsize() == 3
+    stats = backend.stats()["q"]
+    assert (stats.processed, stats.in_flight) == (2, 0)
+
+
+def test_stop_returns_prefetched_messages(redis_backend):
+    backend, queues = redis_backend
+    started, release = threading.Event(), threading.Event()
+    backend.consumer_frontend.run.side_effect = lambda message: (started.set(), release.wait(5))
+    queues["p"].push_many([json.dumps({"id": i}) for i in range(5)], priority=[1, 2, 3, 4, 5])
+    thread = threading.Thread(target=backend.consume, kwargs={"queues": "p", "prefetch": 3})
+    thread.start()
+    assert started.wait(5)
+    backend.stop()
+    release.set()
+    thread.join(timeout=5)
+
+    backend.consumer_frontend.run.assert_called_once_with({"id": 4})
+    assert backend.stats()["p"].requeued == 2
+    queues["p"].push(json.dumps({"id": "new"}), priority=4)
+    assert [json.loads(item)["id"] for item in queues["p"].pop_many(5, block=False)] == [3, "new", 2, 1, 0]
+
+
+def test_stop_returns_prefetched_fifo_messages_to_the_head(redis_backend):
+    backend, queues = redis_backend
+    started, release = threading.Event(), threading.Event()
+    backend.consumer_frontend.run.side_effect = lambda message: (started.set(), release.wait(5))
+    for i in range(4):
+        queues["q"].push(json.dumps({"id": i}))
+    thread = threading.Thread(target=backend.consume, kwargs={"queues": "q", "prefetch": 3})
+    thread.start()
+    assert started.wait(5)
+    backend.stop()
+    queues["q"].push(json.dumps({"id": "new"}))
+    release.set()
+    thread.join(timeout=5)
+
+    backend.consumer_frontend.run.assert_called_once_with({"id": 0})
+    assert [json.loads(queues["q"].pop(block=False))["id"] for _ in range(4)] == [1, 2, 3, "new"]
+
+
+def test_consume_non_block_drains_queues_fairly(redis_backend):
+    backend, queues = redis_backend
+    for i in range(4):
+        queues["q"].push(json.dumps({"id": f"q{i}"}))
+    queues["p"].push_many([json.dumps({"id": f"p{i}"}) for i in range(4)], priority=[0, 5, 0, 9])
+    backend.consume(queues=["q", "p"], block=False)
+
+    handled = [c.args[0]["id"] for c in backend.consumer_frontend.run.call_args_list]
+    assert sorted(handled) == sorted([f"q{i}" for i in range(4)] + [f"p{i}" for i in range(4)])
+    assert [h for h in handled if h.startswith("p")] == ["p3", "p1", "p0", "p2"]
+    assert queues["q"].empty() and queues["p"].empty()
+
+
+def test_consume_until_empty_counts_failures(redis_backend):
+    backend, queues = redis_backend
+    backend.consumer_frontend.run.side_effect = [None, RuntimeError("boom"), None]
+    for i in range(3):
+        queues["q"].push(json.dumps({"id": i}))
+    queues["q"].push("not json")
+    backend.consume_until_empty(queues="q", concurrency=2)
+
+    stats = backend.stats()["q"]
+    assert (stats.received, stats.processed, stats.failed) == (4, 2, 2)
+    backend.logger.info.assert_called_with("Stopped consuming messages from queues: ['q'] (queues empty).")
+
+
+def test_consume_runs_handlers_concurrently(redis_backend):
+    backend, queues = redis_backend
+    barrier = threading.Barrier(3, timeout=5)
+    backend.consumer_frontend.run.side_effect = lambda message: barrier.wait()
+    for i in range(3):
+        queues["q"].push(json.dumps({"id": i}))
+    backend.consume(num_messages=3, queues="q", concurrency=3)
+    assert backend.stats()["q"].processed == 3
+
+
+def test_blocking_consume_picks_up_late_messages_and_stops(redis_backend):
+    backend, queues = redis_backend
+    thread = threading.Thread(target=backend.consume, kwargs={"queues": ["q", "p"]})
+    thread.start()
+    try:
+        time.sleep(0.05)
+        queues["p"].push(json.dumps({"id": "late"}), priority=3)
+        deadline = time.perf_counter() + 5
+        while backend.consumer_frontend.run.call_count < 1 and time.perf_counter() < deadline:
+            time.sleep(0.01)
+    finally:
+        backend.stop()
+        thread.join(timeout=5)
+    assert not thread.is_alive()
+    backend.consumer_frontend.run.assert_called_once_with({"id": "late"})
+
+
+def test_fetch_messages_and_requeue_keep_priority(redis_backend):
+    backend, queues = redis_backend
+    queues["p"].push(json.dumps({"id": 1}), priority=7)
+    queues["p"].push(json.dumps({"id": 2}), priority=7)
+    [(message, score)] = backend.fetch_messages("p", 1, block=False)
+    assert message == {"id": 1}
+    queues["p"].push(json.dumps({"id": 3}), priority=7)
+    backend.requeue_message("p", message, score=score)
+    assert [m for m, _ in backend.fetch_messages("p", 5, block=False)] == [{"id": 1}, {"id": 2}, {"id": 3}]
+    assert backend.fetch_messages("q", 5, block=True, timeout=0.05) == []
+
+
+def test_consume_backs_off_on_receive_errors(redis_backend):
+    backend, queues = redis_backend
+
+    class Broken:
+        def pop(self, *args, **kwargs):
+            raise ConnectionError("redis down")
+
+    queues["broken"] = Broken()
+    backend.max_backoff = 0.05
+    thread = threading.Thread(target=backend.consume, kwargs={"queues": "broken"})
+    thread.start()
+    time.sleep(0.3)
+    backend.stop()
+    thread.join(timeout=5)
+    errors = backend.stats()["broken"].receive_errors
+    assert 2 <= errors < 100
+
+
+def test_aprocess_message(backend):
+    backend, _ = backend
+    backend.logger = MagicMock()
+    frontend = MagicMock()
+    frontend.run = AsyncMock(side_effect=[None, RuntimeError("fail")])
+    backend.consumer_frontend = frontend
+    assert asyncio.run(backend.aprocess_message({"id": 1}))
+    assert not asyncio.run(backend.aprocess_message({"id": 2}))
+    assert not asyncio.run(backend.aprocess_message("notadict"))
@@ -0,0 +1,168 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from unittest.mock import MagicMock
+
+import pytest
+
+from mindtrace.jobs.redis.consumer_runtime import QueueConsumerStats, RedisConsumerRuntime
+
+
+class FakeBackend:
+    """In-memory stand-in for RedisConsumerBackend with the methods the runtime calls."""
+
+    def __init__(self, queues, run=None):
+        self.queues = {name: deque(messages) for name, messages in queues.items()}
+        self.lock = threading.Condition()
+        self.handled = []
+        self.requeued = []
+        self.consumer_frontend = MagicMock()
+        self.consumer_frontend.run = run or (lambda message: None)
+
+    def push(self, queue, message):
+        with self.lock:
+            self.queues[queue].append(message)
+            self.lock.notify_all()
+
+    def fetch_messages(self, queue, count, *, block=True, timeout=None):
+        with self.lock:
+            if block and not self.queues[queue]:
+                self.lock.wait_for(lambda: self.queues[queue], timeout=timeout)
+            taken = []
+            while self.queues[queue] and len(taken) < count:
+                taken.append((self.queues[queue].popleft(), None))
+            return taken
+
+    def requeue_message(self, queue, message, *, score=None):
+        self.requeued.append((queue, message))
+        self.queues[queue].appendleft(message)
+
+    def process_message(self, message):
+        self.consumer_frontend.run(message)
+        self.handled.append(message)
+        return True
+
+    async def aprocess_message(self, message):
+        await self.consumer_frontend.run(message)
+        self.handled.append(message)
+        return True
+
+
+def test_until_empty_round_robins_across_queues():
+    # The slow handler lets both prefetch buffers fill while the first message is processed.
+    backend = FakeBackend({"a": [f"a{i}" for i in range(4)], "b": ["b0", "b1"]}, run=lambda m: time.sleep(0.02))
+    runtime = RedisConsumerRuntime(backend, ["a", "b"], prefetch=4, receive_timeout=0.1)
+    assert runtime.run(until_empty=True) == 6
+    assert sorted(backend.handled) == ["a0", "a1", "a2", "a3", "b0", "b1"]
+    assert backend.handled.index("b1") < backend.handled.index("a3")
+
+
+def test_limit_caps_prefetch_to_remaining_messages():
+    backend = FakeBackend({"a": [f"a{i}" for i in range(10)]})
+    runtime = RedisConsumerRuntime(backend, ["a"], concurrency=2, prefetch=5, receive_timeout=5.0)
+    start = time.perf_counter()
+    assert runtime.run(3) == 3
+    assert time.perf_counter() - start < 1.0  # no fetcher left waiting in a blocking receive
+    assert len(backend.handled) == 3
+    assert len(backend.queues["a"]) == 7
+    stats = runtime.stats()["a"]
+    assert isinstance(stats, QueueConsumerStats)
+    assert (stats.received, stats.processed, stats.requeued, stats.in_flight) == (3, 3, 0, 0)
+
+
+def test_prefetch_window_bounds_messages_held():
+    release = threading.Event()
+    backend = FakeBackend({"a": [f"a{i}" for i in range(10)]}, run=lambda message: release.wait(5))
+    runtime = RedisConsumerRuntime(backend, ["a"], concurrency=1, prefetch=3, receive_timeout=0.05)
+    thread = threading.Thread(target=runtime.run)
+    thread.start()
+    try:
+        time.sleep(0.2)
+        assert runtime.stats()["a"].in_flight == 3
+        assert len(backend.queues["a"]) == 7
+    finally:
+        runtime.stop()
+        release.set()
+        thread.join(timeout=5)
+    assert len(backend.handled) == 1
+    assert list(backend.queues["a"]) == [f"a{i}" for i in range(1, 10)]
+
+
+@pytest.mark.parametrize("coroutine", [True, False])
+def test_asyncio_workers_run_handlers_concurrently(coroutine):
+    if coroutine:
+        active = []
+
+        async def run(message):
+            active.append(message)
+            while len(active) < 3:
+                await asyncio.sleep(0.005)
+
+    else:
+        barrier = threading.Barrier(3, timeout=5)
+
+        def run(message):
+            barrier.wait()
+
+    backend = FakeBackend({"a": ["m0", "m1", "m2"]}, run=run)
+    runtime = RedisConsumerRuntime(backend, ["a"], concurrency=3, worker_type="asyncio", receive_timeout=0.1)
+    assert runtime.run(until_empty=True) == 3
+    assert sorted(backend.handled) == ["m0", "m1", "m2"]
+
+
+def test_blocking_run_waits_for_new_messages():
+    backend = FakeBackend({"a": []})
+    runtime = RedisConsumerRuntime(backend, ["a"], receive_timeout=1.0)
+    threading.Timer(0.05, backend.push, args=("a", "late")).start()
+    start = time.perf_counter()
+    assert runtime.run(1) == 1
+    assert time.perf_counter() - start < 1.0
+    assert backend.handled == ["late"]
+
+
+def test_receive_outliving_shutdown_requeues_its_messages():
+    backend = FakeBackend({"a": ["late"]})
+    fetch_messages = backend.fetch_messages
+
+    def slow_fetch_messages(queue, count, **kwargs):
+        time.sleep(1.5)  # a blocking receive that returns after run() gave up joining the fetcher
+        return fetch_messages(queue, count, **kwargs)
+
+    backend.fetch_messages = slow_fetch_messages
+    runtime = RedisConsumerRuntime(backend, ["a"], receive_timeout=0.05)
+    threading.Timer(0.1, runtime.stop).start()
+    assert runtime.run() == 0
+
+    deadline = time.monotonic() + 5
+    while not backend.requeued and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert backend.requeued == [("a", "late")]
+    assert list(backend.queues["a"]) == ["late"]
+    assert backend.handled == []
+    assert runtime.stats()["a"].in_flight == 0
+
+
+def test_handler_errors_are_counted():
+    backend = FakeBackend({"a": ["ok", "bad"]})
+    backend.process_message = lambda message: message == "ok" or 1 / 0
+    runtime = RedisConsumerRuntime(backend, ["a"], receive_timeout=0.1)
+    assert runtime.run(until_empty=True) == 2
+    stats = runtime.stats()["a"]
+    assert (stats.processed, stats.failed) == (1, 1)
+    assert stats.max_latency_ms >= stats.mean_latency_ms >= 0
+
+
+@pytest.mark.parametrize(
+    "kwargs, match",
+    [
+        ({"concurrency": 0}, "concurrency"),
+        ({"prefetch": 0}, "prefetch"),
+        ({"worker_type": "process"}, "worker_type"),
+    ],
+)
+def test_invalid_arguments(kwargs, match):
+    with pytest.raises(ValueError, match=match):
+        RedisConsumerRuntime(FakeBackend({"a": []}), ["a"], **kwargs)
+    with pytest.raises(ValueError, match="queue"):
+        RedisConsumerRuntime(FakeBackend({}), [])
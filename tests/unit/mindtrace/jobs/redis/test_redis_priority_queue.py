@@ -1,9 +1,13 @@
+import threading
+import time
 from queue import Empty
 from unittest.mock import MagicMock, patch
 
+import fakeredis
 import pytest
 
-from mindtrace.jobs.redis.priority import RedisPriorityQueue
+from mindtrace.jobs.redis.codecs import JsonCodec, MsgpackCodec, PickleCodec, QueueCodec, resolve_codec
+from mindtrace.jobs.redis.priority import MAX_PRIORITY, RedisPriorityQueue
 
 
 @pytest.fixture
@@ -14,36 +18,49 @@ def mock_redis():
         yield mock_instance
 
 
-def test_push_calls_zadd(mock_redis):
+@pytest.fixture
+def fake_server():
+    server = fakeredis.FakeServer()
+    with patch(
+        "mindtrace.jobs.redis.priority.redis.Redis",
+        side_effect=lambda **kwargs: fakeredis.FakeRedis(server=server),
+    ):
+        yield server
+
+
+def test_push_calls_zadd_with_sequenced_member(mock_redis):
     queue = RedisPriorityQueue("testq", host="localhost", port=6381, db=0)
-    with patch("pickle.dumps", return_value=b"data"):
-        queue.push("item", priority=5)
-        assert mock_redis.zadd.called
+    mock_redis.incr.return_value = 7
+    queue.push("item", priority=5)
+
+    mock_redis.incr.assert_called_once_with("priority_queue:testq:seq")
+    (key, mapping), _ = mock_redis.zadd.call_args
+    assert key == "priority_queue:testq"
+    [(member, score)] = mapping.items()
+    assert member == (7).to_bytes(8, "big") + b'"item"'
+    assert score == 5 * 2**32 + 2**32 - 1 - 7
 
 
-def test_pop_blocking_returns_item(mock_redis):
+def test_pop_blocking_uses_bzpopmax(mock_redis):
     queue = RedisPriorityQueue("testq")
-    mock_redis.zpopmax.return_value = [(b"pickled", 1.0)]
-    with patch("pickle.loads", return_value="unpickled"):
-        result = queue.pop(block=True, timeout=0.1)
-        assert result == "unpickled"
-        mock_redis.zpopmax.assert_called()
+    mock_redis.bzpopmax.return_value = (b"priority_queue:testq", (1).to_bytes(8, "big") + b'"payload"', 1.0)
+    assert queue.pop(block=True, timeout=0.1) == "payload"
+    mock_redis.bzpopmax.assert_called_once_with("priority_queue:testq", timeout=0.1)
+    mock_redis.zpopmax.assert_not_called()
 
 
-def test_pop_blocking_empty_raises(mock_redis):
+def test_pop_blocking_without_timeout_waits_forever(mock_redis):
     queue = RedisPriorityQueue("testq")
-    mock_redis.zpopmax.return_value = []
-    with pytest.raises(Empty):
-        queue.pop(block=True, timeout=0.1)
+    mock_redis.bzpopmax.return_value = (b"k", (1).to_bytes(8, "big") + b"1", 1.0)
+    queue.pop(block=True, timeout=None)
+    mock_redis.bzpopmax.assert_called_once_with("priority_queue:testq", timeout=0)
 
 
-def test_pop_nonblocking_returns_item(mock_redis):
+def test_pop_blocking_empty_raises(mock_redis):
     queue = RedisPriorityQueue("testq")
-    mock_redis.zpopmax.return_value = [(b"pickled", 1.0)]
-    with patch("pickle.loads", return_value="unpickled"):
-        result = queue.pop(block=False)
-        assert result == "unpickled"
-        mock_redis.zpopmax.assert_called()
+    mock_redis.bzpopmax.return_value = None
+    with pytest.raises(Empty):
+        queue.pop(block=True, timeout=0.1)
 
 
 def test_pop_nonblocking_empty_raises(mock_redis):
@@ -51,6 +68,7 @@ def test_pop_nonblocking_empty_raises(mock_redis):
     mock_redis.zpopmax.return_value = []
     with pytest.raises(Empty):
         queue.pop(block=False)
+    mock_redis.bzpopmax.assert_not_called()
 
 
 def test_qsize_and_empty(mock_redis):
@@ -60,3 +78,153 @@ def test_qsize_and_empty(mock_redis):
     assert not queue.empty()
     mock_redis.zcard.return_value = 0
     assert queue.empty()
+
+
+@pytest.mark.parametrize("priority", [1.5, MAX_PRIORITY + 1, -MAX_PRIORITY - 1])
+def test_push_rejects_unrepresentable_priorities(mock_redis, priority):
+    queue = RedisPriorityQueue("testq")
+    with pytest.raises(ValueError, match="Priority"):
+        queue.push("item", priority=priority)
+    mock_redis.zadd.assert_not_called()
+
+
+class TestOrdering:
+    def test_priority_then_fifo_order_across_producers(self, fake_server):
+        producer_a = RedisPriorityQueue("q")
+        producer_b = RedisPriorityQueue("q")
+        producer_a.push("a-low", priority=1)
+        producer_b.push("b-high", priority=10)
+        producer_a.push("a-high", priority=10)
+        producer_b.push("b-low", priority=1)
+        producer_a.push("negative", priority=-MAX_PRIORITY)
+        producer_b.push("top", priority=MAX_PRIORITY)
+
+        consumer = RedisPriorityQueue("q")
+        assert [consumer.pop(block=False) for _ in range(6)] == [
+            "top",
+            "b-high",
+            "a-high",
+            "a-low",
+            "b-low",
+            "negative",
+        ]
+
+    def test_duplicate_items_are_kept(self, fake_server):
+        queue = RedisPriorityQueue("q")
+        queue.push({"job": 1})
+        queue.push({"job": 1})
+        assert queue.qsize() == 2
+        assert queue.pop_many(5, block=False) == [{"job": 1}, {"job": 1}]
+
+
+class TestBatchOperations:
+    def test_push_many_and_pop_many(self, fake_server):
+        queue = RedisPriorityQueue("q")
+        queue.push_many(["a", "b", "c"], priority=[0, 5, 0])
+        queue.push_many(["d", "e"])
+
+        assert queue.pop_many(2, block=False) == ["b", "a"]
+        assert queue.pop_many(10, block=False) == ["c", "d", "e"]
+        with pytest.raises(Empty):
+            queue.pop_many(10, block=False)
+
+    def test_pop_many_with_priority(self, fake_server):
+        queue = RedisPriorityQueue("q")
+        queue.push_many(["a", "b", "c"], priority=[-3, 7, 0])
+        entries = queue.pop_many(3, block=False, with_priority=True)
+        assert [item for item, _ in entries] == ["b", "c", "a"]
+        assert [int(score // 2**32) for _, score in entries] == [7, 0, -3]
+
+    def test_push_back_restores_original_position(self, fake_server):
+        queue = RedisPriorityQueue("q")
+        queue.push_many(["a", "b", "c"], priority=[1, 1, 2])
+        taken = queue.pop_many(2, block=False, with_priority=True)
+        queue.push("d", priority=1)
+        queue.push("e", priority=2)
+        queue.push_back(taken)
+        assert queue.pop_many(10, block=False) == ["c", "e", "a", "b", "d"]
+
+    def test_push_many_validates_before_writing(self, fake_server):
+        queue = RedisPriorityQueue("q")
+        with pytest.raises(ValueError, match="priorities"):
+            queue.push_many(["a", "b"], priority=[1])
+        with pytest.raises(ValueError, match="Priority"):
+            queue.push_many(["a", "b"], priority=[1, 0.5])
+        queue.push_many([])
+        assert queue.empty()
+
+    def test_pop_many_rejects_non_positive_count(self, fake_server):
+        with pytest.raises(ValueError):
+            RedisPriorityQueue("q").pop_many(0)
+
+
+class TestBlocking:
+    def test_blocking_pop_wakes_on_push(self, fake_server):
+        consumer = RedisPriorityQueue("q")
+        producer = RedisPriorityQueue("q")
+        timer = threading.Timer(0.05, producer.push, args=("delayed",))
+        timer.start()
+        try:
+            start = time.perf_counter()
+            assert consumer.pop(block=True, timeout=2) == "delayed"
+            assert time.perf_counter() - start < 1.0
+        finally:
+            timer.join()
+
+    def test_blocking_pop_many_takes_first_then_rest(self, fake_server):
+        consumer = RedisPriorityQueue("q")
+        producer = RedisPriorityQueue("q")
+        timer = threading.Timer(0.05, producer.push_many, args=(["x", "y", "z"],))
+        timer.start()
+        try:
+            assert consumer.pop_many(2, block=True, timeout=2) == ["x", "y"]
+        finally:
+            timer.join()
+        assert consumer.pop(block=True, timeout=0) == "z"
+
+    def test_blocking_pop_times_out(self, fake_server):
+        with pytest.raises(Empty):
+            RedisPriorityQueue("q").pop(block=True, timeout=0.05)
+        with pytest.raises(Empty):
+            RedisPriorityQueue("q").pop_many(3, block=True, timeout=0.05)
+
+
+class TestCodecs:
+    @pytest.mark.parametrize("codec", ["json", JsonCodec(), PickleCodec()])
+    def test_round_trip(self, fake_server, codec):
+        queue = RedisPriorityQueue("q", codec=codec)
+        message = {"job_id": "1", "payload": [1, 2.5, "three", None]}
+        queue.push(message, priority=3)
+        assert queue.pop(block=False) == message
+
+    def test_custom_codec(self, fake_server):
+        class Upper(QueueCodec):
+            name = "upper"
+
+            def encode(self, item):
+                return item.upper().encode()
+
+            def decode(self, data):
+                return data.decode()
+
+        queue = RedisPriorityQueue("q", codec=Upper())
+        queue.push("hello")
+        assert queue.pop(block=False) == "HELLO"
+
+    def test_resolve_codec(self):
+        assert isinstance(resolve_codec("JSON"), JsonCodec)
+        codec = PickleCodec()
+        assert resolve_codec(codec) is codec
+        with pytest.raises(ValueError, match="Unknown queue codec"):
+            resolve_codec("yaml")
+
+    def test_msgpack_codec_requires_msgpack(self):
+        with patch.dict("sys.modules", {"msgpack": None}):
+            with pytest.raises(ImportError, match="pip install msgpack"):
+                MsgpackCodec()
+
+    def test_msgpack_codec_round_trip(self, fake_server):
+        pytest.importorskip("msgpack")
+        queue = RedisPriorityQueue("q", codec="msgpack")
+        queue.push({"blob": b"\x00\xff", "n": 1})
+        assert queue.pop(block=False) == {"blob": b"\x00\xff", "n": 1}
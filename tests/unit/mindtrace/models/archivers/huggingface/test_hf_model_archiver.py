@@ -6,6 +6,7 @@ from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
+import torch
 
 from mindtrace.models.archivers.huggingface.hf_model_archiver import (
     _HF_AVAILABLE,
@@ -55,7 +56,7 @@ def test_hf_archiver_save(hf_archiver):
     hf_archiver.save(mock_model)
 
     # Verify model.save_pretrained was called with correct path
-    mock_model.save_pretrained.assert_called_once_with(hf_archiver.uri)
+    mock_model.save_pretrained.assert_called_once_with(hf_archiver.uri, safe_serialization=True)
 
 
 def test_hf_archiver_save_creates_directory(temp_dir):
@@ -95,6 +96,23 @@ def test_hf_archiver_load(hf_archiver, temp_dir):
             result = hf_archiver.load(MagicMock)
 
             assert result == mock_model_instance
+            mock_bert.from_pretrained.assert_called_once_with(hf_archiver.uri, config=mock_config)
+
+
+def test_hf_archiver_lazy_load_uses_low_cpu_mem_usage(hf_archiver, temp_dir):
+    """Test load(lazy=True) builds the model on the meta device via low_cpu_mem_usage."""
+    (Path(temp_dir) / "config.json").write_text('{"architectures": ["BertModel"], "model_type": "bert"}')
+
+    with patch("transformers.AutoConfig") as mock_auto_config:
+        mock_config = MagicMock()
+        mock_auto_config.from_pretrained.return_value = mock_config
+        mock_bert = MagicMock()
+        mock_bert.__name__ = "BertModel"
+
+        with patch.object(HuggingFaceModelArchiver, "_get_model_class", return_value=mock_bert):
+            hf_archiver.load(MagicMock, lazy=True)
+
+        mock_bert.from_pretrained.assert_called_once_with(hf_archiver.uri, config=mock_config, low_cpu_mem_usage=True)
 
 
 def test_hf_archiver_load_missing_config(hf_archiver):
@@ -156,19 +174,21 @@ def test_hf_archiver_save_with_peft_adapter(hf_archiver):
     mock_model.peft_config = {"default": mock_peft_config}
 
     with patch("peft.get_peft_model_state_dict") as mock_get_state:
-        mock_get_state.return_value = {"layer": "weights"}
+        mock_get_state.return_value = {"layer": torch.zeros(2)}
 
-        with patch("torch.save") as mock_torch_save:
-            hf_archiver.save(mock_model)
+        hf_archiver.save(mock_model)
 
-            # Verify base model saved
-            mock_model.save_pretrained.assert_called_once()
+        # Verify base model saved
+        mock_model.save_pretrained.assert_called_once()
 
-            # Verify adapter config saved
-            mock_peft_config.save_pretrained.assert_called_once()
+        # Verify adapter config saved
+        mock_peft_config.save_pretrained.assert_called_once()
 
-            # Verify adapter weights saved
-            mock_torch_save.assert_called_once()
+        # Verify adapter weights saved as safetensors
+        from safetensors.torch import load_file
+
+        adapter_weights = load_file(os.path.join(hf_archiver.uri, "adapter", "adapter_model.safetensors"))
+        assert torch.equal(adapter_weights["layer"], torch.zeros(2))
 
 
 @pytest.mark.skipif(not HAS_PEFT, reason="peft not installed")
@@ -262,9 +282,9 @@ def test_save_peft_model_merges_and_saves(hf_archiver, temp_dir):
     with (
         patch("copy.deepcopy", return_value=mock_model) as mock_deepcopy,
         patch("peft.get_peft_model_state_dict") as mock_get_state,
-        patch("torch.save") as mock_torch_save,
+        patch("safetensors.torch.save_file") as mock_save_file,
     ):
-        mock_get_state.return_value = {"lora_A": "weights"}
+        mock_get_state.return_value = {"lora_A": torch.ones(2)}
 
         hf_archiver._save_peft_model(mock_model)
 
@@ -275,16 +295,16 @@ def test_save_peft_model_merges_and_saves(hf_archiver, temp_dir):
         mock_model.merge_and_unload.assert_called_once()
 
         # Merged model saved
-        mock_merged.save_pretrained.assert_called_once_with(temp_dir)
+        mock_merged.save_pretrained.assert_called_once_with(temp_dir, safe_serialization=True)
 
         # Adapter config saved for provenance
         adapter_dir = os.path.join(temp_dir, "adapter")
         mock_peft_config.save_pretrained.assert_called_once_with(adapter_dir)
 
         # Adapter weights saved
-        mock_torch_save.assert_called_once()
-        saved_path = mock_torch_save.call_args[0][1]
-        assert saved_path == os.path.join(adapter_dir, "adapter.bin")
+        mock_save_file.assert_called_once()
+        saved_path = mock_save_file.call_args[0][1]
+        assert saved_path == os.path.join(adapter_dir, "adapter_model.safetensors")
 
         # archiver_meta.json written with merged=True
         meta_path = os.path.join(adapter_dir, "archiver_meta.json")
@@ -310,7 +330,7 @@ def test_save_peft_model_no_default_config(hf_archiver, temp_dir):
     with (
         patch("copy.deepcopy", return_value=mock_model),
         patch("peft.get_peft_model_state_dict", return_value={}),
-        patch("torch.save"),
+        patch("safetensors.torch.save_file"),
     ):
         hf_archiver._save_peft_model(mock_model)
 
@@ -387,6 +407,29 @@ def test_load_peft_adapter_injects_when_not_merged(hf_archiver, temp_dir):
         assert result is mock_injected
 
 
+@pytest.mark.skipif(not HAS_PEFT, reason="peft not installed")
+def test_load_peft_adapter_reads_safetensors_weights(hf_archiver, temp_dir):
+    """Test _load_peft_adapter prefers adapter_model.safetensors over a legacy adapter.bin."""
+    from safetensors.torch import save_file
+
+    adapter_dir = Path(temp_dir) / "adapter"
+    adapter_dir.mkdir()
+    (adapter_dir / "adapter_config.json").write_text('{"peft_type": "LORA"}')
+    save_file({"lora_A": torch.ones(3)}, str(adapter_dir / "adapter_model.safetensors"))
+
+    with (
+        patch("peft.PeftConfig"),
+        patch("peft.inject_adapter_in_model", side_effect=lambda config, model: model),
+        patch("peft.set_peft_model_state_dict") as mock_set_state,
+        patch("torch.load") as mock_torch_load,
+    ):
+        hf_archiver._load_peft_adapter(MagicMock())
+
+    mock_torch_load.assert_not_called()
+    loaded_state = mock_set_state.call_args[0][1]
+    assert torch.equal(loaded_state["lora_A"], torch.ones(3))
+
+
 @pytest.mark.skipif(not HAS_PEFT, reason="peft not installed")
 def test_load_peft_adapter_no_adapter_dir(hf_archiver):
     """Test _load_peft_adapter returns model unchanged when no adapter directory exists."""
@@ -8,6 +8,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 import torch
+from safetensors.torch import load_file
 
 from mindtrace.models.archivers.timm.timm_model_archiver import (
     _TIMM_AVAILABLE,
@@ -63,25 +64,27 @@ def test_timm_archiver_is_timm_model(timm_archiver):
 def test_timm_archiver_save(timm_archiver, temp_dir):
     """Test save method."""
     # Create mock timm model with controlled attributes
-    mock_model = MagicMock(spec=["pretrained_cfg", "num_classes", "state_dict"])
+    mock_model = MagicMock(spec=["pretrained_cfg", "num_classes", "state_dict", "named_buffers"])
     mock_model.pretrained_cfg = {"architecture": "resnet18"}
     mock_model.num_classes = 10
     mock_model.state_dict.return_value = {"layer1.weight": torch.zeros(1)}
+    mock_model.named_buffers.return_value = []
 
-    with patch("torch.save") as mock_torch_save:
-        timm_archiver.save(mock_model)
+    timm_archiver.save(mock_model)
 
-        # Verify config was saved
-        config_path = Path(temp_dir) / "config.json"
-        assert config_path.exists()
+    # Verify config was saved
+    config_path = Path(temp_dir) / "config.json"
+    assert config_path.exists()
 
-        with open(config_path) as f:
-            config = json.load(f)
-        assert config["architecture"] == "resnet18"
-        assert config["num_classes"] == 10
+    with open(config_path) as f:
+        config = json.load(f)
+    assert config["architecture"] == "resnet18"
+    assert config["num_classes"] == 10
 
-        # Verify state dict was saved
-        mock_torch_save.assert_called_once()
+    # Verify state dict was saved as safetensors, with no buffers file for a model without extra buffers
+    assert load_file(Path(temp_dir) / "model.safetensors").keys() == {"layer1.weight"}
+    assert not (Path(temp_dir) / "model.pt").exists()
+    assert not (Path(temp_dir) / "buffers.safetensors").exists()
 
 
 def test_timm_archiver_save_creates_directory(temp_dir):
@@ -89,12 +92,12 @@ def test_timm_archiver_save_creates_directory(temp_dir):
     nested_dir = os.path.join(temp_dir, "nested", "path")
     archiver = TimmModelArchiver(uri=nested_dir)
 
-    mock_model = MagicMock(spec=["pretrained_cfg", "state_dict"])
+    mock_model = MagicMock(spec=["pretrained_cfg", "state_dict", "named_buffers"])
     mock_model.pretrained_cfg = {"architecture": "resnet18"}
     mock_model.state_dict.return_value = {}
+    mock_model.named_buffers.return_value = []
 
-    with patch("torch.save"):
-        archiver.save(mock_model)
+    archiver.save(mock_model)
 
     assert os.path.exists(nested_dir)
 
@@ -125,7 +128,7 @@ def test_timm_archiver_load_missing_weights(timm_archiver, temp_dir):
 
 @pytest.mark.skipif(not HAS_TIMM, reason="timm not installed")
 def test_timm_archiver_load(timm_archiver, temp_dir):
-    """Test load method."""
+    """Test load method on an artifact saved with the legacy ``model.pt`` weights."""
     # Create config
     config = {
         "architecture": "resnet18",
@@ -193,3 +196,44 @@ def test_timm_archiver_roundtrip(temp_dir):
         out1 = model(dummy_input)
         out2 = loaded_model(dummy_input)
     assert torch.allclose(out1, out2)
+
+
+@pytest.mark.skipif(not HAS_TIMM, reason="timm not installed")
+@pytest.mark.parametrize("keep_buffers_file", [True, False])
+def test_timm_archiver_lazy_load_assigns_memory_mapped_weights(temp_dir, keep_buffers_file):
+    """Test lazy=True builds on the meta device and restores the non-persistent buffers."""
+    archiver = TimmModelArchiver(uri=temp_dir)
+    # efficientvit_m0 registers its attention bias indices as non-persistent buffers
+    model = timm.create_model("efficientvit_m0", pretrained=False, num_classes=3).eval()
+    archiver.save(model)
+    assert os.path.exists(os.path.join(temp_dir, "buffers.safetensors"))
+    if not keep_buffers_file:
+        os.remove(os.path.join(temp_dir, "buffers.safetensors"))
+
+    with patch("timm.create_model", wraps=timm.create_model) as create_model:
+        loaded = archiver.load(MagicMock, lazy=True).eval()
+
+    # The CPU build only happens when the buffers have to be recovered from a fresh model
+    assert create_model.call_count == (1 if keep_buffers_file else 2)
+    assert not any(t.is_meta for t in [*loaded.parameters(), *loaded.buffers()])
+    dummy_input = torch.randn(2, 3, 224, 224)
+    with torch.no_grad():
+        assert torch.equal(loaded(dummy_input), model(dummy_input))
+
+
+@pytest.mark.skipif(not HAS_TIMM, reason="timm not installed")
+def test_timm_archiver_restores_tied_weight_names(temp_dir):
+    """Test that a weight stored once for tied parameters is restored under every name."""
+    archiver = TimmModelArchiver(uri=temp_dir)
+    model = timm.create_model("test_vit", pretrained=False, num_classes=4)
+    model.extra_head = torch.nn.Linear(model.head.in_features, 4)
+    model.extra_head.weight = model.head.weight
+    archiver.save(model)
+
+    state_dict = load_file(os.path.join(temp_dir, "model.safetensors"))
+    assert len({"head.weight", "extra_head.weight"} & state_dict.keys()) == 1
+
+    TimmModelArchiver._restore_tied_entries(model, state_dict)
+
+    assert torch.equal(state_dict["head.weight"], model.head.weight.detach())
+    assert torch.equal(state_dict["extra_head.weight"], model.head.weight.detach())
@@ -6,7 +6,9 @@ import numpy as np
 import pytest
 
 from mindtrace.models.evaluation.metrics.classification import (
+    ClassificationMetricAccumulator,
     accuracy,
+    classification_report,
     precision_recall_f1,
     roc_auc_score,
     top_k_accuracy,
@@ -94,3 +96,35 @@ class TestRocAucScoreMirrored:
         score = roc_auc_score(probs, targets, num_classes=2, average="weighted")
 
         assert score == pytest.approx(0.0)
+
+
+class TestClassificationMetricAccumulator:
+    def test_sharded_updates_match_whole_array_metrics_exactly(self):
+        rng = np.random.default_rng(0)
+        preds = rng.integers(0, 5, size=1_000)
+        targets = np.where(rng.random(1_000) < 0.7, preds, rng.integers(0, 5, size=1_000))
+        shards = [ClassificationMetricAccumulator(num_classes=5) for _ in range(3)]
+        for start in range(0, 1_000, 64):
+            shards[(start // 64) % 3].update(preds[start : start + 64], targets[start : start + 64])
+        merged = shards[0]
+        merged.merge(shards[1])
+        merged.merge(shards[2])
+
+        result = merged.compute(class_names=list("abcde"))
+
+        assert result["accuracy"] == accuracy(preds, targets)
+        assert (result["precision"], result["recall"], result["f1"]) == precision_recall_f1(preds, targets, 5)
+        assert result["classification_report"] == classification_report(preds, targets, 5, class_names=list("abcde"))
+        assert merged.num_samples == 1_000
+
+    def test_validates_labels_shapes_and_merge_compatibility(self):
+        accumulator = ClassificationMetricAccumulator(num_classes=3)
+
+        with pytest.raises(ValueError, match="Shape mismatch"):
+            accumulator.update(np.array([0, 1]), np.array([0]))
+        with pytest.raises(ValueError, match=r"\[0, 3\)"):
+            accumulator.update(np.array([0, 3]), np.array([0, 1]))
+        with pytest.raises(ValueError, match="must not be empty"):
+            accumulator.compute()
+        with pytest.raises(ValueError, match="Cannot merge"):
+            accumulator.merge(ClassificationMetricAccumulator(num_classes=4))
@@ -0,0 +1,158 @@
+"""Tests for the multi-threshold engine in `mindtrace.models.evaluation.metrics.detection`."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from mindtrace.models.evaluation.metrics.detection import (
+    COCO_IOU_THRESHOLDS,
+    DetectionMetricAccumulator,
+    _match_predictions,
+    average_precision,
+    coco_map_summary,
+    mean_average_precision,
+    mean_average_precision_50_95,
+)
+from mindtrace.models.testing.suites.detection_metrics import (
+    reference_mean_average_precision_50_95,
+    synthetic_detections,
+)
+
+
+def _reference_average_precision(scores: np.ndarray, matched: np.ndarray, num_gt: int) -> float:
+    order = np.argsort(-scores)
+    cum_tp = np.cumsum(matched[order].astype(np.float64))
+    cum_fp = np.cumsum((~matched[order]).astype(np.float64))
+    precision = cum_tp / (cum_tp + cum_fp)
+    recall = cum_tp / num_gt
+    ap = 0.0
+    for r in np.linspace(0.0, 1.0, 101):
+        mask = recall >= r
+        ap += np.max(precision[mask]) if mask.any() else 0.0
+    return float(ap / 101)
+
+
+class TestMatchPredictions:
+    def test_matches_each_threshold_independently(self):
+        # Row 0 overlaps GT 0 at 0.8; row 1 overlaps GT 0 at 0.9 and GT 1 at 0.6.
+        iou = np.array([[0.8, 0.0], [0.9, 0.6]])
+
+        is_tp = _match_predictions(iou, np.array([0.5, 0.7, 0.85]))
+
+        np.testing.assert_array_equal(is_tp, [[True, True, False], [True, False, True]])
+
+    def test_ties_go_to_lowest_gt_index_and_threshold_is_strict(self):
+        iou = np.array([[0.75, 0.75], [0.75, 0.75], [0.5, 0.0]])
+
+        is_tp = _match_predictions(iou, np.array([0.5, 0.75]))
+
+        np.testing.assert_array_equal(is_tp, [[True, True], [True, True], [False, False]])
+
+    def test_without_gt_boxes_everything_is_unmatched(self):
+        assert not _match_predictions(np.zeros((3, 0)), COCO_IOU_THRESHOLDS).any()
+
+
+class TestAveragePrecision:
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_per_recall_threshold_loop_exactly(self, seed: int):
+        rng = np.random.default_rng(seed)
+        scores = np.round(rng.random(200), 1)
+        matched = rng.random(200) < 0.4
+
+        assert average_precision(scores, matched, 120) == _reference_average_precision(scores, matched, 120)
+
+
+class TestDetectionMetricAccumulator:
+    @pytest.mark.parametrize(
+        ("num_classes", "gt_per_image", "predictions_per_image"),
+        [(5, 8, 60), (20, 3, 30), (3, 0, 10), (3, 5, 0)],
+    )
+    def test_matches_per_threshold_reference_exactly(self, num_classes, gt_per_image, predictions_per_image):
+        predictions, targets = synthetic_detections(
+            60,
+            num_classes=num_classes,
+            gt_per_image=gt_per_image,
+            predictions_per_image=predictions_per_image,
+            seed=num_classes,
+        )
+
+        assert mean_average_precision_50_95(predictions, targets, num_classes) == (
+            reference_mean_average_precision_50_95(predictions, targets, num_classes)
+        )
+
+    def test_batched_updates_match_a_single_update(self):
+        predictions, targets = synthetic_detections(50, num_classes=4, gt_per_image=5, predictions_per_image=40)
+        whole = DetectionMetricAccumulator(num_classes=4)
+        whole.update(predictions, targets)
+        batched = DetectionMetricAccumulator(num_classes=4)
+        for start in range(0, 50, 7):
+            batched.update(predictions[start : start + 7], targets[start : start + 7])
+
+        assert batched.compute() == whole.compute()
+        assert batched.num_images == 50
+
+    def test_merging_contiguous_shards_matches_a_single_accumulator(self):
+        predictions, targets = synthetic_detections(40, num_classes=3, gt_per_image=4, predictions_per_image=30)
+        whole = DetectionMetricAccumulator(num_classes=3)
+        whole.update(predictions, targets)
+        merged = DetectionMetricAccumulator(num_classes=3)
+        for start in range(0, 40, 15):
+            shard = DetectionMetricAccumulator(num_classes=3)
+            shard.update(predictions[start : start + 15], targets[start : start + 15])
+            merged.merge(shard)
+
+        assert merged.compute() == whole.compute()
+        assert merged.num_images == 40
+        with pytest.raises(ValueError, match="Cannot merge"):
+            merged.merge(DetectionMetricAccumulator(num_classes=3, iou_thresholds=[0.5]))
+
+    def test_compute_reports_per_threshold_and_per_class_values(self):
+        predictions = [
+            {"boxes": np.array([[0, 0, 10, 10], [50, 50, 60, 60]]), "scores": np.array([0.9, 0.8]), "labels": [0, 1]}
+        ]
+        targets = [{"boxes": np.array([[0, 0, 10, 8], [0, 0, 5, 5]]), "labels": [0, 2]}]
+        accumulator = DetectionMetricAccumulator(num_classes=3, iou_thresholds=[0.5, 0.9])
+        accumulator.update(predictions, targets)
+
+        result = accumulator.compute()
+
+        # Class 0 matches at IoU 0.8 only; class 2 has no predictions; class 1 has no GT.
+        assert result["mAP_per_threshold"] == {0.5: 0.5, 0.9: 0.0}
+        assert result["mAP"] == pytest.approx(0.25)
+        assert result["AP_per_class"] == {0: 0.5, 1: 0.0, 2: 0.0}
+        assert result["AP_per_class_per_threshold"][0.5] == {0: 1.0, 1: 0.0, 2: 0.0}
+        assert np.isnan(accumulator.average_precisions()[1]).all()
+
+    def test_ignores_out_of_range_labels_and_resets(self):
+        accumulator = DetectionMetricAccumulator(num_classes=1)
+        accumulator.update(
+            [{"boxes": np.array([[0, 0, 4, 4]]), "scores": np.array([0.9]), "labels": np.array([3])}],
+            [{"boxes": np.array([[0, 0, 4, 4], [0, 0, 4, 4]]), "labels": np.array([0, -1])}],
+        )
+
+        assert accumulator.compute()["mAP"] == 0.0
+        assert accumulator.average_precisions()[0, 0] == 0.0
+
+        accumulator.reset()
+        assert accumulator.num_images == 0
+        assert np.isnan(accumulator.average_precisions()).all()
+
+    def test_validates_inputs(self):
+        with pytest.raises(ValueError, match="at least one threshold"):
+            DetectionMetricAccumulator(num_classes=2, iou_thresholds=[])
+        with pytest.raises(ValueError, match="equal length"):
+            DetectionMetricAccumulator(num_classes=2).update([{}], [])
+
+    def test_single_threshold_wrapper_and_coco_summary(self):
+        predictions, targets = synthetic_detections(20, num_classes=3, gt_per_image=4, predictions_per_image=20)
+        accumulator = DetectionMetricAccumulator(num_classes=3)
+        accumulator.update(predictions, targets)
+        summary = coco_map_summary(accumulator.compute())
+
+        map_75 = mean_average_precision(predictions, targets, 3, iou_threshold=float(COCO_IOU_THRESHOLDS[5]))
+        assert map_75["mAP"] == summary["mAP@75"]
+        assert (
+            mean_average_precision(predictions, targets, 3)["AP_per_class"]
+            == (accumulator.compute()["AP_per_class_per_threshold"][0.5])
+        )
@@ -0,0 +1,46 @@
+"""Tests for `mindtrace.models.evaluation.metrics.regression`."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from mindtrace.models.evaluation.metrics.regression import RegressionMetricAccumulator, mae, mse, r2_score, rmse
+
+
+class TestRegressionMetricAccumulator:
+    def test_batched_and_merged_statistics_match_whole_array_metrics(self):
+        rng = np.random.default_rng(0)
+        targets = rng.normal(1_000.0, 3.0, size=5_000)
+        preds = targets + rng.normal(0.0, 0.5, size=5_000)
+        first = RegressionMetricAccumulator()
+        second = RegressionMetricAccumulator()
+        for start in range(0, 3_000, 128):
+            first.update(preds[start : min(start + 128, 3_000)], targets[start : min(start + 128, 3_000)])
+        second.update(preds[3_000:].reshape(-1, 1), targets[3_000:])
+        first.merge(second)
+
+        result = first.compute()
+
+        assert first.num_samples == 5_000
+        assert result["mae"] == pytest.approx(mae(preds, targets), rel=1e-12)
+        assert result["mse"] == pytest.approx(mse(preds, targets), rel=1e-12)
+        assert result["rmse"] == pytest.approx(rmse(preds, targets), rel=1e-12)
+        assert result["r2"] == pytest.approx(r2_score(preds, targets), rel=1e-12)
+
+    @pytest.mark.parametrize(("preds", "expected_r2"), [([2.0, 2.0], 1.0), ([1.0, 3.0], 0.0)])
+    def test_constant_targets_follow_r2_score_convention(self, preds, expected_r2):
+        accumulator = RegressionMetricAccumulator()
+        accumulator.update(np.array(preds[:1]), np.array([2.0]))
+        accumulator.update(np.array(preds[1:]), np.array([2.0]))
+
+        assert accumulator.compute()["r2"] == expected_r2 == r2_score(np.array(preds), np.array([2.0, 2.0]))
+
+    def test_validates_shapes_and_empty_state(self):
+        accumulator = RegressionMetricAccumulator()
+
+        with pytest.raises(ValueError, match="Shape mismatch"):
+            accumulator.update(np.zeros(3), np.zeros(2))
+        accumulator.merge(RegressionMetricAccumulator())
+        with pytest.raises(ValueError, match="must not be empty"):
+            accumulator.compute()
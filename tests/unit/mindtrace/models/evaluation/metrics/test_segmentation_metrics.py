@@ -5,7 +5,13 @@ from __future__ import annotations
 import numpy as np
 import pytest
 
-from mindtrace.models.evaluation.metrics.segmentation import frequency_weighted_iou
+from mindtrace.models.evaluation.metrics.segmentation import (
+    SegmentationMetricAccumulator,
+    dice_score,
+    frequency_weighted_iou,
+    mean_iou,
+    pixel_accuracy,
+)
 
 
 class TestFrequencyWeightedIoU:
@@ -25,3 +31,44 @@ class TestFrequencyWeightedIoU:
         result = frequency_weighted_iou(preds, targets, num_classes=2, ignore_index=255)
 
         assert result == pytest.approx(0.0)
+
+
+class TestSegmentationMetricAccumulator:
+    @pytest.mark.parametrize("ignore_index", [-1, 255])
+    def test_streamed_shards_match_concatenated_masks_exactly(self, ignore_index: int):
+        rng = np.random.default_rng(abs(ignore_index))
+        targets = rng.integers(0, 4, size=(12, 16, 24)).astype(np.uint8)
+        targets[:, :2] = 255
+        preds = np.where(rng.random(targets.shape) < 0.6, targets, rng.integers(0, 5, size=targets.shape))
+        first = SegmentationMetricAccumulator(num_classes=4, ignore_index=ignore_index)
+        second = SegmentationMetricAccumulator(num_classes=4, ignore_index=ignore_index)
+        for start in range(0, 6, 4):
+            first.update(preds[start : min(start + 4, 6)], targets[start : min(start + 4, 6)])
+        second.update(preds[6:], targets[6:])
+        first.merge(second)
+
+        result = first.compute()
+
+        assert result["pixel_accuracy"] == pixel_accuracy(preds, targets)
+        assert {k: result[k] for k in ("mIoU", "iou_per_class")} == mean_iou(preds, targets, 4, ignore_index)
+        assert {k: result[k] for k in ("mean_dice", "dice_per_class")} == dice_score(preds, targets, 4, ignore_index)
+
+    def test_update_leaves_caller_arrays_untouched(self):
+        preds = np.array([[[0, 7], [1, 1]]], dtype=np.int64)
+        targets = np.array([[[0, 0], [1, 9]]], dtype=np.int64)
+        accumulator = SegmentationMetricAccumulator(num_classes=2)
+
+        accumulator.update(preds, targets)
+
+        np.testing.assert_array_equal(preds, [[[0, 7], [1, 1]]])
+        np.testing.assert_array_equal(targets, [[[0, 0], [1, 9]]])
+        assert accumulator.confusion_matrix.sum() == 4
+
+    def test_validates_shapes_and_merge_compatibility(self):
+        accumulator = SegmentationMetricAccumulator(num_classes=2)
+
+        with pytest.raises(ValueError, match="Shape mismatch"):
+            accumulator.update(np.zeros((1, 2, 2)), np.zeros((1, 2, 3)))
+        with pytest.raises(ValueError, match="Cannot merge"):
+            accumulator.merge(SegmentationMetricAccumulator(num_classes=2, ignore_index=255))
+        assert accumulator.compute()["pixel_accuracy"] == 0.0
@@ -69,3 +69,42 @@ class TestEvaluationRunnerMirrored:
         assert isinstance(model.seen_inputs, torch.Tensor)
         assert model.seen_inputs.device.type == "cpu"
         assert results["mAP@50"] == pytest.approx(1.0)
+
+    @pytest.mark.parametrize("task", ["classification", "segmentation", "regression"])
+    def test_run_sharded_matches_run_over_the_concatenated_loader(self, task):
+        torch.manual_seed(0)
+        if task == "classification":
+            model, num_classes = nn.Linear(6, 4), 4
+            batches = [(torch.randn(8, 6), torch.randint(0, 4, (8,))) for _ in range(6)]
+        elif task == "segmentation":
+            model, num_classes = nn.Conv2d(3, 5, kernel_size=1), 5
+            batches = [(torch.randn(2, 3, 12, 12), torch.randint(0, 5, (2, 12, 12))) for _ in range(6)]
+        else:
+            model, num_classes = nn.Linear(6, 1), 1
+            batches = [(torch.randn(8, 6), torch.randn(8)) for _ in range(6)]
+        runner = EvaluationRunner(model, task=task, num_classes=num_classes, device="cpu")
+
+        expected = runner.run(batches)
+        sharded = runner.run_sharded([batches[:2], batches[2:3], batches[3:]], max_workers=2)
+
+        if task == "regression":
+            assert sharded == pytest.approx(expected, rel=1e-9)
+        else:
+            assert sharded == expected
+
+    def test_run_sharded_logs_once_and_rejects_no_loaders(self):
+        class _Tracker:
+            def __init__(self):
+                self.calls: list[tuple[dict, int]] = []
+
+            def log(self, scalars, step):
+                self.calls.append((scalars, step))
+
+        tracker = _Tracker()
+        runner = EvaluationRunner(nn.Linear(4, 1), task="regression", num_classes=1, device="cpu", tracker=tracker)
+
+        results = runner.run_sharded([[], [(torch.randn(3, 4), torch.randn(3))]], step=7)
+
+        assert tracker.calls == [(results, 7)]
+        with pytest.raises(ValueError, match="at least one loader"):
+            runner.run_sharded([])
@@ -0,0 +1,361 @@
+"""Unit tests for dynamic micro-batching in mindtrace.models.serving.
+
+Tests cover:
+- MicroBatcher coalescing, per-item failures, and shutdown
+- ModelService /predict batching and per-request response splitting
+- OnnxModelService predict_array coalescing into one session.run
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from mindtrace.models.serving.batching import BatchTiming, MicroBatcher
+from mindtrace.models.serving.schemas import PredictRequest, PredictResponse
+from mindtrace.models.serving.service import ModelService
+
+
+@pytest.fixture(autouse=True)
+def _mock_env(monkeypatch):
+    """Provide the minimal environment Service.__init__ requires."""
+    monkeypatch.setenv("MINDTRACE_DEFAULT_HOST_URLS__SERVICE", "http://localhost:8000")
+    monkeypatch.setenv("MINDTRACE_DIR_PATHS__LOGGER_DIR", "/tmp/test_logs")
+    monkeypatch.setenv("MINDTRACE_DIR_PATHS__SERVER_PIDS_DIR", "/tmp/test_pids")
+
+    from mindtrace.core import CoreConfig
+    from mindtrace.services import Service
+
+    Service.config = CoreConfig()
+
+
+def _submit_together(fn, items):
+    """Call ``fn`` on every item from its own thread, all at roughly the same time."""
+    barrier = threading.Barrier(len(items))
+
+    def call(item):
+        barrier.wait()
+        return fn(item)
+
+    with ThreadPoolExecutor(max_workers=len(items)) as pool:
+        return list(pool.map(call, items))
+
+
+# ---------------------------------------------------------------------------
+# MicroBatcher
+# ---------------------------------------------------------------------------
+
+
+class TestMicroBatcher:
+    def test_coalesces_concurrent_items(self):
+        batches = []
+
+        def double(items):
+            batches.append(list(items))
+            return [item * 2 for item in items]
+
+        batcher = MicroBatcher(double, max_batch_size=8, max_wait_s=0.5)
+        try:
+            results = _submit_together(batcher.run, list(range(8)))
+        finally:
+            batcher.close()
+
+        assert [result for result, _ in results] == [item * 2 for item in range(8)]
+        assert sum(len(batch) for batch in batches) == 8
+        assert len(batches) < 8
+        timing = results[0][1]
+        assert isinstance(timing, BatchTiming)
+        assert timing.batch_size >= 1
+        assert timing.queue_wait_s >= 0.0
+        assert timing.compute_s >= 0.0
+
+    def test_respects_max_batch_size(self):
+        sizes = []
+
+        def record(items):
+            sizes.append(len(items))
+            return items
+
+        batcher = MicroBatcher(record, max_batch_size=3, max_wait_s=0.5)
+        try:
+            _submit_together(batcher.run, list(range(7)))
+        finally:
+            batcher.close()
+
+        assert max(sizes) <= 3
+        assert sum(sizes) == 7
+
+    def test_single_item_waits_at_most_max_wait(self):
+        batcher = MicroBatcher(lambda items: items, max_batch_size=64, max_wait_s=0.01)
+        try:
+            start = time.perf_counter()
+            result, timing = batcher.run("x", timeout=5)
+            elapsed = time.perf_counter() - start
+        finally:
+            batcher.close()
+
+        assert result == "x"
+        assert timing.batch_size == 1
+        assert elapsed < 1.0
+
+    def test_exception_result_fails_only_that_item(self):
+        def process(items):
+            return [ValueError(f"bad {item}") if item == 2 else item for item in items]
+
+        batcher = MicroBatcher(process, max_batch_size=4, max_wait_s=0.2)
+        try:
+            futures = [batcher.submit(item) for item in range(4)]
+            with pytest.raises(ValueError, match="bad 2"):
+                futures[2].result(timeout=5)
+            assert [futures[i].result(timeout=5)[0] for i in (0, 1, 3)] == [0, 1, 3]
+        finally:
+            batcher.close()
+
+    def test_raising_process_batch_fails_whole_batch(self):
+        def explode(items):
+            raise RuntimeError("model crashed")
+
+        batcher = MicroBatcher(explode, max_batch_size=4, max_wait_s=0.2)
+        try:
+            futures = [batcher.submit(item) for item in range(2)]
+            for future in futures:
+                with pytest.raises(RuntimeError, match="model crashed"):
+                    future.result(timeout=5)
+        finally:
+            batcher.close()
+
+    def test_result_count_mismatch_is_an_error(self):
+        batcher = MicroBatcher(lambda items: [], max_batch_size=2, max_wait_s=0.0)
+        try:
+            with pytest.raises(RuntimeError, match="returned 0 results"):
+                batcher.run(1, timeout=5)
+        finally:
+            batcher.close()
+
+    def test_close_finishes_queued_items_and_rejects_new_ones(self):
+        release = threading.Event()
+
+        def slow(items):
+            release.wait(5)
+            return items
+
+        batcher = MicroBatcher(slow, max_batch_size=1, max_wait_s=0.0)
+        futures = [batcher.submit(item) for item in range(3)]
+        closer = threading.Thread(target=batcher.close)
+        closer.start()
+        release.set()
+        closer.join(5)
+
+        assert [future.result(timeout=5)[0] for future in futures] == [0, 1, 2]
+        assert batcher.closed
+        with pytest.raises(RuntimeError, match="closed"):
+            batcher.submit(4)
+
+    def test_stats(self):
+        batcher = MicroBatcher(lambda items: items, max_batch_size=4, max_wait_s=0.0)
+        try:
+            batcher.run(1, timeout=5)
+            batcher.run(2, timeout=5)
+            stats = batcher.stats()
+        finally:
+            batcher.close()
+
+        assert stats["items"] == 2
+        assert stats["batches"] == 2
+        assert stats["mean_batch_size"] == 1.0
+        assert stats["largest_batch"] == 1
+
+    @pytest.mark.parametrize("kwargs", [{"max_batch_size": 0}, {"max_wait_s": -1.0}])
+    def test_invalid_arguments(self, kwargs):
+        with pytest.raises(ValueError):
+            MicroBatcher(lambda items: items, **kwargs)
+
+
+# ---------------------------------------------------------------------------
+# ModelService
+# ---------------------------------------------------------------------------
+
+
+class _EchoService(ModelService):
+    _task = "unit_test"
+
+    def load_model(self) -> None:
+        self.predict_calls = []
+
+    def predict(self, request: PredictRequest) -> PredictResponse:
+        self.predict_calls.append(list(request.images))
+        if request.params.get("fail"):
+            raise RuntimeError("predict failed")
+        return PredictResponse(
+            results=[{"img": image, **request.params} for image in request.images],
+            timing_s=0.0,
+        )
+
+
+class TestModelServiceBatching:
+    def test_batching_disabled_by_default(self):
+        svc = _EchoService(model_name="m", model_version="v1")
+
+        response = svc._handle_predict(PredictRequest(images=["a.png"]))
+
+        assert svc._predict_batcher is None
+        assert response.queue_wait_s is None
+        assert response.batch_size is None
+        assert "batching" not in svc.info().extra
+
+    def test_concurrent_requests_share_one_predict_call(self):
+        svc = _EchoService(model_name="m", model_version="v1", max_batch_size=4, max_batch_wait_s=0.5)
+        requests = [PredictRequest(images=[f"{i}a.png", f"{i}b.png"]) for i in range(4)]
+        try:
+            responses = _submit_together(svc._handle_predict, requests)
+        finally:
+            svc._predict_batcher.close()
+
+        for i, response in enumerate(responses):
+            assert [result["img"] for result in response.results] == [f"{i}a.png", f"{i}b.png"]
+            assert response.batch_size >= 1
+            assert response.queue_wait_s >= 0.0
+            assert response.compute_s >= 0.0
+            assert response.timing_s >= response.queue_wait_s
+        assert len(svc.predict_calls) < 4
+        assert sum(len(call) for call in svc.predict_calls) == 8
+        assert svc.info().extra["batching"]["items"] == 4
+
+    def test_requests_with_different_params_run_separately(self):
+        svc = _EchoService(model_name="m", model_version="v1", max_batch_size=4)
+        requests = [
+            PredictRequest(images=["a.png"], params={"conf": 0.5}),
+            PredictRequest(images=["b.png"], params={"conf": 0.9}),
+            PredictRequest(images=["c.png"], params={"conf": 0.5}),
+        ]
+
+        results = svc._predict_coalesced(requests)
+
+        assert [response.results for response in results] == [
+            [{"img": "a.png", "conf": 0.5}],
+            [{"img": "b.png", "conf": 0.9}],
+            [{"img": "c.png", "conf": 0.5}],
+        ]
+        assert sorted(svc.predict_calls) == [["a.png", "c.png"], ["b.png"]]
+        svc._predict_batcher.close()
+
+    def test_failing_group_does_not_fail_other_groups(self):
+        svc = _EchoService(model_name="m", model_version="v1", max_batch_size=4)
+
+        results = svc._predict_coalesced(
+            [PredictRequest(images=["a.png"], params={"fail": True}), PredictRequest(images=["b.png"])]
+        )
+
+        assert isinstance(results[0], RuntimeError)
+        assert results[1].results == [{"img": "b.png"}]
+        svc._predict_batcher.close()
+
+    def test_predict_batch_rejects_unsplittable_results(self):
+        class _Aggregating(_EchoService):
+            def predict(self, request):
+                return PredictResponse(results=[len(request.images)], timing_s=0.0)
+
+        svc = _Aggregating(model_name="m", model_version="v1")
+
+        with pytest.raises(ValueError, match="override predict_batch"):
+            svc.predict_batch([PredictRequest(images=["a.png"]), PredictRequest(images=["b.png"])])
+
+    async def test_shutdown_cleanup_closes_batcher(self):
+        svc = _EchoService(model_name="m", model_version="v1", max_batch_size=2)
+        batcher = svc._predict_batcher
+
+        await svc.shutdown_cleanup()
+
+        assert batcher.closed
+        assert svc._predict_batcher is None
+
+
+# ---------------------------------------------------------------------------
+# OnnxModelService
+# ---------------------------------------------------------------------------
+
+
+def _make_onnx_service(batch_dim, **kwargs):
+    from mindtrace.models.serving.onnx.service import OnnxModelService
+
+    class _Onnx(OnnxModelService):
+        def predict(self, request):
+            return PredictResponse(results=[], timing_s=0.0)
+
+    session = MagicMock()
+    inp = MagicMock()
+    inp.name = "x"
+    inp.shape = [batch_dim, 2]
+    out = MagicMock()
+    out.name = "y"
+    out.shape = [batch_dim, 2]
+    session.get_inputs.return_value = [inp]
+    session.get_outputs.return_value = [out]
+    session.get_providers.return_value = ["CPUExecutionProvider"]
+    session.run.side_effect = lambda names, feeds: [feeds["x"] * 10]
+
+    fd, path = tempfile.mkstemp(suffix=".onnx")
+    os.close(fd)
+    try:
+        with patch("mindtrace.models.serving.onnx.service._require_onnxruntime") as mock_ort_fn:
+            mock_ort = MagicMock()
+            mock_ort.InferenceSession.return_value = session
+            mock_ort.get_available_providers.return_value = ["CPUExecutionProvider"]
+            mock_ort_fn.return_value = mock_ort
+            svc = _Onnx(model_path=path, model_name="m", model_version="v1", **kwargs)
+    finally:
+        os.unlink(path)
+    return svc, session
+
+
+class TestOnnxArrayBatching:
+    def test_concurrent_predict_array_calls_share_one_session_run(self):
+        svc, session = _make_onnx_service("batch", max_batch_size=4, max_batch_wait_s=0.5)
+        inputs = [{"x": np.full((i + 1, 2), i, dtype=np.float32)} for i in range(4)]
+        try:
+            outputs = _submit_together(svc.predict_array, inputs)
+        finally:
+            svc._array_batcher.close()
+
+        for i, output in enumerate(outputs):
+            np.testing.assert_array_equal(output["y"], np.full((i + 1, 2), i * 10, dtype=np.float32))
+        assert session.run.call_count < 4
+
+    def test_incompatible_shapes_are_run_separately(self):
+        svc, session = _make_onnx_service(None, max_batch_size=4)
+        calls = [
+            {"x": np.zeros((1, 2), dtype=np.float32)},
+            {"x": np.ones((2, 3), dtype=np.float32)},
+            {"x": np.ones((1, 2), dtype=np.float32)},
+        ]
+
+        results = svc._run_coalesced(calls)
+
+        assert session.run.call_count == 2
+        assert results[0]["y"].shape == (1, 2)
+        assert results[1]["y"].shape == (2, 3)
+        np.testing.assert_array_equal(results[2]["y"], np.full((1, 2), 10, dtype=np.float32))
+        svc._array_batcher.close()
+
+    def test_unsplittable_output_fails_the_group(self):
+        svc, session = _make_onnx_service("batch", max_batch_size=4)
+        session.run.side_effect = lambda names, feeds: [np.zeros(3)]
+
+        results = svc._run_coalesced([{"x": np.zeros((1, 2))}, {"x": np.zeros((1, 2))}])
+
+        assert all(isinstance(result, ValueError) for result in results)
+        svc._array_batcher.close()
+
+    def test_fixed_batch_dimension_disables_array_batching(self):
+        svc, _ = _make_onnx_service(1, max_batch_size=4)
+
+        assert svc._array_batcher is None
+        assert svc._predict_batcher is not None
+        svc._predict_batcher.close()
@@ -0,0 +1,109 @@
+"""OnnxModelService loading from a real local registry with onnxruntime, including the optimized-graph cache."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+ort = pytest.importorskip("onnxruntime")
+pytest.importorskip("onnx")
+
+from mindtrace.models.serving.onnx.service import OnnxModelService  # noqa: E402
+from mindtrace.models.testing.suites.onnx_cold_start import synthetic_onnx_mlp  # noqa: E402
+from mindtrace.registry import LocalRegistryBackend, Registry  # noqa: E402
+
+_BATCH = {"x": np.random.default_rng(1).standard_normal((3, 16), dtype=np.float32)}
+
+
+@pytest.fixture(autouse=True)
+def _service_config(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("MINDTRACE_DEFAULT_HOST_URLS__SERVICE", "http://localhost:8000")
+    monkeypatch.setenv("MINDTRACE_DIR_PATHS__LOGGER_DIR", "/tmp/logs")
+    monkeypatch.setenv("MINDTRACE_DIR_PATHS__SERVER_PIDS_DIR", "/tmp/pids")
+
+    from mindtrace.core import CoreConfig
+    from mindtrace.services import Service
+
+    Service.config = CoreConfig()
+
+
+@pytest.fixture
+def registry(tmp_path) -> Registry:
+    registry = Registry(backend=LocalRegistryBackend(uri=tmp_path / "registry", pull_mode="direct"))
+    registry.save("mlp:v1", synthetic_onnx_mlp(hidden_size=16, layers=3))
+    return registry
+
+
+def _service(registry: Registry, **kwargs) -> OnnxModelService:
+    svc = OnnxModelService(
+        model_name="mlp",
+        model_version="v1",
+        registry=registry,
+        providers=["CPUExecutionProvider"],
+        live_service=False,
+        **kwargs,
+    )
+    svc.load_model()
+    return svc
+
+
+def _reference_outputs(registry: Registry) -> np.ndarray:
+    session = ort.InferenceSession(registry.load("mlp:v1").SerializeToString(), providers=["CPUExecutionProvider"])
+    return session.run(None, _BATCH)[0]
+
+
+def test_artifact_load_matches_proto_session_and_reads_archiver_metadata(registry):
+    svc = _service(registry)
+
+    np.testing.assert_allclose(svc.run(_BATCH)["y"], _reference_outputs(registry), rtol=1e-5)
+    assert svc._onnx_metadata["producer_name"] == "mindtrace-bench"
+    assert svc._onnx_metadata["ir_version"] == 8
+    assert svc._onnx_metadata["opset_imports"] == [{"domain": "ai.onnx", "version": 17}]
+    assert registry.list_objects() == ["mlp:v1"]
+
+
+def test_optimized_graph_is_cached_once_and_reused(registry, monkeypatch):
+    first = _service(registry, cache_optimized_model=True)
+    cache_key = first._onnx_metadata["optimized_model"]
+
+    assert cache_key.startswith("mlp:v1:ort-optimized-")
+    assert sorted(registry.list_objects()) == ["mlp:v1", cache_key]
+    with registry.open_artifact(cache_key) as (cache_dir, metadata):
+        assert (cache_dir / "model.onnx").is_file()
+        assert metadata["metadata"]["source"] == "mlp:v1"
+
+    def fail_save(*args, **kwargs):
+        raise AssertionError("a cache hit must not save again")
+
+    monkeypatch.setattr(registry, "save", fail_save)
+    second = _service(registry, cache_optimized_model=True)
+
+    assert second._onnx_metadata["optimized_model"] == cache_key
+    assert second._onnx_metadata["producer_name"] == "mindtrace-bench"
+    np.testing.assert_allclose(second.run(_BATCH)["y"], _reference_outputs(registry), rtol=1e-4, atol=1e-5)
+
+
+def test_cache_key_tracks_optimization_level_and_caller_options_are_restored(registry):
+    options = ort.SessionOptions()
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_BASIC
+    basic = _service(registry, cache_optimized_model=True, session_options=options)
+    default = _service(registry, cache_optimized_model=True)
+
+    assert basic._onnx_metadata["optimized_model"] != default._onnx_metadata["optimized_model"]
+    assert options.graph_optimization_level == ort.GraphOptimizationLevel.ORT_ENABLE_BASIC
+    assert options.optimized_model_filepath == ""
+
+    # Loading from the cache switches optimization off only for the duration of the session creation.
+    _service(registry, cache_optimized_model=True, session_options=options)
+    assert options.graph_optimization_level == ort.GraphOptimizationLevel.ORT_ENABLE_BASIC
+
+
+def test_failed_cache_save_still_returns_a_usable_session(registry, monkeypatch):
+    def broken_save(*args, **kwargs):
+        raise OSError("read-only registry")
+
+    monkeypatch.setattr(registry, "save", broken_save)
+    svc = _service(registry, cache_optimized_model=True)
+
+    assert "optimized_model" not in svc._onnx_metadata
+    np.testing.assert_allclose(svc.run(_BATCH)["y"], _reference_outputs(registry), rtol=1e-5)
@@ -963,3 +963,121 @@ class TestFitIntegration:
             for v in values:
                 assert v > 0.0
                 assert v < float("inf")
+
+
+# ---------------------------------------------------------------------------
+# Host sync, autocast, transfer, compile and profiling options
+# ---------------------------------------------------------------------------
+
+
+class TestStepPerformanceOptions:
+    """On-device loss accumulation, bf16 CPU autocast, non-blocking copies, compile, phase profiling."""
+
+    def test_bfloat16_autocast_enabled_on_cpu_without_scaler(self, simple_model, loss_fn, optimizer):
+        trainer = _make_trainer(simple_model, loss_fn, optimizer, mixed_precision=True, amp_dtype="bfloat16")
+        assert trainer._amp_enabled is True
+        assert trainer._scaler is None
+        assert trainer.amp_dtype == torch.bfloat16
+
+        with patch("torch.amp.autocast", wraps=torch.amp.autocast) as mock_autocast:
+            history = trainer.fit(_make_loader(n_batches=2), _make_loader(n_batches=1), epochs=1)
+
+        mock_autocast.assert_called_with(device_type="cpu", dtype=torch.bfloat16)
+        assert mock_autocast.call_count == 3
+        assert 0.0 < history["train/loss"][0] < float("inf")
+
+    def test_amp_dtype_ignored_without_mixed_precision(self, simple_model, loss_fn, optimizer):
+        trainer = _make_trainer(simple_model, loss_fn, optimizer, amp_dtype=torch.bfloat16)
+        assert trainer._amp_enabled is False
+        assert trainer.amp_dtype is None
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"amp_dtype": "int8"}, {"amp_dtype": torch.float32}, {"log_every_n_steps": 0}],
+    )
+    def test_invalid_options_raise(self, simple_model, loss_fn, optimizer, kwargs):
+        with pytest.raises(ValueError):
+            _make_trainer(simple_model, loss_fn, optimizer, **kwargs)
+
+    def test_loss_read_back_once_per_epoch_without_batch_callbacks(self, simple_model, loss_fn, optimizer, monkeypatch):
+        trainer = _make_trainer(simple_model, loss_fn, optimizer, callbacks=[Callback()])
+        original_item = torch.Tensor.item
+        calls = []
+
+        def counting_item(tensor):
+            calls.append(tensor)
+            return original_item(tensor)
+
+        monkeypatch.setattr(torch.Tensor, "item", counting_item)
+        metrics = trainer._train_epoch(_make_loader(n_batches=5))
+
+        assert len(calls) == 1
+        assert metrics["train/loss"] > 0.0
+
+    def test_epoch_loss_matches_mean_of_batch_losses(self, simple_model, loss_fn, optimizer):
+        losses = []
+
+        class Recorder(Callback):
+            def on_batch_end(self, trainer, batch, loss):
+                losses.append(loss)
+
+        trainer = _make_trainer(simple_model, loss_fn, optimizer, callbacks=[Recorder()])
+        metrics = trainer._train_epoch(_make_loader(n_batches=4))
+
+        assert len(losses) == 4
+        assert all(isinstance(loss, float) for loss in losses)
+        assert metrics["train/loss"] == pytest.approx(sum(losses) / len(losses), rel=1e-5)
+
+    def test_step_loss_logged_every_n_optimizer_steps(self, simple_model, loss_fn, optimizer):
+        tracker = MagicMock()
+        trainer = _make_trainer(
+            simple_model,
+            loss_fn,
+            optimizer,
+            tracker=tracker,
+            gradient_accumulation_steps=2,
+            log_every_n_steps=1,
+        )
+        trainer.fit(_make_loader(n_batches=4), epochs=2)
+
+        step_logs = [c for c in tracker.log.call_args_list if "train/step_loss" in c.args[0]]
+        assert [c.kwargs["step"] for c in step_logs] == [1, 2, 3, 4]
+        assert trainer.global_step == 4
+        epoch_logs = [c for c in tracker.log.call_args_list if "train/loss" in c.args[0]]
+        assert [c.kwargs["step"] for c in epoch_logs] == [0, 1]
+
+    def test_profile_steps_reports_phase_means(self, simple_model, loss_fn, optimizer):
+        tracker = MagicMock()
+        trainer = _make_trainer(simple_model, loss_fn, optimizer, tracker=tracker, profile_steps=True)
+        history = trainer.fit(_make_loader(n_batches=3), epochs=1)
+
+        phases = ["data_wait", "forward", "backward", "optimizer", "callbacks"]
+        for phase in phases:
+            assert history[f"profile/{phase}_ms"][0] >= 0.0
+        assert history["profile/step_ms"][0] == pytest.approx(
+            sum(history[f"profile/{phase}_ms"][0] for phase in phases)
+        )
+        assert "profile/forward_ms" in tracker.log.call_args.args[0]
+
+    def test_profile_keys_absent_by_default(self, simple_model, loss_fn, optimizer):
+        trainer = _make_trainer(simple_model, loss_fn, optimizer)
+        assert set(trainer._train_epoch(_make_loader(n_batches=1))) == {"train/loss"}
+
+    def test_compile_model_wraps_forward_only(self, simple_model, loss_fn, optimizer):
+        compiled = MagicMock(side_effect=simple_model)
+        with patch("torch.compile", return_value=compiled) as mock_compile:
+            trainer = _make_trainer(simple_model, loss_fn, optimizer, compile_model={"mode": "reduce-overhead"})
+            trainer._train_epoch(_make_loader(n_batches=2))
+
+        mock_compile.assert_called_once_with(simple_model, mode="reduce-overhead")
+        assert trainer.model is simple_model
+        assert compiled.call_count == 2
+
+    def test_non_blocking_copies_only_to_cuda(self, simple_model, loss_fn, optimizer):
+        trainer = _make_trainer(simple_model, loss_fn, optimizer)
+        assert trainer._non_blocking is False
+
+        trainer._non_blocking = True
+        tensor = MagicMock(spec=torch.Tensor)
+        trainer._to_device({"x": tensor})
+        tensor.to.assert_called_once_with(trainer.device, non_blocking=True)
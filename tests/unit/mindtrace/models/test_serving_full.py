@@ -541,11 +541,54 @@ class TestOnnxModelServiceFromFile:
 class TestOnnxModelServiceFromRegistry:
     """Test OnnxModelService loading from a mocked registry."""
 
-    def test_load_from_registry(self, _patch_core_config):
+    @staticmethod
+    def _make_svc(mock_registry, mock_ort):
         from mindtrace.models.serving.onnx.service import OnnxModelService
 
-        mock_session = _mock_onnx_session()
+        with patch("mindtrace.models.serving.onnx.service._require_onnxruntime", return_value=mock_ort):
+
+            class TestOnnx(OnnxModelService):
+                _task = "detection"
+
+                def predict(self, request):
+                    return PredictResponse(results=[], timing_s=0.0)
 
+            return TestOnnx(model_name="det-model", model_version="v2", registry=mock_registry)
+
+    def test_load_from_registry_opens_stored_model_file(self, _patch_core_config, tmp_path):
+        (tmp_path / "model.onnx").write_bytes(b"fake-onnx")
+        (tmp_path / "metadata.json").write_text(
+            json.dumps(
+                {
+                    "ir_version": 7,
+                    "producer_name": "pytorch",
+                    "producer_version": "2.0",
+                    "opset_imports": [{"domain": "ai.onnx", "version": 17}],
+                }
+            )
+        )
+        mock_registry = MagicMock()
+        mock_registry.open_artifact.return_value.__enter__.return_value = (tmp_path, {"hash": "sha256:abc"})
+        mock_ort = _mock_ort_module()
+        mock_ort.InferenceSession.return_value = _mock_onnx_session()
+
+        svc = self._make_svc(mock_registry, mock_ort)
+
+        mock_registry.open_artifact.assert_called_once_with("det-model:v2")
+        mock_registry.load.assert_not_called()
+        mock_ort.InferenceSession.assert_called_once_with(
+            str(tmp_path / "model.onnx"),
+            sess_options=None,
+            providers=["CPUExecutionProvider"],
+        )
+        assert svc._onnx_metadata == {
+            "ir_version": 7,
+            "producer_name": "pytorch",
+            "producer_version": "2.0",
+            "opset_imports": [{"domain": "ai.onnx", "version": 17}],
+        }
+
+    def test_load_from_registry_falls_back_to_proto_without_model_file(self, _patch_core_config, tmp_path):
         mock_proto = MagicMock()
         mock_proto.SerializeToString.return_value = b"serialized-onnx"
         mock_proto.ir_version = 7
@@ -557,25 +600,12 @@ class TestOnnxModelServiceFromRegistry:
         mock_proto.opset_import = [opset]
 
         mock_registry = MagicMock()
+        mock_registry.open_artifact.return_value.__enter__.return_value = (tmp_path, {})
         mock_registry.load.return_value = mock_proto
+        mock_ort = _mock_ort_module()
+        mock_ort.InferenceSession.return_value = _mock_onnx_session()
 
-        with patch("mindtrace.models.serving.onnx.service._require_onnxruntime") as mock_ort_fn:
-            mock_ort = MagicMock()
-            mock_ort.InferenceSession.return_value = mock_session
-            mock_ort.get_available_providers.return_value = ["CPUExecutionProvider"]
-            mock_ort_fn.return_value = mock_ort
-
-            class TestOnnx(OnnxModelService):
-                _task = "detection"
-
-                def predict(self, request):
-                    return PredictResponse(results=[], timing_s=0.0)
-
-            svc = TestOnnx(
-                model_name="det-model",
-                model_version="v2",
-                registry=mock_registry,
-            )
+        svc = self._make_svc(mock_registry, mock_ort)
 
         mock_registry.load.assert_called_once_with("det-model:v2")
         mock_ort.InferenceSession.assert_called_once_with(
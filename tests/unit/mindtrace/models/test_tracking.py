@@ -3,6 +3,7 @@
 Covers:
 - Tracker (abstract base, factory, context manager)
 - CompositeTracker (fan-out, partial failure, all-fail)
+- BackgroundTracker (coalescing, flush triggers, overflow policy, ordering)
 - MLflowTracker (all methods, import guard)
 - WandBTracker (all methods, torch guard, artifact upload)
 - TensorBoardTracker (all methods, _require_writer guard)
@@ -17,6 +18,8 @@ tests run correctly regardless of whether the real library is installed.
 
 from __future__ import annotations
 
+import threading
+import time
 from typing import Any
 from unittest.mock import MagicMock, patch  # noqa: E402
 
@@ -25,6 +28,7 @@ import pytest
 from mindtrace.models.tracking.backends.mlflow import MLflowTracker  # noqa: E402
 from mindtrace.models.tracking.backends.tensorboard import TensorBoardTracker  # noqa: E402
 from mindtrace.models.tracking.backends.wandb import WandBTracker  # noqa: E402
+from mindtrace.models.tracking.background import BackgroundTracker  # noqa: E402
 from mindtrace.models.tracking.bridges import (  # noqa: E402
     HuggingFaceTrackerBridge,
     UltralyticsTrackerBridge,
@@ -335,6 +339,177 @@ class TestCompositeTracker:
         assert child.calls[0][0] == "start_run"
 
 
+class BatchRecordingTracker(StubTracker):
+    """Stub that records ``log_batch`` calls and can be made slow or held."""
+
+    def __init__(self, delay: float = 0.0):
+        super().__init__()
+        self.delay = delay
+        self.batches: list[list[tuple[dict, int]]] = []
+        self.release = threading.Event()
+        self.release.set()
+
+    def log_batch(self, batch):
+        self.release.wait()
+        time.sleep(self.delay)
+        self.batches.append(batch)
+        super().log_batch(batch)
+
+
+@pytest.fixture
+def background():
+    trackers = []
+
+    def make(child, **kwargs):
+        tracker = BackgroundTracker(child, **kwargs)
+        trackers.append(tracker)
+        return tracker
+
+    yield make
+    for tracker in trackers:
+        tracker.close()
+
+
+class TestBackgroundTracker:
+    """Tests for queued, coalesced dispatch through BackgroundTracker."""
+
+    def test_base_log_batch_calls_log_per_step(self):
+        child = StubTracker()
+        child.log_batch([({"a": 1.0}, 0), ({"a": 2.0}, 1)])
+        assert child.calls == [("log", ({"a": 1.0}, 0), {}), ("log", ({"a": 2.0}, 1), {})]
+
+    def test_log_returns_before_a_slow_backend_and_coalesces_steps(self, background):
+        child = BatchRecordingTracker(delay=0.2)
+        tracker = background(child, flush_interval=60.0)
+
+        start = time.perf_counter()
+        tracker.log({"loss": 1.0}, step=0)
+        tracker.log({"acc": 0.5}, step=0)
+        tracker.log({"loss": 0.9}, step=1)
+        assert time.perf_counter() - start < 0.1
+
+        tracker.flush()
+        assert child.batches == [[({"loss": 1.0, "acc": 0.5}, 0), ({"loss": 0.9}, 1)]]
+        stats = tracker.stats()
+        assert (stats.logged, stats.flushes, stats.pending_steps) == (3, 1, 0)
+        assert stats.mean_flush_ms >= 150
+
+    def test_flushes_on_batch_size_and_interval(self, background):
+        child = BatchRecordingTracker()
+        tracker = background(child, max_batch_steps=2, flush_interval=0.05)
+
+        for step in range(3):
+            tracker.log({"loss": float(step)}, step=step)
+        deadline = time.monotonic() + 2.0
+        while sum(len(b) for b in child.batches) < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert [len(batch) for batch in child.batches] == [2, 1]
+
+    def test_other_calls_keep_their_order_with_metrics(self, background):
+        child = StubTracker()
+        tracker = background(child, flush_interval=60.0)
+
+        with tracker.run("exp", config={"lr": 0.1}):
+            tracker.log({"loss": 1.0}, step=0)
+            tracker.log_params({"batch": 32})
+            tracker.log({"loss": 0.5}, step=1)
+
+        assert [call[0] for call in child.calls] == ["start_run", "log", "log_params", "log", "finish"]
+
+    def test_drop_policy_discards_metrics_when_queue_is_full(self, background):
+        child = BatchRecordingTracker()
+        child.release.clear()
+        tracker = background(child, max_queue_size=2, max_batch_steps=1, on_full="drop")
+
+        tracker.log({"loss": 0.0}, step=0)  # Taken by the worker, which then blocks in log_batch
+        time.sleep(0.05)
+        for step in range(1, 6):
+            tracker.log({"loss": float(step)}, step=step)
+        child.release.set()
+        tracker.flush()
+
+        stats = tracker.stats()
+        assert stats.dropped == 3
+        assert [batch[0][1] for batch in child.batches] == [0, 1, 2]
+
+    def test_block_policy_waits_for_room(self, background):
+        child = BatchRecordingTracker()
+        child.release.clear()
+        tracker = background(child, max_queue_size=1, max_batch_steps=1)
+        tracker.log({"loss": 0.0}, step=0)
+        time.sleep(0.05)
+        tracker.log({"loss": 1.0}, step=1)
+
+        blocked = threading.Thread(target=tracker.log, args=({"loss": 2.0}, 2))
+        blocked.start()
+        blocked.join(0.1)
+        assert blocked.is_alive()
+
+        child.release.set()
+        blocked.join(2.0)
+        tracker.flush()
+        assert tracker.stats().dropped == 0
+        assert [batch[0][1] for batch in child.batches] == [0, 1, 2]
+
+    def test_backend_errors_are_counted_and_finish_errors_raised(self, background):
+        tracker = background(FailingTracker(msg="backend down"))
+
+        tracker.log({"loss": 1.0}, step=0)
+        tracker.flush()
+        assert tracker.stats().errors == 1
+        with pytest.raises(RuntimeError, match="backend down"):
+            tracker.finish()
+
+    def test_log_model_snapshots_the_model(self, background):
+        child = StubTracker()
+        tracker = background(child)
+        model = {"weights": [1, 2]}
+
+        tracker.log_model(model, "net", "v1")
+        model["weights"].append(3)
+        tracker.flush()
+
+        assert child.calls[0][1][0] == {"weights": [1, 2]}
+
+    def test_closed_tracker_rejects_calls(self, background):
+        tracker = background(StubTracker())
+        tracker.close()
+        with pytest.raises(RuntimeError, match="closed"):
+            tracker.log({"loss": 1.0}, step=0)
+
+    def test_composite_background_isolates_slow_children(self):
+        slow, fast = BatchRecordingTracker(delay=0.3), StubTracker()
+        composite = CompositeTracker(trackers=[slow, fast], background=True, background_options={"flush_interval": 0.0})
+
+        start = time.perf_counter()
+        composite.log({"loss": 1.0}, step=0)
+        composite.log({"loss": 0.5}, step=1)
+        assert time.perf_counter() - start < 0.1
+
+        composite.flush()
+        assert fast.calls == [("log", ({"loss": 1.0}, 0), {}), ("log", ({"loss": 0.5}, 1), {})]
+        assert [stats.backend for stats in composite.stats()] == ["BatchRecordingTracker", "StubTracker"]
+        for child in composite._trackers:
+            child.close()
+
+    def test_composite_background_finish_stops_its_workers(self):
+        child, shared = StubTracker(), BackgroundTracker(StubTracker())
+        composite = CompositeTracker(trackers=[child, shared], background=True)
+
+        with composite.run("first", config={}):
+            composite.log({"loss": 1.0}, step=0)
+        first = composite._trackers[0]
+        assert first.closed and not first._worker.is_alive()
+        assert not shared.closed  # Wrappers passed in by the caller are the caller's to close
+
+        with composite.run("second", config={}):
+            composite.log({"loss": 0.5}, step=0)
+        assert composite._trackers[0] is not first and composite._trackers[0].closed
+        assert [call[0] for call in child.calls] == ["start_run", "log", "finish"] * 2
+        shared.close()
+
+
 # ===================================================================
 # 4. MLflowTracker tests
 # ===================================================================
@@ -390,6 +565,26 @@ class TestMLflowTracker:
         tracker.log({"loss": 0.5, "acc": 0.9}, step=10)
         mock_mlflow.log_metrics.assert_called_once_with({"loss": 0.5, "acc": 0.9}, step=10)
 
+    def test_log_batch_uses_one_client_request_per_1000_values(self, mock_mlflow):
+        tracker = MLflowTracker(experiment_name="test")
+        mock_mlflow.active_run.return_value.info.run_id = "run-1"
+        batch = [({f"m{i}": float(i) for i in range(600)}, step) for step in range(2)]
+
+        tracker.log_batch(batch)
+
+        client = mock_mlflow.MlflowClient.return_value
+        assert [len(c.kwargs["metrics"]) for c in client.log_batch.call_args_list] == [1000, 200]
+        assert client.log_batch.call_args.args == ("run-1",)
+        mock_mlflow.log_metrics.assert_not_called()
+
+    def test_log_batch_without_active_run_logs_per_step(self, mock_mlflow):
+        tracker = MLflowTracker(experiment_name="test")
+        mock_mlflow.active_run.return_value = None
+
+        tracker.log_batch([({"loss": 1.0}, 0), ({"loss": 0.5}, 1)])
+
+        assert mock_mlflow.log_metrics.call_count == 2
+
     def test_log_params(self, mock_mlflow):
         tracker = MLflowTracker(experiment_name="test")
         tracker.log_params({"batch_size": 32})
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import builtins
+import pickle
 from types import SimpleNamespace
 from unittest.mock import patch
 
@@ -10,7 +12,12 @@ import pytest
 
 torch = pytest.importorskip("torch")
 
-from mindtrace.models.training.datalake_bridge import DatalakeDataset, build_datalake_loader  # noqa: E402
+from mindtrace.models.training.datalake_bridge import (  # noqa: E402
+    DatalakeDataset,
+    DiskSampleCache,
+    StreamingDatalakeDataset,
+    build_datalake_loader,
+)
 
 
 def _datum(id_: int, data: object) -> SimpleNamespace:
@@ -22,6 +29,45 @@ def _identity_transform(datums: dict) -> tuple:
     return datums[col].data, 0
 
 
+def _pair_transform(datums: dict) -> tuple:
+    return datums["image"].data, datums["label"].data
+
+
+class _FakeDatalake:
+    """Async ``query_data`` / ``get_data`` over ``n`` image+label rows that records how it is called."""
+
+    def __init__(self, n: int, delay: float = 0.0):
+        self.rows = [{"_id": i, "image": i, "label": 1000 + i} for i in range(n)]
+        self.delay = delay
+        self.get_calls: list[list[int]] = []
+        self.loops: set[int] = set()
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def query_data(self, query, datums_wanted=None):
+        self.loops.add(id(asyncio.get_running_loop()))
+        return self.rows[:datums_wanted]
+
+    async def get_data(self, ids):
+        self.loops.add(id(asyncio.get_running_loop()))
+        self.get_calls.append(list(ids))
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        return [_datum(i, f"image-{i}" if i < 1000 else i - 1000) for i in reversed(ids)]
+
+
+_OPENED: list[_FakeDatalake] = []
+
+
+async def _open_fake_datalake() -> _FakeDatalake:
+    _OPENED.append(_FakeDatalake(4))
+    return _OPENED[-1]
+
+
 class TestDatalakeDatasetMirrored:
     def test_init_raises_import_error_without_torch_utils(self):
         original_import = builtins.__import__
@@ -102,3 +148,160 @@ class TestBuildDatalakeLoaderMirrored:
             drop_last=True,
             pin_memory=True,
         )
+
+    def test_streaming_loader_keeps_workers_and_leaves_shuffle_to_the_dataset(self):
+        fake_dataset = object()
+
+        with patch(
+            "mindtrace.models.training.datalake_bridge.StreamingDatalakeDataset", return_value=fake_dataset
+        ) as mock_dataset:
+            with patch("torch.utils.data.DataLoader") as mock_loader:
+                build_datalake_loader(
+                    datalake=SimpleNamespace(),
+                    query={"column": "image"},
+                    transform=_identity_transform,
+                    streaming=True,
+                    num_workers=2,
+                    read_ahead=3,
+                )
+
+        assert mock_dataset.call_args.kwargs["shuffle"] is True
+        assert mock_dataset.call_args.kwargs["read_ahead"] == 3
+        mock_loader.assert_called_once_with(fake_dataset, batch_size=32, num_workers=2, persistent_workers=True)
+
+
+class TestStreamingDatalakeDataset:
+    @pytest.fixture
+    def make_dataset(self):
+        datasets = []
+
+        def make(datalake, **kwargs):
+            dataset = StreamingDatalakeDataset(datalake, query={"column": "image"}, transform=_pair_transform, **kwargs)
+            datasets.append(dataset)
+            return dataset
+
+        yield make
+        for dataset in datasets:
+            dataset.close()
+
+    def test_streams_every_row_in_order_with_batched_fetches_on_one_loop(self, make_dataset):
+        datalake = _FakeDatalake(10)
+        dataset = make_dataset(datalake, fetch_batch_size=4)
+
+        samples = list(dataset)
+
+        assert len(dataset) == 10
+        assert samples == [(f"image-{i}", i) for i in range(10)]
+        assert [len(ids) for ids in datalake.get_calls] == [8, 8, 4]
+        list(dataset)
+        # The ID query and every fetch share the dataset's persistent loop.
+        assert len(datalake.loops) == 1
+
+    def test_bounds_concurrent_fetches(self, make_dataset):
+        datalake = _FakeDatalake(32, delay=0.02)
+        dataset = make_dataset(datalake, fetch_batch_size=2, max_concurrency=3, read_ahead=8)
+
+        assert len(list(dataset)) == 32
+        assert datalake.peak_in_flight == 3
+
+    def test_shuffle_changes_order_per_epoch_and_set_epoch_replays_it(self, make_dataset):
+        dataset = make_dataset(_FakeDatalake(20), shuffle=True, seed=7)
+
+        first = [label for _, label in dataset]
+        second = [label for _, label in dataset]
+        dataset.set_epoch(0)
+        replay = [label for _, label in dataset]
+
+        assert sorted(first) == sorted(second) == list(range(20))
+        assert first != second
+        assert replay == first
+
+    def test_dataloader_workers_shard_rows_without_overlap(self, make_dataset):
+        dataset = make_dataset(_FakeDatalake(23), fetch_batch_size=3)
+        loader = torch.utils.data.DataLoader(dataset, batch_size=4, num_workers=2)
+
+        labels = [int(label) for _, labels in loader for label in labels]
+
+        assert sorted(labels) == list(range(23))
+
+    def test_ddp_ranks_get_equal_padded_shards(self, make_dataset):
+        dataset = make_dataset(_FakeDatalake(10), shuffle=True, seed=3)
+
+        shards = []
+        for rank in range(3):
+            dataset.set_epoch(0)
+            with patch("mindtrace.models.training.datalake_bridge._distributed_rank", return_value=(rank, 3)):
+                assert len(dataset) == 4
+                shards.append([label for _, label in dataset])
+
+        # 10 rows over 3 ranks: every rank steps through 4 samples, two rows repeated as padding.
+        assert [len(shard) for shard in shards] == [4, 4, 4]
+        assert sorted(set(label for shard in shards for label in shard)) == list(range(10))
+
+    def test_dataloader_workers_split_the_rank_shard(self, make_dataset):
+        dataset = make_dataset(_FakeDatalake(11), fetch_batch_size=2)
+        loader = torch.utils.data.DataLoader(dataset, batch_size=2, num_workers=2)
+
+        with patch("mindtrace.models.training.datalake_bridge._distributed_rank", return_value=(1, 2)):
+            labels = sorted(int(label) for _, labels in loader for label in labels)
+            assert len(dataset) == 6
+
+        # Rank 1 of 2 owns the odd rows plus row 0 as padding, whichever worker fetched them.
+        assert labels == [0, 1, 3, 5, 7, 9]
+
+    def test_disk_cache_serves_later_epochs_without_fetching(self, make_dataset, tmp_path):
+        datalake = _FakeDatalake(6)
+        dataset = make_dataset(datalake, fetch_batch_size=4, cache_dir=tmp_path)
+
+        first = list(dataset)
+        fetches = len(datalake.get_calls)
+        second = list(dataset)
+
+        assert second == first
+        assert len(datalake.get_calls) == fetches
+        assert dataset.cache.hits == 6
+
+    def test_missing_datum_raises_lookup_error(self, make_dataset):
+        datalake = _FakeDatalake(2)
+
+        async def get_data(ids):
+            return []
+
+        datalake.get_data = get_data
+        with pytest.raises(LookupError, match="no datum"):
+            list(make_dataset(datalake))
+
+    def test_pickled_copy_opens_its_own_connection_through_the_factory(self, make_dataset):
+        _OPENED.clear()
+        dataset = make_dataset(_FakeDatalake(4), datalake_factory=_open_fake_datalake)
+        clone = pickle.loads(pickle.dumps(dataset))
+        clone._owner_pid = -1  # Stand in for a spawned worker process
+
+        assert clone._datalake is None
+        assert len(list(clone)) == 4
+        assert len(_OPENED) == 1
+        assert _OPENED[0].get_calls
+        clone.close()
+
+
+class TestDiskSampleCache:
+    def test_evicts_least_recently_used_samples_over_budget(self, tmp_path):
+        cache = DiskSampleCache(tmp_path, max_bytes=3000)
+        payload = b"x" * 900
+        for key in ("a", "b", "c"):
+            cache.put(key, payload)
+        assert cache.get("a") == payload  # Refresh "a" so "b" is now the oldest
+
+        cache.put("d", payload)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == cache.get("d") == payload
+        assert cache.misses == 1
+
+    def test_reopening_directory_keeps_samples_and_clear_removes_them(self, tmp_path):
+        DiskSampleCache(tmp_path).put(("image", 1), (1, 2))
+        cache = DiskSampleCache(tmp_path)
+
+        assert cache.get(("image", 1)) == (1, 2)
+        cache.clear()
+        assert cache.get(("image", 1), "missing") == "missing"
@@ -1436,3 +1436,322 @@ def test_local_commit_direct_upload_metadata_yaml_failure(backend, monkeypatch):
         on_conflict=OnConflict.OVERWRITE,
     )
     assert r.is_error
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Content-addressed layout
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.fixture
+def cas_backend(temp_dir):
+    """A content-addressed LocalRegistryBackend rooted in its own directory."""
+    return LocalRegistryBackend(uri=str(temp_dir / "cas"), lock_timeout=1, content_addressed=True)
+
+
+def _write_model(path: Path, weights: bytes, config: str) -> Path:
+    path.mkdir(parents=True, exist_ok=True)
+    (path / "weights.bin").write_bytes(weights)
+    (path / "sub").mkdir(exist_ok=True)
+    (path / "sub" / "config.json").write_text(config)
+    return path
+
+
+def _blobs(backend) -> list[Path]:
+    return sorted(p for p in (backend.uri / "_blobs" / "sha256").glob("*/*") if not p.name.startswith("."))
+
+
+def test_cas_push_deduplicates_unchanged_files(cas_backend, temp_dir):
+    v1 = _write_model(temp_dir / "v1", b"w" * 4096, '{"lr": 1}')
+    v2 = _write_model(temp_dir / "v2", b"w" * 4096, '{"lr": 2}')
+
+    cas_backend.push("model", "1.0.0", v1, {"_files": ["weights.bin", "sub/config.json"]})
+    cas_backend.push("model", "1.0.1", v2, {"_files": ["weights.bin", "sub/config.json"]})
+
+    # weights shared, two distinct configs
+    assert len(_blobs(cas_backend)) == 3
+    w1 = cas_backend.uri / "model" / "1.0.0" / "weights.bin"
+    w2 = cas_backend.uri / "model" / "1.0.1" / "weights.bin"
+    assert os.stat(w1).st_ino == os.stat(w2).st_ino
+
+    meta = cas_backend.fetch_metadata("model", "1.0.1").first().metadata
+    assert set(meta["_blobs"]) == {"weights.bin", "sub/config.json"}
+    assert cas_backend._blob_path(meta["_blobs"]["weights.bin"]).exists()
+
+
+def test_cas_pull_copies_and_round_trips(cas_backend, temp_dir):
+    src = _write_model(temp_dir / "src", b"abc", "{}")
+    cas_backend.push("model", "1", src, {})
+    meta = cas_backend.fetch_metadata("model", "1").first().metadata
+
+    dest = temp_dir / "dest"
+    result = cas_backend.pull("model", "1", dest, metadata=meta).first()
+
+    assert result.ok
+    assert (dest / "weights.bin").read_bytes() == b"abc"
+    assert (dest / "sub" / "config.json").read_text() == "{}"
+    # The default copy mode never hands out the shared blob itself
+    blob = cas_backend._blob_path(meta["_blobs"]["weights.bin"])
+    assert os.stat(dest / "weights.bin").st_ino != os.stat(blob).st_ino
+
+
+def test_cas_link_pull_hardlinks_blobs(temp_dir):
+    backend = LocalRegistryBackend(uri=str(temp_dir / "cas"), lock_timeout=1, content_addressed=True, pull_mode="link")
+    backend.push("model", "1", _write_model(temp_dir / "src", b"abc", "{}"), {})
+    meta = backend.fetch_metadata("model", "1").first().metadata
+
+    dest = temp_dir / "dest"
+    assert backend.pull("model", "1", dest, metadata=meta).first().ok
+
+    blob = backend._blob_path(meta["_blobs"]["weights.bin"])
+    assert os.stat(dest / "weights.bin").st_ino == os.stat(blob).st_ino
+
+
+def test_cas_delete_releases_only_unreferenced_blobs(cas_backend, temp_dir):
+    cas_backend.push("model", "1", _write_model(temp_dir / "v1", b"shared", "a"), {})
+    cas_backend.push("model", "2", _write_model(temp_dir / "v2", b"shared", "b"), {})
+    shared = cas_backend._blob_path(cas_backend.fetch_metadata("model", "2").first().metadata["_blobs"]["weights.bin"])
+
+    assert cas_backend.delete("model", "1").first().ok
+    assert shared.exists()
+    assert len(_blobs(cas_backend)) == 2
+
+    assert cas_backend.delete("model", "2").first().ok
+    assert _blobs(cas_backend) == []
+
+
+def test_cas_overwrite_releases_replaced_blobs(cas_backend, temp_dir):
+    cas_backend.push("model", "1", _write_model(temp_dir / "v1", b"old", "a"), {})
+    cas_backend.push("model", "1", _write_model(temp_dir / "v2", b"new", "a"), {}, on_conflict=OnConflict.OVERWRITE)
+
+    assert (cas_backend.uri / "model" / "1" / "weights.bin").read_bytes() == b"new"
+    assert len(_blobs(cas_backend)) == 2
+
+
+def test_cas_relinks_blob_collected_concurrently(cas_backend, temp_dir, monkeypatch):
+    src = _write_model(temp_dir / "v1", b"data", "c")
+    cas_backend.push("model", "1", src, {})
+    real_link = os.link
+    calls = {"n": 0}
+
+    def flaky_link(blob, dst):
+        calls["n"] += 1
+        if calls["n"] == 1:
+            # Simulate a concurrent delete collecting the blob between the existence check and the link.
+            os.unlink(blob)
+            raise FileNotFoundError(blob)
+        return real_link(blob, dst)
+
+    monkeypatch.setattr("mindtrace.registry.backends.local_registry_backend.os.link", flaky_link)
+    cas_backend.push("model", "2", src, {})
+
+    assert (cas_backend.uri / "model" / "2" / "weights.bin").read_bytes() == b"data"
+
+
+def test_cas_falls_back_to_copy_without_hardlinks(cas_backend, temp_dir, monkeypatch):
+    def no_link(*args, **kwargs):
+        raise OSError("hardlinks not supported")
+
+    monkeypatch.setattr("mindtrace.registry.backends.local_registry_backend.os.link", no_link)
+    cas_backend.push("model", "1", _write_model(temp_dir / "v1", b"data", "c"), {})
+    meta = cas_backend.fetch_metadata("model", "1").first().metadata
+
+    dest = temp_dir / "dest"
+    assert cas_backend.pull("model", "1", dest, metadata=meta).first().ok
+    assert (dest / "weights.bin").read_bytes() == b"data"
+
+
+def test_cas_collect_garbage_removes_unlinked_blobs(cas_backend, temp_dir):
+    cas_backend.push("model", "1", _write_model(temp_dir / "v1", b"kept", "c"), {})
+    cas_backend._store_blob(temp_dir / "v1" / "weights.bin", "0" * 64)
+
+    assert cas_backend.collect_garbage() == 1
+    assert len(_blobs(cas_backend)) == 2
+
+
+def test_plain_backend_reads_and_deletes_cas_versions(cas_backend, temp_dir):
+    cas_backend.push("model", "1", _write_model(temp_dir / "v1", b"data", "c"), {})
+    plain = LocalRegistryBackend(uri=cas_backend.uri, lock_timeout=1, pull_mode="link")
+    meta = plain.fetch_metadata("model", "1").first().metadata
+
+    assert plain.pull("model", "1", temp_dir / "dest", metadata=meta).first().ok
+    # The pulled hardlinks keep the blobs alive until they are gone too
+    assert plain.delete("model", "1").first().ok
+    assert len(_blobs(cas_backend)) == 2
+
+    shutil.rmtree(temp_dir / "dest")
+    assert plain.collect_garbage() == 2
+    assert _blobs(cas_backend) == []
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Pull modes
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+def test_invalid_pull_mode(temp_dir):
+    with pytest.raises(ValueError, match="Unknown pull_mode"):
+        LocalRegistryBackend(uri=str(temp_dir), pull_mode="mmap")
+
+
+@pytest.mark.parametrize("pull_mode", ["link", "direct"])
+def test_link_pull_shares_stored_files(temp_dir, sample_object_dir, sample_metadata, pull_mode):
+    backend = LocalRegistryBackend(uri=str(temp_dir / "reg"), lock_timeout=1, pull_mode=pull_mode)
+    backend.push("test:object", "1.0.0", sample_object_dir, sample_metadata)
+
+    dest = temp_dir / "dest"
+    assert backend.pull("test:object", "1.0.0", dest, metadata=sample_metadata).first().ok
+
+    stored = backend.uri / "test:object" / "1.0.0" / "file1.txt"
+    assert (dest / "file1.txt").read_text() == "test content 1"
+    assert os.stat(dest / "file1.txt").st_ino == os.stat(stored).st_ino
+
+
+def test_reflink_pull_produces_independent_files(temp_dir, sample_object_dir, sample_metadata):
+    backend = LocalRegistryBackend(uri=str(temp_dir / "reg"), lock_timeout=1, pull_mode="reflink")
+    backend.push("test:object", "1.0.0", sample_object_dir, sample_metadata)
+
+    dest = temp_dir / "dest"
+    assert backend.pull("test:object", "1.0.0", dest, metadata=sample_metadata).first().ok
+    (dest / "file1.txt").write_text("modified")
+
+    assert (backend.uri / "test:object" / "1.0.0" / "file1.txt").read_text() == "test content 1"
+
+
+def test_link_pull_falls_back_to_copy(temp_dir, sample_object_dir, sample_metadata, monkeypatch):
+    backend = LocalRegistryBackend(uri=str(temp_dir / "reg"), lock_timeout=1, pull_mode="link")
+    backend.push("test:object", "1.0.0", sample_object_dir, sample_metadata)
+
+    def no_link(*args, **kwargs):
+        raise OSError("cross-device link")
+
+    monkeypatch.setattr("mindtrace.registry.backends.local_registry_backend.os.link", no_link)
+    monkeypatch.setattr(LocalRegistryBackend, "_clone_file", staticmethod(lambda src, dst: False))
+    dest = temp_dir / "dest"
+    assert backend.pull("test:object", "1.0.0", dest, metadata=sample_metadata).first().ok
+
+    stored = backend.uri / "test:object" / "1.0.0" / "file2.txt"
+    assert (dest / "file2.txt").read_text() == "test content 2"
+    assert os.stat(dest / "file2.txt").st_ino != os.stat(stored).st_ino
+
+
+def test_local_artifact_path_only_in_direct_mode(temp_dir, sample_object_dir, sample_metadata):
+    copying = LocalRegistryBackend(uri=str(temp_dir / "reg"), lock_timeout=1)
+    direct = LocalRegistryBackend(uri=str(temp_dir / "reg"), lock_timeout=1, pull_mode="direct")
+    copying.push("test:object", "1.0.0", sample_object_dir, sample_metadata)
+
+    assert copying.local_artifact_path("test:object", "1.0.0") is None
+    assert direct.local_artifact_path("test:object", "1.0.0") == direct.uri / "test:object" / "1.0.0"
+    assert direct.local_artifact_path("test:object", "2.0.0") is None
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Metadata index
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.fixture
+def indexed_backend(temp_dir):
+    return LocalRegistryBackend(uri=str(temp_dir / "reg"), lock_timeout=1, index=True)
+
+
+def test_index_tracks_push_delete_and_metadata(indexed_backend, sample_object_dir, sample_metadata):
+    indexed_backend.push("test:object", "1.0.0", sample_object_dir, sample_metadata)
+    indexed_backend.push("test:object", "1.10.0", sample_object_dir, sample_metadata)
+    indexed_backend.push("test:object", "1.9.0", sample_object_dir, sample_metadata)
+    indexed_backend.save_metadata("test:other", "1", {"name": "test:other"})
+
+    assert indexed_backend.list_objects() == ["test:object", "test:other"]
+    assert indexed_backend.list_versions("test:object") == {"test:object": ["1.0.0", "1.9.0", "1.10.0"]}
+    assert indexed_backend.latest_version("test:object") == "1.10.0"
+
+    indexed_backend.delete("test:object", "1.10.0")
+    indexed_backend.delete_metadata("test:other", "1")
+    assert indexed_backend.list_objects() == ["test:object"]
+    assert indexed_backend.latest_version("test:object") == "1.9.0"
+
+    # Listings agree with a backend scanning the metadata files.
+    plain = LocalRegistryBackend(uri=indexed_backend.uri, lock_timeout=1)
+    assert plain.list_objects() == indexed_backend.list_objects()
+    assert plain.list_versions("test:object") == indexed_backend.list_versions("test:object")
+
+
+def test_index_is_not_consulted_for_listing_files(indexed_backend, sample_object_dir, sample_metadata):
+    indexed_backend.push("test:object", "1.0.0", sample_object_dir, sample_metadata)
+    with patch.object(Path, "glob", side_effect=AssertionError("listing should not glob")):
+        assert indexed_backend.list_objects() == ["test:object"]
+        assert indexed_backend.list_versions("test:object") == {"test:object": ["1.0.0"]}
+
+
+def test_index_failed_push_leaves_no_entry(indexed_backend, sample_object_dir, sample_metadata):
+    with patch("shutil.copytree", side_effect=OSError("disk full")):
+        assert not indexed_backend.push("test:object", "1.0.0", sample_object_dir, sample_metadata).first().ok
+    assert indexed_backend.list_objects() == []
+
+
+def test_index_is_built_from_existing_registry(temp_dir, sample_object_dir, sample_metadata):
+    plain = LocalRegistryBackend(uri=str(temp_dir / "reg"), lock_timeout=1)
+    plain.push("test:object", "1.0.0", sample_object_dir, sample_metadata)
+    plain.push("test:object", "2.0.0", sample_object_dir, sample_metadata)
+
+    indexed = LocalRegistryBackend(uri=str(temp_dir / "reg"), lock_timeout=1, index=True)
+    assert indexed.list_versions("test:object") == {"test:object": ["1.0.0", "2.0.0"]}
+    assert (indexed.uri / "_index.sqlite3").exists()
+
+
+def test_rebuild_index_picks_up_unindexed_writes(temp_dir, sample_object_dir, sample_metadata):
+    indexed = LocalRegistryBackend(uri=str(temp_dir / "reg"), lock_timeout=1, index=True)
+    indexed.push("test:object", "1.0.0", sample_object_dir, sample_metadata)
+    plain = LocalRegistryBackend(uri=str(temp_dir / "reg"), lock_timeout=1)
+    plain.push("test:new", "1.0.0", sample_object_dir, sample_metadata)
+    plain.delete("test:object", "1.0.0")
+
+    assert indexed.list_objects() == ["test:object"]
+    assert indexed.rebuild_index() == 1
+    assert indexed.list_objects() == ["test:new"]
+
+
+def test_rebuild_index_requires_index(backend):
+    with pytest.raises(RuntimeError, match="index=True"):
+        backend.rebuild_index()
+
+
+@pytest.mark.parametrize("index", [False, True])
+def test_touch_orders_lru_entries(temp_dir, sample_object_dir, sample_metadata, index):
+    backend = LocalRegistryBackend(uri=str(temp_dir / "reg"), lock_timeout=1, index=index)
+    for version in ("1.0.0", "2.0.0", "3.0.0"):
+        backend.push("test:object", version, sample_object_dir, sample_metadata)
+        backend.touch("test:object", version, last_accessed=float(version[0]))
+    backend.touch("test:object", "1.0.0", last_accessed=10.0)
+
+    assert backend.lru_entries() == [
+        ("test:object", "2.0.0", 2.0),
+        ("test:object", "3.0.0", 3.0),
+        ("test:object", "1.0.0", 10.0),
+    ]
+    assert backend._object_metadata_path("test:object", "1.0.0").stat().st_mtime == 10.0
+
+
+def test_touch_missing_version(indexed_backend):
+    with pytest.raises(FileNotFoundError):
+        indexed_backend.touch("test:object", "1.0.0")
+
+
+def test_unindexed_lru_entries_fall_back_when_stat_fails(backend, sample_object_dir, sample_metadata):
+    backend.push("test:object", "1.0.0", sample_object_dir, sample_metadata)
+    real_path = backend._object_metadata_path("test:object", "1.0.0")
+
+    class _Unstattable(type(real_path)):
+        def stat(self, *args, **kwargs):
+            raise OSError("no stat")
+
+    with patch.object(backend, "_object_metadata_path", return_value=_Unstattable(real_path)):
+        with patch("mindtrace.registry.backends.local_registry_backend.time.time", return_value=999.0):
+            assert backend.lru_entries() == [("test:object", "1.0.0", 999.0)]
+
+
+def test_unindexed_latest_version(backend, sample_object_dir, sample_metadata):
+    assert backend.latest_version("test:object") is None
+    backend.push("test:object", "1.9.0", sample_object_dir, sample_metadata)
+    backend.push("test:object", "1.10.0", sample_object_dir, sample_metadata)
+    assert backend.latest_version("test:object") == "1.10.0"
@@ -0,0 +1,80 @@
+import pickle
+
+from mindtrace.registry.backends.local_registry_index import LocalRegistryIndex, main, version_sort_key
+
+
+def test_version_sort_key_orders_numerically():
+    versions = ["1.10", "1", "1.9", "1.0", "2", "latest"]
+    assert sorted(versions, key=version_sort_key) == ["latest", "1", "1.0", "1.9", "1.10", "2"]
+
+
+def test_add_remove_and_queries(tmp_path):
+    index = LocalRegistryIndex(tmp_path / "index.sqlite3")
+    index.add("b:obj", "1.10", last_accessed=3.0)
+    index.add("b:obj", "1.9", last_accessed=1.0)
+    index.add("a:obj", "1", last_accessed=2.0)
+
+    assert index.objects() == ["a:obj", "b:obj"]
+    assert index.versions("b:obj") == ["1.9", "1.10"]
+    assert index.latest("b:obj") == "1.10"
+    assert index.latest("missing") is None
+    assert index.lru() == [("b:obj", "1.9", 1.0), ("a:obj", "1", 2.0), ("b:obj", "1.10", 3.0)]
+    assert index.lru(limit=1) == [("b:obj", "1.9", 1.0)]
+    assert ("a:obj", "1") in index
+    assert len(index) == 3
+
+    index.remove("b:obj", "1.10")
+    index.remove("b:obj", "unknown")
+    assert index.versions("b:obj") == ["1.9"]
+    assert len(index) == 2
+
+
+def test_latest_ignores_non_numeric_versions(tmp_path):
+    index = LocalRegistryIndex(tmp_path / "index.sqlite3")
+    index.add("obj", "__temp__abc")
+    assert index.latest("obj") is None
+    index.add("obj", "2")
+    assert index.latest("obj") == "2"
+
+
+def test_touch(tmp_path):
+    index = LocalRegistryIndex(tmp_path / "index.sqlite3")
+    index.add("obj", "1", last_accessed=1.0)
+    index.add("obj", "2", last_accessed=2.0)
+
+    assert index.touch("obj", "1", last_accessed=5.0) is True
+    assert index.touch("obj", "3") is False
+    assert [version for _, version, _ in index.lru()] == ["2", "1"]
+
+
+def test_replace_all_marks_index_built(tmp_path):
+    index = LocalRegistryIndex(tmp_path / "index.sqlite3")
+    index.add("stale", "1")
+    assert index.is_built() is False
+
+    assert index.replace_all([("obj", "1", 1.0), ("obj", "2", 2.0)]) == 2
+    assert index.is_built() is True
+    assert index.objects() == ["obj"]
+
+
+def test_state_is_shared_through_the_database_file(tmp_path):
+    writer = LocalRegistryIndex(tmp_path / "index.sqlite3")
+    writer.add("obj", "1")
+    reader = pickle.loads(pickle.dumps(writer))
+
+    assert reader.versions("obj") == ["1"]
+    writer.close()
+    writer.add("obj", "2")
+    assert reader.versions("obj") == ["1", "2"]
+
+
+def test_main_rebuilds_index(tmp_path, capsys):
+    (tmp_path / "_meta_test%3Aobj@1.0.0.yaml").write_text("name: test:obj\n")
+
+    assert main([str(tmp_path)]) == 0
+    assert "Indexed 1 object version(s)" in capsys.readouterr().out
+    assert LocalRegistryIndex(tmp_path / "_index.sqlite3").versions("test:obj") == ["1.0.0"]
+
+
+def test_main_missing_directory(tmp_path):
+    assert main([str(tmp_path / "missing")]) == 1
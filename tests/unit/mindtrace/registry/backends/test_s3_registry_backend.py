@@ -1,4 +1,5 @@
 import json
+import threading
 import warnings
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -104,7 +105,7 @@ class MockMinioHandler:
         )
 
     def list_objects(self, prefix: str = "", **kwargs) -> List[str]:
-        return [name for name in self._objects.keys() if name.startswith(prefix)]
+        return [name for name in list(self._objects) if name.startswith(prefix)]
 
     def upload_string(
         self, data: str | bytes, remote_path: str, if_generation_match: int | None = None, **kwargs
@@ -1601,3 +1602,151 @@ def test_s3_commit_direct_upload_metadata_write_error(backend, monkeypatch):
         on_conflict=OnConflict.OVERWRITE,
     )
     assert r.is_error
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Content-addressed layout
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.fixture
+def cas_backend(mock_minio_handler, tmp_path):
+    """Create a content-addressed backend with mocked S3 storage."""
+    return S3RegistryBackend(
+        uri=str(tmp_path / "s3_cas_cache"),
+        endpoint="localhost:9000",
+        access_key="minioadmin",
+        secret_key="minioadmin",
+        bucket="test-bucket",
+        secure=False,
+        content_addressed=True,
+    )
+
+
+def _blob_keys(backend) -> List[str]:
+    return sorted(backend.storage.list_objects(prefix="_blobs/sha256/"))
+
+
+def test_cas_push_uploads_unchanged_files_once(cas_backend, sample_object_dir, sample_metadata, tmp_path):
+    v2_dir = tmp_path / "v2"
+    v2_dir.mkdir()
+    (v2_dir / "data.json").write_text('{"key": "changed"}')
+    (v2_dir / "model.bin").write_bytes((sample_object_dir / "model.bin").read_bytes())
+
+    assert cas_backend.push("model", "1.0.0", sample_object_dir, sample_metadata).first().ok
+    uploads = []
+    original_upload_batch = cas_backend.storage.upload_batch
+    cas_backend.storage.upload_batch = lambda files, **kw: uploads.extend(files) or original_upload_batch(files, **kw)
+    assert cas_backend.push("model", "1.0.1", v2_dir, sample_metadata).first().ok
+
+    # Only the changed config was uploaded for the second version
+    assert [local for local, _ in uploads] == [str(v2_dir / "data.json")]
+    assert len(_blob_keys(cas_backend)) == 3
+    assert cas_backend.storage.list_objects(prefix="objects/") == []
+
+    meta = cas_backend.fetch_metadata("model", "1.0.1").first().metadata
+    assert meta["_storage"]["layout"] == "content_addressed"
+    assert set(meta["_blobs"]) == {"data.json", "model.bin"}
+
+
+def test_cas_pull_reassembles_from_blobs(cas_backend, sample_object_dir, sample_metadata, tmp_path):
+    cas_backend.push("model", "1.0.0", sample_object_dir, sample_metadata)
+    meta = cas_backend.fetch_metadata("model", "1.0.0").first().metadata
+
+    dest = tmp_path / "dest"
+    assert cas_backend.pull("model", "1.0.0", dest, metadata=meta).first().ok
+    assert (dest / "data.json").read_text() == '{"key": "value"}'
+    assert (dest / "model.bin").read_bytes() == b"\x00\x01\x02\x03"
+
+
+def test_cas_delete_releases_only_unreferenced_blobs(cas_backend, sample_object_dir, sample_metadata):
+    cas_backend.push("model", "1.0.0", sample_object_dir, sample_metadata)
+    cas_backend.push("model", "1.0.1", sample_object_dir, sample_metadata)
+    assert len(_blob_keys(cas_backend)) == 2
+
+    assert cas_backend.delete("model", "1.0.0").first().ok
+    assert len(_blob_keys(cas_backend)) == 2
+
+    assert cas_backend.delete("model", "1.0.1").first().ok
+    assert _blob_keys(cas_backend) == []
+    assert cas_backend.storage.list_objects(prefix="_blobs/refs/") == []
+    assert cas_backend.storage.list_objects(prefix="_staging/") == []
+
+
+def test_cas_overwrite_releases_replaced_blobs(cas_backend, sample_object_dir, sample_metadata, tmp_path):
+    cas_backend.push("model", "1.0.0", sample_object_dir, sample_metadata)
+    new_dir = tmp_path / "new"
+    new_dir.mkdir()
+    (new_dir / "data.json").write_text("{}")
+    (new_dir / "model.bin").write_bytes(b"\x00\x01\x02\x03")
+
+    result = cas_backend.push("model", "1.0.0", new_dir, sample_metadata, on_conflict=OnConflict.OVERWRITE).first()
+
+    assert result.is_overwritten
+    assert result.cleanup == CleanupState.OK
+    assert len(_blob_keys(cas_backend)) == 2
+    assert len(cas_backend.storage.list_objects(prefix="_blobs/refs/")) == 2
+
+
+def test_cas_push_rolls_back_references_on_upload_failure(cas_backend, sample_object_dir, sample_metadata):
+    cas_backend.storage.upload_batch = lambda files, **kw: MockBatchResult(
+        results=[MockFileResult(local_path=files[0][0], status="error", ok=False, error_message="boom")]
+    )
+
+    result = cas_backend.push(["model"], ["1.0.0"], [sample_object_dir], [sample_metadata]).first()
+
+    assert result.is_error
+    assert result.cleanup == CleanupState.OK
+    assert cas_backend.storage.list_objects(prefix="_blobs/") == []
+    assert not cas_backend.has_object("model", "1.0.0")[("model", "1.0.0")]
+
+
+def test_plain_backend_pulls_cas_versions(cas_backend, backend, sample_object_dir, sample_metadata, tmp_path):
+    cas_backend.push("model", "1.0.0", sample_object_dir, sample_metadata)
+    # Each backend owns a separate mocked bucket; share the stored objects.
+    backend.storage._objects.update(cas_backend.storage._objects)
+    meta = backend.fetch_metadata("model", "1.0.0").first().metadata
+
+    assert backend.pull("model", "1.0.0", tmp_path / "dest", metadata=meta).first().ok
+    assert (tmp_path / "dest" / "model.bin").read_bytes() == b"\x00\x01\x02\x03"
+    assert backend.delete("model", "1.0.0").first().ok
+    assert backend.storage.list_objects(prefix="_blobs/") == []
+
+
+def test_cas_push_reuploads_blob_released_concurrently(cas_backend, sample_object_dir, sample_metadata, tmp_path):
+    cas_backend.push("model", "1.0.0", sample_object_dir, sample_metadata)
+    deleting, waiting, resume = threading.Event(), threading.Event(), threading.Event()
+
+    original_delete_batch = cas_backend.storage.delete_batch
+
+    def delete_batch(paths, **kwargs):
+        # Hold the release between its reference check and the blob delete.
+        if any(path.startswith("_blobs/sha256/") for path in paths):
+            deleting.set()
+            resume.wait(5)
+        return original_delete_batch(paths, **kwargs)
+
+    original_wait = cas_backend._wait_for_blob_release
+
+    def wait_for_blob_release(digest):
+        waiting.set()
+        original_wait(digest)
+
+    cas_backend.storage.delete_batch = delete_batch
+    cas_backend._wait_for_blob_release = wait_for_blob_release
+
+    release = threading.Thread(target=cas_backend.delete, args=("model", "1.0.0"))
+    release.start()
+    assert deleting.wait(5)
+    push = threading.Thread(target=cas_backend.push, args=("model", "1.0.1", sample_object_dir, sample_metadata))
+    push.start()
+    assert waiting.wait(5)
+    resume.set()
+    release.join(5)
+    push.join(5)
+
+    # The push either kept the blobs referenced or re-uploaded them after the release deleted them.
+    meta = cas_backend.fetch_metadata("model", "1.0.1").first().metadata
+    assert cas_backend.pull("model", "1.0.1", tmp_path / "dest", metadata=meta).first().ok
+    assert (tmp_path / "dest" / "model.bin").read_bytes() == b"\x00\x01\x02\x03"
+    assert len(_blob_keys(cas_backend)) == 2
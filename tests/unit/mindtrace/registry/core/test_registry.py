@@ -1,4 +1,3 @@
-import os
 import shutil
 import threading
 import time
@@ -6,7 +5,7 @@ from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from types import SimpleNamespace
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import ANY, Mock, patch
 
 import pytest
 from pydantic import BaseModel
@@ -582,6 +581,86 @@ def test_load_directory_with_contents(registry):
             assert (loaded_path / "subdir" / "file3.txt").read_text() == "content3"
 
 
+def test_direct_pull_mode_loads_without_pulling(temp_registry_dir, test_bytes):
+    """Immutable registries read directly from the store when the backend allows it."""
+    backend = LocalRegistryBackend(uri=temp_registry_dir, pull_mode="direct")
+    registry = Registry(backend=backend, version_objects=True)
+    registry.save("test:bytes", test_bytes, version="1.0.0")
+
+    with patch.object(backend, "pull", side_effect=AssertionError("pull should not be called")):
+        assert registry.load("test:bytes", version="1.0.0") == test_bytes
+        assert registry.load(["test:bytes"], version=["1.0.0"]).results == [test_bytes]
+
+
+def test_direct_pull_mode_copies_path_outputs(temp_registry_dir):
+    """Path outputs are copied out of the store rather than moved in direct mode."""
+    backend = LocalRegistryBackend(uri=temp_registry_dir, pull_mode="direct")
+    registry = Registry(backend=backend, version_objects=True)
+    with TemporaryDirectory() as source_dir:
+        (Path(source_dir) / "file1.txt").write_text("content1")
+        registry.save("test:dir", Path(source_dir), version="1.0.0")
+
+    with TemporaryDirectory() as output_dir:
+        loaded_path = registry.load("test:dir", version="1.0.0", output_dir=output_dir)
+        assert (loaded_path / "file1.txt").read_text() == "content1"
+
+    # The stored artifact survives and can be loaded again.
+    with TemporaryDirectory() as output_dir:
+        loaded_path = registry.load("test:dir", version="1.0.0", output_dir=output_dir)
+        assert (loaded_path / "file1.txt").read_text() == "content1"
+
+
+def test_direct_pull_mode_ignored_for_mutable_registry(temp_registry_dir, test_bytes):
+    """Mutable registries always pull, since stored versions may be overwritten."""
+    backend = LocalRegistryBackend(uri=temp_registry_dir, pull_mode="direct")
+    registry = Registry(backend=backend, version_objects=True, mutable=True)
+    registry.save("test:bytes", test_bytes, version="1.0.0")
+
+    with patch.object(backend, "pull", wraps=backend.pull) as pull:
+        assert registry.load("test:bytes", version="1.0.0") == test_bytes
+    pull.assert_called_once()
+
+
+def test_open_artifact_exposes_stored_files(registry, test_bytes):
+    """open_artifact yields the raw stored files and cleans up the temporary pull on exit."""
+    registry.save("test:bytes", test_bytes, version="1.0.0")
+
+    with registry.open_artifact("test:bytes", version="1.0.0") as (artifact_dir, metadata):
+        assert metadata["class"] == "builtins.bytes"
+        assert (artifact_dir / "data.txt").read_bytes() == test_bytes
+    assert not artifact_dir.exists()
+
+
+def test_open_artifact_direct_mode_reads_in_place(temp_registry_dir, test_bytes):
+    """Immutable direct-mode registries open the stored directory without pulling."""
+    backend = LocalRegistryBackend(uri=temp_registry_dir, pull_mode="direct")
+    registry = Registry(backend=backend, version_objects=True)
+    registry.save("test:bytes", test_bytes, version="1.0.0")
+
+    with patch.object(backend, "pull", side_effect=AssertionError("pull should not be called")):
+        with registry.open_artifact("test:bytes", version="1.0.0") as (artifact_dir, _):
+            assert (artifact_dir / "data.txt").read_bytes() == test_bytes
+    assert artifact_dir.exists()
+
+
+def test_open_artifact_skips_upfront_hashing_unless_asked(registry, test_bytes):
+    """Streamed opens do not hash the artifact before yielding it; verify="integrity" still checks it."""
+    registry.save("test:bytes", test_bytes, version="1.0.0")
+    with patch.object(registry._core, "_verify_artifact", wraps=registry._core._verify_artifact) as spy:
+        with registry.open_artifact("test:bytes", version="1.0.0") as (artifact_dir, _):
+            assert (artifact_dir / "data.txt").exists()
+        spy.assert_not_called()
+        with registry.open_artifact("test:bytes", version="1.0.0", verify="integrity"):
+            pass
+        spy.assert_called_once()
+
+
+def test_open_artifact_missing_raises(registry):
+    with pytest.raises(RegistryObjectNotFound):
+        with registry.open_artifact("test:missing", version="1.0.0"):
+            pass
+
+
 def test_load_error_handling(registry, test_config):
     """Test that errors during loading are properly logged and re-raised."""
     # Save a valid config first
@@ -2518,7 +2597,9 @@ def test_save_computes_hash(registry, test_config):
     # Verify hash is present in metadata
     assert "hash" in metadata
     assert isinstance(metadata["hash"], str)
-    assert len(metadata["hash"]) == 64  # SHA256 produces 64 hex characters
+    assert metadata["hash"].startswith("sha256:")
+    assert len(metadata["hash"]) == len("sha256:") + 64  # SHA256 produces 64 hex characters
+    assert set(metadata["_digests"]) == {Path(f).as_posix() for f in metadata["_files"]}
 
 
 def test_save_hash_deterministic(registry, test_config):
@@ -2640,7 +2721,7 @@ def test_load_hash_mismatch_error_message(registry, test_config):
     meta_path = registry.backend._object_metadata_path("test:config", "1.0.0")
     with open(meta_path) as f:
         metadata = yaml.safe_load(f)
-    metadata["hash"] = "0" * 64  # Invalid hash
+    metadata["hash"] = "sha256:" + "0" * 64  # Invalid hash
     with open(meta_path, "w") as f:
         yaml.safe_dump(metadata, f)
 
@@ -2652,10 +2733,58 @@ def test_load_hash_mismatch_error_message(registry, test_config):
     assert "Artifact hash verification failed" in error_message
     assert "Expected hash:" in error_message
     assert "computed hash:" in error_message
-    assert "0" * 64 in error_message  # Invalid hash should be in message
+    assert "sha256:" + "0" * 64 in error_message  # Invalid hash should be in message
     assert correct_hash in error_message  # Correct hash should be in message
 
 
+def test_load_hash_mismatch_names_changed_files(registry, test_config):
+    """Test that a corrupted artifact file is named in the verification error."""
+    registry.save("test:config", test_config, version="1.0.0")
+    metadata = registry.info("test:config", version="1.0.0")
+    rel_path = next(iter(metadata["_digests"]))
+
+    artifact_path = registry.backend._full_path(registry.backend._object_key("test:config", "1.0.0")) / rel_path
+    artifact_path.write_bytes(artifact_path.read_bytes() + b" ")
+
+    with pytest.raises(ValueError, match=f"Mismatched files: {rel_path}"):
+        registry.load("test:config", version="1.0.0", verify="integrity")
+
+
+def test_load_verifies_legacy_dir_hash(registry, test_config):
+    """Test that artifacts saved with an unprefixed compute_dir_hash hash still verify."""
+    import yaml
+
+    registry.save("test:config", test_config, version="1.0.0")
+    meta_path = registry.backend._object_metadata_path("test:config", "1.0.0")
+    with open(meta_path) as f:
+        metadata = yaml.safe_load(f)
+    artifact_dir = registry.backend._full_path(registry.backend._object_key("test:config", "1.0.0"))
+    metadata["hash"] = compute_dir_hash(artifact_dir)
+    metadata.pop("_digests")
+    with open(meta_path, "w") as f:
+        yaml.safe_dump(metadata, f)
+
+    assert registry.load("test:config", version="1.0.0", verify="integrity") == test_config
+
+
+@pytest.mark.parametrize("algorithm", ["blake2b", "xxh3_128"])
+def test_registry_hash_algorithm(temp_registry_dir, test_config, algorithm):
+    """Test that a registry hashes with its configured algorithm and verifies on load."""
+    if algorithm == "xxh3_128":
+        pytest.importorskip("xxhash")
+    registry = Registry(backend=temp_registry_dir, version_objects=True, hash_algorithm=algorithm)
+    registry.save("test:config", test_config, version="1.0.0")
+
+    assert registry.info("test:config", version="1.0.0")["hash"].startswith(f"{algorithm}:")
+    assert registry.load("test:config", version="1.0.0", verify="integrity") == test_config
+
+
+def test_registry_rejects_unknown_hash_algorithm(temp_registry_dir):
+    """Test that an unknown hash algorithm is rejected."""
+    with pytest.raises(ValueError, match="hash_algorithm"):
+        Registry(backend=temp_registry_dir, hash_algorithm="md5")
+
+
 def test_hash_computation_different_objects(registry, test_config):
     """Test that different objects produce different hashes."""
     # Create two different configs
@@ -2883,9 +3012,8 @@ class TestRegistryCacheLRU:
 
     @staticmethod
     def set_cache_mtime(registry, name, version, timestamp):
-        """Set cached metadata mtime for deterministic LRU assertions."""
-        metadata_path = registry._cache.backend._object_metadata_path(name, version)
-        os.utime(metadata_path, (timestamp, timestamp))
+        """Set cached last-access time for deterministic LRU assertions."""
+        registry._cache.backend.touch(name, version, timestamp)
 
     @staticmethod
     def cache_mtime(registry, name, version):
@@ -2960,20 +3088,18 @@ class TestRegistryCacheLRU:
 
         assert entries == [{"name": "test:obj", "version": "1.0.0", "last_accessed": 123.0}]
 
-    def test_list_cache_lru_entries_falls_back_when_stat_fails(self, temp_registry_dir):
+    def test_cache_backend_is_indexed(self, temp_registry_dir):
         registry = self.make_remote_registry(temp_registry_dir, cache_max_entries=8)
-        registry._cache.save("test:stat", "x", version="1.0.0")
-        bad_meta = MagicMock()
-        bad_meta.stat.side_effect = OSError("no stat")
-        with patch.object(registry._cache.backend, "_object_metadata_path", return_value=bad_meta):
-            with patch("mindtrace.registry.core.registry.time.time", return_value=999.0):
-                entries = registry._list_cache_lru_entries()
+        registry._cache.save("test:obj", "x", version="1.0.0")
 
-        assert entries == [{"name": "test:stat", "version": "1.0.0", "last_accessed": 999.0}]
+        assert registry._cache.backend.indexed
+        with patch.object(registry._cache.backend, "_object_metadata_path", side_effect=AssertionError("no stat")):
+            entries = registry._list_cache_lru_entries()
+        assert [(entry["name"], entry["version"]) for entry in entries] == [("test:obj", "1.0.0")]
 
-    def test_list_cache_lru_entries_swallows_list_objects_failure(self, temp_registry_dir):
+    def test_list_cache_lru_entries_swallows_backend_failure(self, temp_registry_dir):
         registry = self.make_remote_registry(temp_registry_dir, cache_max_entries=8)
-        with patch.object(registry._cache, "list_objects", side_effect=RuntimeError("boom")):
+        with patch.object(registry._cache.backend, "lru_entries", side_effect=RuntimeError("boom")):
             assert registry._list_cache_lru_entries() == []
 
     def test_prune_keeps_most_recent_metadata_mtimes(self, temp_registry_dir):
@@ -3495,6 +3621,85 @@ def test_load_cache_hash_mismatch(temp_registry_dir):
         assert registry._cache.load("test:obj", "1.0.0") == "new_value"
 
 
+def test_indexed_backend_resolves_latest_without_listing_versions(temp_registry_dir):
+    """Auto-versioned saves and latest loads use the backend index instead of listing every version."""
+    backend = LocalRegistryBackend(uri=str(Path(temp_registry_dir) / "indexed"), index=True)
+    registry = Registry(backend=backend, version_objects=True, use_cache=False)
+    for value in range(3):
+        registry.save("test:obj", value)
+
+    with patch.object(backend, "list_versions", wraps=backend.list_versions) as spy:
+        registry._invalidate_versions_cache("test:obj")
+        assert registry.save("test:obj", "next") == "1.0.3"
+        assert registry.load("test:obj") == "next"
+        assert registry._latest("test:missing") is None
+    spy.assert_not_called()
+
+    # A cached version list is reused as before.
+    registry.list_versions("test:obj")
+    with patch.object(backend, "latest_version") as lookup:
+        assert registry._latest("test:obj") == "1.0.3"
+    lookup.assert_not_called()
+
+
+def test_load_cache_legacy_remote_hash_is_not_stale(temp_registry_dir):
+    """A cached copy of an artifact saved with the legacy unprefixed hash is reused on the next full-verify load."""
+    from tempfile import TemporaryDirectory
+
+    mock_backend = Mock(spec=RegistryBackend)
+    mock_backend.uri = Path(temp_registry_dir) / "remote"
+    mock_backend.registered_materializers = Mock(return_value={})
+    mock_backend.fetch_registry_metadata = Mock(return_value={})
+    mock_backend.has_object = Mock(return_value={("test:obj", "1.0.0"): True})
+    mock_backend.list_versions = Mock(return_value={"test:obj": ["1.0.0"]})
+
+    registry = Registry(backend=mock_backend, version_objects=True)
+
+    with TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        (temp_path / "data.json").write_text('"value"')
+        legacy_hash = compute_dir_hash(temp_path)
+        assert ":" not in legacy_hash
+
+        mock_backend.fetch_metadata = Mock(
+            side_effect=lambda names, versions: _make_op_results(
+                *[
+                    OpResult.success(
+                        n,
+                        v,
+                        metadata={
+                            "class": "builtins.str",
+                            "materializer": "zenml.materializers.built_in_materializer.BuiltInMaterializer",
+                            "hash": legacy_hash,
+                        },
+                    )
+                    for n, v in zip(
+                        [names] if isinstance(names, str) else names,
+                        [versions] if isinstance(versions, str) else versions,
+                    )
+                ]
+            )
+        )
+
+        def mock_pull(names, versions, local_paths, acquire_lock=False, metadata=None):
+            results = OpResults()
+            for n, v, p in zip(names, versions, local_paths):
+                shutil.copytree(temp_path, p, dirs_exist_ok=True)
+                results.add(OpResult.success(n, v))
+            return results
+
+        mock_backend.pull = Mock(side_effect=mock_pull)
+
+        assert registry.load("test:obj", "1.0.0", verify="full") == "value"
+        assert registry.load("test:obj", "1.0.0", verify="full") == "value"
+        assert registry.load(["test:obj"], ["1.0.0"], verify="full").results == ["value"]
+
+        mock_backend.pull.assert_called_once()
+        cache_meta = registry._cache.backend.fetch_metadata("test:obj", "1.0.0").first().metadata
+        assert cache_meta["source_hash"] == legacy_hash
+        assert cache_meta["hash"] != legacy_hash
+
+
 def test_load_cache_error_fallback(temp_registry_dir):
     """Test that load() falls back to remote when cache check fails."""
     from tempfile import TemporaryDirectory
@@ -4772,6 +4977,7 @@ class TestRegistryFacadeCoverage:
             ["remote-value", "fresh-value"],
             version=["2.0.0", "3.0.0"],
             on_conflict=OnConflict.OVERWRITE,
+            source_hash=ANY,
         )
 
         with pytest.raises(ValueError, match="same length"):
@@ -1,5 +1,6 @@
 """Unit tests for the ConnectionManager class."""
 
+import threading
 from unittest.mock import AsyncMock, Mock, patch
 from uuid import uuid4
 
@@ -484,6 +485,140 @@ class TestConnectionManagerContextManager:
             assert result == self.cm.suppress
 
 
+class TestConnectionManagerHttpClients:
+    """Test the pooled keep-alive HTTP clients."""
+
+    def test_sync_client_is_lazy_and_reused(self):
+        """The sync client is created on first use and shared by later calls."""
+        cm = ConnectionManager()
+        assert cm._http._client is None
+
+        client = cm.http_client
+        assert isinstance(client, httpx.Client)
+        assert cm.http_client is client
+        cm.close_clients()
+
+    def test_close_clients_recreates_on_next_use(self):
+        """Closing the clients does not break the connection manager."""
+        cm = ConnectionManager()
+        client = cm.http_client
+        cm.close_clients()
+
+        assert client.is_closed
+        assert cm.http_client is not client
+        assert not cm.http_client.is_closed
+        cm.close_clients()
+
+    def test_limits_and_http2_are_applied(self):
+        """Pool limits and HTTP/2 are passed through to the clients."""
+        limits = httpx.Limits(max_connections=4, max_keepalive_connections=2)
+        with patch("mindtrace.services.core.connection_manager.httpx.Client") as mock_client_cls:
+            cm = ConnectionManager(http_limits=limits, http2=True)
+            mock_client_cls.return_value.is_closed = False
+            _ = cm.http_client
+            _ = cm.http_client
+
+        mock_client_cls.assert_called_once_with(limits=limits, http2=True, timeout=60.0)
+
+    async def test_async_client_is_reused_within_a_loop(self):
+        """One async client serves every call made from the same event loop."""
+        cm = ConnectionManager()
+        client = cm.async_http_client
+
+        assert isinstance(client, httpx.AsyncClient)
+        assert cm.async_http_client is client
+
+        await cm.aclose_clients()
+        assert client.is_closed
+
+    def test_async_client_per_event_loop(self):
+        """Each event loop gets its own async client."""
+        import asyncio
+
+        cm = ConnectionManager()
+
+        async def get_client():
+            return cm.async_http_client
+
+        first = asyncio.run(get_client())
+        second = asyncio.run(get_client())
+        assert first is not second
+        cm.close_clients()
+
+    def test_async_client_closes_with_its_event_loop(self):
+        """A loop shut down by asyncio.run closes its client, which the next loop's lookup then forgets."""
+        import asyncio
+
+        cm = ConnectionManager()
+
+        async def get_client():
+            return cm.async_http_client
+
+        first = asyncio.run(get_client())
+        assert first.is_closed
+
+        second = asyncio.run(get_client())
+        assert second.is_closed
+        assert list(cm._http._async_clients.values())[0][0] is second
+        assert len(cm._http._async_clients) == 1
+
+    def test_close_clients_closes_async_clients_of_open_loops(self):
+        """close_clients closes async clients of idle loops and of loops running in other threads."""
+        import asyncio
+
+        cm = ConnectionManager()
+
+        async def get_client():
+            return cm.async_http_client
+
+        idle_loop = asyncio.new_event_loop()
+        running_loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=running_loop.run_forever, daemon=True)
+        thread.start()
+        try:
+            idle_client = idle_loop.run_until_complete(get_client())
+            running_client = asyncio.run_coroutine_threadsafe(get_client(), running_loop).result(timeout=5)
+
+            cm.close_clients()
+
+            assert idle_client.is_closed
+            asyncio.run_coroutine_threadsafe(asyncio.sleep(0.05), running_loop).result(timeout=5)
+            assert running_client.is_closed
+            assert cm._http._async_clients == {}
+        finally:
+            running_loop.call_soon_threadsafe(running_loop.stop)
+            thread.join(timeout=5)
+            running_loop.close()
+            idle_loop.close()
+
+    def test_async_client_requires_running_loop(self):
+        """Async clients are bound to a loop, so there is none to hand out outside one."""
+        with pytest.raises(RuntimeError):
+            _ = ConnectionManager().async_http_client
+
+    def test_exit_closes_clients(self):
+        """Leaving the context closes the pooled clients after shutdown."""
+        cm = ConnectionManager()
+        client = cm.http_client
+        with patch.object(cm, "shutdown"):
+            cm.__exit__(None, None, None)
+
+        assert client.is_closed
+
+    def test_exit_closes_clients_when_shutdown_fails(self):
+        """The clients are closed even if shutdown raises."""
+        cm = ConnectionManager()
+        client = cm.http_client
+        with (
+            patch.object(cm, "shutdown", side_effect=Exception("Shutdown failed")),
+            patch.object(cm.logger, "exception"),
+        ):
+            cm.suppress = True
+            cm.__exit__(ValueError, ValueError("Test error"), None)
+
+        assert client.is_closed
+
+
 class TestConnectionManagerIntegration:
     """Integration-style tests for ConnectionManager workflows."""
 
@@ -256,7 +256,7 @@ class TestGenerateConnectionManager:
         assert hasattr(ConnectionManagerClass, "safe_endpoint")
         assert hasattr(ConnectionManagerClass, "asafe_endpoint")
 
-    @patch("mindtrace.services.core.utils.httpx")
+    @patch("mindtrace.services.core.connection_manager.httpx")
     def test_generated_method_sync_call_success(self, mock_httpx, mock_service_class):
         """Test successful sync method call."""
         mock_service_class, mock_service, mock_endpoint1, _ = mock_service_class
@@ -265,7 +265,7 @@ class TestGenerateConnectionManager:
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"result": "success"}
-        mock_httpx.post.return_value = mock_response
+        mock_httpx.Client.return_value.post.return_value = mock_response
 
         # Setup input/output schemas
         mock_input_schema = Mock()
@@ -283,7 +283,9 @@ class TestGenerateConnectionManager:
         _ = manager.test_endpoint(test_param="value")
 
         # Verify httpx call
-        mock_httpx.post.assert_called_once_with("http://test.com/test_endpoint", json={"input": "data"}, timeout=60)
+        mock_httpx.Client.return_value.post.assert_called_once_with(
+            "http://test.com/test_endpoint", json={"input": "data"}, timeout=60
+        )
 
         # Verify input schema was called
         mock_input_schema.assert_called_once_with(test_param="value")
@@ -291,14 +293,14 @@ class TestGenerateConnectionManager:
         # Verify output schema was called
         mock_output_schema.assert_called_once_with(result="success")
 
-    @patch("mindtrace.services.core.utils.httpx")
+    @patch("mindtrace.services.core.connection_manager.httpx")
     def test_generated_method_uses_default_timeout(self, mock_httpx, mock_service_class):
         """Test generated sync methods use the default endpoint timeout."""
         mock_service_class, mock_service, mock_endpoint1, _ = mock_service_class
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"result": "success"}
-        mock_httpx.post.return_value = mock_response
+        mock_httpx.Client.return_value.post.return_value = mock_response
         mock_endpoint1.input_schema = None
         mock_endpoint1.output_schema = Mock()
 
@@ -306,16 +308,18 @@ class TestGenerateConnectionManager:
         manager = ConnectionManagerClass(url=parse_url("http://test.com"))
         manager.test_endpoint()
 
-        mock_httpx.post.assert_called_once_with("http://test.com/test_endpoint", json={}, timeout=60)
+        mock_httpx.Client.return_value.post.assert_called_once_with(
+            "http://test.com/test_endpoint", json={}, timeout=60
+        )
 
-    @patch("mindtrace.services.core.utils.httpx")
+    @patch("mindtrace.services.core.connection_manager.httpx")
     def test_generated_method_allows_timeout_override(self, mock_httpx, mock_service_class):
         """Test generated sync methods allow a method-local timeout override."""
         mock_service_class, mock_service, mock_endpoint1, _ = mock_service_class
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"result": "success"}
-        mock_httpx.post.return_value = mock_response
+        mock_httpx.Client.return_value.post.return_value = mock_response
         mock_endpoint1.input_schema = None
         mock_endpoint1.output_schema = Mock()
 
@@ -323,9 +327,9 @@ class TestGenerateConnectionManager:
         manager = ConnectionManagerClass(url=parse_url("http://test.com"))
         manager.test_endpoint(timeout=5)
 
-        mock_httpx.post.assert_called_once_with("http://test.com/test_endpoint", json={}, timeout=5)
+        mock_httpx.Client.return_value.post.assert_called_once_with("http://test.com/test_endpoint", json={}, timeout=5)
 
-    @patch("mindtrace.services.core.utils.httpx")
+    @patch("mindtrace.services.core.connection_manager.httpx")
     @pytest.mark.asyncio
     async def test_generated_method_async_call_success(self, mock_httpx, mock_service_class):
         """Test successful async method call."""
@@ -337,7 +341,7 @@ class TestGenerateConnectionManager:
         mock_response.status_code = 200
         mock_response.json.return_value = {"result": "async_success"}
         mock_client.post.return_value = mock_response
-        mock_httpx.AsyncClient.return_value.__aenter__.return_value = mock_client
+        mock_httpx.AsyncClient.return_value = mock_client
 
         # Setup schemas
         mock_input_schema = Mock()
@@ -357,7 +361,7 @@ class TestGenerateConnectionManager:
         # Verify async client call
         mock_client.post.assert_called_once_with("http://test.com/test_endpoint", json={"async": "data"}, timeout=60)
 
-    @patch("mindtrace.services.core.utils.httpx")
+    @patch("mindtrace.services.core.connection_manager.httpx")
     @pytest.mark.asyncio
     async def test_generated_async_method_allows_timeout_override(self, mock_httpx, mock_service_class):
         """Test generated async methods allow a method-local timeout override."""
@@ -367,7 +371,7 @@ class TestGenerateConnectionManager:
         mock_response.status_code = 200
         mock_response.json.return_value = {"result": "async_success"}
         mock_client.post.return_value = mock_response
-        mock_httpx.AsyncClient.return_value.__aenter__.return_value = mock_client
+        mock_httpx.AsyncClient.return_value = mock_client
         mock_endpoint1.input_schema = None
         mock_endpoint1.output_schema = Mock()
 
@@ -375,10 +379,10 @@ class TestGenerateConnectionManager:
         manager = ConnectionManagerClass(url=parse_url("http://test.com"))
         await manager.atest_endpoint(timeout=300)
 
-        mock_httpx.AsyncClient.assert_called_once_with(timeout=300)
+        mock_httpx.AsyncClient.assert_called_once()
         mock_client.post.assert_called_once_with("http://test.com/test_endpoint", json={}, timeout=300)
 
-    @patch("mindtrace.services.core.utils.httpx")
+    @patch("mindtrace.services.core.connection_manager.httpx")
     def test_generated_method_http_error(self, mock_httpx, mock_service_class):
         """Test HTTP error handling in generated method."""
         mock_service_class, mock_service, mock_endpoint1, _ = mock_service_class
@@ -387,7 +391,7 @@ class TestGenerateConnectionManager:
         mock_response = Mock()
         mock_response.status_code = 500
         mock_response.text = "Internal Server Error"
-        mock_httpx.post.return_value = mock_response
+        mock_httpx.Client.return_value.post.return_value = mock_response
 
         # Setup schemas
         mock_endpoint1.input_schema = None
@@ -403,7 +407,7 @@ class TestGenerateConnectionManager:
         assert exc_info.value.status_code == 500
         assert exc_info.value.detail == "Internal Server Error"
 
-    @patch("mindtrace.services.core.utils.httpx")
+    @patch("mindtrace.services.core.connection_manager.httpx")
     def test_generated_method_no_input_schema(self, mock_httpx, mock_service_class):
         """Test method generation with no input schema."""
         mock_service_class, mock_service, _, mock_endpoint2 = mock_service_class
@@ -412,7 +416,7 @@ class TestGenerateConnectionManager:
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"result": "no_input"}
-        mock_httpx.post.return_value = mock_response
+        mock_httpx.Client.return_value.post.return_value = mock_response
 
         # mock_endpoint2 has input_schema = None
         mock_endpoint2.output_schema = Mock()
@@ -424,9 +428,11 @@ class TestGenerateConnectionManager:
         _ = manager.no_input_endpoint(raw_param="value")
 
         # Should pass kwargs directly as payload (but since input_schema is None, it creates empty payload)
-        mock_httpx.post.assert_called_once_with("http://test.com/no_input_endpoint", json={}, timeout=60)
+        mock_httpx.Client.return_value.post.assert_called_once_with(
+            "http://test.com/no_input_endpoint", json={}, timeout=60
+        )
 
-    @patch("mindtrace.services.core.utils.httpx")
+    @patch("mindtrace.services.core.connection_manager.httpx")
     def test_generated_method_empty_response(self, mock_httpx, mock_service_class):
         """Test handling of empty response content."""
         mock_service_class, mock_service, mock_endpoint1, _ = mock_service_class
@@ -435,7 +441,7 @@ class TestGenerateConnectionManager:
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.side_effect = Exception("No JSON content")
-        mock_httpx.post.return_value = mock_response
+        mock_httpx.Client.return_value.post.return_value = mock_response
 
         mock_endpoint1.input_schema = None
         mock_endpoint1.output_schema = Mock()
@@ -449,7 +455,7 @@ class TestGenerateConnectionManager:
         # Should call output schema with default success response
         mock_endpoint1.output_schema.assert_called_once_with(success=True)
 
-    @patch("mindtrace.services.core.utils.httpx")
+    @patch("mindtrace.services.core.connection_manager.httpx")
     def test_generated_method_validation_flags(self, mock_httpx, mock_service_class):
         """Test validate_input and validate_output flags."""
         mock_service_class, mock_service, mock_endpoint1, _ = mock_service_class
@@ -458,7 +464,7 @@ class TestGenerateConnectionManager:
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"raw": "response"}
-        mock_httpx.post.return_value = mock_response
+        mock_httpx.Client.return_value.post.return_value = mock_response
 
         mock_endpoint1.input_schema = Mock()
         mock_endpoint1.output_schema = Mock()
@@ -470,7 +476,7 @@ class TestGenerateConnectionManager:
         result = manager.test_endpoint(validate_input=False, validate_output=False, raw_param="value")
 
         # Should pass kwargs directly and return raw response
-        mock_httpx.post.assert_called_once_with(
+        mock_httpx.Client.return_value.post.assert_called_once_with(
             "http://test.com/test_endpoint", json={"raw_param": "value"}, timeout=60
         )
 
@@ -481,7 +487,7 @@ class TestGenerateConnectionManager:
         # Should return raw response
         assert result == {"raw": "response"}
 
-    @patch("mindtrace.services.core.utils.httpx")
+    @patch("mindtrace.services.core.connection_manager.httpx")
     def test_generated_method_no_input_schema_with_validate_input_false(self, mock_httpx, mock_service_class):
         """Test method generation with no input schema and validate_input=False."""
         mock_service_class, mock_service, _, mock_endpoint2 = mock_service_class
@@ -490,7 +496,7 @@ class TestGenerateConnectionManager:
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"result": "no_input_validate_false"}
-        mock_httpx.post.return_value = mock_response
+        mock_httpx.Client.return_value.post.return_value = mock_response
 
         # mock_endpoint2 has input_schema = None
         mock_endpoint2.output_schema = Mock()
@@ -503,11 +509,11 @@ class TestGenerateConnectionManager:
         _ = manager.no_input_endpoint(validate_input=False, raw_param="value")
 
         # Should pass kwargs directly as payload
-        mock_httpx.post.assert_called_once_with(
+        mock_httpx.Client.return_value.post.assert_called_once_with(
             "http://test.com/no_input_endpoint", json={"raw_param": "value"}, timeout=60
         )
 
-    @patch("mindtrace.services.core.utils.httpx")
+    @patch("mindtrace.services.core.connection_manager.httpx")
     @pytest.mark.asyncio
     async def test_generated_async_method_no_input_schema_with_validate_input_false(
         self, mock_httpx, mock_service_class
@@ -521,7 +527,7 @@ class TestGenerateConnectionManager:
         mock_response.status_code = 200
         mock_response.json.return_value = {"result": "async_no_input_validate_false"}
         mock_client.post.return_value = mock_response
-        mock_httpx.AsyncClient.return_value.__aenter__.return_value = mock_client
+        mock_httpx.AsyncClient.return_value = mock_client
 
         # mock_endpoint2 has input_schema = None
         mock_endpoint2.output_schema = Mock()
@@ -538,7 +544,7 @@ class TestGenerateConnectionManager:
             "http://test.com/no_input_endpoint", json={"async_param": "value"}, timeout=60
         )
 
-    @patch("mindtrace.services.core.utils.httpx")
+    @patch("mindtrace.services.core.connection_manager.httpx")
     @pytest.mark.asyncio
     async def test_generated_async_method_http_error(self, mock_httpx, mock_service_class):
         """Test async method HTTP error handling."""
@@ -550,7 +556,7 @@ class TestGenerateConnectionManager:
         mock_response.status_code = 400
         mock_response.text = "Bad Request"
         mock_client.post.return_value = mock_response
-        mock_httpx.AsyncClient.return_value.__aenter__.return_value = mock_client
+        mock_httpx.AsyncClient.return_value = mock_client
 
         mock_endpoint1.input_schema = None
         mock_endpoint1.output_schema = Mock()
@@ -565,7 +571,7 @@ class TestGenerateConnectionManager:
         assert exc_info.value.status_code == 400
         assert exc_info.value.detail == "Bad Request"
 
-    @patch("mindtrace.services.core.utils.httpx")
+    @patch("mindtrace.services.core.connection_manager.httpx")
     @pytest.mark.asyncio
     async def test_generated_async_method_empty_response(self, mock_httpx, mock_service_class):
         """Test async method handling of empty response."""
@@ -577,7 +583,7 @@ class TestGenerateConnectionManager:
         mock_response.status_code = 200
         mock_response.json.side_effect = Exception("No JSON content")
         mock_client.post.return_value = mock_response
-        mock_httpx.AsyncClient.return_value.__aenter__.return_value = mock_client
+        mock_httpx.AsyncClient.return_value = mock_client
 
         mock_endpoint1.input_schema = None
         mock_endpoint1.output_schema = Mock()
@@ -591,7 +597,7 @@ class TestGenerateConnectionManager:
         # Should call output schema with default success response
         mock_endpoint1.output_schema.assert_called_once_with(success=True)
 
-    @patch("mindtrace.services.core.utils.httpx")
+    @patch("mindtrace.services.core.connection_manager.httpx")
     @pytest.mark.asyncio
     async def test_generated_async_method_no_validate_output(self, mock_httpx, mock_service_class):
         """Test async method with validate_output=False returning raw result."""
@@ -603,7 +609,7 @@ class TestGenerateConnectionManager:
         mock_response.status_code = 200
         mock_response.json.return_value = {"raw": "async_response_data"}
         mock_client.post.return_value = mock_response
-        mock_httpx.AsyncClient.return_value.__aenter__.return_value = mock_client
+        mock_httpx.AsyncClient.return_value = mock_client
 
         mock_endpoint1.input_schema = None
         mock_endpoint1.output_schema = Mock()
@@ -618,7 +624,7 @@ class TestGenerateConnectionManager:
         assert result == {"raw": "async_response_data"}
         mock_endpoint1.output_schema.assert_not_called()
 
-    @patch("mindtrace.services.core.utils.httpx")
+    @patch("mindtrace.services.core.connection_manager.httpx")
     def test_generated_method_multiple_args_error(self, mock_httpx, mock_service_class):
         """Test that method raises error when called with multiple args."""
         from pydantic import BaseModel
@@ -637,7 +643,7 @@ class TestGenerateConnectionManager:
         with pytest.raises(ValueError, match="must be called with either kwargs or a single argument"):
             manager.test_endpoint(TestInput(value="test"), "extra_arg")
 
-    @patch("mindtrace.services.core.utils.httpx")
+    @patch("mindtrace.services.core.connection_manager.httpx")
     def test_generated_method_wrong_arg_type_error(self, mock_httpx, mock_service_class):
         """Test that method raises error when arg is wrong type."""
         from pydantic import BaseModel
@@ -656,7 +662,7 @@ class TestGenerateConnectionManager:
         with pytest.raises(ValueError, match="must be called with either kwargs or a single argument"):
             manager.test_endpoint("not_a_test_input")
 
-    @patch("mindtrace.services.core.utils.httpx")
+    @patch("mindtrace.services.core.connection_manager.httpx")
     def test_generated_method_args_and_kwargs_error(self, mock_httpx, mock_service_class):
         """Test that method raises error when called with both args and kwargs."""
         from pydantic import BaseModel
@@ -675,7 +681,7 @@ class TestGenerateConnectionManager:
         with pytest.raises(ValueError, match="must be called with either kwargs or a single argument"):
             manager.test_endpoint(TestInput(value="test"), extra_param="value")
 
-    @patch("mindtrace.services.core.utils.httpx")
+    @patch("mindtrace.services.core.connection_manager.httpx")
     @pytest.mark.asyncio
     async def test_generated_async_method_multiple_args_error(self, mock_httpx, mock_service_class):
         """Test that async method raises error when called with multiple args."""
@@ -695,7 +701,7 @@ class TestGenerateConnectionManager:
         with pytest.raises(ValueError, match="must be called with either kwargs or a single argument"):
             await manager.atest_endpoint(TestInput(value="test"), "extra_arg")
 
-    @patch("mindtrace.services.core.utils.httpx")
+    @patch("mindtrace.services.core.connection_manager.httpx")
     @pytest.mark.asyncio
     async def test_generated_async_method_wrong_arg_type_error(self, mock_httpx, mock_service_class):
         """Test that async method raises error when arg is wrong type."""
@@ -715,7 +721,7 @@ class TestGenerateConnectionManager:
         with pytest.raises(ValueError, match="must be called with either kwargs or a single argument"):
             await manager.atest_endpoint("not_a_test_input")
 
-    @patch("mindtrace.services.core.utils.httpx")
+    @patch("mindtrace.services.core.connection_manager.httpx")
     @pytest.mark.asyncio
     async def test_generated_async_method_args_and_kwargs_error(self, mock_httpx, mock_service_class):
         """Test that async method raises error when called with both args and kwargs."""
@@ -735,7 +741,7 @@ class TestGenerateConnectionManager:
         with pytest.raises(ValueError, match="must be called with either kwargs or a single argument"):
             await manager.atest_endpoint(TestInput(value="test"), extra_param="value")
 
-    @patch("mindtrace.services.core.utils.httpx")
+    @patch("mindtrace.services.core.connection_manager.httpx")
     def test_generated_method_single_valid_arg(self, mock_httpx, mock_service_class):
         """Test that method works with a single valid arg."""
 
@@ -750,7 +756,7 @@ class TestGenerateConnectionManager:
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"result": "success"}
-        mock_httpx.post.return_value = mock_response
+        mock_httpx.Client.return_value.post.return_value = mock_response
 
         ConnectionManagerClass = generate_connection_manager(mock_service_class)
         manager = ConnectionManagerClass(url=parse_url("http://test.com"))
@@ -759,10 +765,12 @@ class TestGenerateConnectionManager:
         result = manager.test_endpoint(TestInput(value="test"))
 
         # Should call httpx with dumped payload
-        mock_httpx.post.assert_called_once_with("http://test.com/test_endpoint", json={"value": "test"}, timeout=60)
+        mock_httpx.Client.return_value.post.assert_called_once_with(
+            "http://test.com/test_endpoint", json={"value": "test"}, timeout=60
+        )
         assert result == {"result": "success"}
 
-    @patch("mindtrace.services.core.utils.httpx")
+    @patch("mindtrace.services.core.connection_manager.httpx")
     def test_generated_method_kwargs_uses_json_mode_dump(self, mock_httpx, mock_service_class):
         """Validated kwargs should be serialized with model_dump(mode='json')."""
         mock_service_class, mock_service, mock_endpoint1, _ = mock_service_class
@@ -770,7 +778,7 @@ class TestGenerateConnectionManager:
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"result": "success"}
-        mock_httpx.post.return_value = mock_response
+        mock_httpx.Client.return_value.post.return_value = mock_response
 
         mock_input_instance = Mock()
         mock_input_instance.model_dump.return_value = {"object_id": "json-safe-id"}
@@ -785,12 +793,12 @@ class TestGenerateConnectionManager:
 
         mock_input_schema.assert_called_once_with(object_id="raw-id")
         mock_input_instance.model_dump.assert_called_once_with(mode="json")
-        mock_httpx.post.assert_called_once_with(
+        mock_httpx.Client.return_value.post.assert_called_once_with(
             "http://test.com/test_endpoint", json={"object_id": "json-safe-id"}, timeout=60
         )
         assert result == {"result": "success"}
 
-    @patch("mindtrace.services.core.utils.httpx")
+    @patch("mindtrace.services.core.connection_manager.httpx")
     def test_generated_method_single_valid_arg_uses_json_mode_dump(self, mock_httpx, mock_service_class):
         """Validated positional inputs should be serialized with model_dump(mode='json')."""
 
@@ -804,7 +812,7 @@ class TestGenerateConnectionManager:
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"result": "success"}
-        mock_httpx.post.return_value = mock_response
+        mock_httpx.Client.return_value.post.return_value = mock_response
 
         ConnectionManagerClass = generate_connection_manager(mock_service_class)
         manager = ConnectionManagerClass(url=parse_url("http://test.com"))
@@ -813,10 +821,12 @@ class TestGenerateConnectionManager:
             result = manager.test_endpoint(TestInput(value="test"))
 
         mock_dump.assert_called_once_with(ANY, mode="json")
-        mock_httpx.post.assert_called_once_with("http://test.com/test_endpoint", json={"value": "test"}, timeout=60)
+        mock_httpx.Client.return_value.post.assert_called_once_with(
+            "http://test.com/test_endpoint", json={"value": "test"}, timeout=60
+        )
         assert result == {"result": "success"}
 
-    @patch("mindtrace.services.core.utils.httpx")
+    @patch("mindtrace.services.core.connection_manager.httpx")
     @pytest.mark.asyncio
     async def test_generated_async_method_single_valid_arg(self, mock_httpx, mock_service_class):
         """Test that async method works with a single valid arg."""
@@ -834,7 +844,7 @@ class TestGenerateConnectionManager:
         mock_response.status_code = 200
         mock_response.json.return_value = {"result": "async_success"}
         mock_client.post.return_value = mock_response
-        mock_httpx.AsyncClient.return_value.__aenter__.return_value = mock_client
+        mock_httpx.AsyncClient.return_value = mock_client
 
         ConnectionManagerClass = generate_connection_manager(mock_service_class)
         manager = ConnectionManagerClass(url=parse_url("http://test.com"))
@@ -846,7 +856,7 @@ class TestGenerateConnectionManager:
         mock_client.post.assert_called_once_with("http://test.com/test_endpoint", json={"value": "test"}, timeout=60)
         assert result == {"result": "async_success"}
 
-    @patch("mindtrace.services.core.utils.httpx")
+    @patch("mindtrace.services.core.connection_manager.httpx")
     @pytest.mark.asyncio
     async def test_generated_async_method_kwargs_uses_json_mode_dump(self, mock_httpx, mock_service_class):
         """Async validated kwargs should be serialized with model_dump(mode='json')."""
@@ -857,7 +867,7 @@ class TestGenerateConnectionManager:
         mock_response.status_code = 200
         mock_response.json.return_value = {"result": "async_success"}
         mock_client.post.return_value = mock_response
-        mock_httpx.AsyncClient.return_value.__aenter__.return_value = mock_client
+        mock_httpx.AsyncClient.return_value = mock_client
 
         mock_input_instance = Mock()
         mock_input_instance.model_dump.return_value = {"object_id": "json-safe-id"}
@@ -877,7 +887,7 @@ class TestGenerateConnectionManager:
         )
         assert result == {"result": "async_success"}
 
-    @patch("mindtrace.services.core.utils.httpx")
+    @patch("mindtrace.services.core.connection_manager.httpx")
     @pytest.mark.asyncio
     async def test_generated_async_method_single_valid_arg_uses_json_mode_dump(self, mock_httpx, mock_service_class):
         """Async validated positional inputs should be serialized with model_dump(mode='json')."""
@@ -894,7 +904,7 @@ class TestGenerateConnectionManager:
         mock_response.status_code = 200
         mock_response.json.return_value = {"result": "async_success"}
         mock_client.post.return_value = mock_response
-        mock_httpx.AsyncClient.return_value.__aenter__.return_value = mock_client
+        mock_httpx.AsyncClient.return_value = mock_client
 
         ConnectionManagerClass = generate_connection_manager(mock_service_class)
         manager = ConnectionManagerClass(url=parse_url("http://test.com"))
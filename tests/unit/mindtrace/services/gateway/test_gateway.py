@@ -345,14 +345,14 @@ class TestProxyConnectionManagerIntegration:
     def proxy_cm(self, mock_original_cm):
         """Create a ProxyConnectionManager for testing."""
         # Create the proxy but avoid triggering HTTP requests during creation
-        with patch("requests.get"), patch("requests.post"):
+        with patch("httpx.Client.get"), patch("httpx.Client.post"):
             return ProxyConnectionManager(
                 gateway_url="http://localhost:8090", app_name="test-service", original_cm=mock_original_cm
             )
 
     def test_proxy_method_call_success(self, proxy_cm):
         """Test successful method call through proxy."""
-        with patch("requests.post") as mock_post:
+        with patch("httpx.Client.post") as mock_post:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.json.return_value = {"echoed": "test message"}
@@ -367,14 +367,14 @@ class TestProxyConnectionManagerIntegration:
 
             # Verify the request was made correctly
             mock_post.assert_called_once_with(
-                "http://localhost:8090/test-service/echo", json={"message": "test message"}, timeout=60
+                "http://localhost:8090/test-service/echo", json={"message": "test message"}
             )
 
             assert result == {"echoed": "test message"}
 
     def test_proxy_method_call_no_args(self, proxy_cm):
         """Test method call with no arguments through proxy."""
-        with patch("requests.post") as mock_post:
+        with patch("httpx.Client.post") as mock_post:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.json.return_value = {"status": "ok"}
@@ -388,11 +388,11 @@ class TestProxyConnectionManagerIntegration:
             _ = status_method()
 
             # Verify POST was used (all proxy methods use POST)
-            mock_post.assert_called_once_with("http://localhost:8090/test-service/status", json={}, timeout=60)
+            mock_post.assert_called_once_with("http://localhost:8090/test-service/status", json={})
 
     def test_proxy_method_call_failure(self, proxy_cm):
         """Test failed method call through proxy."""
-        with patch("requests.post") as mock_post:
+        with patch("httpx.Client.post") as mock_post:
             mock_response = Mock()
             mock_response.status_code = 500
             mock_response.text = "Internal Server Error"
@@ -523,3 +523,141 @@ class TestGatewayEdgeCases:
                 headers={},
                 content=b"{}",
             )
+
+
+class TestGatewayStreaming:
+    """Test the streaming pass-through proxy mode."""
+
+    @pytest.fixture
+    def gateway(self):
+        """Create a Gateway whose shared upstream client is served by a mock transport."""
+        gateway = Gateway()
+        gateway.upstream_requests = []
+
+        async def upstream(request: httpx.Request) -> httpx.Response:
+            body = await request.aread()
+            gateway.upstream_requests.append((request, body))
+
+            async def chunks():
+                yield b"\x89PNG"
+                yield body
+
+            return httpx.Response(
+                201,
+                content=chunks(),
+                headers=[
+                    ("Content-Type", "image/png"),
+                    ("X-Upstream", "yes"),
+                    ("Set-Cookie", "a=1"),
+                    ("Set-Cookie", "b=2"),
+                    ("Connection", "keep-alive"),
+                ],
+            )
+
+        gateway.client = httpx.AsyncClient(transport=httpx.MockTransport(upstream))
+        return gateway
+
+    @pytest.fixture
+    def client(self, gateway):
+        """HTTP client talking to the gateway app in-process."""
+        return httpx.AsyncClient(transport=httpx.ASGITransport(app=gateway.app), base_url="http://gateway")
+
+    async def test_streams_non_json_response_with_headers(self, gateway, client):
+        """Status, content type and headers are preserved and hop-by-hop headers are dropped."""
+        gateway.register_app(AppConfig(name="images", url="http://upstream:8001", streaming=True))
+
+        response = await client.post("/images/upload?quality=high", content=b"raw-bytes")
+
+        assert response.status_code == 201
+        assert response.content == b"\x89PNGraw-bytes"
+        assert response.headers["content-type"] == "image/png"
+        assert response.headers["x-upstream"] == "yes"
+        assert response.headers.get_list("set-cookie") == ["a=1", "b=2"]
+        assert "connection" not in response.headers
+
+        upstream_request, upstream_body = gateway.upstream_requests[0]
+        assert str(upstream_request.url) == "http://upstream:8001/upload?quality=high"
+        assert upstream_request.method == "POST"
+        assert upstream_body == b"raw-bytes"
+
+    async def test_get_without_body_is_not_chunked(self, gateway, client):
+        """Requests without a body are forwarded without one."""
+        gateway.register_app(AppConfig(name="images", url="http://upstream:8001/", streaming=True))
+
+        response = await client.get("/images/latest")
+
+        assert response.status_code == 201
+        upstream_request, upstream_body = gateway.upstream_requests[0]
+        assert upstream_body == b""
+        assert "transfer-encoding" not in upstream_request.headers
+
+    async def test_stream_request_network_error(self, gateway, client):
+        """Upstream connection errors surface as a 500."""
+
+        def unreachable(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("Connection refused")
+
+        gateway.client = httpx.AsyncClient(transport=httpx.MockTransport(unreachable))
+        gateway.register_app(AppConfig(name="images", url="http://upstream:8001", streaming=True))
+
+        response = await client.get("/images/latest")
+
+        assert response.status_code == 500
+        assert "Connection refused" in response.json()["detail"]
+
+    async def test_forward_request_dispatches_streaming_apps(self, gateway):
+        """forward_request only takes the streaming path for apps registered with streaming=True."""
+        gateway.register_app(AppConfig(name="images", url="http://upstream:8001", streaming=True))
+        mock_request = Mock(spec=Request)
+
+        with patch.object(gateway, "stream_request", new=AsyncMock(return_value="streamed")) as mock_stream:
+            result = await gateway.forward_request(mock_request, "images", "upload")
+
+        assert result == "streamed"
+        mock_stream.assert_awaited_once_with(mock_request, "images", "http://upstream:8001/upload")
+
+        gateway.register_app(AppConfig(name="images", url="http://upstream:8001"))
+        assert "images" not in gateway.streaming_apps
+
+
+class TestGatewayAppClients:
+    """Test per-app upstream clients."""
+
+    @pytest.fixture
+    def gateway(self):
+        return Gateway()
+
+    def test_apps_share_client_by_default(self, gateway):
+        """Apps without their own settings use the gateway's shared client."""
+        gateway.register_app(AppConfig(name="test-service", url="http://localhost:8001"))
+
+        assert gateway.client_for("test-service") is gateway.client
+
+    def test_app_with_limits_gets_own_client(self, gateway):
+        """Pool limits and timeout create a dedicated client for the app."""
+        with patch("mindtrace.services.gateway.gateway.httpx.AsyncClient") as mock_client_cls:
+            gateway.register_app(AppConfig(name="big", url="http://localhost:8001", timeout=120.0, max_connections=4))
+
+        assert gateway.client_for("big") is mock_client_cls.return_value
+        limits = mock_client_cls.call_args.kwargs["limits"]
+        assert limits.max_connections == 4
+        assert limits.max_keepalive_connections == httpx.Limits().max_keepalive_connections
+        assert mock_client_cls.call_args.kwargs["timeout"] == 120.0
+
+    def test_reregistering_without_settings_drops_app_client(self, gateway):
+        """Registering the app again without settings goes back to the shared client."""
+        gateway.register_app(AppConfig(name="big", url="http://localhost:8001", max_keepalive_connections=2))
+        assert gateway.client_for("big") is not gateway.client
+
+        gateway.register_app(AppConfig(name="big", url="http://localhost:8001"))
+        assert gateway.client_for("big") is gateway.client
+
+    async def test_shutdown_cleanup_closes_clients(self, gateway):
+        """Shutdown closes the shared and per-app clients."""
+        gateway.register_app(AppConfig(name="big", url="http://localhost:8001", timeout=10.0))
+        app_client = gateway.client_for("big")
+
+        await gateway.shutdown_cleanup()
+
+        assert gateway.client.is_closed
+        assert app_client.is_closed
@@ -67,7 +67,7 @@ def test_service_endpoints_extraction():
     assert service_endpoints["dummy"] == DummySchema
 
 
-@patch("requests.post")
+@patch("httpx.Client.post")
 def test_sync_proxy_method_success(mock_post):
     """Test successful sync proxy method call."""
     mock_response = Mock()
@@ -89,10 +89,10 @@ def test_sync_proxy_method_success(mock_post):
     # Result is wrapped in DummyOutput because schema validation is applied
     assert isinstance(result, DummyOutput)
     assert result.result == "ok"
-    mock_post.assert_called_once_with("http://gateway/app/dummy", json={"foo": "bar"}, timeout=60)
+    mock_post.assert_called_once_with("http://gateway/app/dummy", json={"foo": "bar"})
 
 
-@patch("requests.post")
+@patch("httpx.Client.post")
 def test_sync_proxy_method_http_error(mock_post):
     """Test sync proxy method with HTTP error."""
     mock_response = Mock()
@@ -112,7 +112,7 @@ def test_sync_proxy_method_http_error(mock_post):
         dummy_method(foo="bar")
 
 
-@patch("requests.post")
+@patch("httpx.Client.post")
 def test_sync_proxy_method_json_error(mock_post):
     """Test sync proxy method with JSON parsing error."""
     mock_response = Mock()
@@ -143,7 +143,7 @@ async def test_async_proxy_method_success(mock_client_class):
     mock_response.status_code = 200
     mock_response.json.return_value = {"result": "ok"}  # json() is synchronous in httpx
     mock_client.post.return_value = mock_response
-    mock_client_class.return_value.__aenter__.return_value = mock_client
+    mock_client_class.return_value = mock_client
 
     dummy_cm = DummyCMWithServiceEndpoints()
     dummy_cm._service_endpoints = {"dummy": DummySchema}
@@ -173,7 +173,7 @@ def test_getattribute_internal_attrs():
     assert proxy_cm.original_cm == dummy_cm
 
 
-@patch("requests.get")
+@patch("httpx.Client.get")
 def test_getattribute_proxy_property_get_success(mock_get):
     """Test property access via GET request."""
     mock_response = Mock()
@@ -187,7 +187,7 @@ def test_getattribute_proxy_property_get_success(mock_get):
 
     result = proxy_cm.some_property
     assert result["foo"] == "bar"
-    mock_get.assert_called_once_with("http://gateway/app/some_property", timeout=60)
+    mock_get.assert_called_once_with("http://gateway/app/some_property")
 
 
 def test_dynamic_method_creation():
@@ -295,7 +295,7 @@ async def test_async_proxy_method_input_validation_fallback(mock_client_class):
     mock_response.status_code = 200
     mock_response.json.return_value = {"result": "success"}
     mock_client.post.return_value = mock_response
-    mock_client_class.return_value.__aenter__.return_value = mock_client
+    mock_client_class.return_value = mock_client
 
     # Create connection manager with failing input schema
     dummy_cm = DummyCMWithServiceEndpoints()
@@ -322,7 +322,7 @@ async def test_async_proxy_method_input_validation_fallback(mock_client_class):
     assert result.result == "success"
 
 
-@patch("requests.post")
+@patch("httpx.Client.post")
 def test_sync_proxy_method_input_validation_fallback(mock_post):
     """Test sync proxy method fallback when input validation fails."""
 
@@ -364,7 +364,6 @@ def test_sync_proxy_method_input_validation_fallback(mock_post):
     mock_post.assert_called_once_with(
         "http://gateway/app/failing_input",
         json=test_kwargs,  # Should be raw kwargs, not validated input
-        timeout=60,
     )
 
     # Verify that the result was processed correctly
@@ -389,7 +388,7 @@ async def test_async_proxy_method_no_input_schema(mock_client_class):
     mock_response.status_code = 200
     mock_response.json.return_value = {"result": "no_validation"}
     mock_client.post.return_value = mock_response
-    mock_client_class.return_value.__aenter__.return_value = mock_client
+    mock_client_class.return_value = mock_client
 
     # Create connection manager with schema that has no input validation
     dummy_cm = DummyCMWithServiceEndpoints()
@@ -433,7 +432,7 @@ async def test_async_proxy_method_missing_input_schema_attribute(mock_client_cla
     mock_response.status_code = 200
     mock_response.json.return_value = {"result": "no_input_attr"}
     mock_client.post.return_value = mock_response
-    mock_client_class.return_value.__aenter__.return_value = mock_client
+    mock_client_class.return_value = mock_client
 
     # Create connection manager with schema that has no input_schema attribute
     dummy_cm = DummyCMWithServiceEndpoints()
@@ -528,7 +527,7 @@ async def test_async_proxy_method_http_error(mock_client_class):
     mock_response.status_code = 500
     mock_response.text = "Internal Server Error"
     mock_client.post.return_value = mock_response
-    mock_client_class.return_value.__aenter__.return_value = mock_client
+    mock_client_class.return_value = mock_client
 
     # Create connection manager with schema
     dummy_cm = DummyCMWithServiceEndpoints()
@@ -555,7 +554,7 @@ async def test_async_proxy_method_json_parsing_error(mock_client_class):
     mock_response.status_code = 200
     mock_response.json.side_effect = Exception("Invalid JSON")
     mock_client.post.return_value = mock_response
-    mock_client_class.return_value.__aenter__.return_value = mock_client
+    mock_client_class.return_value = mock_client
 
     # Create connection manager with schema that has no output validation
     dummy_cm = DummyCMWithServiceEndpoints()
@@ -597,7 +596,7 @@ async def test_async_proxy_method_output_validation_error(mock_client_class):
     mock_response.status_code = 200
     mock_response.json.return_value = {"result": "success"}
     mock_client.post.return_value = mock_response
-    mock_client_class.return_value.__aenter__.return_value = mock_client
+    mock_client_class.return_value = mock_client
 
     # Create connection manager with failing output schema
     dummy_cm = DummyCMWithServiceEndpoints()
@@ -616,7 +615,7 @@ async def test_async_proxy_method_output_validation_error(mock_client_class):
     assert result == {"result": "success"}
 
 
-@patch("requests.post")
+@patch("httpx.Client.post")
 def test_sync_proxy_method_json_parsing_error(mock_post):
     """Test sync proxy method when JSON parsing fails."""
     # Set up mocks for HTTP request with unparseable JSON
@@ -643,7 +642,7 @@ def test_sync_proxy_method_json_parsing_error(mock_post):
     assert result.success is True
 
 
-@patch("requests.get")
+@patch("httpx.Client.get")
 def test_getattribute_get_request_json_error(mock_get):
     """Test __getattribute__ when GET request succeeds but JSON parsing fails."""
     mock_response = Mock()
@@ -662,11 +661,11 @@ def test_getattribute_get_request_json_error(mock_get):
 
     # Should return the raw text when JSON parsing fails
     assert result == "raw response text"
-    mock_get.assert_called_once_with("http://gateway/app/some_property", timeout=60)
+    mock_get.assert_called_once_with("http://gateway/app/some_property")
 
 
-@patch("requests.get")
-@patch("requests.post")
+@patch("httpx.Client.get")
+@patch("httpx.Client.post")
 def test_getattribute_get_fails_post_succeeds_json_error(mock_post, mock_get):
     """Test __getattribute__ when GET fails, POST succeeds but JSON parsing fails."""
     # GET request fails
@@ -691,8 +690,8 @@ def test_getattribute_get_fails_post_succeeds_json_error(mock_post, mock_get):
 
     # Should return the raw text from POST when JSON parsing fails
     assert result == "post response text"
-    mock_get.assert_called_once_with("http://gateway/app/some_property", timeout=60)
-    mock_post.assert_called_once_with("http://gateway/app/some_property", timeout=60)
+    mock_get.assert_called_once_with("http://gateway/app/some_property")
+    mock_post.assert_called_once_with("http://gateway/app/some_property")
 
 
 def test_getattr_fallback():
@@ -725,7 +724,7 @@ async def test_async_proxy_method_output_schema_no_validation(mock_client_class)
     mock_response.status_code = 200
     mock_response.json.return_value = {"result": "raw_result"}
     mock_client.post.return_value = mock_response
-    mock_client_class.return_value.__aenter__.return_value = mock_client
+    mock_client_class.return_value = mock_client
 
     # Create connection manager with schema that has no output validation
     dummy_cm = DummyCMWithServiceEndpoints()
@@ -744,7 +743,7 @@ async def test_async_proxy_method_output_schema_no_validation(mock_client_class)
     assert result == {"result": "raw_result"}
 
 
-@patch("requests.post")
+@patch("httpx.Client.post")
 def test_sync_proxy_method_output_schema_no_validation(mock_post):
     """Test sync proxy method when output_schema is None."""
 
@@ -777,7 +776,7 @@ def test_sync_proxy_method_output_schema_no_validation(mock_post):
     assert result == {"result": "raw_result"}
 
 
-@patch("requests.post")
+@patch("httpx.Client.post")
 def test_sync_proxy_method_output_validation_error(mock_post):
     """Test sync proxy method when output validation fails."""
 
@@ -815,8 +814,8 @@ def test_sync_proxy_method_output_validation_error(mock_post):
     assert result == {"result": "success"}
 
 
-@patch("requests.get")
-@patch("requests.post")
+@patch("httpx.Client.get")
+@patch("httpx.Client.post")
 def test_getattribute_both_get_and_post_fail(mock_post, mock_get):
     """Test __getattribute__ when both GET and POST requests fail."""
     # Mock both GET and POST to return non-200 status codes
@@ -840,8 +839,8 @@ def test_getattribute_both_get_and_post_fail(mock_post, mock_get):
         ProxyConnectionManager.__getattribute__(proxy_cm, "some_property")
 
     # Verify both GET and POST were called
-    mock_get.assert_called_once_with("http://gateway/app/some_property", timeout=60)
-    mock_post.assert_called_once_with("http://gateway/app/some_property", timeout=60)
+    mock_get.assert_called_once_with("http://gateway/app/some_property")
+    mock_post.assert_called_once_with("http://gateway/app/some_property")
 
 
 def test_getattribute_proxy_method_access():
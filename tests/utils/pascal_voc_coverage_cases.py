@@ -3,6 +3,8 @@ from __future__ import annotations
 import runpy
 import sys
 import tarfile
+from functools import partial
+from io import BytesIO
 from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
@@ -255,18 +257,16 @@ def test_schema_labels_and_annotation_set_creation_helpers():
     assert with_background[0].name == "background"
     assert with_background[0].id == 0
 
-    datalake = MagicMock()
-    datalake.create_annotation_set.return_value = "annotation_set"
-
-    created = pascal_voc._create_annotation_set_if_needed(
-        datalake,
-        datum_id="datum_1",
+    spec = pascal_voc._annotation_set_spec(
         name="pascal-voc-classification",
         annotation_schema_id="schema_1",
+        annotations=[{"kind": "classification", "label": "person"}],
     )
 
-    assert created == "annotation_set"
-    datalake.create_annotation_set.assert_called_once()
+    assert spec["name"] == "pascal-voc-classification"
+    assert spec["annotation_schema_id"] == "schema_1"
+    assert (spec["purpose"], spec["source_type"], spec["status"]) == ("ground_truth", "human", "active")
+    assert spec["annotations"] == [{"kind": "classification", "label": "person"}]
 
 
 def test_ensure_schema_updates_existing_schema_to_include_new_optional_attrs():
@@ -431,19 +431,7 @@ def test_import_pascal_voc_raises_for_missing_payloads(tmp_path: Path, missing_n
 
 def test_import_pascal_voc_creates_classification_detection_and_segmentation_records(tmp_path: Path):
     build_tiny_voc_fixture(tmp_path)
-    datalake = MagicMock()
-    datalake.get_dataset_version.side_effect = RuntimeError("missing")
-    datalake.create_asset_from_object.side_effect = [
-        SimpleNamespace(asset_id="image_asset"),
-        SimpleNamespace(asset_id="mask_asset"),
-    ]
-    datalake.create_datum.return_value = SimpleNamespace(datum_id="datum_1")
-    datalake.create_annotation_set.side_effect = [
-        SimpleNamespace(annotation_set_id="set_cls"),
-        SimpleNamespace(annotation_set_id="set_det"),
-        SimpleNamespace(annotation_set_id="set_seg"),
-    ]
-    datalake.create_dataset_version.return_value = SimpleNamespace(dataset_version_id="dataset_version_1")
+    datalake = make_import_datalake_mock()
 
     schemas = {
         "classification": make_schema_ref("schema_cls"),
@@ -469,18 +457,104 @@ def test_import_pascal_voc_creates_classification_detection_and_segmentation_rec
     assert summary.classification_record_count == 1
     assert summary.detection_record_count == 1
     assert summary.segmentation_record_count == 1
-    assert datalake.create_asset_from_object.call_count == 2
-    assert datalake.create_asset_from_object.call_args_list[0].kwargs["on_conflict"] == "overwrite"
-    assert datalake.create_asset_from_object.call_args_list[1].kwargs["kind"] == "mask"
-
-    classification_records = datalake.add_annotation_records.call_args_list[0].args[0]
-    detection_records = datalake.add_annotation_records.call_args_list[1].args[0]
-    segmentation_records = datalake.add_annotation_records.call_args_list[2].args[0]
-
+    assert summary.dataset_version_id == "dataset_version_1"
+
+    datalake.create_assets_from_objects.assert_called_once()
+    asset_specs = datalake.create_assets_from_objects.call_args.args[0]
+    assert [spec["kind"] for spec in asset_specs] == ["image", "mask"]
+    assert all(spec["on_conflict"] == "overwrite" for spec in asset_specs)
+    assert asset_specs[0]["name"] == "imports__pascal-voc-2012__demo__1.0.0__train__images__2008_000008.jpg"
+
+    datalake.create_annotation_sets.assert_called_once()
+    set_specs = datalake.create_annotation_sets.call_args.args[0]
+    assert [spec["name"] for spec in set_specs] == [
+        "pascal-voc-classification",
+        "pascal-voc-detection",
+        "pascal-voc-segmentation",
+    ]
+    assert [spec["annotation_schema_id"] for spec in set_specs] == ["schema_cls", "schema_det", "schema_seg"]
+    classification_records, detection_records, segmentation_records = (spec["annotations"] for spec in set_specs)
     assert classification_records[0]["kind"] == "classification"
     assert detection_records[0]["kind"] == "bbox"
     assert segmentation_records[0]["kind"] == "mask"
     assert segmentation_records[0]["geometry"]["mask_asset_id"] == "mask_asset"
+    assert all(
+        record["subject"] == {"kind": "asset", "id": "image_asset"}
+        for records in (classification_records, detection_records, segmentation_records)
+        for record in records
+    )
+
+    datalake.create_datums.assert_called_once()
+    (datum_spec,) = datalake.create_datums.call_args.args[0]
+    assert datum_spec["asset_refs"] == {"image": "image_asset"}
+    assert datum_spec["annotation_set_ids"] == ["set_cls", "set_det", "set_seg"]
+    assert datalake.create_dataset_version.call_args.kwargs["manifest"] == ["datum_1"]
+
+
+def test_import_pascal_voc_writes_images_in_batches_in_split_order(tmp_path: Path):
+    voc_root, image_id = build_tiny_voc_fixture(tmp_path, include_segmentation=False, include_classification=False)
+    image_ids = [image_id, "2008_000009", "2008_000010"]
+    for extra_id in image_ids[1:]:
+        Image.new("RGB", (4, 4)).save(voc_root / "JPEGImages" / f"{extra_id}.jpg")
+        (voc_root / "Annotations" / f"{extra_id}.xml").write_text("<annotation />")
+    (voc_root / "ImageSets" / "Main" / "train.txt").write_text("\n".join(image_ids) + "\n")
+
+    datalake = MagicMock()
+    datalake.get_dataset_version.side_effect = RuntimeError("missing")
+    datalake.create_assets_from_objects.side_effect = lambda specs: [
+        SimpleNamespace(asset_id=f"asset_{spec['asset_metadata']['source_image_id']}") for spec in specs
+    ]
+    datalake.create_annotation_sets.side_effect = lambda specs: [
+        SimpleNamespace(annotation_set_id=f"set_{index}") for index, _ in enumerate(specs)
+    ]
+    datalake.create_datums.side_effect = lambda specs: [
+        SimpleNamespace(datum_id=f"datum_{spec['metadata']['source_image_id']}") for spec in specs
+    ]
+    schemas = {name: make_schema_ref(f"schema_{name}") for name in ("classification", "detection", "segmentation")}
+
+    with patch.object(pascal_voc, "_ensure_voc_schemas", return_value=schemas):
+        summary = pascal_voc.import_pascal_voc(
+            datalake,
+            pascal_voc.PascalVocImportConfig(
+                root_dir=tmp_path, split="train", show_progress=False, batch_size=2, workers=1
+            ),
+        )
+
+    assert [len(call.args[0]) for call in datalake.create_assets_from_objects.call_args_list] == [2, 1]
+    assert [len(call.args[0]) for call in datalake.create_datums.call_args_list] == [2, 1]
+    assert datalake.create_dataset_version.call_args.kwargs["manifest"] == [f"datum_{item}" for item in image_ids]
+    assert summary.datum_count == 3
+    assert summary.detection_record_count == 1
+    assert datalake.create_datums.call_args_list[1].args[0][0]["annotation_set_ids"] == []
+
+
+def test_import_pascal_voc_rejects_non_positive_batch_size(tmp_path: Path):
+    with pytest.raises(ValueError, match="batch_size must be at least 1"):
+        pascal_voc.import_pascal_voc(
+            MagicMock(),
+            pascal_voc.PascalVocImportConfig(root_dir=tmp_path, split="train", batch_size=0, show_progress=False),
+        )
+
+
+def test_iter_prepared_chunks_uses_process_pool_and_preserves_order(tmp_path: Path):
+    voc_root, image_id = build_tiny_voc_fixture(tmp_path)
+    prepare = partial(
+        pascal_voc._prepare_voc_image,
+        voc_root / "JPEGImages",
+        voc_root / "Annotations",
+        voc_root / "SegmentationClass",
+    )
+
+    chunks = list(pascal_voc._iter_prepared_chunks([image_id] * 3, prepare, batch_size=2, workers=2))
+
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    prepared = chunks[0][0]
+    assert prepared.image_id == image_id
+    assert prepared.image_bytes == (voc_root / "JPEGImages" / f"{image_id}.jpg").read_bytes()
+    assert [detection["label"] for detection in prepared.detections] == ["person"]
+    assert [class_name for class_name, _ in prepared.masks] == ["person"]
+    with Image.open(BytesIO(prepared.masks[0][1])) as mask:
+        assert list(mask.get_flattened_data()) == [0, 255, 0, 0]
 
 
 def test_build_cli_parses_expected_arguments():
@@ -510,6 +584,10 @@ def test_build_cli_parses_expected_arguments():
             "--source-url",
             "https://example.com/voc.tar",
             "--no-progress",
+            "--batch-size",
+            "64",
+            "--workers",
+            "2",
         ]
     )
 
@@ -525,6 +603,8 @@ def test_build_cli_parses_expected_arguments():
     assert args.download is True
     assert args.source_url == "https://example.com/voc.tar"
     assert args.no_progress is True
+    assert args.batch_size == 64
+    assert args.workers == 2
 
 
 def test_main_calls_importer_prints_summary_and_closes_datalake(capsys: pytest.CaptureFixture[str]):
@@ -82,12 +82,17 @@ def make_import_datalake_mock() -> MagicMock:
     datalake.create_annotation_schema.side_effect = lambda **_: make_schema_ref(next(schema_ids))
 
     asset_ids = iter(("image_asset", "mask_asset"))
-    datalake.create_asset_from_object.side_effect = lambda **_: SimpleNamespace(asset_id=next(asset_ids))
+    datalake.create_assets_from_objects.side_effect = lambda specs: [
+        SimpleNamespace(asset_id=next(asset_ids)) for _ in specs
+    ]
 
-    datalake.create_datum.return_value = SimpleNamespace(datum_id="datum_1")
+    datum_ids = iter(("datum_1",))
+    datalake.create_datums.side_effect = lambda specs: [SimpleNamespace(datum_id=next(datum_ids)) for _ in specs]
 
     annotation_set_ids = iter(("set_cls", "set_det", "set_seg"))
-    datalake.create_annotation_set.side_effect = lambda **_: SimpleNamespace(annotation_set_id=next(annotation_set_ids))
+    datalake.create_annotation_sets.side_effect = lambda specs: [
+        SimpleNamespace(annotation_set_id=next(annotation_set_ids)) for _ in specs
+    ]
 
     datalake.create_dataset_version.return_value = SimpleNamespace(dataset_version_id="dataset_version_1")
     return datalake